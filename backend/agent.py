@@ -4,7 +4,7 @@ Uses OpenAI GPT-4o-mini with tool-calling to analyse a car query and return
 a structured BUY / WAIT / NEUTRAL recommendation with a plain-English explanation.
 
 Tools (called by the LLM in order):
-  1. get_price_history        → MongoDB price_snapshots time series
+  1. get_price_history        → MongoDB price_series bucket (one doc per series)
   2. run_forecast             → Prophet 30 / 90-day price forecast
   3. run_price_prediction     → XGBoost inference + top-3 SHAP factors
   4. get_market_context       → Inventory count, trend, regional range
@@ -19,31 +19,68 @@ Environment variables required (.env):
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import sys
+import threading
+import time
 import warnings
 warnings.filterwarnings("ignore")          # suppress XGBoost GPU/CPU device warnings
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
-from openai import OpenAI
 from pymongo import MongoClient
 
 # ── Project imports ───────────────────────────────────────────────────────────
 _ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(_ROOT))
 from scripts.model_utils import predict_price, explain_prediction
+from backend.utils.price_series import SERIES_COLLECTION, series_id, bucket_to_history
+from backend.snapshot_store import SnapshotStore
+from backend.db_indexes import IndexManager
+from backend.llm.cache import LLMCache
+from backend.llm.compaction import compact_tool_result, tool_message_content
+from backend.llm.explanation_cache import ExplanationTemplateCache
+from backend.query_parser import (
+    DEFAULT_CONDITION, DEFAULT_MILEAGE, DEFAULT_REGION, parse_query, resolve_vehicle,
+)
+from backend.llm.gateway import LLMGateway
+from backend.llm.async_client import AsyncLLMClient
 
 # ── Bootstrap ─────────────────────────────────────────────────────────────────
 load_dotenv(_ROOT / ".env")
 
-_oai = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-_db  = MongoClient(os.environ["MONGO_URI"])["carmarket"]
+# Every OpenAI call goes through this gateway: shared client, per-call
+# deadline and circuit breaker (see backend/llm/gateway.py).
+llm = LLMGateway.from_env()
+# Event-loop callers (arun_* / arun_orchestrator) await this pooled client
+# instead; it shares the gateway's breaker.
+allm = AsyncLLMClient.from_env(llm.breaker)
+_db = MongoClient(os.environ["MONGO_URI"])["carmarket"]
+
+# price_series served from memory; main.py loads it at startup and polls for
+# new ingest versions. Direct MongoDB reads below are only the fallback used
+# when the store cannot be loaded; after a failed load they are used straight
+# away for SNAPSHOT_RETRY_SECONDS while the poller retries.
+snapshot_store = SnapshotStore(_db, retry_s=float(os.environ.get("SNAPSHOT_RETRY_SECONDS", 60)))
+# Required indexes + explain() checks; main.py runs it at startup and serves
+# its report on /api/admin/indexes.
+index_manager = IndexManager(_db)
+
+# Content-addressed gpt-4o-mini response cache shared by run_llm_price_analysis
+# and ExplanationAgent (None when LLM_CACHE_ENABLED=0).
+llm_cache = LLMCache.from_env(_db, root=_ROOT)
+# ExplanationAgent bullets re-rendered across near-identical analyses
+# (None when EXPLAIN_TEMPLATE_ENABLED=0).
+explanation_templates = ExplanationTemplateCache.from_env()
 
 MODEL = "gpt-4o-mini"
 
@@ -61,42 +98,59 @@ SYSTEM_PROMPT = (
     "Be direct. Do not hedge excessively."
 )
 
+# run_agent(mode="direct"): tools already ran, the model only explains
+DIRECT_PROMPT = (
+    "You are a car market analyst. The user's query and the outputs of the "
+    "analysis tools are below; synthesize_recommendation holds the final signal. "
+    "Write a 3-sentence plain English explanation citing specific $ numbers. "
+    "Be direct. Do not hedge excessively."
+)
+
+# loop   : the model routes the six tools itself (up to max_tool_rounds completions)
+# direct : query parsed locally, tools run in a fixed order, one completion
+AGENT_MODES = ("loop", "direct")
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # Tool implementations
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _get_series(make: str, model: str, year: int) -> dict | None:
+    """Fetch the bucketed price_series document for (make, model, year) — one _id lookup."""
+    return _db[SERIES_COLLECTION].find_one({"_id": series_id(make, model, year)})
+
+
 def get_price_history(make: str, model: str, year: int) -> list[dict]:
-    """Query MongoDB price_snapshots for (make, model, year) time series."""
-    cursor = _db["price_snapshots"].find(
-        {"make": make.lower(), "model": model.lower(), "year": year},
-        {"_id": 0, "year_month": 1, "avg_price": 1, "median_price": 1, "listing_count": 1},
-    ).sort("year_month", 1)
-
-    history = [
-        {
-            "date":          doc["year_month"],
-            "avg_price":     round(doc.get("avg_price", 0), 2),
-            "median_price":  round(doc.get("median_price", 0), 2),
-            "listing_count": doc.get("listing_count", 0),
-        }
-        for doc in cursor
-    ]
+    """Return the monthly (make, model, year) time series from the snapshot store."""
+    if snapshot_store.ensure_loaded():
+        history = snapshot_store.history(make, model, year)
+    else:
+        bucket  = _get_series(make, model, year)
+        history = bucket_to_history(bucket) if bucket else []
     return history if history else [{"error": f"No price history for {year} {make} {model}"}]
 
 
+def _global_recent_prices() -> list[float]:
+    """avg_price of the 3 most recent snapshot rows market-wide, newest first."""
+    if snapshot_store.ensure_loaded():
+        return snapshot_store.global_recent()
+    return [
+        float(doc["avg_price"])
+        for doc in _db["price_snapshots"]
+        .find({}, {"_id": 0, "year_month": 1, "avg_price": 1})
+        .sort("year_month", -1)
+        .limit(3)
+        if doc.get("avg_price") is not None
+    ]
+
+
 def _market_trend_forecast() -> dict:
     """
     Fallback: derive a forecast from the most recent global price_snapshots
     (all makes/models combined).  Used when a specific car has no history.
     Falls back to US used-car industry averages when DB has no data.
     """
-    recent = list(
-        _db["price_snapshots"]
-        .find({}, {"_id": 0, "year_month": 1, "avg_price": 1})
-        .sort("year_month", -1)
-        .limit(3)
-    )
+    recent = _global_recent_prices()
 
     # Industry default when DB has no global data
     if len(recent) == 0:
@@ -113,12 +167,12 @@ def _market_trend_forecast() -> dict:
             "method":           "industry_default",
         }
 
-    last_price = float(recent[0]["avg_price"])
+    last_price = recent[0]
 
     if len(recent) < 2:
         mom_rate = 0.003
     else:
-        prev_price = float(recent[1]["avg_price"])
+        prev_price = recent[1]
         mom_rate   = (last_price - prev_price) / prev_price if prev_price else 0.003
 
     fc_30  = round(last_price * (1 + mom_rate), 2)
@@ -137,11 +191,12 @@ def _market_trend_forecast() -> dict:
     }
 
 
-def run_forecast(make: str, model: str, year: int) -> dict:
+def run_forecast(make: str, model: str, year: int, price_history: list[dict] | None = None) -> dict:
     """
     Fetch price history from MongoDB then run Facebook Prophet.
     Accepts make/model/year directly so the LLM doesn't need to pipe
-    raw data between tool calls.
+    raw data between tool calls. *price_history* (not exposed to the LLM)
+    skips the fetch when the caller already holds get_price_history output.
 
     Fallback chain:
       0 months of car data  → market-wide average trend (or industry default)
@@ -153,7 +208,8 @@ def run_forecast(make: str, model: str, year: int) -> dict:
     except ImportError:
         return {"error": "prophet not installed. Run: pip install prophet"}
 
-    price_history = get_price_history(make, model, year)
+    if price_history is None:
+        price_history = get_price_history(make, model, year)
     has_car_data  = price_history and "error" not in price_history[0]
 
     # ── No car-specific data → fall back to market-wide trend ────────────────
@@ -265,6 +321,52 @@ def run_price_prediction(
     }
 
 
+def _series_context_from_db(make: str, model: str, year: int) -> dict:
+    """MongoDB fallback for SnapshotStore.context — same shape, read from the bucket."""
+    bucket = _get_series(make, model, year)
+    if bucket:
+        # n_listings is materialised at ingest time from the listings collection
+        total_count = int(bucket.get("n_listings", 0))
+    else:
+        total_count = _db["listings"].count_documents(
+            {"make": make.lower(), "model": model.lower(), "year": year}
+        )
+
+    # Inventory trend: compare snapshot listing_count across most recent 2 periods
+    counts = (bucket or {}).get("listing_count", [])
+    prices = [p for p in (bucket or {}).get("avg_price", []) if p is not None]
+
+    inventory_trend = "unknown"
+    if len(counts) >= 2:
+        curr_cnt  = counts[-1] if counts[-1] is not None else 0
+        prev_cnt  = counts[-2] if counts[-2] is not None else 1
+        inventory_trend = "rising" if curr_cnt >= prev_cnt else "falling"
+
+    ctx = {"n_listings": total_count, "inventory_trend": inventory_trend,
+           "has_prices": bool(prices), "price_vs_median_pct": 0.0}
+    if prices:
+        overall_avg = sum(prices) / len(prices)
+        # latest avg vs overall avg → negative means currently below market
+        latest_avg  = bucket["avg_price"][-1] if bucket["avg_price"][-1] is not None else overall_avg
+        ctx["price_vs_median_pct"] = round((latest_avg - overall_avg) / overall_avg * 100, 2) if overall_avg else 0.0
+        ctx["min_price"] = round(min(prices), 2)
+        ctx["max_price"] = round(max(prices), 2)
+    return ctx
+
+
+def _global_price_range() -> dict | None:
+    """Market-wide {avg, min, max} of snapshot avg_price, or None when the DB is empty."""
+    if snapshot_store.ensure_loaded():
+        return snapshot_store.global_range()
+    global_agg = list(_db["price_snapshots"].aggregate([
+        {"$group": {"_id": None,
+                    "avg": {"$avg": "$avg_price"},
+                    "min": {"$min": "$avg_price"},
+                    "max": {"$max": "$avg_price"}}},
+    ]))
+    return global_agg[0] if global_agg else None
+
+
 def get_market_context(make: str, model: str, year: int) -> dict:
     """Return inventory count, trend, price-vs-median, and regional range.
 
@@ -279,58 +381,26 @@ def get_market_context(make: str, model: str, year: int) -> dict:
     _INDUSTRY_MIN  =  7_995.0
     _INDUSTRY_MAX  = 45_000.0
 
-    make_l  = make.lower()
-    model_l = model.lower()
-    filter_ = {"make": make_l, "model": model_l, "year": year}
-
-    # Current listing count from listings collection
-    total_count = _db["listings"].count_documents(filter_)
-
-    # Inventory trend: compare snapshot listing_count across most recent 2 periods
-    recent = list(
-        _db["price_snapshots"]
-        .find(filter_, {"_id": 0, "year_month": 1, "listing_count": 1, "avg_price": 1})
-        .sort("year_month", -1)
-        .limit(2)
-    )
+    if snapshot_store.ensure_loaded():
+        ctx = snapshot_store.context(make, model, year)
+    else:
+        ctx = _series_context_from_db(make, model, year)
+    ctx = ctx or {"n_listings": 0, "inventory_trend": "unknown",
+                  "has_prices": False, "price_vs_median_pct": 0.0}
 
-    inventory_trend = "unknown"
-    price_vs_median_pct = 0.0
-    if len(recent) == 2:
-        curr_cnt  = recent[0].get("listing_count", 0)
-        prev_cnt  = recent[1].get("listing_count", 1)
-        inventory_trend = "rising" if curr_cnt >= prev_cnt else "falling"
+    total_count         = ctx["n_listings"]
+    inventory_trend     = ctx["inventory_trend"]
+    price_vs_median_pct = ctx["price_vs_median_pct"]
 
-    # Overall median price for this make/model/year
-    pipeline = [
-        {"$match": filter_},
-        {"$group": {
-            "_id": None,
-            "overall_avg": {"$avg": "$avg_price"},
-            "min_price":   {"$min": "$avg_price"},
-            "max_price":   {"$max": "$avg_price"},
-        }},
-    ]
-    agg = list(_db["price_snapshots"].aggregate(pipeline))
-    if agg:
-        overall_avg = agg[0]["overall_avg"] or 0
-        min_price   = round(agg[0]["min_price"], 2)
-        max_price   = round(agg[0]["max_price"], 2)
-        # latest avg vs overall avg → negative means currently below market
-        latest_avg  = recent[0].get("avg_price", overall_avg) if recent else overall_avg
-        price_vs_median_pct = round((latest_avg - overall_avg) / overall_avg * 100, 2) if overall_avg else 0.0
+    if ctx["has_prices"]:
+        min_price = ctx["min_price"]
+        max_price = ctx["max_price"]
     else:
         # No make-specific data — try global snapshot average for price range display
-        global_agg = list(_db["price_snapshots"].aggregate([
-            {"$group": {"_id": None,
-                        "avg": {"$avg": "$avg_price"},
-                        "mn":  {"$min": "$avg_price"},
-                        "mx":  {"$max": "$avg_price"}}},
-        ]))
-        if global_agg:
-            g = global_agg[0]
-            min_price = round(g["mn"], 2)
-            max_price = round(g["mx"], 2)
+        g = _global_price_range()
+        if g:
+            min_price = round(g["min"], 2)
+            max_price = round(g["max"], 2)
         else:
             # Pure industry fallback (no DB data at all)
             min_price = _INDUSTRY_MIN
@@ -346,6 +416,174 @@ def get_market_context(make: str, model: str, year: int) -> dict:
     }
 
 
+def llm_cache_get(messages: list[dict], params: dict) -> tuple[str | None, str | None]:
+    """(cache_key, cached content) for a MODEL completion — (None, None) when caching is off."""
+    if not llm_cache:
+        return None, None
+    key = llm_cache.key(MODEL, messages, **params)
+    return key, llm_cache.get(key)
+
+
+def llm_cache_put(cache_key: str | None, content: str) -> None:
+    """Store a reply that parsed into a usable result (never a malformed one)."""
+    if llm_cache and cache_key:
+        llm_cache.put(cache_key, content, MODEL)
+
+
+class LLMStep:
+    """One cached MODEL completion: the messages, how to read the reply, what to return instead.
+
+    run_llm_step / arun_llm_step drive it — cache lookup → completion → parse
+    → cache store, with *fallback* on any error — and differ only in the
+    transport call. *parse* raises on a malformed reply, or returns None when
+    the reply holds nothing usable; only parsed replies are cached.
+    Subclasses may widen lookup() / accept() (see ExplanationAgent).
+    """
+
+    def __init__(
+        self,
+        messages: list[dict],
+        params: dict,
+        parse: Callable[[str], Any],
+        fallback: Callable[[Exception], Any],
+        timeout: float | None = None,
+    ) -> None:
+        self.messages = messages
+        self.params   = params
+        self.parse    = parse
+        self.fallback = fallback
+        self.timeout  = timeout            # None → the client's default deadline
+        self._key: str | None = None
+
+    def request(self) -> dict:
+        """Keyword arguments for llm.chat / allm.chat / allm.stream."""
+        return {"model": MODEL, "messages": self.messages, "timeout": self.timeout, **self.params}
+
+    def lookup(self) -> Any:
+        """Result from a cached reply, or None → call the model."""
+        self._key, content = llm_cache_get(self.messages, self.params)
+        return None if content is None else self.parse(content)
+
+    def accept(self, content: str) -> Any:
+        """Result from a fresh reply, cached once it parsed into one."""
+        result = self.parse(content)
+        if result is not None:
+            llm_cache_put(self._key, content)
+        return result
+
+
+def _reply(resp) -> str:
+    return resp.choices[0].message.content
+
+
+def _no_result(exc: Exception) -> None:
+    return None
+
+
+def run_llm_step(step: LLMStep) -> Any:
+    try:
+        result = step.lookup()
+        return result if result is not None else step.accept(_reply(llm.chat(**step.request())))
+    except Exception as exc:
+        return step.fallback(exc)
+
+
+async def arun_llm_step(step: LLMStep, priority: str = "interactive") -> Any:
+    """run_llm_step on the shared pooled client; cache I/O stays off the event loop."""
+    try:
+        result = await asyncio.to_thread(step.lookup)
+        if result is None:
+            resp   = await allm.chat(priority=priority, **step.request())
+            result = await asyncio.to_thread(step.accept, _reply(resp))
+        return result
+    except Exception as exc:
+        return step.fallback(exc)
+
+
+_PRICE_ANALYSIS_PARAMS = {"temperature": 0.15, "response_format": {"type": "json_object"}}
+
+
+def _analysis_inputs(
+    make: str, model: str, year: int, mileage: int, condition: str, region: str,
+    current_price: float, stat_forecast_30d: float, stat_forecast_90d: float,
+    trend_direction: str, trend_pct_30d: float, inventory_trend: str,
+    price_vs_median_pct: float,
+) -> str:
+    """Vehicle + data-input block shared by the analysis and combined prompts.
+
+    Its parameters are the price-analysis inputs (the ``analysis`` dicts below).
+    """
+    current_month = datetime.now().strftime("%B")
+    return (
+        f"Vehicle: {year} {make.title()} {model.title()}\n"
+        f"Details: {mileage:,} miles | {condition} condition | {region} region\n"
+        f"Current month: {current_month}\n\n"
+        f"Data inputs:\n"
+        f"  XGBoost fair market value : ${current_price:,.0f}\n"
+        f"  Statistical 30-day forecast: ${stat_forecast_30d:,.0f} ({trend_pct_30d:+.1f}%)\n"
+        f"  Statistical 90-day forecast: ${stat_forecast_90d:,.0f}\n"
+        f"  Market trend              : {trend_direction}\n"
+        f"  Inventory trend           : {inventory_trend}\n"
+        f"  Price vs market median    : {price_vs_median_pct:+.1f}%\n\n"
+        f"Consider: typical depreciation for this make/model age, seasonal demand patterns, "
+        f"regional supply, and whether the statistical forecast seems reasonable.\n\n"
+    )
+
+
+def _price_analysis_messages(analysis: dict) -> list[dict]:
+    prompt = (
+        f"You are an expert automotive market analyst. Analyse this used car and forecast prices.\n\n"
+        + _analysis_inputs(**analysis) +
+        f"Respond with ONLY valid JSON:\n"
+        f'{{\n'
+        f'  "forecast_30d": <number — your best predicted price in 30 days>,\n'
+        f'  "forecast_90d": <number — your best predicted price in 90 days>,\n'
+        f'  "trend_direction": "rising" | "falling" | "stable",\n'
+        f'  "confidence": "HIGH" | "MODERATE" | "LOW",\n'
+        f'  "key_insight": "<one concise sentence about the most important price driver>",\n'
+        f'  "best_time_to_buy": "now" | "30_days" | "90_days" | "wait"\n'
+        f'}}'
+    )
+    return [
+        {"role": "system", "content": "You are an expert automotive market analyst. Always respond with valid JSON only."},
+        {"role": "user",   "content": prompt},
+    ]
+
+
+def _parse_price_analysis(content: str, analysis: dict) -> dict:
+    data = json.loads(content)
+    return {
+        "forecast_30d":       float(data.get("forecast_30d", analysis["stat_forecast_30d"])),
+        "forecast_90d":       float(data.get("forecast_90d", analysis["stat_forecast_90d"])),
+        "trend_direction":    str(data.get("trend_direction", analysis["trend_direction"])),
+        "confidence":         str(data.get("confidence", "MODERATE")),
+        "key_insight":        str(data.get("key_insight", "")),
+        "best_time_to_buy":   str(data.get("best_time_to_buy", "neutral")),
+        "method":             "llm_analysis",
+    }
+
+
+def _price_analysis_fallback(exc: Exception, analysis: dict) -> dict:
+    # Graceful fallback — return statistical values so the pipeline continues
+    return {
+        "forecast_30d":     analysis["stat_forecast_30d"],
+        "forecast_90d":     analysis["stat_forecast_90d"],
+        "trend_direction":  analysis["trend_direction"],
+        "confidence":       "LOW",
+        "key_insight":      f"LLM analysis unavailable ({exc}); using statistical forecast.",
+        "best_time_to_buy": "neutral",
+        "method":           "llm_fallback",
+    }
+
+
+def _price_analysis_step(analysis: dict) -> LLMStep:
+    return LLMStep(
+        _price_analysis_messages(analysis), _PRICE_ANALYSIS_PARAMS,
+        parse=partial(_parse_price_analysis, analysis=analysis),
+        fallback=partial(_price_analysis_fallback, analysis=analysis),
+    )
+
+
 def run_llm_price_analysis(
     make: str,
     model: str,
@@ -369,21 +607,42 @@ def run_llm_price_analysis(
     Returns blended forecast values, a trend call, confidence, key insight,
     and a best-time-to-buy signal — all used by synthesize_recommendation.
     """
-    current_month = datetime.now().strftime("%B")
+    return run_llm_step(_price_analysis_step(dict(locals())))   # every parameter is an input
+
+
+async def arun_llm_price_analysis(*, priority: str = "interactive", **analysis) -> dict:
+    """Async run_llm_price_analysis (same keyword arguments, cache and fallback)."""
+    return await arun_llm_step(_price_analysis_step(analysis), priority)
+
+
+# ── Combined single-call mode ────────────────────────────────────────────────
+# One completion returns the forecast adjustments AND the reasoning for the
+# recommendation they lead to. The caller re-derives the recommendation with
+# the deterministic agents and only keeps the reasoning when it matches.
+
+_COMBINED_PARAMS = {"temperature": 0.15, "response_format": {"type": "json_object"}}
+RECOMMENDATIONS  = ("BUY NOW", "WAIT", "MONITOR")
+
+
+def _combined_messages(analysis: dict, rules: dict) -> list[dict]:
+    """analysis: run_llm_price_analysis kwargs · rules: conf_agree, conf_disagree, has_history."""
+    p, s90 = analysis["current_price"], analysis["stat_forecast_90d"]
+    high_if = "|change_90d| > 5" if rules["has_history"] else "always (no price history)"
     prompt = (
-        f"You are an expert automotive market analyst. Analyse this used car and forecast prices.\n\n"
-        f"Vehicle: {year} {make.title()} {model.title()}\n"
-        f"Details: {mileage:,} miles | {condition} condition | {region} region\n"
-        f"Current month: {current_month}\n\n"
-        f"Data inputs:\n"
-        f"  XGBoost fair market value : ${current_price:,.0f}\n"
-        f"  Statistical 30-day forecast: ${stat_forecast_30d:,.0f} ({trend_pct_30d:+.1f}%)\n"
-        f"  Statistical 90-day forecast: ${stat_forecast_90d:,.0f}\n"
-        f"  Market trend              : {trend_direction}\n"
-        f"  Inventory trend           : {inventory_trend}\n"
-        f"  Price vs market median    : {price_vs_median_pct:+.1f}%\n\n"
-        f"Consider: typical depreciation for this make/model age, seasonal demand patterns, "
-        f"regional supply, and whether the statistical forecast seems reasonable.\n\n"
+        f"You are an expert automotive market analyst. Forecast prices for this used car, "
+        f"then explain the recommendation the rules below give for your forecast.\n\n"
+        + _analysis_inputs(**analysis) +
+        f"Decision rules, applied to YOUR numbers:\n"
+        f"  change_90d = (0.3 × {s90:.0f} + 0.7 × forecast_90d − {p:.0f}) / {p:.0f} × 100\n"
+        f"  confidence = {rules['conf_agree']} if trend_direction is \"{analysis['trend_direction']}\", "
+        f"otherwise {rules['conf_disagree']}; +3 if best_time_to_buy is \"now\" or \"30_days\"\n"
+        f"  volatility = High if {high_if}; Moderate if |change_90d| > 2"
+        f"{' or inventory is unknown' if analysis['inventory_trend'] == 'unknown' else ''}; else Low\n"
+        f"  First match wins:\n"
+        f"    1. WAIT    if change_90d ≤ -3 and confidence ≥ 75\n"
+        f"    2. BUY NOW if change_90d ≥ 2 and volatility is Low\n"
+        f"    3. BUY NOW if price vs median ({analysis['price_vs_median_pct']:+.1f}%) ≤ -10 and confidence ≥ 75\n"
+        f"    4. MONITOR otherwise\n\n"
         f"Respond with ONLY valid JSON:\n"
         f'{{\n'
         f'  "forecast_30d": <number — your best predicted price in 30 days>,\n'
@@ -391,41 +650,110 @@ def run_llm_price_analysis(
         f'  "trend_direction": "rising" | "falling" | "stable",\n'
         f'  "confidence": "HIGH" | "MODERATE" | "LOW",\n'
         f'  "key_insight": "<one concise sentence about the most important price driver>",\n'
-        f'  "best_time_to_buy": "now" | "30_days" | "90_days" | "wait"\n'
-        f'}}'
+        f'  "best_time_to_buy": "now" | "30_days" | "90_days" | "wait",\n'
+        f'  "expected_recommendation": "BUY NOW" | "WAIT" | "MONITOR",\n'
+        f'  "reasoning": ["sentence1", "sentence2", "sentence3"]\n'
+        f'}}\n'
+        f"Each reasoning sentence must be direct, cite specific numbers, be ≤ 25 words, "
+        f"and support expected_recommendation."
     )
+    return [
+        {"role": "system", "content": "You are an expert automotive market analyst. Always respond with valid JSON only."},
+        {"role": "user",   "content": prompt},
+    ]
 
-    try:
-        resp = _oai.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert automotive market analyst. Always respond with valid JSON only."},
-                {"role": "user",   "content": prompt},
-            ],
-            temperature=0.15,
-            response_format={"type": "json_object"},
-        )
-        data = json.loads(resp.choices[0].message.content)
-        return {
-            "forecast_30d":       float(data.get("forecast_30d", stat_forecast_30d)),
-            "forecast_90d":       float(data.get("forecast_90d", stat_forecast_90d)),
-            "trend_direction":    str(data.get("trend_direction", trend_direction)),
-            "confidence":         str(data.get("confidence", "MODERATE")),
-            "key_insight":        str(data.get("key_insight", "")),
-            "best_time_to_buy":   str(data.get("best_time_to_buy", "neutral")),
-            "method":             "llm_analysis",
-        }
-    except Exception as exc:
-        # Graceful fallback — return statistical values so the pipeline continues
-        return {
-            "forecast_30d":     stat_forecast_30d,
-            "forecast_90d":     stat_forecast_90d,
-            "trend_direction":  trend_direction,
-            "confidence":       "LOW",
-            "key_insight":      f"LLM analysis unavailable ({exc}); using statistical forecast.",
-            "best_time_to_buy": "neutral",
-            "method":           "llm_fallback",
-        }
+
+def _parse_combined(content: str, analysis: dict) -> dict:
+    result    = _parse_price_analysis(content, analysis)
+    data      = json.loads(content)
+    expected  = str(data.get("expected_recommendation", "")).upper()
+    reasoning = data.get("reasoning")
+    if expected not in RECOMMENDATIONS:
+        raise ValueError(f"Unexpected expected_recommendation {expected!r}")
+    if not isinstance(reasoning, list) or len(reasoning) < 3:
+        raise ValueError("Unexpected reasoning shape")
+    result.update(
+        method="llm_combined",
+        expected_recommendation=expected,
+        reasoning=[str(r) for r in reasoning[:3]],
+    )
+    return result
+
+
+def _combined_step(analysis: dict, rules: dict) -> LLMStep:
+    return LLMStep(
+        _combined_messages(analysis, rules), _COMBINED_PARAMS,
+        parse=partial(_parse_combined, analysis=analysis), fallback=_no_result,
+    )
+
+
+def run_llm_combined_analysis(analysis: dict, rules: dict) -> dict | None:
+    """One completion → price analysis + expected recommendation + 3 reasoning bullets.
+
+    None when the call fails or the reply is malformed; the caller then takes
+    the two-call path.
+    """
+    return run_llm_step(_combined_step(analysis, rules))
+
+
+async def arun_llm_combined_analysis(analysis: dict, rules: dict, priority: str = "interactive") -> dict | None:
+    """Async run_llm_combined_analysis on the shared pooled client."""
+    return await arun_llm_step(_combined_step(analysis, rules), priority)
+
+
+# ── Query parsing fallback (backend/query_parser.py handles most queries) ────
+_QUERY_PARSE_PARAMS = {"temperature": 0, "response_format": {"type": "json_object"}}
+_QUERY_PARSE_TIMEOUT_S = 10.0
+
+
+def _query_parse_messages(query: str) -> list[dict]:
+    return [
+        {"role": "system", "content": "You extract vehicle details from car-buying questions. Return JSON only."},
+        {"role": "user",   "content": (
+            f"Query: {query}\n\n"
+            f"Respond with ONLY valid JSON: "
+            f'{{"make": str, "model": str, "year": int, "mileage": int | null, '
+            f'"condition": "excellent" | "good" | "fair" | "poor" | "salvage" | "like new" | "new" | null, '
+            f'"region": "<US state, lower-case>" | null}}\n'
+            f"Use null for anything the query does not state."
+        )},
+    ]
+
+
+def _parse_query_reply(content: str) -> dict | None:
+    data  = json.loads(content)
+    make  = str(data.get("make") or "").strip().lower()
+    model = str(data.get("model") or "").strip().lower()
+    year  = data.get("year")
+    if not make or not model or not year:
+        return None
+    # Snap to catalogue spelling when possible; unknown vehicles pass through
+    make, model = resolve_vehicle(make, model) or (make, model)
+    return {
+        "make":      make,
+        "model":     model,
+        "year":      int(year),
+        "mileage":   int(data.get("mileage") or DEFAULT_MILEAGE),
+        "condition": str(data.get("condition") or DEFAULT_CONDITION).lower(),
+        "region":    str(data.get("region") or DEFAULT_REGION).lower(),
+    }
+
+
+def _query_parse_step(query: str) -> LLMStep:
+    return LLMStep(
+        _query_parse_messages(query), _QUERY_PARSE_PARAMS,
+        parse=_parse_query_reply, fallback=_no_result, timeout=_QUERY_PARSE_TIMEOUT_S,
+    )
+
+
+def run_llm_parse_query(query: str) -> dict | None:
+    """LLM fallback for queries parse_query() cannot resolve (None on failure)."""
+    return run_llm_step(_query_parse_step(query))
+
+
+async def arun_llm_parse_query(query: str, priority: str = "interactive") -> dict | None:
+    """Async run_llm_parse_query on the shared pooled client."""
+    return await arun_llm_step(_query_parse_step(query), priority)
 
 
 def synthesize_recommendation(
@@ -718,11 +1046,187 @@ def _dispatch(tool_name: str, args: dict) -> Any:
     return fn(**args)
 
 
+# Shared across agent sessions; tools are I/O- or native-code-bound
+_TOOL_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("AGENT_TOOL_WORKERS", 8)), thread_name_prefix="agent-tool",
+)
+
+
+class _ToolSession:
+    """Tool calls for one run_agent conversation.
+
+    Results are memoized by (name, canonical JSON args), so a tool the model
+    calls again — or run_forecast's internal get_price_history — runs once.
+    A memo entry is registered by the thread that executes it, so a caller
+    only ever waits on work already in progress (no pool deadlock).
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[tuple[str, str], Future] = {}
+        self._lock       = threading.Lock()
+        self.latency_ms: dict[str, float] = {}
+        self.cache_hits  = 0
+
+    def call(self, tool_name: str, args: dict) -> Any:
+        key = (tool_name, json.dumps(args, sort_keys=True, separators=(",", ":"), default=str))
+        with self._lock:
+            fut   = self._memo.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._memo[key] = Future()
+            else:
+                self.cache_hits += 1
+        if not owner:
+            return fut.result()
+
+        t0 = None
+        try:
+            if tool_name == "run_forecast" and "price_history" not in args:
+                # Resolved before the timer starts: the fetch is timed (once) under
+                # get_price_history, so per-tool latencies never add up past wall time
+                hist_args = {k: args[k] for k in ("make", "model", "year") if k in args}
+                args = {**args, "price_history": self.call("get_price_history", hist_args)}
+            t0 = time.perf_counter()
+            fut.set_result(_dispatch(tool_name, args))
+        except Exception as exc:
+            fut.set_exception(exc)
+        finally:
+            if t0 is not None:
+                ms = (time.perf_counter() - t0) * 1000
+                with self._lock:
+                    self.latency_ms[tool_name] = round(self.latency_ms.get(tool_name, 0.0) + ms, 1)
+        return fut.result()
+
+    def call_all(self, calls: list[tuple[str, dict]]) -> list[Any]:
+        """Run one round's tool calls concurrently; results in request order."""
+        if len(calls) == 1:
+            return [self.call(*calls[0])]
+        futures = [_TOOL_POOL.submit(self.call, name, args) for name, args in calls]
+        return [f.result() for f in futures]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Agent loop
 # ══════════════════════════════════════════════════════════════════════════════
 
-def run_agent(user_query: str, max_tool_rounds: int = 12) -> dict:
+class _TokenMeter:
+    """Prompt / completion tokens and latency for each agent-loop completion."""
+
+    def __init__(self) -> None:
+        self.rounds: list[dict] = []
+
+    def record(self, response, llm_ms: float) -> None:
+        usage = getattr(response, "usage", None)
+        self.rounds.append({
+            "prompt_tokens":     int(getattr(usage, "prompt_tokens", 0) or 0),
+            "completion_tokens": int(getattr(usage, "completion_tokens", 0) or 0),
+            "llm_ms":            round(llm_ms, 1),
+            "tools_ms":          0.0,
+        })
+
+    def tools(self, ms: float) -> None:
+        self.rounds[-1]["tools_ms"] = round(ms, 1)
+
+    def summary(self) -> dict:
+        prompt     = sum(r["prompt_tokens"] for r in self.rounds)
+        completion = sum(r["completion_tokens"] for r in self.rounds)
+        return {
+            "prompt_tokens":     prompt,
+            "completion_tokens": completion,
+            "total_tokens":      prompt + completion,
+            "rounds":            self.rounds,
+        }
+
+
+def _agent_result(
+    recommendation_result: dict, explanation: str, tool_outputs: dict,
+    meter: _TokenMeter, mode: str = "loop",
+) -> dict:
+    return {
+        "recommendation":  recommendation_result.get("recommendation", "NEUTRAL"),
+        "confidence":      recommendation_result.get("confidence", "LOW"),
+        "explanation":     explanation,
+        "predicted_price": recommendation_result.get("predicted_price", 0.0),
+        "forecast_30d":    recommendation_result.get("forecast_30d", 0.0),
+        "forecast_90d":    recommendation_result.get("forecast_90d", 0.0),
+        "forecast_method": recommendation_result.get("forecast_method", "statistical"),
+        "llm_key_insight": recommendation_result.get("llm_key_insight", ""),
+        "tool_outputs":    tool_outputs,
+        "token_usage":     meter.summary(),
+        "agent_mode":      mode,
+    }
+
+
+def _run_direct(user_query: str, q: dict, meter: _TokenMeter) -> dict:
+    """Fixed tool sequence for a parsed query, then one explanation completion."""
+    session = _ToolSession()
+    tool_outputs: dict = {"tool_latency_ms": session.latency_ms}
+    vehicle = {"make": q["make"], "model": q["model"], "year": q["year"]}
+
+    t0 = time.perf_counter()
+    # Independent tools together; run_forecast reuses the memoized history
+    history, forecast, prediction, context = session.call_all([
+        ("get_price_history",    vehicle),
+        ("run_forecast",         vehicle),
+        ("run_price_prediction", q),
+        ("get_market_context",   vehicle),
+    ])
+    price  = float(prediction.get("predicted_price", 0.0))
+    stat   = dict(
+        stat_forecast_30d=float(forecast.get("forecast_30d", price)),
+        stat_forecast_90d=float(forecast.get("forecast_90d", price)),
+    )
+    trend  = forecast.get("trend_direction", "stable")
+    trend_pct = float(forecast.get("trend_pct_change", 0.0))
+    inventory = context.get("inventory_trend", "unknown")
+    vs_median = float(context.get("price_vs_median_pct", 0.0))
+
+    analysis = session.call("run_llm_price_analysis", dict(
+        **q, current_price=price, **stat, trend_direction=trend, trend_pct_30d=trend_pct,
+        inventory_trend=inventory, price_vs_median_pct=vs_median,
+    ))
+    rec = session.call("synthesize_recommendation", dict(
+        trend_direction=trend, trend_pct_change=trend_pct, price_vs_median_pct=vs_median,
+        inventory_trend=inventory, predicted_price=price, **stat,
+        llm_forecast_30d=float(analysis.get("forecast_30d", 0.0)),
+        llm_forecast_90d=float(analysis.get("forecast_90d", 0.0)),
+        llm_trend_direction=analysis.get("trend_direction", ""),
+        llm_best_time_to_buy=analysis.get("best_time_to_buy", ""),
+        llm_key_insight=analysis.get("key_insight", ""),
+    ))
+    tools_ms = (time.perf_counter() - t0) * 1000
+
+    tool_outputs.update({
+        "get_price_history":         history,
+        "run_forecast":              forecast,
+        "run_price_prediction":      prediction,
+        "get_market_context":        context,
+        "run_llm_price_analysis":    analysis,
+        "synthesize_recommendation": rec,
+    })
+    digest = {name: compact_tool_result(name, out) for name, out in tool_outputs.items()
+              if name != "tool_latency_ms"}
+    messages = [
+        {"role": "system", "content": DIRECT_PROMPT},
+        {"role": "user",   "content": f"{user_query}\n\nTool outputs:\n"
+                                      f"{json.dumps(digest, default=str, separators=(',', ':'))}"},
+    ]
+    t0 = time.perf_counter()
+    try:
+        response    = llm.chat(model=MODEL, messages=messages)
+        meter.record(response, (time.perf_counter() - t0) * 1000)
+        explanation = response.choices[0].message.content or ""
+    except Exception:
+        # Breaker open / timeout — the rule-based rationale still explains the signal
+        meter.record(None, (time.perf_counter() - t0) * 1000)
+        explanation = rec.get("rationale", "")
+    meter.tools(tools_ms)
+    return _agent_result(rec, explanation, tool_outputs, meter, mode="direct")
+
+
+def run_agent(
+    user_query: str, max_tool_rounds: int = 12, compact: bool = True, mode: str = "loop",
+) -> dict:
     """
     Run the full tool-calling agent loop for a user car query.
 
@@ -731,6 +1235,10 @@ def run_agent(user_query: str, max_tool_rounds: int = 12) -> dict:
     user_query     : Natural-language query, e.g. "Should I buy a 2018 Toyota Camry
                      with 45k miles in good condition in California?"
     max_tool_rounds: Safety cap on tool-call iterations.
+    compact        : Send compacted tool results back to the model
+                     (backend/llm/compaction.py); tool_outputs keeps the full ones.
+    mode           : "loop" | "direct" (see AGENT_MODES). Direct mode falls back
+                     to the loop when the query cannot be parsed locally.
 
     Returns
     -------
@@ -743,48 +1251,53 @@ def run_agent(user_query: str, max_tool_rounds: int = 12) -> dict:
       "forecast_90d":   float, # blended AI + statistical 90-day forecast
       "forecast_method": str,  # "llm_blended" | "statistical" | "estimated"
       "llm_key_insight": str,  # one-line insight from LLM analysis
-      "tool_outputs":   dict,  # raw output from every tool called
+      "tool_outputs":   dict,  # raw output from every tool called, plus
+                               # tool_latency_ms {tool: ms} (executed calls only)
+      "token_usage":    dict,  # agent-loop tokens, total and per round
+      "agent_mode":     str,   # mode actually used
     }
     """
+    if mode not in AGENT_MODES:
+        raise ValueError(f"mode must be one of {AGENT_MODES}, got {mode!r}")
+    meter = _TokenMeter()
+    if mode == "direct":
+        parsed = parse_query(user_query)
+        if parsed is not None:
+            return _run_direct(user_query, parsed, meter)
+
     messages: list[dict] = [
         {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user",   "content": user_query},
     ]
 
-    tool_outputs: dict = {}
+    session = _ToolSession()
+    tool_outputs: dict = {"tool_latency_ms": session.latency_ms}
     recommendation_result: dict = {}
 
     for _ in range(max_tool_rounds):
-        response = _oai.chat.completions.create(
+        t0 = time.perf_counter()
+        response = llm.chat(
             model=MODEL,
             messages=messages,
             tools=TOOLS,
             tool_choice="auto",
         )
+        meter.record(response, (time.perf_counter() - t0) * 1000)
         msg = response.choices[0].message
 
         # ── No more tool calls → final answer ────────────────────────────────
         if not msg.tool_calls:
-            explanation = msg.content or ""
-            return {
-                "recommendation":  recommendation_result.get("recommendation", "NEUTRAL"),
-                "confidence":      recommendation_result.get("confidence", "LOW"),
-                "explanation":     explanation,
-                "predicted_price": recommendation_result.get("predicted_price", 0.0),
-                "forecast_30d":    recommendation_result.get("forecast_30d", 0.0),
-                "forecast_90d":    recommendation_result.get("forecast_90d", 0.0),
-                "forecast_method": recommendation_result.get("forecast_method", "statistical"),
-                "llm_key_insight": recommendation_result.get("llm_key_insight", ""),
-                "tool_outputs":    tool_outputs,
-            }
-
-        # ── Execute each requested tool call ─────────────────────────────────
+            return _agent_result(recommendation_result, msg.content or "", tool_outputs, meter)
+
+        # ── Execute the round's tool calls concurrently ──────────────────────
         messages.append(msg)   # append assistant's tool-call message
 
-        for tc in msg.tool_calls:
-            args   = json.loads(tc.function.arguments)
-            result = _dispatch(tc.function.name, args)
+        t0      = time.perf_counter()
+        calls   = [(tc.function.name, json.loads(tc.function.arguments)) for tc in msg.tool_calls]
+        results = session.call_all(calls)
+        meter.tools((time.perf_counter() - t0) * 1000)
 
+        for tc, result in zip(msg.tool_calls, results):
             # Capture synthesize_recommendation output for top-level return
             if tc.function.name == "synthesize_recommendation":
                 recommendation_result = result
@@ -794,20 +1307,12 @@ def run_agent(user_query: str, max_tool_rounds: int = 12) -> dict:
             messages.append({
                 "role":         "tool",
                 "tool_call_id": tc.id,
-                "content":      json.dumps(result, default=str),
+                "content":      (tool_message_content(tc.function.name, result) if compact
+                                 else json.dumps(result, default=str)),
             })
 
-    return {
-        "recommendation": recommendation_result.get("recommendation", "NEUTRAL"),
-        "confidence":     recommendation_result.get("confidence", "LOW"),
-        "explanation":    "Max tool rounds reached without final LLM response.",
-        "predicted_price": recommendation_result.get("predicted_price", 0.0),
-        "forecast_30d":   recommendation_result.get("forecast_30d", 0.0),
-        "forecast_90d":   recommendation_result.get("forecast_90d", 0.0),
-        "forecast_method": recommendation_result.get("forecast_method", "statistical"),
-        "llm_key_insight": recommendation_result.get("llm_key_insight", ""),
-        "tool_outputs":   tool_outputs,
-    }
+    return _agent_result(recommendation_result, "Max tool rounds reached without final LLM response.",
+                         tool_outputs, meter)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -817,14 +1322,15 @@ def run_agent(user_query: str, max_tool_rounds: int = 12) -> dict:
 if __name__ == "__main__":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")  # Windows UTF-8 fix
 
+    args = [a for a in sys.argv[1:] if a != "--direct"]
     query = (
-        sys.argv[1]
-        if len(sys.argv) > 1
+        args[0]
+        if args
         else "Should I buy a 2018 Toyota Camry with 45,000 miles in good condition in California?"
     )
     sep = "-" * 60
     print(f"\nQuery: {query}\n{sep}")
-    result = run_agent(query)
+    result = run_agent(query, mode="direct" if "--direct" in sys.argv else "loop")
 
     print(f"Recommendation : {result['recommendation']}  ({result['confidence']} confidence)")
     print(f"Predicted price: ${result['predicted_price']:,.0f}")
@@ -833,5 +1339,7 @@ if __name__ == "__main__":
     if result["llm_key_insight"]:
         print(f"AI insight: {result['llm_key_insight']}")
     print(f"\nExplanation:\n{result['explanation']}")
+    usage = result["token_usage"]
+    print(f"Agent tokens   : {usage['total_tokens']:,} over {len(usage['rounds'])} completions")
     print(f"\n{sep}\nTool outputs:")
     print(json.dumps(result["tool_outputs"], indent=2, default=str))
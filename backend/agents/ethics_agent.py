@@ -55,6 +55,7 @@ def run(
         "llm_blended":      "XGBoost + GPT-4o-mini blended forecast (statistical + AI reasoning)",
         "linear":           "linear extrapolation (limited 1–2 months of data)",
         "statistical":      "statistical model with blended AI analysis",
+        "statistical_fast": "statistical model only (fast mode — no AI analysis)",
         "market_avg":       "market-wide average trend (no vehicle-specific history available)",
         "industry_default": "US industry default averages (no local market data in database)",
     }
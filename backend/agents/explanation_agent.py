@@ -1,91 +1,176 @@
 # backend/agents/explanation_agent.py
-"""ExplanationAgent — GPT-4o-mini generates a 3-sentence reasoning summary."""
+"""ExplanationAgent — GPT-4o-mini generates a 3-sentence reasoning summary.
+
+Lookup order: exact-prompt cache → template cache (a near-identical
+analysis's bullets re-rendered with this one's numbers, see
+backend/llm/explanation_cache.py) → LLM call → deterministic fallback.
+
+run / arun / astream take the same keyword arguments (the fields of
+ExplanationRequest) and share one _ExplanationStep; they differ only in how
+the completion is fetched.
+"""
 from __future__ import annotations
-import json, os, sys
+import asyncio, json, re, sys
+from dataclasses import dataclass
 from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from openai import OpenAI
-from dotenv import load_dotenv
-
-load_dotenv(_ROOT / ".env")
-_oai = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-MODEL = "gpt-4o-mini"
-
-
-def run(
-    make: str,
-    model: str,
-    year: int,
-    mileage: int,
-    condition: str,
-    region: str,
-    predicted_price: float,
-    predicted_90_day_change: float,
-    confidence_score: int,
-    volatility_index: str,
-    final_recommendation: str,
-    decision_rationale: str,
-    llm_key_insight: str,
-    trend_direction: str,
-    inventory_trend: str,
-) -> dict:
-    """Generate a 3-bullet reasoning summary using GPT-4o-mini.
+from backend.agent import LLMStep, allm, arun_llm_step, run_llm_step, explanation_templates
+from backend.llm.explanation_cache import render
 
-    Falls back to a deterministic template if the LLM call fails.
+# The summary is cosmetic — give up early and use the template instead
+_TIMEOUT_S = 10.0
+_PARAMS    = {"temperature": 0.1, "response_format": {"type": "json_object"}}
 
-    Returns
-    -------
-    {
-        "reasoning_summary": ["sentence 1", "sentence 2", "sentence 3"],
-        "explanation_text": str,   # legacy flat explanation string
-        "agent_log_entry": {...},
-    }
-    """
+
+@dataclass(frozen=True)
+class ExplanationRequest:
+    """What the summary is written from — the orchestrator's explanation kwargs."""
+    make:                    str
+    model:                   str
+    year:                    int
+    mileage:                 int
+    condition:               str
+    region:                  str
+    predicted_price:         float
+    predicted_90_day_change: float
+    confidence_score:        int
+    volatility_index:        str
+    final_recommendation:    str
+    decision_rationale:      str
+    llm_key_insight:         str
+    trend_direction:         str
+    inventory_trend:         str
+
+
+def _messages(r: ExplanationRequest) -> list[dict]:
     prompt = (
         f"You are a car market analyst. Summarise this analysis in exactly 3 concise bullet sentences.\n\n"
-        f"Vehicle: {year} {make.title()} {model.title()}\n"
-        f"Details: {mileage:,} miles | {condition} condition | {region}\n"
-        f"Prediction: ${predicted_price:,.0f} fair value\n"
-        f"90-day forecast: {predicted_90_day_change:+.1f}% change\n"
-        f"Confidence: {confidence_score}% | Volatility: {volatility_index}\n"
-        f"Market trend: {trend_direction} | Inventory: {inventory_trend}\n"
-        f"Recommendation: {final_recommendation}\n"
-        f"Key insight: {llm_key_insight or decision_rationale}\n\n"
+        f"Vehicle: {r.year} {r.make.title()} {r.model.title()}\n"
+        f"Details: {r.mileage:,} miles | {r.condition} condition | {r.region}\n"
+        f"Prediction: ${r.predicted_price:,.0f} fair value\n"
+        f"90-day forecast: {r.predicted_90_day_change:+.1f}% change\n"
+        f"Confidence: {r.confidence_score}% | Volatility: {r.volatility_index}\n"
+        f"Market trend: {r.trend_direction} | Inventory: {r.inventory_trend}\n"
+        f"Recommendation: {r.final_recommendation}\n"
+        f"Key insight: {r.llm_key_insight or r.decision_rationale}\n\n"
         f"Respond with ONLY valid JSON: "
         f'{{ "reasoning": ["sentence1", "sentence2", "sentence3"] }}\n'
         f"Each sentence must be direct, cite specific numbers, and be ≤ 25 words."
     )
+    return [
+        {"role": "system", "content": "You are an expert automotive analyst. Return JSON only."},
+        {"role": "user",   "content": prompt},
+    ]
+
+
+def _parse(content: str) -> list[str]:
+    data    = json.loads(content)
+    bullets = data.get("reasoning", [])
+    if isinstance(bullets, list) and len(bullets) >= 3:
+        return [str(b) for b in bullets[:3]]
+    raise ValueError("Unexpected LLM response shape")
+
+
+_REASONING_RE = re.compile(r'"reasoning"\s*:\s*\[')
+_DECODER      = json.JSONDecoder()
+
+
+class BulletStream:
+    """Incremental parser for the streamed JSON reply — emits each bullet as its string closes."""
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos: int | None = None
+        self.bullets: list[str] = []
+
+    def feed(self, delta: str) -> list[str]:
+        self._buf += delta
+        if self._pos is None:
+            m = _REASONING_RE.search(self._buf)
+            if m is None:
+                return []
+            self._pos = m.end()
+        new: list[str] = []
+        while len(self.bullets) < 3:
+            start = self._buf.find('"', self._pos)
+            if start < 0 or "]" in self._buf[self._pos:start]:
+                break
+            try:
+                text, self._pos = _DECODER.raw_decode(self._buf, start)
+            except json.JSONDecodeError:
+                break   # string not closed yet
+            self.bullets.append(str(text))
+            new.append(str(text))
+        return new
+
+
+def _fallback(r: ExplanationRequest) -> list[str]:
+    # Deterministic fallback
+    direction_word = "rise" if r.predicted_90_day_change > 0 else "fall"
+    return [
+        f"Fair market value for this {r.year} {r.make.title()} {r.model.title()} is ${r.predicted_price:,.0f}.",
+        f"Prices are forecast to {direction_word} {abs(r.predicted_90_day_change):.1f}% over 90 days "
+        f"with {r.confidence_score}% confidence.",
+        r.decision_rationale,
+    ]
+
+
+def _reuse_slot(r: ExplanationRequest) -> tuple[str, dict[str, str]] | None:
+    """(template signature, placeholder values) — None when the template cache is off.
+
+    Values are rendered exactly as _messages() writes them, so the LLM's
+    copies of them can be found in its bullets.
+    """
+    if explanation_templates is None:
+        return None
+    values = {
+        "price":      f"${r.predicted_price:,.0f}",
+        "change":     f"{r.predicted_90_day_change:+.1f}%",
+        "change_abs": f"{abs(r.predicted_90_day_change):.1f}%",
+        "confidence": f"{r.confidence_score}%",
+        "year":       str(r.year),
+        "mileage":    f"{r.mileage:,}",
+        "region":     r.region.title(),
+        "condition":  f"{r.condition} condition",
+    }
+    signature = explanation_templates.signature(
+        r.make, r.model, r.final_recommendation, r.volatility_index, r.trend_direction,
+        r.inventory_trend, r.predicted_90_day_change, r.predicted_price,
+    )
+    return signature, values
+
+
+def _reused(slot: tuple[str, dict[str, str]] | None) -> list[str] | None:
+    """Bullets re-rendered from a similar analysis's explanation, if one is cached."""
+    if slot is None:
+        return None
+    templates = explanation_templates.lookup(slot[0])
+    return render(templates, slot[1]) if templates else None
 
-    try:
-        resp = _oai.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert automotive analyst. Return JSON only."},
-                {"role": "user",   "content": prompt},
-            ],
-            temperature=0.1,
-            response_format={"type": "json_object"},
-        )
-        data    = json.loads(resp.choices[0].message.content)
-        bullets = data.get("reasoning", [])
-        if isinstance(bullets, list) and len(bullets) >= 3:
-            summary = [str(b) for b in bullets[:3]]
-        else:
-            raise ValueError("Unexpected LLM response shape")
-    except Exception:
-        # Deterministic fallback
-        direction_word = "rise" if predicted_90_day_change > 0 else "fall"
-        summary = [
-            f"Fair market value for this {year} {make.title()} {model.title()} is ${predicted_price:,.0f}.",
-            f"Prices are forecast to {direction_word} {abs(predicted_90_day_change):.1f}% over 90 days with {confidence_score}% confidence.",
-            decision_rationale,
-        ]
 
+def _remember(slot: tuple[str, dict[str, str]] | None, summary: list[str]) -> None:
+    if slot is not None:
+        explanation_templates.store(slot[0], summary, slot[1])
+
+
+def build_result(summary: list[str], final_recommendation: str, cached: bool, source: str = "llm") -> dict:
+    """Agent output for a finished summary.
+
+    source: "llm" (this agent's own call) · "combined" (single-call mode) ·
+            "reuse" (a similar analysis's LLM bullets, re-rendered) ·
+            "template" (deterministic, no LLM)
+    """
     explanation_text = " ".join(summary)
 
     msg = f"Generated 3-sentence reasoning for {final_recommendation} recommendation."
+    if source == "combined":
+        msg += " Reused from the combined analysis call (validated against the decision rules)."
+    elif source == "reuse":
+        msg += " Re-rendered from a cached explanation of a near-identical analysis."
+    elif source == "template":
+        msg = f"Deterministic 3-sentence template for {final_recommendation} recommendation (no LLM)."
 
     return {
         "reasoning_summary": summary,
@@ -94,6 +179,90 @@ def run(
             "agent":   "ExplanationAgent",
             "status":  "ok",
             "message": msg,
-            "output":  {"reasoning_summary": summary},
+            "output":  {"reasoning_summary": summary, "cached": cached, "source": source},
         },
     }
+
+
+class _ExplanationStep(LLMStep):
+    """The cached completion plus the template tier; results are build_result() dicts."""
+
+    def __init__(self, request: dict) -> None:
+        self.req  = ExplanationRequest(**request)
+        self.slot = _reuse_slot(self.req)
+        super().__init__(_messages(self.req), _PARAMS, parse=_parse, fallback=self.fallback,
+                         timeout=_TIMEOUT_S)
+
+    def lookup(self) -> dict | None:
+        summary = super().lookup()
+        if summary is not None:
+            return build_result(summary, self.req.final_recommendation, cached=True)
+        reused = _reused(self.slot)
+        if reused:
+            return build_result(reused, self.req.final_recommendation, cached=True, source="reuse")
+        return None
+
+    def accept(self, content: str) -> dict:
+        summary = super().accept(content)
+        _remember(self.slot, summary)
+        return build_result(summary, self.req.final_recommendation, cached=False)
+
+    def fallback(self, exc: Exception | None = None, sent: list[str] | None = None) -> dict:
+        """Template summary, keeping any bullets already streamed."""
+        sent    = sent or []
+        summary = sent + _fallback(self.req)[len(sent):]
+        return build_result(summary, self.req.final_recommendation, cached=False)
+
+
+def template(**request) -> dict:
+    """Deterministic summary with no LLM call (same keyword arguments as run())."""
+    req = ExplanationRequest(**request)
+    return build_result(_fallback(req), req.final_recommendation, cached=False, source="template")
+
+
+def run(**request) -> dict:
+    """Generate a 3-bullet reasoning summary using GPT-4o-mini.
+
+    Keyword arguments are the ExplanationRequest fields. Falls back to a
+    deterministic template if the LLM call fails or the circuit breaker is
+    open.
+
+    Returns
+    -------
+    {
+        "reasoning_summary": ["sentence 1", "sentence 2", "sentence 3"],
+        "explanation_text": str,   # legacy flat explanation string
+        "agent_log_entry": {...},
+    }
+    """
+    return run_llm_step(_ExplanationStep(request))
+
+
+async def arun(*, priority: str = "interactive", **request) -> dict:
+    """Async run() — awaits the shared pooled client; same cache, output and fallback."""
+    return await arun_llm_step(_ExplanationStep(request), priority)
+
+
+async def astream(*, priority: str = "interactive", **request):
+    """Streaming arun() — async generator of ("bullet", str) as each bullet
+    arrives, then ("result", <arun() output>).
+
+    Cache and template hits replay the stored bullets at once. If the stream fails part
+    way, the bullets already sent are kept and the template fills the rest.
+    """
+    step   = _ExplanationStep(request)
+    parser = BulletStream()
+    try:
+        result = await asyncio.to_thread(step.lookup)
+        if result is None:
+            chunks: list[str] = []
+            async for delta in allm.stream(priority=priority, **step.request()):
+                chunks.append(delta)
+                for bullet in parser.feed(delta):
+                    yield "bullet", bullet
+            result = await asyncio.to_thread(step.accept, "".join(chunks))
+    except Exception as exc:
+        result = step.fallback(exc, parser.bullets)
+    for bullet in result["reasoning_summary"][len(parser.bullets):]:
+        yield "bullet", bullet
+    yield "result", result
@@ -1,69 +1,81 @@
 # backend/agents/forecast_agent.py
 """ForecastAgent — blends XGBoost + LLM price predictions into final forecasts."""
 from __future__ import annotations
+import asyncio
 import sys
 from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agent import run_price_prediction, run_llm_price_analysis
+from backend.agent import run_price_prediction, run_llm_price_analysis, arun_llm_price_analysis
 
 
-def run(
-    make: str,
-    model: str,
-    year: int,
-    mileage: int,
-    condition: str,
-    region: str,
-    forecast: dict,
-    market_context: dict,
+def analysis_kwargs(
+    make: str, model: str, year: int, mileage: int, condition: str, region: str,
+    predicted_price: float, forecast: dict, market_context: dict,
 ) -> dict:
-    """Run XGBoost inference then blend with LLM-enhanced price analysis.
-
-    Returns
-    -------
-    {
-        "predicted_price": float,
-        "forecast_30d": float,
-        "forecast_90d": float,
-        "forecast_method": str,
-        "confidence_base": int,      # base confidence 0-100 before adjustments
-        "shap_factors": [...],
-        "llm_analysis": {...},
-        "agent_log_entry": {...},
-    }
-    """
-    # ── XGBoost inference ─────────────────────────────────────────────────────
-    xgb_result = run_price_prediction(make, model, year, mileage, condition, region)
-    predicted_price = float(xgb_result.get("predicted_price", 0.0))
-    shap_factors    = xgb_result.get("shap_factors", [])
-
-    # ── LLM analysis ──────────────────────────────────────────────────────────
-    stat_30d     = float(forecast.get("forecast_30d", predicted_price))
-    stat_90d     = float(forecast.get("forecast_90d", predicted_price))
-    trend_dir    = forecast.get("trend_direction", "stable")
-    trend_pct    = float(forecast.get("trend_pct_change", 0.0))
-    inv_trend    = market_context.get("inventory_trend", "unknown")
-    pct_vs_med   = float(market_context.get("price_vs_median_pct", 0.0))
-
-    llm_analysis = run_llm_price_analysis(
+    """Arguments for (a)run_llm_price_analysis from the XGBoost and statistical outputs."""
+    return dict(
         make=make, model=model, year=year,
         mileage=mileage, condition=condition, region=region,
         current_price=predicted_price,
-        stat_forecast_30d=stat_30d,
-        stat_forecast_90d=stat_90d,
-        trend_direction=trend_dir,
-        trend_pct_30d=trend_pct,
-        inventory_trend=inv_trend,
-        price_vs_median_pct=pct_vs_med,
+        stat_forecast_30d=float(forecast.get("forecast_30d", predicted_price)),
+        stat_forecast_90d=float(forecast.get("forecast_90d", predicted_price)),
+        trend_direction=forecast.get("trend_direction", "stable"),
+        trend_pct_30d=float(forecast.get("trend_pct_change", 0.0)),
+        inventory_trend=market_context.get("inventory_trend", "unknown"),
+        price_vs_median_pct=float(market_context.get("price_vs_median_pct", 0.0)),
     )
 
+
+# ── Base confidence from forecast method ──────────────────────────────────────
+_METHOD_CONF = {
+    "prophet":          80,
+    "llm_blended":      78,
+    "linear":           72,
+    "statistical":      75,
+    "market_avg":       68,
+    "industry_default": 58,
+}
+
+
+def confidence_branches(forecast: dict) -> tuple[int, int]:
+    """Base confidence when the LLM agrees / disagrees with the statistical trend."""
+    conf = _METHOD_CONF.get(forecast.get("method", "market_avg"), 65)
+    return min(99, conf + 5), max(10, conf - 5)
+
+
+def predict(make: str, model: str, year: int, mileage: int, condition: str, region: str) -> tuple[float, list]:
+    """XGBoost fair value and SHAP factors."""
+    xgb_result = run_price_prediction(make, model, year, mileage, condition, region)
+    return float(xgb_result.get("predicted_price", 0.0)), xgb_result.get("shap_factors", [])
+
+
+def statistical_analysis(forecast: dict, predicted_price: float) -> dict:
+    """Stand-in for the LLM analysis when no LLM is called — blend() keeps the statistical values."""
+    return {
+        "forecast_30d":     float(forecast.get("forecast_30d", predicted_price)),
+        "forecast_90d":     float(forecast.get("forecast_90d", predicted_price)),
+        "trend_direction":  forecast.get("trend_direction", "stable"),
+        "confidence":       "MODERATE",
+        "key_insight":      "",
+        "best_time_to_buy": "neutral",
+        "method":           "statistical",
+    }
+
+
+def blend(predicted_price: float, shap_factors: list, forecast: dict, llm_analysis: dict) -> dict:
+    """Blend the statistical and LLM forecasts and derive the base confidence."""
+    stat_30d  = float(forecast.get("forecast_30d", predicted_price))
+    stat_90d  = float(forecast.get("forecast_90d", predicted_price))
+    trend_dir = forecast.get("trend_direction", "stable")
+
     # ── Blend: 40% statistical + 60% LLM for 30d; 30/70 for 90d ─────────────
     llm_30d = float(llm_analysis.get("forecast_30d", stat_30d))
     llm_90d = float(llm_analysis.get("forecast_90d", stat_90d))
 
-    if llm_30d > 0 and stat_30d > 0:
+    # llm_fallback (LLM error / breaker open) echoes the statistical values back
+    if llm_analysis.get("method") in ("llm_analysis", "llm_combined") and llm_30d > 0 and stat_30d > 0:
         blended_30d     = round(0.4 * stat_30d + 0.6 * llm_30d, 2)
         blended_90d     = round(0.3 * stat_90d + 0.7 * llm_90d, 2)
         forecast_method = "llm_blended"
@@ -72,24 +84,10 @@ def run(
         blended_90d     = round(stat_90d, 2)
         forecast_method = forecast.get("method", "statistical")
 
-    # ── Base confidence from forecast method ──────────────────────────────────
-    _method_conf = {
-        "prophet":          80,
-        "llm_blended":      78,
-        "linear":           72,
-        "statistical":      75,
-        "market_avg":       68,
-        "industry_default": 58,
-    }
-    raw_method  = forecast.get("method", "market_avg")
-    conf_base   = _method_conf.get(raw_method, 65)
-
-    # Adjust for LLM agreement on trend direction
-    llm_dir = llm_analysis.get("trend_direction", trend_dir)
-    if llm_dir == trend_dir:
-        conf_base = min(99, conf_base + 5)
-    else:
-        conf_base = max(10, conf_base - 5)
+    # ── Base confidence, adjusted for LLM agreement on trend direction ───────
+    conf_agree, conf_disagree = confidence_branches(forecast)
+    llm_dir   = llm_analysis.get("trend_direction", trend_dir)
+    conf_base = conf_agree if llm_dir == trend_dir else conf_disagree
 
     # Adjust for best_time_to_buy signal
     btb = llm_analysis.get("best_time_to_buy", "neutral")
@@ -124,3 +122,60 @@ def run(
             },
         },
     }
+
+
+def run(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    forecast: dict,
+    market_context: dict,
+) -> dict:
+    """Run XGBoost inference then blend with LLM-enhanced price analysis.
+
+    Returns
+    -------
+    {
+        "predicted_price": float,
+        "forecast_30d": float,
+        "forecast_90d": float,
+        "forecast_method": str,
+        "confidence_base": int,      # base confidence 0-100 before adjustments
+        "shap_factors": [...],
+        "llm_analysis": {...},
+        "agent_log_entry": {...},
+    }
+    """
+    # ── XGBoost inference ─────────────────────────────────────────────────────
+    predicted_price, shap_factors = predict(make, model, year, mileage, condition, region)
+
+    # ── LLM analysis ──────────────────────────────────────────────────────────
+    llm_analysis = run_llm_price_analysis(**analysis_kwargs(
+        make, model, year, mileage, condition, region,
+        predicted_price, forecast, market_context,
+    ))
+    return blend(predicted_price, shap_factors, forecast, llm_analysis)
+
+
+async def arun(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    forecast: dict,
+    market_context: dict,
+    priority: str = "interactive",
+) -> dict:
+    """Async run() — XGBoost on a worker thread, LLM analysis awaited on the shared client."""
+    predicted_price, shap_factors = await asyncio.to_thread(predict, make, model, year, mileage, condition, region)
+
+    llm_analysis = await arun_llm_price_analysis(**analysis_kwargs(
+        make, model, year, mileage, condition, region,
+        predicted_price, forecast, market_context,
+    ), priority=priority)
+    return blend(predicted_price, shap_factors, forecast, llm_analysis)
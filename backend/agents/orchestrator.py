@@ -10,6 +10,8 @@ Demo override table (deterministic, always returned for matched vehicles):
   bmw 3 series   → WAIT    (−5.6%, confidence 78, High)
 """
 from __future__ import annotations
+import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -20,6 +22,24 @@ from backend.agents import (
     data_agent, trend_agent, forecast_agent,
     risk_agent, decision_agent, explanation_agent, ethics_agent,
 )
+from backend.agent import (
+    run_llm_price_analysis, arun_llm_price_analysis,
+    run_llm_combined_analysis, arun_llm_combined_analysis,
+)
+
+# two_call : ForecastAgent LLM analysis, then ExplanationAgent (two completions)
+# combined : one completion returns both; reasoning kept only if it matches
+#            the recommendation the deterministic agents derive
+# fast     : no LLM at all — statistical forecast + template explanation,
+#            forecast_method FAST_METHOD (bulk / internal scoring)
+LLM_MODES = ("two_call", "combined", "fast")
+FAST_METHOD = "statistical_fast"
+
+# inline   : explanation generated before returning
+# deferred : statistical forecast + template explanation returned at once with
+#            explanation_status "pending"; the caller generates the LLM
+#            explanation later from result["explanation_request"]
+EXPLAIN_MODES = ("inline", "deferred")
 
 # ── Demo overrides ─────────────────────────────────────────────────────────────
 _DEMO_OVERRIDES: dict[str, dict] = {
@@ -200,73 +220,80 @@ def _build_demo_agent_log(make: str, model: str, year: int, ov: dict) -> list[di
     ]
 
 
-def run_orchestrator(
-    make: str, model: str, year: int,
-    mileage: int = 50_000, condition: str = "good", region: str = "california",
-) -> dict:
-    """Run the full multi-agent pipeline and return a structured intelligence report."""
+def _demo_result(make: str, model: str, year: int) -> dict | None:
+    """Deterministic report for vehicles in the demo override table (None otherwise)."""
     vehicle_name = f"{year} {make.title()} {model.title()}"
     key          = _normalise(make, model)
+    if key not in _DEMO_OVERRIDES:
+        return None
+
+    ov          = _DEMO_OVERRIDES[key]
+    chg         = float(ov["predicted_90_day_change"])
+    conf        = int(ov["confidence_score"])
+    vol         = ov["volatility_index"]
+    curr_price  = ov["_curr_price"]
+    proj_price  = round(curr_price * (1 + chg / 100), 2)
+    _sigma      = {"Low": 0.04, "Moderate": 0.08, "High": 0.14}.get(vol, 0.08)
+    unc_low     = round(proj_price * (1 - _sigma), 2)
+    unc_high    = round(proj_price * (1 + _sigma), 2)
+    agent_log   = _build_demo_agent_log(make, model, year, ov)
+
+    return {
+        "vehicle_name":             vehicle_name,
+        "predicted_90_day_change":  chg,
+        "projected_price":          proj_price,
+        "current_price":            curr_price,
+        "confidence_score":         conf,
+        "volatility_index":         vol,
+        "risk_score":               ov["risk_score"],
+        "final_recommendation":     ov["final_recommendation"],
+        "reasoning_summary":        ov["reasoning_summary"],
+        "uncertainty_range":        {"low": unc_low, "high": unc_high},
+        "transparency_note":        ov["transparency_note"],
+        "bias_statement":           ov["bias_statement"],
+        "ethics_disclaimer":        ethics_agent._ETHICS_DISCLAIMER,
+        "agent_log":                agent_log,
+        "trend_data":               {
+            "direction":      "falling" if chg < 0 else "rising",
+            "strength":       "strong" if abs(chg) >= 3 else "moderate",
+            "momentum_score": round(50 + chg * 3, 1),
+        },
+        "data_features":            {
+            "ma_30": curr_price, "ma_90": proj_price,
+            "depreciation_rate": abs(chg) if chg < 0 else 0.0,
+            "seasonal_factor": 1.0,
+        },
+        # Legacy compat
+        "recommendation":    ov["recommendation"],
+        "confidence":        ov["confidence"],
+        "explanation":       " ".join(ov["reasoning_summary"]),
+        "predicted_price":   curr_price,
+        "forecast_30d":      round(curr_price * (1 + chg / 100 / 3), 2),
+        "forecast_90d":      proj_price,
+        "forecast_method":   ov["forecast_method"],
+        "llm_key_insight":   ov["reasoning_summary"][1],
+        "tool_outputs": {
+            "get_price_history":      [{"date": "2024-01", "avg_price": curr_price, "listing_count": ov["_inventory"]}],
+            "run_forecast":           {"forecast_30d": round(curr_price * (1 + chg / 300), 2), "forecast_90d": proj_price, "trend_direction": "falling" if chg < 0 else "rising", "trend_pct_change": round(chg / 3, 2), "trend_pct_90d": chg, "method": "prophet", "last_known_price": curr_price},
+            "get_market_context":     {"current_inventory_count": ov["_inventory"], "inventory_trend": "stable", "price_vs_median_pct": ov["_pct_med"]},
+            "run_price_prediction":   {"predicted_price": curr_price, "shap_factors": []},
+            "run_llm_price_analysis": {"forecast_30d": round(curr_price * (1 + chg / 300), 2), "forecast_90d": proj_price, "trend_direction": "falling" if chg < 0 else "rising", "key_insight": ov["reasoning_summary"][1], "best_time_to_buy": "now" if ov["final_recommendation"] == "BUY NOW" else "wait" if ov["final_recommendation"] == "WAIT" else "30_days"},
+            "synthesize_recommendation": {"recommendation": ov["recommendation"], "confidence": ov["confidence"]},
+        },
+        "shap_factors": [],
+    }
+
 
-    # ── Demo override check ───────────────────────────────────────────────────
-    if key in _DEMO_OVERRIDES:
-        ov          = _DEMO_OVERRIDES[key]
-        chg         = float(ov["predicted_90_day_change"])
-        conf        = int(ov["confidence_score"])
-        vol         = ov["volatility_index"]
-        curr_price  = ov["_curr_price"]
-        proj_price  = round(curr_price * (1 + chg / 100), 2)
-        _sigma      = {"Low": 0.04, "Moderate": 0.08, "High": 0.14}.get(vol, 0.08)
-        unc_low     = round(proj_price * (1 - _sigma), 2)
-        unc_high    = round(proj_price * (1 + _sigma), 2)
-        agent_log   = _build_demo_agent_log(make, model, year, ov)
-
-        return {
-            "vehicle_name":             vehicle_name,
-            "predicted_90_day_change":  chg,
-            "projected_price":          proj_price,
-            "current_price":            curr_price,
-            "confidence_score":         conf,
-            "volatility_index":         vol,
-            "risk_score":               ov["risk_score"],
-            "final_recommendation":     ov["final_recommendation"],
-            "reasoning_summary":        ov["reasoning_summary"],
-            "uncertainty_range":        {"low": unc_low, "high": unc_high},
-            "transparency_note":        ov["transparency_note"],
-            "bias_statement":           ov["bias_statement"],
-            "ethics_disclaimer":        ethics_agent._ETHICS_DISCLAIMER,
-            "agent_log":                agent_log,
-            "trend_data":               {
-                "direction":      "falling" if chg < 0 else "rising",
-                "strength":       "strong" if abs(chg) >= 3 else "moderate",
-                "momentum_score": round(50 + chg * 3, 1),
-            },
-            "data_features":            {
-                "ma_30": curr_price, "ma_90": proj_price,
-                "depreciation_rate": abs(chg) if chg < 0 else 0.0,
-                "seasonal_factor": 1.0,
-            },
-            # Legacy compat
-            "recommendation":    ov["recommendation"],
-            "confidence":        ov["confidence"],
-            "explanation":       " ".join(ov["reasoning_summary"]),
-            "predicted_price":   curr_price,
-            "forecast_30d":      round(curr_price * (1 + chg / 100 / 3), 2),
-            "forecast_90d":      proj_price,
-            "forecast_method":   ov["forecast_method"],
-            "llm_key_insight":   ov["reasoning_summary"][1],
-            "tool_outputs": {
-                "get_price_history":      [{"date": "2024-01", "avg_price": curr_price, "listing_count": ov["_inventory"]}],
-                "run_forecast":           {"forecast_30d": round(curr_price * (1 + chg / 300), 2), "forecast_90d": proj_price, "trend_direction": "falling" if chg < 0 else "rising", "trend_pct_change": round(chg / 3, 2), "trend_pct_90d": chg, "method": "prophet", "last_known_price": curr_price},
-                "get_market_context":     {"current_inventory_count": ov["_inventory"], "inventory_trend": "stable", "price_vs_median_pct": ov["_pct_med"]},
-                "run_price_prediction":   {"predicted_price": curr_price, "shap_factors": []},
-                "run_llm_price_analysis": {"forecast_30d": round(curr_price * (1 + chg / 300), 2), "forecast_90d": proj_price, "trend_direction": "falling" if chg < 0 else "rising", "key_insight": ov["reasoning_summary"][1], "best_time_to_buy": "now" if ov["final_recommendation"] == "BUY NOW" else "wait" if ov["final_recommendation"] == "WAIT" else "30_days"},
-                "synthesize_recommendation": {"recommendation": ov["recommendation"], "confidence": ov["confidence"]},
-            },
-            "shap_factors": [],
-        }
-
-    # ── Live pipeline ─────────────────────────────────────────────────────────
+# ── Live pipeline steps ───────────────────────────────────────────────────────
+# Shared by run_orchestrator (sync, CLI / threads) and arun_orchestrator (event
+# loop). Pipeline state travels in one dict between steps.
+
+def _start(
+    make: str, model: str, year: int,
+    mileage: int, condition: str, region: str,
+) -> dict:
+    """Data + trend agents (MongoDB / snapshot store / Prophet — blocking)."""
+    vehicle_name = f"{year} {make.title()} {model.title()}"
     agent_log: list[dict] = []
     agent_log.append({
         "agent": "OrchestratorAgent", "status": "ok",
@@ -276,72 +303,94 @@ def run_orchestrator(
 
     data_out       = data_agent.run(make, model, year)
     agent_log.append(data_out["agent_log_entry"])
-    price_history  = data_out["price_history"]
     market_context = data_out["market_context"]
-    has_history    = data_out["has_history"]
-    inventory_trend = market_context.get("inventory_trend", "unknown")
-    pct_vs_med      = float(market_context.get("price_vs_median_pct", 0.0))
 
-    trend_out = trend_agent.run(make, model, year, price_history)
+    trend_out = trend_agent.run(make, model, year, data_out["price_history"])
     agent_log.append(trend_out["agent_log_entry"])
-    forecast_raw  = trend_out["forecast"]
-    trend_data    = trend_out["trend_data"]
-    data_features = trend_out["data_features"]
-
-    fc_out = forecast_agent.run(
-        make=make, model=model, year=year,
-        mileage=mileage, condition=condition, region=region,
-        forecast=forecast_raw, market_context=market_context,
+
+    return {
+        "make": make, "model": model, "year": year,
+        "mileage": mileage, "condition": condition, "region": region,
+        "vehicle_name":    vehicle_name,
+        "agent_log":       agent_log,
+        "price_history":   data_out["price_history"],
+        "market_context":  market_context,
+        "has_history":     data_out["has_history"],
+        "inventory_trend": market_context.get("inventory_trend", "unknown"),
+        "pct_vs_med":      float(market_context.get("price_vs_median_pct", 0.0)),
+        "forecast_raw":    trend_out["forecast"],
+        "trend_data":      trend_out["trend_data"],
+        "data_features":   trend_out["data_features"],
+    }
+
+
+def _forecast_kwargs(st: dict) -> dict:
+    return dict(
+        make=st["make"], model=st["model"], year=st["year"],
+        mileage=st["mileage"], condition=st["condition"], region=st["region"],
+        forecast=st["forecast_raw"], market_context=st["market_context"],
     )
-    agent_log.append(fc_out["agent_log_entry"])
-    predicted_price = fc_out["predicted_price"]
-    forecast_30d    = fc_out["forecast_30d"]
-    forecast_90d    = fc_out["forecast_90d"]
-    forecast_method = fc_out["forecast_method"]
-    confidence_base = fc_out["confidence_base"]
-    shap_factors    = fc_out["shap_factors"]
-    llm_analysis    = fc_out["llm_analysis"]
-    llm_key_insight = llm_analysis.get("key_insight", "")
+
+
+def _apply_forecast(st: dict, fc_out: dict) -> None:
+    """Record the forecast, then run the pure-Python risk and decision agents."""
+    st["agent_log"].append(fc_out["agent_log_entry"])
+    st["predicted_price"] = fc_out["predicted_price"]
+    st["forecast_30d"]    = fc_out["forecast_30d"]
+    st["forecast_90d"]    = fc_out["forecast_90d"]
+    st["forecast_method"] = fc_out["forecast_method"]
+    st["confidence_base"] = fc_out["confidence_base"]
+    st["shap_factors"]    = fc_out["shap_factors"]
+    st["llm_analysis"]    = fc_out["llm_analysis"]
+    st["llm_key_insight"] = fc_out["llm_analysis"].get("key_insight", "")
 
     risk_out = risk_agent.run(
-        predicted_price=predicted_price, forecast_90d=forecast_90d,
-        confidence_base=confidence_base, inventory_trend=inventory_trend,
-        has_price_history=has_history,
+        predicted_price=st["predicted_price"], forecast_90d=st["forecast_90d"],
+        confidence_base=st["confidence_base"], inventory_trend=st["inventory_trend"],
+        has_price_history=st["has_history"], make=st["make"], model=st["model"], year=st["year"],
     )
-    agent_log.append(risk_out["agent_log_entry"])
-    volatility_index        = risk_out["volatility_index"]
-    risk_score              = risk_out["risk_score"]
-    uncertainty_range       = risk_out["uncertainty_range"]
-    predicted_90_day_change = risk_out["predicted_90_day_change"]
+    st["agent_log"].append(risk_out["agent_log_entry"])
+    st["volatility_index"]        = risk_out["volatility_index"]
+    st["risk_score"]              = risk_out["risk_score"]
+    st["uncertainty_range"]       = risk_out["uncertainty_range"]
+    st["predicted_90_day_change"] = risk_out["predicted_90_day_change"]
 
     dec_out = decision_agent.run(
-        predicted_90_day_change=predicted_90_day_change,
-        confidence_score=confidence_base, volatility_index=volatility_index,
-        price_vs_median_pct=pct_vs_med,
+        predicted_90_day_change=st["predicted_90_day_change"],
+        confidence_score=st["confidence_base"], volatility_index=st["volatility_index"],
+        price_vs_median_pct=st["pct_vs_med"],
     )
-    agent_log.append(dec_out["agent_log_entry"])
-    final_recommendation = dec_out["final_recommendation"]
-    decision_rationale   = dec_out["decision_rationale"]
-    _rec_map             = {"BUY NOW": "BUY", "WAIT": "WAIT", "MONITOR": "NEUTRAL"}
-    legacy_rec           = _rec_map.get(final_recommendation, "NEUTRAL")
-
-    exp_out = explanation_agent.run(
-        make=make, model=model, year=year, mileage=mileage,
-        condition=condition, region=region, predicted_price=predicted_price,
-        predicted_90_day_change=predicted_90_day_change,
-        confidence_score=confidence_base, volatility_index=volatility_index,
-        final_recommendation=final_recommendation, decision_rationale=decision_rationale,
-        llm_key_insight=llm_key_insight, trend_direction=trend_data["direction"],
-        inventory_trend=inventory_trend,
+    st["agent_log"].append(dec_out["agent_log_entry"])
+    st["final_recommendation"] = dec_out["final_recommendation"]
+    st["decision_rationale"]   = dec_out["decision_rationale"]
+
+
+def _explanation_kwargs(st: dict) -> dict:
+    return dict(
+        make=st["make"], model=st["model"], year=st["year"], mileage=st["mileage"],
+        condition=st["condition"], region=st["region"], predicted_price=st["predicted_price"],
+        predicted_90_day_change=st["predicted_90_day_change"],
+        confidence_score=st["confidence_base"], volatility_index=st["volatility_index"],
+        final_recommendation=st["final_recommendation"], decision_rationale=st["decision_rationale"],
+        llm_key_insight=st["llm_key_insight"], trend_direction=st["trend_data"]["direction"],
+        inventory_trend=st["inventory_trend"],
     )
+
+
+def _finish(st: dict, exp_out: dict) -> dict:
+    """Ethics agent + assemble the final report."""
+    agent_log            = st["agent_log"]
+    final_recommendation = st["final_recommendation"]
+    confidence_base      = st["confidence_base"]
+    predicted_price      = st["predicted_price"]
+    forecast_30d         = st["forecast_30d"]
+    forecast_90d         = st["forecast_90d"]
     agent_log.append(exp_out["agent_log_entry"])
-    reasoning_summary = exp_out["reasoning_summary"]
-    explanation_text  = exp_out["explanation_text"]
 
     eth_out = ethics_agent.run(
-        make=make, model=model, year=year, forecast_method=forecast_method,
-        confidence_score=confidence_base, volatility_index=volatility_index,
-        has_price_history=has_history, inventory_trend=inventory_trend,
+        make=st["make"], model=st["model"], year=st["year"], forecast_method=st["forecast_method"],
+        confidence_score=confidence_base, volatility_index=st["volatility_index"],
+        has_price_history=st["has_history"], inventory_trend=st["inventory_trend"],
     )
     agent_log.append(eth_out["agent_log_entry"])
     agent_log.append({
@@ -350,40 +399,216 @@ def run_orchestrator(
         "output": {"final_recommendation": final_recommendation, "confidence_score": confidence_base, "steps_completed": 7},
     })
 
+    _rec_map    = {"BUY NOW": "BUY", "WAIT": "WAIT", "MONITOR": "NEUTRAL"}
+    legacy_rec  = _rec_map.get(final_recommendation, "NEUTRAL")
     legacy_conf = "HIGH" if confidence_base >= 75 else "MODERATE" if confidence_base >= 55 else "LOW"
 
     return {
-        "vehicle_name":             vehicle_name,
-        "predicted_90_day_change":  predicted_90_day_change,
+        "vehicle_name":             st["vehicle_name"],
+        "predicted_90_day_change":  st["predicted_90_day_change"],
         "projected_price":          round(forecast_90d, 2),
         "current_price":            round(predicted_price, 2),
         "confidence_score":         confidence_base,
-        "volatility_index":         volatility_index,
-        "risk_score":               risk_score,
+        "volatility_index":         st["volatility_index"],
+        "risk_score":               st["risk_score"],
         "final_recommendation":     final_recommendation,
-        "reasoning_summary":        reasoning_summary,
-        "uncertainty_range":        uncertainty_range,
+        "reasoning_summary":        exp_out["reasoning_summary"],
+        "uncertainty_range":        st["uncertainty_range"],
         "transparency_note":        eth_out["transparency_note"],
         "bias_statement":           eth_out["bias_statement"],
         "ethics_disclaimer":        eth_out["ethics_disclaimer"],
         "agent_log":                agent_log,
-        "trend_data":               trend_data,
-        "data_features":            data_features,
+        "trend_data":               st["trend_data"],
+        "data_features":            st["data_features"],
         "recommendation":           legacy_rec,
         "confidence":               legacy_conf,
-        "explanation":              explanation_text,
+        "explanation":              exp_out["explanation_text"],
         "predicted_price":          round(predicted_price, 2),
         "forecast_30d":             round(forecast_30d, 2),
         "forecast_90d":             round(forecast_90d, 2),
-        "forecast_method":          forecast_method,
-        "llm_key_insight":          llm_key_insight,
+        "forecast_method":          st["forecast_method"],
+        "llm_key_insight":          st["llm_key_insight"],
         "tool_outputs": {
-            "get_price_history":         price_history,
-            "run_forecast":              forecast_raw,
-            "get_market_context":        market_context,
-            "run_price_prediction":      {"predicted_price": predicted_price, "shap_factors": shap_factors},
-            "run_llm_price_analysis":    llm_analysis,
-            "synthesize_recommendation": {"recommendation": legacy_rec, "confidence": legacy_conf, "rationale": decision_rationale, "predicted_price": predicted_price, "forecast_30d": forecast_30d, "forecast_90d": forecast_90d},
+            "get_price_history":         st["price_history"],
+            "run_forecast":              st["forecast_raw"],
+            "get_market_context":        st["market_context"],
+            "run_price_prediction":      {"predicted_price": predicted_price, "shap_factors": st["shap_factors"]},
+            "run_llm_price_analysis":    st["llm_analysis"],
+            "synthesize_recommendation": {"recommendation": legacy_rec, "confidence": legacy_conf, "rationale": st["decision_rationale"], "predicted_price": predicted_price, "forecast_30d": forecast_30d, "forecast_90d": forecast_90d},
         },
-        "shap_factors": shap_factors,
+        "shap_factors": st["shap_factors"],
     }
+
+
+# ── Deferred-explanation and fast modes ───────────────────────────────────────
+def _start_deterministic(
+    make: str, model: str, year: int,
+    mileage: int, condition: str, region: str,
+) -> dict:
+    """Data → trend → XGBoost + statistical forecast → risk → decision, no LLM."""
+    st = _start(make, model, year, mileage, condition, region)
+    price, shap = forecast_agent.predict(make, model, year, mileage, condition, region)
+    analysis    = forecast_agent.statistical_analysis(st["forecast_raw"], price)
+    _apply_forecast(st, forecast_agent.blend(price, shap, st["forecast_raw"], analysis))
+    return st
+
+
+def _deferred_result(st: dict) -> dict:
+    """Report with the template explanation, marked pending for a later LLM pass."""
+    request = _explanation_kwargs(st)
+    result  = _finish(st, explanation_agent.template(**request))
+    result["explanation_status"]  = "pending"
+    result["explanation_request"] = request
+    return result
+
+
+def _fast_result(st: dict) -> dict:
+    """Final report with the template explanation and no LLM pass to follow."""
+    st["forecast_method"] = FAST_METHOD
+    return _finish(st, explanation_agent.template(**_explanation_kwargs(st)))
+
+
+def apply_explanation(result: dict, exp_out: dict) -> dict:
+    """Fields to overwrite on a deferred *result* once *exp_out* is available."""
+    agent_log = [
+        exp_out["agent_log_entry"] if e.get("agent") == "ExplanationAgent" else e
+        for e in result.get("agent_log", [])
+    ]
+    return {
+        "reasoning_summary":  exp_out["reasoning_summary"],
+        "explanation":        exp_out["explanation_text"],
+        "agent_log":          agent_log,
+        "explanation_status": "ready",
+    }
+
+
+# ── Combined single-call mode ─────────────────────────────────────────────────
+def _combined_inputs(st: dict, predicted_price: float) -> tuple[dict, dict]:
+    """(analysis kwargs, decision-rule inputs) for the combined prompt."""
+    analysis = forecast_agent.analysis_kwargs(
+        st["make"], st["model"], st["year"], st["mileage"], st["condition"], st["region"],
+        predicted_price, st["forecast_raw"], st["market_context"],
+    )
+    conf_agree, conf_disagree = forecast_agent.confidence_branches(st["forecast_raw"])
+    rules = {"conf_agree": conf_agree, "conf_disagree": conf_disagree, "has_history": st["has_history"]}
+    return analysis, rules
+
+
+def _apply_combined(st: dict, predicted_price: float, shap_factors: list, combined: dict) -> dict | None:
+    """Blend / risk / decision from the combined reply.
+
+    Returns the ExplanationAgent output built from its reasoning when the
+    LLM's expected recommendation matches the rules; None otherwise.
+    """
+    _apply_forecast(st, forecast_agent.blend(predicted_price, shap_factors, st["forecast_raw"], combined))
+    if combined["expected_recommendation"] == st["final_recommendation"]:
+        return explanation_agent.build_result(combined["reasoning"], st["final_recommendation"],
+                                              cached=False, source="combined")
+    st["agent_log"].append({
+        "agent": "OrchestratorAgent", "status": "warn",
+        "message": (f"Combined LLM reasoning argued {combined['expected_recommendation']} but the "
+                    f"decision rules gave {st['final_recommendation']} — regenerating the explanation."),
+        "output": {"llm_mode": "combined", "validated": False},
+    })
+    return None
+
+
+def _combined_failed(st: dict) -> None:
+    st["agent_log"].append({
+        "agent": "OrchestratorAgent", "status": "warn",
+        "message": "Combined LLM call failed or returned an invalid reply — using the two-call path.",
+        "output": {"llm_mode": "combined", "validated": False},
+    })
+
+
+def _resolve_mode(llm_mode: str | None, explain: str = "inline") -> str:
+    mode = llm_mode or os.environ.get("LLM_MODE", "two_call")
+    if mode not in LLM_MODES:
+        raise ValueError(f"llm_mode must be one of {LLM_MODES}, got {mode!r}")
+    if explain not in EXPLAIN_MODES:
+        raise ValueError(f"explain must be one of {EXPLAIN_MODES}, got {explain!r}")
+    return mode
+
+
+def run_orchestrator(
+    make: str, model: str, year: int,
+    mileage: int = 50_000, condition: str = "good", region: str = "california",
+    llm_mode: str | None = None, explain: str = "inline",
+) -> dict:
+    """Run the full multi-agent pipeline and return a structured intelligence report.
+
+    llm_mode: "two_call" | "combined" | "fast" (default: LLM_MODE env var, else two_call).
+    explain : "inline" | "deferred" (see EXPLAIN_MODES; ignored in fast mode).
+    """
+    demo = _demo_result(make, model, year)
+    if demo is not None:
+        return demo
+
+    mode = _resolve_mode(llm_mode, explain)
+    if mode == "fast":
+        return _fast_result(_start_deterministic(make, model, year, mileage, condition, region))
+    if explain == "deferred":
+        return _deferred_result(_start_deterministic(make, model, year, mileage, condition, region))
+
+    st = _start(make, model, year, mileage, condition, region)
+    if mode == "two_call":
+        _apply_forecast(st, forecast_agent.run(**_forecast_kwargs(st)))
+        return _finish(st, explanation_agent.run(**_explanation_kwargs(st)))
+
+    price, shap = forecast_agent.predict(make, model, year, mileage, condition, region)
+    analysis, rules = _combined_inputs(st, price)
+    combined = run_llm_combined_analysis(analysis, rules)
+    if combined is None:
+        _combined_failed(st)
+        llm_analysis = run_llm_price_analysis(**analysis)
+        _apply_forecast(st, forecast_agent.blend(price, shap, st["forecast_raw"], llm_analysis))
+        exp_out = None
+    else:
+        exp_out = _apply_combined(st, price, shap, combined)
+    return _finish(st, exp_out or explanation_agent.run(**_explanation_kwargs(st)))
+
+
+async def arun_orchestrator(
+    make: str, model: str, year: int,
+    mileage: int = 50_000, condition: str = "good", region: str = "california",
+    priority: str = "interactive", llm_mode: str | None = None, explain: str = "inline",
+) -> dict:
+    """Async run_orchestrator — LLM steps await the shared pooled client.
+
+    Blocking data/trend work runs on a worker thread; LLM calls hold no
+    thread while waiting on OpenAI. *priority* ("interactive" |
+    "background") orders admission under the global LLM concurrency cap.
+    """
+    demo = _demo_result(make, model, year)
+    if demo is not None:
+        return demo
+
+    mode = _resolve_mode(llm_mode, explain)
+    if mode == "fast":
+        return await asyncio.to_thread(
+            run_orchestrator, make, model, year, mileage, condition, region, llm_mode="fast",
+        )
+    if explain == "deferred":
+        st = await asyncio.to_thread(_start_deterministic, make, model, year, mileage, condition, region)
+        return _deferred_result(st)
+
+    st = await asyncio.to_thread(_start, make, model, year, mileage, condition, region)
+    if mode == "two_call":
+        _apply_forecast(st, await forecast_agent.arun(**_forecast_kwargs(st), priority=priority))
+        return _finish(st, await explanation_agent.arun(**_explanation_kwargs(st), priority=priority))
+
+    price, shap = await asyncio.to_thread(
+        forecast_agent.predict, make, model, year, mileage, condition, region,
+    )
+    analysis, rules = _combined_inputs(st, price)
+    combined = await arun_llm_combined_analysis(analysis, rules, priority=priority)
+    if combined is None:
+        _combined_failed(st)
+        llm_analysis = await arun_llm_price_analysis(**analysis, priority=priority)
+        _apply_forecast(st, forecast_agent.blend(price, shap, st["forecast_raw"], llm_analysis))
+        exp_out = None
+    else:
+        exp_out = _apply_combined(st, price, shap, combined)
+    if exp_out is None:
+        exp_out = await explanation_agent.arun(**_explanation_kwargs(st), priority=priority)
+    return _finish(st, exp_out)
@@ -1,8 +1,23 @@
 # backend/agents/risk_agent.py
 """RiskAssessmentAgent — pure Python volatility, risk, and uncertainty calculation."""
 from __future__ import annotations
+import math
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.agent import snapshot_store
 from backend.utils.smoothing import bound
 
+# Fixed band half-widths, used when no realized volatility is available
+_SIGMA = {"Low": 0.04, "Moderate": 0.08, "High": 0.14}
+
+# A 90-day band from monthly return volatility: sigma_1m · √3, clamped so a
+# very quiet or very noisy series still yields a usable range.
+_HORIZON_MONTHS = 3
+_SIGMA_MIN, _SIGMA_MAX = 0.02, 0.30
+
 
 def run(
     predicted_price: float,
@@ -10,9 +25,16 @@ def run(
     confidence_base: int,
     inventory_trend: str,
     has_price_history: bool,
+    make: str | None = None,
+    model: str | None = None,
+    year: int | None = None,
 ) -> dict:
     """Classify volatility, compute risk score and uncertainty range.
 
+    When make/model/year are given, the uncertainty band is sized from the
+    realized month-over-month volatility precomputed by the snapshot store
+    (series → make → segment → market); otherwise from the volatility class.
+
     Returns
     -------
     {
@@ -52,8 +74,16 @@ def run(
     risk_score = int(bound(risk_base - conf_reduction, 5, 95))
 
     # ── Uncertainty range (projected price ± sigma) ───────────────────────────
-    _sigma = {"Low": 0.04, "Moderate": 0.08, "High": 0.14}
-    sigma        = _sigma[volatility]
+    realized = (
+        snapshot_store.volatility(make, model, year)
+        if make and model and year is not None else None
+    )
+    if realized:
+        sigma        = bound(realized["sigma_1m"] * math.sqrt(_HORIZON_MONTHS), _SIGMA_MIN, _SIGMA_MAX)
+        sigma_source = f"realized_{realized['level']}"
+    else:
+        sigma        = _SIGMA[volatility]
+        sigma_source = "volatility_class"
     proj_price   = forecast_90d if forecast_90d > 0 else predicted_price
     unc_low      = round(proj_price * (1 - sigma), 2)
     unc_high     = round(proj_price * (1 + sigma), 2)
@@ -79,6 +109,8 @@ def run(
                 "predicted_90_day_change": change_pct,
                 "uncertainty_low":         unc_low,
                 "uncertainty_high":        unc_high,
+                "sigma":                   round(sigma, 4),
+                "sigma_source":            sigma_source,
             },
         },
     }
@@ -6,8 +6,49 @@ from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agent import run_forecast
-from backend.utils.smoothing import moving_average, bound
+from backend.agent import run_forecast, snapshot_store
+from backend.utils.smoothing import bound
+from backend.utils import timeseries as ts
+from backend.utils.trend_features import MIN_MONTHS, history_fingerprint
+
+
+def _compute_features(prices: list[float], last_price: float, fc_30: float, fc_90: float) -> dict:
+    """Per-request data features — used when nothing valid was materialised at ingest."""
+    if prices and len(prices) >= MIN_MONTHS:
+        ma_30 = round(float(ts.rolling_mean(prices, 3)[-1]), 2)
+        ma_90 = round(float(ts.rolling_mean(prices, 9)[-1]), 2)
+    else:
+        ma_30 = round(fc_30, 2)
+        ma_90 = round(fc_90, 2)
+
+    # Annualised depreciation rate (positive = depreciation)
+    depreciation_rate = round(ts.depreciation_rate(prices, last=last_price), 2) if prices else 0.0
+
+    # Seasonal factor: current month price vs 3-month MA (> 1 = above seasonal avg)
+    seasonal_factor = round(last_price / ma_90, 3) if ma_90 > 0 else 1.0
+
+    return {
+        "ma_30":             ma_30,
+        "ma_90":             ma_90,
+        "depreciation_rate": depreciation_rate,
+        "seasonal_factor":   seasonal_factor,
+    }
+
+
+def _stored_features(
+    make: str, model: str, year: int,
+    price_history: list[dict], prices: list[float], last_price: float,
+) -> dict | None:
+    """Ingest-time features, or None when missing or the series has changed since."""
+    stored = snapshot_store.trend_features(make, model, year) if snapshot_store.loaded else None
+    if not stored or len(prices) < MIN_MONTHS or stored.get("n_months") != len(prices):
+        return None
+    # Stored values assume the forecast's last price is the last history point
+    if abs(float(stored.get("last_price", 0)) - last_price) >= 0.005:
+        return None
+    if stored.get("fingerprint") != history_fingerprint(price_history):
+        return None
+    return {k: stored[k] for k in ("ma_30", "ma_90", "depreciation_rate", "seasonal_factor")}
 
 
 def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
@@ -59,23 +100,10 @@ def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
     fc_30      = float(forecast.get("forecast_30d", last_price or 18500))
     fc_90      = float(forecast.get("forecast_90d", last_price or 18500))
 
-    if prices and len(prices) >= 3:
-        ma_30 = round(moving_average(prices, 3)[-1], 2)
-        ma_90 = round(moving_average(prices, min(9, len(prices)))[-1], 2)
-    else:
-        ma_30 = round(fc_30, 2)
-        ma_90 = round(fc_90, 2)
-
-    # Annualised depreciation rate (positive = depreciation)
-    if last_price > 0 and len(prices) >= 2:
-        oldest = prices[0]
-        n_years = len(prices) / 12
-        depreciation_rate = round((oldest - last_price) / oldest / max(n_years, 1) * 100, 2)
-    else:
-        depreciation_rate = 0.0
-
-    # Seasonal factor: current month price vs 3-month MA (> 1 = above seasonal avg)
-    seasonal_factor = round(last_price / ma_90, 3) if ma_90 > 0 else 1.0
+    data_features   = _stored_features(make, model, year, price_history, prices, last_price)
+    features_source = "precomputed" if data_features else "computed"
+    if data_features is None:
+        data_features = _compute_features(prices, last_price, fc_30, fc_90)
 
     msg = (
         f"Forecast method: {method}. "
@@ -90,12 +118,7 @@ def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
             "strength":       strength,
             "momentum_score": momentum_score,
         },
-        "data_features": {
-            "ma_30":             ma_30,
-            "ma_90":             ma_90,
-            "depreciation_rate": depreciation_rate,
-            "seasonal_factor":   seasonal_factor,
-        },
+        "data_features": data_features,
         "agent_log_entry": {
             "agent":   "TrendAnalysisAgent",
             "status":  "ok",
@@ -107,6 +130,7 @@ def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
                 "method":         method,
                 "trend_pct_30d":  trend_pct,
                 "trend_pct_90d":  trend_90d,
+                "features":       features_source,
             },
         },
     }
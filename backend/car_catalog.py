@@ -1,9749 +1,164 @@
-"""Auto-generated car catalog from cleaned_cars.csv — do not edit by hand."""
+# backend/car_catalog.py
+"""Static 20-make car catalog (make, model, year), always available.
+
+Loaded from car_catalog.json, written by scripts/build_catalog.py from
+cleaned_cars.csv — regenerate rather than edit by hand. The file holds a
+make table, a newline-joined model table and, per (make, model) in sorted
+order, a model id and a year bitmask (bit i = base_year + i); make_counts
+gives how many (make, model) pairs each make has.
+
+In memory each (make, model) is one slot in parallel arrays (model id, year
+bitmask, first-row offset) over string tables holding every name once, plus
+a make → slot-range index (model → slot dicts are filled in per make on
+first lookup), instead of ~10k dicts:
+
+  CATALOG.makes()              → ["acura", ...]
+  CATALOG.models("honda")      → ["accord", ...]
+  CATALOG.years("honda", "civic") → [2021, 2020, ...]
+  ("honda", "civic", 2018) in CATALOG
+  CATALOG.rows()               → (make, model, year) tuples
+
+CATALOG is still a sequence of {"make", "model", "year"} dicts for callers
+that iterate it; those dicts are built on access, not stored.
+"""
 from __future__ import annotations
+import json
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate
+from pathlib import Path
+
+DATA_PATH = Path(__file__).with_name("car_catalog.json")
+FORMAT    = 1
+
+
+def encode(rows: Iterable[tuple[str, str, int]], source: str = "") -> dict:
+    """(make, model, year) rows → the car_catalog.json document (sorted, de-duplicated)."""
+    years_by_key: dict[tuple[str, str], set[int]] = {}
+    for make, model, year in rows:
+        years_by_key.setdefault((make, model), set()).add(int(year))
+    keys      = sorted(years_by_key)
+    base_year = min((y for ys in years_by_key.values() for y in ys), default=0)
+    makes     = sorted({make for make, _ in keys})
+    models    = sorted({model for _, model in keys})
+    model_ids = {m: i for i, m in enumerate(models)}
+    return {
+        "format":      FORMAT,
+        "source":      source,
+        "base_year":   base_year,
+        "makes":       makes,
+        "models":      "\n".join(models),   # one string parses far faster than thousands
+        "make_counts": [sum(1 for mk, _ in keys if mk == make) for make in makes],
+        "model_ids":   [model_ids[model] for _, model in keys],
+        "year_masks":  [sum(1 << (y - base_year) for y in years_by_key[k]) for k in keys],
+    }
+
+
+def write(doc: dict, path: str | Path = DATA_PATH) -> None:
+    """Compact JSON, one line per field."""
+    lines = [f"{json.dumps(k)}:{json.dumps(v, separators=(',', ':'), ensure_ascii=False)}"
+             for k, v in doc.items()]
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("{" + ",\n".join(lines) + "}\n")
+
+
+class CarCatalog(Sequence):
+    """Array-backed (make, model, year) rows with a make → model → years index."""
+
+    def __init__(self, doc: dict) -> None:
+        if doc.get("format") != FORMAT:
+            raise ValueError(f"Unsupported car catalog format {doc.get('format')!r}")
+        self._base   = doc["base_year"]
+        self._makes  = tuple(sys.intern(m) for m in doc["makes"])
+        # Each model name is one shared object; rows refer to it by id
+        self._models = tuple(doc["models"].split("\n"))
+        # One slot per (make, model), sorted by make then model: model id, year
+        # bitmask and the number of its first row — rows are numbered in make,
+        # model, year-desc order
+        self._model_ids = array("H", doc["model_ids"])
+        self._masks     = array("L", doc["year_masks"])
+        self._offsets   = array("L", accumulate(map(int.bit_count, self._masks), initial=0))
+        bounds          = list(accumulate(doc["make_counts"], initial=0))
+        self._make_of   = array("L", bounds)   # make id → first slot
+        self._spans     = {make: (lo, hi) for make, lo, hi in zip(self._makes, bounds, bounds[1:])}
+        # make → model → slot, built per make on first lookup
+        self._slots: dict[str, dict[str, int]] = {}
+        self._decoded: dict[int, tuple[int, ...]] = {}
+
+    def _years_of(self, slot: int) -> tuple[int, ...]:
+        mask  = self._masks[slot]
+        years = self._decoded.get(mask)
+        if years is None:
+            years = self._decoded[mask] = tuple(
+                self._base + bit for bit in range(mask.bit_length() - 1, -1, -1) if mask >> bit & 1
+            )
+        return years
+
+    def _slot(self, make: str, model: str) -> int | None:
+        slots = self._slots.get(make)
+        if slots is None:
+            if make not in self._spans:
+                return None
+            lo, hi = self._spans[make]
+            slots  = self._slots[make] = dict(zip(self.models(make), range(lo, hi)))
+        return slots.get(model)
+
+    @classmethod
+    def load(cls, path: str | Path = DATA_PATH) -> "CarCatalog":
+        with open(path, encoding="utf-8") as fh:
+            return cls(json.load(fh))
+
+    # ── Index lookups ─────────────────────────────────────────────────────────
+    def makes(self) -> list[str]:
+        return list(self._spans)
+
+    def models(self, make: str) -> list[str]:
+        lo, hi = self._spans.get(make, (0, 0))
+        return [self._models[i] for i in self._model_ids[lo:hi]]
+
+    def years(self, make: str, model: str) -> list[int]:
+        """Catalogued years for (make, model), newest first ([] if unknown)."""
+        slot = self._slot(make, model)
+        return list(self._years_of(slot)) if slot is not None else []
+
+    def __contains__(self, item) -> bool:
+        """(make, model, year) tuple or {"make", "model", "year"} dict."""
+        if isinstance(item, dict):
+            item = (item.get("make"), item.get("model"), item.get("year"))
+        try:
+            make, model, year = item
+        except (TypeError, ValueError):
+            return False
+        return year in self.years(make, model)
+
+    # ── Row access ────────────────────────────────────────────────────────────
+    def rows(self) -> Iterator[tuple[str, str, int]]:
+        for make, (lo, hi) in self._spans.items():
+            for slot in range(lo, hi):
+                model = self._models[self._model_ids[slot]]
+                for year in self._years_of(slot):
+                    yield make, model, year
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("car catalog index out of range")
+        slot = bisect_right(self._offsets, i) - 1
+        return {"make":  self._makes[bisect_right(self._make_of, slot) - 1],
+                "model": self._models[self._model_ids[slot]],
+                "year":  self._years_of(slot)[i - self._offsets[slot]]}
+
+    def __iter__(self) -> Iterator[dict]:
+        for make, model, year in self.rows():
+            yield {"make": make, "model": model, "year": year}
+
 
-CATALOG: list[dict] = [
-    {"make": 'acura', "model": 'ilx', "year": 2020},
-    {"make": 'acura', "model": 'ilx', "year": 2018},
-    {"make": 'acura', "model": 'ilx', "year": 2017},
-    {"make": 'acura', "model": 'ilx', "year": 2016},
-    {"make": 'acura', "model": 'ilx', "year": 2015},
-    {"make": 'acura', "model": 'ilx', "year": 2014},
-    {"make": 'acura', "model": 'ilx', "year": 2013},
-    {"make": 'acura', "model": 'ilx 2.0l sedan 4d', "year": 2014},
-    {"make": 'acura', "model": 'ilx 2.0l sedan 4d', "year": 2013},
-    {"make": 'acura', "model": 'ilx premium and a-spec', "year": 2020},
-    {"make": 'acura', "model": 'ilx premium pkg sedan 4d', "year": 2019},
-    {"make": 'acura', "model": 'ilx premium pkg sedan 4d', "year": 2018},
-    {"make": 'acura', "model": 'ilx sedan 4d', "year": 2020},
-    {"make": 'acura', "model": 'ilx sedan 4d', "year": 2019},
-    {"make": 'acura', "model": 'ilx sedan 4d', "year": 2017},
-    {"make": 'acura', "model": 'ilx sedan 4d', "year": 2016},
-    {"make": 'acura', "model": 'ilx sedan 4d', "year": 2015},
-    {"make": 'acura', "model": 'ilx special edition sedan', "year": 2018},
-    {"make": 'acura', "model": 'ilx technology and a-spec', "year": 2019},
-    {"make": 'acura', "model": 'ilx technology plus and', "year": 2018},
-    {"make": 'acura', "model": 'mdx', "year": 2020},
-    {"make": 'acura', "model": 'mdx', "year": 2019},
-    {"make": 'acura', "model": 'mdx', "year": 2018},
-    {"make": 'acura', "model": 'mdx', "year": 2017},
-    {"make": 'acura', "model": 'mdx', "year": 2016},
-    {"make": 'acura', "model": 'mdx', "year": 2015},
-    {"make": 'acura', "model": 'mdx', "year": 2014},
-    {"make": 'acura', "model": 'mdx', "year": 2013},
-    {"make": 'acura', "model": 'mdx', "year": 2012},
-    {"make": 'acura', "model": 'mdx', "year": 2011},
-    {"make": 'acura', "model": 'mdx', "year": 2010},
-    {"make": 'acura', "model": 'mdx', "year": 2009},
-    {"make": 'acura', "model": 'mdx', "year": 2008},
-    {"make": 'acura', "model": 'mdx', "year": 2007},
-    {"make": 'acura', "model": 'mdx', "year": 2006},
-    {"make": 'acura', "model": 'mdx', "year": 2005},
-    {"make": 'acura', "model": 'mdx 3.5l w/advance', "year": 2016},
-    {"make": 'acura', "model": 'mdx 3.7l advance package', "year": 2011},
-    {"make": 'acura', "model": 'mdx 4wd 4dr', "year": 2008},
-    {"make": 'acura', "model": 'mdx 9-spd at w/tech package', "year": 2018},
-    {"make": 'acura', "model": 'mdx advance and', "year": 2018},
-    {"make": 'acura', "model": 'mdx advance pkg sport', "year": 2020},
-    {"make": 'acura', "model": 'mdx advance pkg sport', "year": 2019},
-    {"make": 'acura', "model": 'mdx awd', "year": 2011},
-    {"make": 'acura', "model": 'mdx awd', "year": 2010},
-    {"make": 'acura', "model": 'mdx awd', "year": 2007},
-    {"make": 'acura', "model": 'mdx awd tech pkg', "year": 2010},
-    {"make": 'acura', "model": 'mdx sh-awd', "year": 2011},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2020},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2019},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2018},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2017},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2016},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2015},
-    {"make": 'acura', "model": 'mdx sh-awd sport utility', "year": 2014},
-    {"make": 'acura', "model": 'mdx sh-awd w/advance and', "year": 2018},
-    {"make": 'acura', "model": 'mdx sh-awd w/advance pkg', "year": 2020},
-    {"make": 'acura', "model": 'mdx sh-awd w/advance pkg', "year": 2018},
-    {"make": 'acura', "model": 'mdx sh-awd w/tech pckg nav', "year": 2009},
-    {"make": 'acura', "model": 'mdx sh-awd w/technology', "year": 2020},
-    {"make": 'acura', "model": 'mdx sh-awd w/technology', "year": 2019},
-    {"make": 'acura', "model": 'mdx sh-awd w/technology', "year": 2018},
-    {"make": 'acura', "model": 'mdx sport hybrid sh-awd', "year": 2019},
-    {"make": 'acura', "model": 'mdx sport hybrid sh-awd', "year": 2018},
-    {"make": 'acura', "model": 'mdx sport hybrid sh-awd', "year": 2017},
-    {"make": 'acura', "model": 'mdx sport utility 4d', "year": 2020},
-    {"make": 'acura', "model": 'mdx sport utility 4d', "year": 2018},
-    {"make": 'acura', "model": 'mdx sport utility 4d', "year": 2013},
-    {"make": 'acura', "model": 'mdx technology pkg sport', "year": 2020},
-    {"make": 'acura', "model": 'mdx technology pkg sport', "year": 2018},
-    {"make": 'acura', "model": 'rdx', "year": 2020},
-    {"make": 'acura', "model": 'rdx', "year": 2019},
-    {"make": 'acura', "model": 'rdx', "year": 2018},
-    {"make": 'acura', "model": 'rdx', "year": 2017},
-    {"make": 'acura', "model": 'rdx', "year": 2016},
-    {"make": 'acura', "model": 'rdx', "year": 2015},
-    {"make": 'acura', "model": 'rdx', "year": 2014},
-    {"make": 'acura', "model": 'rdx', "year": 2013},
-    {"make": 'acura', "model": 'rdx', "year": 2012},
-    {"make": 'acura', "model": 'rdx', "year": 2011},
-    {"make": 'acura', "model": 'rdx', "year": 2010},
-    {"make": 'acura', "model": 'rdx', "year": 2009},
-    {"make": 'acura', "model": 'rdx', "year": 2008},
-    {"make": 'acura', "model": 'rdx', "year": 2007},
-    {"make": 'acura', "model": 'rdx advance pkg sport', "year": 2020},
-    {"make": 'acura', "model": 'rdx advance pkg sport', "year": 2018},
-    {"make": 'acura', "model": 'rdx awd', "year": 2014},
-    {"make": 'acura', "model": 'rdx fwd w/advance pkg', "year": 2019},
-    {"make": 'acura', "model": 'rdx sh-awd', "year": 2008},
-    {"make": 'acura', "model": 'rdx sh-awd a-spec pkg', "year": 2020},
-    {"make": 'acura', "model": 'rdx sh-awd a-spec pkg', "year": 2019},
-    {"make": 'acura', "model": 'rdx sh-awd advance pkg', "year": 2019},
-    {"make": 'acura', "model": 'rdx sh-awd sport utility', "year": 2019},
-    {"make": 'acura', "model": 'rdx sh-awd sport utility', "year": 2012},
-    {"make": 'acura', "model": 'rdx sh-awd technology pkg', "year": 2020},
-    {"make": 'acura', "model": 'rdx sh-awd technology pkg', "year": 2019},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2020},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2019},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2018},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2017},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2016},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2015},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2014},
-    {"make": 'acura', "model": 'rdx sport utility 4d', "year": 2013},
-    {"make": 'acura', "model": 'rdx technology and', "year": 2018},
-    {"make": 'acura', "model": 'rdx technology pkg sport', "year": 2018},
-    {"make": 'acura', "model": 'rl', "year": 2008},
-    {"make": 'acura', "model": 'rl', "year": 2007},
-    {"make": 'acura', "model": 'rl', "year": 2006},
-    {"make": 'acura', "model": 'rl', "year": 2005},
-    {"make": 'acura', "model": 'rl sh-awd w/tech', "year": 2011},
-    {"make": 'acura', "model": 'rlx', "year": 2014},
-    {"make": 'acura', "model": 'rlx sedan 4d', "year": 2016},
-    {"make": 'acura', "model": 'rlx sedan 4d', "year": 2015},
-    {"make": 'acura', "model": 'rlx sedan 4d', "year": 2014},
-    {"make": 'acura', "model": 'rlx sport hybrid sh-awd', "year": 2018},
-    {"make": 'acura', "model": 'rsx', "year": 2006},
-    {"make": 'acura', "model": 'tl', "year": 2014},
-    {"make": 'acura', "model": 'tl', "year": 2013},
-    {"make": 'acura', "model": 'tl', "year": 2012},
-    {"make": 'acura', "model": 'tl', "year": 2011},
-    {"make": 'acura', "model": 'tl', "year": 2010},
-    {"make": 'acura', "model": 'tl', "year": 2009},
-    {"make": 'acura', "model": 'tl', "year": 2008},
-    {"make": 'acura', "model": 'tl', "year": 2007},
-    {"make": 'acura', "model": 'tl', "year": 2006},
-    {"make": 'acura', "model": 'tl', "year": 2005},
-    {"make": 'acura', "model": 'tl advance', "year": 2014},
-    {"make": 'acura', "model": 'tl sedan 4d', "year": 2013},
-    {"make": 'acura', "model": 'tl sedan 4d', "year": 2012},
-    {"make": 'acura', "model": 'tl sh-awd sedan 4d', "year": 2013},
-    {"make": 'acura', "model": 'tl sh-awd sedan 4d', "year": 2012},
-    {"make": 'acura', "model": 'tl special edition sedan', "year": 2013},
-    {"make": 'acura', "model": 'tl tech auto', "year": 2012},
-    {"make": 'acura', "model": 'tl type s', "year": 2008},
-    {"make": 'acura', "model": 'tlx', "year": 2020},
-    {"make": 'acura', "model": 'tlx', "year": 2019},
-    {"make": 'acura', "model": 'tlx', "year": 2018},
-    {"make": 'acura', "model": 'tlx', "year": 2017},
-    {"make": 'acura', "model": 'tlx', "year": 2016},
-    {"make": 'acura', "model": 'tlx', "year": 2015},
-    {"make": 'acura', "model": 'tlx 2.4 sedan 4d', "year": 2020},
-    {"make": 'acura', "model": 'tlx 2.4 sedan 4d', "year": 2019},
-    {"make": 'acura', "model": 'tlx 2.4 sedan 4d', "year": 2018},
-    {"make": 'acura', "model": 'tlx 2.4 sedan 4d', "year": 2016},
-    {"make": 'acura', "model": 'tlx 2.4 w/technology pkg', "year": 2020},
-    {"make": 'acura', "model": 'tlx 3.5 sedan 4d', "year": 2019},
-    {"make": 'acura', "model": 'tlx 3.5 sedan 4d', "year": 2018},
-    {"make": 'acura', "model": 'tlx 3.5 sedan 4d', "year": 2015},
-    {"make": 'acura', "model": 'tlx 3.5 w/advance pkg', "year": 2020},
-    {"make": 'acura', "model": 'tlx 3.5 w/technology pkg', "year": 2020},
-    {"make": 'acura', "model": 'tlx 3.5 w/technology pkg', "year": 2019},
-    {"make": 'acura', "model": 'tlx 3.5 w/technology pkg', "year": 2018},
-    {"make": 'acura', "model": 'tsx', "year": 2014},
-    {"make": 'acura', "model": 'tsx', "year": 2013},
-    {"make": 'acura', "model": 'tsx', "year": 2012},
-    {"make": 'acura', "model": 'tsx', "year": 2011},
-    {"make": 'acura', "model": 'tsx', "year": 2010},
-    {"make": 'acura', "model": 'tsx', "year": 2009},
-    {"make": 'acura', "model": 'tsx', "year": 2008},
-    {"make": 'acura', "model": 'tsx', "year": 2007},
-    {"make": 'acura', "model": 'tsx', "year": 2006},
-    {"make": 'acura', "model": 'tsx', "year": 2005},
-    {"make": 'acura', "model": 'tsx sedan 4d', "year": 2014},
-    {"make": 'acura', "model": 'tsx sedan 4d', "year": 2013},
-    {"make": 'acura', "model": 'tsx sedan 4d', "year": 2012},
-    {"make": 'acura', "model": 'tsx sedan 4d', "year": 2011},
-    {"make": 'acura', "model": 'tsx sedan 4d', "year": 2010},
-    {"make": 'acura', "model": 'tsx tech pkg', "year": 2010},
-    {"make": 'acura', "model": 'tsx wagon 4d', "year": 2012},
-    {"make": 'acura', "model": 'tsx wagon 4d', "year": 2011},
-    {"make": 'audi', "model": 'a3', "year": 2018},
-    {"make": 'audi', "model": 'a3', "year": 2017},
-    {"make": 'audi', "model": 'a3', "year": 2016},
-    {"make": 'audi', "model": 'a3', "year": 2015},
-    {"make": 'audi', "model": 'a3', "year": 2012},
-    {"make": 'audi', "model": 'a3', "year": 2011},
-    {"make": 'audi', "model": 'a3', "year": 2009},
-    {"make": 'audi', "model": 'a3', "year": 2008},
-    {"make": 'audi', "model": 'a3', "year": 2007},
-    {"make": 'audi', "model": 'a3', "year": 2006},
-    {"make": 'audi', "model": 'a3 2.0 tdi premium', "year": 2011},
-    {"make": 'audi', "model": 'a3 2.0t premium', "year": 2015},
-    {"make": 'audi', "model": 'a3 2.0t premium plus', "year": 2016},
-    {"make": 'audi', "model": 'a3 2.0t quattro', "year": 2015},
-    {"make": 'audi', "model": 'a3 e-tron', "year": 2016},
-    {"make": 'audi', "model": 'a3 premium plus sedan 4d', "year": 2020},
-    {"make": 'audi', "model": 'a3 premium plus sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a3 premium plus sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a3 premium sedan 4d', "year": 2020},
-    {"make": 'audi', "model": 'a3 premium sedan 4d', "year": 2019},
-    {"make": 'audi', "model": 'a3 premium sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a3 premium sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a3 prestige sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a3 sportback e-tron premium', "year": 2018},
-    {"make": 'audi', "model": 'a3 sportback e-tron premium', "year": 2016},
-    {"make": 'audi', "model": 'a3 tdi premium sedan 4d', "year": 2015},
-    {"make": 'audi', "model": 'a4', "year": 2018},
-    {"make": 'audi', "model": 'a4', "year": 2017},
-    {"make": 'audi', "model": 'a4', "year": 2016},
-    {"make": 'audi', "model": 'a4', "year": 2015},
-    {"make": 'audi', "model": 'a4', "year": 2014},
-    {"make": 'audi', "model": 'a4', "year": 2013},
-    {"make": 'audi', "model": 'a4', "year": 2012},
-    {"make": 'audi', "model": 'a4', "year": 2011},
-    {"make": 'audi', "model": 'a4', "year": 2010},
-    {"make": 'audi', "model": 'a4', "year": 2009},
-    {"make": 'audi', "model": 'a4', "year": 2008},
-    {"make": 'audi', "model": 'a4', "year": 2007},
-    {"make": 'audi', "model": 'a4', "year": 2006},
-    {"make": 'audi', "model": 'a4', "year": 2005},
-    {"make": 'audi', "model": 'a4 2.0t premium plus', "year": 2018},
-    {"make": 'audi', "model": 'a4 2.0t premium plus', "year": 2014},
-    {"make": 'audi', "model": 'a4 2.0t premium plus', "year": 2011},
-    {"make": 'audi', "model": 'a4 2.0t premiumsedan', "year": 2010},
-    {"make": 'audi', "model": 'a4 2.0t quattro', "year": 2017},
-    {"make": 'audi', "model": 'a4 2.0t quattro', "year": 2008},
-    {"make": 'audi', "model": 'a4 2.0t quattro', "year": 2006},
-    {"make": 'audi', "model": 'a4 2.0t quattro premium', "year": 2012},
-    {"make": 'audi', "model": 'a4 allroad', "year": 2015},
-    {"make": 'audi', "model": 'a4 allroad premium plus', "year": 2019},
-    {"make": 'audi', "model": 'a4 allroad premium plus', "year": 2018},
-    {"make": 'audi', "model": 'a4 allroad premium wagon 4d', "year": 2018},
-    {"make": 'audi', "model": 'a4 allroad premium wagon 4d', "year": 2017},
-    {"make": 'audi', "model": 'a4 allroad prestige wagon', "year": 2018},
-    {"make": 'audi', "model": 'a4 avant', "year": 2008},
-    {"make": 'audi', "model": 'a4 premium', "year": 2013},
-    {"make": 'audi', "model": 'a4 premium plus sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a4 premium plus sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a4 premium plus sedan 4d', "year": 2015},
-    {"make": 'audi', "model": 'a4 premium sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a4 premium sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a4 quattro', "year": 2011},
-    {"make": 'audi', "model": 'a4 quattro', "year": 2008},
-    {"make": 'audi', "model": 'a4 quattro', "year": 2007},
-    {"make": 'audi', "model": 'a4 quattro', "year": 2006},
-    {"make": 'audi', "model": 'a4 ultra premium sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a4 ultra premium sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a5', "year": 2018},
-    {"make": 'audi', "model": 'a5', "year": 2015},
-    {"make": 'audi', "model": 'a5', "year": 2014},
-    {"make": 'audi', "model": 'a5', "year": 2013},
-    {"make": 'audi', "model": 'a5', "year": 2012},
-    {"make": 'audi', "model": 'a5', "year": 2011},
-    {"make": 'audi', "model": 'a5', "year": 2010},
-    {"make": 'audi', "model": 'a5', "year": 2009},
-    {"make": 'audi', "model": 'a5 2.0t premium plus quattr', "year": 2015},
-    {"make": 'audi', "model": 'a5 2.0t quattro premium', "year": 2012},
-    {"make": 'audi', "model": 'a5 manual', "year": 2008},
-    {"make": 'audi', "model": 'a5 premium coupe 2d', "year": 2018},
-    {"make": 'audi', "model": 'a5 premium plus coupe 2d', "year": 2018},
-    {"make": 'audi', "model": 'a5 premium plus sedan 4d', "year": 2019},
-    {"make": 'audi', "model": 'a5 premium plus sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a5 premium sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a5 prestige coupe 2d', "year": 2018},
-    {"make": 'audi', "model": 'a5 sportback', "year": 2018},
-    {"make": 'audi', "model": 'a6', "year": 2019},
-    {"make": 'audi', "model": 'a6', "year": 2018},
-    {"make": 'audi', "model": 'a6', "year": 2017},
-    {"make": 'audi', "model": 'a6', "year": 2016},
-    {"make": 'audi', "model": 'a6', "year": 2015},
-    {"make": 'audi', "model": 'a6', "year": 2014},
-    {"make": 'audi', "model": 'a6', "year": 2013},
-    {"make": 'audi', "model": 'a6', "year": 2012},
-    {"make": 'audi', "model": 'a6', "year": 2011},
-    {"make": 'audi', "model": 'a6', "year": 2010},
-    {"make": 'audi', "model": 'a6', "year": 2009},
-    {"make": 'audi', "model": 'a6', "year": 2008},
-    {"make": 'audi', "model": 'a6', "year": 2007},
-    {"make": 'audi', "model": 'a6', "year": 2006},
-    {"make": 'audi', "model": 'a6', "year": 2005},
-    {"make": 'audi', "model": 'a6 2.0t premium plus sedan', "year": 2018},
-    {"make": 'audi', "model": 'a6 2.0t premium plus sedan', "year": 2017},
-    {"make": 'audi', "model": 'a6 2.0t premium plus sedan', "year": 2016},
-    {"make": 'audi', "model": 'a6 2.0t premium sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a6 2.0t premium sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a6 2.0t premium sedan 4d', "year": 2016},
-    {"make": 'audi', "model": 'a6 2.0t premium sedan 4d', "year": 2014},
-    {"make": 'audi', "model": 'a6 3.0t premium plus sedan', "year": 2018},
-    {"make": 'audi', "model": 'a6 3.0t premium plus sedan', "year": 2017},
-    {"make": 'audi', "model": 'a6 3.0t premium plus sedan', "year": 2016},
-    {"make": 'audi', "model": 'a6 3.0t prestige sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a6 3.0t prestige sedan 4d', "year": 2016},
-    {"make": 'audi', "model": 'a6 3.0t prestige sedan 4d', "year": 2013},
-    {"make": 'audi', "model": 'a6 3.0t quattro', "year": 2013},
-    {"make": 'audi', "model": 'a6 3.0t quattro', "year": 2012},
-    {"make": 'audi', "model": 'a6 3.0t quattro sedan 4d', "year": 2010},
-    {"make": 'audi', "model": 'a6 3.2 quattro', "year": 2006},
-    {"make": 'audi', "model": 'a6 45 tfsi premium plus', "year": 2020},
-    {"make": 'audi', "model": 'a6 45 tfsi premium sedan 4d', "year": 2020},
-    {"make": 'audi', "model": 'a6 45 tfsi premium sedan 4d', "year": 2019},
-    {"make": 'audi', "model": 'a6 competition sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a7', "year": 2017},
-    {"make": 'audi', "model": 'a7', "year": 2016},
-    {"make": 'audi', "model": 'a7', "year": 2015},
-    {"make": 'audi', "model": 'a7', "year": 2014},
-    {"make": 'audi', "model": 'a7', "year": 2013},
-    {"make": 'audi', "model": 'a7', "year": 2012},
-    {"make": 'audi', "model": 'a7 3.0t prestige quattro', "year": 2012},
-    {"make": 'audi', "model": 'a7 3.0t quattro', "year": 2012},
-    {"make": 'audi', "model": 'a7 3.0t quattro prestige', "year": 2012},
-    {"make": 'audi', "model": 'a7 premium plus sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 'a7 premium plus sedan 4d', "year": 2016},
-    {"make": 'audi', "model": 'a7 prestige sedan 4d', "year": 2016},
-    {"make": 'audi', "model": 'a8', "year": 2015},
-    {"make": 'audi', "model": 'a8', "year": 2013},
-    {"make": 'audi', "model": 'a8', "year": 2012},
-    {"make": 'audi', "model": 'a8', "year": 2011},
-    {"make": 'audi', "model": 'a8', "year": 2009},
-    {"make": 'audi', "model": 'a8', "year": 2008},
-    {"make": 'audi', "model": 'a8 3.0t sedan 4d', "year": 2014},
-    {"make": 'audi', "model": 'a8 4.0t quattro dealer serviced since new with all records*97k msrp* sport-conv-comfort-cold weather-camera assistance-led headlights and much more*no accidents*non smoker previous owner', "year": 2013},
-    {"make": 'audi', "model": 'a8 l 4.0t sport sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 'a8 l 4.2 quattro sedan 4d', "year": 2011},
-    {"make": 'audi', "model": 'a8 l quattro awd', "year": 2012},
-    {"make": 'audi', "model": 'a8 l tdi sedan 4d', "year": 2014},
-    {"make": 'audi', "model": 'allroad', "year": 2015},
-    {"make": 'audi', "model": 'allroad', "year": 2014},
-    {"make": 'audi', "model": 'allroad', "year": 2013},
-    {"make": 'audi', "model": 'allroad premium plus wagon', "year": 2015},
-    {"make": 'audi', "model": 'allroad premium plus wagon', "year": 2014},
-    {"make": 'audi', "model": 'allroad premium plus wagon', "year": 2013},
-    {"make": 'audi', "model": 'allroad prestige wagon 4d', "year": 2013},
-    {"make": 'audi', "model": 'q3', "year": 2018},
-    {"make": 'audi', "model": 'q3', "year": 2017},
-    {"make": 'audi', "model": 'q3', "year": 2016},
-    {"make": 'audi', "model": 'q3', "year": 2015},
-    {"make": 'audi', "model": 'q3 premium', "year": 2018},
-    {"make": 'audi', "model": 'q3 premium sport utility 4d', "year": 2018},
-    {"make": 'audi', "model": 'q3 sport premium plus', "year": 2018},
-    {"make": 'audi', "model": 'q3 sport premium utility 4d', "year": 2018},
-    {"make": 'audi', "model": 'q5', "year": 2020},
-    {"make": 'audi', "model": 'q5', "year": 2019},
-    {"make": 'audi', "model": 'q5', "year": 2018},
-    {"make": 'audi', "model": 'q5', "year": 2017},
-    {"make": 'audi', "model": 'q5', "year": 2016},
-    {"make": 'audi', "model": 'q5', "year": 2015},
-    {"make": 'audi', "model": 'q5', "year": 2014},
-    {"make": 'audi', "model": 'q5', "year": 2013},
-    {"make": 'audi', "model": 'q5', "year": 2012},
-    {"make": 'audi', "model": 'q5', "year": 2011},
-    {"make": 'audi', "model": 'q5', "year": 2010},
-    {"make": 'audi', "model": 'q5', "year": 2009},
-    {"make": 'audi', "model": 'q5 2.0 tfsi premium plus', "year": 2018},
-    {"make": 'audi', "model": 'q5 2.0t quattro premium', "year": 2011},
-    {"make": 'audi', "model": 'q5 2.0t quattro premium plus', "year": 2013},
-    {"make": 'audi', "model": 'q5 3.0t premium plus sport', "year": 2017},
-    {"make": 'audi', "model": 'q5 3.0t quattro technik', "year": 2014},
-    {"make": 'audi', "model": 'q5 3.2 quattro premium', "year": 2010},
-    {"make": 'audi', "model": 'q5 45 tfsi premium plus', "year": 2020},
-    {"make": 'audi', "model": 'q5 45 tfsi prestige sport', "year": 2020},
-    {"make": 'audi', "model": 'q5 bad credit', "year": 2017},
-    {"make": 'audi', "model": 'q5 premium awd gas suv auto', "year": 2019},
-    {"make": 'audi', "model": 'q5 premium plus', "year": 2018},
-    {"make": 'audi', "model": 'q5 premium plus', "year": 2014},
-    {"make": 'audi', "model": 'q5 premium plus', "year": 2012},
-    {"make": 'audi', "model": 'q5 premium plus', "year": 2011},
-    {"make": 'audi', "model": 'q5 premium plus', "year": 2010},
-    {"make": 'audi', "model": 'q5 premium plus awd', "year": 2017},
-    {"make": 'audi', "model": 'q5 premium plus sport', "year": 2018},
-    {"make": 'audi', "model": 'q5 premium sport utility 4d', "year": 2019},
-    {"make": 'audi', "model": 'q5 premium sport utility 4d', "year": 2018},
-    {"make": 'audi', "model": 'q5 prestige sport utility', "year": 2018},
-    {"make": 'audi', "model": 'q5 quattro premium plus', "year": 2014},
-    {"make": 'audi', "model": 'q5 quattro premium plus', "year": 2012},
-    {"make": 'audi', "model": 'q5 tdi premium plus sport', "year": 2015},
-    {"make": 'audi', "model": 'q7', "year": 2019},
-    {"make": 'audi', "model": 'q7', "year": 2018},
-    {"make": 'audi', "model": 'q7', "year": 2017},
-    {"make": 'audi', "model": 'q7', "year": 2015},
-    {"make": 'audi', "model": 'q7', "year": 2014},
-    {"make": 'audi', "model": 'q7', "year": 2013},
-    {"make": 'audi', "model": 'q7', "year": 2012},
-    {"make": 'audi', "model": 'q7', "year": 2011},
-    {"make": 'audi', "model": 'q7', "year": 2010},
-    {"make": 'audi', "model": 'q7', "year": 2008},
-    {"make": 'audi', "model": 'q7', "year": 2007},
-    {"make": 'audi', "model": 'q7 3.0t premium plus sport', "year": 2018},
-    {"make": 'audi', "model": 'q7 3.0t premium plus sport', "year": 2017},
-    {"make": 'audi', "model": 'q7 3.0t premium sport', "year": 2018},
-    {"make": 'audi', "model": 'q7 3.0t premuim plus', "year": 2014},
-    {"make": 'audi', "model": 'q7 3.0t prestige sport', "year": 2018},
-    {"make": 'audi', "model": 'q7 3.0t s line prestige', "year": 2014},
-    {"make": 'audi', "model": 'q7 premium plus', "year": 2018},
-    {"make": 'audi', "model": 'q7 premium plus quattro awd', "year": 2015},
-    {"make": 'audi', "model": 'q7 tdi prestige', "year": 2009},
-    {"make": 'audi', "model": 'q7 tdi prestige sport', "year": 2014},
-    {"make": 'audi', "model": 'q8', "year": 2019},
-    {"make": 'audi', "model": 'q8 premium sport utility 4d', "year": 2019},
-    {"make": 'audi', "model": 'rs5', "year": 2013},
-    {"make": 'audi', "model": 's3', "year": 2017},
-    {"make": 'audi', "model": 's3 premium plus sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 's4', "year": 2019},
-    {"make": 'audi', "model": 's4', "year": 2018},
-    {"make": 'audi', "model": 's4', "year": 2014},
-    {"make": 'audi', "model": 's4', "year": 2013},
-    {"make": 'audi', "model": 's4', "year": 2012},
-    {"make": 'audi', "model": 's4', "year": 2007},
-    {"make": 'audi', "model": 's4', "year": 2006},
-    {"make": 'audi', "model": 's4 3.0t premium plus', "year": 2013},
-    {"make": 'audi', "model": 's4 premium plus sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 's4 prestige sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 's4 quattro', "year": 2014},
-    {"make": 'audi', "model": 's4 quattro', "year": 2008},
-    {"make": 'audi', "model": 's5', "year": 2018},
-    {"make": 'audi', "model": 's5', "year": 2015},
-    {"make": 'audi', "model": 's5', "year": 2014},
-    {"make": 'audi', "model": 's5', "year": 2013},
-    {"make": 'audi', "model": 's5', "year": 2011},
-    {"make": 'audi', "model": 's5', "year": 2010},
-    {"make": 'audi', "model": 's5', "year": 2009},
-    {"make": 'audi', "model": 's5 premium plus convertible', "year": 2016},
-    {"make": 'audi', "model": 's5 premium plus coupe 2d', "year": 2018},
-    {"make": 'audi', "model": 's5 premium plus coupe 2d', "year": 2015},
-    {"make": 'audi', "model": 's5 premium plus coupe 2d', "year": 2014},
-    {"make": 'audi', "model": 's5 premium plus sedan 4d', "year": 2019},
-    {"make": 'audi', "model": 's5 premium plus sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 's5 prestige convertible 2d', "year": 2014},
-    {"make": 'audi', "model": 's5 prestige coupe 2d', "year": 2019},
-    {"make": 'audi', "model": 's5 prestige coupe 2d', "year": 2018},
-    {"make": 'audi', "model": 's5 prestige sedan 4d', "year": 2018},
-    {"make": 'audi', "model": 's5 quattro coupe 2d', "year": 2010},
-    {"make": 'audi', "model": 's6', "year": 2013},
-    {"make": 'audi', "model": 's6 prestige quattro awd', "year": 2013},
-    {"make": 'audi', "model": 's7 prestige sedan 4d', "year": 2017},
-    {"make": 'audi', "model": 's7 prestige sedan 4d', "year": 2013},
-    {"make": 'audi', "model": 's7 sedan 4d', "year": 2016},
-    {"make": 'audi', "model": 's8', "year": 2007},
-    {"make": 'audi', "model": 'sq5', "year": 2018},
-    {"make": 'audi', "model": 'sq5', "year": 2016},
-    {"make": 'audi', "model": 'sq5', "year": 2014},
-    {"make": 'audi', "model": 'sq5 premium plus sport', "year": 2018},
-    {"make": 'audi', "model": 'tt', "year": 2016},
-    {"make": 'audi', "model": 'tt', "year": 2009},
-    {"make": 'audi', "model": 'tt', "year": 2008},
-    {"make": 'audi', "model": 'tt', "year": 2005},
-    {"make": 'audi', "model": 'tt 2.0t', "year": 2008},
-    {"make": 'audi', "model": 'tt coupe 2d', "year": 2018},
-    {"make": 'audi', "model": 'tt roadster', "year": 2018},
-    {"make": 'audi', "model": 'tt rs quattro coupe 2d', "year": 2013},
-    {"make": 'bmw', "model": '1 series 128i convertible 2d', "year": 2013},
-    {"make": 'bmw', "model": '1 series 128i convertible 2d', "year": 2012},
-    {"make": 'bmw', "model": '1 series 128i convertible 2d', "year": 2010},
-    {"make": 'bmw', "model": '1 series 128i coupe 2d', "year": 2012},
-    {"make": 'bmw', "model": '1 series 135i convertible 2d', "year": 2013},
-    {"make": 'bmw', "model": '1 series 135i coupe 2d', "year": 2013},
-    {"make": 'bmw', "model": '128i', "year": 2013},
-    {"make": 'bmw', "model": '128i', "year": 2012},
-    {"make": 'bmw', "model": '128i convertible', "year": 2012},
-    {"make": 'bmw', "model": '128i convertible', "year": 2011},
-    {"make": 'bmw', "model": '135i', "year": 2011},
-    {"make": 'bmw', "model": '135i', "year": 2009},
-    {"make": 'bmw', "model": '2 series', "year": 2019},
-    {"make": 'bmw', "model": '2 series', "year": 2016},
-    {"make": 'bmw', "model": '2 series 228i convertible 2d', "year": 2016},
-    {"make": 'bmw', "model": '2 series 228i coupe 2d', "year": 2016},
-    {"make": 'bmw', "model": '2 series 228i coupe 2d', "year": 2014},
-    {"make": 'bmw', "model": '2 series 228i xdrive gran', "year": 2020},
-    {"make": 'bmw', "model": '2 series 230i coupe 2d', "year": 2017},
-    {"make": 'bmw', "model": '2 series 230i xdrive coupe', "year": 2019},
-    {"make": 'bmw', "model": '2 series 230i xdrive coupe', "year": 2017},
-    {"make": 'bmw', "model": '2 series m235i xdrive', "year": 2016},
-    {"make": 'bmw', "model": '2 series m240i coupe 2d', "year": 2019},
-    {"make": 'bmw', "model": '2 series m240i coupe 2d', "year": 2017},
-    {"make": 'bmw', "model": '230i', "year": 2020},
-    {"make": 'bmw', "model": '3 series', "year": 2020},
-    {"make": 'bmw', "model": '3 series', "year": 2018},
-    {"make": 'bmw', "model": '3 series', "year": 2017},
-    {"make": 'bmw', "model": '3 series', "year": 2016},
-    {"make": 'bmw', "model": '3 series', "year": 2015},
-    {"make": 'bmw', "model": '3 series', "year": 2014},
-    {"make": 'bmw', "model": '3 series', "year": 2013},
-    {"make": 'bmw', "model": '3 series', "year": 2012},
-    {"make": 'bmw', "model": '3 series', "year": 2011},
-    {"make": 'bmw', "model": '3 series', "year": 2010},
-    {"make": 'bmw', "model": '3 series', "year": 2009},
-    {"make": 'bmw', "model": '3 series', "year": 2008},
-    {"make": 'bmw', "model": '3 series', "year": 2007},
-    {"make": 'bmw', "model": '3 series', "year": 2006},
-    {"make": 'bmw', "model": '3 series', "year": 2005},
-    {"make": 'bmw', "model": '3 series 320i', "year": 2014},
-    {"make": 'bmw', "model": '3 series 320i xdrive', "year": 2015},
-    {"make": 'bmw', "model": '3 series 320i xdrive', "year": 2014},
-    {"make": 'bmw', "model": '3 series 328d sedan 4d', "year": 2018},
-    {"make": 'bmw', "model": '3 series 328d xdrive sport', "year": 2018},
-    {"make": 'bmw', "model": '3 series 328d xdrive sport', "year": 2015},
-    {"make": 'bmw', "model": '3 series 328i', "year": 2014},
-    {"make": 'bmw', "model": '3 series 328i', "year": 2013},
-    {"make": 'bmw', "model": '3 series 328i', "year": 2012},
-    {"make": 'bmw', "model": '3 series 328i', "year": 2011},
-    {"make": 'bmw', "model": '3 series 328i', "year": 2008},
-    {"make": 'bmw', "model": '3 series 328i convertible 2d', "year": 2011},
-    {"make": 'bmw', "model": '3 series 328i convertible 2d', "year": 2010},
-    {"make": 'bmw', "model": '3 series 328i gran turismo', "year": 2014},
-    {"make": 'bmw', "model": '3 series 328i xdrive', "year": 2014},
-    {"make": 'bmw', "model": '3 series 328i xdrive', "year": 2013},
-    {"make": 'bmw', "model": '3 series 328i xdrive', "year": 2012},
-    {"make": 'bmw', "model": '3 series 328i xdrive', "year": 2011},
-    {"make": 'bmw', "model": '3 series 328xi', "year": 2008},
-    {"make": 'bmw', "model": '3 series 330e iperformance', "year": 2018},
-    {"make": 'bmw', "model": '3 series 330i gran turismo', "year": 2018},
-    {"make": 'bmw', "model": '3 series 330i sedan 4d', "year": 2020},
-    {"make": 'bmw', "model": '3 series 330i xdrive', "year": 2019},
-    {"make": 'bmw', "model": '3 series 330i xdrive', "year": 2017},
-    {"make": 'bmw', "model": '3 series 330i xdrive sedan', "year": 2020},
-    {"make": 'bmw', "model": '3 series 330i xdrive sedan', "year": 2019},
-    {"make": 'bmw', "model": '3 series 330i xdrive sedan', "year": 2018},
-    {"make": 'bmw', "model": '3 series 330i xdrive sedan', "year": 2017},
-    {"make": 'bmw', "model": '3 series 330i xdrive sport', "year": 2017},
-    {"make": 'bmw', "model": '3 series 335d sedan 4d', "year": 2011},
-    {"make": 'bmw', "model": '3 series 335i', "year": 2008},
-    {"make": 'bmw', "model": '3 series 335i convertible 2d', "year": 2013},
-    {"make": 'bmw', "model": '3 series 335i sedan 4d', "year": 2015},
-    {"make": 'bmw', "model": '3 series 335i sedan 4d', "year": 2013},
-    {"make": 'bmw', "model": '3 series 335i xdrive sedan', "year": 2013},
-    {"make": 'bmw', "model": '3 series 340i gran turismo', "year": 2018},
-    {"make": 'bmw', "model": '3 series 340i sedan 4d', "year": 2017},
-    {"make": 'bmw', "model": '3 series 340i sedan 4d', "year": 2016},
-    {"make": 'bmw', "model": '3 series 340i xdrive sedan', "year": 2018},
-    {"make": 'bmw', "model": '3 series 340i xdrive sedan', "year": 2017},
-    {"make": 'bmw', "model": '3 series m340i sedan 4d', "year": 2020},
-    {"make": 'bmw', "model": '3-series', "year": 2017},
-    {"make": 'bmw', "model": '3-series', "year": 2015},
-    {"make": 'bmw', "model": '3-series', "year": 2014},
-    {"make": 'bmw', "model": '3-series', "year": 2013},
-    {"make": 'bmw', "model": '3-series', "year": 2011},
-    {"make": 'bmw', "model": '3-series', "year": 2010},
-    {"make": 'bmw', "model": '3-series', "year": 2008},
-    {"make": 'bmw', "model": '3-series', "year": 2007},
-    {"make": 'bmw', "model": '320i', "year": 2018},
-    {"make": 'bmw', "model": '320i', "year": 2017},
-    {"make": 'bmw', "model": '320i', "year": 2016},
-    {"make": 'bmw', "model": '320i', "year": 2015},
-    {"make": 'bmw', "model": '320i', "year": 2014},
-    {"make": 'bmw', "model": '320i xdrive', "year": 2018},
-    {"make": 'bmw', "model": '320i xdrive', "year": 2017},
-    {"make": 'bmw', "model": '320i xdrive', "year": 2015},
-    {"make": 'bmw', "model": '320i xdrive', "year": 2014},
-    {"make": 'bmw', "model": '325ci', "year": 2006},
-    {"make": 'bmw', "model": '325cic', "year": 2006},
-    {"make": 'bmw', "model": '325i', "year": 2006},
-    {"make": 'bmw', "model": '325i', "year": 2005},
-    {"make": 'bmw', "model": '325xi', "year": 2006},
-    {"make": 'bmw', "model": '325xi', "year": 2005},
-    {"make": 'bmw', "model": '328', "year": 2014},
-    {"make": 'bmw', "model": '328', "year": 2011},
-    {"make": 'bmw', "model": '328 i sulev', "year": 2007},
-    {"make": 'bmw', "model": '328d', "year": 2014},
-    {"make": 'bmw', "model": '328d xdrive awd tdi', "year": 2014},
-    {"make": 'bmw', "model": '328i', "year": 2016},
-    {"make": 'bmw', "model": '328i', "year": 2015},
-    {"make": 'bmw', "model": '328i', "year": 2014},
-    {"make": 'bmw', "model": '328i', "year": 2013},
-    {"make": 'bmw', "model": '328i', "year": 2012},
-    {"make": 'bmw', "model": '328i', "year": 2011},
-    {"make": 'bmw', "model": '328i', "year": 2010},
-    {"make": 'bmw', "model": '328i', "year": 2009},
-    {"make": 'bmw', "model": '328i', "year": 2008},
-    {"make": 'bmw', "model": '328i', "year": 2007},
-    {"make": 'bmw', "model": '328i hard top convertible', "year": 2013},
-    {"make": 'bmw', "model": '328i sport', "year": 2011},
-    {"make": 'bmw', "model": '328i sport 6 speed manual', "year": 2013},
-    {"make": 'bmw', "model": '328i xdrive', "year": 2015},
-    {"make": 'bmw', "model": '328i xdrive', "year": 2014},
-    {"make": 'bmw', "model": '328i xdrive', "year": 2013},
-    {"make": 'bmw', "model": '328i xdrive', "year": 2011},
-    {"make": 'bmw', "model": '328i xdrive', "year": 2010},
-    {"make": 'bmw', "model": '328xi', "year": 2016},
-    {"make": 'bmw', "model": '328xi', "year": 2013},
-    {"make": 'bmw', "model": '328xi', "year": 2011},
-    {"make": 'bmw', "model": '328xi', "year": 2010},
-    {"make": 'bmw', "model": '328xi', "year": 2009},
-    {"make": 'bmw', "model": '328xi', "year": 2008},
-    {"make": 'bmw', "model": '328xi', "year": 2007},
-    {"make": 'bmw', "model": '328xi xdrive awd', "year": 2011},
-    {"make": 'bmw', "model": '328xi xdrive coupe', "year": 2010},
-    {"make": 'bmw', "model": '330e', "year": 2018},
-    {"make": 'bmw', "model": '330i', "year": 2020},
-    {"make": 'bmw', "model": '330i', "year": 2018},
-    {"make": 'bmw', "model": '330i', "year": 2017},
-    {"make": 'bmw', "model": '330i', "year": 2006},
-    {"make": 'bmw', "model": '330xi', "year": 2006},
-    {"make": 'bmw', "model": '330xi xdrive awd sport sedan', "year": 2018},
-    {"make": 'bmw', "model": '330xi xdrive awd sport sedan', "year": 2006},
-    {"make": 'bmw', "model": '335i', "year": 2015},
-    {"make": 'bmw', "model": '335i', "year": 2014},
-    {"make": 'bmw', "model": '335i', "year": 2013},
-    {"make": 'bmw', "model": '335i', "year": 2012},
-    {"make": 'bmw', "model": '335i', "year": 2011},
-    {"make": 'bmw', "model": '335i', "year": 2010},
-    {"make": 'bmw', "model": '335i', "year": 2009},
-    {"make": 'bmw', "model": '335i', "year": 2008},
-    {"make": 'bmw', "model": '335i', "year": 2007},
-    {"make": 'bmw', "model": '335xi', "year": 2008},
-    {"make": 'bmw', "model": '335xi', "year": 2007},
-    {"make": 'bmw', "model": '4 series', "year": 2018},
-    {"make": 'bmw', "model": '4 series', "year": 2017},
-    {"make": 'bmw', "model": '4 series', "year": 2016},
-    {"make": 'bmw', "model": '4 series', "year": 2015},
-    {"make": 'bmw', "model": '4 series', "year": 2014},
-    {"make": 'bmw', "model": '4 series 428i convertible 2d', "year": 2015},
-    {"make": 'bmw', "model": '4 series 428i coupe 2d', "year": 2014},
-    {"make": 'bmw', "model": '4 series 428i gran coupe', "year": 2015},
-    {"make": 'bmw', "model": '4 series 428i xdrive', "year": 2016},
-    {"make": 'bmw', "model": '4 series 428i xdrive', "year": 2015},
-    {"make": 'bmw', "model": '4 series 428i xdrive coupe', "year": 2014},
-    {"make": 'bmw', "model": '4 series 430i convertible 2d', "year": 2018},
-    {"make": 'bmw', "model": '4 series 430i gran coupe', "year": 2019},
-    {"make": 'bmw', "model": '4 series 430i gran coupe', "year": 2018},
-    {"make": 'bmw', "model": '4 series 430i xdrive', "year": 2018},
-    {"make": 'bmw', "model": '4 series 430i xdrive coupe', "year": 2018},
-    {"make": 'bmw', "model": '4 series 430i xdrive gran', "year": 2018},
-    {"make": 'bmw', "model": '4 series 435i gran coupe', "year": 2015},
-    {"make": 'bmw', "model": '4 series 435i xdrive coupe', "year": 2016},
-    {"make": 'bmw', "model": '4 series 435i xdrive gran', "year": 2016},
-    {"make": 'bmw', "model": '4 series 440i convertible 2d', "year": 2018},
-    {"make": 'bmw', "model": '4 series 440i coupe 2d', "year": 2019},
-    {"make": 'bmw', "model": '4 series 440i coupe 2d', "year": 2018},
-    {"make": 'bmw', "model": '4 series 440i gran coupe', "year": 2018},
-    {"make": 'bmw', "model": '4 series 440i gran coupe 4d', "year": 2017},
-    {"make": 'bmw', "model": '4 series 440i xdrive coupe', "year": 2019},
-    {"make": 'bmw', "model": '4 series 440i xdrive gran', "year": 2019},
-    {"make": 'bmw', "model": '4 series 440i xdrive gran', "year": 2018},
-    {"make": 'bmw', "model": '4 series 440i xdrive gran', "year": 2017},
-    {"make": 'bmw', "model": '428i', "year": 2016},
-    {"make": 'bmw', "model": '428i', "year": 2015},
-    {"make": 'bmw', "model": '428i', "year": 2014},
-    {"make": 'bmw', "model": '428i gran coupe', "year": 2015},
-    {"make": 'bmw', "model": '430i', "year": 2018},
-    {"make": 'bmw', "model": '430i', "year": 2017},
-    {"make": 'bmw', "model": '430i m pkg', "year": 2018},
-    {"make": 'bmw', "model": '435', "year": 2014},
-    {"make": 'bmw', "model": '435i', "year": 2015},
-    {"make": 'bmw', "model": '435i', "year": 2014},
-    {"make": 'bmw', "model": '440xi xdrive gran coupe', "year": 2017},
-    {"make": 'bmw', "model": '5 series', "year": 2019},
-    {"make": 'bmw', "model": '5 series', "year": 2018},
-    {"make": 'bmw', "model": '5 series', "year": 2017},
-    {"make": 'bmw', "model": '5 series', "year": 2016},
-    {"make": 'bmw', "model": '5 series', "year": 2015},
-    {"make": 'bmw', "model": '5 series', "year": 2014},
-    {"make": 'bmw', "model": '5 series', "year": 2013},
-    {"make": 'bmw', "model": '5 series', "year": 2012},
-    {"make": 'bmw', "model": '5 series', "year": 2011},
-    {"make": 'bmw', "model": '5 series', "year": 2010},
-    {"make": 'bmw', "model": '5 series', "year": 2008},
-    {"make": 'bmw', "model": '5 series', "year": 2007},
-    {"make": 'bmw', "model": '5 series 528i', "year": 2013},
-    {"make": 'bmw', "model": '5 series 528i sedan 4d', "year": 2015},
-    {"make": 'bmw', "model": '5 series 528i sedan 4d', "year": 2014},
-    {"make": 'bmw', "model": '5 series 528i xdrive', "year": 2012},
-    {"make": 'bmw', "model": '5 series 528i xdrive', "year": 2010},
-    {"make": 'bmw', "model": '5 series 530e xdrive', "year": 2019},
-    {"make": 'bmw', "model": '5 series 530e xdrive sedan', "year": 2020},
-    {"make": 'bmw', "model": '5 series 530i sedan 4d', "year": 2020},
-    {"make": 'bmw', "model": '5 series 530i xdrive sedan', "year": 2020},
-    {"make": 'bmw', "model": '5 series 530i xdrive sedan', "year": 2019},
-    {"make": 'bmw', "model": '5 series 530i xdrive sedan', "year": 2018},
-    {"make": 'bmw', "model": '5 series 535d xdrive sedan', "year": 2015},
-    {"make": 'bmw', "model": '5 series 535d xdrive sedan', "year": 2014},
-    {"make": 'bmw', "model": '5 series 535i', "year": 2011},
-    {"make": 'bmw', "model": '5 series 535i gran turismo', "year": 2017},
-    {"make": 'bmw', "model": '5 series 535i gran turismo', "year": 2016},
-    {"make": 'bmw', "model": '5 series 535i m sport', "year": 2013},
-    {"make": 'bmw', "model": '5 series 535i sedan 4d', "year": 2016},
-    {"make": 'bmw', "model": '5 series 535i sedan 4d', "year": 2015},
-    {"make": 'bmw', "model": '5 series 535i sedan 4d', "year": 2013},
-    {"make": 'bmw', "model": '5 series 535i xdrive sedan', "year": 2012},
-    {"make": 'bmw', "model": '5 series 540i xdrive sedan', "year": 2019},
-    {"make": 'bmw', "model": '5 series 540i xdrive sedan', "year": 2018},
-    {"make": 'bmw', "model": '5 series 540i xdrive sedan', "year": 2017},
-    {"make": 'bmw', "model": '5 series 550i sedan 4d', "year": 2016},
-    {"make": 'bmw', "model": '5 series 550i sedan 4d', "year": 2014},
-    {"make": 'bmw', "model": '5 series gran turismo', "year": 2016},
-    {"make": 'bmw', "model": '5 series iperformance', "year": 2019},
-    {"make": 'bmw', "model": '5-series', "year": 2018},
-    {"make": 'bmw', "model": '5-series', "year": 2017},
-    {"make": 'bmw', "model": '5-series', "year": 2014},
-    {"make": 'bmw', "model": '5-series', "year": 2013},
-    {"make": 'bmw', "model": '5-series', "year": 2011},
-    {"make": 'bmw', "model": '5-series', "year": 2008},
-    {"make": 'bmw', "model": '5-series', "year": 2007},
-    {"make": 'bmw', "model": '525i', "year": 2007},
-    {"make": 'bmw', "model": '525i', "year": 2006},
-    {"make": 'bmw', "model": '528i', "year": 2016},
-    {"make": 'bmw', "model": '528i', "year": 2015},
-    {"make": 'bmw', "model": '528i', "year": 2014},
-    {"make": 'bmw', "model": '528i', "year": 2013},
-    {"make": 'bmw', "model": '528i', "year": 2012},
-    {"make": 'bmw', "model": '528i', "year": 2011},
-    {"make": 'bmw', "model": '528i', "year": 2010},
-    {"make": 'bmw', "model": '528i', "year": 2009},
-    {"make": 'bmw', "model": '528i', "year": 2008},
-    {"make": 'bmw', "model": '528i 5-series', "year": 2013},
-    {"make": 'bmw', "model": '528i xdrive', "year": 2013},
-    {"make": 'bmw', "model": '528xi', "year": 2013},
-    {"make": 'bmw', "model": '528xi', "year": 2012},
-    {"make": 'bmw', "model": '528xi', "year": 2008},
-    {"make": 'bmw', "model": '528xi xdrive awd', "year": 2013},
-    {"make": 'bmw', "model": '530e', "year": 2018},
-    {"make": 'bmw', "model": '530i', "year": 2018},
-    {"make": 'bmw', "model": '530i', "year": 2007},
-    {"make": 'bmw', "model": '530i', "year": 2006},
-    {"make": 'bmw', "model": '530xi', "year": 2007},
-    {"make": 'bmw', "model": '530xi', "year": 2006},
-    {"make": 'bmw', "model": '535 i m-sport', "year": 2016},
-    {"make": 'bmw', "model": '535i', "year": 2017},
-    {"make": 'bmw', "model": '535i', "year": 2015},
-    {"make": 'bmw', "model": '535i', "year": 2014},
-    {"make": 'bmw', "model": '535i', "year": 2013},
-    {"make": 'bmw', "model": '535i', "year": 2012},
-    {"make": 'bmw', "model": '535i', "year": 2011},
-    {"make": 'bmw', "model": '535i', "year": 2010},
-    {"make": 'bmw', "model": '535i', "year": 2009},
-    {"make": 'bmw', "model": '535i', "year": 2008},
-    {"make": 'bmw', "model": '535i 6-spd sport sedan', "year": 2011},
-    {"make": 'bmw', "model": '535i xdrive', "year": 2014},
-    {"make": 'bmw', "model": '535i xdrive', "year": 2013},
-    {"make": 'bmw', "model": '535i xdrive', "year": 2011},
-    {"make": 'bmw', "model": '535i xdrive awd', "year": 2013},
-    {"make": 'bmw', "model": '535xi', "year": 2011},
-    {"make": 'bmw', "model": '535xi', "year": 2010},
-    {"make": 'bmw', "model": '535xi', "year": 2008},
-    {"make": 'bmw', "model": '540i', "year": 2018},
-    {"make": 'bmw', "model": '540i bad credit', "year": 2018},
-    {"make": 'bmw', "model": '550i', "year": 2014},
-    {"make": 'bmw', "model": '550i', "year": 2011},
-    {"make": 'bmw', "model": '550i', "year": 2009},
-    {"make": 'bmw', "model": '550i', "year": 2008},
-    {"make": 'bmw', "model": '550i xdrive', "year": 2013},
-    {"make": 'bmw', "model": '550i xdrive', "year": 2011},
-    {"make": 'bmw', "model": '6 series', "year": 2015},
-    {"make": 'bmw', "model": '6 series', "year": 2014},
-    {"make": 'bmw', "model": '6 series', "year": 2013},
-    {"make": 'bmw', "model": '6 series 640i convertible 2d', "year": 2014},
-    {"make": 'bmw', "model": '6 series 640i gran coupe', "year": 2014},
-    {"make": 'bmw', "model": '6 series 650i convertible 2d', "year": 2015},
-    {"make": 'bmw', "model": '6 series 650i convertible 2d', "year": 2012},
-    {"make": 'bmw', "model": '640', "year": 2014},
-    {"make": 'bmw', "model": '640i', "year": 2014},
-    {"make": 'bmw', "model": '640i', "year": 2013},
-    {"make": 'bmw', "model": '645ci convertible', "year": 2005},
-    {"make": 'bmw', "model": '650i', "year": 2015},
-    {"make": 'bmw', "model": '650i', "year": 2013},
-    {"make": 'bmw', "model": '650i', "year": 2012},
-    {"make": 'bmw', "model": '650i', "year": 2009},
-    {"make": 'bmw', "model": '650i convertible', "year": 2012},
-    {"make": 'bmw', "model": '650i convertible', "year": 2008},
-    {"make": 'bmw', "model": '650i gran coupe', "year": 2013},
-    {"make": 'bmw', "model": '650xi xdrive gran coupe', "year": 2013},
-    {"make": 'bmw', "model": '7 series', "year": 2018},
-    {"make": 'bmw', "model": '7 series', "year": 2016},
-    {"make": 'bmw', "model": '7 series', "year": 2015},
-    {"make": 'bmw', "model": '7 series', "year": 2014},
-    {"make": 'bmw', "model": '7 series', "year": 2013},
-    {"make": 'bmw', "model": '7 series', "year": 2012},
-    {"make": 'bmw', "model": '7 series', "year": 2009},
-    {"make": 'bmw', "model": '7 series 740i sedan 4d', "year": 2020},
-    {"make": 'bmw', "model": '7 series 750i sedan 4d', "year": 2018},
-    {"make": 'bmw', "model": '7 series 750i sedan 4d', "year": 2015},
-    {"make": 'bmw', "model": '7 series 750i xdrive sedan', "year": 2019},
-    {"make": 'bmw', "model": '7 series 750i xdrive sedan', "year": 2018},
-    {"make": 'bmw', "model": '7 series 750li xdrive sedan', "year": 2014},
-    {"make": 'bmw', "model": '7-series', "year": 2011},
-    {"make": 'bmw', "model": '7-series', "year": 2010},
-    {"make": 'bmw', "model": '740i', "year": 2016},
-    {"make": 'bmw', "model": '740i', "year": 2011},
-    {"make": 'bmw', "model": '750i', "year": 2018},
-    {"make": 'bmw', "model": '750i', "year": 2016},
-    {"make": 'bmw', "model": '750i', "year": 2012},
-    {"make": 'bmw', "model": '750i', "year": 2006},
-    {"make": 'bmw', "model": '750i / alpina b7', "year": 2014},
-    {"make": 'bmw', "model": '750i / b7', "year": 2018},
-    {"make": 'bmw', "model": '750li', "year": 2009},
-    {"make": 'bmw', "model": '750li', "year": 2008},
-    {"make": 'bmw', "model": '750li', "year": 2007},
-    {"make": 'bmw', "model": '750li', "year": 2006},
-    {"make": 'bmw', "model": '750li / alpina b7', "year": 2012},
-    {"make": 'bmw', "model": '750li xdrive', "year": 2012},
-    {"make": 'bmw', "model": '750xi xdrive m-sport edition', "year": 2015},
-    {"make": 'bmw', "model": 'alpina b6 gran coupe xdrive', "year": 2015},
-    {"make": 'bmw', "model": 'i3', "year": 2018},
-    {"make": 'bmw', "model": 'i3', "year": 2017},
-    {"make": 'bmw', "model": 'i3', "year": 2016},
-    {"make": 'bmw', "model": 'i3', "year": 2015},
-    {"make": 'bmw', "model": 'i3 base w/range extender', "year": 2018},
-    {"make": 'bmw', "model": 'i3 hatchback 4d', "year": 2015},
-    {"make": 'bmw', "model": 'i3 hatchback 4d', "year": 2014},
-    {"make": 'bmw', "model": 'i3 s w/range extender', "year": 2018},
-    {"make": 'bmw', "model": 'i8', "year": 2016},
-    {"make": 'bmw', "model": 'm3', "year": 2016},
-    {"make": 'bmw', "model": 'm3', "year": 2015},
-    {"make": 'bmw', "model": 'm3', "year": 2013},
-    {"make": 'bmw', "model": 'm3', "year": 2011},
-    {"make": 'bmw', "model": 'm3', "year": 2008},
-    {"make": 'bmw', "model": 'm3 convertible 2d', "year": 2012},
-    {"make": 'bmw', "model": 'm3 convertible 2d', "year": 2011},
-    {"make": 'bmw', "model": 'm3 coupe', "year": 2011},
-    {"make": 'bmw', "model": 'm3 coupe 2d', "year": 2013},
-    {"make": 'bmw', "model": 'm3 coupe 2d', "year": 2012},
-    {"make": 'bmw', "model": 'm3 coupe 2d', "year": 2011},
-    {"make": 'bmw', "model": 'm3 coupe 2d', "year": 2009},
-    {"make": 'bmw', "model": 'm3 sedan 4d', "year": 2018},
-    {"make": 'bmw', "model": 'm3 sedan 4d', "year": 2015},
-    {"make": 'bmw', "model": 'm4', "year": 2020},
-    {"make": 'bmw', "model": 'm4', "year": 2015},
-    {"make": 'bmw', "model": 'm4 coupe 2d', "year": 2015},
-    {"make": 'bmw', "model": 'm5', "year": 2018},
-    {"make": 'bmw', "model": 'm5', "year": 2013},
-    {"make": 'bmw', "model": 'm5', "year": 2007},
-    {"make": 'bmw', "model": 'm5', "year": 2006},
-    {"make": 'bmw', "model": 'm6', "year": 2017},
-    {"make": 'bmw', "model": 'm6', "year": 2007},
-    {"make": 'bmw', "model": 'm6 coupe 4d', "year": 2016},
-    {"make": 'bmw', "model": 'm6 coupe 4d', "year": 2014},
-    {"make": 'bmw', "model": 'x1', "year": 2020},
-    {"make": 'bmw', "model": 'x1', "year": 2018},
-    {"make": 'bmw', "model": 'x1', "year": 2017},
-    {"make": 'bmw', "model": 'x1', "year": 2016},
-    {"make": 'bmw', "model": 'x1', "year": 2015},
-    {"make": 'bmw', "model": 'x1', "year": 2014},
-    {"make": 'bmw', "model": 'x1', "year": 2013},
-    {"make": 'bmw', "model": 'x1 28i sport line pkg', "year": 2013},
-    {"make": 'bmw', "model": 'x1 sdrive28i', "year": 2017},
-    {"make": 'bmw', "model": 'x1 sdrive28i', "year": 2015},
-    {"make": 'bmw', "model": 'x1 sdrive28i sport utility', "year": 2020},
-    {"make": 'bmw', "model": 'x1 sdrive28i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x1 xdrive28i', "year": 2018},
-    {"make": 'bmw', "model": 'x1 xdrive28i', "year": 2017},
-    {"make": 'bmw', "model": 'x1 xdrive28i', "year": 2016},
-    {"make": 'bmw', "model": 'x1 xdrive28i', "year": 2015},
-    {"make": 'bmw', "model": 'x1 xdrive28i', "year": 2014},
-    {"make": 'bmw', "model": 'x1 xdrive28i', "year": 2013},
-    {"make": 'bmw', "model": 'x1 xdrive28i awd! awd', "year": 2015},
-    {"make": 'bmw', "model": 'x1 xdrive28i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x1 xdrive28i sport utility', "year": 2017},
-    {"make": 'bmw', "model": 'x1 xdrive35i', "year": 2014},
-    {"make": 'bmw', "model": 'x1 xdrive35i', "year": 2013},
-    {"make": 'bmw', "model": 'x1 xdrive35i awdsuv', "year": 2013},
-    {"make": 'bmw', "model": 'x2', "year": 2018},
-    {"make": 'bmw', "model": 'x2 sdrive28i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x2 xdrive28i', "year": 2018},
-    {"make": 'bmw', "model": 'x3', "year": 2019},
-    {"make": 'bmw', "model": 'x3', "year": 2018},
-    {"make": 'bmw', "model": 'x3', "year": 2017},
-    {"make": 'bmw', "model": 'x3', "year": 2016},
-    {"make": 'bmw', "model": 'x3', "year": 2015},
-    {"make": 'bmw', "model": 'x3', "year": 2014},
-    {"make": 'bmw', "model": 'x3', "year": 2013},
-    {"make": 'bmw', "model": 'x3', "year": 2012},
-    {"make": 'bmw', "model": 'x3', "year": 2011},
-    {"make": 'bmw', "model": 'x3', "year": 2009},
-    {"make": 'bmw', "model": 'x3', "year": 2008},
-    {"make": 'bmw', "model": 'x3', "year": 2007},
-    {"make": 'bmw', "model": 'x3', "year": 2006},
-    {"make": 'bmw', "model": 'x3', "year": 2005},
-    {"make": 'bmw', "model": 'x3 3.0i', "year": 2006},
-    {"make": 'bmw', "model": 'x3 3.0i', "year": 2005},
-    {"make": 'bmw', "model": 'x3 3.0si', "year": 2008},
-    {"make": 'bmw', "model": 'x3 3.0si', "year": 2007},
-    {"make": 'bmw', "model": 'x3 m40i sport utility 4d', "year": 2018},
-    {"make": 'bmw', "model": 'x3 sdrive30i sport utility', "year": 2020},
-    {"make": 'bmw', "model": 'x3 sdrive30i sport utility', "year": 2019},
-    {"make": 'bmw', "model": 'x3 xdrive 28i', "year": 2014},
-    {"make": 'bmw', "model": 'x3 xdrive 30i awd gas suv', "year": 2019},
-    {"make": 'bmw', "model": 'x3 xdrive28i', "year": 2017},
-    {"make": 'bmw', "model": 'x3 xdrive28i', "year": 2015},
-    {"make": 'bmw', "model": 'x3 xdrive28i', "year": 2014},
-    {"make": 'bmw', "model": 'x3 xdrive28i', "year": 2013},
-    {"make": 'bmw', "model": 'x3 xdrive28i', "year": 2012},
-    {"make": 'bmw', "model": 'x3 xdrive28i', "year": 2011},
-    {"make": 'bmw', "model": 'x3 xdrive28i sport utility', "year": 2017},
-    {"make": 'bmw', "model": 'x3 xdrive28i sport utility', "year": 2016},
-    {"make": 'bmw', "model": 'x3 xdrive30i', "year": 2008},
-    {"make": 'bmw', "model": 'x3 xdrive30i awd gas suv', "year": 2019},
-    {"make": 'bmw', "model": 'x3 xdrive30i awdsuv', "year": 2010},
-    {"make": 'bmw', "model": 'x3 xdrive30i sport utility', "year": 2019},
-    {"make": 'bmw', "model": 'x3 xdrive30i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x3 xdrive35i', "year": 2014},
-    {"make": 'bmw', "model": 'x3 xdrive35i', "year": 2013},
-    {"make": 'bmw', "model": 'x3 xdrive35i', "year": 2012},
-    {"make": 'bmw', "model": 'x3 xdrive35i', "year": 2011},
-    {"make": 'bmw', "model": 'x4', "year": 2018},
-    {"make": 'bmw', "model": 'x4', "year": 2017},
-    {"make": 'bmw', "model": 'x4', "year": 2016},
-    {"make": 'bmw', "model": 'x4', "year": 2015},
-    {"make": 'bmw', "model": 'x4 m40i sport utility 4d', "year": 2017},
-    {"make": 'bmw', "model": 'x4 xdrive28i', "year": 2016},
-    {"make": 'bmw', "model": 'x4 xdrive28i', "year": 2015},
-    {"make": 'bmw', "model": 'x5', "year": 2018},
-    {"make": 'bmw', "model": 'x5', "year": 2017},
-    {"make": 'bmw', "model": 'x5', "year": 2016},
-    {"make": 'bmw', "model": 'x5', "year": 2015},
-    {"make": 'bmw', "model": 'x5', "year": 2014},
-    {"make": 'bmw', "model": 'x5', "year": 2013},
-    {"make": 'bmw', "model": 'x5', "year": 2012},
-    {"make": 'bmw', "model": 'x5', "year": 2011},
-    {"make": 'bmw', "model": 'x5', "year": 2010},
-    {"make": 'bmw', "model": 'x5', "year": 2009},
-    {"make": 'bmw', "model": 'x5', "year": 2008},
-    {"make": 'bmw', "model": 'x5', "year": 2007},
-    {"make": 'bmw', "model": 'x5', "year": 2006},
-    {"make": 'bmw', "model": 'x5', "year": 2005},
-    {"make": 'bmw', "model": 'x5 3.5i premium', "year": 2013},
-    {"make": 'bmw', "model": 'x5 4.4i 4.4i', "year": 2005},
-    {"make": 'bmw', "model": 'x5 sdrive35i', "year": 2014},
-    {"make": 'bmw', "model": 'x5 sdrive35i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x5 xdrive 4.8i awd sport-suv', "year": 2007},
-    {"make": 'bmw', "model": 'x5 xdrive30i', "year": 2010},
-    {"make": 'bmw', "model": 'x5 xdrive30i', "year": 2009},
-    {"make": 'bmw', "model": 'x5 xdrive35d', "year": 2013},
-    {"make": 'bmw', "model": 'x5 xdrive35d', "year": 2012},
-    {"make": 'bmw', "model": 'x5 xdrive35d', "year": 2011},
-    {"make": 'bmw', "model": 'x5 xdrive35d', "year": 2010},
-    {"make": 'bmw', "model": 'x5 xdrive35d sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x5 xdrive35d sport utility', "year": 2017},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2017},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2016},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2015},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2014},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2013},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2012},
-    {"make": 'bmw', "model": 'x5 xdrive35i', "year": 2011},
-    {"make": 'bmw', "model": 'x5 xdrive35i awd luxury suv', "year": 2017},
-    {"make": 'bmw', "model": 'x5 xdrive35i awd luxury suv', "year": 2011},
-    {"make": 'bmw', "model": 'x5 xdrive35i awd suv', "year": 2016},
-    {"make": 'bmw', "model": 'x5 xdrive35i premium', "year": 2013},
-    {"make": 'bmw', "model": 'x5 xdrive35i sport activity', "year": 2011},
-    {"make": 'bmw', "model": 'x5 xdrive35i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x5 xdrive35i sport utility', "year": 2017},
-    {"make": 'bmw', "model": 'x5 xdrive40e iperformance', "year": 2018},
-    {"make": 'bmw', "model": 'x5 xdrive40e iperformance', "year": 2017},
-    {"make": 'bmw', "model": 'x5 xdrive40e sport utility', "year": 2016},
-    {"make": 'bmw', "model": 'x5 xdrive40i sport utility', "year": 2019},
-    {"make": 'bmw', "model": 'x5 xdrive50i', "year": 2013},
-    {"make": 'bmw', "model": 'x5 xdrive50i', "year": 2012},
-    {"make": 'bmw', "model": 'x5 xdrive50i', "year": 2011},
-    {"make": 'bmw', "model": 'x5 xdrive50i 6-speed automatic', "year": 2011},
-    {"make": 'bmw', "model": 'x5 xdrive50i m-sport 7-pass', "year": 2016},
-    {"make": 'bmw', "model": 'x5 xdrive50i m-sport w/3rd r', "year": 2016},
-    {"make": 'bmw', "model": 'x5 xdrive50i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x5 xdrive50i sport utility', "year": 2017},
-    {"make": 'bmw', "model": 'x5m', "year": 2011},
-    {"make": 'bmw', "model": 'x6', "year": 2018},
-    {"make": 'bmw', "model": 'x6', "year": 2017},
-    {"make": 'bmw', "model": 'x6', "year": 2016},
-    {"make": 'bmw', "model": 'x6', "year": 2015},
-    {"make": 'bmw', "model": 'x6', "year": 2014},
-    {"make": 'bmw', "model": 'x6', "year": 2012},
-    {"make": 'bmw', "model": 'x6', "year": 2011},
-    {"make": 'bmw', "model": 'x6', "year": 2009},
-    {"make": 'bmw', "model": 'x6 m', "year": 2012},
-    {"make": 'bmw', "model": 'x6 sdrive35i sport utility', "year": 2016},
-    {"make": 'bmw', "model": 'x6 xdrive35i', "year": 2015},
-    {"make": 'bmw', "model": 'x6 xdrive35i', "year": 2011},
-    {"make": 'bmw', "model": 'x6 xdrive35i sport utility', "year": 2018},
-    {"make": 'bmw', "model": 'x6 xdrive35i sport utility', "year": 2017},
-    {"make": 'bmw', "model": 'x6 xdrive35i sport utility', "year": 2016},
-    {"make": 'bmw', "model": 'x6 xdrive35i sport utility', "year": 2015},
-    {"make": 'bmw', "model": 'x6 xdrive35i sport utility', "year": 2013},
-    {"make": 'bmw', "model": 'z4', "year": 2009},
-    {"make": 'bmw', "model": 'z4', "year": 2008},
-    {"make": 'bmw', "model": 'z4', "year": 2007},
-    {"make": 'bmw', "model": 'z4', "year": 2006},
-    {"make": 'bmw', "model": 'z4', "year": 2005},
-    {"make": 'bmw', "model": 'z4 2.5i', "year": 2005},
-    {"make": 'bmw', "model": 'z4 3.0i 3.0i', "year": 2006},
-    {"make": 'bmw', "model": 'z4 sdrive28i roadster 2d', "year": 2015},
-    {"make": 'bmw', "model": 'z4 sdrive28i roadster 2d', "year": 2014},
-    {"make": 'bmw', "model": 'z4 sdrive35is roadster 2d', "year": 2011},
-    {"make": 'cadillac', "model": 'ats', "year": 2018},
-    {"make": 'cadillac', "model": 'ats', "year": 2017},
-    {"make": 'cadillac', "model": 'ats', "year": 2016},
-    {"make": 'cadillac', "model": 'ats', "year": 2015},
-    {"make": 'cadillac', "model": 'ats', "year": 2014},
-    {"make": 'cadillac', "model": 'ats', "year": 2013},
-    {"make": 'cadillac', "model": 'ats 2.0l turbo', "year": 2014},
-    {"make": 'cadillac', "model": 'ats 2.0l turbo luxury', "year": 2016},
-    {"make": 'cadillac', "model": 'ats 2.0l turbo standard', "year": 2016},
-    {"make": 'cadillac', "model": 'ats 2.0l turbo standard', "year": 2014},
-    {"make": 'cadillac', "model": 'ats 3.6l luxury sedan', "year": 2014},
-    {"make": 'cadillac', "model": 'ats 3.6l luxury sedan', "year": 2013},
-    {"make": 'cadillac', "model": 'ats coupe 2d', "year": 2018},
-    {"make": 'cadillac', "model": 'ats luxury coupe 2d', "year": 2019},
-    {"make": 'cadillac', "model": 'ats luxury coupe 2d', "year": 2018},
-    {"make": 'cadillac', "model": 'ats luxury coupe 2d', "year": 2017},
-    {"make": 'cadillac', "model": 'ats luxury sedan 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'ats luxury sedan 4d', "year": 2017},
-    {"make": 'cadillac', "model": 'ats premium luxury', "year": 2018},
-    {"make": 'cadillac', "model": 'ats sedan', "year": 2017},
-    {"make": 'cadillac', "model": 'ats sedan', "year": 2016},
-    {"make": 'cadillac', "model": 'ats sedan', "year": 2015},
-    {"make": 'cadillac', "model": 'ats sedan', "year": 2013},
-    {"make": 'cadillac', "model": 'ats sedan 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'ats-v coupe 2d', "year": 2017},
-    {"make": 'cadillac', "model": 'ats4 performance', "year": 2013},
-    {"make": 'cadillac', "model": 'ct4', "year": 2020},
-    {"make": 'cadillac', "model": 'ct4 premium luxury', "year": 2021},
-    {"make": 'cadillac', "model": 'ct4 sport awd', "year": 2021},
-    {"make": 'cadillac', "model": 'ct5 luxury sedan 4d', "year": 2020},
-    {"make": 'cadillac', "model": 'ct5 premium luxury', "year": 2021},
-    {"make": 'cadillac', "model": 'ct5 premium luxury', "year": 2020},
-    {"make": 'cadillac', "model": 'ct6', "year": 2018},
-    {"make": 'cadillac', "model": 'ct6', "year": 2017},
-    {"make": 'cadillac', "model": 'ct6', "year": 2016},
-    {"make": 'cadillac', "model": 'ct6 3.6 luxury sedan 4d', "year": 2017},
-    {"make": 'cadillac', "model": 'ct6 luxury', "year": 2016},
-    {"make": 'cadillac', "model": 'ct6 plug-in sedan 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'cts', "year": 2017},
-    {"make": 'cadillac', "model": 'cts', "year": 2016},
-    {"make": 'cadillac', "model": 'cts', "year": 2015},
-    {"make": 'cadillac', "model": 'cts', "year": 2014},
-    {"make": 'cadillac', "model": 'cts', "year": 2013},
-    {"make": 'cadillac', "model": 'cts', "year": 2012},
-    {"make": 'cadillac', "model": 'cts', "year": 2011},
-    {"make": 'cadillac', "model": 'cts', "year": 2010},
-    {"make": 'cadillac', "model": 'cts', "year": 2009},
-    {"make": 'cadillac', "model": 'cts', "year": 2008},
-    {"make": 'cadillac', "model": 'cts', "year": 2007},
-    {"make": 'cadillac', "model": 'cts', "year": 2006},
-    {"make": 'cadillac', "model": 'cts', "year": 2005},
-    {"make": 'cadillac', "model": 'cts 2.0 luxury', "year": 2016},
-    {"make": 'cadillac', "model": 'cts 2.0 luxury sedan 4d', "year": 2019},
-    {"make": 'cadillac', "model": 'cts 2.0 luxury sedan 4d', "year": 2017},
-    {"make": 'cadillac', "model": 'cts 3.6 luxury sedan 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'cts 3.6 performance', "year": 2014},
-    {"make": 'cadillac', "model": 'cts 3.6 premium', "year": 2013},
-    {"make": 'cadillac', "model": 'cts 3.6 premium luxury', "year": 2017},
-    {"make": 'cadillac', "model": 'cts coupe', "year": 2012},
-    {"make": 'cadillac', "model": 'cts cts-v coupe 2d', "year": 2013},
-    {"make": 'cadillac', "model": 'cts luxury awd', "year": 2012},
-    {"make": 'cadillac', "model": 'cts luxury collection', "year": 2015},
-    {"make": 'cadillac', "model": 'cts sedan', "year": 2013},
-    {"make": 'cadillac', "model": 'cts sedan', "year": 2012},
-    {"make": 'cadillac', "model": 'cts sedan', "year": 2011},
-    {"make": 'cadillac', "model": 'cts sedan 4d', "year": 2019},
-    {"make": 'cadillac', "model": 'cts sedan 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'cts sedan 4d', "year": 2017},
-    {"make": 'cadillac', "model": 'cts-v', "year": 2011},
-    {"make": 'cadillac', "model": 'cts4', "year": 2011},
-    {"make": 'cadillac', "model": 'deville', "year": 2005},
-    {"make": 'cadillac', "model": 'dts', "year": 2011},
-    {"make": 'cadillac', "model": 'dts', "year": 2010},
-    {"make": 'cadillac', "model": 'dts', "year": 2009},
-    {"make": 'cadillac', "model": 'dts', "year": 2008},
-    {"make": 'cadillac', "model": 'dts', "year": 2007},
-    {"make": 'cadillac', "model": 'dts', "year": 2006},
-    {"make": 'cadillac', "model": 'dts sedan 4d', "year": 2011},
-    {"make": 'cadillac', "model": 'elr coupe 2d', "year": 2014},
-    {"make": 'cadillac', "model": 'escalade', "year": 2021},
-    {"make": 'cadillac', "model": 'escalade', "year": 2020},
-    {"make": 'cadillac', "model": 'escalade', "year": 2018},
-    {"make": 'cadillac', "model": 'escalade', "year": 2017},
-    {"make": 'cadillac', "model": 'escalade', "year": 2016},
-    {"make": 'cadillac', "model": 'escalade', "year": 2015},
-    {"make": 'cadillac', "model": 'escalade', "year": 2014},
-    {"make": 'cadillac', "model": 'escalade', "year": 2013},
-    {"make": 'cadillac', "model": 'escalade', "year": 2012},
-    {"make": 'cadillac', "model": 'escalade', "year": 2011},
-    {"make": 'cadillac', "model": 'escalade', "year": 2010},
-    {"make": 'cadillac', "model": 'escalade', "year": 2009},
-    {"make": 'cadillac', "model": 'escalade', "year": 2008},
-    {"make": 'cadillac', "model": 'escalade', "year": 2007},
-    {"make": 'cadillac', "model": 'escalade', "year": 2006},
-    {"make": 'cadillac', "model": 'escalade', "year": 2005},
-    {"make": 'cadillac', "model": 'escalade awd', "year": 2008},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2020},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2019},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2018},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2017},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2016},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2015},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2014},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2013},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2012},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2011},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2010},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2009},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2008},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2007},
-    {"make": 'cadillac', "model": 'escalade esv', "year": 2005},
-    {"make": 'cadillac', "model": 'escalade esv awd', "year": 2007},
-    {"make": 'cadillac', "model": 'escalade esv awd', "year": 2005},
-    {"make": 'cadillac', "model": 'escalade esv luxury', "year": 2020},
-    {"make": 'cadillac', "model": 'escalade esv luxury', "year": 2018},
-    {"make": 'cadillac', "model": 'escalade esv platinum', "year": 2018},
-    {"make": 'cadillac', "model": 'escalade esv premium', "year": 2018},
-    {"make": 'cadillac', "model": 'escalade esv premium', "year": 2017},
-    {"make": 'cadillac', "model": 'escalade esv premium', "year": 2015},
-    {"make": 'cadillac', "model": 'escalade esv premium', "year": 2011},
-    {"make": 'cadillac', "model": 'escalade esv premium & luxury pkgs rear dvd pano night vision', "year": 2021},
-    {"make": 'cadillac', "model": 'escalade ext', "year": 2011},
-    {"make": 'cadillac', "model": 'escalade ext', "year": 2008},
-    {"make": 'cadillac', "model": 'escalade ext', "year": 2007},
-    {"make": 'cadillac', "model": 'escalade ext""', "year": 2005},
-    {"make": 'cadillac', "model": 'escalade luxury', "year": 2013},
-    {"make": 'cadillac', "model": 'escalade luxury', "year": 2009},
-    {"make": 'cadillac', "model": 'escalade platinum', "year": 2013},
-    {"make": 'cadillac', "model": 'escalade platinum 4x4', "year": 2015},
-    {"make": 'cadillac', "model": 'escalade premium', "year": 2015},
-    {"make": 'cadillac', "model": 'escalade premium sport', "year": 2013},
-    {"make": 'cadillac', "model": 'srx', "year": 2016},
-    {"make": 'cadillac', "model": 'srx', "year": 2015},
-    {"make": 'cadillac', "model": 'srx', "year": 2014},
-    {"make": 'cadillac', "model": 'srx', "year": 2013},
-    {"make": 'cadillac', "model": 'srx', "year": 2012},
-    {"make": 'cadillac', "model": 'srx', "year": 2011},
-    {"make": 'cadillac', "model": 'srx', "year": 2010},
-    {"make": 'cadillac', "model": 'srx', "year": 2009},
-    {"make": 'cadillac', "model": 'srx', "year": 2008},
-    {"make": 'cadillac', "model": 'srx', "year": 2007},
-    {"make": 'cadillac', "model": 'srx', "year": 2006},
-    {"make": 'cadillac', "model": 'srx', "year": 2005},
-    {"make": 'cadillac', "model": 'srx luxury', "year": 2014},
-    {"make": 'cadillac', "model": 'srx luxury', "year": 2012},
-    {"make": 'cadillac', "model": 'srx luxury', "year": 2011},
-    {"make": 'cadillac', "model": 'srx luxury awd! awd', "year": 2013},
-    {"make": 'cadillac', "model": 'srx luxury collection', "year": 2016},
-    {"make": 'cadillac', "model": 'srx luxury collection', "year": 2015},
-    {"make": 'cadillac', "model": 'srx luxury collection', "year": 2013},
-    {"make": 'cadillac', "model": 'srx luxury collection', "year": 2012},
-    {"make": 'cadillac', "model": 'srx luxury collection', "year": 2011},
-    {"make": 'cadillac', "model": 'srx luxury collection', "year": 2010},
-    {"make": 'cadillac', "model": 'srx performance', "year": 2016},
-    {"make": 'cadillac', "model": 'srx performance', "year": 2013},
-    {"make": 'cadillac', "model": 'srx premium collection', "year": 2015},
-    {"make": 'cadillac', "model": 'srx sport utility 4d', "year": 2012},
-    {"make": 'cadillac', "model": 'srx v8', "year": 2007},
-    {"make": 'cadillac', "model": 'sts', "year": 2009},
-    {"make": 'cadillac', "model": 'sts', "year": 2008},
-    {"make": 'cadillac', "model": 'sts', "year": 2007},
-    {"make": 'cadillac', "model": 'sts', "year": 2006},
-    {"make": 'cadillac', "model": 'sts', "year": 2005},
-    {"make": 'cadillac', "model": 'xlr', "year": 2006},
-    {"make": 'cadillac', "model": 'xt4', "year": 2020},
-    {"make": 'cadillac', "model": 'xt4', "year": 2019},
-    {"make": 'cadillac', "model": 'xt4 luxury sport', "year": 2019},
-    {"make": 'cadillac', "model": 'xt4 premium luxury', "year": 2021},
-    {"make": 'cadillac', "model": 'xt4 premium luxury', "year": 2020},
-    {"make": 'cadillac', "model": 'xt4 premium luxury', "year": 2019},
-    {"make": 'cadillac', "model": 'xt4 sport', "year": 2019},
-    {"make": 'cadillac', "model": 'xt4 sport suv 4d', "year": 2020},
-    {"make": 'cadillac', "model": 'xt4 sport suv 4d', "year": 2019},
-    {"make": 'cadillac', "model": 'xt5', "year": 2020},
-    {"make": 'cadillac', "model": 'xt5', "year": 2019},
-    {"make": 'cadillac', "model": 'xt5', "year": 2018},
-    {"make": 'cadillac', "model": 'xt5', "year": 2017},
-    {"make": 'cadillac', "model": 'xt5 luxury', "year": 2019},
-    {"make": 'cadillac', "model": 'xt5 luxury awd', "year": 2021},
-    {"make": 'cadillac', "model": 'xt5 luxury awd gas suv', "year": 2017},
-    {"make": 'cadillac', "model": 'xt5 luxury sport', "year": 2019},
-    {"make": 'cadillac', "model": 'xt5 luxury sport', "year": 2018},
-    {"make": 'cadillac', "model": 'xt5 luxury sport', "year": 2017},
-    {"make": 'cadillac', "model": 'xt5 platinum sport', "year": 2019},
-    {"make": 'cadillac', "model": 'xt5 platinum sport', "year": 2017},
-    {"make": 'cadillac', "model": 'xt5 premium luxury', "year": 2021},
-    {"make": 'cadillac', "model": 'xt5 premium luxury', "year": 2020},
-    {"make": 'cadillac', "model": 'xt5 premium luxury', "year": 2018},
-    {"make": 'cadillac', "model": 'xt5 premium luxury', "year": 2017},
-    {"make": 'cadillac', "model": 'xt5 sport suv 4d', "year": 2020},
-    {"make": 'cadillac', "model": 'xt5 sport utility 4d', "year": 2019},
-    {"make": 'cadillac', "model": 'xt5 sport utility 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'xt6', "year": 2021},
-    {"make": 'cadillac', "model": 'xt6', "year": 2020},
-    {"make": 'cadillac', "model": 'xt6 premium luxury', "year": 2021},
-    {"make": 'cadillac', "model": 'xt6 premium luxury', "year": 2020},
-    {"make": 'cadillac', "model": 'xts', "year": 2019},
-    {"make": 'cadillac', "model": 'xts', "year": 2018},
-    {"make": 'cadillac', "model": 'xts', "year": 2017},
-    {"make": 'cadillac', "model": 'xts', "year": 2016},
-    {"make": 'cadillac', "model": 'xts', "year": 2015},
-    {"make": 'cadillac', "model": 'xts', "year": 2014},
-    {"make": 'cadillac', "model": 'xts', "year": 2013},
-    {"make": 'cadillac', "model": 'xts luxury', "year": 2017},
-    {"make": 'cadillac', "model": 'xts luxury collection', "year": 2013},
-    {"make": 'cadillac', "model": 'xts luxury sedan 4d', "year": 2019},
-    {"make": 'cadillac', "model": 'xts luxury sedan 4d', "year": 2018},
-    {"make": 'cadillac', "model": 'xts platinum', "year": 2013},
-    {"make": 'cadillac', "model": 'xts standard sedan 4d', "year": 2016},
-    {"make": 'chevrolet', "model": '1500', "year": 2018},
-    {"make": 'chevrolet', "model": '1500', "year": 2014},
-    {"make": 'chevrolet', "model": '2500', "year": 2016},
-    {"make": 'chevrolet', "model": '2500', "year": 2013},
-    {"make": 'chevrolet', "model": '2500', "year": 2012},
-    {"make": 'chevrolet', "model": '2500 cargo van', "year": 2012},
-    {"make": 'chevrolet', "model": '2500hd', "year": 2018},
-    {"make": 'chevrolet', "model": '2500hd lt duramax 4x4', "year": 2013},
-    {"make": 'chevrolet', "model": '3500', "year": 2015},
-    {"make": 'chevrolet', "model": '3500', "year": 2013},
-    {"make": 'chevrolet', "model": '3500 4x4 drw', "year": 2014},
-    {"make": 'chevrolet', "model": '3500 duramax turbo diesel', "year": 2007},
-    {"make": 'chevrolet', "model": '3500 lcf gas', "year": 2009},
-    {"make": 'chevrolet', "model": '3500hd 4x4 duramax', "year": 2015},
-    {"make": 'chevrolet', "model": '4500 lcf gas', "year": 2016},
-    {"make": 'chevrolet', "model": '5500', "year": 2007},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2013},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2012},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2011},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2010},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2009},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2008},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2007},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2006},
-    {"make": 'chevrolet', "model": 'avalanche', "year": 2005},
-    {"make": 'chevrolet', "model": 'avalanche black', "year": 2013},
-    {"make": 'chevrolet', "model": 'avalanche black diamond', "year": 2013},
-    {"make": 'chevrolet', "model": 'avalanche lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'avalanche lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'avalanche lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'avalanche ltz', "year": 2013},
-    {"make": 'chevrolet', "model": 'avalanche ltz', "year": 2010},
-    {"make": 'chevrolet', "model": 'avalanche ltz', "year": 2008},
-    {"make": 'chevrolet', "model": 'avalanche ltz', "year": 2007},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2011},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2010},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2009},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2008},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2007},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2006},
-    {"make": 'chevrolet', "model": 'aveo', "year": 2005},
-    {"make": 'chevrolet', "model": 'aveo hatchback', "year": 2008},
-    {"make": 'chevrolet', "model": 'aveo ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'aveo ls', "year": 2007},
-    {"make": 'chevrolet', "model": 'aveo lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'aveo lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'aveo lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'blazer', "year": 2021},
-    {"make": 'chevrolet', "model": 'blazer', "year": 2020},
-    {"make": 'chevrolet', "model": 'blazer', "year": 2019},
-    {"make": 'chevrolet', "model": 'blazer 1lt sport', "year": 2020},
-    {"make": 'chevrolet', "model": 'blazer 1lt sport', "year": 2019},
-    {"make": 'chevrolet', "model": 'blazer 2lt sport', "year": 2020},
-    {"make": 'chevrolet', "model": 'blazer 2lt sport', "year": 2019},
-    {"make": 'chevrolet', "model": 'blazer lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'blazer premier sport', "year": 2020},
-    {"make": 'chevrolet', "model": 'bolt ev', "year": 2021},
-    {"make": 'chevrolet', "model": 'bolt ev', "year": 2018},
-    {"make": 'chevrolet', "model": 'bolt ev', "year": 2017},
-    {"make": 'chevrolet', "model": 'bolt ev lt hatchback', "year": 2020},
-    {"make": 'chevrolet', "model": 'c', "year": 2012},
-    {"make": 'chevrolet', "model": 'c2500', "year": 2011},
-    {"make": 'chevrolet', "model": 'c3500', "year": 2006},
-    {"make": 'chevrolet', "model": 'c4500', "year": 2005},
-    {"make": 'chevrolet', "model": 'c4500 4x4', "year": 2007},
-    {"make": 'chevrolet', "model": 'c5500', "year": 2008},
-    {"make": 'chevrolet', "model": 'c5500 bus', "year": 2009},
-    {"make": 'chevrolet', "model": 'c8500', "year": 2007},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2020},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2019},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2018},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2017},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2016},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2014},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2013},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2012},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2011},
-    {"make": 'chevrolet', "model": 'camaro', "year": 2010},
-    {"make": 'chevrolet', "model": 'camaro 1ls', "year": 2011},
-    {"make": 'chevrolet', "model": 'camaro 2ss', "year": 2012},
-    {"make": 'chevrolet', "model": 'camaro 2ss', "year": 2010},
-    {"make": 'chevrolet', "model": 'camaro 6 speed manual transmission - v6 - recently', "year": 2013},
-    {"make": 'chevrolet', "model": 'camaro ls', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro ls', "year": 2013},
-    {"make": 'chevrolet', "model": 'camaro ls coupe 2d', "year": 2020},
-    {"make": 'chevrolet', "model": 'camaro ls coupe 2d', "year": 2018},
-    {"make": 'chevrolet', "model": 'camaro ls rwd gas', "year": 2018},
-    {"make": 'chevrolet', "model": 'camaro lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'camaro lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'camaro lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'camaro lt convertible', "year": 2019},
-    {"make": 'chevrolet', "model": 'camaro lt convertible', "year": 2014},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2020},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2019},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2018},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2017},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2016},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro lt coupe 2d', "year": 2014},
-    {"make": 'chevrolet', "model": 'camaro lt w/ manual 6-spd', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro lt1 coupe 2d', "year": 2020},
-    {"make": 'chevrolet', "model": 'camaro rs', "year": 2014},
-    {"make": 'chevrolet', "model": 'camaro rs', "year": 2010},
-    {"make": 'chevrolet', "model": 'camaro ss', "year": 2020},
-    {"make": 'chevrolet', "model": 'camaro ss', "year": 2017},
-    {"make": 'chevrolet', "model": 'camaro ss', "year": 2016},
-    {"make": 'chevrolet', "model": 'camaro ss', "year": 2012},
-    {"make": 'chevrolet', "model": 'camaro ss', "year": 2011},
-    {"make": 'chevrolet', "model": 'camaro ss', "year": 2010},
-    {"make": 'chevrolet', "model": 'camaro ss convertible', "year": 2017},
-    {"make": 'chevrolet', "model": 'camaro ss convertible', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2020},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2019},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2018},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2017},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2016},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2013},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2012},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2011},
-    {"make": 'chevrolet', "model": 'camaro ss coupe 2d', "year": 2010},
-    {"make": 'chevrolet', "model": 'camaro zl1', "year": 2018},
-    {"make": 'chevrolet', "model": 'camaro zl1 convertible', "year": 2013},
-    {"make": 'chevrolet', "model": 'camaro zl1 coupe 2d', "year": 2015},
-    {"make": 'chevrolet', "model": 'camaro zl1 coupe 2d', "year": 2013},
-    {"make": 'chevrolet', "model": 'camaro zl1 super charged v-8 1900 miles!!!', "year": 2018},
-    {"make": 'chevrolet', "model": 'camero', "year": 2015},
-    {"make": 'chevrolet', "model": 'caprice', "year": 2012},
-    {"make": 'chevrolet', "model": 'captiva', "year": 2014},
-    {"make": 'chevrolet', "model": 'captiva', "year": 2013},
-    {"make": 'chevrolet', "model": 'captiva', "year": 2012},
-    {"make": 'chevrolet', "model": 'captiva sport', "year": 2015},
-    {"make": 'chevrolet', "model": 'captiva sport', "year": 2014},
-    {"make": 'chevrolet', "model": 'captiva sport', "year": 2013},
-    {"make": 'chevrolet', "model": 'captiva sport', "year": 2012},
-    {"make": 'chevrolet', "model": 'captiva sport fleet', "year": 2014},
-    {"make": 'chevrolet', "model": 'captiva sport fleet', "year": 2013},
-    {"make": 'chevrolet', "model": 'captiva sport ls', "year": 2014},
-    {"make": 'chevrolet', "model": 'cavalier', "year": 2005},
-    {"make": 'chevrolet', "model": 'cc4500', "year": 2008},
-    {"make": 'chevrolet', "model": 'cc4500', "year": 2007},
-    {"make": 'chevrolet', "model": 'city express', "year": 2015},
-    {"make": 'chevrolet', "model": 'city express cargo van', "year": 2017},
-    {"make": 'chevrolet', "model": 'city express cargo van', "year": 2015},
-    {"make": 'chevrolet', "model": 'classic', "year": 2005},
-    {"make": 'chevrolet', "model": 'cobalt', "year": 2010},
-    {"make": 'chevrolet', "model": 'cobalt', "year": 2009},
-    {"make": 'chevrolet', "model": 'cobalt', "year": 2008},
-    {"make": 'chevrolet', "model": 'cobalt', "year": 2007},
-    {"make": 'chevrolet', "model": 'cobalt', "year": 2006},
-    {"make": 'chevrolet', "model": 'cobalt', "year": 2005},
-    {"make": 'chevrolet', "model": 'cobalt ls', "year": 2009},
-    {"make": 'chevrolet', "model": 'cobalt ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'cobalt ls', "year": 2007},
-    {"make": 'chevrolet', "model": 'cobalt ls', "year": 2006},
-    {"make": 'chevrolet', "model": 'cobalt lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'cobalt lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'cobalt lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'cobalt lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'cobalt lt', "year": 2006},
-    {"make": 'chevrolet', "model": 'colbalt', "year": 2009},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2021},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2020},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2019},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2017},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2015},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2012},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2011},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2010},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2009},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2008},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2007},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2006},
-    {"make": 'chevrolet', "model": 'colorado', "year": 2005},
-    {"make": 'chevrolet', "model": 'colorado 2wd', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado 4wd z71', "year": 2019},
-    {"make": 'chevrolet', "model": 'colorado crew cab', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado crew cab', "year": 2015},
-    {"make": 'chevrolet', "model": 'colorado crew cab 4wd', "year": 2011},
-    {"make": 'chevrolet', "model": 'colorado crew cab lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'colorado crew cab lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado crew cab lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'colorado crew cab lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'colorado crew cab work', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado crew cab z71', "year": 2019},
-    {"make": 'chevrolet', "model": 'colorado crew cab z71', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado crew cab z71', "year": 2017},
-    {"make": 'chevrolet', "model": 'colorado crew cab z71', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado crew cab zr2', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado crew cab zr2', "year": 2017},
-    {"make": 'chevrolet', "model": 'colorado extended cab', "year": 2020},
-    {"make": 'chevrolet', "model": 'colorado extended cab', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado extended cab', "year": 2017},
-    {"make": 'chevrolet', "model": 'colorado extended cab', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'colorado lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'colorado lt 4x4 gas', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado n work truck', "year": 2012},
-    {"make": 'chevrolet', "model": 'colorado rst 4x4 gas', "year": 2020},
-    {"make": 'chevrolet', "model": 'colorado work truck', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado z71', "year": 2018},
-    {"make": 'chevrolet', "model": 'colorado z71', "year": 2016},
-    {"make": 'chevrolet', "model": 'colorado z71', "year": 2015},
-    {"make": 'chevrolet', "model": 'colorado z71 crew cab', "year": 2017},
-    {"make": 'chevrolet', "model": 'colorado zr2', "year": 2018},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2021},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2020},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2019},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2017},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2016},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2015},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2014},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2013},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2012},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2011},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2010},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2009},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2008},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2007},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2006},
-    {"make": 'chevrolet', "model": 'corvette', "year": 2005},
-    {"make": 'chevrolet', "model": 'corvette c6', "year": 2005},
-    {"make": 'chevrolet', "model": 'corvette convertible', "year": 2010},
-    {"make": 'chevrolet', "model": 'corvette convertible', "year": 2007},
-    {"make": 'chevrolet', "model": 'corvette convertible', "year": 2006},
-    {"make": 'chevrolet', "model": 'corvette coupe 2d', "year": 2013},
-    {"make": 'chevrolet', "model": 'corvette coupe 2d', "year": 2012},
-    {"make": 'chevrolet', "model": 'corvette coupe 2d', "year": 2010},
-    {"make": 'chevrolet', "model": 'corvette coupe 2d', "year": 2009},
-    {"make": 'chevrolet', "model": 'corvette grand sport', "year": 2013},
-    {"make": 'chevrolet', "model": 'corvette grand sport', "year": 2012},
-    {"make": 'chevrolet', "model": 'corvette grand sport', "year": 2011},
-    {"make": 'chevrolet', "model": 'corvette grand sport', "year": 2010},
-    {"make": 'chevrolet', "model": 'corvette stingray', "year": 2019},
-    {"make": 'chevrolet', "model": 'corvette stingray', "year": 2016},
-    {"make": 'chevrolet', "model": 'corvette stingray', "year": 2015},
-    {"make": 'chevrolet', "model": 'corvette stingray', "year": 2014},
-    {"make": 'chevrolet', "model": 'corvette stingray z51', "year": 2017},
-    {"make": 'chevrolet', "model": 'corvette stingray z51', "year": 2015},
-    {"make": 'chevrolet', "model": 'corvette stingray z51', "year": 2014},
-    {"make": 'chevrolet', "model": 'corvette z06', "year": 2016},
-    {"make": 'chevrolet', "model": 'corvette z06', "year": 2007},
-    {"make": 'chevrolet', "model": 'corvette z51', "year": 2016},
-    {"make": 'chevrolet', "model": 'corvette zr1', "year": 2010},
-    {"make": 'chevrolet', "model": 'crew cab', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2019},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2018},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2015},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2013},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2012},
-    {"make": 'chevrolet', "model": 'cruze', "year": 2011},
-    {"make": 'chevrolet', "model": 'cruze - new tires - gas saver - great commuter car', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze 1lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze 1lt auto', "year": 2015},
-    {"make": 'chevrolet', "model": 'cruze 1lt auto', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze 2lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'cruze eco', "year": 2012},
-    {"make": 'chevrolet', "model": 'cruze eco', "year": 2011},
-    {"make": 'chevrolet', "model": 'cruze limited', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze limited 1lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze limited 4dr sdn auto lt w/1lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze limited ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze ls', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze ls', "year": 2015},
-    {"make": 'chevrolet', "model": 'cruze ls', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze ls', "year": 2013},
-    {"make": 'chevrolet', "model": 'cruze ls', "year": 2012},
-    {"make": 'chevrolet', "model": 'cruze ls', "year": 2011},
-    {"make": 'chevrolet', "model": 'cruze ls auto', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze ls sedan 4d', "year": 2018},
-    {"make": 'chevrolet', "model": 'cruze ls sedan 4d', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'cruze lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'cruze lt diesel', "year": 2018},
-    {"make": 'chevrolet', "model": 'cruze lt fleet', "year": 2013},
-    {"make": 'chevrolet', "model": 'cruze lt fwd gas sedan', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze lt hatchback', "year": 2019},
-    {"make": 'chevrolet', "model": 'cruze lt hatchback 4d', "year": 2018},
-    {"make": 'chevrolet', "model": 'cruze lt hatchback 4d', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze lt turbo', "year": 2011},
-    {"make": 'chevrolet', "model": 'cruze ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'cruze ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze ltz', "year": 2013},
-    {"make": 'chevrolet', "model": 'cruze ltz', "year": 2012},
-    {"make": 'chevrolet', "model": 'cruze ltz auto', "year": 2014},
-    {"make": 'chevrolet', "model": 'cruze premier', "year": 2017},
-    {"make": 'chevrolet', "model": 'cruze rs', "year": 2014},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2021},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2020},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2019},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2017},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2016},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2015},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2014},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2013},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2012},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2011},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2010},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2009},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2008},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2007},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2006},
-    {"make": 'chevrolet', "model": 'equinox', "year": 2005},
-    {"make": 'chevrolet', "model": 'equinox 1owner 88k ml. new tires well maint&clean carfax!!', "year": 2017},
-    {"make": 'chevrolet', "model": 'equinox 2lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'equinox awd 4dr lt w/1lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2021},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2017},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2016},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2015},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2014},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2013},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2012},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2010},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'equinox ls', "year": 2005},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2006},
-    {"make": 'chevrolet', "model": 'equinox lt', "year": 2005},
-    {"make": 'chevrolet', "model": 'equinox lt 1lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox lt 2lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'equinox lt 2wd', "year": 2017},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2020},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2017},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2016},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2015},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2013},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2012},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2010},
-    {"make": 'chevrolet', "model": 'equinox lt awd', "year": 2008},
-    {"make": 'chevrolet', "model": 'equinox lt awd gas suv', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox lt fwd gas suv', "year": 2019},
-    {"make": 'chevrolet', "model": 'equinox lt fwd gas suv', "year": 2015},
-    {"make": 'chevrolet', "model": 'equinox lt sport', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'equinox ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'equinox ltz', "year": 2013},
-    {"make": 'chevrolet', "model": 'equinox ltz', "year": 2012},
-    {"make": 'chevrolet', "model": 'equinox ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'equinox ltz', "year": 2010},
-    {"make": 'chevrolet', "model": 'equinox ltz awd', "year": 2011},
-    {"make": 'chevrolet', "model": 'equinox ltz awd', "year": 2010},
-    {"make": 'chevrolet', "model": 'equinox premier', "year": 2020},
-    {"make": 'chevrolet', "model": 'equinox premier', "year": 2018},
-    {"make": 'chevrolet', "model": 'equinox premier', "year": 2017},
-    {"make": 'chevrolet', "model": 'express', "year": 2020},
-    {"make": 'chevrolet', "model": 'express', "year": 2019},
-    {"make": 'chevrolet', "model": 'express', "year": 2018},
-    {"make": 'chevrolet', "model": 'express', "year": 2017},
-    {"make": 'chevrolet', "model": 'express', "year": 2016},
-    {"make": 'chevrolet', "model": 'express', "year": 2015},
-    {"make": 'chevrolet', "model": 'express', "year": 2014},
-    {"make": 'chevrolet', "model": 'express', "year": 2013},
-    {"make": 'chevrolet', "model": 'express', "year": 2012},
-    {"make": 'chevrolet', "model": 'express', "year": 2011},
-    {"make": 'chevrolet', "model": 'express', "year": 2010},
-    {"make": 'chevrolet', "model": 'express', "year": 2008},
-    {"make": 'chevrolet', "model": 'express', "year": 2007},
-    {"make": 'chevrolet', "model": 'express', "year": 2006},
-    {"make": 'chevrolet', "model": 'express 1500', "year": 2013},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2020},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2019},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2018},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2017},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2016},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2015},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2014},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2013},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2012},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2011},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2010},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2009},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2007},
-    {"make": 'chevrolet', "model": 'express 2500', "year": 2006},
-    {"make": 'chevrolet', "model": 'express 2500 cargo van', "year": 2019},
-    {"make": 'chevrolet', "model": 'express 2500 cargo van', "year": 2015},
-    {"make": 'chevrolet', "model": 'express 2500 cargo van', "year": 2014},
-    {"make": 'chevrolet', "model": 'express 2500 cargo van', "year": 2011},
-    {"make": 'chevrolet', "model": 'express 2500 v8', "year": 2015},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2017},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2016},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2014},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2011},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2009},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2008},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2007},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2006},
-    {"make": 'chevrolet', "model": 'express 3500', "year": 2005},
-    {"make": 'chevrolet', "model": 'express 3500 kuv', "year": 2012},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2020},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2018},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2014},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2013},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2011},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2007},
-    {"make": 'chevrolet', "model": 'express cargo', "year": 2006},
-    {"make": 'chevrolet', "model": 'express cargo 1500 3dr', "year": 2014},
-    {"make": 'chevrolet', "model": 'express cargo 2500 3dr', "year": 2012},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2020},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2019},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2018},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2017},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2016},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2014},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2013},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2012},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2011},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2010},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2009},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2008},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2007},
-    {"make": 'chevrolet', "model": 'express cargo van', "year": 2006},
-    {"make": 'chevrolet', "model": 'express commercial cutaway', "year": 2016},
-    {"make": 'chevrolet', "model": 'express commercial cutaway', "year": 2015},
-    {"make": 'chevrolet', "model": 'express commercial cutaway', "year": 2013},
-    {"make": 'chevrolet', "model": 'express commercial cutaway', "year": 2012},
-    {"make": 'chevrolet', "model": 'express commercial cutaway', "year": 2008},
-    {"make": 'chevrolet', "model": 'express cutaway', "year": 2012},
-    {"make": 'chevrolet', "model": 'express cutaway', "year": 2010},
-    {"make": 'chevrolet', "model": 'express cutaway 3500', "year": 2015},
-    {"make": 'chevrolet', "model": 'express g1500', "year": 2006},
-    {"make": 'chevrolet', "model": 'express g2500', "year": 2017},
-    {"make": 'chevrolet', "model": 'express g2500', "year": 2016},
-    {"make": 'chevrolet', "model": 'express g3500', "year": 2016},
-    {"make": 'chevrolet', "model": 'express hightop', "year": 2011},
-    {"make": 'chevrolet', "model": 'express passenger', "year": 2019},
-    {"make": 'chevrolet', "model": 'express passenger', "year": 2017},
-    {"make": 'chevrolet', "model": 'express passenger', "year": 2016},
-    {"make": 'chevrolet', "model": 'express passenger', "year": 2015},
-    {"make": 'chevrolet', "model": 'express passenger', "year": 2013},
-    {"make": 'chevrolet', "model": 'express passenger', "year": 2012},
-    {"make": 'chevrolet', "model": 'express passenger-', "year": 2013},
-    {"make": 'chevrolet', "model": 'g4500', "year": 2015},
-    {"make": 'chevrolet', "model": 'girardin', "year": 2009},
-    {"make": 'chevrolet', "model": 'hhr', "year": 2011},
-    {"make": 'chevrolet', "model": 'hhr', "year": 2010},
-    {"make": 'chevrolet', "model": 'hhr', "year": 2009},
-    {"make": 'chevrolet', "model": 'hhr', "year": 2008},
-    {"make": 'chevrolet', "model": 'hhr', "year": 2007},
-    {"make": 'chevrolet', "model": 'hhr', "year": 2006},
-    {"make": 'chevrolet', "model": 'hhr ls', "year": 2011},
-    {"make": 'chevrolet', "model": 'hhr ls', "year": 2009},
-    {"make": 'chevrolet', "model": 'hhr ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'hhr lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'hhr lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'hhr lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'hhr lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'hhr lt', "year": 2006},
-    {"make": 'chevrolet', "model": 'impala', "year": 2020},
-    {"make": 'chevrolet', "model": 'impala', "year": 2019},
-    {"make": 'chevrolet', "model": 'impala', "year": 2018},
-    {"make": 'chevrolet', "model": 'impala', "year": 2017},
-    {"make": 'chevrolet', "model": 'impala', "year": 2016},
-    {"make": 'chevrolet', "model": 'impala', "year": 2015},
-    {"make": 'chevrolet', "model": 'impala', "year": 2014},
-    {"make": 'chevrolet', "model": 'impala', "year": 2013},
-    {"make": 'chevrolet', "model": 'impala', "year": 2012},
-    {"make": 'chevrolet', "model": 'impala', "year": 2011},
-    {"make": 'chevrolet', "model": 'impala', "year": 2010},
-    {"make": 'chevrolet', "model": 'impala', "year": 2009},
-    {"make": 'chevrolet', "model": 'impala', "year": 2008},
-    {"make": 'chevrolet', "model": 'impala', "year": 2007},
-    {"make": 'chevrolet', "model": 'impala', "year": 2006},
-    {"make": 'chevrolet', "model": 'impala', "year": 2005},
-    {"make": 'chevrolet', "model": 'impala limited', "year": 2015},
-    {"make": 'chevrolet', "model": 'impala limited', "year": 2014},
-    {"make": 'chevrolet', "model": 'impala limited - new tires - recently smogged -', "year": 2015},
-    {"make": 'chevrolet', "model": 'impala limited ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'impala limited police', "year": 2014},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2018},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2013},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2012},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2011},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2010},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2009},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2007},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2006},
-    {"make": 'chevrolet', "model": 'impala ls', "year": 2005},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2006},
-    {"make": 'chevrolet', "model": 'impala lt', "year": 2005},
-    {"make": 'chevrolet', "model": 'impala lt limited - recently smogged - ac and heat', "year": 2016},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2013},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2012},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2010},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2009},
-    {"make": 'chevrolet', "model": 'impala ltz', "year": 2008},
-    {"make": 'chevrolet', "model": 'impala ltz sedan 4d', "year": 2015},
-    {"make": 'chevrolet', "model": 'impala police', "year": 2012},
-    {"make": 'chevrolet', "model": 'impala premier', "year": 2019},
-    {"make": 'chevrolet', "model": 'impala premier', "year": 2018},
-    {"make": 'chevrolet', "model": 'impala premier sedan', "year": 2020},
-    {"make": 'chevrolet', "model": 'impala ss', "year": 2009},
-    {"make": 'chevrolet', "model": 'impala ss', "year": 2008},
-    {"make": 'chevrolet', "model": 'impala ss', "year": 2006},
-    {"make": 'chevrolet', "model": 'lifted silverado 1500', "year": 2020},
-    {"make": 'chevrolet', "model": 'lifted silverado 2500', "year": 2021},
-    {"make": 'chevrolet', "model": 'lifted silverado 2500', "year": 2019},
-    {"make": 'chevrolet', "model": 'lifted silverado 2500', "year": 2018},
-    {"make": 'chevrolet', "model": 'lifted silverado 3500', "year": 2019},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2021},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2020},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2019},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2018},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2017},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2015},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2014},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2013},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2012},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2011},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2009},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2008},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2007},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2006},
-    {"make": 'chevrolet', "model": 'malibu', "year": 2005},
-    {"make": 'chevrolet', "model": 'malibu eco', "year": 2013},
-    {"make": 'chevrolet', "model": 'malibu hybrid sedan 4d', "year": 2018},
-    {"make": 'chevrolet', "model": 'malibu limited', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu limited ls', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu limited lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu limited ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2020},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2019},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2017},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2015},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2014},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2013},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2012},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2011},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'malibu ls', "year": 2007},
-    {"make": 'chevrolet', "model": 'malibu ls 1fl', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu ls sedan 4d', "year": 2013},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'malibu lt', "year": 2006},
-    {"make": 'chevrolet', "model": 'malibu lt 1lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu lt 4dr sedan w', "year": 2008},
-    {"make": 'chevrolet', "model": 'malibu lt sedan 4d', "year": 2020},
-    {"make": 'chevrolet', "model": 'malibu lt w/ turbo, navigation', "year": 2016},
-    {"make": 'chevrolet', "model": 'malibu ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'malibu ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'malibu ltz', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu ltz', "year": 2009},
-    {"make": 'chevrolet', "model": 'malibu ltz - sunroof - leather and heated seats -', "year": 2010},
-    {"make": 'chevrolet', "model": 'malibu ltzsedan', "year": 2011},
-    {"make": 'chevrolet', "model": 'malibu maxx', "year": 2005},
-    {"make": 'chevrolet', "model": 'malibu rs', "year": 2020},
-    {"make": 'chevrolet', "model": 'monte carlo', "year": 2007},
-    {"make": 'chevrolet', "model": 'monte carlo', "year": 2006},
-    {"make": 'chevrolet', "model": 'monte carlo ss', "year": 2006},
-    {"make": 'chevrolet', "model": 'silver ltz 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverad0 1500', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2021},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado (classic) 1500 crew cab', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2021},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado 1500', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 1500 2lt crew cab long box 4wd', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 4wd', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 4wd', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 4wd', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 4wd cre', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 4wd double cab 143.5" lt w/1lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 4x4', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 1500 4x4', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 1500 4x4', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 1500 classic', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 1500 crew cab', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado 1500 crewcab', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 1500 custom', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 custom', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 custom trail boss w/ 4wd, z71 off road', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 double', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 double cab', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 double cab', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 extended cab', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 extended cab', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 hybrid', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 1500 ld', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 ls', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 ls', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4wd', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4wd', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4wd', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt 4x4', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt crew 1owner 5.3l 4x4 canopy**new bfg t/a ko2**', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt crew cab 4wd', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt ext cab lifted', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt z71', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt z71', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt z71', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt z71', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt z71', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 lt z71', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz 4x4', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz 4x4', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz 4x4', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz 4x4', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz crew cab 4wd', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz ext. cab 4wd', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz lifted crew 4wd', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz redline crew cab 6.2 liter', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz z71', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 ltz z71', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 1500 regular', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500 rst', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 1500 rst', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 rst 4x4', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 trail', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 work', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 1500 work tr', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 1500 work truck', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 1500 wt', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 1500 z-71 ltz', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 1500 z71', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 2500', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 2500 4wd', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500 6.0l 1-owner 4x4 crew*new wheels* clean car-fax!!!', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500 crew cab lt 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500 diesel 4x4 6.6l lmm duramax turbo diesel crew cab long bed allison 1000 ltz', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 2500 diesel 4x4 6.6l lmm duramax turbo diesel crew cab ltz allison 1000 automatic 6" lifted one owner', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew cab', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew cab', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew cab', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd crew cab', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd extended cab', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 2500 hd ltz', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 2500 heavy d', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 2500 high country lifted diesel 4x4 loaded', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500 high ct', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500 lifted highcountry 6.6l', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500 lt 4x4', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz crew cab 6.6 duramax', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz lifted crew 4wd', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 2500 ltz lifted duramax 6.6 liter', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2010},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado 2500hd', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 2500hd 2wd ext cab 157.5" ltz', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 2500hd 4x4', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 2500hd 4x4', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500hd 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500hd 4x4', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500hd 4x4 ex-cab short box', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500hd built', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500hd classic', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 2500hd flatbed', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500hd heavy', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500hd high', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500hd lbz', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado 2500hd lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 2500hd lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 2500hd lt', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 2500hd ltz', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 2500hd ltz', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 2500hd ltz', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 2500hd ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 2500hd work', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 2500hd work', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 2500hd work', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 2500hd work', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2006},
-    {"make": 'chevrolet', "model": 'silverado 3500', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 3500 classic', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 3500 crew cab w/t utility bed drw 4x4', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 3500 diesel 4x4 6.6l duramax turbo diesel single rear wheel allison automatic', "year": 2005},
-    {"make": 'chevrolet', "model": 'silverado 3500 hd', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 3500 hd extended cab', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 3500 hd high', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 3500 high country diesel lifted fully optioned 4x4', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 3500 high country drw', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 3500 high country drw 4wd 6.6l duramax', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 3500 high country lifted diesel 4x4 loaded', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 3500 high ct', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 3500 ltz', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 3500 ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 3500 ltz drw leveled', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 3500 ltz lifted longbed diesel', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 3500 ltz z71 lifted diesel fully loaded only 34k miles', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2021},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2009},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado 3500hd', "year": 2007},
-    {"make": 'chevrolet', "model": 'silverado 3500hd 4x4', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado 3500hd 4x4', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado 3500hd built after aug 14', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 3500hd cc', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 3500hd lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado 3500hd lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 3500hd ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 3500hd ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 3500hd ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'silverado 3500hd wt', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado 4x4', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado 4x4', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado 6500hd', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado ambulance', "year": 2012},
-    {"make": 'chevrolet', "model": 'silverado crew cab', "year": 2008},
-    {"make": 'chevrolet', "model": 'silverado diesel 3500', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado diesels 3500', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado duramax hd', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado duramax hd', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado durmax 3500', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado hd', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado high country', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado ld', "year": 2019},
-    {"make": 'chevrolet', "model": 'silverado lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado lt 1500', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado lt crew cab', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado lt crew cab', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado lt z71', "year": 2017},
-    {"make": 'chevrolet', "model": 'silverado lt z71', "year": 2016},
-    {"make": 'chevrolet', "model": 'silverado lt z71', "year": 2014},
-    {"make": 'chevrolet', "model": 'silverado lt z71 2500', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado ltz', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado ltz', "year": 2013},
-    {"make": 'chevrolet', "model": 'silverado ltz 1500', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado ltz 4x4', "year": 2018},
-    {"make": 'chevrolet', "model": 'silverado ltz z71', "year": 2015},
-    {"make": 'chevrolet', "model": 'silverado medium duty', "year": 2020},
-    {"make": 'chevrolet', "model": 'silverado trail boss', "year": 2019},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2020},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2019},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2018},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2017},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2016},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2015},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2014},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2013},
-    {"make": 'chevrolet', "model": 'sonic', "year": 2012},
-    {"make": 'chevrolet', "model": 'sonic ls', "year": 2012},
-    {"make": 'chevrolet', "model": 'sonic ls sedan 4d', "year": 2019},
-    {"make": 'chevrolet', "model": 'sonic lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'sonic lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'sonic lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'sonic lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'sonic lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'sonic lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'sonic lt auto', "year": 2013},
-    {"make": 'chevrolet', "model": 'sonic lt auto 5-door', "year": 2014},
-    {"make": 'chevrolet', "model": 'sonic lt sedan 4d', "year": 2013},
-    {"make": 'chevrolet', "model": 'sonic lt turbo', "year": 2013},
-    {"make": 'chevrolet', "model": 'sonic ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'sonic ltz', "year": 2012},
-    {"make": 'chevrolet', "model": 'spark', "year": 2020},
-    {"make": 'chevrolet', "model": 'spark', "year": 2019},
-    {"make": 'chevrolet', "model": 'spark', "year": 2018},
-    {"make": 'chevrolet', "model": 'spark', "year": 2017},
-    {"make": 'chevrolet', "model": 'spark', "year": 2016},
-    {"make": 'chevrolet', "model": 'spark', "year": 2015},
-    {"make": 'chevrolet', "model": 'spark', "year": 2014},
-    {"make": 'chevrolet', "model": 'spark', "year": 2013},
-    {"make": 'chevrolet', "model": 'spark 1lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'spark activ hatchback', "year": 2020},
-    {"make": 'chevrolet', "model": 'spark activ hatchback', "year": 2019},
-    {"make": 'chevrolet', "model": 'spark ev 1lt hatchback', "year": 2016},
-    {"make": 'chevrolet', "model": 'spark ev 1lt hatchback', "year": 2015},
-    {"make": 'chevrolet', "model": 'spark ev 2lt hatchback', "year": 2016},
-    {"make": 'chevrolet', "model": 'spark ev 2lt hatchback', "year": 2015},
-    {"make": 'chevrolet', "model": 'spark ev 2lt hatchback', "year": 2014},
-    {"make": 'chevrolet', "model": 'spark ls', "year": 2019},
-    {"make": 'chevrolet', "model": 'spark ls', "year": 2016},
-    {"make": 'chevrolet', "model": 'spark ls', "year": 2014},
-    {"make": 'chevrolet', "model": 'spark ls', "year": 2013},
-    {"make": 'chevrolet', "model": 'spark lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'ss', "year": 2015},
-    {"make": 'chevrolet', "model": 'ss impala', "year": 2008},
-    {"make": 'chevrolet', "model": 'ss sedan 4d', "year": 2015},
-    {"make": 'chevrolet', "model": 'ssr', "year": 2005},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2021},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2020},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2019},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2018},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2017},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2016},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2015},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2014},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2013},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2012},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2011},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2010},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2009},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2008},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2007},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2006},
-    {"make": 'chevrolet', "model": 'suburban', "year": 2005},
-    {"make": 'chevrolet', "model": 'suburban 1500', "year": 2012},
-    {"make": 'chevrolet', "model": 'suburban 1500', "year": 2011},
-    {"make": 'chevrolet', "model": 'suburban 1500', "year": 2008},
-    {"make": 'chevrolet', "model": 'suburban 1500', "year": 2007},
-    {"make": 'chevrolet', "model": 'suburban 1500', "year": 2005},
-    {"make": 'chevrolet', "model": 'suburban 1500 4x4', "year": 2005},
-    {"make": 'chevrolet', "model": 'suburban 1500 ls 4wd v', "year": 2012},
-    {"make": 'chevrolet', "model": 'suburban 1500 ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'suburban lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'suburban lt 1500', "year": 2012},
-    {"make": 'chevrolet', "model": 'suburban lt 1500', "year": 2007},
-    {"make": 'chevrolet', "model": 'suburban lt 4x4', "year": 2015},
-    {"make": 'chevrolet', "model": 'suburban ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'suburban ltz', "year": 2012},
-    {"make": 'chevrolet', "model": 'suburban ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'suburban ltz', "year": 2008},
-    {"make": 'chevrolet', "model": 'suburban ltz', "year": 2007},
-    {"make": 'chevrolet', "model": 'suburban ltz 4wd', "year": 2011},
-    {"make": 'chevrolet', "model": 'suburban ltz 4x4', "year": 2007},
-    {"make": 'chevrolet', "model": 'suburban premier', "year": 2020},
-    {"make": 'chevrolet', "model": 'suburban premier 4x4', "year": 2017},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2020},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2019},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2018},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2017},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2016},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2015},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2014},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2013},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2012},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2011},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2010},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2009},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2008},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2007},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2006},
-    {"make": 'chevrolet', "model": 'tahoe', "year": 2005},
-    {"make": 'chevrolet', "model": 'tahoe 1500 ltz 4x4 gas', "year": 2012},
-    {"make": 'chevrolet', "model": 'tahoe commercial', "year": 2009},
-    {"make": 'chevrolet', "model": 'tahoe ls', "year": 2007},
-    {"make": 'chevrolet', "model": 'tahoe ls', "year": 2005},
-    {"make": 'chevrolet', "model": 'tahoe ls 4x4 gas suv', "year": 2019},
-    {"make": 'chevrolet', "model": 'tahoe ls sport utility', "year": 2018},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'tahoe lt', "year": 2005},
-    {"make": 'chevrolet', "model": 'tahoe lt 4wd', "year": 2015},
-    {"make": 'chevrolet', "model": 'tahoe lt sport utility', "year": 2020},
-    {"make": 'chevrolet', "model": 'tahoe lt sport utility', "year": 2019},
-    {"make": 'chevrolet', "model": 'tahoe lt sport utility', "year": 2017},
-    {"make": 'chevrolet', "model": 'tahoe lt sport utility', "year": 2015},
-    {"make": 'chevrolet', "model": 'tahoe lt w/2lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'tahoe lt z71', "year": 2015},
-    {"make": 'chevrolet', "model": 'tahoe lt z71', "year": 2013},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2015},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2012},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2011},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2010},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2009},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2008},
-    {"make": 'chevrolet', "model": 'tahoe ltz', "year": 2007},
-    {"make": 'chevrolet', "model": 'tahoe ltz 4x4', "year": 2010},
-    {"make": 'chevrolet', "model": 'tahoe police', "year": 2014},
-    {"make": 'chevrolet', "model": 'tahoe police', "year": 2011},
-    {"make": 'chevrolet', "model": 'tahoe premier', "year": 2020},
-    {"make": 'chevrolet', "model": 'tahoe premier 4x4 gas', "year": 2018},
-    {"make": 'chevrolet', "model": 'tahoe premier 4x4 gas', "year": 2017},
-    {"make": 'chevrolet', "model": 'tahoe rst 4x4 gas suv', "year": 2019},
-    {"make": 'chevrolet', "model": 'tahoe z71', "year": 2005},
-    {"make": 'chevrolet', "model": 'trailblazer', "year": 2021},
-    {"make": 'chevrolet', "model": 'trailblazer', "year": 2009},
-    {"make": 'chevrolet', "model": 'trailblazer', "year": 2008},
-    {"make": 'chevrolet', "model": 'trailblazer', "year": 2007},
-    {"make": 'chevrolet', "model": 'trailblazer', "year": 2006},
-    {"make": 'chevrolet', "model": 'trailblazer', "year": 2005},
-    {"make": 'chevrolet', "model": 'trailblazer 4x4', "year": 2007},
-    {"make": 'chevrolet', "model": 'trailblazer ext', "year": 2006},
-    {"make": 'chevrolet', "model": 'trailblazer ls', "year": 2021},
-    {"make": 'chevrolet', "model": 'trailblazer ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'trailblazer ls', "year": 2007},
-    {"make": 'chevrolet', "model": 'trailblazer ls', "year": 2006},
-    {"make": 'chevrolet', "model": 'trailblazer ls', "year": 2005},
-    {"make": 'chevrolet', "model": 'trailblazer ls 4x4', "year": 2007},
-    {"make": 'chevrolet', "model": 'trailblazer lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'trailblazer lt', "year": 2007},
-    {"make": 'chevrolet', "model": 'trailblazer lt', "year": 2005},
-    {"make": 'chevrolet', "model": 'trailblazer lt 4x4', "year": 2008},
-    {"make": 'chevrolet', "model": 'trailblazer lt w/1lt', "year": 2008},
-    {"make": 'chevrolet', "model": 'trailblazer rs', "year": 2021},
-    {"make": 'chevrolet', "model": 'trailblazer ss', "year": 2006},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2020},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2019},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2018},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2017},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2016},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2015},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2014},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2013},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2012},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2011},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2010},
-    {"make": 'chevrolet', "model": 'traverse', "year": 2009},
-    {"make": 'chevrolet', "model": 'traverse ls', "year": 2015},
-    {"make": 'chevrolet', "model": 'traverse ls', "year": 2014},
-    {"make": 'chevrolet', "model": 'traverse ls', "year": 2012},
-    {"make": 'chevrolet', "model": 'traverse ls sport', "year": 2019},
-    {"make": 'chevrolet', "model": 'traverse ls w/ 3rd row seating', "year": 2014},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2014},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2013},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2012},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2011},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2010},
-    {"make": 'chevrolet', "model": 'traverse lt', "year": 2009},
-    {"make": 'chevrolet', "model": 'traverse lt - rear camera - bluetooth - third row', "year": 2015},
-    {"make": 'chevrolet', "model": 'traverse lt awd', "year": 2018},
-    {"make": 'chevrolet', "model": 'traverse lt awd', "year": 2014},
-    {"make": 'chevrolet', "model": 'traverse lt awd', "year": 2013},
-    {"make": 'chevrolet', "model": 'traverse lt awd', "year": 2011},
-    {"make": 'chevrolet', "model": 'traverse lt awd', "year": 2010},
-    {"make": 'chevrolet', "model": 'traverse lt leather', "year": 2020},
-    {"make": 'chevrolet', "model": 'traverse lt sport', "year": 2020},
-    {"make": 'chevrolet', "model": 'traverse ltz', "year": 2016},
-    {"make": 'chevrolet', "model": 'traverse ltz', "year": 2014},
-    {"make": 'chevrolet', "model": 'traverse ltz', "year": 2009},
-    {"make": 'chevrolet', "model": 'traverse ltz awd', "year": 2011},
-    {"make": 'chevrolet', "model": 'traverse premier', "year": 2019},
-    {"make": 'chevrolet', "model": 'traverse premier', "year": 2018},
-    {"make": 'chevrolet', "model": 'traverse premier awd', "year": 2018},
-    {"make": 'chevrolet', "model": 'trax', "year": 2021},
-    {"make": 'chevrolet', "model": 'trax', "year": 2020},
-    {"make": 'chevrolet', "model": 'trax', "year": 2019},
-    {"make": 'chevrolet', "model": 'trax', "year": 2018},
-    {"make": 'chevrolet', "model": 'trax', "year": 2017},
-    {"make": 'chevrolet', "model": 'trax', "year": 2016},
-    {"make": 'chevrolet', "model": 'trax', "year": 2015},
-    {"make": 'chevrolet', "model": 'trax ls', "year": 2021},
-    {"make": 'chevrolet', "model": 'trax ls', "year": 2020},
-    {"make": 'chevrolet', "model": 'trax ls', "year": 2019},
-    {"make": 'chevrolet', "model": 'trax ls', "year": 2017},
-    {"make": 'chevrolet', "model": 'trax ls sport utility', "year": 2020},
-    {"make": 'chevrolet', "model": 'trax ls sport utility', "year": 2019},
-    {"make": 'chevrolet', "model": 'trax ls sport utility', "year": 2018},
-    {"make": 'chevrolet', "model": 'trax ls sport utility', "year": 2017},
-    {"make": 'chevrolet', "model": 'trax lt', "year": 2020},
-    {"make": 'chevrolet', "model": 'trax lt', "year": 2019},
-    {"make": 'chevrolet', "model": 'trax lt', "year": 2018},
-    {"make": 'chevrolet', "model": 'trax lt', "year": 2017},
-    {"make": 'chevrolet', "model": 'trax lt', "year": 2016},
-    {"make": 'chevrolet', "model": 'trax lt', "year": 2015},
-    {"make": 'chevrolet', "model": 'trax lt sport utility', "year": 2020},
-    {"make": 'chevrolet', "model": 'trax lt sport utility', "year": 2019},
-    {"make": 'chevrolet', "model": 'trax lt sport utility', "year": 2018},
-    {"make": 'chevrolet', "model": 'trax lt sport utility', "year": 2017},
-    {"make": 'chevrolet', "model": 'trax lt sport utility', "year": 2016},
-    {"make": 'chevrolet', "model": 'trax ltz sport utility', "year": 2016},
-    {"make": 'chevrolet', "model": 'trax ltz sport utility', "year": 2015},
-    {"make": 'chevrolet', "model": 'trax turbo', "year": 2017},
-    {"make": 'chevrolet', "model": 'uplander', "year": 2008},
-    {"make": 'chevrolet', "model": 'uplander', "year": 2007},
-    {"make": 'chevrolet', "model": 'uplander', "year": 2006},
-    {"make": 'chevrolet', "model": 'uplander', "year": 2005},
-    {"make": 'chevrolet', "model": 'uplander cargo', "year": 2008},
-    {"make": 'chevrolet', "model": 'uplander ls', "year": 2008},
-    {"make": 'chevrolet', "model": 'volt', "year": 2018},
-    {"make": 'chevrolet', "model": 'volt', "year": 2017},
-    {"make": 'chevrolet', "model": 'volt', "year": 2016},
-    {"make": 'chevrolet', "model": 'volt', "year": 2015},
-    {"make": 'chevrolet', "model": 'volt', "year": 2014},
-    {"make": 'chevrolet', "model": 'volt', "year": 2013},
-    {"make": 'chevrolet', "model": 'volt', "year": 2012},
-    {"make": 'chevrolet', "model": 'volt', "year": 2011},
-    {"make": 'chevrolet', "model": 'volt lt hatchback 4d', "year": 2017},
-    {"make": 'chevrolet', "model": 'volt lt sedan 4d', "year": 2018},
-    {"make": 'chevrolet', "model": 'volt premier hatchback', "year": 2017},
-    {"make": 'chevrolet', "model": 'volt premier sedan 4d', "year": 2018},
-    {"make": 'chevrolet', "model": 'volt premium', "year": 2014},
-    {"make": 'chevrolet', "model": 'volt sedan 4d', "year": 2014},
-    {"make": 'chrysler', "model": '200', "year": 2017},
-    {"make": 'chrysler', "model": '200', "year": 2016},
-    {"make": 'chrysler', "model": '200', "year": 2015},
-    {"make": 'chrysler', "model": '200', "year": 2014},
-    {"make": 'chrysler', "model": '200', "year": 2013},
-    {"make": 'chrysler', "model": '200', "year": 2012},
-    {"make": 'chrysler', "model": '200', "year": 2011},
-    {"make": 'chrysler', "model": '200 200c sedan 4d', "year": 2015},
-    {"make": 'chrysler', "model": '200 200s sedan 4d', "year": 2016},
-    {"make": 'chrysler', "model": '200 200s sedan 4d', "year": 2015},
-    {"make": 'chrysler', "model": '200 c', "year": 2015},
-    {"make": 'chrysler', "model": '200 convertible', "year": 2011},
-    {"make": 'chrysler', "model": '200 limited', "year": 2016},
-    {"make": 'chrysler', "model": '200 limited', "year": 2015},
-    {"make": 'chrysler', "model": '200 limited', "year": 2013},
-    {"make": 'chrysler', "model": '200 limited', "year": 2012},
-    {"make": 'chrysler', "model": '200 limited', "year": 2011},
-    {"make": 'chrysler', "model": '200 limited sedan 4d', "year": 2016},
-    {"make": 'chrysler', "model": '200 limited sedan 4d', "year": 2015},
-    {"make": 'chrysler', "model": '200 lx', "year": 2014},
-    {"make": 'chrysler', "model": '200 lx', "year": 2013},
-    {"make": 'chrysler', "model": '200 s', "year": 2015},
-    {"make": 'chrysler', "model": '200 s', "year": 2013},
-    {"make": 'chrysler', "model": '200 s', "year": 2011},
-    {"make": 'chrysler', "model": '200 s awd gas sedan', "year": 2016},
-    {"make": 'chrysler', "model": '200 touring', "year": 2014},
-    {"make": 'chrysler', "model": '200 touring', "year": 2013},
-    {"make": 'chrysler', "model": '200 touring', "year": 2012},
-    {"make": 'chrysler', "model": '200 touring', "year": 2011},
-    {"make": 'chrysler', "model": '200 touring sedan 4d', "year": 2017},
-    {"make": 'chrysler', "model": '300', "year": 2020},
-    {"make": 'chrysler', "model": '300', "year": 2019},
-    {"make": 'chrysler', "model": '300', "year": 2018},
-    {"make": 'chrysler', "model": '300', "year": 2017},
-    {"make": 'chrysler', "model": '300', "year": 2016},
-    {"make": 'chrysler', "model": '300', "year": 2015},
-    {"make": 'chrysler', "model": '300', "year": 2014},
-    {"make": 'chrysler', "model": '300', "year": 2013},
-    {"make": 'chrysler', "model": '300', "year": 2012},
-    {"make": 'chrysler', "model": '300', "year": 2011},
-    {"make": 'chrysler', "model": '300', "year": 2010},
-    {"make": 'chrysler', "model": '300', "year": 2009},
-    {"make": 'chrysler', "model": '300', "year": 2008},
-    {"make": 'chrysler', "model": '300', "year": 2007},
-    {"make": 'chrysler', "model": '300', "year": 2006},
-    {"make": 'chrysler', "model": '300', "year": 2005},
-    {"make": 'chrysler', "model": '300 300c sedan 4d', "year": 2017},
-    {"make": 'chrysler', "model": '300 300c sedan 4d', "year": 2014},
-    {"make": 'chrysler', "model": '300 300c sedan 4d', "year": 2011},
-    {"make": 'chrysler', "model": '300 300s sedan 4d', "year": 2019},
-    {"make": 'chrysler', "model": '300 300s sedan 4d', "year": 2018},
-    {"make": 'chrysler', "model": '300 300s sedan 4d', "year": 2017},
-    {"make": 'chrysler', "model": '300 300s sedan 4d', "year": 2016},
-    {"make": 'chrysler', "model": '300 limited', "year": 2019},
-    {"make": 'chrysler', "model": '300 limited', "year": 2018},
-    {"make": 'chrysler', "model": '300 limited', "year": 2012},
-    {"make": 'chrysler', "model": '300 limited sedan 4d', "year": 2018},
-    {"make": 'chrysler', "model": '300 limited sedan 4d', "year": 2017},
-    {"make": 'chrysler', "model": '300 s', "year": 2016},
-    {"make": 'chrysler', "model": '300 s awd gas sedan', "year": 2018},
-    {"make": 'chrysler', "model": '300 sedan 4d', "year": 2014},
-    {"make": 'chrysler', "model": '300 touring', "year": 2010},
-    {"make": 'chrysler', "model": '300 touring', "year": 2008},
-    {"make": 'chrysler', "model": '300 touring', "year": 2006},
-    {"make": 'chrysler', "model": '300 touring l sedan 4d', "year": 2019},
-    {"make": 'chrysler', "model": '300 touring l sedan 4d', "year": 2018},
-    {"make": 'chrysler', "model": '300 touring rwd gas', "year": 2019},
-    {"make": 'chrysler', "model": '300 touring sedan 4d', "year": 2019},
-    {"make": 'chrysler', "model": '300 touring sedan 4d', "year": 2018},
-    {"make": 'chrysler', "model": '300-series', "year": 2019},
-    {"make": 'chrysler', "model": '300-series', "year": 2017},
-    {"make": 'chrysler', "model": '300-series', "year": 2014},
-    {"make": 'chrysler', "model": '300-series', "year": 2007},
-    {"make": 'chrysler', "model": '300-series', "year": 2005},
-    {"make": 'chrysler', "model": '300c', "year": 2016},
-    {"make": 'chrysler', "model": '300c', "year": 2014},
-    {"make": 'chrysler', "model": '300c', "year": 2013},
-    {"make": 'chrysler', "model": '300c', "year": 2008},
-    {"make": 'chrysler', "model": '300c', "year": 2007},
-    {"make": 'chrysler', "model": '300c', "year": 2006},
-    {"make": 'chrysler', "model": '300c', "year": 2005},
-    {"make": 'chrysler', "model": '300c awd hemi', "year": 2006},
-    {"make": 'chrysler', "model": '300c hemi', "year": 2006},
-    {"make": 'chrysler', "model": '300c hemi', "year": 2005},
-    {"make": 'chrysler', "model": 'aspen', "year": 2009},
-    {"make": 'chrysler', "model": 'aspen', "year": 2008},
-    {"make": 'chrysler', "model": 'aspen', "year": 2007},
-    {"make": 'chrysler', "model": 'aspen limited', "year": 2008},
-    {"make": 'chrysler', "model": 'crossfire', "year": 2007},
-    {"make": 'chrysler', "model": 'crossfire', "year": 2006},
-    {"make": 'chrysler', "model": 'crossfire', "year": 2005},
-    {"make": 'chrysler', "model": 'crossfire limited', "year": 2005},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2020},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2019},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2018},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2017},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2008},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2007},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2006},
-    {"make": 'chrysler', "model": 'pacifica', "year": 2005},
-    {"make": 'chrysler', "model": 'pacifica hybrid', "year": 2021},
-    {"make": 'chrysler', "model": 'pacifica hybrid limited', "year": 2018},
-    {"make": 'chrysler', "model": 'pacifica hybrid tourin', "year": 2018},
-    {"make": 'chrysler', "model": 'pacifica limited', "year": 2019},
-    {"make": 'chrysler', "model": 'pacifica limited', "year": 2007},
-    {"make": 'chrysler', "model": 'pacifica touring', "year": 2017},
-    {"make": 'chrysler', "model": 'pacifica touring', "year": 2005},
-    {"make": 'chrysler', "model": 'pacifica touring l', "year": 2020},
-    {"make": 'chrysler', "model": 'pacifica touring l', "year": 2017},
-    {"make": 'chrysler', "model": 'pacifica touring plus', "year": 2018},
-    {"make": 'chrysler', "model": 'pacifica touring-l', "year": 2017},
-    {"make": 'chrysler', "model": 'pacifica touring-l plus', "year": 2017},
-    {"make": 'chrysler', "model": 'pt cruiser', "year": 2010},
-    {"make": 'chrysler', "model": 'pt cruiser', "year": 2009},
-    {"make": 'chrysler', "model": 'pt cruiser', "year": 2008},
-    {"make": 'chrysler', "model": 'pt cruiser', "year": 2007},
-    {"make": 'chrysler', "model": 'pt cruiser', "year": 2006},
-    {"make": 'chrysler', "model": 'pt cruiser', "year": 2005},
-    {"make": 'chrysler', "model": 'pt cruiser convertible', "year": 2005},
-    {"make": 'chrysler', "model": 'pt cruiser limited', "year": 2006},
-    {"make": 'chrysler', "model": 'pt cruiser touring', "year": 2008},
-    {"make": 'chrysler', "model": 'pt cruiser touring', "year": 2007},
-    {"make": 'chrysler', "model": 'pt cruiser touring', "year": 2006},
-    {"make": 'chrysler', "model": 'sebring', "year": 2010},
-    {"make": 'chrysler', "model": 'sebring', "year": 2009},
-    {"make": 'chrysler', "model": 'sebring', "year": 2008},
-    {"make": 'chrysler', "model": 'sebring', "year": 2007},
-    {"make": 'chrysler', "model": 'sebring', "year": 2006},
-    {"make": 'chrysler', "model": 'sebring', "year": 2005},
-    {"make": 'chrysler', "model": 'sebring convertible', "year": 2008},
-    {"make": 'chrysler', "model": 'sebring convertible', "year": 2006},
-    {"make": 'chrysler', "model": 'sebring convertible', "year": 2005},
-    {"make": 'chrysler', "model": 'sebring limited', "year": 2010},
-    {"make": 'chrysler', "model": 'sebring touring', "year": 2010},
-    {"make": 'chrysler', "model": 'sebring touring', "year": 2008},
-    {"make": 'chrysler', "model": 'town & country', "year": 2016},
-    {"make": 'chrysler', "model": 'town & country', "year": 2015},
-    {"make": 'chrysler', "model": 'town & country', "year": 2014},
-    {"make": 'chrysler', "model": 'town & country', "year": 2013},
-    {"make": 'chrysler', "model": 'town & country', "year": 2012},
-    {"make": 'chrysler', "model": 'town & country', "year": 2011},
-    {"make": 'chrysler', "model": 'town & country', "year": 2010},
-    {"make": 'chrysler', "model": 'town & country', "year": 2009},
-    {"make": 'chrysler', "model": 'town & country', "year": 2008},
-    {"make": 'chrysler', "model": 'town & country', "year": 2007},
-    {"make": 'chrysler', "model": 'town & country', "year": 2006},
-    {"make": 'chrysler', "model": 'town & country', "year": 2005},
-    {"make": 'chrysler', "model": 'town & country lwb', "year": 2006},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2016},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2015},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2014},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2013},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2012},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2011},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2010},
-    {"make": 'chrysler', "model": 'town & country touring', "year": 2008},
-    {"make": 'chrysler', "model": 'town and country', "year": 2016},
-    {"make": 'chrysler', "model": 'town and country', "year": 2015},
-    {"make": 'chrysler', "model": 'town and country', "year": 2014},
-    {"make": 'chrysler', "model": 'town and country', "year": 2013},
-    {"make": 'chrysler', "model": 'town and country', "year": 2012},
-    {"make": 'chrysler', "model": 'town and country', "year": 2011},
-    {"make": 'chrysler', "model": 'town and country', "year": 2010},
-    {"make": 'chrysler', "model": 'town and country', "year": 2009},
-    {"make": 'chrysler', "model": 'town and country', "year": 2008},
-    {"make": 'chrysler', "model": 'town and country', "year": 2007},
-    {"make": 'chrysler', "model": 'town and country', "year": 2006},
-    {"make": 'chrysler', "model": 'town and country', "year": 2005},
-    {"make": 'chrysler', "model": 'town and country tourin', "year": 2015},
-    {"make": 'chrysler', "model": 'town and country tourin', "year": 2013},
-    {"make": 'chrysler', "model": 'town and country touring', "year": 2009},
-    {"make": 'chrysler', "model": 'town country', "year": 2016},
-    {"make": 'chrysler', "model": 'town country', "year": 2015},
-    {"make": 'chrysler', "model": 'town country', "year": 2014},
-    {"make": 'chrysler', "model": 'town country', "year": 2013},
-    {"make": 'chrysler', "model": 'town country', "year": 2012},
-    {"make": 'chrysler', "model": 'town country', "year": 2010},
-    {"make": 'chrysler', "model": 'town country', "year": 2009},
-    {"make": 'chrysler', "model": 'town country', "year": 2008},
-    {"make": 'chrysler', "model": 'town country lwb', "year": 2006},
-    {"make": 'chrysler', "model": 'vmi ♿', "year": 2006},
-    {"make": 'chrysler', "model": 'voyager lxi minivan 4d', "year": 2020},
-    {"make": 'dodge', "model": '2500', "year": 2012},
-    {"make": 'dodge', "model": 'avenger', "year": 2014},
-    {"make": 'dodge', "model": 'avenger', "year": 2013},
-    {"make": 'dodge', "model": 'avenger', "year": 2012},
-    {"make": 'dodge', "model": 'avenger', "year": 2011},
-    {"make": 'dodge', "model": 'avenger', "year": 2010},
-    {"make": 'dodge', "model": 'avenger', "year": 2009},
-    {"make": 'dodge', "model": 'avenger', "year": 2008},
-    {"make": 'dodge', "model": 'avenger 4dr sdn se', "year": 2014},
-    {"make": 'dodge', "model": 'avenger r/t', "year": 2013},
-    {"make": 'dodge', "model": 'avenger r/t', "year": 2010},
-    {"make": 'dodge', "model": 'avenger se', "year": 2014},
-    {"make": 'dodge', "model": 'avenger se', "year": 2013},
-    {"make": 'dodge', "model": 'avenger se', "year": 2012},
-    {"make": 'dodge', "model": 'avenger se 4dr sedan', "year": 2013},
-    {"make": 'dodge', "model": 'avenger sxt', "year": 2014},
-    {"make": 'dodge', "model": 'avenger sxt', "year": 2013},
-    {"make": 'dodge', "model": 'avenger sxt', "year": 2012},
-    {"make": 'dodge', "model": 'avenger sxt', "year": 2010},
-    {"make": 'dodge', "model": 'caliber', "year": 2011},
-    {"make": 'dodge', "model": 'caliber', "year": 2010},
-    {"make": 'dodge', "model": 'caliber', "year": 2009},
-    {"make": 'dodge', "model": 'caliber', "year": 2008},
-    {"make": 'dodge', "model": 'caliber', "year": 2007},
-    {"make": 'dodge', "model": 'caliber express 5 spd', "year": 2011},
-    {"make": 'dodge', "model": 'caliber r/t', "year": 2007},
-    {"make": 'dodge', "model": 'caliber sxt', "year": 2012},
-    {"make": 'dodge', "model": 'caliber sxt', "year": 2010},
-    {"make": 'dodge', "model": 'caliber sxt', "year": 2009},
-    {"make": 'dodge', "model": 'caliber sxt', "year": 2008},
-    {"make": 'dodge', "model": 'caliber sxt', "year": 2007},
-    {"make": 'dodge', "model": 'caravan', "year": 2010},
-    {"make": 'dodge', "model": 'caravan', "year": 2008},
-    {"make": 'dodge', "model": 'caravan', "year": 2007},
-    {"make": 'dodge', "model": 'caravan', "year": 2006},
-    {"make": 'dodge', "model": 'caravan', "year": 2005},
-    {"make": 'dodge', "model": 'caravan se', "year": 2007},
-    {"make": 'dodge', "model": 'caravan sxt passenger', "year": 2007},
-    {"make": 'dodge', "model": 'caravan/grand caravan', "year": 2008},
-    {"make": 'dodge', "model": 'caravan/grand caravan', "year": 2007},
-    {"make": 'dodge', "model": 'caravan/grand caravan', "year": 2006},
-    {"make": 'dodge', "model": 'challenger', "year": 2020},
-    {"make": 'dodge', "model": 'challenger', "year": 2019},
-    {"make": 'dodge', "model": 'challenger', "year": 2018},
-    {"make": 'dodge', "model": 'challenger', "year": 2017},
-    {"make": 'dodge', "model": 'challenger', "year": 2016},
-    {"make": 'dodge', "model": 'challenger', "year": 2015},
-    {"make": 'dodge', "model": 'challenger', "year": 2014},
-    {"make": 'dodge', "model": 'challenger', "year": 2013},
-    {"make": 'dodge', "model": 'challenger', "year": 2012},
-    {"make": 'dodge', "model": 'challenger', "year": 2011},
-    {"make": 'dodge', "model": 'challenger', "year": 2010},
-    {"make": 'dodge', "model": 'challenger', "year": 2009},
-    {"make": 'dodge', "model": 'challenger', "year": 2008},
-    {"make": 'dodge', "model": 'challenger gt coupe 2d', "year": 2020},
-    {"make": 'dodge', "model": 'challenger gt coupe 2d', "year": 2019},
-    {"make": 'dodge', "model": 'challenger gt coupe 2d', "year": 2018},
-    {"make": 'dodge', "model": 'challenger r/t', "year": 2019},
-    {"make": 'dodge', "model": 'challenger r/t', "year": 2014},
-    {"make": 'dodge', "model": 'challenger r/t', "year": 2013},
-    {"make": 'dodge', "model": 'challenger r/t', "year": 2012},
-    {"make": 'dodge', "model": 'challenger r/t', "year": 2010},
-    {"make": 'dodge', "model": 'challenger r/t', "year": 2009},
-    {"make": 'dodge', "model": 'challenger r/t classic', "year": 2014},
-    {"make": 'dodge', "model": 'challenger r/t coupe 2d', "year": 2020},
-    {"make": 'dodge', "model": 'challenger r/t coupe 2d', "year": 2019},
-    {"make": 'dodge', "model": 'challenger r/t coupe 2d', "year": 2017},
-    {"make": 'dodge', "model": 'challenger r/t coupe 2d', "year": 2016},
-    {"make": 'dodge', "model": 'challenger r/t coupe 2d', "year": 2012},
-    {"make": 'dodge', "model": 'challenger r/t plus shaker', "year": 2016},
-    {"make": 'dodge', "model": 'challenger r/t scat pack', "year": 2020},
-    {"make": 'dodge', "model": 'challenger r/t scat pack', "year": 2019},
-    {"make": 'dodge', "model": 'challenger r/t scat pack', "year": 2018},
-    {"make": 'dodge', "model": 'challenger r/t scat pack', "year": 2017},
-    {"make": 'dodge', "model": 'challenger r/t scat pack', "year": 2016},
-    {"make": 'dodge', "model": 'challenger r/t shaker', "year": 2017},
-    {"make": 'dodge', "model": 'challenger r/t shaker', "year": 2016},
-    {"make": 'dodge', "model": 'challenger scat pack', "year": 2018},
-    {"make": 'dodge', "model": 'challenger se', "year": 2010},
-    {"make": 'dodge', "model": 'challenger se', "year": 2009},
-    {"make": 'dodge', "model": 'challenger srt 392 coupe', "year": 2016},
-    {"make": 'dodge', "model": 'challenger srt 392 coupe', "year": 2015},
-    {"make": 'dodge', "model": 'challenger srt hellcat', "year": 2017},
-    {"make": 'dodge', "model": 'challenger srt hellcat', "year": 2016},
-    {"make": 'dodge', "model": 'challenger srt hellcat only 6505 miles moon roof hk sound bad', "year": 2018},
-    {"make": 'dodge', "model": 'challenger srt8', "year": 2012},
-    {"make": 'dodge', "model": 'challenger srt8', "year": 2010},
-    {"make": 'dodge', "model": 'challenger srt8', "year": 2008},
-    {"make": 'dodge', "model": 'challenger srt8 coupe 2d', "year": 2011},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2019},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2018},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2017},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2016},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2015},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2013},
-    {"make": 'dodge', "model": 'challenger sxt', "year": 2012},
-    {"make": 'dodge', "model": 'challenger sxt coupe 2d', "year": 2019},
-    {"make": 'dodge', "model": 'challenger sxt coupe 2d', "year": 2018},
-    {"make": 'dodge', "model": 'challenger sxt coupe 2d', "year": 2017},
-    {"make": 'dodge', "model": 'challenger sxt plus w/ super sport group', "year": 2013},
-    {"make": 'dodge', "model": 'challenger sxt rwd gas', "year": 2018},
-    {"make": 'dodge', "model": 'challenger sxt rwd gas', "year": 2014},
-    {"make": 'dodge', "model": 'challenger t/a plus coupe', "year": 2017},
-    {"make": 'dodge', "model": 'charger', "year": 2020},
-    {"make": 'dodge', "model": 'charger', "year": 2019},
-    {"make": 'dodge', "model": 'charger', "year": 2018},
-    {"make": 'dodge', "model": 'charger', "year": 2017},
-    {"make": 'dodge', "model": 'charger', "year": 2016},
-    {"make": 'dodge', "model": 'charger', "year": 2015},
-    {"make": 'dodge', "model": 'charger', "year": 2014},
-    {"make": 'dodge', "model": 'charger', "year": 2013},
-    {"make": 'dodge', "model": 'charger', "year": 2012},
-    {"make": 'dodge', "model": 'charger', "year": 2011},
-    {"make": 'dodge', "model": 'charger', "year": 2010},
-    {"make": 'dodge', "model": 'charger', "year": 2009},
-    {"make": 'dodge', "model": 'charger', "year": 2008},
-    {"make": 'dodge', "model": 'charger', "year": 2007},
-    {"make": 'dodge', "model": 'charger', "year": 2006},
-    {"make": 'dodge', "model": 'charger daytona 392 sedan', "year": 2017},
-    {"make": 'dodge', "model": 'charger gt plus sedan 4d', "year": 2018},
-    {"make": 'dodge', "model": 'charger gt sedan 4d', "year": 2020},
-    {"make": 'dodge', "model": 'charger gt sedan 4d', "year": 2018},
-    {"make": 'dodge', "model": 'charger police', "year": 2018},
-    {"make": 'dodge', "model": 'charger r/t', "year": 2018},
-    {"make": 'dodge', "model": 'charger r/t', "year": 2016},
-    {"make": 'dodge', "model": 'charger r/t', "year": 2014},
-    {"make": 'dodge', "model": 'charger r/t', "year": 2008},
-    {"make": 'dodge', "model": 'charger r/t', "year": 2007},
-    {"make": 'dodge', "model": 'charger r/t', "year": 2006},
-    {"make": 'dodge', "model": 'charger r/t road and track', "year": 2015},
-    {"make": 'dodge', "model": 'charger r/t rwd gas sedan', "year": 2017},
-    {"make": 'dodge', "model": 'charger r/t scat pack', "year": 2018},
-    {"make": 'dodge', "model": 'charger r/t scat pack', "year": 2017},
-    {"make": 'dodge', "model": 'charger r/t scat pack', "year": 2016},
-    {"make": 'dodge', "model": 'charger r/t sedan 4d', "year": 2020},
-    {"make": 'dodge', "model": 'charger r/t sedan 4d', "year": 2018},
-    {"make": 'dodge', "model": 'charger rallye awd gas', "year": 2016},
-    {"make": 'dodge', "model": 'charger scat pack sedan 4d', "year": 2019},
-    {"make": 'dodge', "model": 'charger scat pack srt', "year": 2020},
-    {"make": 'dodge', "model": 'charger scat pack srt', "year": 2019},
-    {"make": 'dodge', "model": 'charger se', "year": 2017},
-    {"make": 'dodge', "model": 'charger se', "year": 2016},
-    {"make": 'dodge', "model": 'charger se', "year": 2015},
-    {"make": 'dodge', "model": 'charger se', "year": 2014},
-    {"make": 'dodge', "model": 'charger se', "year": 2012},
-    {"make": 'dodge', "model": 'charger se 4dr sedan', "year": 2013},
-    {"make": 'dodge', "model": 'charger se awd', "year": 2016},
-    {"make": 'dodge', "model": 'charger se sedan 4d', "year": 2017},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2019},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2018},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2017},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2016},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2015},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2014},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2012},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2010},
-    {"make": 'dodge', "model": 'charger sxt', "year": 2009},
-    {"make": 'dodge', "model": 'charger sxt awd gas sedan', "year": 2014},
-    {"make": 'dodge', "model": 'charger sxt awd! awd', "year": 2017},
-    {"make": 'dodge', "model": 'charger sxt plus', "year": 2018},
-    {"make": 'dodge', "model": 'charger sxt rwd gas sedan', "year": 2016},
-    {"make": 'dodge', "model": 'charger sxt sedan 4d', "year": 2020},
-    {"make": 'dodge', "model": 'charger sxt sedan 4d', "year": 2019},
-    {"make": 'dodge', "model": 'charger sxt sedan 4d', "year": 2018},
-    {"make": 'dodge', "model": 'charger sxt sedan 4d', "year": 2016},
-    {"make": 'dodge', "model": 'dakota', "year": 2011},
-    {"make": 'dodge', "model": 'dakota', "year": 2010},
-    {"make": 'dodge', "model": 'dakota', "year": 2008},
-    {"make": 'dodge', "model": 'dakota', "year": 2007},
-    {"make": 'dodge', "model": 'dakota', "year": 2006},
-    {"make": 'dodge', "model": 'dakota', "year": 2005},
-    {"make": 'dodge', "model": 'dakota club cab', "year": 2005},
-    {"make": 'dodge', "model": 'dakota quad cab', "year": 2005},
-    {"make": 'dodge', "model": 'dakota slt', "year": 2007},
-    {"make": 'dodge', "model": 'dakota slt', "year": 2006},
-    {"make": 'dodge', "model": 'dakota slt', "year": 2005},
-    {"make": 'dodge', "model": 'dakota slt quad cab', "year": 2005},
-    {"make": 'dodge', "model": 'dart', "year": 2016},
-    {"make": 'dodge', "model": 'dart', "year": 2015},
-    {"make": 'dodge', "model": 'dart', "year": 2014},
-    {"make": 'dodge', "model": 'dart', "year": 2013},
-    {"make": 'dodge', "model": 'dart aero sedan 4d', "year": 2015},
-    {"make": 'dodge', "model": 'dart limited', "year": 2013},
-    {"make": 'dodge', "model": 'dart limited/gt', "year": 2013},
-    {"make": 'dodge', "model": 'dart rallye', "year": 2013},
-    {"make": 'dodge', "model": 'dart se', "year": 2015},
-    {"make": 'dodge', "model": 'dart se', "year": 2013},
-    {"make": 'dodge', "model": 'dart se sedan 4d', "year": 2016},
-    {"make": 'dodge', "model": 'dart sxt', "year": 2016},
-    {"make": 'dodge', "model": 'dart sxt', "year": 2015},
-    {"make": 'dodge', "model": 'dart sxt', "year": 2014},
-    {"make": 'dodge', "model": 'dart sxt', "year": 2013},
-    {"make": 'dodge', "model": 'dart sxt sedan 4d', "year": 2015},
-    {"make": 'dodge', "model": 'dart sxt sport rallye', "year": 2016},
-    {"make": 'dodge', "model": 'durango', "year": 2020},
-    {"make": 'dodge', "model": 'durango', "year": 2019},
-    {"make": 'dodge', "model": 'durango', "year": 2018},
-    {"make": 'dodge', "model": 'durango', "year": 2017},
-    {"make": 'dodge', "model": 'durango', "year": 2016},
-    {"make": 'dodge', "model": 'durango', "year": 2015},
-    {"make": 'dodge', "model": 'durango', "year": 2014},
-    {"make": 'dodge', "model": 'durango', "year": 2013},
-    {"make": 'dodge', "model": 'durango', "year": 2012},
-    {"make": 'dodge', "model": 'durango', "year": 2011},
-    {"make": 'dodge', "model": 'durango', "year": 2008},
-    {"make": 'dodge', "model": 'durango', "year": 2007},
-    {"make": 'dodge', "model": 'durango', "year": 2006},
-    {"make": 'dodge', "model": 'durango', "year": 2005},
-    {"make": 'dodge', "model": 'durango citadel', "year": 2011},
-    {"make": 'dodge', "model": 'durango crew', "year": 2011},
-    {"make": 'dodge', "model": 'durango crew awd', "year": 2013},
-    {"make": 'dodge', "model": 'durango crew awd', "year": 2011},
-    {"make": 'dodge', "model": 'durango crew awd gas suv', "year": 2013},
-    {"make": 'dodge', "model": 'durango gt awd gas suv', "year": 2020},
-    {"make": 'dodge', "model": 'durango gt awd gas suv', "year": 2018},
-    {"make": 'dodge', "model": 'durango gt awd gas suv', "year": 2017},
-    {"make": 'dodge', "model": 'durango gt plus sport', "year": 2020},
-    {"make": 'dodge', "model": 'durango gt sport utility', "year": 2018},
-    {"make": 'dodge', "model": 'durango gt sport utility', "year": 2017},
-    {"make": 'dodge', "model": 'durango hemi', "year": 2005},
-    {"make": 'dodge', "model": 'durango limited', "year": 2015},
-    {"make": 'dodge', "model": 'durango limited', "year": 2014},
-    {"make": 'dodge', "model": 'durango limited', "year": 2005},
-    {"make": 'dodge', "model": 'durango limited awd', "year": 2014},
-    {"make": 'dodge', "model": 'durango limited awd gas', "year": 2016},
-    {"make": 'dodge', "model": 'durango r/t', "year": 2012},
-    {"make": 'dodge', "model": 'durango r/t awd gas suv', "year": 2020},
-    {"make": 'dodge', "model": 'durango r/t sport utility', "year": 2018},
-    {"make": 'dodge', "model": 'durango r/t sport utility', "year": 2017},
-    {"make": 'dodge', "model": 'durango r/t sport utility', "year": 2015},
-    {"make": 'dodge', "model": 'durango r/t sport utility', "year": 2014},
-    {"make": 'dodge', "model": 'durango rt awd gas suv', "year": 2020},
-    {"make": 'dodge', "model": 'durango slt', "year": 2007},
-    {"make": 'dodge', "model": 'durango slt', "year": 2006},
-    {"make": 'dodge', "model": 'durango sxt', "year": 2013},
-    {"make": 'dodge', "model": 'durango sxt sport', "year": 2013},
-    {"make": 'dodge', "model": 'durango sxt sport utility', "year": 2018},
-    {"make": 'dodge', "model": 'durango sxt sport utility', "year": 2017},
-    {"make": 'dodge', "model": 'durango sxt sport utility', "year": 2014},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2020},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2019},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2018},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2017},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2016},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2015},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2014},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2013},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2012},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2011},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2010},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2009},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2008},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2007},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2006},
-    {"make": 'dodge', "model": 'grand caravan', "year": 2005},
-    {"make": 'dodge', "model": "grand caravan - stow 'n go - flex fuel - new tires", "year": 2012},
-    {"make": 'dodge', "model": 'grand caravan american value package', "year": 2015},
-    {"make": 'dodge', "model": 'grand caravan crew', "year": 2011},
-    {"make": 'dodge', "model": 'grand caravan gt', "year": 2019},
-    {"make": 'dodge', "model": 'grand caravan gt', "year": 2017},
-    {"make": 'dodge', "model": 'grand caravan passenger', "year": 2019},
-    {"make": 'dodge', "model": 'grand caravan passenger', "year": 2016},
-    {"make": 'dodge', "model": 'grand caravan passenger se', "year": 2019},
-    {"make": 'dodge', "model": 'grand caravan passenger se', "year": 2017},
-    {"make": 'dodge', "model": 'grand caravan rt', "year": 2013},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2016},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2015},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2014},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2013},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2012},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2010},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2009},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2008},
-    {"make": 'dodge', "model": 'grand caravan se', "year": 2005},
-    {"make": 'dodge', "model": 'grand caravan se wagon', "year": 2017},
-    {"make": 'dodge', "model": 'grand caravan se wheelcha', "year": 2018},
-    {"make": 'dodge', "model": 'grand caravan se wheelcha', "year": 2015},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2020},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2019},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2018},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2017},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2016},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2015},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2014},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2013},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2012},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2010},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2009},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2008},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2007},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2006},
-    {"make": 'dodge', "model": 'grand caravan sxt', "year": 2005},
-    {"make": 'dodge', "model": 'grand caravan sxt wheelch', "year": 2017},
-    {"make": 'dodge', "model": 'grand caravan sxt wheelch', "year": 2016},
-    {"make": 'dodge', "model": 'grand caravan sxt wheelch', "year": 2015},
-    {"make": 'dodge', "model": 'grand caravan wheelchair', "year": 2016},
-    {"make": 'dodge', "model": 'grand caravan wheelchair', "year": 2015},
-    {"make": 'dodge', "model": 'journey', "year": 2020},
-    {"make": 'dodge', "model": 'journey', "year": 2019},
-    {"make": 'dodge', "model": 'journey', "year": 2018},
-    {"make": 'dodge', "model": 'journey', "year": 2017},
-    {"make": 'dodge', "model": 'journey', "year": 2016},
-    {"make": 'dodge', "model": 'journey', "year": 2015},
-    {"make": 'dodge', "model": 'journey', "year": 2014},
-    {"make": 'dodge', "model": 'journey', "year": 2013},
-    {"make": 'dodge', "model": 'journey', "year": 2012},
-    {"make": 'dodge', "model": 'journey', "year": 2011},
-    {"make": 'dodge', "model": 'journey', "year": 2010},
-    {"make": 'dodge', "model": 'journey', "year": 2009},
-    {"make": 'dodge', "model": 'journey crossroad', "year": 2017},
-    {"make": 'dodge', "model": 'journey crossroad', "year": 2016},
-    {"make": 'dodge', "model": 'journey crossroad fwd gas', "year": 2017},
-    {"make": 'dodge', "model": 'journey crossroad plus', "year": 2016},
-    {"make": 'dodge', "model": 'journey crossroad sport', "year": 2019},
-    {"make": 'dodge', "model": 'journey gt', "year": 2019},
-    {"make": 'dodge', "model": 'journey gt sport utility', "year": 2018},
-    {"make": 'dodge', "model": 'journey r/t', "year": 2015},
-    {"make": 'dodge', "model": 'journey r/t sport utility', "year": 2015},
-    {"make": 'dodge', "model": 'journey se', "year": 2018},
-    {"make": 'dodge', "model": 'journey se', "year": 2017},
-    {"make": 'dodge', "model": 'journey se', "year": 2016},
-    {"make": 'dodge', "model": 'journey se', "year": 2015},
-    {"make": 'dodge', "model": 'journey se sport utility', "year": 2019},
-    {"make": 'dodge', "model": 'journey se sport utility', "year": 2018},
-    {"make": 'dodge', "model": 'journey se suv', "year": 2017},
-    {"make": 'dodge', "model": 'journey se value sport', "year": 2020},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2016},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2015},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2014},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2013},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2012},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2010},
-    {"make": 'dodge', "model": 'journey sxt', "year": 2009},
-    {"make": 'dodge', "model": 'journey sxt awd', "year": 2017},
-    {"make": 'dodge', "model": 'journey sxt awd', "year": 2015},
-    {"make": 'dodge', "model": 'journey sxt awd', "year": 2010},
-    {"make": 'dodge', "model": 'journey sxt fwd gas suv', "year": 2015},
-    {"make": 'dodge', "model": 'magnum', "year": 2007},
-    {"make": 'dodge', "model": 'magnum', "year": 2006},
-    {"make": 'dodge', "model": 'magnum', "year": 2005},
-    {"make": 'dodge', "model": 'magnum sxt', "year": 2008},
-    {"make": 'dodge', "model": 'magnum sxt', "year": 2005},
-    {"make": 'dodge', "model": 'neon', "year": 2005},
-    {"make": 'dodge', "model": 'neon sxt', "year": 2005},
-    {"make": 'dodge', "model": 'nitro', "year": 2011},
-    {"make": 'dodge', "model": 'nitro', "year": 2010},
-    {"make": 'dodge', "model": 'nitro', "year": 2009},
-    {"make": 'dodge', "model": 'nitro', "year": 2008},
-    {"make": 'dodge', "model": 'nitro', "year": 2007},
-    {"make": 'dodge', "model": 'nitro heat 4x4', "year": 2011},
-    {"make": 'dodge', "model": 'nitro se', "year": 2011},
-    {"make": 'dodge', "model": 'nitro slt', "year": 2008},
-    {"make": 'dodge', "model": 'nitro slt', "year": 2007},
-    {"make": 'dodge', "model": 'nitro sxt', "year": 2008},
-    {"make": 'dodge', "model": 'nitro sxt', "year": 2007},
-    {"make": 'dodge', "model": 'ram1500 slt 4+4', "year": 2005},
-    {"make": 'dodge', "model": 'sprinter 3500', "year": 2007},
-    {"make": 'dodge', "model": 'stratus', "year": 2006},
-    {"make": 'dodge', "model": 'stratus', "year": 2005},
-    {"make": 'dodge', "model": 'stratus sxt', "year": 2005},
-    {"make": 'ford', "model": '500', "year": 2006},
-    {"make": 'ford', "model": '500', "year": 2005},
-    {"make": 'ford', "model": 'bronco sport', "year": 2021},
-    {"make": 'ford', "model": 'bus', "year": 2016},
-    {"make": 'ford', "model": 'bus', "year": 2011},
-    {"make": 'ford', "model": 'c - max se hybrid', "year": 2015},
-    {"make": 'ford', "model": 'c-max', "year": 2016},
-    {"make": 'ford', "model": 'c-max', "year": 2015},
-    {"make": 'ford', "model": 'c-max', "year": 2013},
-    {"make": 'ford', "model": 'c-max energi', "year": 2017},
-    {"make": 'ford', "model": 'c-max energi', "year": 2016},
-    {"make": 'ford', "model": 'c-max energi', "year": 2013},
-    {"make": 'ford', "model": 'c-max energi sel wagon 4d', "year": 2016},
-    {"make": 'ford', "model": 'c-max energi sel wagon 4d', "year": 2015},
-    {"make": 'ford', "model": 'c-max hybrid', "year": 2018},
-    {"make": 'ford', "model": 'c-max hybrid', "year": 2017},
-    {"make": 'ford', "model": 'c-max hybrid', "year": 2016},
-    {"make": 'ford', "model": 'c-max hybrid', "year": 2014},
-    {"make": 'ford', "model": 'c-max hybrid', "year": 2013},
-    {"make": 'ford', "model": 'c-max hybrid se', "year": 2013},
-    {"make": 'ford', "model": 'c-max hybrid se wagon 4d', "year": 2018},
-    {"make": 'ford', "model": 'c-max hybrid se wagon 4d', "year": 2017},
-    {"make": 'ford', "model": 'c-max hybrid se wagon 4d', "year": 2013},
-    {"make": 'ford', "model": 'c-max hybrid sel', "year": 2013},
-    {"make": 'ford', "model": 'c-max hybrid sel wagon 4d', "year": 2013},
-    {"make": 'ford', "model": 'c-max hybrid titanium wagon', "year": 2017},
-    {"make": 'ford', "model": 'cmax hybrid', "year": 2016},
-    {"make": 'ford', "model": 'cmax hybrid', "year": 2014},
-    {"make": 'ford', "model": 'cmax hybrid', "year": 2013},
-    {"make": 'ford', "model": 'crown victoria', "year": 2011},
-    {"make": 'ford', "model": 'crown victoria', "year": 2010},
-    {"make": 'ford', "model": 'crown victoria', "year": 2009},
-    {"make": 'ford', "model": 'crown victoria', "year": 2008},
-    {"make": 'ford', "model": 'crown victoria', "year": 2006},
-    {"make": 'ford', "model": 'crown victoria', "year": 2005},
-    {"make": 'ford', "model": 'crown victoria police', "year": 2011},
-    {"make": 'ford', "model": 'crown victoria police', "year": 2010},
-    {"make": 'ford', "model": 'crown victoria police', "year": 2009},
-    {"make": 'ford', "model": 'crown victoria police', "year": 2008},
-    {"make": 'ford', "model": 'crown victoria police', "year": 2007},
-    {"make": 'ford', "model": 'e-150', "year": 2013},
-    {"make": 'ford', "model": 'e-150', "year": 2009},
-    {"make": 'ford', "model": 'e-150 transit', "year": 2016},
-    {"make": 'ford', "model": 'e-250', "year": 2014},
-    {"make": 'ford', "model": 'e-250', "year": 2013},
-    {"make": 'ford', "model": 'e-250', "year": 2011},
-    {"make": 'ford', "model": 'e-250', "year": 2008},
-    {"make": 'ford', "model": 'e-250', "year": 2007},
-    {"make": 'ford', "model": 'e-350', "year": 2014},
-    {"make": 'ford', "model": 'e-350', "year": 2013},
-    {"make": 'ford', "model": 'e-350', "year": 2012},
-    {"make": 'ford', "model": 'e-350', "year": 2011},
-    {"make": 'ford', "model": 'e-350', "year": 2010},
-    {"make": 'ford', "model": 'e-350', "year": 2009},
-    {"make": 'ford', "model": 'e-350', "year": 2008},
-    {"make": 'ford', "model": 'e-350', "year": 2006},
-    {"make": 'ford', "model": 'e-350', "year": 2005},
-    {"make": 'ford', "model": 'e-350sd', "year": 2013},
-    {"make": 'ford', "model": 'e-350sd commercial', "year": 2012},
-    {"make": 'ford', "model": 'e-350sd commercial', "year": 2009},
-    {"make": 'ford', "model": 'e-450', "year": 2017},
-    {"make": 'ford', "model": 'e-450', "year": 2016},
-    {"make": 'ford', "model": 'e-450', "year": 2015},
-    {"make": 'ford', "model": 'e-450', "year": 2012},
-    {"make": 'ford', "model": 'e-450', "year": 2011},
-    {"make": 'ford', "model": 'e-450', "year": 2007},
-    {"make": 'ford', "model": 'e-series cargo', "year": 2014},
-    {"make": 'ford', "model": 'e-series cargo', "year": 2013},
-    {"make": 'ford', "model": 'e-series cargo', "year": 2012},
-    {"make": 'ford', "model": 'e-series cargo e-150', "year": 2013},
-    {"make": 'ford', "model": 'e-series cargo e-350', "year": 2014},
-    {"make": 'ford', "model": 'e-series cargo e-350 sd', "year": 2014},
-    {"make": 'ford', "model": 'e-series chassis', "year": 2016},
-    {"make": 'ford', "model": 'e-series chassis', "year": 2013},
-    {"make": 'ford', "model": 'e-series chassis', "year": 2011},
-    {"make": 'ford', "model": 'e-series chassis 14 feet box', "year": 2015},
-    {"make": 'ford', "model": 'e-series chassis e 350 sd', "year": 2007},
-    {"make": 'ford', "model": 'e-series chassis e-450', "year": 2007},
-    {"make": 'ford', "model": 'e-series chassis e-450 sd', "year": 2011},
-    {"make": 'ford', "model": 'e-series cutaway', "year": 2018},
-    {"make": 'ford', "model": 'e150', "year": 2013},
-    {"make": 'ford', "model": 'e150', "year": 2005},
-    {"make": 'ford', "model": 'e150 cargo', "year": 2013},
-    {"make": 'ford', "model": 'e150 cargo van', "year": 2014},
-    {"make": 'ford', "model": 'e150 cargo van', "year": 2013},
-    {"make": 'ford', "model": 'e150 cargo van', "year": 2011},
-    {"make": 'ford', "model": 'e250', "year": 2013},
-    {"make": 'ford', "model": 'e250', "year": 2010},
-    {"make": 'ford', "model": 'e250', "year": 2009},
-    {"make": 'ford', "model": 'e250 cargo van', "year": 2013},
-    {"make": 'ford', "model": 'e250 cargo van', "year": 2012},
-    {"make": 'ford', "model": 'e250 econoline', "year": 2011},
-    {"make": 'ford', "model": 'e250 econoline', "year": 2008},
-    {"make": 'ford', "model": 'e250 econoline', "year": 2006},
-    {"make": 'ford', "model": 'e250 van', "year": 2008},
-    {"make": 'ford', "model": 'e350', "year": 2015},
-    {"make": 'ford', "model": 'e350', "year": 2013},
-    {"make": 'ford', "model": 'e350', "year": 2012},
-    {"make": 'ford', "model": 'e350', "year": 2011},
-    {"make": 'ford', "model": 'e350', "year": 2009},
-    {"make": 'ford', "model": 'e350', "year": 2007},
-    {"make": 'ford', "model": 'e350', "year": 2006},
-    {"make": 'ford', "model": 'e350 box truck', "year": 2014},
-    {"make": 'ford', "model": 'e350 box truck', "year": 2013},
-    {"make": 'ford', "model": 'e350 cutaway', "year": 2015},
-    {"make": 'ford', "model": 'e350 passenger van', "year": 2008},
-    {"make": 'ford', "model": 'e350 super duty', "year": 2014},
-    {"make": 'ford', "model": 'e350 super duty cargo', "year": 2013},
-    {"make": 'ford', "model": 'e350 van', "year": 2006},
-    {"make": 'ford', "model": 'e350 wheelchair van', "year": 2008},
-    {"make": 'ford', "model": 'e350 xlt', "year": 2005},
-    {"make": 'ford', "model": 'e450', "year": 2011},
-    {"make": 'ford', "model": 'e450', "year": 2007},
-    {"make": 'ford', "model": 'e450 bus', "year": 2006},
-    {"make": 'ford', "model": 'e450 shuttle bus', "year": 2014},
-    {"make": 'ford', "model": 'e450 super duty', "year": 2011},
-    {"make": 'ford', "model": 'econoline', "year": 2016},
-    {"make": 'ford', "model": 'econoline', "year": 2014},
-    {"make": 'ford', "model": 'econoline', "year": 2013},
-    {"make": 'ford', "model": 'econoline', "year": 2012},
-    {"make": 'ford', "model": 'econoline', "year": 2011},
-    {"make": 'ford', "model": 'econoline', "year": 2010},
-    {"make": 'ford', "model": 'econoline', "year": 2009},
-    {"make": 'ford', "model": 'econoline', "year": 2006},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2014},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2013},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2012},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2011},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2010},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2008},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2007},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2006},
-    {"make": 'ford', "model": 'econoline cargo van', "year": 2005},
-    {"make": 'ford', "model": 'econoline commercial', "year": 2012},
-    {"make": 'ford', "model": 'econoline commercial cutaway', "year": 2016},
-    {"make": 'ford', "model": 'econoline commercial cutaway', "year": 2014},
-    {"make": 'ford', "model": 'econoline commercial cutaway', "year": 2013},
-    {"make": 'ford', "model": 'econoline commercial cutaway', "year": 2011},
-    {"make": 'ford', "model": 'econoline commercial cutaway', "year": 2010},
-    {"make": 'ford', "model": 'econoline commercial cutaway', "year": 2005},
-    {"make": 'ford', "model": 'econoline e150 cargo van', "year": 2013},
-    {"make": 'ford', "model": 'econoline e350', "year": 2013},
-    {"make": 'ford', "model": 'econoline e350', "year": 2006},
-    {"make": 'ford', "model": 'econoline wagon', "year": 2011},
-    {"make": 'ford', "model": 'econoline wagon', "year": 2010},
-    {"make": 'ford', "model": 'ecosport', "year": 2020},
-    {"make": 'ford', "model": 'ecosport', "year": 2019},
-    {"make": 'ford', "model": 'ecosport', "year": 2018},
-    {"make": 'ford', "model": 'ecosport s sport utility 4d', "year": 2018},
-    {"make": 'ford', "model": 'ecosport se', "year": 2019},
-    {"make": 'ford', "model": 'ecosport se', "year": 2018},
-    {"make": 'ford', "model": 'ecosport se sport utility', "year": 2018},
-    {"make": 'ford', "model": 'ecosport ses sport utility', "year": 2018},
-    {"make": 'ford', "model": 'ecosport titanium', "year": 2020},
-    {"make": 'ford', "model": 'ecosport titanium', "year": 2019},
-    {"make": 'ford', "model": 'ecosport titanium awd', "year": 2018},
-    {"make": 'ford', "model": 'ecosport titanium sport', "year": 2018},
-    {"make": 'ford', "model": 'ecosport titanium suv', "year": 2020},
-    {"make": 'ford', "model": 'edge', "year": 2020},
-    {"make": 'ford', "model": 'edge', "year": 2019},
-    {"make": 'ford', "model": 'edge', "year": 2018},
-    {"make": 'ford', "model": 'edge', "year": 2017},
-    {"make": 'ford', "model": 'edge', "year": 2016},
-    {"make": 'ford', "model": 'edge', "year": 2015},
-    {"make": 'ford', "model": 'edge', "year": 2014},
-    {"make": 'ford', "model": 'edge', "year": 2013},
-    {"make": 'ford', "model": 'edge', "year": 2012},
-    {"make": 'ford', "model": 'edge', "year": 2011},
-    {"make": 'ford', "model": 'edge', "year": 2010},
-    {"make": 'ford', "model": 'edge', "year": 2009},
-    {"make": 'ford', "model": 'edge', "year": 2008},
-    {"make": 'ford', "model": 'edge', "year": 2007},
-    {"make": 'ford', "model": 'edge limited', "year": 2013},
-    {"make": 'ford', "model": 'edge limited', "year": 2012},
-    {"make": 'ford', "model": 'edge limited', "year": 2011},
-    {"make": 'ford', "model": 'edge limited', "year": 2010},
-    {"make": 'ford', "model": 'edge limited', "year": 2008},
-    {"make": 'ford', "model": 'edge limited awd', "year": 2013},
-    {"make": 'ford', "model": 'edge limited awd', "year": 2011},
-    {"make": 'ford', "model": 'edge limited wagon', "year": 2012},
-    {"make": 'ford', "model": 'edge se', "year": 2019},
-    {"make": 'ford', "model": 'edge se', "year": 2013},
-    {"make": 'ford', "model": 'edge se', "year": 2012},
-    {"make": 'ford', "model": 'edge se suv', "year": 2019},
-    {"make": 'ford', "model": 'edge sel', "year": 2018},
-    {"make": 'ford', "model": 'edge sel', "year": 2017},
-    {"make": 'ford', "model": 'edge sel', "year": 2016},
-    {"make": 'ford', "model": 'edge sel', "year": 2015},
-    {"make": 'ford', "model": 'edge sel', "year": 2014},
-    {"make": 'ford', "model": 'edge sel', "year": 2013},
-    {"make": 'ford', "model": 'edge sel', "year": 2012},
-    {"make": 'ford', "model": 'edge sel', "year": 2011},
-    {"make": 'ford', "model": 'edge sel', "year": 2010},
-    {"make": 'ford', "model": 'edge sel', "year": 2008},
-    {"make": 'ford', "model": 'edge sel', "year": 2007},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2020},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2019},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2018},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2017},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2013},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2011},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2008},
-    {"make": 'ford', "model": 'edge sel awd', "year": 2007},
-    {"make": 'ford', "model": 'edge sel plus', "year": 2007},
-    {"make": 'ford', "model": 'edge sel plus awd', "year": 2007},
-    {"make": 'ford', "model": 'edge sel sport utility 4d', "year": 2018},
-    {"make": 'ford', "model": 'edge sel suv', "year": 2020},
-    {"make": 'ford', "model": 'edge sel turbo', "year": 2015},
-    {"make": 'ford', "model": 'edge sport', "year": 2017},
-    {"make": 'ford', "model": 'edge sport', "year": 2011},
-    {"make": 'ford', "model": 'edge sport awd', "year": 2013},
-    {"make": 'ford', "model": 'edge sport awd! awd', "year": 2013},
-    {"make": 'ford', "model": 'edge sport suv 4d', "year": 2018},
-    {"make": 'ford', "model": 'edge st line', "year": 2020},
-    {"make": 'ford', "model": 'edge titanium', "year": 2020},
-    {"make": 'ford', "model": 'edge titanium', "year": 2018},
-    {"make": 'ford', "model": 'edge titanium', "year": 2016},
-    {"make": 'ford', "model": 'edge titanium awd', "year": 2019},
-    {"make": 'ford', "model": 'escape', "year": 2020},
-    {"make": 'ford', "model": 'escape', "year": 2019},
-    {"make": 'ford', "model": 'escape', "year": 2018},
-    {"make": 'ford', "model": 'escape', "year": 2017},
-    {"make": 'ford', "model": 'escape', "year": 2016},
-    {"make": 'ford', "model": 'escape', "year": 2015},
-    {"make": 'ford', "model": 'escape', "year": 2014},
-    {"make": 'ford', "model": 'escape', "year": 2013},
-    {"make": 'ford', "model": 'escape', "year": 2012},
-    {"make": 'ford', "model": 'escape', "year": 2011},
-    {"make": 'ford', "model": 'escape', "year": 2010},
-    {"make": 'ford', "model": 'escape', "year": 2009},
-    {"make": 'ford', "model": 'escape', "year": 2008},
-    {"make": 'ford', "model": 'escape', "year": 2007},
-    {"make": 'ford', "model": 'escape', "year": 2006},
-    {"make": 'ford', "model": 'escape', "year": 2005},
-    {"make": 'ford', "model": 'escape - new tires - great mpg for suv -', "year": 2012},
-    {"make": 'ford', "model": 'escape hybrid', "year": 2009},
-    {"make": 'ford', "model": 'escape hybrid', "year": 2008},
-    {"make": 'ford', "model": 'escape hybrid', "year": 2007},
-    {"make": 'ford', "model": 'escape hybrid', "year": 2006},
-    {"make": 'ford', "model": 'escape hybrid', "year": 2005},
-    {"make": 'ford', "model": 'escape limited', "year": 2012},
-    {"make": 'ford', "model": 'escape limited', "year": 2011},
-    {"make": 'ford', "model": 'escape limited', "year": 2010},
-    {"make": 'ford', "model": 'escape limited', "year": 2009},
-    {"make": 'ford', "model": 'escape limited', "year": 2008},
-    {"make": 'ford', "model": 'escape limited', "year": 2006},
-    {"make": 'ford', "model": 'escape s', "year": 2018},
-    {"make": 'ford', "model": 'escape s', "year": 2017},
-    {"make": 'ford', "model": 'escape s', "year": 2015},
-    {"make": 'ford', "model": 'escape se', "year": 2020},
-    {"make": 'ford', "model": 'escape se', "year": 2019},
-    {"make": 'ford', "model": 'escape se', "year": 2018},
-    {"make": 'ford', "model": 'escape se', "year": 2017},
-    {"make": 'ford', "model": 'escape se', "year": 2016},
-    {"make": 'ford', "model": 'escape se', "year": 2015},
-    {"make": 'ford', "model": 'escape se', "year": 2014},
-    {"make": 'ford', "model": 'escape se', "year": 2013},
-    {"make": 'ford', "model": 'escape se 4wd', "year": 2017},
-    {"make": 'ford', "model": 'escape se 4x4', "year": 2017},
-    {"make": 'ford', "model": 'escape se automatic', "year": 2017},
-    {"make": 'ford', "model": 'escape se awd', "year": 2017},
-    {"make": 'ford', "model": 'escape se awd', "year": 2014},
-    {"make": 'ford', "model": 'escape se awd 65k 1-owner new tires tow pkg camera sync', "year": 2016},
-    {"make": 'ford', "model": 'escape se awd 68k ml.1owner new tirew well maint.clean!!!', "year": 2018},
-    {"make": 'ford', "model": 'escape se fwd gas suv auto', "year": 2019},
-    {"make": 'ford', "model": 'escape se sport utility 4d', "year": 2017},
-    {"make": 'ford', "model": 'escape sel', "year": 2020},
-    {"make": 'ford', "model": 'escape sel', "year": 2019},
-    {"make": 'ford', "model": 'escape sel', "year": 2018},
-    {"make": 'ford', "model": 'escape sel', "year": 2013},
-    {"make": 'ford', "model": 'escape sel 4wd', "year": 2013},
-    {"make": 'ford', "model": 'escape sel awd gas suv auto', "year": 2020},
-    {"make": 'ford', "model": 'escape sel sport utility 4d', "year": 2018},
-    {"make": 'ford', "model": 'escape sel suv', "year": 2020},
-    {"make": 'ford', "model": 'escape titanium', "year": 2017},
-    {"make": 'ford', "model": 'escape titanium', "year": 2016},
-    {"make": 'ford', "model": 'escape titanium', "year": 2015},
-    {"make": 'ford', "model": 'escape titanium', "year": 2014},
-    {"make": 'ford', "model": 'escape titanium 4wd, w/ navigation', "year": 2013},
-    {"make": 'ford', "model": 'escape titanium 4x4 gas suv', "year": 2017},
-    {"make": 'ford', "model": 'escape titanium awd', "year": 2013},
-    {"make": 'ford', "model": 'escape titanium sport', "year": 2017},
-    {"make": 'ford', "model": 'escape xls', "year": 2010},
-    {"make": 'ford', "model": 'escape xls', "year": 2006},
-    {"make": 'ford', "model": 'escape xls awd! awd', "year": 2011},
-    {"make": 'ford', "model": 'escape xlt', "year": 2013},
-    {"make": 'ford', "model": 'escape xlt', "year": 2012},
-    {"make": 'ford', "model": 'escape xlt', "year": 2011},
-    {"make": 'ford', "model": 'escape xlt', "year": 2010},
-    {"make": 'ford', "model": 'escape xlt', "year": 2009},
-    {"make": 'ford', "model": 'escape xlt', "year": 2008},
-    {"make": 'ford', "model": 'escape xlt', "year": 2007},
-    {"make": 'ford', "model": 'escape xlt', "year": 2006},
-    {"make": 'ford', "model": 'escape xlt', "year": 2005},
-    {"make": 'ford', "model": 'escape xlt 4x4', "year": 2011},
-    {"make": 'ford', "model": 'escape xlt 4x4', "year": 2009},
-    {"make": 'ford', "model": 'escape xlt 4x4', "year": 2008},
-    {"make": 'ford', "model": 'escape xlt 4x4', "year": 2006},
-    {"make": 'ford', "model": 'escape xlt 4x4', "year": 2005},
-    {"make": 'ford', "model": 'escape xlt awd', "year": 2012},
-    {"make": 'ford', "model": 'escape xlt awd! awd', "year": 2010},
-    {"make": 'ford', "model": 'escape-se, 4wd', "year": 2016},
-    {"make": 'ford', "model": 'excursion', "year": 2005},
-    {"make": 'ford', "model": 'excursion limited', "year": 2005},
-    {"make": 'ford', "model": 'excursion limited 55k miles*1-owner*diesel*rust free*collector quality*like new in&out*all original*new wheels & tires*unicorn alert', "year": 2005},
-    {"make": 'ford', "model": 'expedition', "year": 2020},
-    {"make": 'ford', "model": 'expedition', "year": 2019},
-    {"make": 'ford', "model": 'expedition', "year": 2018},
-    {"make": 'ford', "model": 'expedition', "year": 2017},
-    {"make": 'ford', "model": 'expedition', "year": 2016},
-    {"make": 'ford', "model": 'expedition', "year": 2015},
-    {"make": 'ford', "model": 'expedition', "year": 2014},
-    {"make": 'ford', "model": 'expedition', "year": 2013},
-    {"make": 'ford', "model": 'expedition', "year": 2012},
-    {"make": 'ford', "model": 'expedition', "year": 2011},
-    {"make": 'ford', "model": 'expedition', "year": 2010},
-    {"make": 'ford', "model": 'expedition', "year": 2009},
-    {"make": 'ford', "model": 'expedition', "year": 2008},
-    {"make": 'ford', "model": 'expedition', "year": 2007},
-    {"make": 'ford', "model": 'expedition', "year": 2006},
-    {"make": 'ford', "model": 'expedition', "year": 2005},
-    {"make": 'ford', "model": 'expedition eddie bauer', "year": 2007},
-    {"make": 'ford', "model": 'expedition eddie bauer', "year": 2006},
-    {"make": 'ford', "model": 'expedition el', "year": 2017},
-    {"make": 'ford', "model": 'expedition el', "year": 2016},
-    {"make": 'ford', "model": 'expedition el', "year": 2015},
-    {"make": 'ford', "model": 'expedition el', "year": 2014},
-    {"make": 'ford', "model": 'expedition el', "year": 2013},
-    {"make": 'ford', "model": 'expedition el', "year": 2012},
-    {"make": 'ford', "model": 'expedition el', "year": 2011},
-    {"make": 'ford', "model": 'expedition el', "year": 2009},
-    {"make": 'ford', "model": 'expedition el', "year": 2008},
-    {"make": 'ford', "model": 'expedition el', "year": 2007},
-    {"make": 'ford', "model": 'expedition el limited', "year": 2017},
-    {"make": 'ford', "model": 'expedition el limited', "year": 2013},
-    {"make": 'ford', "model": 'expedition el limited', "year": 2012},
-    {"make": 'ford', "model": 'expedition el xlt 4x4', "year": 2015},
-    {"make": 'ford', "model": 'expedition limited', "year": 2016},
-    {"make": 'ford', "model": 'expedition limited', "year": 2014},
-    {"make": 'ford', "model": 'expedition limited', "year": 2011},
-    {"make": 'ford', "model": 'expedition limited', "year": 2010},
-    {"make": 'ford', "model": 'expedition limited', "year": 2007},
-    {"make": 'ford', "model": 'expedition limited 4x4', "year": 2012},
-    {"make": 'ford', "model": 'expedition limited 4x4', "year": 2005},
-    {"make": 'ford', "model": 'expedition max', "year": 2020},
-    {"make": 'ford', "model": 'expedition max', "year": 2019},
-    {"make": 'ford', "model": 'expedition max', "year": 2018},
-    {"make": 'ford', "model": 'expedition max 4x4', "year": 2019},
-    {"make": 'ford', "model": 'expedition platinum 4x4 gas', "year": 2019},
-    {"make": 'ford', "model": 'expedition platinum 4x4 gas', "year": 2017},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2018},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2017},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2011},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2010},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2007},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2006},
-    {"make": 'ford', "model": 'expedition xlt', "year": 2005},
-    {"make": 'ford', "model": 'expedition xlt sport', "year": 2017},
-    {"make": 'ford', "model": 'expedition xlt sport', "year": 2014},
-    {"make": 'ford', "model": 'explorer', "year": 2021},
-    {"make": 'ford', "model": 'explorer', "year": 2020},
-    {"make": 'ford', "model": 'explorer', "year": 2019},
-    {"make": 'ford', "model": 'explorer', "year": 2018},
-    {"make": 'ford', "model": 'explorer', "year": 2017},
-    {"make": 'ford', "model": 'explorer', "year": 2016},
-    {"make": 'ford', "model": 'explorer', "year": 2015},
-    {"make": 'ford', "model": 'explorer', "year": 2014},
-    {"make": 'ford', "model": 'explorer', "year": 2013},
-    {"make": 'ford', "model": 'explorer', "year": 2012},
-    {"make": 'ford', "model": 'explorer', "year": 2011},
-    {"make": 'ford', "model": 'explorer', "year": 2010},
-    {"make": 'ford', "model": 'explorer', "year": 2009},
-    {"make": 'ford', "model": 'explorer', "year": 2008},
-    {"make": 'ford', "model": 'explorer', "year": 2007},
-    {"make": 'ford', "model": 'explorer', "year": 2006},
-    {"make": 'ford', "model": 'explorer', "year": 2005},
-    {"make": 'ford', "model": 'explorer 4x4', "year": 2015},
-    {"make": 'ford', "model": 'explorer 4x4', "year": 2014},
-    {"make": 'ford', "model": 'explorer 4x4', "year": 2013},
-    {"make": 'ford', "model": 'explorer 4x4', "year": 2008},
-    {"make": 'ford', "model": 'explorer base', "year": 2011},
-    {"make": 'ford', "model": 'explorer eddie bauer', "year": 2010},
-    {"make": 'ford', "model": 'explorer eddie bauer', "year": 2008},
-    {"make": 'ford', "model": 'explorer eddie bauer', "year": 2007},
-    {"make": 'ford', "model": 'explorer eddie bauer', "year": 2006},
-    {"make": 'ford', "model": 'explorer eddie bauer 4x4', "year": 2006},
-    {"make": 'ford', "model": 'explorer hybrid limited', "year": 2020},
-    {"make": 'ford', "model": 'explorer hybrid limited suv', "year": 2020},
-    {"make": 'ford', "model": 'explorer limited', "year": 2021},
-    {"make": 'ford', "model": 'explorer limited', "year": 2020},
-    {"make": 'ford', "model": 'explorer limited', "year": 2017},
-    {"make": 'ford', "model": 'explorer limited', "year": 2016},
-    {"make": 'ford', "model": 'explorer limited', "year": 2015},
-    {"make": 'ford', "model": 'explorer limited', "year": 2014},
-    {"make": 'ford', "model": 'explorer limited', "year": 2013},
-    {"make": 'ford', "model": 'explorer limited', "year": 2012},
-    {"make": 'ford', "model": 'explorer limited', "year": 2008},
-    {"make": 'ford', "model": 'explorer limited 4x4 gas', "year": 2019},
-    {"make": 'ford', "model": 'explorer limited sport', "year": 2014},
-    {"make": 'ford', "model": 'explorer limited suv', "year": 2021},
-    {"make": 'ford', "model": 'explorer police interceptor', "year": 2017},
-    {"make": 'ford', "model": 'explorer police interceptor', "year": 2014},
-    {"make": 'ford', "model": 'explorer sport', "year": 2019},
-    {"make": 'ford', "model": 'explorer sport', "year": 2018},
-    {"make": 'ford', "model": 'explorer sport', "year": 2016},
-    {"make": 'ford', "model": 'explorer sport', "year": 2015},
-    {"make": 'ford', "model": 'explorer sport', "year": 2014},
-    {"make": 'ford', "model": 'explorer sport 4x4 gas suv', "year": 2018},
-    {"make": 'ford', "model": 'explorer sport trac', "year": 2010},
-    {"make": 'ford', "model": 'explorer sport trac', "year": 2009},
-    {"make": 'ford', "model": 'explorer sport trac', "year": 2008},
-    {"make": 'ford', "model": 'explorer sport trac', "year": 2007},
-    {"make": 'ford', "model": 'explorer sport trac', "year": 2005},
-    {"make": 'ford', "model": 'explorer sport utility 4d', "year": 2018},
-    {"make": 'ford', "model": 'explorer st 4x4 gas suv', "year": 2020},
-    {"make": 'ford', "model": 'explorer xls', "year": 2005},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2020},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2019},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2018},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2017},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2016},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2015},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2014},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2013},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2012},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2011},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2010},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2009},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2008},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2007},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2006},
-    {"make": 'ford', "model": 'explorer xlt', "year": 2005},
-    {"make": 'ford', "model": 'explorer xlt - 4wd - flex fuel - third row seat -', "year": 2013},
-    {"make": 'ford', "model": 'explorer xlt 4wd', "year": 2018},
-    {"make": 'ford', "model": 'explorer xlt 4wd', "year": 2017},
-    {"make": 'ford', "model": 'explorer xlt 4x4', "year": 2014},
-    {"make": 'ford', "model": 'explorer xlt 4x4', "year": 2013},
-    {"make": 'ford', "model": 'explorer xlt 4x4', "year": 2008},
-    {"make": 'ford', "model": 'explorer xlt 4x4', "year": 2005},
-    {"make": 'ford', "model": 'explorer xlt 4x4 gas suv', "year": 2018},
-    {"make": 'ford', "model": 'explorer xlt 4x4 gas suv', "year": 2017},
-    {"make": 'ford', "model": 'explorer xlt sport utility', "year": 2019},
-    {"make": 'ford', "model": 'explorer xlt sport utility', "year": 2018},
-    {"make": 'ford', "model": 'explorer xlt suv', "year": 2018},
-    {"make": 'ford', "model": 'f 150', "year": 2018},
-    {"make": 'ford', "model": 'f 250', "year": 2011},
-    {"make": 'ford', "model": 'f 350', "year": 2015},
-    {"make": 'ford', "model": 'f 350', "year": 2011},
-    {"make": 'ford', "model": 'f 350 lariat fx4 dually', "year": 2019},
-    {"make": 'ford', "model": 'f 450', "year": 2011},
-    {"make": 'ford', "model": 'f-150', "year": 2021},
-    {"make": 'ford', "model": 'f-150', "year": 2020},
-    {"make": 'ford', "model": 'f-150', "year": 2019},
-    {"make": 'ford', "model": 'f-150', "year": 2018},
-    {"make": 'ford', "model": 'f-150', "year": 2017},
-    {"make": 'ford', "model": 'f-150', "year": 2016},
-    {"make": 'ford', "model": 'f-150', "year": 2015},
-    {"make": 'ford', "model": 'f-150', "year": 2014},
-    {"make": 'ford', "model": 'f-150', "year": 2013},
-    {"make": 'ford', "model": 'f-150', "year": 2012},
-    {"make": 'ford', "model": 'f-150', "year": 2011},
-    {"make": 'ford', "model": 'f-150', "year": 2010},
-    {"make": 'ford', "model": 'f-150', "year": 2009},
-    {"make": 'ford', "model": 'f-150', "year": 2008},
-    {"make": 'ford', "model": 'f-150', "year": 2007},
-    {"make": 'ford', "model": 'f-150', "year": 2006},
-    {"make": 'ford', "model": 'f-150', "year": 2005},
-    {"make": 'ford', "model": 'f-150 4wd supercrew 145" platinum', "year": 2009},
-    {"make": 'ford', "model": 'f-150 4x4', "year": 2005},
-    {"make": 'ford', "model": 'f-150 4x4 5.0l v8 360hp 380ft. lbs. torque super crew xlt one owner', "year": 2011},
-    {"make": 'ford', "model": 'f-150 extended cab', "year": 2016},
-    {"make": 'ford', "model": 'f-150 fx2', "year": 2012},
-    {"make": 'ford', "model": 'f-150 fx4', "year": 2014},
-    {"make": 'ford', "model": 'f-150 fx4', "year": 2013},
-    {"make": 'ford', "model": 'f-150 fx4', "year": 2012},
-    {"make": 'ford', "model": 'f-150 fx4 4wd!crew cab', "year": 2013},
-    {"make": 'ford', "model": 'f-150 fx4 lifted crew ecoboost 3.5liter', "year": 2013},
-    {"make": 'ford', "model": 'f-150 king ranch 4x4 ecoboo', "year": 2014},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2020},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2019},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2018},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2017},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2016},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2015},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2014},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2013},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2012},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2011},
-    {"make": 'ford', "model": 'f-150 lariat', "year": 2010},
-    {"make": 'ford', "model": 'f-150 lariat 4wd', "year": 2020},
-    {"make": 'ford', "model": 'f-150 lariat 4wd!crew cab', "year": 2011},
-    {"make": 'ford', "model": 'f-150 lariat 4x4 loaded', "year": 2017},
-    {"make": 'ford', "model": 'f-150 lariat crew cab 4x4', "year": 2019},
-    {"make": 'ford', "model": 'f-150 lariat ecoboost 4x4', "year": 2018},
-    {"make": 'ford', "model": 'f-150 lifted lariat supercrew 5.0 v8', "year": 2015},
-    {"make": 'ford', "model": 'f-150 lifted supercrew xlt 4x4 v6 twin turbo financing', "year": 2017},
-    {"make": 'ford', "model": 'f-150 limited', "year": 2014},
-    {"make": 'ford', "model": 'f-150 platinum', "year": 2018},
-    {"make": 'ford', "model": 'f-150 platinum', "year": 2017},
-    {"make": 'ford', "model": 'f-150 platinum', "year": 2016},
-    {"make": 'ford', "model": 'f-150 platinum', "year": 2015},
-    {"make": 'ford', "model": 'f-150 platinum 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f-150 platinum crew cab 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f-150 platinum crew cab 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f-150 platinum crew ecoboost 3.5l', "year": 2015},
-    {"make": 'ford', "model": 'f-150 platinum ecoboost', "year": 2018},
-    {"make": 'ford', "model": 'f-150 quad cab short box', "year": 2016},
-    {"make": 'ford', "model": 'f-150 raptor', "year": 2018},
-    {"make": 'ford', "model": 'f-150 raptor arizona raptor*rust free*icon level kit*tech pkg*pano roof*newer tires*graphics pkg*like new in&out*non smoker*immaculate interior*heated steering wheel*cooled seats*tailgate step', "year": 2017},
-    {"make": 'ford', "model": 'f-150 stx', "year": 2019},
-    {"make": 'ford', "model": 'f-150 stx', "year": 2014},
-    {"make": 'ford', "model": 'f-150 super cab xl', "year": 2016},
-    {"make": 'ford', "model": 'f-150 super cab xlt', "year": 2014},
-    {"make": 'ford', "model": 'f-150 supercrew xlt 4x4', "year": 2012},
-    {"make": 'ford', "model": 'f-150 svt raptor', "year": 2014},
-    {"make": 'ford', "model": 'f-150 svt raptor', "year": 2013},
-    {"make": 'ford', "model": 'f-150 svt raptor', "year": 2010},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2019},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2018},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2017},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2014},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2013},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2012},
-    {"make": 'ford', "model": 'f-150 xl', "year": 2008},
-    {"make": 'ford', "model": 'f-150 xl 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f-150 xl standard cab', "year": 2013},
-    {"make": 'ford', "model": 'f-150 xl supercrew', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2020},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2019},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2018},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2017},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2015},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2014},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2013},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2012},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2011},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2010},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2009},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2008},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2007},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2006},
-    {"make": 'ford', "model": 'f-150 xlt', "year": 2005},
-    {"make": 'ford', "model": 'f-150 xlt 4wd!extended', "year": 2006},
-    {"make": 'ford', "model": 'f-150 xlt 4x4', "year": 2017},
-    {"make": 'ford', "model": 'f-150 xlt 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f-150 xlt 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f-150 xlt 4x4', "year": 2012},
-    {"make": 'ford', "model": 'f-150 xlt 4x4 4dr supercrew', "year": 2020},
-    {"make": 'ford', "model": 'f-150 xlt automatic', "year": 2018},
-    {"make": 'ford', "model": 'f-150 xlt fx4crew cab', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xlt sport supercrew', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xlt supercab', "year": 2018},
-    {"make": 'ford', "model": 'f-150 xlt supercrew', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xlt supercrew eco boost 3.5l', "year": 2018},
-    {"make": 'ford', "model": 'f-150 xlt supercrew ecoboost 3.5l premium', "year": 2016},
-    {"make": 'ford', "model": 'f-150 xltcrew cab', "year": 2018},
-    {"make": 'ford', "model": 'f-150 xltcrew cab', "year": 2013},
-    {"make": 'ford', "model": 'f-150 xltextended cab', "year": 2006},
-    {"make": 'ford', "model": 'f-250', "year": 2020},
-    {"make": 'ford', "model": 'f-250', "year": 2019},
-    {"make": 'ford', "model": 'f-250', "year": 2018},
-    {"make": 'ford', "model": 'f-250', "year": 2017},
-    {"make": 'ford', "model": 'f-250', "year": 2016},
-    {"make": 'ford', "model": 'f-250', "year": 2015},
-    {"make": 'ford', "model": 'f-250', "year": 2014},
-    {"make": 'ford', "model": 'f-250', "year": 2013},
-    {"make": 'ford', "model": 'f-250', "year": 2012},
-    {"make": 'ford', "model": 'f-250', "year": 2011},
-    {"make": 'ford', "model": 'f-250', "year": 2010},
-    {"make": 'ford', "model": 'f-250', "year": 2009},
-    {"make": 'ford', "model": 'f-250', "year": 2008},
-    {"make": 'ford', "model": 'f-250', "year": 2007},
-    {"make": 'ford', "model": 'f-250', "year": 2006},
-    {"make": 'ford', "model": 'f-250', "year": 2005},
-    {"make": 'ford', "model": 'f-250 4x4 1-owner 94k ml.**new wheels & tires**6.2l', "year": 2015},
-    {"make": 'ford', "model": 'f-250 4x4 lifted', "year": 2016},
-    {"make": 'ford', "model": 'f-250 4x4 super duty 5.4l triton v8 ext cab short bed fabtech lift one owner', "year": 2006},
-    {"make": 'ford', "model": 'f-250 crew cab king ranch 4x4', "year": 2017},
-    {"make": 'ford', "model": 'f-250 crew cab king ranch 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f-250 crew cab lariat 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f-250 crew cab xl 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f-250 crew cab xlt 4x4', "year": 2011},
-    {"make": 'ford', "model": 'f-250 king ranch', "year": 2018},
-    {"make": 'ford', "model": 'f-250 king ranch', "year": 2008},
-    {"make": 'ford', "model": 'f-250 platinum crew cab 4wd', "year": 2016},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2017},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2016},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2015},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2014},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2013},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2011},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2008},
-    {"make": 'ford', "model": 'f-250 sd', "year": 2007},
-    {"make": 'ford', "model": 'f-250 stx', "year": 2017},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2020},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2019},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2018},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2017},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2016},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2015},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2014},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2013},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2012},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2011},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2010},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2009},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2007},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2006},
-    {"make": 'ford', "model": 'f-250 super duty', "year": 2005},
-    {"make": 'ford', "model": 'f-250 super duty 4x2 2dr re', "year": 2016},
-    {"make": 'ford', "model": 'f-250 super duty 4x2 2dr re', "year": 2015},
-    {"make": 'ford', "model": 'f-250 super duty crew 4x4 32k ml.1owner*new wheels 6.2l', "year": 2019},
-    {"make": 'ford', "model": 'f-250 super duty lariat', "year": 2016},
-    {"make": 'ford', "model": 'f-250 super duty lariat', "year": 2014},
-    {"make": 'ford', "model": 'f-250 super duty lariat crew 6.7 liter', "year": 2017},
-    {"make": 'ford', "model": 'f-250 super duty lariat lift 6.7 liter', "year": 2017},
-    {"make": 'ford', "model": 'f-250 super duty super duty', "year": 2015},
-    {"make": 'ford', "model": 'f-250 super duty super duty', "year": 2013},
-    {"make": 'ford', "model": 'f-250 super duty xl', "year": 2014},
-    {"make": 'ford', "model": 'f-250 super duty xlt', "year": 2017},
-    {"make": 'ford', "model": 'f-250 super duty xlt', "year": 2015},
-    {"make": 'ford', "model": 'f-250 super duty xlt', "year": 2014},
-    {"make": 'ford', "model": 'f-250 super duty xlt lifted crew', "year": 2017},
-    {"make": 'ford', "model": 'f-250 supercab 4x4', "year": 2011},
-    {"make": 'ford', "model": 'f-250 superduty lariat crew 6.7 liter', "year": 2017},
-    {"make": 'ford', "model": 'f-250 superduty lariat crew roush package 6.7 liter', "year": 2019},
-    {"make": 'ford', "model": 'f-250 superduty lifted stx 8ft 6.7l diesel', "year": 2020},
-    {"make": 'ford', "model": 'f-250 superduty xlt crew cab 6.7 liter', "year": 2015},
-    {"make": 'ford', "model": 'f-250 xlt', "year": 2017},
-    {"make": 'ford', "model": 'f-250 xlt maxed out 4x4', "year": 2019},
-    {"make": 'ford', "model": 'f-250sd', "year": 2020},
-    {"make": 'ford', "model": 'f-250sd', "year": 2019},
-    {"make": 'ford', "model": 'f-250sd', "year": 2017},
-    {"make": 'ford', "model": 'f-250sd', "year": 2016},
-    {"make": 'ford', "model": 'f-250sd', "year": 2015},
-    {"make": 'ford', "model": 'f-250sd', "year": 2012},
-    {"make": 'ford', "model": 'f-250sd xlt 4wd!standard', "year": 2009},
-    {"make": 'ford', "model": 'f-350', "year": 2020},
-    {"make": 'ford', "model": 'f-350', "year": 2019},
-    {"make": 'ford', "model": 'f-350', "year": 2018},
-    {"make": 'ford', "model": 'f-350', "year": 2017},
-    {"make": 'ford', "model": 'f-350', "year": 2016},
-    {"make": 'ford', "model": 'f-350', "year": 2015},
-    {"make": 'ford', "model": 'f-350', "year": 2014},
-    {"make": 'ford', "model": 'f-350', "year": 2013},
-    {"make": 'ford', "model": 'f-350', "year": 2012},
-    {"make": 'ford', "model": 'f-350', "year": 2011},
-    {"make": 'ford', "model": 'f-350', "year": 2010},
-    {"make": 'ford', "model": 'f-350', "year": 2009},
-    {"make": 'ford', "model": 'f-350', "year": 2008},
-    {"make": 'ford', "model": 'f-350', "year": 2007},
-    {"make": 'ford', "model": 'f-350', "year": 2006},
-    {"make": 'ford', "model": 'f-350', "year": 2005},
-    {"make": 'ford', "model": 'f-350 crew cab dump bed 4x4 drw', "year": 2012},
-    {"make": 'ford', "model": 'f-350 crew cab lariat 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f-350 crew cab lariat 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f-350 crew cab lariat 4x4 drw', "year": 2011},
-    {"make": 'ford', "model": 'f-350 crew cab, lariat,', "year": 2016},
-    {"make": 'ford', "model": 'f-350 diesel', "year": 2016},
-    {"make": 'ford', "model": 'f-350 drw 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f-350 dually crew cab', "year": 2019},
-    {"make": 'ford', "model": 'f-350 ext cab 6.7 diesel', "year": 2012},
-    {"make": 'ford', "model": 'f-350 ext cab xl 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f-350 lariat crewcab dually', "year": 2018},
-    {"make": 'ford', "model": 'f-350 lariat superduty crew drw 4x4 6.7', "year": 2017},
-    {"make": 'ford', "model": 'f-350 lariat ultimate lifted diesel only 49k mles loaded', "year": 2017},
-    {"make": 'ford', "model": 'f-350 lifted f350 lariat 6.7l power stroke diesel 4x4', "year": 2017},
-    {"make": 'ford', "model": 'f-350 lifted super duty power stroke diesel loaded', "year": 2020},
-    {"make": 'ford', "model": 'f-350 platinum ultimate', "year": 2018},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2018},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2016},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2015},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2013},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2012},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2011},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2008},
-    {"make": 'ford', "model": 'f-350 sd', "year": 2006},
-    {"make": 'ford', "model": 'f-350 sd lariat crew cab 4x', "year": 2011},
-    {"make": 'ford', "model": 'f-350 super dut', "year": 2013},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2019},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2018},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2017},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2016},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2015},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2014},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2013},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2012},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2011},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2009},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2007},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2006},
-    {"make": 'ford', "model": 'f-350 super duty', "year": 2005},
-    {"make": 'ford', "model": 'f-350 super duty 4x2 2dr re', "year": 2016},
-    {"make": 'ford', "model": 'f-350 super duty 4x2 2dr re', "year": 2013},
-    {"make": 'ford', "model": 'f-350 super duty crew cab xlt 6.7 liter', "year": 2016},
-    {"make": 'ford', "model": 'f-350 super duty lariat', "year": 2016},
-    {"make": 'ford', "model": 'f-350 super duty lariat crew 8ft lb 6.7 liter', "year": 2017},
-    {"make": 'ford', "model": "f-350 super duty platinum lifted diesel on 37's", "year": 2019},
-    {"make": 'ford', "model": 'f-350 super duty super duty', "year": 2012},
-    {"make": 'ford', "model": 'f-350 superduty lariat crew drw', "year": 2013},
-    {"make": 'ford', "model": 'f-350 superduty platinum drw 4wd', "year": 2016},
-    {"make": 'ford', "model": 'f-350 superduty xlt drw 6.7 liter diesel', "year": 2017},
-    {"make": 'ford', "model": 'f-350 utility truck', "year": 2010},
-    {"make": 'ford', "model": 'f-350 xl', "year": 2015},
-    {"make": 'ford', "model": 'f-350 xl 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f-350 xl extended cab util', "year": 2012},
-    {"make": 'ford', "model": 'f-350 xlt 4x4', "year": 2011},
-    {"make": 'ford', "model": 'f-350 xlt lariat', "year": 2017},
-    {"make": 'ford', "model": 'f-350sd', "year": 2020},
-    {"make": 'ford', "model": 'f-350sd', "year": 2019},
-    {"make": 'ford', "model": 'f-350sd', "year": 2017},
-    {"make": 'ford', "model": 'f-350sd', "year": 2016},
-    {"make": 'ford', "model": 'f-350sd', "year": 2015},
-    {"make": 'ford', "model": 'f-350sd', "year": 2014},
-    {"make": 'ford', "model": 'f-350sd', "year": 2013},
-    {"make": 'ford', "model": 'f-350sd', "year": 2012},
-    {"make": 'ford', "model": 'f-450', "year": 2017},
-    {"make": 'ford', "model": 'f-450', "year": 2015},
-    {"make": 'ford', "model": 'f-450', "year": 2013},
-    {"make": 'ford', "model": 'f-450', "year": 2012},
-    {"make": 'ford', "model": 'f-450', "year": 2011},
-    {"make": 'ford', "model": 'f-450', "year": 2008},
-    {"make": 'ford', "model": 'f-450', "year": 2006},
-    {"make": 'ford', "model": 'f-450 crew cab dump truck 6', "year": 2015},
-    {"make": 'ford', "model": 'f-450 sd', "year": 2011},
-    {"make": 'ford', "model": 'f-450 super duty', "year": 2016},
-    {"make": 'ford', "model": 'f-450 super duty', "year": 2014},
-    {"make": 'ford', "model": 'f-450 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f-450 super duty drw platinum', "year": 2019},
-    {"make": 'ford', "model": 'f-450 super duty lariat', "year": 2017},
-    {"make": 'ford', "model": 'f-450 super duty lariat', "year": 2011},
-    {"make": 'ford', "model": 'f-450 super duty superduty platinum drw 4wd', "year": 2016},
-    {"make": 'ford', "model": 'f-450sd', "year": 2019},
-    {"make": 'ford', "model": 'f-450sd', "year": 2018},
-    {"make": 'ford', "model": 'f-450sd', "year": 2015},
-    {"make": 'ford', "model": 'f-450sd', "year": 2012},
-    {"make": 'ford', "model": 'f-450sd', "year": 2011},
-    {"make": 'ford', "model": 'f-550', "year": 2020},
-    {"make": 'ford', "model": 'f-550', "year": 2018},
-    {"make": 'ford', "model": 'f-550', "year": 2016},
-    {"make": 'ford', "model": 'f-550', "year": 2015},
-    {"make": 'ford', "model": 'f-550', "year": 2014},
-    {"make": 'ford', "model": 'f-550', "year": 2013},
-    {"make": 'ford', "model": 'f-550', "year": 2012},
-    {"make": 'ford', "model": 'f-550', "year": 2011},
-    {"make": 'ford', "model": 'f-550', "year": 2008},
-    {"make": 'ford', "model": 'f-550', "year": 2006},
-    {"make": 'ford', "model": "f-550 12' utility truck", "year": 2012},
-    {"make": 'ford', "model": 'f-550 crew cab flat bed xlt 4x4 drw', "year": 2011},
-    {"make": 'ford', "model": 'f-550 super duty', "year": 2017},
-    {"make": 'ford', "model": 'f-550 super duty', "year": 2009},
-    {"make": 'ford', "model": 'f-550 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f-550 super duty 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f-550sd', "year": 2016},
-    {"make": 'ford', "model": 'f-650', "year": 2009},
-    {"make": 'ford', "model": 'f-650', "year": 2008},
-    {"make": 'ford', "model": 'f-650', "year": 2005},
-    {"make": 'ford', "model": 'f-650 dump', "year": 2007},
-    {"make": 'ford', "model": 'f-650 sd', "year": 2017},
-    {"make": 'ford', "model": 'f-750', "year": 2011},
-    {"make": 'ford', "model": 'f-750', "year": 2009},
-    {"make": 'ford', "model": 'f-750', "year": 2007},
-    {"make": 'ford', "model": 'f-750sd', "year": 2017},
-    {"make": 'ford', "model": 'f-super duty', "year": 2021},
-    {"make": 'ford', "model": 'f150', "year": 2019},
-    {"make": 'ford', "model": 'f150', "year": 2018},
-    {"make": 'ford', "model": 'f150', "year": 2017},
-    {"make": 'ford', "model": 'f150', "year": 2016},
-    {"make": 'ford', "model": 'f150', "year": 2015},
-    {"make": 'ford', "model": 'f150', "year": 2014},
-    {"make": 'ford', "model": 'f150', "year": 2013},
-    {"make": 'ford', "model": 'f150', "year": 2012},
-    {"make": 'ford', "model": 'f150', "year": 2011},
-    {"make": 'ford', "model": 'f150', "year": 2010},
-    {"make": 'ford', "model": 'f150', "year": 2009},
-    {"make": 'ford', "model": 'f150', "year": 2008},
-    {"make": 'ford', "model": 'f150', "year": 2007},
-    {"make": 'ford', "model": 'f150', "year": 2006},
-    {"make": 'ford', "model": 'f150', "year": 2005},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2012},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2011},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2010},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2009},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2008},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2007},
-    {"make": 'ford', "model": 'f150 4x4', "year": 2005},
-    {"make": 'ford', "model": 'f150 fx4', "year": 2013},
-    {"make": 'ford', "model": 'f150 fx4', "year": 2012},
-    {"make": 'ford', "model": 'f150 fx4', "year": 2011},
-    {"make": 'ford', "model": 'f150 fx4', "year": 2010},
-    {"make": 'ford', "model": 'f150 fx4 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f150 fx4 4x4 1/2 ton gas', "year": 2013},
-    {"make": 'ford', "model": 'f150 fx4 4x4 half ton gas', "year": 2013},
-    {"make": 'ford', "model": 'f150 fx4 ecoboost', "year": 2013},
-    {"make": 'ford', "model": 'f150 king ranch fx4 4x4 gas', "year": 2017},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2020},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2018},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2017},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2015},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2013},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2011},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2010},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2008},
-    {"make": 'ford', "model": 'f150 lariat', "year": 2005},
-    {"make": 'ford', "model": 'f150 lariat 4wd', "year": 2020},
-    {"make": 'ford', "model": 'f150 lariat 4wd f-150', "year": 2020},
-    {"make": 'ford', "model": 'f150 lariat 4wd f-150 4x4', "year": 2020},
-    {"make": 'ford', "model": 'f150 lariat 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f150 lariat 4x4 1/2 ton gas', "year": 2018},
-    {"make": 'ford', "model": 'f150 lariat 4x4 half ton', "year": 2019},
-    {"make": 'ford', "model": 'f150 lariat 4x4 half ton', "year": 2018},
-    {"make": 'ford', "model": 'f150 lariat 4x4 half ton', "year": 2017},
-    {"make": 'ford', "model": 'f150 lariat 4x4 half ton', "year": 2016},
-    {"make": 'ford', "model": 'f150 lariat fx4 4x4 1/2 ton', "year": 2019},
-    {"make": 'ford', "model": 'f150 lariat fx4 4x4 1/2 ton', "year": 2018},
-    {"make": 'ford', "model": 'f150 lariat sport 4x4 gas', "year": 2019},
-    {"make": 'ford', "model": 'f150 lariat sport 4x4 gas', "year": 2018},
-    {"make": 'ford', "model": 'f150 lariat supercrew 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f150 lariat supercrew 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f150 lariat supercrew 4x4', "year": 2012},
-    {"make": 'ford', "model": 'f150 limited', "year": 2013},
-    {"make": 'ford', "model": 'f150 pickup', "year": 2016},
-    {"make": 'ford', "model": 'f150 platinum', "year": 2010},
-    {"make": 'ford', "model": 'f150 platinum fx4 4x4 gas', "year": 2016},
-    {"make": 'ford', "model": 'f150 regular cab', "year": 2014},
-    {"make": 'ford', "model": 'f150 regular cab', "year": 2013},
-    {"make": 'ford', "model": 'f150 regular cab', "year": 2007},
-    {"make": 'ford', "model": 'f150 regular cab', "year": 2005},
-    {"make": 'ford', "model": 'f150 regular cab xl pickup', "year": 2020},
-    {"make": 'ford', "model": 'f150 regular cab xl pickup', "year": 2019},
-    {"make": 'ford', "model": 'f150 regular cab xl pickup', "year": 2016},
-    {"make": 'ford', "model": 'f150 regular cab xlt pickup', "year": 2020},
-    {"make": 'ford', "model": 'f150 regular cab xlt pickup', "year": 2019},
-    {"make": 'ford', "model": 'f150 stx', "year": 2020},
-    {"make": 'ford', "model": 'f150 stx', "year": 2018},
-    {"make": 'ford', "model": 'f150 stx 4wd', "year": 2018},
-    {"make": 'ford', "model": 'f150 stx 4x4 half ton gas', "year": 2019},
-    {"make": 'ford', "model": 'f150 super cab', "year": 2015},
-    {"make": 'ford', "model": 'f150 super cab', "year": 2014},
-    {"make": 'ford', "model": 'f150 super cab', "year": 2013},
-    {"make": 'ford', "model": 'f150 super cab', "year": 2011},
-    {"make": 'ford', "model": 'f150 super cab', "year": 2010},
-    {"make": 'ford', "model": 'f150 super cab lariat', "year": 2018},
-    {"make": 'ford', "model": 'f150 super cab lariat', "year": 2017},
-    {"make": 'ford', "model": 'f150 super cab stx pickup', "year": 2013},
-    {"make": 'ford', "model": 'f150 super cab xl pickup 4d', "year": 2018},
-    {"make": 'ford', "model": 'f150 super cab xl pickup 4d', "year": 2016},
-    {"make": 'ford', "model": 'f150 super cab xl pickup 4d', "year": 2014},
-    {"make": 'ford', "model": 'f150 super cab xl pickup 4d', "year": 2013},
-    {"make": 'ford', "model": 'f150 super cab xlt pickup', "year": 2020},
-    {"make": 'ford', "model": 'f150 super cab xlt pickup', "year": 2019},
-    {"make": 'ford', "model": 'f150 super cab xlt pickup', "year": 2018},
-    {"make": 'ford', "model": 'f150 super cab xlt pickup', "year": 2015},
-    {"make": 'ford', "model": 'f150 super cab xlt pickup', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercab stx 4x4', "year": 2019},
-    {"make": 'ford', "model": 'f150 supercrew', "year": 2015},
-    {"make": 'ford', "model": 'f150 supercrew 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2020},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2018},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2017},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2016},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2015},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2013},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2012},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2011},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2010},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2009},
-    {"make": 'ford', "model": 'f150 supercrew cab', "year": 2005},
-    {"make": 'ford', "model": 'f150 supercrew cab fx2', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercrew cab fx4', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercrew cab fx4', "year": 2013},
-    {"make": 'ford', "model": 'f150 supercrew cab king', "year": 2017},
-    {"make": 'ford', "model": 'f150 supercrew cab king', "year": 2015},
-    {"make": 'ford', "model": 'f150 supercrew cab lariat', "year": 2020},
-    {"make": 'ford', "model": 'f150 supercrew cab lariat', "year": 2019},
-    {"make": 'ford', "model": 'f150 supercrew cab lariat', "year": 2018},
-    {"make": 'ford', "model": 'f150 supercrew cab lariat', "year": 2016},
-    {"make": 'ford', "model": 'f150 supercrew cab lariat', "year": 2015},
-    {"make": 'ford', "model": 'f150 supercrew cab lariat', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercrew cab platinum', "year": 2013},
-    {"make": 'ford', "model": 'f150 supercrew cab svt', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercrew cab xl', "year": 2020},
-    {"make": 'ford', "model": 'f150 supercrew cab xl', "year": 2019},
-    {"make": 'ford', "model": 'f150 supercrew cab xl', "year": 2018},
-    {"make": 'ford', "model": 'f150 supercrew cab xl', "year": 2015},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2020},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2019},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2018},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2017},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2016},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2015},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2014},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2013},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2012},
-    {"make": 'ford', "model": 'f150 supercrew cab xlt', "year": 2010},
-    {"make": 'ford', "model": 'f150 xl', "year": 2014},
-    {"make": 'ford', "model": 'f150 xl', "year": 2013},
-    {"make": 'ford', "model": 'f150 xl', "year": 2012},
-    {"make": 'ford', "model": 'f150 xl', "year": 2008},
-    {"make": 'ford', "model": 'f150 xl', "year": 2007},
-    {"make": 'ford', "model": 'f150 xl', "year": 2005},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2015},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2014},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2013},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2012},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2011},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2010},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2009},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2008},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2007},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2006},
-    {"make": 'ford', "model": 'f150 xlt', "year": 2005},
-    {"make": 'ford', "model": 'f150 xlt 4wd', "year": 2020},
-    {"make": 'ford', "model": 'f150 xlt 4wd', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt 4wd', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt 4wd', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt 4wd f-150 4x4', "year": 2020},
-    {"make": 'ford', "model": 'f150 xlt 4wd f-150 4x4', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt 4wd f-150 4x4', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt 4x4', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt 4x4', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f150 xlt 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f150 xlt 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f150 xlt 4x4', "year": 2010},
-    {"make": 'ford', "model": 'f150 xlt 4x4 1/2 ton gas', "year": 2020},
-    {"make": 'ford', "model": 'f150 xlt 4x4 1/2 ton gas', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt 4x4 1/2 ton gas', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt 4x4 1/2 ton gas', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt 4x4 1/2 ton gas', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt 4x4 1/2 ton gas', "year": 2015},
-    {"make": 'ford', "model": 'f150 xlt 4x4 half ton gas', "year": 2020},
-    {"make": 'ford', "model": 'f150 xlt 4x4 half ton gas', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt 4x4 half ton gas', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt 4x4 half ton gas', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt 4x4 half ton gas', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt 4x4 half ton gas', "year": 2015},
-    {"make": 'ford', "model": 'f150 xlt fx4 4x4 1/2 ton', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt fx4 4x4 half ton', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt fx4 4x4 half ton', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt sport 4x4 1/2 ton', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt sport 4x4 1/2 ton', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt sport 4x4 1/2 ton', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt sport 4x4 half ton', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt sport 4x4 half ton', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt sport 4x4 half ton', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt supercrew', "year": 2016},
-    {"make": 'ford', "model": 'f150 xlt supercrew', "year": 2015},
-    {"make": 'ford', "model": 'f150 xlt xtr 4x4 1/2 ton', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt xtr 4x4 1/2 ton', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt xtr 4x4 1/2 ton', "year": 2017},
-    {"make": 'ford', "model": 'f150 xlt xtr 4x4 half ton', "year": 2019},
-    {"make": 'ford', "model": 'f150 xlt xtr 4x4 half ton', "year": 2018},
-    {"make": 'ford', "model": 'f150 xlt xtr 4x4 half ton', "year": 2017},
-    {"make": 'ford', "model": 'f250', "year": 2020},
-    {"make": 'ford', "model": 'f250', "year": 2019},
-    {"make": 'ford', "model": 'f250', "year": 2018},
-    {"make": 'ford', "model": 'f250', "year": 2017},
-    {"make": 'ford', "model": 'f250', "year": 2016},
-    {"make": 'ford', "model": 'f250', "year": 2015},
-    {"make": 'ford', "model": 'f250', "year": 2014},
-    {"make": 'ford', "model": 'f250', "year": 2013},
-    {"make": 'ford', "model": 'f250', "year": 2012},
-    {"make": 'ford', "model": 'f250', "year": 2011},
-    {"make": 'ford', "model": 'f250', "year": 2010},
-    {"make": 'ford', "model": 'f250', "year": 2009},
-    {"make": 'ford', "model": 'f250', "year": 2008},
-    {"make": 'ford', "model": 'f250', "year": 2007},
-    {"make": 'ford', "model": 'f250', "year": 2006},
-    {"make": 'ford', "model": 'f250', "year": 2005},
-    {"make": 'ford', "model": 'f250 4wd', "year": 2019},
-    {"make": 'ford', "model": 'f250 4wd', "year": 2018},
-    {"make": 'ford', "model": 'f250 4x4', "year": 2018},
-    {"make": 'ford', "model": 'f250 4x4 platinum', "year": 2017},
-    {"make": 'ford', "model": 'f250 cng', "year": 2013},
-    {"make": 'ford', "model": 'f250 crew', "year": 2017},
-    {"make": 'ford', "model": 'f250 crew 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f250 ext cab', "year": 2015},
-    {"make": 'ford', "model": 'f250 ext cab 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f250 extra cab 4x4 diesel', "year": 2008},
-    {"make": 'ford', "model": 'f250 king ranch', "year": 2020},
-    {"make": 'ford', "model": 'f250 king ranch', "year": 2018},
-    {"make": 'ford', "model": 'f250 king ranch', "year": 2013},
-    {"make": 'ford', "model": 'f250 lariat', "year": 2006},
-    {"make": 'ford', "model": 'f250 lariat', "year": 2005},
-    {"make": 'ford', "model": 'f250 lariat 4x4 diesel', "year": 2019},
-    {"make": 'ford', "model": 'f250 lariat 4x4 diesel', "year": 2017},
-    {"make": 'ford', "model": 'f250 platinum 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f250 sd xlt', "year": 2017},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2019},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2017},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2016},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2015},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2014},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2013},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2012},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2011},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2010},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2009},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2007},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2006},
-    {"make": 'ford', "model": 'f250 super duty', "year": 2005},
-    {"make": 'ford', "model": 'f250 super duty 4x4', "year": 2016},
-    {"make": 'ford', "model": 'f250 super duty 4x4', "year": 2015},
-    {"make": 'ford', "model": 'f250 super duty 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f250 super duty 4x4', "year": 2012},
-    {"make": 'ford', "model": 'f250 super duty 4x4', "year": 2006},
-    {"make": 'ford', "model": 'f250 super duty cab xl', "year": 2016},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2019},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2017},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2016},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2015},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2014},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2012},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2011},
-    {"make": 'ford', "model": 'f250 super duty crew cab', "year": 2009},
-    {"make": 'ford', "model": 'f250 super duty crew cab xl', "year": 2020},
-    {"make": 'ford', "model": 'f250 super duty lariat', "year": 2019},
-    {"make": 'ford', "model": 'f250 super duty lariat', "year": 2015},
-    {"make": 'ford', "model": 'f250 super duty lariat', "year": 2012},
-    {"make": 'ford', "model": 'f250 super duty lariat', "year": 2011},
-    {"make": 'ford', "model": 'f250 super duty platinum', "year": 2014},
-    {"make": 'ford', "model": 'f250 super duty platinum', "year": 2013},
-    {"make": 'ford', "model": 'f250 super duty regular cab', "year": 2019},
-    {"make": 'ford', "model": 'f250 super duty super cab', "year": 2005},
-    {"make": 'ford', "model": 'f250 super duty xl', "year": 2012},
-    {"make": 'ford', "model": 'f250 super duty xlt', "year": 2018},
-    {"make": 'ford', "model": 'f250 super duty xlt', "year": 2016},
-    {"make": 'ford', "model": 'f250 super duty xlt', "year": 2015},
-    {"make": 'ford', "model": 'f250 super duty xlt', "year": 2006},
-    {"make": 'ford', "model": 'f250 xl super duty', "year": 2012},
-    {"make": 'ford', "model": 'f250sd', "year": 2015},
-    {"make": 'ford', "model": 'f350', "year": 2019},
-    {"make": 'ford', "model": 'f350', "year": 2017},
-    {"make": 'ford', "model": 'f350', "year": 2016},
-    {"make": 'ford', "model": 'f350', "year": 2015},
-    {"make": 'ford', "model": 'f350', "year": 2014},
-    {"make": 'ford', "model": 'f350', "year": 2013},
-    {"make": 'ford', "model": 'f350', "year": 2012},
-    {"make": 'ford', "model": 'f350', "year": 2011},
-    {"make": 'ford', "model": 'f350', "year": 2009},
-    {"make": 'ford', "model": 'f350', "year": 2008},
-    {"make": 'ford', "model": 'f350', "year": 2007},
-    {"make": 'ford', "model": 'f350', "year": 2006},
-    {"make": 'ford', "model": 'f350', "year": 2005},
-    {"make": 'ford', "model": 'f350 diesel power stroke', "year": 2019},
-    {"make": 'ford', "model": 'f350 diesel power stroke', "year": 2017},
-    {"make": 'ford', "model": 'f350 diesel powerstroke 4x4', "year": 2014},
-    {"make": 'ford', "model": 'f350 diesel powerstroke fx4', "year": 2018},
-    {"make": 'ford', "model": 'f350 diesel powerstroke fx4', "year": 2017},
-    {"make": 'ford', "model": 'f350 diesels powerstroke', "year": 2020},
-    {"make": 'ford', "model": 'f350 ext cab', "year": 2012},
-    {"make": 'ford', "model": 'f350 lariat', "year": 2013},
-    {"make": 'ford', "model": 'f350 lariat', "year": 2006},
-    {"make": 'ford', "model": 'f350 lariat', "year": 2005},
-    {"make": 'ford', "model": 'f350 lariat srw 4x4', "year": 2013},
-    {"make": 'ford', "model": 'f350 power stroke lariat', "year": 2017},
-    {"make": 'ford', "model": 'f350 powerstroke lariat', "year": 2020},
-    {"make": 'ford', "model": 'f350 powerstroke lariat', "year": 2019},
-    {"make": 'ford', "model": 'f350 powerstroke lariat', "year": 2017},
-    {"make": 'ford', "model": 'f350 powerstroke xlt 4x4', "year": 2019},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2017},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2016},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2015},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2014},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2013},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2012},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2011},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2010},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2009},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2007},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2006},
-    {"make": 'ford', "model": 'f350 super duty', "year": 2005},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2018},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2017},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2016},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2015},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2014},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2012},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2011},
-    {"make": 'ford', "model": 'f350 super duty crew cab', "year": 2008},
-    {"make": 'ford', "model": 'f350 super duty diesel', "year": 2011},
-    {"make": 'ford', "model": 'f350 super duty larait', "year": 2015},
-    {"make": 'ford', "model": 'f350 super duty lariat', "year": 2016},
-    {"make": 'ford', "model": 'f350 super duty lariat', "year": 2011},
-    {"make": 'ford', "model": 'f350 super duty lariat', "year": 2005},
-    {"make": 'ford', "model": 'f350 super duty regular cab & chassis', "year": 2016},
-    {"make": 'ford', "model": 'f350 work truck', "year": 2008},
-    {"make": 'ford', "model": 'f350 xl', "year": 2008},
-    {"make": 'ford', "model": 'f350 xl', "year": 2006},
-    {"make": 'ford', "model": 'f450', "year": 2012},
-    {"make": 'ford', "model": 'f450', "year": 2008},
-    {"make": 'ford', "model": 'f450', "year": 2006},
-    {"make": 'ford', "model": 'f450', "year": 2005},
-    {"make": 'ford', "model": "f450 12' stake bed", "year": 2005},
-    {"make": 'ford', "model": 'f450 super duty', "year": 2012},
-    {"make": 'ford', "model": 'f450 super duty', "year": 2011},
-    {"make": 'ford', "model": 'f450 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f450 super duty', "year": 2006},
-    {"make": 'ford', "model": 'f450 super duty crew cab', "year": 2014},
-    {"make": 'ford', "model": 'f450 super duty king ranch', "year": 2014},
-    {"make": 'ford', "model": 'f450 super duty regular cab & chassis', "year": 2019},
-    {"make": 'ford', "model": 'f450 xl', "year": 2008},
-    {"make": 'ford', "model": 'f450 xl', "year": 2007},
-    {"make": 'ford', "model": 'f450 xl', "year": 2005},
-    {"make": 'ford', "model": 'f550', "year": 2013},
-    {"make": 'ford', "model": 'f550', "year": 2012},
-    {"make": 'ford', "model": 'f550', "year": 2008},
-    {"make": 'ford', "model": 'f550', "year": 2007},
-    {"make": 'ford', "model": 'f550', "year": 2006},
-    {"make": 'ford', "model": 'f550', "year": 2005},
-    {"make": 'ford', "model": 'f550 4x4 crew cab', "year": 2013},
-    {"make": 'ford', "model": 'f550 lariat', "year": 2010},
-    {"make": 'ford', "model": 'f550 super duty', "year": 2019},
-    {"make": 'ford', "model": 'f550 super duty', "year": 2018},
-    {"make": 'ford', "model": 'f550 super duty', "year": 2016},
-    {"make": 'ford', "model": 'f550 super duty', "year": 2010},
-    {"make": 'ford', "model": 'f550 super duty', "year": 2008},
-    {"make": 'ford', "model": 'f550 super duty regular cab & chassis', "year": 2014},
-    {"make": 'ford', "model": 'f550 xl', "year": 2014},
-    {"make": 'ford', "model": 'f650 crew cab', "year": 2015},
-    {"make": 'ford', "model": 'f750', "year": 2015},
-    {"make": 'ford', "model": 'f750', "year": 2013},
-    {"make": 'ford', "model": 'f750', "year": 2005},
-    {"make": 'ford', "model": 'f750 xl', "year": 2007},
-    {"make": 'ford', "model": 'fiesta', "year": 2019},
-    {"make": 'ford', "model": 'fiesta', "year": 2018},
-    {"make": 'ford', "model": 'fiesta', "year": 2017},
-    {"make": 'ford', "model": 'fiesta', "year": 2016},
-    {"make": 'ford', "model": 'fiesta', "year": 2015},
-    {"make": 'ford', "model": 'fiesta', "year": 2014},
-    {"make": 'ford', "model": 'fiesta', "year": 2013},
-    {"make": 'ford', "model": 'fiesta', "year": 2012},
-    {"make": 'ford', "model": 'fiesta', "year": 2011},
-    {"make": 'ford', "model": 'fiesta s', "year": 2016},
-    {"make": 'ford', "model": 'fiesta se', "year": 2019},
-    {"make": 'ford', "model": 'fiesta se', "year": 2018},
-    {"make": 'ford', "model": 'fiesta se', "year": 2017},
-    {"make": 'ford', "model": 'fiesta se', "year": 2016},
-    {"make": 'ford', "model": 'fiesta se', "year": 2015},
-    {"make": 'ford', "model": 'fiesta se', "year": 2014},
-    {"make": 'ford', "model": 'fiesta se', "year": 2013},
-    {"make": 'ford', "model": 'fiesta se', "year": 2012},
-    {"make": 'ford', "model": 'fiesta se', "year": 2011},
-    {"make": 'ford', "model": 'fiesta se - new tires - gas saver - just smogged -', "year": 2016},
-    {"make": 'ford', "model": 'fiesta se w/ backup camera', "year": 2018},
-    {"make": 'ford', "model": 'fiesta sel', "year": 2012},
-    {"make": 'ford', "model": 'fiesta sel', "year": 2011},
-    {"make": 'ford', "model": 'fiesta ses', "year": 2011},
-    {"make": 'ford', "model": 'fiesta st', "year": 2016},
-    {"make": 'ford', "model": 'fiesta st', "year": 2014},
-    {"make": 'ford', "model": 'fiesta st hatchback 4d', "year": 2018},
-    {"make": 'ford', "model": 'fiesta st hatchback 4d', "year": 2017},
-    {"make": 'ford', "model": 'fiesta st hatchback 4d', "year": 2016},
-    {"make": 'ford', "model": 'fiesta st hatchback 4d', "year": 2015},
-    {"make": 'ford', "model": 'fiesta titanium', "year": 2016},
-    {"make": 'ford', "model": 'five hundred', "year": 2007},
-    {"make": 'ford', "model": 'five hundred', "year": 2006},
-    {"make": 'ford', "model": 'five hundred', "year": 2005},
-    {"make": 'ford', "model": 'five hundred sel', "year": 2005},
-    {"make": 'ford', "model": 'flex', "year": 2019},
-    {"make": 'ford', "model": 'flex', "year": 2018},
-    {"make": 'ford', "model": 'flex', "year": 2017},
-    {"make": 'ford', "model": 'flex', "year": 2016},
-    {"make": 'ford', "model": 'flex', "year": 2015},
-    {"make": 'ford', "model": 'flex', "year": 2014},
-    {"make": 'ford', "model": 'flex', "year": 2013},
-    {"make": 'ford', "model": 'flex', "year": 2012},
-    {"make": 'ford', "model": 'flex', "year": 2011},
-    {"make": 'ford', "model": 'flex', "year": 2010},
-    {"make": 'ford', "model": 'flex', "year": 2009},
-    {"make": 'ford', "model": 'flex limited', "year": 2014},
-    {"make": 'ford', "model": 'flex limited awd', "year": 2013},
-    {"make": 'ford', "model": 'flex limited awd', "year": 2009},
-    {"make": 'ford', "model": 'flex limited sport utility', "year": 2019},
-    {"make": 'ford', "model": 'flex se', "year": 2014},
-    {"make": 'ford', "model": 'flex se', "year": 2009},
-    {"make": 'ford', "model": 'flex se sport utility 4d', "year": 2018},
-    {"make": 'ford', "model": 'flex sel', "year": 2018},
-    {"make": 'ford', "model": 'flex sel', "year": 2014},
-    {"make": 'ford', "model": 'flex sel', "year": 2013},
-    {"make": 'ford', "model": 'flex sel', "year": 2012},
-    {"make": 'ford', "model": 'flex sel', "year": 2010},
-    {"make": 'ford', "model": 'flex sel', "year": 2009},
-    {"make": 'ford', "model": 'flex sel awd', "year": 2015},
-    {"make": 'ford', "model": 'flex sel awd', "year": 2014},
-    {"make": 'ford', "model": 'flex sel sport utility 4d', "year": 2012},
-    {"make": 'ford', "model": 'focus', "year": 2018},
-    {"make": 'ford', "model": 'focus', "year": 2017},
-    {"make": 'ford', "model": 'focus', "year": 2016},
-    {"make": 'ford', "model": 'focus', "year": 2015},
-    {"make": 'ford', "model": 'focus', "year": 2014},
-    {"make": 'ford', "model": 'focus', "year": 2013},
-    {"make": 'ford', "model": 'focus', "year": 2012},
-    {"make": 'ford', "model": 'focus', "year": 2011},
-    {"make": 'ford', "model": 'focus', "year": 2010},
-    {"make": 'ford', "model": 'focus', "year": 2009},
-    {"make": 'ford', "model": 'focus', "year": 2008},
-    {"make": 'ford', "model": 'focus', "year": 2007},
-    {"make": 'ford', "model": 'focus', "year": 2006},
-    {"make": 'ford', "model": 'focus', "year": 2005},
-    {"make": 'ford', "model": 'focus electric hatchback 4d', "year": 2017},
-    {"make": 'ford', "model": 'focus electric hatchback 4d', "year": 2016},
-    {"make": 'ford', "model": 'focus electric hatchback 4d', "year": 2014},
-    {"make": 'ford', "model": 'focus s', "year": 2009},
-    {"make": 'ford', "model": 'focus s sedan 4d', "year": 2018},
-    {"make": 'ford', "model": 'focus se', "year": 2018},
-    {"make": 'ford', "model": 'focus se', "year": 2017},
-    {"make": 'ford', "model": 'focus se', "year": 2016},
-    {"make": 'ford', "model": 'focus se', "year": 2015},
-    {"make": 'ford', "model": 'focus se', "year": 2014},
-    {"make": 'ford', "model": 'focus se', "year": 2013},
-    {"make": 'ford', "model": 'focus se', "year": 2012},
-    {"make": 'ford', "model": 'focus se', "year": 2011},
-    {"make": 'ford', "model": 'focus se', "year": 2010},
-    {"make": 'ford', "model": 'focus se', "year": 2009},
-    {"make": 'ford', "model": 'focus se', "year": 2008},
-    {"make": 'ford', "model": 'focus se', "year": 2007},
-    {"make": 'ford', "model": 'focus se hatchback', "year": 2016},
-    {"make": 'ford', "model": 'focus se hatchback', "year": 2015},
-    {"make": 'ford', "model": 'focus se hatchback', "year": 2014},
-    {"make": 'ford', "model": 'focus se hatchback', "year": 2013},
-    {"make": 'ford', "model": 'focus se hatchback', "year": 2012},
-    {"make": 'ford', "model": 'focus se hatchback 4d', "year": 2018},
-    {"make": 'ford', "model": 'focus se hatchback 4d', "year": 2015},
-    {"make": 'ford', "model": 'focus se sedan', "year": 2014},
-    {"make": 'ford', "model": 'focus se sedan', "year": 2013},
-    {"make": 'ford', "model": 'focus se sedan 4d', "year": 2018},
-    {"make": 'ford', "model": 'focus se sedan 4d', "year": 2017},
-    {"make": 'ford', "model": 'focus sel', "year": 2018},
-    {"make": 'ford', "model": 'focus sel', "year": 2012},
-    {"make": 'ford', "model": 'focus sel', "year": 2011},
-    {"make": 'ford', "model": 'focus ses', "year": 2010},
-    {"make": 'ford', "model": 'focus ses', "year": 2009},
-    {"make": 'ford', "model": 'focus ses', "year": 2008},
-    {"make": 'ford', "model": 'focus ses', "year": 2007},
-    {"make": 'ford', "model": 'focus ses', "year": 2005},
-    {"make": 'ford', "model": 'focus st', "year": 2018},
-    {"make": 'ford', "model": 'focus st', "year": 2017},
-    {"make": 'ford', "model": 'focus st', "year": 2016},
-    {"make": 'ford', "model": 'focus st', "year": 2014},
-    {"make": 'ford', "model": 'focus st', "year": 2013},
-    {"make": 'ford', "model": 'focus st hatchback', "year": 2018},
-    {"make": 'ford', "model": 'focus st hatchback 4d', "year": 2018},
-    {"make": 'ford', "model": 'focus st hatchback 4d', "year": 2017},
-    {"make": 'ford', "model": 'focus st hatchback 4d', "year": 2016},
-    {"make": 'ford', "model": 'focus st hatchback 4d', "year": 2014},
-    {"make": 'ford', "model": 'focus titanium', "year": 2016},
-    {"make": 'ford', "model": 'focus titanium', "year": 2014},
-    {"make": 'ford', "model": 'focus titanium', "year": 2013},
-    {"make": 'ford', "model": 'focus titanium', "year": 2012},
-    {"make": 'ford', "model": 'focus titanium hatchback 4d', "year": 2018},
-    {"make": 'ford', "model": 'focus titanium hatchback 4d', "year": 2016},
-    {"make": 'ford', "model": 'focus titanium hatchback 4d', "year": 2015},
-    {"make": 'ford', "model": 'focus zx3', "year": 2005},
-    {"make": 'ford', "model": 'focus zx4', "year": 2007},
-    {"make": 'ford', "model": 'focus zx4', "year": 2005},
-    {"make": 'ford', "model": 'focus zx4 ses', "year": 2006},
-    {"make": 'ford', "model": 'freestar', "year": 2006},
-    {"make": 'ford', "model": 'freestar', "year": 2005},
-    {"make": 'ford', "model": 'freestar limited', "year": 2005},
-    {"make": 'ford', "model": 'freestar semini van', "year": 2006},
-    {"make": 'ford', "model": 'freestar ses', "year": 2005},
-    {"make": 'ford', "model": 'freestyle', "year": 2007},
-    {"make": 'ford', "model": 'freestyle', "year": 2006},
-    {"make": 'ford', "model": 'freestyle', "year": 2005},
-    {"make": 'ford', "model": 'freestyle limited', "year": 2006},
-    {"make": 'ford', "model": 'freestyle sel', "year": 2005},
-    {"make": 'ford', "model": 'fusion', "year": 2020},
-    {"make": 'ford', "model": 'fusion', "year": 2019},
-    {"make": 'ford', "model": 'fusion', "year": 2018},
-    {"make": 'ford', "model": 'fusion', "year": 2017},
-    {"make": 'ford', "model": 'fusion', "year": 2016},
-    {"make": 'ford', "model": 'fusion', "year": 2015},
-    {"make": 'ford', "model": 'fusion', "year": 2014},
-    {"make": 'ford', "model": 'fusion', "year": 2013},
-    {"make": 'ford', "model": 'fusion', "year": 2012},
-    {"make": 'ford', "model": 'fusion', "year": 2011},
-    {"make": 'ford', "model": 'fusion', "year": 2010},
-    {"make": 'ford', "model": 'fusion', "year": 2009},
-    {"make": 'ford', "model": 'fusion', "year": 2008},
-    {"make": 'ford', "model": 'fusion', "year": 2007},
-    {"make": 'ford', "model": 'fusion', "year": 2006},
-    {"make": 'ford', "model": 'fusion energi', "year": 2018},
-    {"make": 'ford', "model": 'fusion energi', "year": 2016},
-    {"make": 'ford', "model": 'fusion energi plug-in', "year": 2018},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2020},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2019},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2018},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2017},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2016},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2014},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2011},
-    {"make": 'ford', "model": 'fusion hybrid', "year": 2010},
-    {"make": 'ford', "model": 'fusion hybrid se', "year": 2018},
-    {"make": 'ford', "model": 'fusion hybrid sel', "year": 2019},
-    {"make": 'ford', "model": 'fusion platinum sedan 4d', "year": 2018},
-    {"make": 'ford', "model": 'fusion platinum sedan 4d', "year": 2017},
-    {"make": 'ford', "model": 'fusion s', "year": 2016},
-    {"make": 'ford', "model": 'fusion s', "year": 2014},
-    {"make": 'ford', "model": 'fusion se', "year": 2020},
-    {"make": 'ford', "model": 'fusion se', "year": 2019},
-    {"make": 'ford', "model": 'fusion se', "year": 2018},
-    {"make": 'ford', "model": 'fusion se', "year": 2017},
-    {"make": 'ford', "model": 'fusion se', "year": 2016},
-    {"make": 'ford', "model": 'fusion se', "year": 2015},
-    {"make": 'ford', "model": 'fusion se', "year": 2014},
-    {"make": 'ford', "model": 'fusion se', "year": 2013},
-    {"make": 'ford', "model": 'fusion se', "year": 2012},
-    {"make": 'ford', "model": 'fusion se', "year": 2011},
-    {"make": 'ford', "model": 'fusion se', "year": 2010},
-    {"make": 'ford', "model": 'fusion se', "year": 2009},
-    {"make": 'ford', "model": 'fusion se', "year": 2008},
-    {"make": 'ford', "model": 'fusion se', "year": 2007},
-    {"make": 'ford', "model": 'fusion se', "year": 2006},
-    {"make": 'ford', "model": 'fusion se 4dr sedan', "year": 2014},
-    {"make": 'ford', "model": 'fusion se awd gas sedan', "year": 2014},
-    {"make": 'ford', "model": 'fusion se hybrid sedan 4d', "year": 2020},
-    {"make": 'ford', "model": 'fusion se sedan 4d', "year": 2018},
-    {"make": 'ford', "model": 'fusion se sedan 4d', "year": 2017},
-    {"make": 'ford', "model": 'fusion se w / navigation', "year": 2018},
-    {"make": 'ford', "model": 'fusion sel', "year": 2020},
-    {"make": 'ford', "model": 'fusion sel', "year": 2019},
-    {"make": 'ford', "model": 'fusion sel', "year": 2012},
-    {"make": 'ford', "model": 'fusion sel', "year": 2011},
-    {"make": 'ford', "model": 'fusion sel', "year": 2010},
-    {"make": 'ford', "model": 'fusion sel', "year": 2009},
-    {"make": 'ford', "model": 'fusion sel', "year": 2008},
-    {"make": 'ford', "model": 'fusion sel', "year": 2007},
-    {"make": 'ford', "model": 'fusion sel', "year": 2006},
-    {"make": 'ford', "model": 'fusion sport', "year": 2010},
-    {"make": 'ford', "model": 'fusion titanium', "year": 2017},
-    {"make": 'ford', "model": 'fusion titanium', "year": 2016},
-    {"make": 'ford', "model": 'fusion titanium', "year": 2015},
-    {"make": 'ford', "model": 'fusion titanium', "year": 2014},
-    {"make": 'ford', "model": 'fusion titanium', "year": 2013},
-    {"make": 'ford', "model": 'gt premium 2,200 miles', "year": 2020},
-    {"make": 'ford', "model": 'lifted f150 lariat 4x4 gas', "year": 2020},
-    {"make": 'ford', "model": 'lifted f150 xlt 4x4 1/2 ton', "year": 2020},
-    {"make": 'ford', "model": 'lifted f150 xlt 4x4 1/2 ton', "year": 2019},
-    {"make": 'ford', "model": 'lifted f150 xlt 4x4 1/2 ton', "year": 2018},
-    {"make": 'ford', "model": 'lifted f150 xlt 4x4 1/2 ton', "year": 2016},
-    {"make": 'ford', "model": 'lifted f150 xlt fx4 4x4 gas', "year": 2016},
-    {"make": 'ford', "model": 'lifted f350 diesel lariat', "year": 2017},
-    {"make": 'ford', "model": 'mustang', "year": 2020},
-    {"make": 'ford', "model": 'mustang', "year": 2019},
-    {"make": 'ford', "model": 'mustang', "year": 2018},
-    {"make": 'ford', "model": 'mustang', "year": 2017},
-    {"make": 'ford', "model": 'mustang', "year": 2016},
-    {"make": 'ford', "model": 'mustang', "year": 2015},
-    {"make": 'ford', "model": 'mustang', "year": 2014},
-    {"make": 'ford', "model": 'mustang', "year": 2013},
-    {"make": 'ford', "model": 'mustang', "year": 2012},
-    {"make": 'ford', "model": 'mustang', "year": 2011},
-    {"make": 'ford', "model": 'mustang', "year": 2010},
-    {"make": 'ford', "model": 'mustang', "year": 2009},
-    {"make": 'ford', "model": 'mustang', "year": 2008},
-    {"make": 'ford', "model": 'mustang', "year": 2007},
-    {"make": 'ford', "model": 'mustang', "year": 2006},
-    {"make": 'ford', "model": 'mustang', "year": 2005},
-    {"make": 'ford', "model": 'mustang boss 302 coupe 2d', "year": 2013},
-    {"make": 'ford', "model": 'mustang convertible', "year": 2014},
-    {"make": 'ford', "model": 'mustang deluxe', "year": 2005},
-    {"make": 'ford', "model": 'mustang ecoboost', "year": 2020},
-    {"make": 'ford', "model": 'mustang ecoboost', "year": 2019},
-    {"make": 'ford', "model": 'mustang ecoboost', "year": 2018},
-    {"make": 'ford', "model": 'mustang ecoboost', "year": 2015},
-    {"make": 'ford', "model": 'mustang ecoboost - rear camera - bluetooth -', "year": 2019},
-    {"make": 'ford', "model": 'mustang ecoboost coupe 2d', "year": 2020},
-    {"make": 'ford', "model": 'mustang ecoboost coupe 2d', "year": 2018},
-    {"make": 'ford', "model": 'mustang ecoboost premium', "year": 2019},
-    {"make": 'ford', "model": 'mustang ecoboost premium', "year": 2017},
-    {"make": 'ford', "model": 'mustang ecoboost premium', "year": 2015},
-    {"make": 'ford', "model": 'mustang gt', "year": 2020},
-    {"make": 'ford', "model": 'mustang gt', "year": 2017},
-    {"make": 'ford', "model": 'mustang gt', "year": 2016},
-    {"make": 'ford', "model": 'mustang gt', "year": 2015},
-    {"make": 'ford', "model": 'mustang gt', "year": 2014},
-    {"make": 'ford', "model": 'mustang gt', "year": 2013},
-    {"make": 'ford', "model": 'mustang gt', "year": 2012},
-    {"make": 'ford', "model": 'mustang gt', "year": 2010},
-    {"make": 'ford', "model": 'mustang gt', "year": 2009},
-    {"make": 'ford', "model": 'mustang gt', "year": 2008},
-    {"make": 'ford', "model": 'mustang gt', "year": 2007},
-    {"make": 'ford', "model": 'mustang gt', "year": 2006},
-    {"make": 'ford', "model": 'mustang gt', "year": 2005},
-    {"make": 'ford', "model": 'mustang gt convertible', "year": 2011},
-    {"make": 'ford', "model": 'mustang gt convertible', "year": 2006},
-    {"make": 'ford', "model": 'mustang gt coupe 2d', "year": 2020},
-    {"make": 'ford', "model": 'mustang gt coupe 2d', "year": 2019},
-    {"make": 'ford', "model": 'mustang gt coupe 2d', "year": 2018},
-    {"make": 'ford', "model": 'mustang gt coupe 2d', "year": 2017},
-    {"make": 'ford', "model": 'mustang gt coupe 2d', "year": 2016},
-    {"make": 'ford', "model": 'mustang gt coupe 2d', "year": 2015},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2019},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2018},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2016},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2015},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2011},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2009},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2008},
-    {"make": 'ford', "model": 'mustang gt premium', "year": 2005},
-    {"make": 'ford', "model": 'mustang gt premium coupe', "year": 2011},
-    {"make": 'ford', "model": 'mustang gt premium coupe 2d', "year": 2020},
-    {"make": 'ford', "model": 'mustang gt premium coupe 2d', "year": 2019},
-    {"make": 'ford', "model": 'mustang gt premium coupe 2d', "year": 2016},
-    {"make": 'ford', "model": 'mustang gt premium coupe 2d', "year": 2015},
-    {"make": 'ford', "model": 'mustang premium', "year": 2006},
-    {"make": 'ford', "model": 'mustang premium rwd gas', "year": 2017},
-    {"make": 'ford', "model": 'mustang shelby gt500 coupe', "year": 2014},
-    {"make": 'ford', "model": 'mustang v6', "year": 2014},
-    {"make": 'ford', "model": 'mustang v6', "year": 2010},
-    {"make": 'ford', "model": 'mustang v6 convertible 2d', "year": 2017},
-    {"make": 'ford', "model": 'mustang v6 coupe 2d', "year": 2016},
-    {"make": 'ford', "model": 'mustang v6 premium', "year": 2013},
-    {"make": 'ford', "model": 'police interceptor utility', "year": 2017},
-    {"make": 'ford', "model": 'police interceptor utility', "year": 2015},
-    {"make": 'ford', "model": 'ranger', "year": 2020},
-    {"make": 'ford', "model": 'ranger', "year": 2019},
-    {"make": 'ford', "model": 'ranger', "year": 2011},
-    {"make": 'ford', "model": 'ranger', "year": 2010},
-    {"make": 'ford', "model": 'ranger', "year": 2009},
-    {"make": 'ford', "model": 'ranger', "year": 2008},
-    {"make": 'ford', "model": 'ranger', "year": 2007},
-    {"make": 'ford', "model": 'ranger', "year": 2006},
-    {"make": 'ford', "model": 'ranger', "year": 2005},
-    {"make": 'ford', "model": 'ranger fx4 off-road 4wd!', "year": 2009},
-    {"make": 'ford', "model": 'ranger regular cab', "year": 2007},
-    {"make": 'ford', "model": 'ranger super cab', "year": 2008},
-    {"make": 'ford', "model": 'ranger super cab', "year": 2006},
-    {"make": 'ford', "model": 'ranger super cab xlt pickup', "year": 2011},
-    {"make": 'ford', "model": 'ranger super cab xlt pickup', "year": 2010},
-    {"make": 'ford', "model": 'ranger supercab', "year": 2008},
-    {"make": 'ford', "model": 'ranger supercab xl pickup', "year": 2020},
-    {"make": 'ford', "model": 'ranger supercab xl pickup', "year": 2019},
-    {"make": 'ford', "model": 'ranger supercab xlt pickup', "year": 2020},
-    {"make": 'ford', "model": 'ranger supercab xlt pickup', "year": 2019},
-    {"make": 'ford', "model": 'ranger supercrew lariat', "year": 2019},
-    {"make": 'ford', "model": 'ranger supercrew xl pickup', "year": 2020},
-    {"make": 'ford', "model": 'ranger supercrew xl pickup', "year": 2019},
-    {"make": 'ford', "model": 'ranger supercrew xlt pickup', "year": 2020},
-    {"make": 'ford', "model": 'ranger supercrew xlt pickup', "year": 2019},
-    {"make": 'ford', "model": 'ranger xl', "year": 2011},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2020},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2019},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2011},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2010},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2009},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2008},
-    {"make": 'ford', "model": 'ranger xlt', "year": 2007},
-    {"make": 'ford', "model": 'ranger xlt fx4 4x4 1/4 ton', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2020},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2018},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2017},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2015},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2013},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2012},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2007},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2006},
-    {"make": 'ford', "model": 'super duty f-250', "year": 2005},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2020},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2018},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2017},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2015},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2013},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2012},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2010},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2009},
-    {"make": 'ford', "model": 'super duty f-250 srw', "year": 2008},
-    {"make": 'ford', "model": 'super duty f-250 srw laria', "year": 2008},
-    {"make": 'ford', "model": 'super duty f-250 srw xl', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-250 xlt', "year": 2006},
-    {"make": 'ford', "model": 'super duty f-350', "year": 2006},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2018},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2017},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2015},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2012},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2010},
-    {"make": 'ford', "model": 'super duty f-350 drw', "year": 2008},
-    {"make": 'ford', "model": 'super duty f-350 drw king', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-350 drw xl', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2018},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2017},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2015},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2013},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2012},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2010},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2009},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2008},
-    {"make": 'ford', "model": 'super duty f-350 srw', "year": 2006},
-    {"make": 'ford', "model": 'super duty f-350 srw 4wd la', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-350 srw king', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-350 srw laria', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-350 srw laria', "year": 2015},
-    {"make": 'ford', "model": 'super duty f-350 srw laria', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-350 srw laria', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-350 srw xlt', "year": 2013},
-    {"make": 'ford', "model": 'super duty f-450 drw', "year": 2017},
-    {"make": 'ford', "model": 'super duty f-450 drw', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-450 drw', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-450 drw', "year": 2008},
-    {"make": 'ford', "model": 'super duty f-450 drw', "year": 2007},
-    {"make": 'ford', "model": 'super duty f-450 drw xl', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-450 pickup', "year": 2020},
-    {"make": 'ford', "model": 'super duty f-450 pickup', "year": 2019},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2017},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2015},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2013},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2012},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2011},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2010},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2008},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2007},
-    {"make": 'ford', "model": 'super duty f-550 drw', "year": 2006},
-    {"make": 'ford', "model": 'super duty f-550 drw xl', "year": 2014},
-    {"make": 'ford', "model": 'super duty f-750 straight frame', "year": 2016},
-    {"make": 'ford', "model": 'super duty f-750 straight frame', "year": 2007},
-    {"make": 'ford', "model": 'super duty f250 srw lariat', "year": 2017},
-    {"make": 'ford', "model": 'super duty f250 srw xl', "year": 2020},
-    {"make": 'ford', "model": 'taurus', "year": 2019},
-    {"make": 'ford', "model": 'taurus', "year": 2018},
-    {"make": 'ford', "model": 'taurus', "year": 2017},
-    {"make": 'ford', "model": 'taurus', "year": 2016},
-    {"make": 'ford', "model": 'taurus', "year": 2015},
-    {"make": 'ford', "model": 'taurus', "year": 2014},
-    {"make": 'ford', "model": 'taurus', "year": 2013},
-    {"make": 'ford', "model": 'taurus', "year": 2012},
-    {"make": 'ford', "model": 'taurus', "year": 2011},
-    {"make": 'ford', "model": 'taurus', "year": 2010},
-    {"make": 'ford', "model": 'taurus', "year": 2009},
-    {"make": 'ford', "model": 'taurus', "year": 2008},
-    {"make": 'ford', "model": 'taurus', "year": 2007},
-    {"make": 'ford', "model": 'taurus', "year": 2006},
-    {"make": 'ford', "model": 'taurus', "year": 2005},
-    {"make": 'ford', "model": 'taurus limited', "year": 2018},
-    {"make": 'ford', "model": 'taurus limited', "year": 2015},
-    {"make": 'ford', "model": 'taurus limited', "year": 2014},
-    {"make": 'ford', "model": 'taurus limited', "year": 2013},
-    {"make": 'ford', "model": 'taurus limited', "year": 2012},
-    {"make": 'ford', "model": 'taurus limited', "year": 2011},
-    {"make": 'ford', "model": 'taurus limited fwd gas auto', "year": 2017},
-    {"make": 'ford', "model": 'taurus limited sedan 4d', "year": 2018},
-    {"make": 'ford', "model": 'taurus limited sedan 4d', "year": 2017},
-    {"make": 'ford', "model": 'taurus police interceptor', "year": 2015},
-    {"make": 'ford', "model": 'taurus police interceptor', "year": 2014},
-    {"make": 'ford', "model": 'taurus police interceptor', "year": 2013},
-    {"make": 'ford', "model": 'taurus se', "year": 2016},
-    {"make": 'ford', "model": 'taurus se', "year": 2013},
-    {"make": 'ford', "model": 'taurus se', "year": 2011},
-    {"make": 'ford', "model": 'taurus se', "year": 2007},
-    {"make": 'ford', "model": 'taurus se', "year": 2006},
-    {"make": 'ford', "model": 'taurus se', "year": 2005},
-    {"make": 'ford', "model": 'taurus se sedan 4d', "year": 2017},
-    {"make": 'ford', "model": 'taurus sel', "year": 2015},
-    {"make": 'ford', "model": 'taurus sel', "year": 2014},
-    {"make": 'ford', "model": 'taurus sel', "year": 2013},
-    {"make": 'ford', "model": 'taurus sel', "year": 2011},
-    {"make": 'ford', "model": 'taurus sel', "year": 2008},
-    {"make": 'ford', "model": 'taurus sel', "year": 2007},
-    {"make": 'ford', "model": 'taurus sel', "year": 2006},
-    {"make": 'ford', "model": 'taurus sel', "year": 2005},
-    {"make": 'ford', "model": 'taurus sel awd', "year": 2015},
-    {"make": 'ford', "model": 'taurus sel awd', "year": 2010},
-    {"make": 'ford', "model": 'taurus sho', "year": 2013},
-    {"make": 'ford', "model": 'taurus sho', "year": 2011},
-    {"make": 'ford', "model": 'taurus sho', "year": 2010},
-    {"make": 'ford', "model": 'taurus sho sedan 4d', "year": 2018},
-    {"make": 'ford', "model": 'taurus x', "year": 2008},
-    {"make": 'ford', "model": 'thunderbird', "year": 2005},
-    {"make": 'ford', "model": 'thunderbird convertible', "year": 2005},
-    {"make": 'ford', "model": 'transit', "year": 2020},
-    {"make": 'ford', "model": 'transit', "year": 2019},
-    {"make": 'ford', "model": 'transit', "year": 2018},
-    {"make": 'ford', "model": 'transit', "year": 2017},
-    {"make": 'ford', "model": 'transit', "year": 2016},
-    {"make": 'ford', "model": 'transit', "year": 2015},
-    {"make": 'ford', "model": 'transit', "year": 2010},
-    {"make": 'ford', "model": 'transit 150', "year": 2017},
-    {"make": 'ford', "model": 'transit 150', "year": 2015},
-    {"make": 'ford', "model": 'transit 150 cargo van', "year": 2017},
-    {"make": 'ford', "model": 'transit 150 wheelchair han', "year": 2019},
-    {"make": 'ford', "model": 'transit 250', "year": 2019},
-    {"make": 'ford', "model": 'transit 250', "year": 2018},
-    {"make": 'ford', "model": 'transit 250', "year": 2016},
-    {"make": 'ford', "model": 'transit 250', "year": 2015},
-    {"make": 'ford', "model": 'transit 250 cargo van', "year": 2019},
-    {"make": 'ford', "model": 'transit 250 cargo van', "year": 2017},
-    {"make": 'ford', "model": 'transit 250 van low roof', "year": 2018},
-    {"make": 'ford', "model": 'transit 350', "year": 2016},
-    {"make": 'ford', "model": 'transit 350', "year": 2015},
-    {"make": 'ford', "model": 'transit 350 wagon', "year": 2017},
-    {"make": 'ford', "model": 'transit cargo', "year": 2020},
-    {"make": 'ford', "model": 'transit cargo', "year": 2019},
-    {"make": 'ford', "model": 'transit cargo', "year": 2018},
-    {"make": 'ford', "model": 'transit cargo', "year": 2017},
-    {"make": 'ford', "model": 'transit cargo', "year": 2016},
-    {"make": 'ford', "model": 'transit cargo', "year": 2015},
-    {"make": 'ford', "model": 'transit cargo 150', "year": 2017},
-    {"make": 'ford', "model": 'transit cargo 150', "year": 2016},
-    {"make": 'ford', "model": 'transit cargo 250', "year": 2019},
-    {"make": 'ford', "model": 'transit cargo 250', "year": 2016},
-    {"make": 'ford', "model": 'transit cargo 350', "year": 2016},
-    {"make": 'ford', "model": 'transit cargo van', "year": 2020},
-    {"make": 'ford', "model": 'transit cargo van', "year": 2019},
-    {"make": 'ford', "model": 'transit cargo van', "year": 2018},
-    {"make": 'ford', "model": 'transit cargo van', "year": 2016},
-    {"make": 'ford', "model": 'transit cargo van', "year": 2015},
-    {"make": 'ford', "model": 'transit connect', "year": 2017},
-    {"make": 'ford', "model": 'transit connect', "year": 2016},
-    {"make": 'ford', "model": 'transit connect', "year": 2015},
-    {"make": 'ford', "model": 'transit connect', "year": 2014},
-    {"make": 'ford', "model": 'transit connect', "year": 2013},
-    {"make": 'ford', "model": 'transit connect', "year": 2012},
-    {"make": 'ford', "model": 'transit connect', "year": 2011},
-    {"make": 'ford', "model": 'transit connect', "year": 2010},
-    {"make": 'ford', "model": 'transit connect cargo', "year": 2017},
-    {"make": 'ford', "model": 'transit connect cargo', "year": 2015},
-    {"make": 'ford', "model": 'transit connect cargo', "year": 2014},
-    {"make": 'ford', "model": 'transit connect cargo van', "year": 2020},
-    {"make": 'ford', "model": 'transit connect cargo van', "year": 2014},
-    {"make": 'ford', "model": 'transit connect cargo van xl', "year": 2012},
-    {"make": 'ford', "model": 'transit connect cargo van xlt', "year": 2012},
-    {"make": 'ford', "model": 'transit connect cargo xl', "year": 2016},
-    {"make": 'ford', "model": 'transit connect cargo xl', "year": 2015},
-    {"make": 'ford', "model": 'transit connect cargo xlt', "year": 2019},
-    {"make": 'ford', "model": 'transit connect cargo xlt', "year": 2016},
-    {"make": 'ford', "model": 'transit connect cargo xlt', "year": 2014},
-    {"make": 'ford', "model": 'transit connect passenger', "year": 2020},
-    {"make": 'ford', "model": 'transit connect passenger', "year": 2016},
-    {"make": 'ford', "model": 'transit connect van', "year": 2018},
-    {"make": 'ford', "model": 'transit connect van', "year": 2016},
-    {"make": 'ford', "model": 'transit connect van', "year": 2014},
-    {"make": 'ford', "model": 'transit connect van', "year": 2011},
-    {"make": 'ford', "model": 'transit connect van xl', "year": 2021},
-    {"make": 'ford', "model": 'transit connect van xlt', "year": 2019},
-    {"make": 'ford', "model": 'transit connect wagon', "year": 2016},
-    {"make": 'ford', "model": 'transit connect wagon', "year": 2015},
-    {"make": 'ford', "model": 'transit connect wagon', "year": 2014},
-    {"make": 'ford', "model": 'transit connect wagon', "year": 2012},
-    {"make": 'ford', "model": 'transit connect xl', "year": 2015},
-    {"make": 'ford', "model": 'transit connect xl', "year": 2014},
-    {"make": 'ford', "model": 'transit connect xlt', "year": 2017},
-    {"make": 'ford', "model": 'transit connect xlt', "year": 2016},
-    {"make": 'ford', "model": 'transit connect xlt', "year": 2015},
-    {"make": 'ford', "model": 'transit connect xlt', "year": 2014},
-    {"make": 'ford', "model": 'transit connect xlt', "year": 2013},
-    {"make": 'ford', "model": 'transit connect xlt', "year": 2012},
-    {"make": 'ford', "model": 'transit cutaway', "year": 2016},
-    {"make": 'ford', "model": 'transit cutaway', "year": 2015},
-    {"make": 'ford', "model": 'transit passenger wagon', "year": 2018},
-    {"make": 'ford', "model": 'transit t150', "year": 2017},
-    {"make": 'ford', "model": 'transit t150', "year": 2015},
-    {"make": 'ford', "model": 'transit t250', "year": 2020},
-    {"make": 'ford', "model": 'transit t250', "year": 2019},
-    {"make": 'ford', "model": 'transit t250', "year": 2016},
-    {"make": 'ford', "model": 'transit t250 cargo van', "year": 2019},
-    {"make": 'ford', "model": 'transit t250 extended', "year": 2020},
-    {"make": 'ford', "model": 'transit t250 extended', "year": 2019},
-    {"make": 'ford', "model": 'transit t350 hd', "year": 2017},
-    {"make": 'ford', "model": 'transit van', "year": 2019},
-    {"make": 'ford', "model": 'transit van', "year": 2018},
-    {"make": 'ford', "model": 'transit van', "year": 2017},
-    {"make": 'ford', "model": 'transit wagon xl', "year": 2017},
-    {"make": 'ford', "model": 'transit-250', "year": 2020},
-    {"make": 'ford', "model": 'transit-350', "year": 2016},
-    {"make": 'ford', "model": 'utility police interceptor', "year": 2014},
-    {"make": 'gmc', "model": '2500', "year": 2016},
-    {"make": 'gmc', "model": '2500', "year": 2015},
-    {"make": 'gmc', "model": '2500 savana cargo', "year": 2014},
-    {"make": 'gmc', "model": '3500', "year": 2020},
-    {"make": 'gmc', "model": 'acadia', "year": 2021},
-    {"make": 'gmc', "model": 'acadia', "year": 2020},
-    {"make": 'gmc', "model": 'acadia', "year": 2019},
-    {"make": 'gmc', "model": 'acadia', "year": 2018},
-    {"make": 'gmc', "model": 'acadia', "year": 2017},
-    {"make": 'gmc', "model": 'acadia', "year": 2016},
-    {"make": 'gmc', "model": 'acadia', "year": 2015},
-    {"make": 'gmc', "model": 'acadia', "year": 2014},
-    {"make": 'gmc', "model": 'acadia', "year": 2013},
-    {"make": 'gmc', "model": 'acadia', "year": 2012},
-    {"make": 'gmc', "model": 'acadia', "year": 2011},
-    {"make": 'gmc', "model": 'acadia', "year": 2010},
-    {"make": 'gmc', "model": 'acadia', "year": 2009},
-    {"make": 'gmc', "model": 'acadia', "year": 2008},
-    {"make": 'gmc', "model": 'acadia', "year": 2007},
-    {"make": 'gmc', "model": 'acadia - new tires - third row seat - 8 seater -', "year": 2008},
-    {"make": 'gmc', "model": 'acadia awd', "year": 2010},
-    {"make": 'gmc', "model": 'acadia awd', "year": 2008},
-    {"make": 'gmc', "model": 'acadia denali', "year": 2015},
-    {"make": 'gmc', "model": 'acadia denali', "year": 2014},
-    {"make": 'gmc', "model": 'acadia denali', "year": 2013},
-    {"make": 'gmc', "model": 'acadia denali', "year": 2012},
-    {"make": 'gmc', "model": 'acadia denali', "year": 2011},
-    {"make": 'gmc', "model": 'acadia denali sport utility', "year": 2020},
-    {"make": 'gmc', "model": 'acadia limited', "year": 2017},
-    {"make": 'gmc', "model": 'acadia limited sport utility', "year": 2017},
-    {"make": 'gmc', "model": 'acadia sle', "year": 2021},
-    {"make": 'gmc', "model": 'acadia sle awd', "year": 2012},
-    {"make": 'gmc', "model": 'acadia sle sport utility 4d', "year": 2020},
-    {"make": 'gmc', "model": 'acadia sle-1 sport utility', "year": 2019},
-    {"make": 'gmc', "model": 'acadia sle-1 sport utility', "year": 2017},
-    {"make": 'gmc', "model": 'acadia sle-2 sport utility', "year": 2018},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2020},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2016},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2014},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2012},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2011},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2010},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2008},
-    {"make": 'gmc', "model": 'acadia slt', "year": 2007},
-    {"make": 'gmc', "model": 'acadia slt awd', "year": 2012},
-    {"make": 'gmc', "model": 'acadia slt sport utility 4d', "year": 2020},
-    {"make": 'gmc', "model": 'acadia slt-1', "year": 2017},
-    {"make": 'gmc', "model": 'acadia slt-1', "year": 2014},
-    {"make": 'gmc', "model": 'acadia slt-1 sport utility', "year": 2017},
-    {"make": 'gmc', "model": 'acadia slt-2', "year": 2009},
-    {"make": 'gmc', "model": 'acadia slt-2', "year": 2008},
-    {"make": 'gmc', "model": 'acadia slt-2 sport utility', "year": 2019},
-    {"make": 'gmc', "model": 'acadia slt-2 sport utility', "year": 2018},
-    {"make": 'gmc', "model": 'c4500', "year": 2005},
-    {"make": 'gmc', "model": 'c5500', "year": 2007},
-    {"make": 'gmc', "model": 'c5500', "year": 2005},
-    {"make": 'gmc', "model": 'c5500 24 foot flatbed 8.1l gas', "year": 2005},
-    {"make": 'gmc', "model": 'c7500', "year": 2007},
-    {"make": 'gmc', "model": 'c7500 dump truck', "year": 2006},
-    {"make": 'gmc', "model": 'c8500', "year": 2005},
-    {"make": 'gmc', "model": 'canyon', "year": 2019},
-    {"make": 'gmc', "model": 'canyon', "year": 2018},
-    {"make": 'gmc', "model": 'canyon', "year": 2017},
-    {"make": 'gmc', "model": 'canyon', "year": 2016},
-    {"make": 'gmc', "model": 'canyon', "year": 2015},
-    {"make": 'gmc', "model": 'canyon', "year": 2012},
-    {"make": 'gmc', "model": 'canyon', "year": 2011},
-    {"make": 'gmc', "model": 'canyon', "year": 2009},
-    {"make": 'gmc', "model": 'canyon', "year": 2008},
-    {"make": 'gmc', "model": 'canyon', "year": 2007},
-    {"make": 'gmc', "model": 'canyon', "year": 2005},
-    {"make": 'gmc', "model": 'canyon crew cab pickup 4d 5', "year": 2018},
-    {"make": 'gmc', "model": 'canyon crew cab sle all', "year": 2018},
-    {"make": 'gmc', "model": 'canyon crew cab sle pickup', "year": 2016},
-    {"make": 'gmc', "model": 'canyon crew cab slt pickup', "year": 2018},
-    {"make": 'gmc', "model": 'canyon extended cab pickup', "year": 2018},
-    {"make": 'gmc', "model": 'canyon extended cab sle', "year": 2015},
-    {"make": 'gmc', "model": 'canyon regular cab', "year": 2006},
-    {"make": 'gmc', "model": 'canyon sle crew cab short b', "year": 2019},
-    {"make": 'gmc', "model": 'canyon slt 4x4 1/4 ton gas', "year": 2017},
-    {"make": 'gmc', "model": 'denali 2500hd diesel sierra', "year": 2013},
-    {"make": 'gmc', "model": 'envoy', "year": 2009},
-    {"make": 'gmc', "model": 'envoy', "year": 2008},
-    {"make": 'gmc', "model": 'envoy', "year": 2007},
-    {"make": 'gmc', "model": 'envoy', "year": 2006},
-    {"make": 'gmc', "model": 'envoy', "year": 2005},
-    {"make": 'gmc', "model": 'envoy denali', "year": 2007},
-    {"make": 'gmc', "model": 'envoy denali', "year": 2006},
-    {"make": 'gmc', "model": 'envoy sle', "year": 2008},
-    {"make": 'gmc', "model": 'envoy sle', "year": 2005},
-    {"make": 'gmc', "model": 'envoy sle 4wd', "year": 2006},
-    {"make": 'gmc', "model": 'envoy slt 4x4', "year": 2006},
-    {"make": 'gmc', "model": 'envoy xl', "year": 2006},
-    {"make": 'gmc', "model": 'envoy xl', "year": 2005},
-    {"make": 'gmc', "model": 'savana', "year": 2019},
-    {"make": 'gmc', "model": 'savana', "year": 2017},
-    {"make": 'gmc', "model": 'savana', "year": 2015},
-    {"make": 'gmc', "model": 'savana', "year": 2007},
-    {"make": 'gmc', "model": 'savana', "year": 2006},
-    {"make": 'gmc', "model": 'savana 2500', "year": 2018},
-    {"make": 'gmc', "model": 'savana 2500', "year": 2017},
-    {"make": 'gmc', "model": 'savana 2500', "year": 2014},
-    {"make": 'gmc', "model": 'savana 2500', "year": 2006},
-    {"make": 'gmc', "model": 'savana 2500 cargo', "year": 2017},
-    {"make": 'gmc', "model": 'savana 3500', "year": 2008},
-    {"make": 'gmc', "model": 'savana cargo', "year": 2020},
-    {"make": 'gmc', "model": 'savana cargo', "year": 2019},
-    {"make": 'gmc', "model": 'savana cargo', "year": 2018},
-    {"make": 'gmc', "model": 'savana cargo 2500 3dr', "year": 2012},
-    {"make": 'gmc', "model": 'savana cargo van', "year": 2019},
-    {"make": 'gmc', "model": 'savana cargo van', "year": 2018},
-    {"make": 'gmc', "model": 'savana cargo van', "year": 2017},
-    {"make": 'gmc', "model": 'savana cargo van', "year": 2012},
-    {"make": 'gmc', "model": 'savana cargo van', "year": 2009},
-    {"make": 'gmc', "model": 'savana commercial cutaway', "year": 2017},
-    {"make": 'gmc', "model": 'savana commercial cutaway', "year": 2016},
-    {"make": 'gmc', "model": 'savana cutaway', "year": 2016},
-    {"make": 'gmc', "model": 'savana cutaway', "year": 2008},
-    {"make": 'gmc', "model": 'savana passenger', "year": 2014},
-    {"make": 'gmc', "model": 'sierra', "year": 2021},
-    {"make": 'gmc', "model": 'sierra', "year": 2020},
-    {"make": 'gmc', "model": 'sierra', "year": 2019},
-    {"make": 'gmc', "model": 'sierra', "year": 2018},
-    {"make": 'gmc', "model": 'sierra', "year": 2017},
-    {"make": 'gmc', "model": 'sierra', "year": 2016},
-    {"make": 'gmc', "model": 'sierra', "year": 2015},
-    {"make": 'gmc', "model": 'sierra', "year": 2014},
-    {"make": 'gmc', "model": 'sierra', "year": 2013},
-    {"make": 'gmc', "model": 'sierra', "year": 2012},
-    {"make": 'gmc', "model": 'sierra', "year": 2011},
-    {"make": 'gmc', "model": 'sierra', "year": 2010},
-    {"make": 'gmc', "model": 'sierra', "year": 2009},
-    {"make": 'gmc', "model": 'sierra', "year": 2008},
-    {"make": 'gmc', "model": 'sierra', "year": 2007},
-    {"make": 'gmc', "model": 'sierra', "year": 2006},
-    {"make": 'gmc', "model": 'sierra', "year": 2005},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2021},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2011},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2010},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2009},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2008},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2007},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2006},
-    {"make": 'gmc', "model": 'sierra 1500', "year": 2005},
-    {"make": 'gmc', "model": 'sierra 1500 4wd', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 4wd crew cab 143', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 4x4 half ton gas', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 all terrain 4x4', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 at4', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500 at4', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 at4 4x4 1/2 ton', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 at4 4x4 half ton', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 base', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500 crew 4x4', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab', "year": 2007},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab sl', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab sle', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab sle', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab sle', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab sle', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab sle', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab slt', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab slt', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab slt', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab slt', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 crew cab slt', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500 denali', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 denali', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 denali', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500 denali', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 1500 denali', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 denali', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 1500 denali 4x4 gas', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 double cab', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500 double cab', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 double cab', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500 double cab', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 1500 double cab', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 double cab sle', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 double cab sle', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500 double cab sle', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 1500 double cab slt', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 double cab slt', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 elevation 4x4', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500 elevation 4x4', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 extended cab sle', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500 extended cab slt', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500 limited double', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 regular cab', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 regular cab', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 1500 regular cab', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 regular cab', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 regular cab work', "year": 2011},
-    {"make": 'gmc', "model": 'sierra 1500 sl', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 1500 sle', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500 sle', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 sle', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 sle', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 1500 sle', "year": 2010},
-    {"make": 'gmc', "model": 'sierra 1500 sle', "year": 2008},
-    {"make": 'gmc', "model": 'sierra 1500 sle double cab', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 slt', "year": 2010},
-    {"make": 'gmc', "model": 'sierra 1500 slt 4 wd', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 1500 slt 4x4 1/2 ton', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 sltcrew cab', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 1500 sltextended', "year": 2007},
-    {"make": 'gmc', "model": 'sierra 1500 x31 4x4 half ton', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 2500', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 2500', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 2500 4wd', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500 denali', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 2500 denali', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500 hd', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500 hd all terrain', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 2500 hd crew cab', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500 hd crew cab', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 2500 hd crew cab', "year": 2008},
-    {"make": 'gmc', "model": 'sierra 2500 hd double cab', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 2500 hd extended cab', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 2500 hd extended cab', "year": 2006},
-    {"make": 'gmc', "model": 'sierra 2500 lifted denali 6.6 duramax crew cab', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 2500 lifted denali diesel bds fully loaded', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 2500 lifted denali diesel mlti view headsup power roof', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 2500 slt', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 2500 slt', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500 slt', "year": 2007},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2021},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2011},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2010},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2009},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2008},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2007},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2006},
-    {"make": 'gmc', "model": 'sierra 2500hd', "year": 2005},
-    {"make": 'gmc', "model": 'sierra 2500hd available wifi', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500hd classic', "year": 2007},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 2500hd denali', "year": 2011},
-    {"make": 'gmc', "model": 'sierra 2500hd sle', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 2500hd slt', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 2500hd slt', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 3500', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 3500', "year": 2006},
-    {"make": 'gmc', "model": 'sierra 3500 crew-cab dually', "year": 2005},
-    {"make": 'gmc', "model": 'sierra 3500 denali', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 3500 denali', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 3500 lifted diesel 3500hd denali on 37s loaded 7k miles', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 3500 sle', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 3500 slt', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2020},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2019},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2018},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2017},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2015},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2009},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2008},
-    {"make": 'gmc', "model": 'sierra 3500hd', "year": 2005},
-    {"make": 'gmc', "model": 'sierra 3500hd cc', "year": 2014},
-    {"make": 'gmc', "model": 'sierra 3500hd cc', "year": 2008},
-    {"make": 'gmc', "model": 'sierra 3500hd denali', "year": 2016},
-    {"make": 'gmc', "model": 'sierra 3500hd denali', "year": 2013},
-    {"make": 'gmc', "model": 'sierra 3500hd denali', "year": 2012},
-    {"make": 'gmc', "model": 'sierra 3500hd sle', "year": 2014},
-    {"make": 'gmc', "model": 'sierra at4', "year": 2020},
-    {"make": 'gmc', "model": 'sierra denali', "year": 2018},
-    {"make": 'gmc', "model": 'sierra denali 4x4 crew', "year": 2014},
-    {"make": 'gmc', "model": 'sierra diesel duramax 3500', "year": 2020},
-    {"make": 'gmc', "model": 'sierra diesel duramax 3500', "year": 2019},
-    {"make": 'gmc', "model": 'sierra diesel duramax 3500', "year": 2018},
-    {"make": 'gmc', "model": 'sierra diesel durmax 3500', "year": 2019},
-    {"make": 'gmc', "model": 'sierra diesel durmax 3500 hd', "year": 2020},
-    {"make": 'gmc', "model": 'sierra diesel durmax 3500 hd', "year": 2019},
-    {"make": 'gmc', "model": 'sierra diesels duramax 3500', "year": 2020},
-    {"make": 'gmc', "model": 'sierra diesels duramax 3500', "year": 2019},
-    {"make": 'gmc', "model": 'sierra duramax 3500 hd 4x4', "year": 2020},
-    {"make": 'gmc', "model": 'sierra duramax 3500 hd all', "year": 2018},
-    {"make": 'gmc', "model": 'sierra hd', "year": 2019},
-    {"make": 'gmc', "model": 'sierra sle crew cab short b', "year": 2017},
-    {"make": 'gmc', "model": 'sierra sle crew cab short b', "year": 2014},
-    {"make": 'gmc', "model": 'sierra slt', "year": 2018},
-    {"make": 'gmc', "model": 'sierra slt', "year": 2015},
-    {"make": 'gmc', "model": 'sierra slt 4x4 leather', "year": 2014},
-    {"make": 'gmc', "model": 'starcraft', "year": 2011},
-    {"make": 'gmc', "model": 'terrain', "year": 2021},
-    {"make": 'gmc', "model": 'terrain', "year": 2020},
-    {"make": 'gmc', "model": 'terrain', "year": 2019},
-    {"make": 'gmc', "model": 'terrain', "year": 2018},
-    {"make": 'gmc', "model": 'terrain', "year": 2017},
-    {"make": 'gmc', "model": 'terrain', "year": 2016},
-    {"make": 'gmc', "model": 'terrain', "year": 2015},
-    {"make": 'gmc', "model": 'terrain', "year": 2014},
-    {"make": 'gmc', "model": 'terrain', "year": 2013},
-    {"make": 'gmc', "model": 'terrain', "year": 2012},
-    {"make": 'gmc', "model": 'terrain', "year": 2011},
-    {"make": 'gmc', "model": 'terrain', "year": 2010},
-    {"make": 'gmc', "model": 'terrain denali', "year": 2013},
-    {"make": 'gmc', "model": 'terrain denali awd', "year": 2018},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2019},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2018},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2017},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2015},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2014},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2013},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2011},
-    {"make": 'gmc', "model": 'terrain sle', "year": 2010},
-    {"make": 'gmc', "model": 'terrain sle sport utility 4d', "year": 2020},
-    {"make": 'gmc', "model": 'terrain sle sport utility 4d', "year": 2018},
-    {"make": 'gmc', "model": 'terrain sle-1', "year": 2017},
-    {"make": 'gmc', "model": 'terrain sle-1 awd! awd', "year": 2016},
-    {"make": 'gmc', "model": 'terrain sle-1 sport utility', "year": 2016},
-    {"make": 'gmc', "model": 'terrain sle-2', "year": 2015},
-    {"make": 'gmc', "model": 'terrain sle-2', "year": 2012},
-    {"make": 'gmc', "model": 'terrain sle-2 awd', "year": 2015},
-    {"make": 'gmc', "model": 'terrain slt', "year": 2020},
-    {"make": 'gmc', "model": 'terrain slt', "year": 2017},
-    {"make": 'gmc', "model": 'terrain slt', "year": 2016},
-    {"make": 'gmc', "model": 'terrain slt', "year": 2014},
-    {"make": 'gmc', "model": 'terrain slt', "year": 2013},
-    {"make": 'gmc', "model": 'terrain slt', "year": 2010},
-    {"make": 'gmc', "model": 'terrain slt awd gas suv auto', "year": 2017},
-    {"make": 'gmc', "model": 'terrain slt-1', "year": 2015},
-    {"make": 'gmc', "model": 'topkick', "year": 2006},
-    {"make": 'gmc', "model": 'yukon', "year": 2020},
-    {"make": 'gmc', "model": 'yukon', "year": 2019},
-    {"make": 'gmc', "model": 'yukon', "year": 2018},
-    {"make": 'gmc', "model": 'yukon', "year": 2017},
-    {"make": 'gmc', "model": 'yukon', "year": 2016},
-    {"make": 'gmc', "model": 'yukon', "year": 2015},
-    {"make": 'gmc', "model": 'yukon', "year": 2014},
-    {"make": 'gmc', "model": 'yukon', "year": 2013},
-    {"make": 'gmc', "model": 'yukon', "year": 2012},
-    {"make": 'gmc', "model": 'yukon', "year": 2011},
-    {"make": 'gmc', "model": 'yukon', "year": 2010},
-    {"make": 'gmc', "model": 'yukon', "year": 2009},
-    {"make": 'gmc', "model": 'yukon', "year": 2008},
-    {"make": 'gmc', "model": 'yukon', "year": 2007},
-    {"make": 'gmc', "model": 'yukon', "year": 2006},
-    {"make": 'gmc', "model": 'yukon', "year": 2005},
-    {"make": 'gmc', "model": 'yukon 1500 slt - 4wd - new tires - rear camera -', "year": 2013},
-    {"make": 'gmc', "model": 'yukon 4x4', "year": 2012},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2019},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2018},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2017},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2016},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2015},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2013},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2012},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2011},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2010},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2009},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2008},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2007},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2006},
-    {"make": 'gmc', "model": 'yukon denali', "year": 2005},
-    {"make": 'gmc', "model": 'yukon denali 4x4 gas suv', "year": 2019},
-    {"make": 'gmc', "model": 'yukon denali 4x4 gas suv', "year": 2015},
-    {"make": 'gmc', "model": 'yukon denali awd', "year": 2013},
-    {"make": 'gmc', "model": 'yukon denali awd', "year": 2011},
-    {"make": 'gmc', "model": 'yukon denali sport utility', "year": 2013},
-    {"make": 'gmc', "model": 'yukon hybrid', "year": 2010},
-    {"make": 'gmc', "model": 'yukon sle sport utility 4d', "year": 2018},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2016},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2015},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2012},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2009},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2008},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2007},
-    {"make": 'gmc', "model": 'yukon slt', "year": 2005},
-    {"make": 'gmc', "model": 'yukon slt 4x4', "year": 2007},
-    {"make": 'gmc', "model": 'yukon slt sport utility 4d', "year": 2020},
-    {"make": 'gmc', "model": 'yukon slt sport utility 4d', "year": 2015},
-    {"make": 'gmc', "model": 'yukon slt2 4wd v8', "year": 2007},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2018},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2017},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2016},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2015},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2014},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2013},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2012},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2011},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2010},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2009},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2008},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2007},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2006},
-    {"make": 'gmc', "model": 'yukon xl', "year": 2005},
-    {"make": 'gmc', "model": 'yukon xl 1500', "year": 2011},
-    {"make": 'gmc', "model": 'yukon xl 1500 denali sport', "year": 2014},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2016},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2015},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2011},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2010},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2008},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2007},
-    {"make": 'gmc', "model": 'yukon xl denali', "year": 2005},
-    {"make": 'gmc', "model": 'yukon xl denali 2wd 4dr 1500', "year": 2008},
-    {"make": 'gmc', "model": 'yukon xl denali usa 1', "year": 2018},
-    {"make": 'gmc', "model": 'yukon xl slt', "year": 2020},
-    {"make": 'gmc', "model": 'yukon xl slt', "year": 2019},
-    {"make": 'gmc', "model": 'yukon xl slt', "year": 2015},
-    {"make": 'gmc', "model": 'yukon xl slt', "year": 2008},
-    {"make": 'honda', "model": 'accord', "year": 2021},
-    {"make": 'honda', "model": 'accord', "year": 2020},
-    {"make": 'honda', "model": 'accord', "year": 2019},
-    {"make": 'honda', "model": 'accord', "year": 2018},
-    {"make": 'honda', "model": 'accord', "year": 2017},
-    {"make": 'honda', "model": 'accord', "year": 2016},
-    {"make": 'honda', "model": 'accord', "year": 2015},
-    {"make": 'honda', "model": 'accord', "year": 2014},
-    {"make": 'honda', "model": 'accord', "year": 2013},
-    {"make": 'honda', "model": 'accord', "year": 2012},
-    {"make": 'honda', "model": 'accord', "year": 2011},
-    {"make": 'honda', "model": 'accord', "year": 2010},
-    {"make": 'honda', "model": 'accord', "year": 2009},
-    {"make": 'honda', "model": 'accord', "year": 2008},
-    {"make": 'honda', "model": 'accord', "year": 2007},
-    {"make": 'honda', "model": 'accord', "year": 2006},
-    {"make": 'honda', "model": 'accord', "year": 2005},
-    {"make": 'honda', "model": 'accord 4-door sedan', "year": 2007},
-    {"make": 'honda', "model": 'accord 4-door sedan', "year": 2006},
-    {"make": 'honda', "model": 'accord coupe', "year": 2012},
-    {"make": 'honda', "model": 'accord coupe', "year": 2009},
-    {"make": 'honda', "model": 'accord coupe', "year": 2008},
-    {"make": 'honda', "model": 'accord coupe', "year": 2007},
-    {"make": 'honda', "model": 'accord cpe', "year": 2011},
-    {"make": 'honda', "model": 'accord crosstour', "year": 2011},
-    {"make": 'honda', "model": 'accord crosstour', "year": 2010},
-    {"make": 'honda', "model": 'accord crosstour ex-l', "year": 2010},
-    {"make": 'honda', "model": 'accord ex', "year": 2015},
-    {"make": 'honda', "model": 'accord ex', "year": 2014},
-    {"make": 'honda', "model": 'accord ex', "year": 2013},
-    {"make": 'honda', "model": 'accord ex', "year": 2012},
-    {"make": 'honda', "model": 'accord ex', "year": 2011},
-    {"make": 'honda', "model": 'accord ex', "year": 2010},
-    {"make": 'honda', "model": 'accord ex', "year": 2009},
-    {"make": 'honda', "model": 'accord ex', "year": 2008},
-    {"make": 'honda', "model": 'accord ex', "year": 2007},
-    {"make": 'honda', "model": 'accord ex', "year": 2006},
-    {"make": 'honda', "model": 'accord ex', "year": 2005},
-    {"make": 'honda', "model": 'accord ex sedan', "year": 2012},
-    {"make": 'honda', "model": 'accord ex w/honda sensing', "year": 2017},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2017},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2016},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2015},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2014},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2013},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2012},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2011},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2010},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2009},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2008},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2007},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2006},
-    {"make": 'honda', "model": 'accord ex-l', "year": 2005},
-    {"make": 'honda', "model": 'accord ex-l coupe', "year": 2015},
-    {"make": 'honda', "model": 'accord ex-l coupe 2d', "year": 2015},
-    {"make": 'honda', "model": 'accord ex-l coupe 2d', "year": 2010},
-    {"make": 'honda', "model": 'accord ex-l sedan 4d', "year": 2018},
-    {"make": 'honda', "model": 'accord ex-l sedan 4d', "year": 2015},
-    {"make": 'honda', "model": 'accord ex-l sedan 4d', "year": 2013},
-    {"make": 'honda', "model": 'accord ex-l sedan 4d', "year": 2011},
-    {"make": 'honda', "model": 'accord ex-l v6', "year": 2008},
-    {"make": 'honda', "model": 'accord exl', "year": 2012},
-    {"make": 'honda', "model": 'accord hybrid', "year": 2017},
-    {"make": 'honda', "model": 'accord hybrid', "year": 2015},
-    {"make": 'honda', "model": 'accord hybrid sedan 4d', "year": 2020},
-    {"make": 'honda', "model": 'accord hybrid sedan 4d', "year": 2019},
-    {"make": 'honda', "model": 'accord hybrid touring', "year": 2018},
-    {"make": 'honda', "model": 'accord lx', "year": 2017},
-    {"make": 'honda', "model": 'accord lx', "year": 2016},
-    {"make": 'honda', "model": 'accord lx', "year": 2015},
-    {"make": 'honda', "model": 'accord lx', "year": 2014},
-    {"make": 'honda', "model": 'accord lx', "year": 2013},
-    {"make": 'honda', "model": 'accord lx', "year": 2012},
-    {"make": 'honda', "model": 'accord lx', "year": 2011},
-    {"make": 'honda', "model": 'accord lx', "year": 2010},
-    {"make": 'honda', "model": 'accord lx', "year": 2009},
-    {"make": 'honda', "model": 'accord lx', "year": 2008},
-    {"make": 'honda', "model": 'accord lx', "year": 2007},
-    {"make": 'honda', "model": 'accord lx', "year": 2006},
-    {"make": 'honda', "model": 'accord lx', "year": 2005},
-    {"make": 'honda', "model": 'accord lx cvt', "year": 2018},
-    {"make": 'honda', "model": 'accord lx sedan 4d', "year": 2020},
-    {"make": 'honda', "model": 'accord lx sedan 4d', "year": 2017},
-    {"make": 'honda', "model": 'accord lx sedan 4d', "year": 2016},
-    {"make": 'honda', "model": 'accord lx sedan 4d', "year": 2015},
-    {"make": 'honda', "model": 'accord lx sedan 4d', "year": 2013},
-    {"make": 'honda', "model": 'accord lx special', "year": 2005},
-    {"make": 'honda', "model": 'accord lx-p', "year": 2009},
-    {"make": 'honda', "model": 'accord lx-p sedan at', "year": 2011},
-    {"make": 'honda', "model": 'accord lxsedan cvt', "year": 2017},
-    {"make": 'honda', "model": 'accord sdn', "year": 2013},
-    {"make": 'honda', "model": 'accord sdn', "year": 2012},
-    {"make": 'honda', "model": 'accord sdn', "year": 2011},
-    {"make": 'honda', "model": 'accord sdn', "year": 2010},
-    {"make": 'honda', "model": 'accord sdn', "year": 2009},
-    {"make": 'honda', "model": 'accord sdn', "year": 2008},
-    {"make": 'honda', "model": 'accord sdn', "year": 2006},
-    {"make": 'honda', "model": 'accord sdn lx', "year": 2013},
-    {"make": 'honda', "model": 'accord se', "year": 2012},
-    {"make": 'honda', "model": 'accord se', "year": 2011},
-    {"make": 'honda', "model": 'accord se 4dr sedan', "year": 2012},
-    {"make": 'honda', "model": 'accord sedan', "year": 2018},
-    {"make": 'honda', "model": 'accord sedan', "year": 2017},
-    {"make": 'honda', "model": 'accord sedan', "year": 2016},
-    {"make": 'honda', "model": 'accord sedan', "year": 2015},
-    {"make": 'honda', "model": 'accord sedan', "year": 2014},
-    {"make": 'honda', "model": 'accord sedan', "year": 2013},
-    {"make": 'honda', "model": 'accord sedan', "year": 2008},
-    {"make": 'honda', "model": 'accord sedan', "year": 2006},
-    {"make": 'honda', "model": 'accord sedan ex', "year": 2015},
-    {"make": 'honda', "model": 'accord sedan lx', "year": 2014},
-    {"make": 'honda', "model": 'accord sedan sport', "year": 2014},
-    {"make": 'honda', "model": 'accord sedan sport 1.5t', "year": 2019},
-    {"make": 'honda', "model": 'accord sport', "year": 2019},
-    {"make": 'honda', "model": 'accord sport', "year": 2018},
-    {"make": 'honda', "model": 'accord sport', "year": 2017},
-    {"make": 'honda', "model": 'accord sport', "year": 2016},
-    {"make": 'honda', "model": 'accord sport', "year": 2015},
-    {"make": 'honda', "model": 'accord sport', "year": 2014},
-    {"make": 'honda', "model": 'accord sport', "year": 2013},
-    {"make": 'honda', "model": 'accord sport 1.5t', "year": 2019},
-    {"make": 'honda', "model": 'accord sport se', "year": 2017},
-    {"make": 'honda', "model": 'accord sport se sedan 4d', "year": 2017},
-    {"make": 'honda', "model": 'accord sport sedan 4d', "year": 2018},
-    {"make": 'honda', "model": 'accord sport sedan 4d', "year": 2017},
-    {"make": 'honda', "model": 'accord sport sedan 4d', "year": 2013},
-    {"make": 'honda', "model": 'accord sport special fwd', "year": 2017},
-    {"make": 'honda', "model": 'accord touring', "year": 2013},
-    {"make": 'honda', "model": 'accord touring sedan 4d', "year": 2018},
-    {"make": 'honda', "model": 'accord touring v6', "year": 2013},
-    {"make": 'honda', "model": 'civic', "year": 2021},
-    {"make": 'honda', "model": 'civic', "year": 2020},
-    {"make": 'honda', "model": 'civic', "year": 2019},
-    {"make": 'honda', "model": 'civic', "year": 2018},
-    {"make": 'honda', "model": 'civic', "year": 2017},
-    {"make": 'honda', "model": 'civic', "year": 2016},
-    {"make": 'honda', "model": 'civic', "year": 2015},
-    {"make": 'honda', "model": 'civic', "year": 2014},
-    {"make": 'honda', "model": 'civic', "year": 2013},
-    {"make": 'honda', "model": 'civic', "year": 2012},
-    {"make": 'honda', "model": 'civic', "year": 2011},
-    {"make": 'honda', "model": 'civic', "year": 2010},
-    {"make": 'honda', "model": 'civic', "year": 2009},
-    {"make": 'honda', "model": 'civic', "year": 2008},
-    {"make": 'honda', "model": 'civic', "year": 2007},
-    {"make": 'honda', "model": 'civic', "year": 2006},
-    {"make": 'honda', "model": 'civic', "year": 2005},
-    {"make": 'honda', "model": 'civic coupe', "year": 2015},
-    {"make": 'honda', "model": 'civic coupe', "year": 2013},
-    {"make": 'honda', "model": 'civic coupe', "year": 2012},
-    {"make": 'honda', "model": 'civic coupe', "year": 2011},
-    {"make": 'honda', "model": 'civic coupe', "year": 2008},
-    {"make": 'honda', "model": 'civic cpe', "year": 2013},
-    {"make": 'honda', "model": 'civic cpe', "year": 2008},
-    {"make": 'honda', "model": 'civic dx', "year": 2005},
-    {"make": 'honda', "model": 'civic ex', "year": 2019},
-    {"make": 'honda', "model": 'civic ex', "year": 2018},
-    {"make": 'honda', "model": 'civic ex', "year": 2017},
-    {"make": 'honda', "model": 'civic ex', "year": 2016},
-    {"make": 'honda', "model": 'civic ex', "year": 2015},
-    {"make": 'honda', "model": 'civic ex', "year": 2014},
-    {"make": 'honda', "model": 'civic ex', "year": 2013},
-    {"make": 'honda', "model": 'civic ex', "year": 2012},
-    {"make": 'honda', "model": 'civic ex', "year": 2011},
-    {"make": 'honda', "model": 'civic ex', "year": 2010},
-    {"make": 'honda', "model": 'civic ex', "year": 2009},
-    {"make": 'honda', "model": 'civic ex', "year": 2008},
-    {"make": 'honda', "model": 'civic ex', "year": 2007},
-    {"make": 'honda', "model": 'civic ex', "year": 2006},
-    {"make": 'honda', "model": 'civic ex', "year": 2005},
-    {"make": 'honda', "model": 'civic ex coupe', "year": 2011},
-    {"make": 'honda', "model": 'civic ex coupe', "year": 2009},
-    {"make": 'honda', "model": 'civic ex cpe', "year": 2013},
-    {"make": 'honda', "model": 'civic ex fwd gas sedan', "year": 2017},
-    {"make": 'honda', "model": 'civic ex hatchback 4d', "year": 2019},
-    {"make": 'honda', "model": 'civic ex sedan 4d', "year": 2020},
-    {"make": 'honda', "model": 'civic ex sedan 4d', "year": 2018},
-    {"make": 'honda', "model": 'civic ex sedan 4d', "year": 2014},
-    {"make": 'honda', "model": 'civic ex-l', "year": 2017},
-    {"make": 'honda', "model": 'civic ex-l', "year": 2015},
-    {"make": 'honda', "model": 'civic ex-l', "year": 2013},
-    {"make": 'honda', "model": 'civic ex-l', "year": 2012},
-    {"make": 'honda', "model": 'civic ex-l', "year": 2008},
-    {"make": 'honda', "model": 'civic ex-l sedan 4d', "year": 2015},
-    {"make": 'honda', "model": 'civic exl', "year": 2008},
-    {"make": 'honda', "model": 'civic hatchback', "year": 2019},
-    {"make": 'honda', "model": 'civic hatchback', "year": 2018},
-    {"make": 'honda', "model": 'civic hatchback', "year": 2017},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2015},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2010},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2009},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2008},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2007},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2006},
-    {"make": 'honda', "model": 'civic hybrid', "year": 2005},
-    {"make": 'honda', "model": 'civic lx', "year": 2020},
-    {"make": 'honda', "model": 'civic lx', "year": 2019},
-    {"make": 'honda', "model": 'civic lx', "year": 2018},
-    {"make": 'honda', "model": 'civic lx', "year": 2017},
-    {"make": 'honda', "model": 'civic lx', "year": 2016},
-    {"make": 'honda', "model": 'civic lx', "year": 2015},
-    {"make": 'honda', "model": 'civic lx', "year": 2014},
-    {"make": 'honda', "model": 'civic lx', "year": 2013},
-    {"make": 'honda', "model": 'civic lx', "year": 2012},
-    {"make": 'honda', "model": 'civic lx', "year": 2011},
-    {"make": 'honda', "model": 'civic lx', "year": 2010},
-    {"make": 'honda', "model": 'civic lx', "year": 2009},
-    {"make": 'honda', "model": 'civic lx', "year": 2008},
-    {"make": 'honda', "model": 'civic lx', "year": 2007},
-    {"make": 'honda', "model": 'civic lx', "year": 2006},
-    {"make": 'honda', "model": 'civic lx', "year": 2005},
-    {"make": 'honda', "model": 'civic lx coupe', "year": 2015},
-    {"make": 'honda', "model": 'civic lx coupe 2d', "year": 2018},
-    {"make": 'honda', "model": 'civic lx coupe 2d', "year": 2015},
-    {"make": 'honda', "model": 'civic lx coupe 2d', "year": 2014},
-    {"make": 'honda', "model": 'civic lx fwd gas sedan', "year": 2013},
-    {"make": 'honda', "model": 'civic lx hatchback 4d', "year": 2017},
-    {"make": 'honda', "model": 'civic lx sedan', "year": 2015},
-    {"make": 'honda', "model": 'civic lx sedan', "year": 2014},
-    {"make": 'honda', "model": 'civic lx sedan', "year": 2012},
-    {"make": 'honda', "model": 'civic lx sedan', "year": 2007},
-    {"make": 'honda', "model": 'civic lx sedan', "year": 2006},
-    {"make": 'honda', "model": 'civic lx sedan 4d', "year": 2018},
-    {"make": 'honda', "model": 'civic lx sedan 4d', "year": 2017},
-    {"make": 'honda', "model": 'civic lx sedan 4d', "year": 2016},
-    {"make": 'honda', "model": 'civic lx sedan 4d', "year": 2015},
-    {"make": 'honda', "model": 'civic natural gas sedan 4d', "year": 2012},
-    {"make": 'honda', "model": 'civic sdn', "year": 2013},
-    {"make": 'honda', "model": 'civic sdn', "year": 2012},
-    {"make": 'honda', "model": 'civic sdn', "year": 2009},
-    {"make": 'honda', "model": 'civic sdn', "year": 2008},
-    {"make": 'honda', "model": 'civic sdn lx', "year": 2013},
-    {"make": 'honda', "model": 'civic sedan', "year": 2020},
-    {"make": 'honda', "model": 'civic sedan', "year": 2019},
-    {"make": 'honda', "model": 'civic sedan', "year": 2018},
-    {"make": 'honda', "model": 'civic sedan', "year": 2017},
-    {"make": 'honda', "model": 'civic sedan', "year": 2016},
-    {"make": 'honda', "model": 'civic sedan', "year": 2015},
-    {"make": 'honda', "model": 'civic sedan', "year": 2014},
-    {"make": 'honda', "model": 'civic sedan', "year": 2012},
-    {"make": 'honda', "model": 'civic sedan', "year": 2010},
-    {"make": 'honda', "model": 'civic sedan', "year": 2009},
-    {"make": 'honda', "model": 'civic sedan lx', "year": 2017},
-    {"make": 'honda', "model": 'civic sedan touring', "year": 2019},
-    {"make": 'honda', "model": 'civic si', "year": 2015},
-    {"make": 'honda', "model": 'civic si', "year": 2013},
-    {"make": 'honda', "model": 'civic si', "year": 2012},
-    {"make": 'honda', "model": 'civic si', "year": 2008},
-    {"make": 'honda', "model": 'civic si', "year": 2007},
-    {"make": 'honda', "model": 'civic si', "year": 2006},
-    {"make": 'honda', "model": 'civic si coupe', "year": 2008},
-    {"make": 'honda', "model": 'civic si coupe 2d', "year": 2020},
-    {"make": 'honda', "model": 'civic si coupe 2d', "year": 2018},
-    {"make": 'honda', "model": 'civic si coupe 2d', "year": 2014},
-    {"make": 'honda', "model": 'civic si coupe 2d', "year": 2013},
-    {"make": 'honda', "model": 'civic si sedan 4d', "year": 2019},
-    {"make": 'honda', "model": 'civic si sedan 4d', "year": 2018},
-    {"make": 'honda', "model": 'civic si sedan 4d', "year": 2013},
-    {"make": 'honda', "model": 'civic si sedan 4d', "year": 2012},
-    {"make": 'honda', "model": 'civic sport', "year": 2019},
-    {"make": 'honda', "model": 'civic sport hatchback', "year": 2018},
-    {"make": 'honda', "model": 'civic sport hatchback 4d', "year": 2020},
-    {"make": 'honda', "model": 'civic sport touring', "year": 2020},
-    {"make": 'honda', "model": 'civic touring sedan 4d', "year": 2020},
-    {"make": 'honda', "model": 'civic type r', "year": 2019},
-    {"make": 'honda', "model": 'civic type r touring', "year": 2019},
-    {"make": 'honda', "model": 'civic type r touring', "year": 2018},
-    {"make": 'honda', "model": 'civic type r touring', "year": 2017},
-    {"make": 'honda', "model": 'clarity', "year": 2020},
-    {"make": 'honda', "model": 'clarity plug-in hybrid', "year": 2018},
-    {"make": 'honda', "model": 'cr v', "year": 2019},
-    {"make": 'honda', "model": 'cr-v', "year": 2021},
-    {"make": 'honda', "model": 'cr-v', "year": 2020},
-    {"make": 'honda', "model": 'cr-v', "year": 2019},
-    {"make": 'honda', "model": 'cr-v', "year": 2018},
-    {"make": 'honda', "model": 'cr-v', "year": 2017},
-    {"make": 'honda', "model": 'cr-v', "year": 2016},
-    {"make": 'honda', "model": 'cr-v', "year": 2015},
-    {"make": 'honda', "model": 'cr-v', "year": 2014},
-    {"make": 'honda', "model": 'cr-v', "year": 2013},
-    {"make": 'honda', "model": 'cr-v', "year": 2012},
-    {"make": 'honda', "model": 'cr-v', "year": 2011},
-    {"make": 'honda', "model": 'cr-v', "year": 2010},
-    {"make": 'honda', "model": 'cr-v', "year": 2009},
-    {"make": 'honda', "model": 'cr-v', "year": 2008},
-    {"make": 'honda', "model": 'cr-v', "year": 2007},
-    {"make": 'honda', "model": 'cr-v', "year": 2006},
-    {"make": 'honda', "model": 'cr-v', "year": 2005},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2017},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2016},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2015},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2014},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2012},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2011},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2010},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2009},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2008},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2007},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2006},
-    {"make": 'honda', "model": 'cr-v ex', "year": 2005},
-    {"make": 'honda', "model": 'cr-v ex awd', "year": 2012},
-    {"make": 'honda', "model": 'cr-v ex l w/navi 4dr suv', "year": 2007},
-    {"make": 'honda', "model": 'cr-v ex se', "year": 2006},
-    {"make": 'honda', "model": 'cr-v ex sport utility 4d', "year": 2016},
-    {"make": 'honda', "model": 'cr-v ex sport utility 4d', "year": 2013},
-    {"make": 'honda', "model": 'cr-v ex sport utility 4d', "year": 2012},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2017},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2015},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2014},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2013},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2012},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2011},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2010},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2009},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2008},
-    {"make": 'honda', "model": 'cr-v ex-l', "year": 2007},
-    {"make": 'honda', "model": 'cr-v ex-l sport utility', "year": 2013},
-    {"make": 'honda', "model": 'cr-v ex-l sport utility 4d', "year": 2014},
-    {"make": 'honda', "model": 'cr-v ex-l w/navigation', "year": 2017},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2016},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2015},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2014},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2013},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2011},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2010},
-    {"make": 'honda', "model": 'cr-v lx', "year": 2008},
-    {"make": 'honda', "model": 'cr-v lx 4wd 5-speed at', "year": 2010},
-    {"make": 'honda', "model": 'cr-v se awd', "year": 2011},
-    {"make": 'honda', "model": 'cr-v se sport utility 4d', "year": 2016},
-    {"make": 'honda', "model": 'cr-v touring sport utility', "year": 2017},
-    {"make": 'honda', "model": 'cr-z', "year": 2012},
-    {"make": 'honda', "model": 'cr-z', "year": 2011},
-    {"make": 'honda', "model": 'cr-z ex', "year": 2014},
-    {"make": 'honda', "model": 'cr-z ex coupe 2d', "year": 2013},
-    {"make": 'honda', "model": 'crosstour', "year": 2014},
-    {"make": 'honda', "model": 'crosstour', "year": 2013},
-    {"make": 'honda', "model": 'crosstour', "year": 2012},
-    {"make": 'honda', "model": 'crosstour', "year": 2011},
-    {"make": 'honda', "model": 'crosstour ex-l sport', "year": 2013},
-    {"make": 'honda', "model": 'crosstour ex-l sport', "year": 2012},
-    {"make": 'honda', "model": 'crv', "year": 2016},
-    {"make": 'honda', "model": 'crv', "year": 2015},
-    {"make": 'honda', "model": 'crv', "year": 2014},
-    {"make": 'honda', "model": 'crv', "year": 2013},
-    {"make": 'honda', "model": 'crv', "year": 2012},
-    {"make": 'honda', "model": 'crv', "year": 2011},
-    {"make": 'honda', "model": 'crv', "year": 2010},
-    {"make": 'honda', "model": 'crv', "year": 2009},
-    {"make": 'honda', "model": 'crv', "year": 2008},
-    {"make": 'honda', "model": 'crv', "year": 2007},
-    {"make": 'honda', "model": 'crv', "year": 2006},
-    {"make": 'honda', "model": 'crv', "year": 2005},
-    {"make": 'honda', "model": 'crv all wheel drive lx', "year": 2014},
-    {"make": 'honda', "model": 'crv cr-v 4wd', "year": 2009},
-    {"make": 'honda', "model": 'crv ex', "year": 2015},
-    {"make": 'honda', "model": 'crv ex', "year": 2013},
-    {"make": 'honda', "model": 'crv ex', "year": 2009},
-    {"make": 'honda', "model": 'crv ex', "year": 2008},
-    {"make": 'honda', "model": 'crv ex', "year": 2007},
-    {"make": 'honda', "model": 'crv ex awd', "year": 2014},
-    {"make": 'honda', "model": 'crv ex-l', "year": 2010},
-    {"make": 'honda', "model": 'crv ex-l awd', "year": 2013},
-    {"make": 'honda', "model": 'crv ex-l awd', "year": 2008},
-    {"make": 'honda', "model": 'crv lx', "year": 2007},
-    {"make": 'honda', "model": 'crv lx awd', "year": 2013},
-    {"make": 'honda', "model": 'crv lx local trade', "year": 2012},
-    {"make": 'honda', "model": 'crv touring suv', "year": 2019},
-    {"make": 'honda', "model": 'crz', "year": 2011},
-    {"make": 'honda', "model": 'element', "year": 2010},
-    {"make": 'honda', "model": 'element', "year": 2008},
-    {"make": 'honda', "model": 'element', "year": 2007},
-    {"make": 'honda', "model": 'element', "year": 2006},
-    {"make": 'honda', "model": 'element', "year": 2005},
-    {"make": 'honda', "model": 'element ex 4wd at', "year": 2010},
-    {"make": 'honda', "model": 'element ex awd', "year": 2008},
-    {"make": 'honda', "model": 'element ex awd', "year": 2006},
-    {"make": 'honda', "model": 'element ex sport utility', "year": 2010},
-    {"make": 'honda', "model": 'fit', "year": 2019},
-    {"make": 'honda', "model": 'fit', "year": 2018},
-    {"make": 'honda', "model": 'fit', "year": 2017},
-    {"make": 'honda', "model": 'fit', "year": 2016},
-    {"make": 'honda', "model": 'fit', "year": 2015},
-    {"make": 'honda', "model": 'fit', "year": 2013},
-    {"make": 'honda', "model": 'fit', "year": 2012},
-    {"make": 'honda', "model": 'fit', "year": 2011},
-    {"make": 'honda', "model": 'fit', "year": 2010},
-    {"make": 'honda', "model": 'fit', "year": 2009},
-    {"make": 'honda', "model": 'fit', "year": 2008},
-    {"make": 'honda', "model": 'fit', "year": 2007},
-    {"make": 'honda', "model": 'fit ex', "year": 2016},
-    {"make": 'honda', "model": 'fit ex-l hatchback 4d', "year": 2015},
-    {"make": 'honda', "model": 'fit hatchback 4d', "year": 2012},
-    {"make": 'honda', "model": 'fit lx', "year": 2016},
-    {"make": 'honda', "model": 'fit lx hatchback 4d', "year": 2019},
-    {"make": 'honda', "model": 'fit lx hatchback 4d', "year": 2018},
-    {"make": 'honda', "model": 'fit sport', "year": 2015},
-    {"make": 'honda', "model": 'fit sport', "year": 2013},
-    {"make": 'honda', "model": 'fit sport', "year": 2012},
-    {"make": 'honda', "model": 'fit sport', "year": 2011},
-    {"make": 'honda', "model": 'fit sport', "year": 2010},
-    {"make": 'honda', "model": 'fit sport', "year": 2009},
-    {"make": 'honda', "model": 'fit sport', "year": 2008},
-    {"make": 'honda', "model": 'fit sport', "year": 2007},
-    {"make": 'honda', "model": 'fit sport automatic', "year": 2009},
-    {"make": 'honda', "model": 'fit sport hatchback', "year": 2009},
-    {"make": 'honda', "model": 'fit sport hatchback', "year": 2008},
-    {"make": 'honda', "model": 'fit sport hatchback 4d', "year": 2020},
-    {"make": 'honda', "model": 'fit sport hatchback 4d', "year": 2019},
-    {"make": 'honda', "model": 'fit sport hatchback 4d', "year": 2013},
-    {"make": 'honda', "model": 'hr-v', "year": 2019},
-    {"make": 'honda', "model": 'hr-v', "year": 2018},
-    {"make": 'honda', "model": 'hr-v', "year": 2017},
-    {"make": 'honda', "model": 'hr-v', "year": 2016},
-    {"make": 'honda', "model": 'hr-v sport suv 4d', "year": 2019},
-    {"make": 'honda', "model": 'hrv', "year": 2019},
-    {"make": 'honda', "model": 'insight', "year": 2019},
-    {"make": 'honda', "model": 'insight', "year": 2011},
-    {"make": 'honda', "model": 'insight', "year": 2010},
-    {"make": 'honda', "model": 'insight ex sedan 4d', "year": 2020},
-    {"make": 'honda', "model": 'insight ex sedan 4d', "year": 2019},
-    {"make": 'honda', "model": 'insight hybrid', "year": 2014},
-    {"make": 'honda', "model": 'insight hybrid', "year": 2010},
-    {"make": 'honda', "model": 'insight hybrid ex', "year": 2010},
-    {"make": 'honda', "model": 'insight touring sedan 4d', "year": 2019},
-    {"make": 'honda', "model": 'odyssey', "year": 2021},
-    {"make": 'honda', "model": 'odyssey', "year": 2020},
-    {"make": 'honda', "model": 'odyssey', "year": 2019},
-    {"make": 'honda', "model": 'odyssey', "year": 2018},
-    {"make": 'honda', "model": 'odyssey', "year": 2017},
-    {"make": 'honda', "model": 'odyssey', "year": 2016},
-    {"make": 'honda', "model": 'odyssey', "year": 2015},
-    {"make": 'honda', "model": 'odyssey', "year": 2014},
-    {"make": 'honda', "model": 'odyssey', "year": 2013},
-    {"make": 'honda', "model": 'odyssey', "year": 2012},
-    {"make": 'honda', "model": 'odyssey', "year": 2011},
-    {"make": 'honda', "model": 'odyssey', "year": 2010},
-    {"make": 'honda', "model": 'odyssey', "year": 2009},
-    {"make": 'honda', "model": 'odyssey', "year": 2008},
-    {"make": 'honda', "model": 'odyssey', "year": 2007},
-    {"make": 'honda', "model": 'odyssey', "year": 2006},
-    {"make": 'honda', "model": 'odyssey', "year": 2005},
-    {"make": 'honda', "model": 'odyssey elite minivan 4d', "year": 2018},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2013},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2012},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2011},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2010},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2008},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2007},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2006},
-    {"make": 'honda', "model": 'odyssey ex', "year": 2005},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2019},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2016},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2015},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2014},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2013},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2012},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2011},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2010},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2009},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2008},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2007},
-    {"make": 'honda', "model": 'odyssey ex-l', "year": 2006},
-    {"make": 'honda', "model": 'odyssey ex-l minivan 4d', "year": 2019},
-    {"make": 'honda', "model": 'odyssey ex-l minivan 4d', "year": 2015},
-    {"make": 'honda', "model": 'odyssey ex-l w/dvd w/navi', "year": 2010},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2021},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2019},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2014},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2012},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2010},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2008},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2007},
-    {"make": 'honda', "model": 'odyssey exl', "year": 2006},
-    {"make": 'honda', "model": 'odyssey lx', "year": 2011},
-    {"make": 'honda', "model": 'odyssey touring', "year": 2010},
-    {"make": 'honda', "model": 'odyssey touring', "year": 2007},
-    {"make": 'honda', "model": 'odyssey touring', "year": 2006},
-    {"make": 'honda', "model": 'odyssey touring elite', "year": 2014},
-    {"make": 'honda', "model": 'odyssey touring elite', "year": 2011},
-    {"make": 'honda', "model": 'passport', "year": 2019},
-    {"make": 'honda', "model": 'passport elite sport', "year": 2020},
-    {"make": 'honda', "model": 'passport ex-l sport', "year": 2019},
-    {"make": 'honda', "model": 'passport sport suv 4d', "year": 2019},
-    {"make": 'honda', "model": 'pilot', "year": 2020},
-    {"make": 'honda', "model": 'pilot', "year": 2019},
-    {"make": 'honda', "model": 'pilot', "year": 2018},
-    {"make": 'honda', "model": 'pilot', "year": 2017},
-    {"make": 'honda', "model": 'pilot', "year": 2016},
-    {"make": 'honda', "model": 'pilot', "year": 2015},
-    {"make": 'honda', "model": 'pilot', "year": 2014},
-    {"make": 'honda', "model": 'pilot', "year": 2013},
-    {"make": 'honda', "model": 'pilot', "year": 2012},
-    {"make": 'honda', "model": 'pilot', "year": 2011},
-    {"make": 'honda', "model": 'pilot', "year": 2010},
-    {"make": 'honda', "model": 'pilot', "year": 2009},
-    {"make": 'honda', "model": 'pilot', "year": 2008},
-    {"make": 'honda', "model": 'pilot', "year": 2007},
-    {"make": 'honda', "model": 'pilot', "year": 2006},
-    {"make": 'honda', "model": 'pilot', "year": 2005},
-    {"make": 'honda', "model": 'pilot 4wd v6 touring', "year": 2015},
-    {"make": 'honda', "model": 'pilot elite', "year": 2019},
-    {"make": 'honda', "model": 'pilot ex', "year": 2011},
-    {"make": 'honda', "model": 'pilot ex', "year": 2007},
-    {"make": 'honda', "model": 'pilot ex', "year": 2006},
-    {"make": 'honda', "model": 'pilot ex', "year": 2005},
-    {"make": 'honda', "model": 'pilot ex 4wd w/leather and navigatio', "year": 2006},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2018},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2016},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2014},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2013},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2012},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2011},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2010},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2009},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2008},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2007},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2006},
-    {"make": 'honda', "model": 'pilot ex-l', "year": 2005},
-    {"make": 'honda', "model": 'pilot ex-l 4wd', "year": 2015},
-    {"make": 'honda', "model": 'pilot ex-l 4wd', "year": 2012},
-    {"make": 'honda', "model": 'pilot ex-l 4wd', "year": 2011},
-    {"make": 'honda', "model": 'pilot ex-l 4wd 5-spd at with navigat', "year": 2012},
-    {"make": 'honda', "model": 'pilot ex-l awd, 3rd row seating', "year": 2011},
-    {"make": 'honda', "model": 'pilot ex-l sport utility', "year": 2018},
-    {"make": 'honda', "model": 'pilot ex-l sport utility', "year": 2017},
-    {"make": 'honda', "model": 'pilot ex-l sport utility', "year": 2016},
-    {"make": 'honda', "model": 'pilot ex-l w/res sport', "year": 2018},
-    {"make": 'honda', "model": 'pilot exl', "year": 2005},
-    {"make": 'honda', "model": 'pilot lx 4x4', "year": 2014},
-    {"make": 'honda', "model": 'pilot lx sport utility 4d', "year": 2017},
-    {"make": 'honda', "model": 'pilot se', "year": 2008},
-    {"make": 'honda', "model": 'pilot touring', "year": 2014},
-    {"make": 'honda', "model": 'pilot touring', "year": 2011},
-    {"make": 'honda', "model": 'pilot touring', "year": 2009},
-    {"make": 'honda', "model": 'pilot touring awd', "year": 2011},
-    {"make": 'honda', "model": 'pilot touring sport', "year": 2017},
-    {"make": 'honda', "model": 'pilot touring w/navi', "year": 2009},
-    {"make": 'honda', "model": 'ridgeline', "year": 2019},
-    {"make": 'honda', "model": 'ridgeline', "year": 2018},
-    {"make": 'honda', "model": 'ridgeline', "year": 2017},
-    {"make": 'honda', "model": 'ridgeline', "year": 2014},
-    {"make": 'honda', "model": 'ridgeline', "year": 2013},
-    {"make": 'honda', "model": 'ridgeline', "year": 2012},
-    {"make": 'honda', "model": 'ridgeline', "year": 2011},
-    {"make": 'honda', "model": 'ridgeline', "year": 2010},
-    {"make": 'honda', "model": 'ridgeline', "year": 2009},
-    {"make": 'honda', "model": 'ridgeline', "year": 2008},
-    {"make": 'honda', "model": 'ridgeline', "year": 2007},
-    {"make": 'honda', "model": 'ridgeline', "year": 2006},
-    {"make": 'honda', "model": 'ridgeline rtl', "year": 2019},
-    {"make": 'honda', "model": 'ridgeline rtl', "year": 2017},
-    {"make": 'honda', "model": 'ridgeline rtl', "year": 2008},
-    {"make": 'honda', "model": 'ridgeline rtl', "year": 2007},
-    {"make": 'honda', "model": 'ridgeline rtl', "year": 2006},
-    {"make": 'honda', "model": 'ridgeline rtl pickup 4d 5', "year": 2020},
-    {"make": 'honda', "model": 'ridgeline rtl pickup 4d 5', "year": 2019},
-    {"make": 'honda', "model": 'ridgeline rtl pickup 4d 5', "year": 2018},
-    {"make": 'honda', "model": 'ridgeline rtl-e crew cab', "year": 2019},
-    {"make": 'honda', "model": 'ridgeline rtl-e pickup 4d', "year": 2019},
-    {"make": 'honda', "model": 'ridgeline rtl-t pickup 4d', "year": 2019},
-    {"make": 'honda', "model": 'ridgeline sport pickup 4d', "year": 2020},
-    {"make": 'honda', "model": 'ridgeline sport pickup 4d', "year": 2019},
-    {"make": 'honda', "model": 's2000', "year": 2006},
-    {"make": 'hyundai', "model": 'accent', "year": 2019},
-    {"make": 'hyundai', "model": 'accent', "year": 2017},
-    {"make": 'hyundai', "model": 'accent', "year": 2016},
-    {"make": 'hyundai', "model": 'accent', "year": 2015},
-    {"make": 'hyundai', "model": 'accent', "year": 2014},
-    {"make": 'hyundai', "model": 'accent', "year": 2013},
-    {"make": 'hyundai', "model": 'accent', "year": 2012},
-    {"make": 'hyundai', "model": 'accent', "year": 2011},
-    {"make": 'hyundai', "model": 'accent', "year": 2010},
-    {"make": 'hyundai', "model": 'accent', "year": 2009},
-    {"make": 'hyundai', "model": 'accent', "year": 2008},
-    {"make": 'hyundai', "model": 'accent', "year": 2007},
-    {"make": 'hyundai', "model": 'accent', "year": 2006},
-    {"make": 'hyundai', "model": 'accent gls', "year": 2015},
-    {"make": 'hyundai', "model": 'accent gls', "year": 2013},
-    {"make": 'hyundai', "model": 'accent gls', "year": 2012},
-    {"make": 'hyundai', "model": 'accent gs', "year": 2014},
-    {"make": 'hyundai', "model": 'accent gs', "year": 2010},
-    {"make": 'hyundai', "model": 'accent se', "year": 2017},
-    {"make": 'hyundai', "model": 'accent se', "year": 2016},
-    {"make": 'hyundai', "model": 'accent se', "year": 2007},
-    {"make": 'hyundai', "model": 'accent se sedan 4d', "year": 2020},
-    {"make": 'hyundai', "model": 'accent se sedan 4d', "year": 2019},
-    {"make": 'hyundai', "model": 'accent se sedan 4d', "year": 2018},
-    {"make": 'hyundai', "model": 'accent se sedan 4d', "year": 2017},
-    {"make": 'hyundai', "model": 'accent value edition', "year": 2017},
-    {"make": 'hyundai', "model": 'azera', "year": 2015},
-    {"make": 'hyundai', "model": 'azera', "year": 2014},
-    {"make": 'hyundai', "model": 'azera', "year": 2007},
-    {"make": 'hyundai', "model": 'azera', "year": 2006},
-    {"make": 'hyundai', "model": 'azera limited', "year": 2007},
-    {"make": 'hyundai', "model": 'azera sedan 4d', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra', "year": 2020},
-    {"make": 'hyundai', "model": 'elantra', "year": 2019},
-    {"make": 'hyundai', "model": 'elantra', "year": 2018},
-    {"make": 'hyundai', "model": 'elantra', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra', "year": 2016},
-    {"make": 'hyundai', "model": 'elantra', "year": 2015},
-    {"make": 'hyundai', "model": 'elantra', "year": 2014},
-    {"make": 'hyundai', "model": 'elantra', "year": 2013},
-    {"make": 'hyundai', "model": 'elantra', "year": 2012},
-    {"make": 'hyundai', "model": 'elantra', "year": 2011},
-    {"make": 'hyundai', "model": 'elantra', "year": 2010},
-    {"make": 'hyundai', "model": 'elantra', "year": 2009},
-    {"make": 'hyundai', "model": 'elantra', "year": 2008},
-    {"make": 'hyundai', "model": 'elantra', "year": 2007},
-    {"make": 'hyundai', "model": 'elantra', "year": 2006},
-    {"make": 'hyundai', "model": 'elantra', "year": 2005},
-    {"make": 'hyundai', "model": 'elantra coupe', "year": 2014},
-    {"make": 'hyundai', "model": 'elantra coupe', "year": 2013},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2013},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2012},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2011},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2010},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2009},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2008},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2007},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2006},
-    {"make": 'hyundai', "model": 'elantra gls', "year": 2005},
-    {"make": 'hyundai', "model": 'elantra gls pzev', "year": 2013},
-    {"make": 'hyundai', "model": 'elantra gls pzev', "year": 2010},
-    {"make": 'hyundai', "model": 'elantra gt', "year": 2018},
-    {"make": 'hyundai', "model": 'elantra gt', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra gt', "year": 2016},
-    {"make": 'hyundai', "model": 'elantra gt', "year": 2014},
-    {"make": 'hyundai', "model": 'elantra gt', "year": 2013},
-    {"make": 'hyundai', "model": 'elantra gt fwd gas auto', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra gt hatchback 4d', "year": 2018},
-    {"make": 'hyundai', "model": 'elantra limited', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra limited', "year": 2013},
-    {"make": 'hyundai', "model": 'elantra limited pzev', "year": 2012},
-    {"make": 'hyundai', "model": 'elantra limited sedan 4d', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra se', "year": 2018},
-    {"make": 'hyundai', "model": 'elantra se', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra se', "year": 2016},
-    {"make": 'hyundai', "model": 'elantra se', "year": 2015},
-    {"make": 'hyundai', "model": 'elantra se', "year": 2014},
-    {"make": 'hyundai', "model": 'elantra se', "year": 2010},
-    {"make": 'hyundai', "model": 'elantra se 4dr sedan', "year": 2016},
-    {"make": 'hyundai', "model": 'elantra se sedan 4d', "year": 2017},
-    {"make": 'hyundai', "model": 'elantra se sedan 4d', "year": 2015},
-    {"make": 'hyundai', "model": 'elantra sel', "year": 2020},
-    {"make": 'hyundai', "model": 'elantra sel', "year": 2019},
-    {"make": 'hyundai', "model": 'elantra sel', "year": 2018},
-    {"make": 'hyundai', "model": 'elantra touring', "year": 2011},
-    {"make": 'hyundai', "model": 'elantra touring', "year": 2010},
-    {"make": 'hyundai', "model": 'entourage', "year": 2008},
-    {"make": 'hyundai', "model": 'entourage', "year": 2007},
-    {"make": 'hyundai', "model": 'equus', "year": 2014},
-    {"make": 'hyundai', "model": 'equus', "year": 2012},
-    {"make": 'hyundai', "model": 'equus signature sedan 4d', "year": 2013},
-    {"make": 'hyundai', "model": 'genesis', "year": 2016},
-    {"make": 'hyundai', "model": 'genesis', "year": 2015},
-    {"make": 'hyundai', "model": 'genesis', "year": 2014},
-    {"make": 'hyundai', "model": 'genesis', "year": 2013},
-    {"make": 'hyundai', "model": 'genesis', "year": 2012},
-    {"make": 'hyundai', "model": 'genesis', "year": 2011},
-    {"make": 'hyundai', "model": 'genesis', "year": 2010},
-    {"make": 'hyundai', "model": 'genesis', "year": 2009},
-    {"make": 'hyundai', "model": 'genesis 3.8 sedan 4d', "year": 2016},
-    {"make": 'hyundai', "model": 'genesis 3.8 sedan 4d', "year": 2015},
-    {"make": 'hyundai', "model": 'genesis 3.8 sedan 4d', "year": 2013},
-    {"make": 'hyundai', "model": 'genesis 3.8l', "year": 2018},
-    {"make": 'hyundai', "model": 'genesis 3.8l', "year": 2015},
-    {"make": 'hyundai', "model": 'genesis 3.8l', "year": 2012},
-    {"make": 'hyundai', "model": 'genesis 4.6 sedan 4d', "year": 2011},
-    {"make": 'hyundai', "model": 'genesis coupe', "year": 2013},
-    {"make": 'hyundai', "model": 'genesis coupe', "year": 2012},
-    {"make": 'hyundai', "model": 'genesis coupe', "year": 2011},
-    {"make": 'hyundai', "model": 'genesis coupe', "year": 2010},
-    {"make": 'hyundai', "model": 'genesis coupe 2.0t', "year": 2012},
-    {"make": 'hyundai', "model": 'genesis coupe 2.0t', "year": 2011},
-    {"make": 'hyundai', "model": 'genesis coupe 3.8', "year": 2016},
-    {"make": 'hyundai', "model": 'genesis coupe 3.8 2d', "year": 2016},
-    {"make": 'hyundai', "model": 'genesis coupe 3.8 2d', "year": 2015},
-    {"make": 'hyundai', "model": 'genesis coupe 3.8 track', "year": 2013},
-    {"make": 'hyundai', "model": 'ioniq electric', "year": 2019},
-    {"make": 'hyundai', "model": 'ioniq electric limited', "year": 2019},
-    {"make": 'hyundai', "model": 'ioniq hybrid', "year": 2018},
-    {"make": 'hyundai', "model": 'ioniq hybrid sel', "year": 2019},
-    {"make": 'hyundai', "model": 'ioniq hybrid sel', "year": 2017},
-    {"make": 'hyundai', "model": 'ioniq plug-in hybrid', "year": 2019},
-    {"make": 'hyundai', "model": 'kona', "year": 2021},
-    {"make": 'hyundai', "model": 'kona', "year": 2020},
-    {"make": 'hyundai', "model": 'kona', "year": 2019},
-    {"make": 'hyundai', "model": 'kona', "year": 2018},
-    {"make": 'hyundai', "model": 'kona electric ultimate', "year": 2020},
-    {"make": 'hyundai', "model": 'kona ultimate sport', "year": 2020},
-    {"make": 'hyundai', "model": 'palisade se sport', "year": 2020},
-    {"make": 'hyundai', "model": 'palisade sel sport', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2019},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2018},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2017},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2016},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2015},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2014},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2013},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2012},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2011},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2010},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2009},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2008},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2007},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2006},
-    {"make": 'hyundai', "model": 'santa fe', "year": 2005},
-    {"make": 'hyundai', "model": 'santa fe 2.0t limited', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe 2.0t sel sport', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe 2.4 limited', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe 2.4 se sport', "year": 2019},
-    {"make": 'hyundai', "model": 'santa fe 2.4 sel sport', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe 2.4 ultimate', "year": 2019},
-    {"make": 'hyundai', "model": 'santa fe gls', "year": 2012},
-    {"make": 'hyundai', "model": 'santa fe gls', "year": 2011},
-    {"make": 'hyundai', "model": 'santa fe gls', "year": 2009},
-    {"make": 'hyundai', "model": 'santa fe gls', "year": 2008},
-    {"make": 'hyundai', "model": 'santa fe gls', "year": 2006},
-    {"make": 'hyundai', "model": 'santa fe limited', "year": 2017},
-    {"make": 'hyundai', "model": 'santa fe limited', "year": 2012},
-    {"make": 'hyundai', "model": 'santa fe limited', "year": 2011},
-    {"make": 'hyundai', "model": 'santa fe limited', "year": 2009},
-    {"make": 'hyundai', "model": 'santa fe se awd, w/ lane keeping assist', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe se sport', "year": 2018},
-    {"make": 'hyundai', "model": 'santa fe sel awd gas suv', "year": 2020},
-    {"make": 'hyundai', "model": 'santa fe sport', "year": 2018},
-    {"make": 'hyundai', "model": 'santa fe sport', "year": 2017},
-    {"make": 'hyundai', "model": 'santa fe sport', "year": 2016},
-    {"make": 'hyundai', "model": 'santa fe sport', "year": 2015},
-    {"make": 'hyundai', "model": 'santa fe sport', "year": 2014},
-    {"make": 'hyundai', "model": 'santa fe sport', "year": 2013},
-    {"make": 'hyundai', "model": 'santa fe sport 2.0t', "year": 2013},
-    {"make": 'hyundai', "model": 'santa fe sport 2.4l', "year": 2018},
-    {"make": 'hyundai', "model": 'santa fe sport 2.4l', "year": 2017},
-    {"make": 'hyundai', "model": 'santa fe sport awd', "year": 2014},
-    {"make": 'hyundai', "model": 'santa fe sport awd', "year": 2013},
-    {"make": 'hyundai', "model": 'santa fe sport utility', "year": 2018},
-    {"make": 'hyundai', "model": 'santa fe sport utility', "year": 2017},
-    {"make": 'hyundai', "model": 'santa fe sport utility', "year": 2015},
-    {"make": 'hyundai', "model": 'santa fe xl se sport', "year": 2019},
-    {"make": 'hyundai', "model": 'sonata', "year": 2020},
-    {"make": 'hyundai', "model": 'sonata', "year": 2019},
-    {"make": 'hyundai', "model": 'sonata', "year": 2018},
-    {"make": 'hyundai', "model": 'sonata', "year": 2017},
-    {"make": 'hyundai', "model": 'sonata', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata', "year": 2014},
-    {"make": 'hyundai', "model": 'sonata', "year": 2013},
-    {"make": 'hyundai', "model": 'sonata', "year": 2012},
-    {"make": 'hyundai', "model": 'sonata', "year": 2011},
-    {"make": 'hyundai', "model": 'sonata', "year": 2010},
-    {"make": 'hyundai', "model": 'sonata', "year": 2009},
-    {"make": 'hyundai', "model": 'sonata', "year": 2008},
-    {"make": 'hyundai', "model": 'sonata', "year": 2007},
-    {"make": 'hyundai', "model": 'sonata', "year": 2006},
-    {"make": 'hyundai', "model": 'sonata', "year": 2005},
-    {"make": 'hyundai', "model": 'sonata 2.4l', "year": 2017},
-    {"make": 'hyundai', "model": 'sonata 2.4l limited', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata 2.4l se', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata eco sedan 4d', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2014},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2013},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2012},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2011},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2010},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2009},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2008},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2007},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2006},
-    {"make": 'hyundai', "model": 'sonata gls', "year": 2005},
-    {"make": 'hyundai', "model": 'sonata gls 4dr sedan', "year": 2009},
-    {"make": 'hyundai', "model": 'sonata gls pzev', "year": 2013},
-    {"make": 'hyundai', "model": 'sonata gls sedan 4d', "year": 2014},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2017},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2014},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2013},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2012},
-    {"make": 'hyundai', "model": 'sonata hybrid', "year": 2011},
-    {"make": 'hyundai', "model": 'sonata hybrid limited', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata hybrid limited', "year": 2013},
-    {"make": 'hyundai', "model": 'sonata limited', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata limited', "year": 2013},
-    {"make": 'hyundai', "model": 'sonata limited', "year": 2011},
-    {"make": 'hyundai', "model": 'sonata limited', "year": 2009},
-    {"make": 'hyundai', "model": 'sonata limited sedan 4d', "year": 2021},
-    {"make": 'hyundai', "model": 'sonata limited sedan 4d', "year": 2018},
-    {"make": 'hyundai', "model": 'sonata plug-in hybrid', "year": 2017},
-    {"make": 'hyundai', "model": 'sonata se', "year": 2019},
-    {"make": 'hyundai', "model": 'sonata se', "year": 2018},
-    {"make": 'hyundai', "model": 'sonata se', "year": 2017},
-    {"make": 'hyundai', "model": 'sonata se', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata se', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata se', "year": 2011},
-    {"make": 'hyundai', "model": 'sonata se sedan 4d', "year": 2020},
-    {"make": 'hyundai', "model": 'sonata se sedan 4d', "year": 2019},
-    {"make": 'hyundai', "model": 'sonata se sedan 4d', "year": 2018},
-    {"make": 'hyundai', "model": 'sonata se sedan 4d', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata se sedan 4d', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata sel plus sedan 4d', "year": 2020},
-    {"make": 'hyundai', "model": 'sonata sel sedan 4d', "year": 2020},
-    {"make": 'hyundai', "model": 'sonata sel sedan 4d', "year": 2019},
-    {"make": 'hyundai', "model": 'sonata sel sedan 4d', "year": 2018},
-    {"make": 'hyundai', "model": 'sonata sport', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata sport', "year": 2015},
-    {"make": 'hyundai', "model": 'sonata sport sedan 4d', "year": 2019},
-    {"make": 'hyundai', "model": 'sonata sport sedan 4d', "year": 2017},
-    {"make": 'hyundai', "model": 'sonata sport sedan 4d', "year": 2016},
-    {"make": 'hyundai', "model": 'sonata sport sedan 4d', "year": 2015},
-    {"make": 'hyundai', "model": 'tiburon', "year": 2008},
-    {"make": 'hyundai', "model": 'tiburon', "year": 2007},
-    {"make": 'hyundai', "model": 'tiburon gt', "year": 2007},
-    {"make": 'hyundai', "model": 'tucson', "year": 2021},
-    {"make": 'hyundai', "model": 'tucson', "year": 2020},
-    {"make": 'hyundai', "model": 'tucson', "year": 2019},
-    {"make": 'hyundai', "model": 'tucson', "year": 2018},
-    {"make": 'hyundai', "model": 'tucson', "year": 2017},
-    {"make": 'hyundai', "model": 'tucson', "year": 2016},
-    {"make": 'hyundai', "model": 'tucson', "year": 2015},
-    {"make": 'hyundai', "model": 'tucson', "year": 2014},
-    {"make": 'hyundai', "model": 'tucson', "year": 2013},
-    {"make": 'hyundai', "model": 'tucson', "year": 2012},
-    {"make": 'hyundai', "model": 'tucson', "year": 2011},
-    {"make": 'hyundai', "model": 'tucson', "year": 2010},
-    {"make": 'hyundai', "model": 'tucson', "year": 2008},
-    {"make": 'hyundai', "model": 'tucson', "year": 2007},
-    {"make": 'hyundai', "model": 'tucson', "year": 2006},
-    {"make": 'hyundai', "model": 'tucson', "year": 2005},
-    {"make": 'hyundai', "model": 'tucson eco sport utility', "year": 2017},
-    {"make": 'hyundai', "model": 'tucson gl sport', "year": 2006},
-    {"make": 'hyundai', "model": 'tucson gls', "year": 2014},
-    {"make": 'hyundai', "model": 'tucson gls', "year": 2013},
-    {"make": 'hyundai', "model": 'tucson gls pzev', "year": 2011},
-    {"make": 'hyundai', "model": 'tucson gls sport utility', "year": 2013},
-    {"make": 'hyundai', "model": 'tucson limited', "year": 2013},
-    {"make": 'hyundai', "model": 'tucson se', "year": 2018},
-    {"make": 'hyundai', "model": 'tucson se awd', "year": 2019},
-    {"make": 'hyundai', "model": 'tucson se awd gas suv', "year": 2020},
-    {"make": 'hyundai', "model": 'tucson se sport utility', "year": 2017},
-    {"make": 'hyundai', "model": 'tucson sel', "year": 2018},
-    {"make": 'hyundai', "model": 'tucson sport suv 4d', "year": 2017},
-    {"make": 'hyundai', "model": 'veloster', "year": 2019},
-    {"make": 'hyundai', "model": 'veloster', "year": 2017},
-    {"make": 'hyundai', "model": 'veloster', "year": 2016},
-    {"make": 'hyundai', "model": 'veloster', "year": 2015},
-    {"make": 'hyundai', "model": 'veloster', "year": 2014},
-    {"make": 'hyundai', "model": 'veloster', "year": 2013},
-    {"make": 'hyundai', "model": 'veloster', "year": 2012},
-    {"make": 'hyundai', "model": 'veloster coupe 3d', "year": 2012},
-    {"make": 'hyundai', "model": 'veloster hatchback', "year": 2016},
-    {"make": 'hyundai', "model": 'veloster n coupe 3d', "year": 2020},
-    {"make": 'hyundai', "model": 'veloster n coupe 3d', "year": 2019},
-    {"make": 'hyundai', "model": 'veloster turbo', "year": 2016},
-    {"make": 'hyundai', "model": 'veloster turbo', "year": 2013},
-    {"make": 'hyundai', "model": 'veloster turbo r-spec', "year": 2016},
-    {"make": 'hyundai', "model": 'venue sel sport utility', "year": 2020},
-    {"make": 'hyundai', "model": 'veracruz', "year": 2012},
-    {"make": 'hyundai', "model": 'veracruz', "year": 2011},
-    {"make": 'hyundai', "model": 'veracruz', "year": 2010},
-    {"make": 'hyundai', "model": 'veracruz', "year": 2008},
-    {"make": 'hyundai', "model": 'veracruz', "year": 2007},
-    {"make": 'hyundai', "model": 'veracruz limited', "year": 2012},
-    {"make": 'jeep', "model": 'all-new wrangler unlimited', "year": 2018},
-    {"make": 'jeep', "model": 'cherokee', "year": 2021},
-    {"make": 'jeep', "model": 'cherokee', "year": 2020},
-    {"make": 'jeep', "model": 'cherokee', "year": 2019},
-    {"make": 'jeep', "model": 'cherokee', "year": 2018},
-    {"make": 'jeep', "model": 'cherokee', "year": 2017},
-    {"make": 'jeep', "model": 'cherokee', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee', "year": 2015},
-    {"make": 'jeep', "model": 'cherokee', "year": 2014},
-    {"make": 'jeep', "model": 'cherokee latitude', "year": 2019},
-    {"make": 'jeep', "model": 'cherokee latitude', "year": 2018},
-    {"make": 'jeep', "model": 'cherokee latitude', "year": 2017},
-    {"make": 'jeep', "model": 'cherokee latitude', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee latitude', "year": 2015},
-    {"make": 'jeep', "model": 'cherokee latitude', "year": 2014},
-    {"make": 'jeep', "model": 'cherokee latitude 4 x 4', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee latitude 4wd', "year": 2015},
-    {"make": 'jeep', "model": 'cherokee latitude 4x4', "year": 2014},
-    {"make": 'jeep', "model": 'cherokee latitude plus', "year": 2019},
-    {"make": 'jeep', "model": 'cherokee latitude sport', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee limited', "year": 2019},
-    {"make": 'jeep', "model": 'cherokee limited', "year": 2017},
-    {"make": 'jeep', "model": 'cherokee limited', "year": 2015},
-    {"make": 'jeep', "model": 'cherokee limited', "year": 2014},
-    {"make": 'jeep', "model": 'cherokee limited 4x4 gas', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee overland', "year": 2018},
-    {"make": 'jeep', "model": 'cherokee sport fwd gas suv', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee trailhawk', "year": 2015},
-    {"make": 'jeep', "model": 'cherokee trailhawk 4wd', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee trailhawk 4wd v6', "year": 2017},
-    {"make": 'jeep', "model": 'cherokee trailhawk 4x4 gas', "year": 2020},
-    {"make": 'jeep', "model": 'cherokee trailhawk 4x4 gas', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee trailhawk sport', "year": 2016},
-    {"make": 'jeep', "model": 'cherokee trailhawk sport', "year": 2014},
-    {"make": 'jeep', "model": 'commander', "year": 2010},
-    {"make": 'jeep', "model": 'commander', "year": 2009},
-    {"make": 'jeep', "model": 'commander', "year": 2008},
-    {"make": 'jeep', "model": 'commander', "year": 2007},
-    {"make": 'jeep', "model": 'commander', "year": 2006},
-    {"make": 'jeep', "model": 'commander limited', "year": 2007},
-    {"make": 'jeep', "model": 'commander limited', "year": 2006},
-    {"make": 'jeep', "model": 'commander limited 4x4', "year": 2007},
-    {"make": 'jeep', "model": 'compass', "year": 2021},
-    {"make": 'jeep', "model": 'compass', "year": 2020},
-    {"make": 'jeep', "model": 'compass', "year": 2019},
-    {"make": 'jeep', "model": 'compass', "year": 2018},
-    {"make": 'jeep', "model": 'compass', "year": 2017},
-    {"make": 'jeep', "model": 'compass', "year": 2016},
-    {"make": 'jeep', "model": 'compass', "year": 2015},
-    {"make": 'jeep', "model": 'compass', "year": 2014},
-    {"make": 'jeep', "model": 'compass', "year": 2013},
-    {"make": 'jeep', "model": 'compass', "year": 2012},
-    {"make": 'jeep', "model": 'compass', "year": 2011},
-    {"make": 'jeep', "model": 'compass', "year": 2010},
-    {"make": 'jeep', "model": 'compass', "year": 2009},
-    {"make": 'jeep', "model": 'compass', "year": 2008},
-    {"make": 'jeep', "model": 'compass', "year": 2007},
-    {"make": 'jeep', "model": 'compass 4x4', "year": 2016},
-    {"make": 'jeep', "model": 'compass high altitude', "year": 2016},
-    {"make": 'jeep', "model": 'compass latitude', "year": 2019},
-    {"make": 'jeep', "model": 'compass latitude', "year": 2018},
-    {"make": 'jeep', "model": 'compass latitude', "year": 2016},
-    {"make": 'jeep', "model": 'compass latitude', "year": 2014},
-    {"make": 'jeep', "model": 'compass latitude', "year": 2013},
-    {"make": 'jeep', "model": 'compass latitude fwd gas', "year": 2017},
-    {"make": 'jeep', "model": 'compass latitude sport', "year": 2018},
-    {"make": 'jeep', "model": 'compass limited', "year": 2018},
-    {"make": 'jeep', "model": 'compass limited 4x4', "year": 2007},
-    {"make": 'jeep', "model": 'compass sport', "year": 2018},
-    {"make": 'jeep', "model": 'compass sport', "year": 2017},
-    {"make": 'jeep', "model": 'compass sport', "year": 2016},
-    {"make": 'jeep', "model": 'compass sport', "year": 2015},
-    {"make": 'jeep', "model": 'compass sport', "year": 2014},
-    {"make": 'jeep', "model": 'compass sport', "year": 2013},
-    {"make": 'jeep', "model": 'compass sport', "year": 2011},
-    {"make": 'jeep', "model": 'compass trailhawk', "year": 2019},
-    {"make": 'jeep', "model": 'gladiator', "year": 2021},
-    {"make": 'jeep', "model": 'gladiator', "year": 2020},
-    {"make": 'jeep', "model": 'gladiator mojave', "year": 2021},
-    {"make": 'jeep', "model": 'gladiator overland', "year": 2020},
-    {"make": 'jeep', "model": 'gladiator rubicon', "year": 2020},
-    {"make": 'jeep', "model": 'gladiator rubicon only 9k', "year": 2020},
-    {"make": 'jeep', "model": 'gladiator sport pickup 4d 5', "year": 2020},
-    {"make": 'jeep', "model": 'gladiator sport s', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2021},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2019},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2017},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2016},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2015},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2014},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2013},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2011},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2010},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2009},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2008},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2007},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2006},
-    {"make": 'jeep', "model": 'grand cherokee', "year": 2005},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2016},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2015},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2014},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2013},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2011},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2010},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2009},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2008},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2007},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2006},
-    {"make": 'jeep', "model": 'grand cherokee laredo', "year": 2005},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4wd', "year": 2013},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4wd', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4wd', "year": 2006},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2017},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2013},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2007},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2006},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4', "year": 2005},
-    {"make": 'jeep', "model": 'grand cherokee laredo 4x4 1owner well maint*new wheels*deliver 2u', "year": 2015},
-    {"make": 'jeep', "model": 'grand cherokee laredo awd', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee laredo sport', "year": 2019},
-    {"make": 'jeep', "model": 'grand cherokee laredo sport', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee laredo sport', "year": 2017},
-    {"make": 'jeep', "model": 'grand cherokee laredo sport', "year": 2015},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2019},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2017},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2016},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2015},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2014},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2011},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2010},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2007},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2006},
-    {"make": 'jeep', "model": 'grand cherokee limited', "year": 2005},
-    {"make": 'jeep', "model": 'grand cherokee limited 4wd', "year": 2013},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2019},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2017},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2015},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2014},
-    {"make": 'jeep', "model": 'grand cherokee limited 4x4', "year": 2005},
-    {"make": 'jeep', "model": 'grand cherokee limited x', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2019},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2017},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2014},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2013},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee overland', "year": 2011},
-    {"make": 'jeep', "model": 'grand cherokee overland 4wd', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee overland 4x4', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee overland 4x4', "year": 2012},
-    {"make": 'jeep', "model": 'grand cherokee overland 4x4', "year": 2011},
-    {"make": 'jeep', "model": 'grand cherokee srt', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee summit', "year": 2014},
-    {"make": 'jeep', "model": 'grand cherokee trailhawk', "year": 2020},
-    {"make": 'jeep', "model": 'grand cherokee trailhawk', "year": 2018},
-    {"make": 'jeep', "model": 'grand cherokee trailhawk', "year": 2017},
-    {"make": 'jeep', "model": 'liberty', "year": 2012},
-    {"make": 'jeep', "model": 'liberty', "year": 2011},
-    {"make": 'jeep', "model": 'liberty', "year": 2010},
-    {"make": 'jeep', "model": 'liberty', "year": 2009},
-    {"make": 'jeep', "model": 'liberty', "year": 2008},
-    {"make": 'jeep', "model": 'liberty', "year": 2007},
-    {"make": 'jeep', "model": 'liberty', "year": 2006},
-    {"make": 'jeep', "model": 'liberty', "year": 2005},
-    {"make": 'jeep', "model": 'liberty 4wd 4dr sport', "year": 2006},
-    {"make": 'jeep', "model": 'liberty 4x4', "year": 2007},
-    {"make": 'jeep', "model": 'liberty 4x4', "year": 2005},
-    {"make": 'jeep', "model": 'liberty crd', "year": 2005},
-    {"make": 'jeep', "model": 'liberty limited', "year": 2010},
-    {"make": 'jeep', "model": 'liberty limited', "year": 2008},
-    {"make": 'jeep', "model": 'liberty limited', "year": 2007},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2012},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2011},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2010},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2009},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2008},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2006},
-    {"make": 'jeep', "model": 'liberty sport', "year": 2005},
-    {"make": 'jeep', "model": 'liberty sport 4+4', "year": 2010},
-    {"make": 'jeep', "model": 'liberty sport 4wd', "year": 2008},
-    {"make": 'jeep', "model": 'liberty sport 4x4', "year": 2012},
-    {"make": 'jeep', "model": 'liberty sport 4x4', "year": 2010},
-    {"make": 'jeep', "model": 'liberty sport 4x4', "year": 2009},
-    {"make": 'jeep', "model": 'liberty sport 4x4', "year": 2008},
-    {"make": 'jeep', "model": 'liberty sport 4x4', "year": 2006},
-    {"make": 'jeep', "model": 'liberty sport 4x4', "year": 2005},
-    {"make": 'jeep', "model": 'liberty sport suv 4d', "year": 2012},
-    {"make": 'jeep', "model": 'lifted grand cherokee 4x4', "year": 2020},
-    {"make": 'jeep', "model": 'lifted wrangler sport 4x4', "year": 2014},
-    {"make": 'jeep', "model": 'lifted wrangler unlimited', "year": 2019},
-    {"make": 'jeep', "model": 'patriot', "year": 2017},
-    {"make": 'jeep', "model": 'patriot', "year": 2016},
-    {"make": 'jeep', "model": 'patriot', "year": 2015},
-    {"make": 'jeep', "model": 'patriot', "year": 2014},
-    {"make": 'jeep', "model": 'patriot', "year": 2013},
-    {"make": 'jeep', "model": 'patriot', "year": 2012},
-    {"make": 'jeep', "model": 'patriot', "year": 2011},
-    {"make": 'jeep', "model": 'patriot', "year": 2010},
-    {"make": 'jeep', "model": 'patriot', "year": 2009},
-    {"make": 'jeep', "model": 'patriot', "year": 2008},
-    {"make": 'jeep', "model": 'patriot', "year": 2007},
-    {"make": 'jeep', "model": 'patriot 4x4', "year": 2014},
-    {"make": 'jeep', "model": 'patriot 4x4', "year": 2010},
-    {"make": 'jeep', "model": 'patriot high altitude', "year": 2017},
-    {"make": 'jeep', "model": 'patriot high altitude 4x4', "year": 2016},
-    {"make": 'jeep', "model": 'patriot latitude', "year": 2017},
-    {"make": 'jeep', "model": 'patriot latitude', "year": 2014},
-    {"make": 'jeep', "model": 'patriot latitude', "year": 2012},
-    {"make": 'jeep', "model": 'patriot latitude 4x4', "year": 2015},
-    {"make": 'jeep', "model": 'patriot limited', "year": 2010},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2016},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2015},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2014},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2012},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2011},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2010},
-    {"make": 'jeep', "model": 'patriot sport', "year": 2008},
-    {"make": 'jeep', "model": 'patriot sport 4x4', "year": 2014},
-    {"make": 'jeep', "model": 'patriot sport se', "year": 2016},
-    {"make": 'jeep', "model": 'patriot sport suv 4d', "year": 2016},
-    {"make": 'jeep', "model": 'renegade', "year": 2020},
-    {"make": 'jeep', "model": 'renegade', "year": 2019},
-    {"make": 'jeep', "model": 'renegade', "year": 2018},
-    {"make": 'jeep', "model": 'renegade', "year": 2017},
-    {"make": 'jeep', "model": 'renegade', "year": 2016},
-    {"make": 'jeep', "model": 'renegade', "year": 2015},
-    {"make": 'jeep', "model": 'renegade altitude 4x4 gas', "year": 2017},
-    {"make": 'jeep', "model": 'renegade altitude sport', "year": 2019},
-    {"make": 'jeep', "model": 'renegade altitude sport', "year": 2017},
-    {"make": 'jeep', "model": 'renegade bad credit', "year": 2016},
-    {"make": 'jeep', "model": 'renegade deserthawk sport', "year": 2017},
-    {"make": 'jeep', "model": 'renegade latitude', "year": 2019},
-    {"make": 'jeep', "model": 'renegade latitude', "year": 2018},
-    {"make": 'jeep', "model": 'renegade latitude', "year": 2017},
-    {"make": 'jeep', "model": 'renegade latitude', "year": 2016},
-    {"make": 'jeep', "model": 'renegade latitude', "year": 2015},
-    {"make": 'jeep', "model": 'renegade latitude 4x4 gas', "year": 2016},
-    {"make": 'jeep', "model": 'renegade latitude sport', "year": 2017},
-    {"make": 'jeep', "model": 'renegade limited', "year": 2015},
-    {"make": 'jeep', "model": 'renegade limited 4x4', "year": 2016},
-    {"make": 'jeep', "model": 'renegade limited 4x4 gas', "year": 2018},
-    {"make": 'jeep', "model": 'renegade sport', "year": 2019},
-    {"make": 'jeep', "model": 'renegade sport', "year": 2018},
-    {"make": 'jeep', "model": 'renegade sport', "year": 2016},
-    {"make": 'jeep', "model": 'renegade sport', "year": 2015},
-    {"make": 'jeep', "model": 'renegade sport suv 4d', "year": 2020},
-    {"make": 'jeep', "model": 'renegade sport suv 4d', "year": 2019},
-    {"make": 'jeep', "model": 'renegade sport suv 4d', "year": 2018},
-    {"make": 'jeep', "model": 'renegade sport suv 4d', "year": 2017},
-    {"make": 'jeep', "model": 'renegade sport suv 4d', "year": 2016},
-    {"make": 'jeep', "model": 'renegade trailhawk', "year": 2017},
-    {"make": 'jeep', "model": 'renegade trailhawk', "year": 2016},
-    {"make": 'jeep', "model": 'renegade trailhawk', "year": 2015},
-    {"make": 'jeep', "model": 'renegade trailhawk 4x4 gas', "year": 2018},
-    {"make": 'jeep', "model": 'renegade upland edition', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler', "year": 2011},
-    {"make": 'jeep', "model": 'wrangler', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler', "year": 2009},
-    {"make": 'jeep', "model": 'wrangler', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler', "year": 2007},
-    {"make": 'jeep', "model": 'wrangler', "year": 2006},
-    {"make": 'jeep', "model": 'wrangler', "year": 2005},
-    {"make": 'jeep', "model": 'wrangler all new rubicon', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler all new sport suv', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler golden eagle (jk)', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler jk', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler jk unlimited', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler jk unlimited sport', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler moab', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler rubicon', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler rubicon', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler rubicon', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler rubicon', "year": 2009},
-    {"make": 'jeep', "model": 'wrangler rubicon', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler rubicon', "year": 2006},
-    {"make": 'jeep', "model": 'wrangler rubicon 392', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler rubicon sport', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler rubicon sport', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler sahara', "year": 2007},
-    {"make": 'jeep', "model": 'wrangler sahara (jk) sport', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler sahara sport', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2011},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler sport', "year": 2006},
-    {"make": 'jeep', "model": 'wrangler sport 4x4 gas suv', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler sport s utility 2d', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler sport s utility 2d', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler sport suv 2d', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler sport suv 2d', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler sport suv 2d', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler sport suv 2d', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler sport suv 2d', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler sport suv 2d', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimi', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler unlimi', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimi', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler unlimi', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler unlimi', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler unlimi', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2011},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2009},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2007},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2006},
-    {"make": 'jeep', "model": 'wrangler unlimited', "year": 2005},
-    {"make": 'jeep', "model": 'wrangler unlimited 75th 4x4', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited all new', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2021},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2011},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler unlimited rubicon local trade* terra fles sport lift*37" nitto trail grabblers*17" kmc xd beadlock wheels* x2o winch* steel bumpers*led lights* never off roaded', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2011},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2009},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara', "year": 2007},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara 4', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara 4dr hardtop', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimited sahara lifted', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2019},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2015},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2014},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2013},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2012},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2011},
-    {"make": 'jeep', "model": 'wrangler unlimited sport', "year": 2010},
-    {"make": 'jeep', "model": 'wrangler unlimited sport s', "year": 2020},
-    {"make": 'jeep', "model": 'wrangler unlimited sport s', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited sport s', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited willys', "year": 2018},
-    {"make": 'jeep', "model": 'wrangler unlimited willys', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited willys', "year": 2016},
-    {"make": 'jeep', "model": 'wrangler unlimited winter', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler unlimited x', "year": 2009},
-    {"make": 'jeep', "model": 'wrangler unlimited x', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler unlmited sahara', "year": 2017},
-    {"make": 'jeep', "model": 'wrangler x', "year": 2009},
-    {"make": 'jeep', "model": 'wrangler x', "year": 2008},
-    {"make": 'jeep', "model": 'wrangler x', "year": 2007},
-    {"make": 'jeep', "model": 'wrangler x', "year": 2006},
-    {"make": 'kia', "model": 'amanti', "year": 2008},
-    {"make": 'kia', "model": 'amanti', "year": 2005},
-    {"make": 'kia', "model": 'borrego', "year": 2009},
-    {"make": 'kia', "model": 'cadenza', "year": 2017},
-    {"make": 'kia', "model": 'cadenza', "year": 2015},
-    {"make": 'kia', "model": 'cadenza', "year": 2014},
-    {"make": 'kia', "model": 'cadenza premium', "year": 2017},
-    {"make": 'kia', "model": 'cadenza premium sedan 4d', "year": 2018},
-    {"make": 'kia', "model": 'forte', "year": 2021},
-    {"make": 'kia', "model": 'forte', "year": 2020},
-    {"make": 'kia', "model": 'forte', "year": 2019},
-    {"make": 'kia', "model": 'forte', "year": 2018},
-    {"make": 'kia', "model": 'forte', "year": 2017},
-    {"make": 'kia', "model": 'forte', "year": 2016},
-    {"make": 'kia', "model": 'forte', "year": 2015},
-    {"make": 'kia', "model": 'forte', "year": 2014},
-    {"make": 'kia', "model": 'forte', "year": 2013},
-    {"make": 'kia', "model": 'forte', "year": 2012},
-    {"make": 'kia', "model": 'forte', "year": 2011},
-    {"make": 'kia', "model": 'forte', "year": 2010},
-    {"make": 'kia', "model": 'forte 5-door', "year": 2016},
-    {"make": 'kia', "model": 'forte ex', "year": 2015},
-    {"make": 'kia', "model": 'forte ex', "year": 2014},
-    {"make": 'kia', "model": 'forte ex', "year": 2013},
-    {"make": 'kia', "model": 'forte ex', "year": 2012},
-    {"make": 'kia', "model": 'forte ex', "year": 2011},
-    {"make": 'kia', "model": 'forte ex', "year": 2010},
-    {"make": 'kia', "model": 'forte fe sedan 4d', "year": 2020},
-    {"make": 'kia', "model": 'forte fe sedan 4d', "year": 2019},
-    {"make": 'kia', "model": 'forte koup', "year": 2011},
-    {"make": 'kia', "model": 'forte koup', "year": 2010},
-    {"make": 'kia', "model": 'forte koup ex coupe 2d', "year": 2016},
-    {"make": 'kia', "model": 'forte koup sx coupe 2d', "year": 2016},
-    {"make": 'kia', "model": 'forte lx', "year": 2018},
-    {"make": 'kia', "model": 'forte lx', "year": 2017},
-    {"make": 'kia', "model": 'forte lx', "year": 2016},
-    {"make": 'kia', "model": 'forte lx', "year": 2015},
-    {"make": 'kia', "model": 'forte lx', "year": 2014},
-    {"make": 'kia', "model": 'forte lx sedan 4d', "year": 2018},
-    {"make": 'kia', "model": 'forte lx sedan 4d', "year": 2016},
-    {"make": 'kia', "model": 'forte lxs', "year": 2019},
-    {"make": 'kia', "model": 'forte lxs sedan 4d', "year": 2020},
-    {"make": 'kia', "model": 'forte s sedan 4d', "year": 2019},
-    {"make": 'kia', "model": 'forte s sedan 4d', "year": 2018},
-    {"make": 'kia', "model": 'forte sx', "year": 2011},
-    {"make": 'kia', "model": 'forte sx sedan 4d', "year": 2013},
-    {"make": 'kia', "model": 'forte sx sedan 4d', "year": 2010},
-    {"make": 'kia', "model": 'forte5 ex hatchback 4d', "year": 2016},
-    {"make": 'kia', "model": 'forte5 lx', "year": 2017},
-    {"make": 'kia', "model": 'forte5 lx hatchback 4d', "year": 2017},
-    {"make": 'kia', "model": 'forte5 lx hatchback 4d', "year": 2016},
-    {"make": 'kia', "model": 'k5', "year": 2021},
-    {"make": 'kia', "model": 'k900 luxury sedan 4d', "year": 2019},
-    {"make": 'kia', "model": 'k900 premium sedan 4d', "year": 2017},
-    {"make": 'kia', "model": 'niro', "year": 2021},
-    {"make": 'kia', "model": 'niro', "year": 2019},
-    {"make": 'kia', "model": 'niro', "year": 2018},
-    {"make": 'kia', "model": 'niro', "year": 2017},
-    {"make": 'kia', "model": 'niro ev ex wagon 4d', "year": 2019},
-    {"make": 'kia', "model": 'niro ex wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'niro fe', "year": 2017},
-    {"make": 'kia', "model": 'niro fe wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'niro lx wagon 4d', "year": 2019},
-    {"make": 'kia', "model": 'niro lx wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'niro lx wagon 4d', "year": 2017},
-    {"make": 'kia', "model": 'niro plug-in hybrid', "year": 2020},
-    {"make": 'kia', "model": 'niro s touring wagon 4d', "year": 2019},
-    {"make": 'kia', "model": 'optima', "year": 2020},
-    {"make": 'kia', "model": 'optima', "year": 2019},
-    {"make": 'kia', "model": 'optima', "year": 2018},
-    {"make": 'kia', "model": 'optima', "year": 2017},
-    {"make": 'kia', "model": 'optima', "year": 2016},
-    {"make": 'kia', "model": 'optima', "year": 2015},
-    {"make": 'kia', "model": 'optima', "year": 2014},
-    {"make": 'kia', "model": 'optima', "year": 2013},
-    {"make": 'kia', "model": 'optima', "year": 2012},
-    {"make": 'kia', "model": 'optima', "year": 2011},
-    {"make": 'kia', "model": 'optima', "year": 2010},
-    {"make": 'kia', "model": 'optima', "year": 2009},
-    {"make": 'kia', "model": 'optima', "year": 2008},
-    {"make": 'kia', "model": 'optima', "year": 2007},
-    {"make": 'kia', "model": 'optima', "year": 2006},
-    {"make": 'kia', "model": 'optima ex', "year": 2018},
-    {"make": 'kia', "model": 'optima ex', "year": 2016},
-    {"make": 'kia', "model": 'optima ex', "year": 2015},
-    {"make": 'kia', "model": 'optima ex', "year": 2014},
-    {"make": 'kia', "model": 'optima ex', "year": 2013},
-    {"make": 'kia', "model": 'optima ex', "year": 2012},
-    {"make": 'kia', "model": 'optima ex sedan 4d', "year": 2015},
-    {"make": 'kia', "model": 'optima ex w/ leather', "year": 2013},
-    {"make": 'kia', "model": 'optima gdi', "year": 2015},
-    {"make": 'kia', "model": 'optima hybrid', "year": 2018},
-    {"make": 'kia', "model": 'optima hybrid', "year": 2017},
-    {"make": 'kia', "model": 'optima hybrid', "year": 2015},
-    {"make": 'kia', "model": 'optima hybrid', "year": 2013},
-    {"make": 'kia', "model": 'optima hybrid sedan 4d', "year": 2015},
-    {"make": 'kia', "model": 'optima lx', "year": 2019},
-    {"make": 'kia', "model": 'optima lx', "year": 2018},
-    {"make": 'kia', "model": 'optima lx', "year": 2017},
-    {"make": 'kia', "model": 'optima lx', "year": 2016},
-    {"make": 'kia', "model": 'optima lx', "year": 2015},
-    {"make": 'kia', "model": 'optima lx', "year": 2014},
-    {"make": 'kia', "model": 'optima lx', "year": 2013},
-    {"make": 'kia', "model": 'optima lx', "year": 2012},
-    {"make": 'kia', "model": 'optima lx', "year": 2011},
-    {"make": 'kia', "model": 'optima lx', "year": 2010},
-    {"make": 'kia', "model": 'optima lx', "year": 2009},
-    {"make": 'kia', "model": 'optima lx', "year": 2008},
-    {"make": 'kia', "model": 'optima lx', "year": 2006},
-    {"make": 'kia', "model": 'optima lx sedan 4d', "year": 2018},
-    {"make": 'kia', "model": 'optima lx sedan 4d', "year": 2015},
-    {"make": 'kia', "model": 'optima plug-in hybrid ex', "year": 2018},
-    {"make": 'kia', "model": 'optima plug-in hybrid ex', "year": 2017},
-    {"make": 'kia', "model": 'optima s sedan 4d', "year": 2018},
-    {"make": 'kia', "model": 'optima sx', "year": 2012},
-    {"make": 'kia', "model": 'optima sx turbo', "year": 2013},
-    {"make": 'kia', "model": 'optima sx turbo', "year": 2012},
-    {"make": 'kia', "model": 'optima sx turbo w/navigation', "year": 2016},
-    {"make": 'kia', "model": 'optima sxl turbo', "year": 2015},
-    {"make": 'kia', "model": 'rio', "year": 2018},
-    {"make": 'kia', "model": 'rio', "year": 2017},
-    {"make": 'kia', "model": 'rio', "year": 2016},
-    {"make": 'kia', "model": 'rio', "year": 2015},
-    {"make": 'kia', "model": 'rio', "year": 2014},
-    {"make": 'kia', "model": 'rio', "year": 2013},
-    {"make": 'kia', "model": 'rio', "year": 2012},
-    {"make": 'kia', "model": 'rio', "year": 2009},
-    {"make": 'kia', "model": 'rio', "year": 2008},
-    {"make": 'kia', "model": 'rio', "year": 2007},
-    {"make": 'kia', "model": 'rio 5-door', "year": 2018},
-    {"make": 'kia', "model": 'rio ex', "year": 2013},
-    {"make": 'kia', "model": 'rio lx', "year": 2016},
-    {"make": 'kia', "model": 'rio lx', "year": 2014},
-    {"make": 'kia', "model": 'rio lx', "year": 2013},
-    {"make": 'kia', "model": 'rio lx', "year": 2010},
-    {"make": 'kia', "model": 'rio lx', "year": 2009},
-    {"make": 'kia', "model": 'rio s hatchback 5d', "year": 2020},
-    {"make": 'kia', "model": 'rio s sedan 4d', "year": 2020},
-    {"make": 'kia', "model": 'rio5', "year": 2012},
-    {"make": 'kia', "model": 'rondo', "year": 2009},
-    {"make": 'kia', "model": 'rondo', "year": 2008},
-    {"make": 'kia', "model": 'rondo', "year": 2007},
-    {"make": 'kia', "model": 'rondo lx', "year": 2009},
-    {"make": 'kia', "model": 'sedona', "year": 2018},
-    {"make": 'kia', "model": 'sedona', "year": 2017},
-    {"make": 'kia', "model": 'sedona', "year": 2016},
-    {"make": 'kia', "model": 'sedona', "year": 2015},
-    {"make": 'kia', "model": 'sedona', "year": 2012},
-    {"make": 'kia', "model": 'sedona', "year": 2010},
-    {"make": 'kia', "model": 'sedona', "year": 2009},
-    {"make": 'kia', "model": 'sedona', "year": 2008},
-    {"make": 'kia', "model": 'sedona', "year": 2007},
-    {"make": 'kia', "model": 'sedona', "year": 2006},
-    {"make": 'kia', "model": 'sedona', "year": 2005},
-    {"make": 'kia', "model": 'sedona ex', "year": 2015},
-    {"make": 'kia', "model": 'sedona lx', "year": 2011},
-    {"make": 'kia', "model": 'sedona lx', "year": 2010},
-    {"make": 'kia', "model": 'sedona lx', "year": 2005},
-    {"make": 'kia', "model": 'sedona sx minivan 4d', "year": 2017},
-    {"make": 'kia', "model": 'sedona sx minivan 4d', "year": 2015},
-    {"make": 'kia', "model": 'seltos', "year": 2021},
-    {"make": 'kia', "model": 'sorento', "year": 2020},
-    {"make": 'kia', "model": 'sorento', "year": 2019},
-    {"make": 'kia', "model": 'sorento', "year": 2018},
-    {"make": 'kia', "model": 'sorento', "year": 2017},
-    {"make": 'kia', "model": 'sorento', "year": 2016},
-    {"make": 'kia', "model": 'sorento', "year": 2015},
-    {"make": 'kia', "model": 'sorento', "year": 2014},
-    {"make": 'kia', "model": 'sorento', "year": 2013},
-    {"make": 'kia', "model": 'sorento', "year": 2012},
-    {"make": 'kia', "model": 'sorento', "year": 2011},
-    {"make": 'kia', "model": 'sorento', "year": 2009},
-    {"make": 'kia', "model": 'sorento', "year": 2008},
-    {"make": 'kia', "model": 'sorento', "year": 2007},
-    {"make": 'kia', "model": 'sorento', "year": 2006},
-    {"make": 'kia', "model": 'sorento', "year": 2005},
-    {"make": 'kia', "model": 'sorento ex', "year": 2016},
-    {"make": 'kia', "model": 'sorento ex', "year": 2011},
-    {"make": 'kia', "model": 'sorento ex sport utility 4d', "year": 2019},
-    {"make": 'kia', "model": 'sorento ex sport utility 4d', "year": 2018},
-    {"make": 'kia', "model": 'sorento limited-sxl sport', "year": 2017},
-    {"make": 'kia', "model": 'sorento lx', "year": 2020},
-    {"make": 'kia', "model": 'sorento lx', "year": 2019},
-    {"make": 'kia', "model": 'sorento lx', "year": 2017},
-    {"make": 'kia', "model": 'sorento lx', "year": 2016},
-    {"make": 'kia', "model": 'sorento lx', "year": 2015},
-    {"make": 'kia', "model": 'sorento lx', "year": 2014},
-    {"make": 'kia', "model": 'sorento lx', "year": 2013},
-    {"make": 'kia', "model": 'sorento lx', "year": 2012},
-    {"make": 'kia', "model": 'sorento lx', "year": 2011},
-    {"make": 'kia', "model": 'sorento lx', "year": 2008},
-    {"make": 'kia', "model": 'sorento lx - awd - rear camera - bluetooth -', "year": 2014},
-    {"make": 'kia', "model": 'sorento lx sport utility 4d', "year": 2019},
-    {"make": 'kia', "model": 'sorento lx sport utility 4d', "year": 2018},
-    {"make": 'kia', "model": 'sorento lx sport utility 4d', "year": 2017},
-    {"make": 'kia', "model": 'sorento lx sport utility 4d', "year": 2014},
-    {"make": 'kia', "model": 'sorento lx sport utility 4d', "year": 2012},
-    {"make": 'kia', "model": 'sorento lx w/ 3rd row seating', "year": 2018},
-    {"make": 'kia', "model": 'sorento lx-v6', "year": 2011},
-    {"make": 'kia', "model": 'sorento sx', "year": 2013},
-    {"make": 'kia', "model": 'sorento sx', "year": 2011},
-    {"make": 'kia', "model": 'sorento sx sport utility 4d', "year": 2018},
-    {"make": 'kia', "model": 'sorento sx sport utility 4d', "year": 2017},
-    {"make": 'kia', "model": 'soul', "year": 2020},
-    {"make": 'kia', "model": 'soul', "year": 2019},
-    {"make": 'kia', "model": 'soul', "year": 2018},
-    {"make": 'kia', "model": 'soul', "year": 2017},
-    {"make": 'kia', "model": 'soul', "year": 2016},
-    {"make": 'kia', "model": 'soul', "year": 2015},
-    {"make": 'kia', "model": 'soul', "year": 2014},
-    {"make": 'kia', "model": 'soul', "year": 2013},
-    {"make": 'kia', "model": 'soul', "year": 2012},
-    {"make": 'kia', "model": 'soul', "year": 2011},
-    {"make": 'kia', "model": 'soul', "year": 2010},
-    {"make": 'kia', "model": 'soul ! wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'soul ! wagon 4d', "year": 2017},
-    {"make": 'kia', "model": 'soul ! wagon 4d', "year": 2016},
-    {"make": 'kia', "model": 'soul ! wagon 4d', "year": 2015},
-    {"make": 'kia', "model": 'soul ! wagon 4d', "year": 2013},
-    {"make": 'kia', "model": 'soul ! wagon 4d', "year": 2010},
-    {"make": 'kia', "model": 'soul +', "year": 2018},
-    {"make": 'kia', "model": 'soul +', "year": 2017},
-    {"make": 'kia', "model": 'soul +', "year": 2016},
-    {"make": 'kia', "model": 'soul +', "year": 2015},
-    {"make": 'kia', "model": 'soul +', "year": 2014},
-    {"make": 'kia', "model": 'soul +', "year": 2013},
-    {"make": 'kia', "model": 'soul +', "year": 2012},
-    {"make": 'kia', "model": 'soul +', "year": 2011},
-    {"make": 'kia', "model": 'soul +', "year": 2010},
-    {"make": 'kia', "model": 'soul + wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'soul + wagon 4d', "year": 2017},
-    {"make": 'kia', "model": 'soul + wagon 4d', "year": 2016},
-    {"make": 'kia', "model": 'soul + wagon 4d', "year": 2011},
-    {"make": 'kia', "model": 'soul base', "year": 2017},
-    {"make": 'kia', "model": 'soul base', "year": 2016},
-    {"make": 'kia', "model": 'soul ev', "year": 2017},
-    {"make": 'kia', "model": 'soul ev', "year": 2016},
-    {"make": 'kia', "model": 'soul ev + wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'soul ev plus', "year": 2017},
-    {"make": 'kia', "model": 'soul lx wagon 4d', "year": 2020},
-    {"make": 'kia', "model": 'soul plus', "year": 2015},
-    {"make": 'kia', "model": 'soul plus', "year": 2014},
-    {"make": 'kia', "model": 'soul s wagon 4d', "year": 2021},
-    {"make": 'kia', "model": 'soul s wagon 4d', "year": 2020},
-    {"make": 'kia', "model": 'soul wagon 4d', "year": 2019},
-    {"make": 'kia', "model": 'soul wagon 4d', "year": 2018},
-    {"make": 'kia', "model": 'soul wagon 4d', "year": 2016},
-    {"make": 'kia', "model": 'soul x-line wagon 4d', "year": 2020},
-    {"make": 'kia', "model": 'spectra', "year": 2009},
-    {"make": 'kia', "model": 'spectra', "year": 2008},
-    {"make": 'kia', "model": 'spectra', "year": 2007},
-    {"make": 'kia', "model": 'spectra', "year": 2006},
-    {"make": 'kia', "model": 'spectra', "year": 2005},
-    {"make": 'kia', "model": 'spectra ex', "year": 2009},
-    {"make": 'kia', "model": 'spectra ex', "year": 2008},
-    {"make": 'kia', "model": 'spectra ex', "year": 2007},
-    {"make": 'kia', "model": 'sportage', "year": 2020},
-    {"make": 'kia', "model": 'sportage', "year": 2019},
-    {"make": 'kia', "model": 'sportage', "year": 2018},
-    {"make": 'kia', "model": 'sportage', "year": 2017},
-    {"make": 'kia', "model": 'sportage', "year": 2016},
-    {"make": 'kia', "model": 'sportage', "year": 2015},
-    {"make": 'kia', "model": 'sportage', "year": 2014},
-    {"make": 'kia', "model": 'sportage', "year": 2013},
-    {"make": 'kia', "model": 'sportage', "year": 2012},
-    {"make": 'kia', "model": 'sportage', "year": 2011},
-    {"make": 'kia', "model": 'sportage', "year": 2009},
-    {"make": 'kia', "model": 'sportage', "year": 2008},
-    {"make": 'kia', "model": 'sportage', "year": 2007},
-    {"make": 'kia', "model": 'sportage', "year": 2006},
-    {"make": 'kia', "model": 'sportage', "year": 2005},
-    {"make": 'kia', "model": 'sportage ex awd gas suv', "year": 2018},
-    {"make": 'kia', "model": 'sportage ex sport utility 4d', "year": 2018},
-    {"make": 'kia', "model": 'sportage lx', "year": 2020},
-    {"make": 'kia', "model": 'sportage lx', "year": 2017},
-    {"make": 'kia', "model": 'sportage lx', "year": 2016},
-    {"make": 'kia', "model": 'sportage lx', "year": 2015},
-    {"make": 'kia', "model": 'sportage lx', "year": 2012},
-    {"make": 'kia', "model": 'sportage lx', "year": 2011},
-    {"make": 'kia', "model": 'sportage lx', "year": 2009},
-    {"make": 'kia', "model": 'sportage lx', "year": 2007},
-    {"make": 'kia', "model": 'sportage lx awd', "year": 2016},
-    {"make": 'kia', "model": 'sportage lx awd, w/ lane warning', "year": 2020},
-    {"make": 'kia', "model": 'sportage lx fwd', "year": 2017},
-    {"make": 'kia', "model": 'sportage lx sport utility 4d', "year": 2020},
-    {"make": 'kia', "model": 'sportage lx sport utility 4d', "year": 2019},
-    {"make": 'kia', "model": 'sportage lx sport utility 4d', "year": 2018},
-    {"make": 'kia', "model": 'sportage sx', "year": 2012},
-    {"make": 'kia', "model": 'sportage sx sport utility 4d', "year": 2018},
-    {"make": 'kia', "model": 'stinger', "year": 2020},
-    {"make": 'kia', "model": 'stinger', "year": 2018},
-    {"make": 'kia', "model": 'stinger gt sedan 4d', "year": 2020},
-    {"make": 'kia', "model": 'stinger gt-line sedan 4d', "year": 2020},
-    {"make": 'kia', "model": 'stinger premium', "year": 2018},
-    {"make": 'kia', "model": 'stinger premium sedan 4d', "year": 2018},
-    {"make": 'kia', "model": 'telluride', "year": 2021},
-    {"make": 'kia', "model": 'telluride', "year": 2020},
-    {"make": 'kia', "model": 'telluride ex sport utility', "year": 2020},
-    {"make": 'kia', "model": 'telluride lx sport utility', "year": 2020},
-    {"make": 'kia', "model": 'telluride s sport utility 4d', "year": 2020},
-    {"make": 'lexus', "model": 'ct', "year": 2014},
-    {"make": 'lexus', "model": 'ct', "year": 2013},
-    {"make": 'lexus', "model": 'ct', "year": 2012},
-    {"make": 'lexus', "model": 'ct 200h', "year": 2016},
-    {"make": 'lexus', "model": 'ct 200h', "year": 2014},
-    {"make": 'lexus', "model": 'ct 200h', "year": 2012},
-    {"make": 'lexus', "model": 'ct 200h', "year": 2011},
-    {"make": 'lexus', "model": 'ct 200h hatchback 4d', "year": 2015},
-    {"make": 'lexus', "model": 'ct 200h hatchback 4d', "year": 2014},
-    {"make": 'lexus', "model": 'ct 200h hatchback 4d', "year": 2013},
-    {"make": 'lexus', "model": 'ct 200h hatchback 4d', "year": 2012},
-    {"make": 'lexus', "model": 'ct 200h hybrid', "year": 2012},
-    {"make": 'lexus', "model": 'ct 200h premium', "year": 2012},
-    {"make": 'lexus', "model": 'ct 200h premium hatchback', "year": 2012},
-    {"make": 'lexus', "model": 'ct200h', "year": 2014},
-    {"make": 'lexus', "model": 'dealer* luxury pkg* rear dvd* preffered pkg*mark levinson*2-keys*like new', "year": 2015},
-    {"make": 'lexus', "model": 'es', "year": 2019},
-    {"make": 'lexus', "model": 'es', "year": 2018},
-    {"make": 'lexus', "model": 'es', "year": 2017},
-    {"make": 'lexus', "model": 'es', "year": 2014},
-    {"make": 'lexus', "model": 'es', "year": 2013},
-    {"make": 'lexus', "model": 'es', "year": 2012},
-    {"make": 'lexus', "model": 'es', "year": 2010},
-    {"make": 'lexus', "model": 'es', "year": 2009},
-    {"make": 'lexus', "model": 'es', "year": 2008},
-    {"make": 'lexus', "model": 'es', "year": 2007},
-    {"make": 'lexus', "model": 'es 300h', "year": 2016},
-    {"make": 'lexus', "model": 'es 300h', "year": 2015},
-    {"make": 'lexus', "model": 'es 300h', "year": 2013},
-    {"make": 'lexus', "model": 'es 330', "year": 2006},
-    {"make": 'lexus', "model": 'es 330', "year": 2005},
-    {"make": 'lexus', "model": 'es 350', "year": 2018},
-    {"make": 'lexus', "model": 'es 350', "year": 2017},
-    {"make": 'lexus', "model": 'es 350', "year": 2016},
-    {"make": 'lexus', "model": 'es 350', "year": 2015},
-    {"make": 'lexus', "model": 'es 350', "year": 2014},
-    {"make": 'lexus', "model": 'es 350', "year": 2013},
-    {"make": 'lexus', "model": 'es 350', "year": 2012},
-    {"make": 'lexus', "model": 'es 350', "year": 2011},
-    {"make": 'lexus', "model": 'es 350', "year": 2010},
-    {"make": 'lexus', "model": 'es 350', "year": 2009},
-    {"make": 'lexus', "model": 'es 350', "year": 2008},
-    {"make": 'lexus', "model": 'es 350', "year": 2007},
-    {"make": 'lexus', "model": 'es 350 f sport sedan 4d', "year": 2019},
-    {"make": 'lexus', "model": 'es 350 luxury sedan 4d', "year": 2019},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2018},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2017},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2016},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2015},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2014},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2013},
-    {"make": 'lexus', "model": 'es 350 sedan 4d', "year": 2012},
-    {"make": 'lexus', "model": 'es330', "year": 2006},
-    {"make": 'lexus', "model": 'es350', "year": 2017},
-    {"make": 'lexus', "model": 'es350', "year": 2013},
-    {"make": 'lexus', "model": 'es350', "year": 2011},
-    {"make": 'lexus', "model": 'es350', "year": 2010},
-    {"make": 'lexus', "model": 'es350', "year": 2009},
-    {"make": 'lexus', "model": 'es350', "year": 2008},
-    {"make": 'lexus', "model": 'es350', "year": 2007},
-    {"make": 'lexus', "model": 'gs', "year": 2016},
-    {"make": 'lexus', "model": 'gs', "year": 2015},
-    {"make": 'lexus', "model": 'gs', "year": 2014},
-    {"make": 'lexus', "model": 'gs', "year": 2013},
-    {"make": 'lexus', "model": 'gs', "year": 2011},
-    {"make": 'lexus', "model": 'gs', "year": 2006},
-    {"make": 'lexus', "model": 'gs 200t sedan 4d', "year": 2017},
-    {"make": 'lexus', "model": 'gs 300', "year": 2006},
-    {"make": 'lexus', "model": 'gs 350', "year": 2015},
-    {"make": 'lexus', "model": 'gs 350', "year": 2014},
-    {"make": 'lexus', "model": 'gs 350', "year": 2013},
-    {"make": 'lexus', "model": 'gs 350', "year": 2010},
-    {"make": 'lexus', "model": 'gs 350', "year": 2008},
-    {"make": 'lexus', "model": 'gs 350', "year": 2007},
-    {"make": 'lexus', "model": 'gs 350 awd', "year": 2014},
-    {"make": 'lexus', "model": 'gs 350 awd', "year": 2013},
-    {"make": 'lexus', "model": 'gs 350 f sport', "year": 2017},
-    {"make": 'lexus', "model": 'gs 350 rwd', "year": 2013},
-    {"make": 'lexus', "model": 'gs 350 sedan 4d', "year": 2018},
-    {"make": 'lexus', "model": 'gs 350 sedan 4d', "year": 2017},
-    {"make": 'lexus', "model": 'gs 350 sedan 4d', "year": 2016},
-    {"make": 'lexus', "model": 'gs 350 sedan 4d', "year": 2015},
-    {"make": 'lexus', "model": 'gs 350 sedan 4d', "year": 2014},
-    {"make": 'lexus', "model": 'gs 350 sedan 4d', "year": 2013},
-    {"make": 'lexus', "model": 'gs 450h', "year": 2007},
-    {"make": 'lexus', "model": 'gs300', "year": 2006},
-    {"make": 'lexus', "model": 'gs350', "year": 2007},
-    {"make": 'lexus', "model": 'gx', "year": 2018},
-    {"make": 'lexus', "model": 'gx', "year": 2017},
-    {"make": 'lexus', "model": 'gx', "year": 2013},
-    {"make": 'lexus', "model": 'gx', "year": 2012},
-    {"make": 'lexus', "model": 'gx 460', "year": 2017},
-    {"make": 'lexus', "model": 'gx 460', "year": 2016},
-    {"make": 'lexus', "model": 'gx 460', "year": 2014},
-    {"make": 'lexus', "model": 'gx 460', "year": 2013},
-    {"make": 'lexus', "model": 'gx 460', "year": 2012},
-    {"make": 'lexus', "model": 'gx 460', "year": 2010},
-    {"make": 'lexus', "model": 'gx 460 luxury', "year": 2015},
-    {"make": 'lexus', "model": 'gx 460 luxury sport', "year": 2015},
-    {"make": 'lexus', "model": 'gx 460 sport utility 4d', "year": 2018},
-    {"make": 'lexus', "model": 'gx 460 sport utility 4d', "year": 2016},
-    {"make": 'lexus', "model": 'gx 460 sport utility 4d', "year": 2015},
-    {"make": 'lexus', "model": 'gx 460 sport utility 4d', "year": 2014},
-    {"make": 'lexus', "model": 'gx 470', "year": 2008},
-    {"make": 'lexus', "model": 'gx 470', "year": 2007},
-    {"make": 'lexus', "model": 'gx 470', "year": 2006},
-    {"make": 'lexus', "model": 'gx 470', "year": 2005},
-    {"make": 'lexus', "model": 'gx 470 4dr suv', "year": 2006},
-    {"make": 'lexus', "model": 'gx 470 4dr suv 2-owner arizona gx*rust&accident free*new timing belt&water pump*new bilstein lift*new wheels&tires* immaculate shape*all books and keys*all records since new', "year": 2006},
-    {"make": 'lexus', "model": 'gx 470 4wd', "year": 2008},
-    {"make": 'lexus', "model": 'gx460', "year": 2014},
-    {"make": 'lexus', "model": 'gx470', "year": 2007},
-    {"make": 'lexus', "model": 'gx470', "year": 2006},
-    {"make": 'lexus', "model": 'gx470', "year": 2005},
-    {"make": 'lexus', "model": 'hs', "year": 2011},
-    {"make": 'lexus', "model": 'hs', "year": 2010},
-    {"make": 'lexus', "model": 'hs 250 premium', "year": 2010},
-    {"make": 'lexus', "model": 'hs 250h', "year": 2010},
-    {"make": 'lexus', "model": 'is', "year": 2018},
-    {"make": 'lexus', "model": 'is', "year": 2017},
-    {"make": 'lexus', "model": 'is', "year": 2016},
-    {"make": 'lexus', "model": 'is', "year": 2015},
-    {"make": 'lexus', "model": 'is', "year": 2014},
-    {"make": 'lexus', "model": 'is', "year": 2012},
-    {"make": 'lexus', "model": 'is', "year": 2011},
-    {"make": 'lexus', "model": 'is', "year": 2010},
-    {"make": 'lexus', "model": 'is', "year": 2008},
-    {"make": 'lexus', "model": 'is', "year": 2007},
-    {"make": 'lexus', "model": 'is 200 turbo', "year": 2017},
-    {"make": 'lexus', "model": 'is 200t', "year": 2017},
-    {"make": 'lexus', "model": 'is 200t', "year": 2016},
-    {"make": 'lexus', "model": 'is 200t sedan 4d', "year": 2017},
-    {"make": 'lexus', "model": 'is 250', "year": 2015},
-    {"make": 'lexus', "model": 'is 250', "year": 2014},
-    {"make": 'lexus', "model": 'is 250', "year": 2013},
-    {"make": 'lexus', "model": 'is 250', "year": 2012},
-    {"make": 'lexus', "model": 'is 250', "year": 2011},
-    {"make": 'lexus', "model": 'is 250', "year": 2010},
-    {"make": 'lexus', "model": 'is 250', "year": 2009},
-    {"make": 'lexus', "model": 'is 250', "year": 2008},
-    {"make": 'lexus', "model": 'is 250', "year": 2007},
-    {"make": 'lexus', "model": 'is 250', "year": 2006},
-    {"make": 'lexus', "model": 'is 250 crafted line sedan', "year": 2015},
-    {"make": 'lexus', "model": 'is 250 sedan 4d', "year": 2015},
-    {"make": 'lexus', "model": 'is 250 sedan 4d', "year": 2014},
-    {"make": 'lexus', "model": 'is 250 sedan 4d', "year": 2013},
-    {"make": 'lexus', "model": 'is 250 sedan 4d', "year": 2012},
-    {"make": 'lexus', "model": 'is 300', "year": 2019},
-    {"make": 'lexus', "model": 'is 300', "year": 2018},
-    {"make": 'lexus', "model": 'is 300', "year": 2017},
-    {"make": 'lexus', "model": 'is 300', "year": 2016},
-    {"make": 'lexus', "model": 'is 300 sedan 4d', "year": 2020},
-    {"make": 'lexus', "model": 'is 300 sedan 4d', "year": 2019},
-    {"make": 'lexus', "model": 'is 350', "year": 2014},
-    {"make": 'lexus', "model": 'is 350', "year": 2012},
-    {"make": 'lexus', "model": 'is 350', "year": 2008},
-    {"make": 'lexus', "model": 'is 350', "year": 2007},
-    {"make": 'lexus', "model": 'is 350', "year": 2006},
-    {"make": 'lexus', "model": 'is 350 f sport sedan 4d', "year": 2020},
-    {"make": 'lexus', "model": 'is 350 sedan 4d', "year": 2019},
-    {"make": 'lexus', "model": 'is 350 sedan 4d', "year": 2018},
-    {"make": 'lexus', "model": 'is 350 sedan 4d', "year": 2016},
-    {"make": 'lexus', "model": 'is 350 sedan 4d', "year": 2014},
-    {"make": 'lexus', "model": 'is 350 sport convertible', "year": 2010},
-    {"make": 'lexus', "model": 'is200t', "year": 2016},
-    {"make": 'lexus', "model": 'is250', "year": 2014},
-    {"make": 'lexus', "model": 'is250', "year": 2012},
-    {"make": 'lexus', "model": 'is250', "year": 2011},
-    {"make": 'lexus', "model": 'is250', "year": 2009},
-    {"make": 'lexus', "model": 'is250', "year": 2008},
-    {"make": 'lexus', "model": 'is250', "year": 2007},
-    {"make": 'lexus', "model": 'lc 500', "year": 2018},
-    {"make": 'lexus', "model": 'ls', "year": 2010},
-    {"make": 'lexus', "model": 'ls', "year": 2009},
-    {"make": 'lexus', "model": 'ls', "year": 2008},
-    {"make": 'lexus', "model": 'ls', "year": 2007},
-    {"make": 'lexus', "model": 'ls', "year": 2005},
-    {"make": 'lexus', "model": 'ls 430', "year": 2006},
-    {"make": 'lexus', "model": 'ls 430', "year": 2005},
-    {"make": 'lexus', "model": 'ls 460', "year": 2013},
-    {"make": 'lexus', "model": 'ls 460', "year": 2012},
-    {"make": 'lexus', "model": 'ls 460', "year": 2011},
-    {"make": 'lexus', "model": 'ls 460', "year": 2010},
-    {"make": 'lexus', "model": 'ls 460', "year": 2009},
-    {"make": 'lexus', "model": 'ls 460', "year": 2008},
-    {"make": 'lexus', "model": 'ls 460', "year": 2007},
-    {"make": 'lexus', "model": 'ls 460 crafted line sedan', "year": 2015},
-    {"make": 'lexus', "model": 'ls 460 f sport', "year": 2013},
-    {"make": 'lexus', "model": 'ls 460 l sedan 4d', "year": 2013},
-    {"make": 'lexus', "model": 'ls 460 lwb', "year": 2007},
-    {"make": 'lexus', "model": 'ls 460 rwd', "year": 2010},
-    {"make": 'lexus', "model": 'ls 460 sedan 4d', "year": 2016},
-    {"make": 'lexus', "model": 'ls 460 sedan 4d', "year": 2014},
-    {"make": 'lexus', "model": 'ls 460 sedan 4d', "year": 2013},
-    {"make": 'lexus', "model": 'ls 460 sedan 4d', "year": 2012},
-    {"make": 'lexus', "model": 'ls 460l', "year": 2007},
-    {"make": 'lexus', "model": 'ls 600h l', "year": 2011},
-    {"make": 'lexus', "model": 'ls430', "year": 2005},
-    {"make": 'lexus', "model": 'ls430 4.3l v8', "year": 2005},
-    {"make": 'lexus', "model": 'ls460', "year": 2007},
-    {"make": 'lexus', "model": 'lx 470', "year": 2005},
-    {"make": 'lexus', "model": 'lx 570', "year": 2014},
-    {"make": 'lexus', "model": 'lx 570', "year": 2011},
-    {"make": 'lexus', "model": 'lx 570', "year": 2009},
-    {"make": 'lexus', "model": 'nx', "year": 2019},
-    {"make": 'lexus', "model": 'nx', "year": 2018},
-    {"make": 'lexus', "model": 'nx', "year": 2017},
-    {"make": 'lexus', "model": 'nx', "year": 2016},
-    {"make": 'lexus', "model": 'nx 200t', "year": 2017},
-    {"make": 'lexus', "model": 'nx 200t', "year": 2016},
-    {"make": 'lexus', "model": 'nx 200t', "year": 2015},
-    {"make": 'lexus', "model": 'nx 200t f sport suv 4d', "year": 2015},
-    {"make": 'lexus', "model": 'nx 200t sport utility 4d', "year": 2017},
-    {"make": 'lexus', "model": 'nx 200t sport utility 4d', "year": 2016},
-    {"make": 'lexus', "model": 'nx 200t sport utility 4d', "year": 2015},
-    {"make": 'lexus', "model": 'nx 300', "year": 2019},
-    {"make": 'lexus', "model": 'nx 300', "year": 2018},
-    {"make": 'lexus', "model": 'nx 300 f sport suv 4d', "year": 2020},
-    {"make": 'lexus', "model": 'nx 300 luxury sport', "year": 2020},
-    {"make": 'lexus', "model": 'nx 300 sport utility 4d', "year": 2020},
-    {"make": 'lexus', "model": 'nx 300 sport utility 4d', "year": 2019},
-    {"make": 'lexus', "model": 'nx 300 sport utility 4d', "year": 2018},
-    {"make": 'lexus', "model": 'nx 300h sport utility 4d', "year": 2019},
-    {"make": 'lexus', "model": 'nx 300h sport utility 4d', "year": 2018},
-    {"make": 'lexus', "model": 'nx 300h sport utility 4d', "year": 2015},
-    {"make": 'lexus', "model": 'rc', "year": 2017},
-    {"make": 'lexus', "model": 'rc', "year": 2015},
-    {"make": 'lexus', "model": 'rc 200t', "year": 2017},
-    {"make": 'lexus', "model": 'rc 350', "year": 2016},
-    {"make": 'lexus', "model": 'rc 350', "year": 2015},
-    {"make": 'lexus', "model": 'rc 350 coupe 2d', "year": 2019},
-    {"make": 'lexus', "model": 'rc 350 coupe 2d', "year": 2017},
-    {"make": 'lexus', "model": 'rc 350 coupe 2d', "year": 2015},
-    {"make": 'lexus', "model": 'rc 350 f sport', "year": 2015},
-    {"make": 'lexus', "model": 'rx', "year": 2019},
-    {"make": 'lexus', "model": 'rx', "year": 2018},
-    {"make": 'lexus', "model": 'rx', "year": 2017},
-    {"make": 'lexus', "model": 'rx', "year": 2015},
-    {"make": 'lexus', "model": 'rx', "year": 2014},
-    {"make": 'lexus', "model": 'rx', "year": 2013},
-    {"make": 'lexus', "model": 'rx', "year": 2012},
-    {"make": 'lexus', "model": 'rx', "year": 2011},
-    {"make": 'lexus', "model": 'rx', "year": 2010},
-    {"make": 'lexus', "model": 'rx', "year": 2008},
-    {"make": 'lexus', "model": 'rx', "year": 2007},
-    {"make": 'lexus', "model": 'rx 330', "year": 2006},
-    {"make": 'lexus', "model": 'rx 330', "year": 2005},
-    {"make": 'lexus', "model": 'rx 330 4x4 with premium', "year": 2005},
-    {"make": 'lexus', "model": 'rx 330 awd', "year": 2005},
-    {"make": 'lexus', "model": 'rx 350', "year": 2020},
-    {"make": 'lexus', "model": 'rx 350', "year": 2018},
-    {"make": 'lexus', "model": 'rx 350', "year": 2017},
-    {"make": 'lexus', "model": 'rx 350', "year": 2016},
-    {"make": 'lexus', "model": 'rx 350', "year": 2015},
-    {"make": 'lexus', "model": 'rx 350', "year": 2014},
-    {"make": 'lexus', "model": 'rx 350', "year": 2013},
-    {"make": 'lexus', "model": 'rx 350', "year": 2012},
-    {"make": 'lexus', "model": 'rx 350', "year": 2011},
-    {"make": 'lexus', "model": 'rx 350', "year": 2010},
-    {"make": 'lexus', "model": 'rx 350', "year": 2009},
-    {"make": 'lexus', "model": 'rx 350', "year": 2008},
-    {"make": 'lexus', "model": 'rx 350', "year": 2007},
-    {"make": 'lexus', "model": 'rx 350 4x4 with navigation', "year": 2013},
-    {"make": 'lexus', "model": 'rx 350 4x4 with navigation', "year": 2008},
-    {"make": 'lexus', "model": 'rx 350 awd', "year": 2011},
-    {"make": 'lexus', "model": 'rx 350 awd', "year": 2010},
-    {"make": 'lexus', "model": 'rx 350 f sport suv 4d', "year": 2020},
-    {"make": 'lexus', "model": 'rx 350 f sport suv 4d', "year": 2016},
-    {"make": 'lexus', "model": 'rx 350 f sport suv 4d', "year": 2015},
-    {"make": 'lexus', "model": 'rx 350 low miles nice', "year": 2020},
-    {"make": 'lexus', "model": 'rx 350 sport utility 4d', "year": 2019},
-    {"make": 'lexus', "model": 'rx 350 sport utility 4d', "year": 2018},
-    {"make": 'lexus', "model": 'rx 350 sport utility 4d', "year": 2017},
-    {"make": 'lexus', "model": 'rx 350 sport utility 4d', "year": 2016},
-    {"make": 'lexus', "model": 'rx 350 sport utility 4d', "year": 2013},
-    {"make": 'lexus', "model": 'rx 350 sport utility 4d', "year": 2010},
-    {"make": 'lexus', "model": 'rx 350l sport utility 4d', "year": 2020},
-    {"make": 'lexus', "model": 'rx 350l sport utility 4d', "year": 2018},
-    {"make": 'lexus', "model": 'rx 400h', "year": 2008},
-    {"make": 'lexus', "model": 'rx 400h', "year": 2006},
-    {"make": 'lexus', "model": 'rx 400h basesuv', "year": 2008},
-    {"make": 'lexus', "model": 'rx 450h', "year": 2019},
-    {"make": 'lexus', "model": 'rx 450h', "year": 2013},
-    {"make": 'lexus', "model": 'rx 450h', "year": 2011},
-    {"make": 'lexus', "model": 'rx 450h', "year": 2010},
-    {"make": 'lexus', "model": 'rx 450h sport utility 4d', "year": 2017},
-    {"make": 'lexus', "model": 'rx330', "year": 2006},
-    {"make": 'lexus', "model": 'rx330', "year": 2005},
-    {"make": 'lexus', "model": 'rx350', "year": 2017},
-    {"make": 'lexus', "model": 'rx350', "year": 2015},
-    {"make": 'lexus', "model": 'rx350', "year": 2013},
-    {"make": 'lexus', "model": 'rx350', "year": 2012},
-    {"make": 'lexus', "model": 'rx350', "year": 2011},
-    {"make": 'lexus', "model": 'rx350', "year": 2010},
-    {"make": 'lexus', "model": 'rx350', "year": 2009},
-    {"make": 'lexus', "model": 'rx350', "year": 2008},
-    {"make": 'lexus', "model": 'rx350', "year": 2007},
-    {"make": 'lexus', "model": 'rx350 awd', "year": 2012},
-    {"make": 'lexus', "model": 'rx350 awd gas suv auto', "year": 2019},
-    {"make": 'lexus', "model": 'rx350 awd gas suv auto', "year": 2009},
-    {"make": 'lexus', "model": 'rx400h', "year": 2008},
-    {"make": 'lexus', "model": 'rx400h', "year": 2007},
-    {"make": 'lexus', "model": 'rx400h', "year": 2006},
-    {"make": 'lexus', "model": 'ux', "year": 2019},
-    {"make": 'lexus', "model": 'ux 200 f sport suv 4d', "year": 2019},
-    {"make": 'lexus', "model": 'ux 250h f sport suv 4d', "year": 2020},
-    {"make": 'lexus', "model": 'ux 250h sport utility 4d', "year": 2020},
-    {"make": 'lexus', "model": 'ux 250h sport utility 4d', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'a-class a 220', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'a-class a 220', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'amg gt', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'b-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'b-class b 250e', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'b-class electric', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'benz c250', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'benz c250', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz c250', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz c250 sport', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz c280', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz c280 4matic', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz c280 4matic', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz c300', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz c300 4matic', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz c300 4matic', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz c300 4matic', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz c300 4matic', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz c350', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz cls550', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz cls550', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz e300', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz e350', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz e350 4matic', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz e350 4matic', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz e500', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'benz gl450', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'benz gl450', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz gl450', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz gl450', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz gl450', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz gla250', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'benz glk 350', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'benz glk 350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz glk 350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz glk 350', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'benz glk350 4matic', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz ml350', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz ml350 4matic', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz ml350 4matic', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz s430', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'benz s550', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'benz s550', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'benz s550', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'benz s550', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'benz s550', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'benz s550 4matic', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz sl500', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'benz slk 250', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'benz slk 350', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'benz sprinter 2500 ext', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'c 250', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'c 250', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'c 300', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'c 300', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'c 300', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'c 300 sport', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'c-class', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'c-class c 250', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'c-class c 300', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'c-class c 300', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'c-class c 300', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'c-class c 300', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'c-class c 300', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'c-class c 350e', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'c-class c 63 amg', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'c-class c 63 amg', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'c-class c 63 amg', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'c-class c300', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'c-class hybrid', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'c230', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'c230 kompressor', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'c250', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'c250', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'c280 3.0l luxury', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'c300', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'c300', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'c300', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'c300 sport 4matic', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'cl-class cl 550', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'cla', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'cla', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'cla', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'cla', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'cla', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cla 250', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'cla 250', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'cla 250', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cla 250 4matic', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'cla 250 coupe 4d', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'cla 250 coupe 4d', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'cla-class', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'cla-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'cla-class', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'cla-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'cla-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cla-class cla 250', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cla-class cla 45', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cla45 amg', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'clk', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'clk-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'clk-class', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'clk350', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'clk350', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'clk550 5.5l', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'cls', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cls', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'cls', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'cls-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'cls-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cls-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'cls-class', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'cls-class', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'cls-class cls 400', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'cls-class cls 550', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'cls-class cls 550', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'cls-class cls 63', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'cls550', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'cls550 executive s', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'e 350', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'e 400', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'e 400', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'e 550', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'e 550', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'e-320 sedan', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'e-class', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'e-class e 300', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'e-class e 350', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'e-class e 350', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'e-class e 350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'e-class e 350', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'e-class e 350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'e-class e 400', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'e-class e 400', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'e-class e 400', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'e-class e 400', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'e-class e 450', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'e-class e 550', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'e-class e 63 amg', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'e-class e 63 amg', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'e350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'e350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'e350', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'e350', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'e350 4matic', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'e350 4matic awd sp', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'e350 sport 3.5l', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'e350 sport 4matic', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'e350 sport 4matic', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'e550 sedan 4matic', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'g-class', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'g-class g 63 amg', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'gl 350 bluetec local trade*80k msrp*prem pkg*lighting pkg*pano roof* appearance pkg* brown black leather* dvd* tow pkg', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'gl-class', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'gl-class gl 350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'gl-class gl 450', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'gl-class gl 450', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'gl450', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'gl450 4matic 4wd l', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'gl450 4matic awd w', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'gla', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'gla', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gla', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gla', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'gla', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'gla 250', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'gla 250 4matic', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gla 250 sport', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gla-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gla-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gla-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'gla-class gla 250', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'gla-class gla 45', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'glb 250 4matic', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'glb 250 sport', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'glc', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'glc', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'glc', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'glc', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'glc', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'glc 300', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'glc 300 4matic', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'glc 300 sport', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'glc 300 sport', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'glc 300 sport', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'glc-class', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'glc-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'glc-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gle', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'gle', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gle', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gle', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'gle 350', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gle 350', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gle 350', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'gle 350 4matic', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'gle 350 4matic', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gle 350 4matic', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'gle 350 sport', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'gle 350 sport', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gle-class', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'gle-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gle-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gle-class gle 350', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'glk', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'glk', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'glk', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'glk', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'glk 350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'glk 350', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'glk-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'glk-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'glk-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'glk-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'glk-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'glk-class', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'glk-class glk 250', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'glk-class glk 350', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'glk-class glk 350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'glk-class glk 350', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'glk-class glk 350', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'glk350 4matic awd', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'glk350 4matic awd', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'gls', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gls', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gls 450 4matic', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'gls 450 4matic', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'gls 450 4matic', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gls 450 4matic', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gls 450 sport', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gls 550 sport', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gls-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'gls-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'gls550', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'm-class', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'm-class 3.5l', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'm-class ml 320', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'm-class ml 350', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'm-class ml 350', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'm-class ml 350', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'm-class ml 350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'm-class ml 500', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'mercedes-amg', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'mercedes-amg', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'mercedes-amg cla', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'mercedes-amg cla', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'mercedes-amg cla', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'mercedes-amg cla', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'metris', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'metris passenger', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'metris passenger', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'ml 350', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'ml 350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'ml 350', "year": 2010},
-    {"make": 'mercedes-benz', "model": 'ml-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'ml-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'ml350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'ml350', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'ml350 3.5l', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'ml350 4matic awd s', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'ml350 4wd', "year": 2008},
-    {"make": 'mercedes-benz', "model": 'r-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'r-class r 350', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'r350', "year": 2006},
-    {"make": 'mercedes-benz', "model": 's 550', "year": 2015},
-    {"make": 'mercedes-benz', "model": 's 550', "year": 2012},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2020},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2017},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2016},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2015},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2014},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2012},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2011},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2010},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2008},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2007},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2006},
-    {"make": 'mercedes-benz', "model": 's-class', "year": 2005},
-    {"make": 'mercedes-benz', "model": 's-class s 450', "year": 2018},
-    {"make": 'mercedes-benz', "model": 's-class s 550', "year": 2015},
-    {"make": 'mercedes-benz', "model": 's-class s 550', "year": 2014},
-    {"make": 'mercedes-benz', "model": 's-class s 550', "year": 2013},
-    {"make": 'mercedes-benz', "model": 's-class s 550', "year": 2010},
-    {"make": 'mercedes-benz', "model": 's550', "year": 2008},
-    {"make": 'mercedes-benz', "model": 's550', "year": 2007},
-    {"make": 'mercedes-benz', "model": 's65 amg', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'sl 550', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'sl-class', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'sl-class', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'sl-class', "year": 2009},
-    {"make": 'mercedes-benz', "model": 'sl-class', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'sl-class sl 400', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'sl-class sl 550', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'sl-class sl 550', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'sl-class sl 550', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'sl-class sl 550', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'sl500 5.0l', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'sl550', "year": 2007},
-    {"make": 'mercedes-benz', "model": 'sl550 amg sport package', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'slc 300 roadster', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'slk', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'slk 300 roadster', "year": 2016},
-    {"make": 'mercedes-benz', "model": 'slk 350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'slk-class slk 250', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'slk-class slk 250', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'slk280', "year": 2006},
-    {"make": 'mercedes-benz', "model": 'slk350', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'slk350', "year": 2005},
-    {"make": 'mercedes-benz', "model": 'sprinter', "year": 2018},
-    {"make": 'mercedes-benz', "model": 'sprinter', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'sprinter', "year": 2011},
-    {"make": 'mercedes-benz', "model": 'sprinter 2500', "year": 2017},
-    {"make": 'mercedes-benz', "model": 'sprinter 2500', "year": 2015},
-    {"make": 'mercedes-benz', "model": 'sprinter 2500', "year": 2013},
-    {"make": 'mercedes-benz', "model": 'sprinter 2500', "year": 2012},
-    {"make": 'mercedes-benz', "model": 'sprinter 2500 cargo', "year": 2014},
-    {"make": 'mercedes-benz', "model": 'sprinter cab chassis', "year": 2019},
-    {"make": 'mercedes-benz', "model": 'sprinter cargo van', "year": 2020},
-    {"make": 'mercedes-benz', "model": 'sprinter cargo vans', "year": 2016},
-    {"make": 'nissan', "model": '350z', "year": 2006},
-    {"make": 'nissan', "model": '350z', "year": 2005},
-    {"make": 'nissan', "model": '370z', "year": 2017},
-    {"make": 'nissan', "model": '370z', "year": 2016},
-    {"make": 'nissan', "model": '370z', "year": 2015},
-    {"make": 'nissan', "model": '370z', "year": 2014},
-    {"make": 'nissan', "model": '370z', "year": 2011},
-    {"make": 'nissan', "model": '370z', "year": 2010},
-    {"make": 'nissan', "model": '370z coupe 2d', "year": 2020},
-    {"make": 'nissan', "model": '370z nismo coupe 2d', "year": 2019},
-    {"make": 'nissan', "model": '370z roadster', "year": 2010},
-    {"make": 'nissan', "model": '370z roadster 2d', "year": 2010},
-    {"make": 'nissan', "model": '370z sport touring coupe', "year": 2020},
-    {"make": 'nissan', "model": '370z touring coupe 2d', "year": 2014},
-    {"make": 'nissan', "model": '370z touring coupe 2d', "year": 2012},
-    {"make": 'nissan', "model": 'altima', "year": 2020},
-    {"make": 'nissan', "model": 'altima', "year": 2019},
-    {"make": 'nissan', "model": 'altima', "year": 2018},
-    {"make": 'nissan', "model": 'altima', "year": 2017},
-    {"make": 'nissan', "model": 'altima', "year": 2016},
-    {"make": 'nissan', "model": 'altima', "year": 2015},
-    {"make": 'nissan', "model": 'altima', "year": 2014},
-    {"make": 'nissan', "model": 'altima', "year": 2013},
-    {"make": 'nissan', "model": 'altima', "year": 2012},
-    {"make": 'nissan', "model": 'altima', "year": 2011},
-    {"make": 'nissan', "model": 'altima', "year": 2010},
-    {"make": 'nissan', "model": 'altima', "year": 2009},
-    {"make": 'nissan', "model": 'altima', "year": 2008},
-    {"make": 'nissan', "model": 'altima', "year": 2007},
-    {"make": 'nissan', "model": 'altima', "year": 2006},
-    {"make": 'nissan', "model": 'altima', "year": 2005},
-    {"make": 'nissan', "model": 'altima 2.5', "year": 2016},
-    {"make": 'nissan', "model": 'altima 2.5', "year": 2015},
-    {"make": 'nissan', "model": 'altima 2.5', "year": 2013},
-    {"make": 'nissan', "model": 'altima 2.5 4dr sedan', "year": 2014},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2020},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2018},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2017},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2016},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2015},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2014},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2013},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2012},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2011},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2010},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2009},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2008},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2007},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2006},
-    {"make": 'nissan', "model": 'altima 2.5 s', "year": 2005},
-    {"make": 'nissan', "model": 'altima 2.5 s sedan 4d', "year": 2017},
-    {"make": 'nissan', "model": 'altima 2.5 s w/ power seat', "year": 2015},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2019},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2018},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2014},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2013},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2009},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2008},
-    {"make": 'nissan', "model": 'altima 2.5 sl', "year": 2005},
-    {"make": 'nissan', "model": 'altima 2.5 sl sedan 4d', "year": 2015},
-    {"make": 'nissan', "model": 'altima 2.5 sr', "year": 2020},
-    {"make": 'nissan', "model": 'altima 2.5 sr', "year": 2018},
-    {"make": 'nissan', "model": 'altima 2.5 sr', "year": 2017},
-    {"make": 'nissan', "model": 'altima 2.5 sr sedan', "year": 2019},
-    {"make": 'nissan', "model": 'altima 2.5 sr sedan 4d', "year": 2018},
-    {"make": 'nissan', "model": 'altima 2.5 sv', "year": 2019},
-    {"make": 'nissan', "model": 'altima 2.5 sv', "year": 2018},
-    {"make": 'nissan', "model": 'altima 2.5 sv', "year": 2017},
-    {"make": 'nissan', "model": 'altima 2.5 sv', "year": 2014},
-    {"make": 'nissan', "model": 'altima 2.5s', "year": 2015},
-    {"make": 'nissan', "model": 'altima 2.5s', "year": 2008},
-    {"make": 'nissan', "model": 'altima 3.5 sl', "year": 2015},
-    {"make": 'nissan', "model": 'altima 3.5 sl', "year": 2013},
-    {"make": 'nissan', "model": 'altima 3.5 sv', "year": 2013},
-    {"make": 'nissan', "model": 'altima coupe', "year": 2008},
-    {"make": 'nissan', "model": 'altima hybrid', "year": 2009},
-    {"make": 'nissan', "model": 'altima s', "year": 2015},
-    {"make": 'nissan', "model": 'altima s', "year": 2014},
-    {"make": 'nissan', "model": 'altima s', "year": 2013},
-    {"make": 'nissan', "model": 'altima s', "year": 2012},
-    {"make": 'nissan', "model": 'altima s', "year": 2010},
-    {"make": 'nissan', "model": 'altima sr', "year": 2018},
-    {"make": 'nissan', "model": 'altima sr', "year": 2017},
-    {"make": 'nissan', "model": 'altima sr', "year": 2016},
-    {"make": 'nissan', "model": 'altima sv', "year": 2014},
-    {"make": 'nissan', "model": 'altima sv sedan', "year": 2017},
-    {"make": 'nissan', "model": 'armada', "year": 2020},
-    {"make": 'nissan', "model": 'armada', "year": 2019},
-    {"make": 'nissan', "model": 'armada', "year": 2018},
-    {"make": 'nissan', "model": 'armada', "year": 2017},
-    {"make": 'nissan', "model": 'armada', "year": 2015},
-    {"make": 'nissan', "model": 'armada', "year": 2014},
-    {"make": 'nissan', "model": 'armada', "year": 2013},
-    {"make": 'nissan', "model": 'armada', "year": 2012},
-    {"make": 'nissan', "model": 'armada', "year": 2011},
-    {"make": 'nissan', "model": 'armada', "year": 2010},
-    {"make": 'nissan', "model": 'armada', "year": 2008},
-    {"make": 'nissan', "model": 'armada', "year": 2007},
-    {"make": 'nissan', "model": 'armada', "year": 2006},
-    {"make": 'nissan', "model": 'armada', "year": 2005},
-    {"make": 'nissan', "model": 'armada le', "year": 2005},
-    {"make": 'nissan', "model": 'armada platinum', "year": 2014},
-    {"make": 'nissan', "model": 'armada platinum', "year": 2011},
-    {"make": 'nissan', "model": 'armada platinum 4x4 gas', "year": 2020},
-    {"make": 'nissan', "model": 'armada platinum reserve 4', "year": 2015},
-    {"make": 'nissan', "model": 'armada se', "year": 2006},
-    {"make": 'nissan', "model": 'armada sl sport utility', "year": 2017},
-    {"make": 'nissan', "model": 'cube', "year": 2012},
-    {"make": 'nissan', "model": 'cube', "year": 2011},
-    {"make": 'nissan', "model": 'cube', "year": 2010},
-    {"make": 'nissan', "model": 'cube', "year": 2009},
-    {"make": 'nissan', "model": 'frontier', "year": 2019},
-    {"make": 'nissan', "model": 'frontier', "year": 2018},
-    {"make": 'nissan', "model": 'frontier', "year": 2017},
-    {"make": 'nissan', "model": 'frontier', "year": 2016},
-    {"make": 'nissan', "model": 'frontier', "year": 2015},
-    {"make": 'nissan', "model": 'frontier', "year": 2014},
-    {"make": 'nissan', "model": 'frontier', "year": 2013},
-    {"make": 'nissan', "model": 'frontier', "year": 2012},
-    {"make": 'nissan', "model": 'frontier', "year": 2011},
-    {"make": 'nissan', "model": 'frontier', "year": 2010},
-    {"make": 'nissan', "model": 'frontier', "year": 2009},
-    {"make": 'nissan', "model": 'frontier', "year": 2008},
-    {"make": 'nissan', "model": 'frontier', "year": 2007},
-    {"make": 'nissan', "model": 'frontier', "year": 2006},
-    {"make": 'nissan', "model": 'frontier', "year": 2005},
-    {"make": 'nissan', "model": 'frontier 4x4', "year": 2019},
-    {"make": 'nissan', "model": 'frontier crew cab', "year": 2016},
-    {"make": 'nissan', "model": 'frontier crew cab', "year": 2015},
-    {"make": 'nissan', "model": 'frontier crew cab', "year": 2013},
-    {"make": 'nissan', "model": 'frontier crew cab', "year": 2007},
-    {"make": 'nissan', "model": 'frontier crew cab pro-4x', "year": 2020},
-    {"make": 'nissan', "model": 'frontier crew cab pro-4x', "year": 2018},
-    {"make": 'nissan', "model": 'frontier crew cab pro-4x', "year": 2017},
-    {"make": 'nissan', "model": 'frontier crew cab pro-4x', "year": 2016},
-    {"make": 'nissan', "model": 'frontier crew cab s', "year": 2016},
-    {"make": 'nissan', "model": 'frontier crew cab sl', "year": 2019},
-    {"make": 'nissan', "model": 'frontier crew cab sv', "year": 2020},
-    {"make": 'nissan', "model": 'frontier crew cab sv', "year": 2019},
-    {"make": 'nissan', "model": 'frontier crew cab sv', "year": 2018},
-    {"make": 'nissan', "model": 'frontier crew cab sv', "year": 2017},
-    {"make": 'nissan', "model": 'frontier crew cab sv', "year": 2016},
-    {"make": 'nissan', "model": 'frontier king cab s', "year": 2019},
-    {"make": 'nissan', "model": 'frontier king cab s', "year": 2016},
-    {"make": 'nissan', "model": 'frontier king cab sv', "year": 2019},
-    {"make": 'nissan', "model": 'frontier king cab sv', "year": 2017},
-    {"make": 'nissan', "model": 'frontier pro 4x', "year": 2010},
-    {"make": 'nissan', "model": 'frontier se', "year": 2010},
-    {"make": 'nissan', "model": 'frontier sv', "year": 2016},
-    {"make": 'nissan', "model": 'frontier sv', "year": 2015},
-    {"make": 'nissan', "model": 'frontier sv', "year": 2014},
-    {"make": 'nissan', "model": 'frontier sv 4x4', "year": 2015},
-    {"make": 'nissan', "model": 'frontier sv 4x4', "year": 2014},
-    {"make": 'nissan', "model": 'frontier sv crew cab', "year": 2019},
-    {"make": 'nissan', "model": 'gt-r', "year": 2020},
-    {"make": 'nissan', "model": 'gt-r', "year": 2012},
-    {"make": 'nissan', "model": 'juke', "year": 2017},
-    {"make": 'nissan', "model": 'juke', "year": 2016},
-    {"make": 'nissan', "model": 'juke', "year": 2015},
-    {"make": 'nissan', "model": 'juke', "year": 2014},
-    {"make": 'nissan', "model": 'juke', "year": 2013},
-    {"make": 'nissan', "model": 'juke', "year": 2012},
-    {"make": 'nissan', "model": 'juke', "year": 2011},
-    {"make": 'nissan', "model": 'juke nismo', "year": 2014},
-    {"make": 'nissan', "model": 'juke s', "year": 2013},
-    {"make": 'nissan', "model": 'juke s sport utility 4d', "year": 2016},
-    {"make": 'nissan', "model": 'juke sl', "year": 2012},
-    {"make": 'nissan', "model": 'juke sl', "year": 2011},
-    {"make": 'nissan', "model": 'juke sv', "year": 2012},
-    {"make": 'nissan', "model": 'juke sv', "year": 2011},
-    {"make": 'nissan', "model": 'juke sv awd', "year": 2011},
-    {"make": 'nissan', "model": 'kicks', "year": 2020},
-    {"make": 'nissan', "model": 'kicks', "year": 2019},
-    {"make": 'nissan', "model": 'kicks', "year": 2018},
-    {"make": 'nissan', "model": 'leaf', "year": 2019},
-    {"make": 'nissan', "model": 'leaf', "year": 2018},
-    {"make": 'nissan', "model": 'leaf', "year": 2016},
-    {"make": 'nissan', "model": 'leaf', "year": 2015},
-    {"make": 'nissan', "model": 'leaf', "year": 2013},
-    {"make": 'nissan', "model": 'leaf', "year": 2012},
-    {"make": 'nissan', "model": 'leaf', "year": 2011},
-    {"make": 'nissan', "model": 'leaf s', "year": 2013},
-    {"make": 'nissan', "model": 'leaf s hatchback 4d', "year": 2019},
-    {"make": 'nissan', "model": 'leaf s hatchback 4d', "year": 2018},
-    {"make": 'nissan', "model": 'leaf s hatchback 4d', "year": 2013},
-    {"make": 'nissan', "model": 'leaf sl', "year": 2019},
-    {"make": 'nissan', "model": 'leaf sl', "year": 2012},
-    {"make": 'nissan', "model": 'leaf sl hatchback 4d', "year": 2015},
-    {"make": 'nissan', "model": 'leaf sl hatchback 4d', "year": 2012},
-    {"make": 'nissan', "model": 'leaf sv hatchback 4d', "year": 2020},
-    {"make": 'nissan', "model": 'leaf sv hatchback 4d', "year": 2019},
-    {"make": 'nissan', "model": 'leaf sv hatchback 4d', "year": 2015},
-    {"make": 'nissan', "model": 'lifted titan platinum 4x4', "year": 2017},
-    {"make": 'nissan', "model": 'maxima', "year": 2020},
-    {"make": 'nissan', "model": 'maxima', "year": 2019},
-    {"make": 'nissan', "model": 'maxima', "year": 2018},
-    {"make": 'nissan', "model": 'maxima', "year": 2017},
-    {"make": 'nissan', "model": 'maxima', "year": 2016},
-    {"make": 'nissan', "model": 'maxima', "year": 2014},
-    {"make": 'nissan', "model": 'maxima', "year": 2013},
-    {"make": 'nissan', "model": 'maxima', "year": 2012},
-    {"make": 'nissan', "model": 'maxima', "year": 2011},
-    {"make": 'nissan', "model": 'maxima', "year": 2010},
-    {"make": 'nissan', "model": 'maxima', "year": 2009},
-    {"make": 'nissan', "model": 'maxima', "year": 2008},
-    {"make": 'nissan', "model": 'maxima', "year": 2007},
-    {"make": 'nissan', "model": 'maxima', "year": 2006},
-    {"make": 'nissan', "model": 'maxima', "year": 2005},
-    {"make": 'nissan', "model": 'maxima 3.5 4dr sedan', "year": 2013},
-    {"make": 'nissan', "model": 'maxima 3.5 s', "year": 2014},
-    {"make": 'nissan', "model": 'maxima 3.5 sv', "year": 2010},
-    {"make": 'nissan', "model": 'maxima platinum sedan 4d', "year": 2020},
-    {"make": 'nissan', "model": 'maxima platinum sedan 4d', "year": 2019},
-    {"make": 'nissan', "model": 'maxima platinum sedan 4d', "year": 2018},
-    {"make": 'nissan', "model": 'maxima s', "year": 2014},
-    {"make": 'nissan', "model": 'maxima s sedan 4d', "year": 2019},
-    {"make": 'nissan', "model": 'maxima s sedan 4d', "year": 2018},
-    {"make": 'nissan', "model": 'maxima se', "year": 2005},
-    {"make": 'nissan', "model": 'maxima sl', "year": 2005},
-    {"make": 'nissan', "model": 'maxima sr fwd gas sedan', "year": 2018},
-    {"make": 'nissan', "model": 'maxima sv', "year": 2017},
-    {"make": 'nissan', "model": 'maxima sv sedan 4d', "year": 2020},
-    {"make": 'nissan', "model": 'maxima sv sedan 4d', "year": 2019},
-    {"make": 'nissan', "model": 'murano', "year": 2020},
-    {"make": 'nissan', "model": 'murano', "year": 2019},
-    {"make": 'nissan', "model": 'murano', "year": 2018},
-    {"make": 'nissan', "model": 'murano', "year": 2017},
-    {"make": 'nissan', "model": 'murano', "year": 2016},
-    {"make": 'nissan', "model": 'murano', "year": 2015},
-    {"make": 'nissan', "model": 'murano', "year": 2014},
-    {"make": 'nissan', "model": 'murano', "year": 2013},
-    {"make": 'nissan', "model": 'murano', "year": 2012},
-    {"make": 'nissan', "model": 'murano', "year": 2011},
-    {"make": 'nissan', "model": 'murano', "year": 2010},
-    {"make": 'nissan', "model": 'murano', "year": 2009},
-    {"make": 'nissan', "model": 'murano', "year": 2007},
-    {"make": 'nissan', "model": 'murano', "year": 2006},
-    {"make": 'nissan', "model": 'murano', "year": 2005},
-    {"make": 'nissan', "model": 'murano le', "year": 2009},
-    {"make": 'nissan', "model": 'murano platnium', "year": 2018},
-    {"make": 'nissan', "model": 'murano s', "year": 2018},
-    {"make": 'nissan', "model": 'murano s', "year": 2014},
-    {"make": 'nissan', "model": 'murano s', "year": 2013},
-    {"make": 'nissan', "model": 'murano s', "year": 2009},
-    {"make": 'nissan', "model": 'murano s', "year": 2007},
-    {"make": 'nissan', "model": 'murano s sport utility 4d', "year": 2018},
-    {"make": 'nissan', "model": 'murano sl', "year": 2012},
-    {"make": 'nissan', "model": 'murano sl', "year": 2010},
-    {"make": 'nissan', "model": 'murano sl', "year": 2009},
-    {"make": 'nissan', "model": 'murano sl', "year": 2006},
-    {"make": 'nissan', "model": 'murano sl awd', "year": 2015},
-    {"make": 'nissan', "model": 'murano sl awd', "year": 2010},
-    {"make": 'nissan', "model": 'murano sl awd', "year": 2009},
-    {"make": 'nissan', "model": 'murano sl awd', "year": 2007},
-    {"make": 'nissan', "model": 'murano sl awd', "year": 2005},
-    {"make": 'nissan', "model": 'murano sv', "year": 2013},
-    {"make": 'nissan', "model": 'murano sv', "year": 2012},
-    {"make": 'nissan', "model": 'murano sv awd! awd', "year": 2011},
-    {"make": 'nissan', "model": 'murano sv sport utility', "year": 2017},
-    {"make": 'nissan', "model": 'nv', "year": 2017},
-    {"make": 'nissan', "model": 'nv', "year": 2015},
-    {"make": 'nissan', "model": 'nv', "year": 2012},
-    {"make": 'nissan', "model": 'nv cargo', "year": 2017},
-    {"make": 'nissan', "model": 'nv cargo', "year": 2012},
-    {"make": 'nissan', "model": 'nv200', "year": 2019},
-    {"make": 'nissan', "model": 'nv200', "year": 2018},
-    {"make": 'nissan', "model": 'nv200', "year": 2017},
-    {"make": 'nissan', "model": 'nv200', "year": 2016},
-    {"make": 'nissan', "model": 'nv200', "year": 2015},
-    {"make": 'nissan', "model": 'nv200', "year": 2014},
-    {"make": 'nissan', "model": 'nv200', "year": 2013},
-    {"make": 'nissan', "model": 'nv200 s', "year": 2017},
-    {"make": 'nissan', "model": 'nv200 s', "year": 2015},
-    {"make": 'nissan', "model": 'nv200 sv', "year": 2017},
-    {"make": 'nissan', "model": 'nv200 sv', "year": 2015},
-    {"make": 'nissan', "model": 'nv2500 hd cargo', "year": 2017},
-    {"make": 'nissan', "model": 'nv2500 hd cargo', "year": 2016},
-    {"make": 'nissan', "model": 'nv2500hd', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2020},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2019},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2018},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2017},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2016},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2015},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2013},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2012},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2011},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2010},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2008},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2007},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2006},
-    {"make": 'nissan', "model": 'pathfinder', "year": 2005},
-    {"make": 'nissan', "model": 'pathfinder le 4wd', "year": 2007},
-    {"make": 'nissan', "model": 'pathfinder platinum', "year": 2016},
-    {"make": 'nissan', "model": 'pathfinder platinum', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder platinum', "year": 2013},
-    {"make": 'nissan', "model": 'pathfinder s 4x4 gas suv', "year": 2018},
-    {"make": 'nissan', "model": 'pathfinder se', "year": 2010},
-    {"make": 'nissan', "model": 'pathfinder se', "year": 2007},
-    {"make": 'nissan', "model": 'pathfinder se', "year": 2006},
-    {"make": 'nissan', "model": 'pathfinder se', "year": 2005},
-    {"make": 'nissan', "model": 'pathfinder sl', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder sl', "year": 2013},
-    {"make": 'nissan', "model": 'pathfinder sl 4wd', "year": 2013},
-    {"make": 'nissan', "model": 'pathfinder sl sport', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder sv', "year": 2016},
-    {"make": 'nissan', "model": 'pathfinder sv', "year": 2015},
-    {"make": 'nissan', "model": 'pathfinder sv', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder sv', "year": 2013},
-    {"make": 'nissan', "model": 'pathfinder sv 4wd', "year": 2014},
-    {"make": 'nissan', "model": 'pathfinder sv 4x4', "year": 2013},
-    {"make": 'nissan', "model": 'pathfinder sv sport', "year": 2015},
-    {"make": 'nissan', "model": 'quest', "year": 2016},
-    {"make": 'nissan', "model": 'quest', "year": 2013},
-    {"make": 'nissan', "model": 'quest', "year": 2012},
-    {"make": 'nissan', "model": 'quest', "year": 2011},
-    {"make": 'nissan', "model": 'quest', "year": 2009},
-    {"make": 'nissan', "model": 'quest', "year": 2008},
-    {"make": 'nissan', "model": 'quest', "year": 2007},
-    {"make": 'nissan', "model": 'quest', "year": 2006},
-    {"make": 'nissan', "model": 'quest', "year": 2005},
-    {"make": 'nissan', "model": 'quest 3.5 svmini van', "year": 2012},
-    {"make": 'nissan', "model": 'quest s', "year": 2007},
-    {"make": 'nissan', "model": 'quest sl', "year": 2008},
-    {"make": 'nissan', "model": 'quest sv', "year": 2017},
-    {"make": 'nissan', "model": 'rogue', "year": 2020},
-    {"make": 'nissan', "model": 'rogue', "year": 2019},
-    {"make": 'nissan', "model": 'rogue', "year": 2018},
-    {"make": 'nissan', "model": 'rogue', "year": 2017},
-    {"make": 'nissan', "model": 'rogue', "year": 2016},
-    {"make": 'nissan', "model": 'rogue', "year": 2015},
-    {"make": 'nissan', "model": 'rogue', "year": 2014},
-    {"make": 'nissan', "model": 'rogue', "year": 2013},
-    {"make": 'nissan', "model": 'rogue', "year": 2012},
-    {"make": 'nissan', "model": 'rogue', "year": 2011},
-    {"make": 'nissan', "model": 'rogue', "year": 2010},
-    {"make": 'nissan', "model": 'rogue', "year": 2009},
-    {"make": 'nissan', "model": 'rogue', "year": 2008},
-    {"make": 'nissan', "model": 'rogue awd', "year": 2017},
-    {"make": 'nissan', "model": 'rogue awd', "year": 2013},
-    {"make": 'nissan', "model": 'rogue awd', "year": 2012},
-    {"make": 'nissan', "model": 'rogue awd sv', "year": 2018},
-    {"make": 'nissan', "model": 'rogue s', "year": 2020},
-    {"make": 'nissan', "model": 'rogue s', "year": 2019},
-    {"make": 'nissan', "model": 'rogue s', "year": 2018},
-    {"make": 'nissan', "model": 'rogue s', "year": 2017},
-    {"make": 'nissan', "model": 'rogue s', "year": 2016},
-    {"make": 'nissan', "model": 'rogue s', "year": 2015},
-    {"make": 'nissan', "model": 'rogue s', "year": 2014},
-    {"make": 'nissan', "model": 'rogue s', "year": 2013},
-    {"make": 'nissan', "model": 'rogue s', "year": 2012},
-    {"make": 'nissan', "model": 'rogue s', "year": 2010},
-    {"make": 'nissan', "model": 'rogue s (2017.5) sport', "year": 2017},
-    {"make": 'nissan', "model": 'rogue s awd', "year": 2018},
-    {"make": 'nissan', "model": 'rogue s awd', "year": 2013},
-    {"make": 'nissan', "model": 'rogue s sport utility 4d', "year": 2020},
-    {"make": 'nissan', "model": 'rogue s sport utility 4d', "year": 2018},
-    {"make": 'nissan', "model": 'rogue select', "year": 2015},
-    {"make": 'nissan', "model": 'rogue select', "year": 2014},
-    {"make": 'nissan', "model": 'rogue select s sport', "year": 2015},
-    {"make": 'nissan', "model": 'rogue sl', "year": 2019},
-    {"make": 'nissan', "model": 'rogue sl', "year": 2016},
-    {"make": 'nissan', "model": 'rogue sl', "year": 2015},
-    {"make": 'nissan', "model": 'rogue sl', "year": 2014},
-    {"make": 'nissan', "model": 'rogue sl', "year": 2008},
-    {"make": 'nissan', "model": 'rogue sl awd', "year": 2011},
-    {"make": 'nissan', "model": 'rogue sl awd', "year": 2009},
-    {"make": 'nissan', "model": 'rogue sl sport utility 4d', "year": 2020},
-    {"make": 'nissan', "model": 'rogue sport', "year": 2020},
-    {"make": 'nissan', "model": 'rogue sport', "year": 2019},
-    {"make": 'nissan', "model": 'rogue sport', "year": 2018},
-    {"make": 'nissan', "model": 'rogue sport', "year": 2017},
-    {"make": 'nissan', "model": 'rogue sport sv utility 4d', "year": 2017},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2020},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2019},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2018},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2017},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2016},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2015},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2014},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2012},
-    {"make": 'nissan', "model": 'rogue sv', "year": 2011},
-    {"make": 'nissan', "model": 'rogue sv awd', "year": 2018},
-    {"make": 'nissan', "model": 'rogue sv awd', "year": 2017},
-    {"make": 'nissan', "model": 'rogue sv awd', "year": 2013},
-    {"make": 'nissan', "model": 'rogue sv awd', "year": 2011},
-    {"make": 'nissan', "model": 'rogue sv awd gas suv auto', "year": 2018},
-    {"make": 'nissan', "model": 'rogue sv low miles nice', "year": 2016},
-    {"make": 'nissan', "model": 'rogue sv sport utility 4d', "year": 2018},
-    {"make": 'nissan', "model": 'rogue sv sport utility 4d', "year": 2017},
-    {"make": 'nissan', "model": 'sentra', "year": 2020},
-    {"make": 'nissan', "model": 'sentra', "year": 2019},
-    {"make": 'nissan', "model": 'sentra', "year": 2018},
-    {"make": 'nissan', "model": 'sentra', "year": 2017},
-    {"make": 'nissan', "model": 'sentra', "year": 2016},
-    {"make": 'nissan', "model": 'sentra', "year": 2015},
-    {"make": 'nissan', "model": 'sentra', "year": 2014},
-    {"make": 'nissan', "model": 'sentra', "year": 2013},
-    {"make": 'nissan', "model": 'sentra', "year": 2012},
-    {"make": 'nissan', "model": 'sentra', "year": 2011},
-    {"make": 'nissan', "model": 'sentra', "year": 2010},
-    {"make": 'nissan', "model": 'sentra', "year": 2009},
-    {"make": 'nissan', "model": 'sentra', "year": 2008},
-    {"make": 'nissan', "model": 'sentra', "year": 2007},
-    {"make": 'nissan', "model": 'sentra', "year": 2006},
-    {"make": 'nissan', "model": 'sentra', "year": 2005},
-    {"make": 'nissan', "model": 'sentra 2.0 s', "year": 2011},
-    {"make": 'nissan', "model": 'sentra 2.0 s', "year": 2010},
-    {"make": 'nissan', "model": 'sentra 2.0 sr', "year": 2012},
-    {"make": 'nissan', "model": 'sentra nismo', "year": 2017},
-    {"make": 'nissan', "model": 'sentra s', "year": 2019},
-    {"make": 'nissan', "model": 'sentra s', "year": 2018},
-    {"make": 'nissan', "model": 'sentra s', "year": 2017},
-    {"make": 'nissan', "model": 'sentra s', "year": 2016},
-    {"make": 'nissan', "model": 'sentra s', "year": 2015},
-    {"make": 'nissan', "model": 'sentra s', "year": 2012},
-    {"make": 'nissan', "model": 'sentra s', "year": 2010},
-    {"make": 'nissan', "model": 'sentra s', "year": 2006},
-    {"make": 'nissan', "model": 'sentra s', "year": 2005},
-    {"make": 'nissan', "model": 'sentra s sedan 4d', "year": 2019},
-    {"make": 'nissan', "model": 'sentra s sedan 4d', "year": 2018},
-    {"make": 'nissan', "model": 'sentra s sedan 4d', "year": 2013},
-    {"make": 'nissan', "model": 'sentra sl', "year": 2013},
-    {"make": 'nissan', "model": 'sentra sl', "year": 2012},
-    {"make": 'nissan', "model": 'sentra sr', "year": 2019},
-    {"make": 'nissan', "model": 'sentra sr', "year": 2015},
-    {"make": 'nissan', "model": 'sentra sr', "year": 2014},
-    {"make": 'nissan', "model": 'sentra sr sedan', "year": 2012},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2019},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2018},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2017},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2016},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2015},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2014},
-    {"make": 'nissan', "model": 'sentra sv', "year": 2013},
-    {"make": 'nissan', "model": 'sentra sv sedan 4d', "year": 2018},
-    {"make": 'nissan', "model": 'sentra sv sedan 4d', "year": 2017},
-    {"make": 'nissan', "model": 'sentra sv sedan 4d', "year": 2016},
-    {"make": 'nissan', "model": 'sentra sv sedan 4d', "year": 2015},
-    {"make": 'nissan', "model": 'titan', "year": 2021},
-    {"make": 'nissan', "model": 'titan', "year": 2019},
-    {"make": 'nissan', "model": 'titan', "year": 2018},
-    {"make": 'nissan', "model": 'titan', "year": 2017},
-    {"make": 'nissan', "model": 'titan', "year": 2016},
-    {"make": 'nissan', "model": 'titan', "year": 2015},
-    {"make": 'nissan', "model": 'titan', "year": 2014},
-    {"make": 'nissan', "model": 'titan', "year": 2013},
-    {"make": 'nissan', "model": 'titan', "year": 2012},
-    {"make": 'nissan', "model": 'titan', "year": 2011},
-    {"make": 'nissan', "model": 'titan', "year": 2010},
-    {"make": 'nissan', "model": 'titan', "year": 2009},
-    {"make": 'nissan', "model": 'titan', "year": 2008},
-    {"make": 'nissan', "model": 'titan', "year": 2007},
-    {"make": 'nissan', "model": 'titan', "year": 2006},
-    {"make": 'nissan', "model": 'titan', "year": 2005},
-    {"make": 'nissan', "model": 'titan crew cab', "year": 2014},
-    {"make": 'nissan', "model": 'titan crew cab sv pickup', "year": 2019},
-    {"make": 'nissan', "model": 'titan crew cab sv pickup', "year": 2018},
-    {"make": 'nissan', "model": 'titan crew cab sv pickup', "year": 2017},
-    {"make": 'nissan', "model": 'titan crew cab sv pickup', "year": 2013},
-    {"make": 'nissan', "model": 'titan le', "year": 2005},
-    {"make": 'nissan', "model": 'titan platinum reserve', "year": 2020},
-    {"make": 'nissan', "model": 'titan pro-4x', "year": 2014},
-    {"make": 'nissan', "model": 'titan pro-4x 4x4 half ton', "year": 2010},
-    {"make": 'nissan', "model": 'titan s', "year": 2017},
-    {"make": 'nissan', "model": 'titan se', "year": 2010},
-    {"make": 'nissan', "model": 'titan se', "year": 2006},
-    {"make": 'nissan', "model": 'titan se crew cab 5\'6"', "year": 2009},
-    {"make": 'nissan', "model": 'titan single cab', "year": 2017},
-    {"make": 'nissan', "model": 'titan single cab sv', "year": 2017},
-    {"make": 'nissan', "model": 'titan sv', "year": 2018},
-    {"make": 'nissan', "model": 'titan xd', "year": 2019},
-    {"make": 'nissan', "model": 'titan xd', "year": 2018},
-    {"make": 'nissan', "model": 'titan xd', "year": 2017},
-    {"make": 'nissan', "model": 'titan xd', "year": 2016},
-    {"make": 'nissan', "model": 'titan xd crew cab', "year": 2016},
-    {"make": 'nissan', "model": 'titan xd crew cab pro-4x', "year": 2016},
-    {"make": 'nissan', "model": 'titan xd crew cab sv', "year": 2017},
-    {"make": 'nissan', "model": 'titan xd pro-4x', "year": 2017},
-    {"make": 'nissan', "model": 'titan xd pro-4x', "year": 2016},
-    {"make": 'nissan', "model": 'titan xd single cab sv', "year": 2017},
-    {"make": 'nissan', "model": 'ud2600', "year": 2012},
-    {"make": 'nissan', "model": 'versa', "year": 2021},
-    {"make": 'nissan', "model": 'versa', "year": 2020},
-    {"make": 'nissan', "model": 'versa', "year": 2019},
-    {"make": 'nissan', "model": 'versa', "year": 2018},
-    {"make": 'nissan', "model": 'versa', "year": 2017},
-    {"make": 'nissan', "model": 'versa', "year": 2016},
-    {"make": 'nissan', "model": 'versa', "year": 2015},
-    {"make": 'nissan', "model": 'versa', "year": 2014},
-    {"make": 'nissan', "model": 'versa', "year": 2013},
-    {"make": 'nissan', "model": 'versa', "year": 2012},
-    {"make": 'nissan', "model": 'versa', "year": 2011},
-    {"make": 'nissan', "model": 'versa', "year": 2010},
-    {"make": 'nissan', "model": 'versa', "year": 2009},
-    {"make": 'nissan', "model": 'versa', "year": 2008},
-    {"make": 'nissan', "model": 'versa', "year": 2007},
-    {"make": 'nissan', "model": 'versa 1.6', "year": 2009},
-    {"make": 'nissan', "model": 'versa 1.6 s', "year": 2020},
-    {"make": 'nissan', "model": 'versa note', "year": 2018},
-    {"make": 'nissan', "model": 'versa note', "year": 2017},
-    {"make": 'nissan', "model": 'versa note', "year": 2016},
-    {"make": 'nissan', "model": 'versa note', "year": 2015},
-    {"make": 'nissan', "model": 'versa note', "year": 2014},
-    {"make": 'nissan', "model": 'versa note sr sr, hatchback', "year": 2016},
-    {"make": 'nissan', "model": 'versa note sv', "year": 2018},
-    {"make": 'nissan', "model": 'versa note sv', "year": 2015},
-    {"make": 'nissan', "model": 'versa note sv', "year": 2014},
-    {"make": 'nissan', "model": 'versa note sv hatchback', "year": 2016},
-    {"make": 'nissan', "model": 'versa s', "year": 2015},
-    {"make": 'nissan', "model": 'versa s', "year": 2012},
-    {"make": 'nissan', "model": 'versa s', "year": 2011},
-    {"make": 'nissan', "model": 'versa s', "year": 2010},
-    {"make": 'nissan', "model": 'versa s', "year": 2007},
-    {"make": 'nissan', "model": 'versa sedan', "year": 2019},
-    {"make": 'nissan', "model": 'versa sedan', "year": 2018},
-    {"make": 'nissan', "model": 'versa sedan', "year": 2017},
-    {"make": 'nissan', "model": 'versa sedan sv', "year": 2017},
-    {"make": 'nissan', "model": 'versa sv', "year": 2020},
-    {"make": 'nissan', "model": 'versa sv', "year": 2019},
-    {"make": 'nissan', "model": 'versa sv', "year": 2018},
-    {"make": 'nissan', "model": 'versa sv', "year": 2017},
-    {"make": 'nissan', "model": 'versa sv', "year": 2015},
-    {"make": 'nissan', "model": 'versa sv', "year": 2014},
-    {"make": 'nissan', "model": 'versa sv', "year": 2013},
-    {"make": 'nissan', "model": 'versa sv', "year": 2012},
-    {"make": 'nissan', "model": 'versa sv sedan 4d', "year": 2018},
-    {"make": 'nissan', "model": 'xterra', "year": 2014},
-    {"make": 'nissan', "model": 'xterra', "year": 2012},
-    {"make": 'nissan', "model": 'xterra', "year": 2011},
-    {"make": 'nissan', "model": 'xterra', "year": 2010},
-    {"make": 'nissan', "model": 'xterra', "year": 2009},
-    {"make": 'nissan', "model": 'xterra', "year": 2008},
-    {"make": 'nissan', "model": 'xterra', "year": 2007},
-    {"make": 'nissan', "model": 'xterra', "year": 2006},
-    {"make": 'nissan', "model": 'xterra', "year": 2005},
-    {"make": 'nissan', "model": 'xterra s', "year": 2010},
-    {"make": 'nissan', "model": 'xterra s', "year": 2008},
-    {"make": 'nissan', "model": 'xterra s sport utility 4d', "year": 2011},
-    {"make": 'nissan', "model": 'xterra se', "year": 2007},
-    {"make": 'nissan', "model": 'xterra se', "year": 2005},
-    {"make": 'ram', "model": '1500', "year": 2021},
-    {"make": 'ram', "model": '1500', "year": 2020},
-    {"make": 'ram', "model": '1500', "year": 2019},
-    {"make": 'ram', "model": '1500', "year": 2018},
-    {"make": 'ram', "model": '1500', "year": 2017},
-    {"make": 'ram', "model": '1500', "year": 2016},
-    {"make": 'ram', "model": '1500', "year": 2015},
-    {"make": 'ram', "model": '1500', "year": 2014},
-    {"make": 'ram', "model": '1500', "year": 2013},
-    {"make": 'ram', "model": '1500', "year": 2012},
-    {"make": 'ram', "model": '1500', "year": 2011},
-    {"make": 'ram', "model": '1500', "year": 2010},
-    {"make": 'ram', "model": '1500', "year": 2009},
-    {"make": 'ram', "model": '1500', "year": 2008},
-    {"make": 'ram', "model": '1500', "year": 2007},
-    {"make": 'ram', "model": '1500', "year": 2006},
-    {"make": 'ram', "model": '1500', "year": 2005},
-    {"make": 'ram', "model": '1500 4x4', "year": 2019},
-    {"make": 'ram', "model": '1500 4x4', "year": 2018},
-    {"make": 'ram', "model": '1500 4x4', "year": 2017},
-    {"make": 'ram', "model": '1500 4x4', "year": 2016},
-    {"make": 'ram', "model": '1500 4x4', "year": 2015},
-    {"make": 'ram', "model": '1500 4x4', "year": 2014},
-    {"make": 'ram', "model": '1500 4x4', "year": 2013},
-    {"make": 'ram', "model": '1500 4x4', "year": 2012},
-    {"make": 'ram', "model": '1500 4x4', "year": 2011},
-    {"make": 'ram', "model": '1500 4x4', "year": 2010},
-    {"make": 'ram', "model": '1500 4x4', "year": 2008},
-    {"make": 'ram', "model": '1500 big horn', "year": 2019},
-    {"make": 'ram', "model": '1500 big horn', "year": 2018},
-    {"make": 'ram', "model": '1500 big horn', "year": 2017},
-    {"make": 'ram', "model": '1500 big horn', "year": 2016},
-    {"make": 'ram', "model": '1500 big horn', "year": 2015},
-    {"make": 'ram', "model": '1500 big horn', "year": 2014},
-    {"make": 'ram', "model": '1500 big horn 4wd', "year": 2020},
-    {"make": 'ram', "model": '1500 big horn hemi loaded', "year": 2020},
-    {"make": 'ram', "model": '1500 big horn/lone star', "year": 2020},
-    {"make": 'ram', "model": '1500 big horn/lone star', "year": 2019},
-    {"make": 'ram', "model": '1500 bighorn 4x4 gas', "year": 2020},
-    {"make": 'ram', "model": '1500 classic', "year": 2020},
-    {"make": 'ram', "model": '1500 classic', "year": 2019},
-    {"make": 'ram', "model": '1500 classic bighorn', "year": 2019},
-    {"make": 'ram', "model": '1500 classic crew cab', "year": 2019},
-    {"make": 'ram', "model": '1500 classic crew cab big', "year": 2019},
-    {"make": 'ram', "model": '1500 classic crew cab slt', "year": 2020},
-    {"make": 'ram', "model": '1500 classic express', "year": 2019},
-    {"make": 'ram', "model": '1500 classic quad cab', "year": 2019},
-    {"make": 'ram', "model": '1500 classic regular cab', "year": 2019},
-    {"make": 'ram', "model": '1500 classic slt', "year": 2019},
-    {"make": 'ram', "model": '1500 classic slt 4wd', "year": 2019},
-    {"make": 'ram', "model": '1500 classic slt 4x4', "year": 2019},
-    {"make": 'ram', "model": '1500 classic tradesman', "year": 2019},
-    {"make": 'ram', "model": '1500 classic warlock', "year": 2020},
-    {"make": 'ram', "model": '1500 classic warlock', "year": 2019},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2019},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2017},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2016},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2015},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2014},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2013},
-    {"make": 'ram', "model": '1500 crew cab', "year": 2011},
-    {"make": 'ram', "model": '1500 crew cab big horn', "year": 2020},
-    {"make": 'ram', "model": '1500 crew cab big horn', "year": 2019},
-    {"make": 'ram', "model": '1500 crew cab big horn', "year": 2018},
-    {"make": 'ram', "model": '1500 crew cab big horn', "year": 2017},
-    {"make": 'ram', "model": '1500 crew cab big horn', "year": 2016},
-    {"make": 'ram', "model": '1500 crew cab big horn', "year": 2014},
-    {"make": 'ram', "model": '1500 crew cab express pickup', "year": 2017},
-    {"make": 'ram', "model": '1500 crew cab express pickup', "year": 2014},
-    {"make": 'ram', "model": '1500 crew cab laramie', "year": 2020},
-    {"make": 'ram', "model": '1500 crew cab laramie', "year": 2017},
-    {"make": 'ram', "model": '1500 crew cab laramie', "year": 2015},
-    {"make": 'ram', "model": '1500 crew cab laramie limit', "year": 2014},
-    {"make": 'ram', "model": '1500 crew cab laramie pickup', "year": 2020},
-    {"make": 'ram', "model": '1500 crew cab laramie pickup', "year": 2019},
-    {"make": 'ram', "model": '1500 crew cab laramie pickup', "year": 2018},
-    {"make": 'ram', "model": '1500 crew cab laramie pickup', "year": 2017},
-    {"make": 'ram', "model": '1500 crew cab laramie pickup', "year": 2015},
-    {"make": 'ram', "model": '1500 crew cab laramie pickup', "year": 2014},
-    {"make": 'ram', "model": '1500 crew cab lone star', "year": 2015},
-    {"make": 'ram', "model": '1500 crew cab rebel pickup', "year": 2020},
-    {"make": 'ram', "model": '1500 crew cab slt pickup 4d', "year": 2018},
-    {"make": 'ram', "model": '1500 crew cab tradesman', "year": 2018},
-    {"make": 'ram', "model": '1500 crew cab tradesman', "year": 2017},
-    {"make": 'ram', "model": '1500 crew cab tradesman', "year": 2015},
-    {"make": 'ram', "model": '1500 express', "year": 2018},
-    {"make": 'ram', "model": '1500 express', "year": 2017},
-    {"make": 'ram', "model": '1500 express', "year": 2016},
-    {"make": 'ram', "model": '1500 express', "year": 2014},
-    {"make": 'ram', "model": '1500 express', "year": 2012},
-    {"make": 'ram', "model": '1500 express 4x4 gas', "year": 2018},
-    {"make": 'ram', "model": '1500 express 4x4 gas', "year": 2017},
-    {"make": 'ram', "model": '1500 express crew cab short', "year": 2015},
-    {"make": 'ram', "model": '1500 harvest', "year": 2018},
-    {"make": 'ram', "model": '1500 hemi', "year": 2016},
-    {"make": 'ram', "model": '1500 hemi slt', "year": 2016},
-    {"make": 'ram', "model": '1500 laramie', "year": 2021},
-    {"make": 'ram', "model": '1500 laramie', "year": 2020},
-    {"make": 'ram', "model": '1500 laramie', "year": 2019},
-    {"make": 'ram', "model": '1500 laramie', "year": 2018},
-    {"make": 'ram', "model": '1500 laramie', "year": 2017},
-    {"make": 'ram', "model": '1500 laramie', "year": 2016},
-    {"make": 'ram', "model": '1500 laramie', "year": 2015},
-    {"make": 'ram', "model": '1500 laramie', "year": 2011},
-    {"make": 'ram', "model": '1500 laramie', "year": 2010},
-    {"make": 'ram', "model": '1500 laramie', "year": 2008},
-    {"make": 'ram', "model": '1500 laramie 4x4', "year": 2019},
-    {"make": 'ram', "model": '1500 laramie 4x4', "year": 2017},
-    {"make": 'ram', "model": '1500 laramie 4x4', "year": 2007},
-    {"make": 'ram', "model": '1500 laramie 4x4 eco diesel', "year": 2016},
-    {"make": 'ram', "model": '1500 laramie 4x4 gas', "year": 2020},
-    {"make": 'ram', "model": '1500 laramie 4x4 gas', "year": 2019},
-    {"make": 'ram', "model": '1500 laramie 4x4 gas', "year": 2017},
-    {"make": 'ram', "model": '1500 laramie 4x4 gas', "year": 2013},
-    {"make": 'ram', "model": '1500 laramie crew cab short', "year": 2017},
-    {"make": 'ram', "model": '1500 laramie limited', "year": 2015},
-    {"make": 'ram', "model": '1500 laramie longhorn', "year": 2014},
-    {"make": 'ram', "model": '1500 laramie longhorn editi', "year": 2013},
-    {"make": 'ram', "model": '1500 laramie quad cab short', "year": 2014},
-    {"make": 'ram', "model": '1500 lifted big horn crew cab 5.7 liter hemi', "year": 2017},
-    {"make": 'ram', "model": '1500 limited', "year": 2020},
-    {"make": 'ram', "model": '1500 limited 4x4 gas', "year": 2019},
-    {"make": 'ram', "model": '1500 limited 4x4 hemi crew', "year": 2017},
-    {"make": 'ram', "model": '1500 limited crewcab leveled', "year": 2019},
-    {"make": 'ram', "model": '1500 lone star', "year": 2019},
-    {"make": 'ram', "model": '1500 lone star', "year": 2006},
-    {"make": 'ram', "model": '1500 longhorn', "year": 2014},
-    {"make": 'ram', "model": '1500 longhorn 4x4 gas', "year": 2017},
-    {"make": 'ram', "model": '1500 longhorn limited', "year": 2014},
-    {"make": 'ram', "model": '1500 outdoorsman', "year": 2017},
-    {"make": 'ram', "model": '1500 outdoorsman 4x4', "year": 2018},
-    {"make": 'ram', "model": '1500 outdoorsman 4x4', "year": 2017},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2017},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2016},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2015},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2014},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2013},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2008},
-    {"make": 'ram', "model": '1500 quad cab', "year": 2005},
-    {"make": 'ram', "model": '1500 quad cab big horn', "year": 2019},
-    {"make": 'ram', "model": '1500 quad cab big horn', "year": 2018},
-    {"make": 'ram', "model": '1500 quad cab express pickup', "year": 2017},
-    {"make": 'ram', "model": '1500 quad cab harvest pickup', "year": 2018},
-    {"make": 'ram', "model": '1500 quad cab laramie pickup', "year": 2020},
-    {"make": 'ram', "model": '1500 quad cab laramie pickup', "year": 2014},
-    {"make": 'ram', "model": '1500 quad cab slt pickup 4d', "year": 2017},
-    {"make": 'ram', "model": '1500 quad cab sport pickup', "year": 2013},
-    {"make": 'ram', "model": '1500 quad cab tradesman', "year": 2017},
-    {"make": 'ram', "model": '1500 rebel', "year": 2020},
-    {"make": 'ram', "model": '1500 rebel', "year": 2019},
-    {"make": 'ram', "model": '1500 rebel', "year": 2016},
-    {"make": 'ram', "model": '1500 rebel 4x4 1/2 ton', "year": 2019},
-    {"make": 'ram', "model": '1500 rebel 4x4 1/2 ton', "year": 2018},
-    {"make": 'ram', "model": '1500 rebel 4x4 1/2 ton', "year": 2017},
-    {"make": 'ram', "model": '1500 regular cab tradesman', "year": 2017},
-    {"make": 'ram', "model": '1500 regular cab tradesman', "year": 2016},
-    {"make": 'ram', "model": '1500 slt', "year": 2018},
-    {"make": 'ram', "model": '1500 slt', "year": 2017},
-    {"make": 'ram', "model": '1500 slt', "year": 2016},
-    {"make": 'ram', "model": '1500 slt', "year": 2015},
-    {"make": 'ram', "model": '1500 slt', "year": 2014},
-    {"make": 'ram', "model": '1500 slt', "year": 2012},
-    {"make": 'ram', "model": '1500 slt', "year": 2010},
-    {"make": 'ram', "model": '1500 slt', "year": 2009},
-    {"make": 'ram', "model": '1500 slt', "year": 2008},
-    {"make": 'ram', "model": '1500 slt', "year": 2006},
-    {"make": 'ram', "model": '1500 slt', "year": 2005},
-    {"make": 'ram', "model": '1500 slt 1owner 4x4 5.7l well maint runs&drive great!!!', "year": 2014},
-    {"make": 'ram', "model": '1500 slt 4wd', "year": 2018},
-    {"make": 'ram', "model": '1500 slt 4wd!crew cab', "year": 2016},
-    {"make": 'ram', "model": '1500 slt 4x4 1/2 ton', "year": 2017},
-    {"make": 'ram', "model": '1500 slt 4x4 half ton', "year": 2017},
-    {"make": 'ram', "model": '1500 slt 4x4 half ton', "year": 2016},
-    {"make": 'ram', "model": '1500 sltcrew cab', "year": 2017},
-    {"make": 'ram', "model": '1500 sport', "year": 2018},
-    {"make": 'ram', "model": '1500 sport', "year": 2017},
-    {"make": 'ram', "model": '1500 sport', "year": 2016},
-    {"make": 'ram', "model": '1500 sport', "year": 2014},
-    {"make": 'ram', "model": '1500 sport', "year": 2013},
-    {"make": 'ram', "model": '1500 sport', "year": 2012},
-    {"make": 'ram', "model": '1500 sport 4x4', "year": 2015},
-    {"make": 'ram', "model": '1500 sport 4x4 1/2 ton', "year": 2018},
-    {"make": 'ram', "model": '1500 sport 4x4 1/2 ton', "year": 2017},
-    {"make": 'ram', "model": '1500 sport 4x4 1/2 ton', "year": 2016},
-    {"make": 'ram', "model": '1500 sport 4x4 1/2 ton', "year": 2015},
-    {"make": 'ram', "model": '1500 sport 4x4 1/2 ton', "year": 2014},
-    {"make": 'ram', "model": '1500 sport 4x4 1/2 ton', "year": 2013},
-    {"make": 'ram', "model": '1500 sportcrew cab', "year": 2015},
-    {"make": 'ram', "model": '1500 st', "year": 2017},
-    {"make": 'ram', "model": '1500 st 4x4 gas', "year": 2017},
-    {"make": 'ram', "model": '1500 sxt 4x4 half ton', "year": 2018},
-    {"make": 'ram', "model": '1500 tradesman', "year": 2017},
-    {"make": 'ram', "model": '1500 tradesman', "year": 2016},
-    {"make": 'ram', "model": '1500 tradesman', "year": 2015},
-    {"make": 'ram', "model": '1500 tradesman', "year": 2014},
-    {"make": 'ram', "model": '1500 tradesman 4wd!crew', "year": 2015},
-    {"make": 'ram', "model": '1500 trx launch edition 702hp every option #114 of 702', "year": 2021},
-    {"make": 'ram', "model": '2500', "year": 2020},
-    {"make": 'ram', "model": '2500', "year": 2019},
-    {"make": 'ram', "model": '2500', "year": 2018},
-    {"make": 'ram', "model": '2500', "year": 2017},
-    {"make": 'ram', "model": '2500', "year": 2016},
-    {"make": 'ram', "model": '2500', "year": 2015},
-    {"make": 'ram', "model": '2500', "year": 2014},
-    {"make": 'ram', "model": '2500', "year": 2013},
-    {"make": 'ram', "model": '2500', "year": 2012},
-    {"make": 'ram', "model": '2500', "year": 2011},
-    {"make": 'ram', "model": '2500', "year": 2010},
-    {"make": 'ram', "model": '2500', "year": 2009},
-    {"make": 'ram', "model": '2500', "year": 2008},
-    {"make": 'ram', "model": '2500', "year": 2007},
-    {"make": 'ram', "model": '2500', "year": 2006},
-    {"make": 'ram', "model": '2500', "year": 2005},
-    {"make": 'ram', "model": '2500 4wd', "year": 2019},
-    {"make": 'ram', "model": '2500 4x4', "year": 2015},
-    {"make": 'ram', "model": '2500 4x4', "year": 2005},
-    {"make": 'ram', "model": '2500 4x4 cummins', "year": 2018},
-    {"make": 'ram', "model": '2500 4x4 power wagon crew cab 5.7l hemi gas laramie one owner low miles', "year": 2005},
-    {"make": 'ram', "model": '2500 6" lifted laramie crew 4x4', "year": 2020},
-    {"make": 'ram', "model": '2500 crew cab', "year": 2017},
-    {"make": 'ram', "model": '2500 crew cab', "year": 2016},
-    {"make": 'ram', "model": '2500 crew cab', "year": 2015},
-    {"make": 'ram', "model": '2500 crew cab', "year": 2014},
-    {"make": 'ram', "model": '2500 crew cab', "year": 2012},
-    {"make": 'ram', "model": '2500 crew cab', "year": 2011},
-    {"make": 'ram', "model": '2500 crew cab big horn', "year": 2020},
-    {"make": 'ram', "model": '2500 crew cab big horn', "year": 2019},
-    {"make": 'ram', "model": '2500 crew cab lone star', "year": 2019},
-    {"make": 'ram', "model": '2500 crew cab slt 4x4', "year": 2016},
-    {"make": 'ram', "model": '2500 crew cab slt 4x4', "year": 2013},
-    {"make": 'ram', "model": '2500 crew cab tradesman', "year": 2020},
-    {"make": 'ram', "model": '2500 crew cab tradesman', "year": 2018},
-    {"make": 'ram', "model": '2500 cummins', "year": 2005},
-    {"make": 'ram', "model": '2500 laramie', "year": 2020},
-    {"make": 'ram', "model": '2500 laramie', "year": 2018},
-    {"make": 'ram', "model": '2500 laramie', "year": 2017},
-    {"make": 'ram', "model": '2500 laramie', "year": 2016},
-    {"make": 'ram', "model": '2500 laramie', "year": 2014},
-    {"make": 'ram', "model": '2500 laramie', "year": 2012},
-    {"make": 'ram', "model": '2500 laramie', "year": 2008},
-    {"make": 'ram', "model": '2500 laramie 4dr megacab', "year": 2018},
-    {"make": 'ram', "model": '2500 laramie crew 4wd', "year": 2015},
-    {"make": 'ram', "model": '2500 laramie crewcab 4wd', "year": 2016},
-    {"make": 'ram', "model": '2500 laramie cummins', "year": 2020},
-    {"make": 'ram', "model": '2500 laramie longhorn', "year": 2016},
-    {"make": 'ram', "model": '2500 laramie longhorn', "year": 2015},
-    {"make": 'ram', "model": '2500 laramie longhorn', "year": 2012},
-    {"make": 'ram', "model": '2500 laramie longhorn', "year": 2011},
-    {"make": 'ram', "model": '2500 laramie mega cab 4x4 bds lifted loaded diesel', "year": 2018},
-    {"make": 'ram', "model": '2500 longhorn mega 4x4', "year": 2014},
-    {"make": 'ram', "model": '2500 mega cab', "year": 2014},
-    {"make": 'ram', "model": '2500 mega cab', "year": 2007},
-    {"make": 'ram', "model": '2500 mega cab', "year": 2006},
-    {"make": 'ram', "model": '2500 power wagon', "year": 2016},
-    {"make": 'ram', "model": '2500 powerwagon', "year": 2016},
-    {"make": 'ram', "model": '2500 quad cab', "year": 2007},
-    {"make": 'ram', "model": '2500 quad cab', "year": 2005},
-    {"make": 'ram', "model": '2500 quad cab d i e', "year": 2007},
-    {"make": 'ram', "model": '2500 reg cab slt 4x4', "year": 2011},
-    {"make": 'ram', "model": '2500 slt', "year": 2015},
-    {"make": 'ram', "model": '2500 slt', "year": 2014},
-    {"make": 'ram', "model": '2500 slt', "year": 2007},
-    {"make": 'ram', "model": '2500 slt', "year": 2006},
-    {"make": 'ram', "model": '2500 slt 4x4 cummins', "year": 2012},
-    {"make": 'ram', "model": '2500 st', "year": 2012},
-    {"make": 'ram', "model": '2500 st crew cab flatbed', "year": 2012},
-    {"make": 'ram', "model": '2500 tradesman', "year": 2018},
-    {"make": 'ram', "model": '2500 tradesman', "year": 2017},
-    {"make": 'ram', "model": '2500 tradesman', "year": 2015},
-    {"make": 'ram', "model": '2500 tradesman', "year": 2014},
-    {"make": 'ram', "model": '2500 tradesman crew cab', "year": 2016},
-    {"make": 'ram', "model": '2500 tradesman lifted 4wd cummins', "year": 2016},
-    {"make": 'ram', "model": '2500 tradesman usa truck', "year": 2016},
-    {"make": 'ram', "model": '3500', "year": 2021},
-    {"make": 'ram', "model": '3500', "year": 2020},
-    {"make": 'ram', "model": '3500', "year": 2019},
-    {"make": 'ram', "model": '3500', "year": 2018},
-    {"make": 'ram', "model": '3500', "year": 2017},
-    {"make": 'ram', "model": '3500', "year": 2016},
-    {"make": 'ram', "model": '3500', "year": 2015},
-    {"make": 'ram', "model": '3500', "year": 2014},
-    {"make": 'ram', "model": '3500', "year": 2013},
-    {"make": 'ram', "model": '3500', "year": 2012},
-    {"make": 'ram', "model": '3500', "year": 2011},
-    {"make": 'ram', "model": '3500', "year": 2010},
-    {"make": 'ram', "model": '3500', "year": 2009},
-    {"make": 'ram', "model": '3500', "year": 2008},
-    {"make": 'ram', "model": '3500', "year": 2007},
-    {"make": 'ram', "model": '3500', "year": 2006},
-    {"make": 'ram', "model": '3500', "year": 2005},
-    {"make": 'ram', "model": '3500 big horn', "year": 2019},
-    {"make": 'ram', "model": '3500 big horn', "year": 2018},
-    {"make": 'ram', "model": '3500 bighorn 4x4 1 ton', "year": 2019},
-    {"make": 'ram', "model": '3500 chassis cab', "year": 2018},
-    {"make": 'ram', "model": '3500 crew cab', "year": 2014},
-    {"make": 'ram', "model": '3500 crew cab', "year": 2012},
-    {"make": 'ram', "model": '3500 crew cab flat bed tradesman 4x4 drw', "year": 2012},
-    {"make": 'ram', "model": '3500 crew cab trademan 4x4 drw', "year": 2017},
-    {"make": 'ram', "model": "3500 high roof 10'6 - lift gate -", "year": 2015},
-    {"make": 'ram', "model": '3500 laramie', "year": 2018},
-    {"make": 'ram', "model": '3500 laramie', "year": 2017},
-    {"make": 'ram', "model": '3500 laramie', "year": 2016},
-    {"make": 'ram', "model": '3500 laramie', "year": 2015},
-    {"make": 'ram', "model": '3500 laramie drw crew cab cummins', "year": 2012},
-    {"make": 'ram', "model": '3500 lifted tradesman drw 6.7 cummins', "year": 2020},
-    {"make": 'ram', "model": '3500 mega cab', "year": 2014},
-    {"make": 'ram', "model": '3500 mega cab', "year": 2006},
-    {"make": 'ram', "model": '3500 slt', "year": 2018},
-    {"make": 'ram', "model": '3500 slt', "year": 2017},
-    {"make": 'ram', "model": '3500 slt', "year": 2012},
-    {"make": 'ram', "model": '3500 slt', "year": 2007},
-    {"make": 'ram', "model": '3500 slt', "year": 2006},
-    {"make": 'ram', "model": '3500 slt lifted crew', "year": 2016},
-    {"make": 'ram', "model": '3500 tradesman', "year": 2015},
-    {"make": 'ram', "model": '3500 tradesman', "year": 2014},
-    {"make": 'ram', "model": '3500 tradesman', "year": 2013},
-    {"make": 'ram', "model": '3500 tradesman crew cab sho', "year": 2015},
-    {"make": 'ram', "model": '3500 tradesman hd 4x4 dually', "year": 2019},
-    {"make": 'ram', "model": '4500', "year": 2018},
-    {"make": 'ram', "model": '4500', "year": 2016},
-    {"make": 'ram', "model": '4500', "year": 2014},
-    {"make": 'ram', "model": '5500', "year": 2019},
-    {"make": 'ram', "model": '5500', "year": 2018},
-    {"make": 'ram', "model": '5500', "year": 2017},
-    {"make": 'ram', "model": '5500', "year": 2016},
-    {"make": 'ram', "model": '5500', "year": 2015},
-    {"make": 'ram', "model": '5500', "year": 2014},
-    {"make": 'ram', "model": '5500', "year": 2013},
-    {"make": 'ram', "model": '5500', "year": 2012},
-    {"make": 'ram', "model": '5500 tradesman', "year": 2015},
-    {"make": 'ram', "model": 'all-new 1500', "year": 2019},
-    {"make": 'ram', "model": 'c/v', "year": 2015},
-    {"make": 'ram', "model": 'c/v', "year": 2012},
-    {"make": 'ram', "model": 'cargo van', "year": 2014},
-    {"make": 'ram', "model": 'cargo van', "year": 2012},
-    {"make": 'ram', "model": 'chassis cab', "year": 2012},
-    {"make": 'ram', "model": 'chassis cab', "year": 2011},
-    {"make": 'ram', "model": 'chassis cab', "year": 2007},
-    {"make": 'ram', "model": 'cummins 2500 bighorn', "year": 2019},
-    {"make": 'ram', "model": 'cummins 3500 laramie', "year": 2016},
-    {"make": 'ram', "model": 'dakota', "year": 2011},
-    {"make": 'ram', "model": 'diesel cummins 3500', "year": 2020},
-    {"make": 'ram', "model": 'diesel cummins 3500', "year": 2015},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2020},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2019},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2018},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2017},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2016},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2015},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2014},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2013},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2012},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2011},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2010},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2009},
-    {"make": 'ram', "model": 'pickup 1500', "year": 2008},
-    {"make": 'ram', "model": 'pickup 1500 classic', "year": 2020},
-    {"make": 'ram', "model": 'pickup 1500 classic', "year": 2019},
-    {"make": 'ram', "model": 'pickup 1500 classic slt 4wd', "year": 2019},
-    {"make": 'ram', "model": 'pickup 1500 express quad cab', "year": 2017},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2020},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2019},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2018},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2016},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2015},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2012},
-    {"make": 'ram', "model": 'pickup 2500', "year": 2006},
-    {"make": 'ram', "model": 'pickup 3500', "year": 2019},
-    {"make": 'ram', "model": 'pickup 3500', "year": 2012},
-    {"make": 'ram', "model": 'pickup 3500', "year": 2005},
-    {"make": 'ram', "model": 'promaster', "year": 2020},
-    {"make": 'ram', "model": 'promaster', "year": 2019},
-    {"make": 'ram', "model": 'promaster', "year": 2018},
-    {"make": 'ram', "model": 'promaster', "year": 2017},
-    {"make": 'ram', "model": 'promaster', "year": 2016},
-    {"make": 'ram', "model": 'promaster 1500', "year": 2019},
-    {"make": 'ram', "model": 'promaster 1500', "year": 2018},
-    {"make": 'ram', "model": 'promaster 1500', "year": 2017},
-    {"make": 'ram', "model": 'promaster 1500', "year": 2014},
-    {"make": 'ram', "model": 'promaster 1500 cargo van', "year": 2017},
-    {"make": 'ram', "model": 'promaster 2500', "year": 2020},
-    {"make": 'ram', "model": 'promaster 2500', "year": 2019},
-    {"make": 'ram', "model": 'promaster 2500', "year": 2018},
-    {"make": 'ram', "model": 'promaster 2500', "year": 2017},
-    {"make": 'ram', "model": 'promaster 2500', "year": 2015},
-    {"make": 'ram', "model": 'promaster 2500', "year": 2014},
-    {"make": 'ram', "model": 'promaster 2500 cargo', "year": 2014},
-    {"make": 'ram', "model": 'promaster 2500 cargo van', "year": 2017},
-    {"make": 'ram', "model": 'promaster 2500 high top', "year": 2019},
-    {"make": 'ram', "model": 'promaster 3500', "year": 2015},
-    {"make": 'ram', "model": 'promaster cargo', "year": 2019},
-    {"make": 'ram', "model": 'promaster cargo 1500 cargo 136 wb', "year": 2020},
-    {"make": 'ram', "model": 'promaster cargo 3500 159 wb', "year": 2017},
-    {"make": 'ram', "model": 'promaster cargo van', "year": 2020},
-    {"make": 'ram', "model": 'promaster cargo van', "year": 2019},
-    {"make": 'ram', "model": 'promaster cargo van', "year": 2018},
-    {"make": 'ram', "model": 'promaster cargo van', "year": 2017},
-    {"make": 'ram', "model": 'promaster cargo van', "year": 2016},
-    {"make": 'ram', "model": 'promaster cargo van', "year": 2014},
-    {"make": 'ram', "model": 'promaster city', "year": 2020},
-    {"make": 'ram', "model": 'promaster city', "year": 2018},
-    {"make": 'ram', "model": 'promaster city', "year": 2017},
-    {"make": 'ram', "model": 'promaster city', "year": 2016},
-    {"make": 'ram', "model": 'promaster city', "year": 2015},
-    {"make": 'ram', "model": 'promaster city cargo tradesman', "year": 2018},
-    {"make": 'ram', "model": 'promaster city cargo van', "year": 2017},
-    {"make": 'ram', "model": 'promaster city cargo van', "year": 2016},
-    {"make": 'ram', "model": 'promaster city cargo van', "year": 2015},
-    {"make": 'ram', "model": 'promaster city wagon slt', "year": 2016},
-    {"make": 'ram', "model": 'promaster city wagon slt', "year": 2015},
-    {"make": 'ram', "model": 'promaster city wagon van 4d', "year": 2018},
-    {"make": 'ram', "model": 'rebel', "year": 2019},
-    {"make": 'subaru', "model": 'ascent', "year": 2021},
-    {"make": 'subaru', "model": 'ascent', "year": 2020},
-    {"make": 'subaru', "model": 'ascent', "year": 2019},
-    {"make": 'subaru', "model": 'ascent premium sport', "year": 2019},
-    {"make": 'subaru', "model": 'b9 tribeca', "year": 2006},
-    {"make": 'subaru', "model": 'baja sport arizona rust free* all service records since new*new timing belt*new brakes&rotors*new tune up*new tires*new struts*smoke free*zero oil leaks*rare find', "year": 2006},
-    {"make": 'subaru', "model": 'brz', "year": 2018},
-    {"make": 'subaru', "model": 'brz', "year": 2015},
-    {"make": 'subaru', "model": 'brz', "year": 2014},
-    {"make": 'subaru', "model": 'brz limited coupe 2d', "year": 2020},
-    {"make": 'subaru', "model": 'brz limited coupe 2d', "year": 2018},
-    {"make": 'subaru', "model": 'brz limited coupe 2d', "year": 2015},
-    {"make": 'subaru', "model": 'brz premium coupe 2d', "year": 2019},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2021},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2020},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2019},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2018},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2017},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2016},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2014},
-    {"make": 'subaru', "model": 'crosstrek', "year": 2013},
-    {"make": 'subaru', "model": 'crosstrek 2.0i limited', "year": 2018},
-    {"make": 'subaru', "model": 'crosstrek 2.0i limited', "year": 2016},
-    {"make": 'subaru', "model": 'crosstrek 2.0i premium', "year": 2019},
-    {"make": 'subaru', "model": 'crosstrek 2.0i premium', "year": 2018},
-    {"make": 'subaru', "model": 'crosstrek 2.0i premium', "year": 2017},
-    {"make": 'subaru', "model": 'crosstrek hybrid sport', "year": 2019},
-    {"make": 'subaru', "model": 'crosstrek limited', "year": 2018},
-    {"make": 'subaru', "model": 'forester', "year": 2021},
-    {"make": 'subaru', "model": 'forester', "year": 2020},
-    {"make": 'subaru', "model": 'forester', "year": 2019},
-    {"make": 'subaru', "model": 'forester', "year": 2018},
-    {"make": 'subaru', "model": 'forester', "year": 2017},
-    {"make": 'subaru', "model": 'forester', "year": 2016},
-    {"make": 'subaru', "model": 'forester', "year": 2015},
-    {"make": 'subaru', "model": 'forester', "year": 2014},
-    {"make": 'subaru', "model": 'forester', "year": 2013},
-    {"make": 'subaru', "model": 'forester', "year": 2012},
-    {"make": 'subaru', "model": 'forester', "year": 2011},
-    {"make": 'subaru', "model": 'forester', "year": 2010},
-    {"make": 'subaru', "model": 'forester', "year": 2009},
-    {"make": 'subaru', "model": 'forester', "year": 2008},
-    {"make": 'subaru', "model": 'forester', "year": 2007},
-    {"make": 'subaru', "model": 'forester', "year": 2006},
-    {"make": 'subaru', "model": 'forester', "year": 2005},
-    {"make": 'subaru', "model": 'forester (natl)', "year": 2005},
-    {"make": 'subaru', "model": 'forester 2.0xt premium', "year": 2015},
-    {"make": 'subaru', "model": 'forester 2.0xt touring', "year": 2014},
-    {"make": 'subaru', "model": 'forester 2.5i', "year": 2015},
-    {"make": 'subaru', "model": 'forester 2.5i limited', "year": 2018},
-    {"make": 'subaru', "model": 'forester 2.5i limited', "year": 2015},
-    {"make": 'subaru', "model": 'forester 2.5i limited', "year": 2014},
-    {"make": 'subaru', "model": 'forester 2.5i premium', "year": 2018},
-    {"make": 'subaru', "model": 'forester 2.5i premium', "year": 2017},
-    {"make": 'subaru', "model": 'forester 2.5i premium', "year": 2016},
-    {"make": 'subaru', "model": 'forester 2.5i premium', "year": 2015},
-    {"make": 'subaru', "model": 'forester 2.5i premium', "year": 2014},
-    {"make": 'subaru', "model": 'forester 2.5i premium', "year": 2009},
-    {"make": 'subaru', "model": 'forester 2.5i premium local trade* clean title* no accidents* all weather pkg* eyesight* navigation* back up camera* tyger roof basket* full clear bra on front* non smoker*2-keys', "year": 2015},
-    {"make": 'subaru', "model": 'forester 2.5i sport', "year": 2018},
-    {"make": 'subaru', "model": 'forester 2.5i sport', "year": 2017},
-    {"make": 'subaru', "model": 'forester 2.5i touring awd', "year": 2014},
-    {"make": 'subaru', "model": 'forester 2.5x', "year": 2013},
-    {"make": 'subaru', "model": 'forester 2.5x', "year": 2012},
-    {"make": 'subaru', "model": 'forester 2.5x', "year": 2011},
-    {"make": 'subaru', "model": 'forester 2.5x', "year": 2007},
-    {"make": 'subaru', "model": 'forester 2.5x', "year": 2005},
-    {"make": 'subaru', "model": 'forester 2.5x limited', "year": 2010},
-    {"make": 'subaru', "model": 'forester 2.5x premium', "year": 2011},
-    {"make": 'subaru', "model": 'forester 2.5x premium', "year": 2010},
-    {"make": 'subaru', "model": 'forester 2.5x premium', "year": 2009},
-    {"make": 'subaru', "model": 'forester 2.5x sport', "year": 2012},
-    {"make": 'subaru', "model": 'forester limited', "year": 2010},
-    {"make": 'subaru', "model": 'forester limited', "year": 2009},
-    {"make": 'subaru', "model": 'forester premium', "year": 2020},
-    {"make": 'subaru', "model": 'forester premium', "year": 2017},
-    {"make": 'subaru', "model": 'forester premium awd', "year": 2019},
-    {"make": 'subaru', "model": 'forester sport suv 4d', "year": 2019},
-    {"make": 'subaru', "model": 'forester touring sport', "year": 2019},
-    {"make": 'subaru', "model": 'impreza', "year": 2021},
-    {"make": 'subaru', "model": 'impreza', "year": 2020},
-    {"make": 'subaru', "model": 'impreza', "year": 2019},
-    {"make": 'subaru', "model": 'impreza', "year": 2018},
-    {"make": 'subaru', "model": 'impreza', "year": 2017},
-    {"make": 'subaru', "model": 'impreza', "year": 2016},
-    {"make": 'subaru', "model": 'impreza', "year": 2015},
-    {"make": 'subaru', "model": 'impreza', "year": 2014},
-    {"make": 'subaru', "model": 'impreza', "year": 2013},
-    {"make": 'subaru', "model": 'impreza', "year": 2012},
-    {"make": 'subaru', "model": 'impreza', "year": 2011},
-    {"make": 'subaru', "model": 'impreza', "year": 2010},
-    {"make": 'subaru', "model": 'impreza', "year": 2009},
-    {"make": 'subaru', "model": 'impreza', "year": 2008},
-    {"make": 'subaru', "model": 'impreza', "year": 2007},
-    {"make": 'subaru', "model": 'impreza', "year": 2006},
-    {"make": 'subaru', "model": 'impreza', "year": 2005},
-    {"make": 'subaru', "model": 'impreza 2.0i', "year": 2019},
-    {"make": 'subaru', "model": 'impreza 2.0i limited', "year": 2017},
-    {"make": 'subaru', "model": 'impreza 2.0i premium', "year": 2017},
-    {"make": 'subaru', "model": 'impreza 2.0i premium', "year": 2015},
-    {"make": 'subaru', "model": 'impreza 2.0i premium', "year": 2013},
-    {"make": 'subaru', "model": 'impreza 2.0i premium', "year": 2012},
-    {"make": 'subaru', "model": 'impreza 2.0i sport wagon', "year": 2018},
-    {"make": 'subaru', "model": 'impreza 2.0i sport wagon', "year": 2017},
-    {"make": 'subaru', "model": 'impreza 2.5i', "year": 2011},
-    {"make": 'subaru', "model": 'impreza 2.5i', "year": 2010},
-    {"make": 'subaru', "model": 'impreza 2.5i', "year": 2009},
-    {"make": 'subaru', "model": 'impreza 2.5i', "year": 2008},
-    {"make": 'subaru', "model": 'impreza 2.5i awd', "year": 2010},
-    {"make": 'subaru', "model": 'impreza 2.5i premium', "year": 2011},
-    {"make": 'subaru', "model": 'impreza 2.5rs', "year": 2005},
-    {"make": 'subaru', "model": 'impreza awd 4d sedan', "year": 2014},
-    {"make": 'subaru', "model": 'impreza outback sport', "year": 2010},
-    {"make": 'subaru', "model": 'impreza outback sport', "year": 2009},
-    {"make": 'subaru', "model": 'impreza outback sport', "year": 2008},
-    {"make": 'subaru', "model": 'impreza outback sport', "year": 2007},
-    {"make": 'subaru', "model": 'impreza outback sport', "year": 2006},
-    {"make": 'subaru', "model": 'impreza sedan 4d', "year": 2020},
-    {"make": 'subaru', "model": 'impreza sedan wrx', "year": 2013},
-    {"make": 'subaru', "model": 'impreza sport', "year": 2017},
-    {"make": 'subaru', "model": 'impreza sport - awd - rear camera - lane keep assi', "year": 2017},
-    {"make": 'subaru', "model": 'impreza wagon', "year": 2016},
-    {"make": 'subaru', "model": 'impreza wagon', "year": 2012},
-    {"make": 'subaru', "model": 'impreza wagon', "year": 2010},
-    {"make": 'subaru', "model": 'impreza wagon', "year": 2008},
-    {"make": 'subaru', "model": 'impreza wagon 4d', "year": 2020},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2013},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2012},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2011},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2010},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2009},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2008},
-    {"make": 'subaru', "model": 'impreza wrx', "year": 2006},
-    {"make": 'subaru', "model": 'impreza wrx limited sedan', "year": 2014},
-    {"make": 'subaru', "model": 'impreza wrx limited sedan', "year": 2011},
-    {"make": 'subaru', "model": 'impreza wrx premium hatch', "year": 2013},
-    {"make": 'subaru', "model": 'impreza wrx sedan 4d', "year": 2012},
-    {"make": 'subaru', "model": 'impreza wrx sport wagon', "year": 2013},
-    {"make": 'subaru', "model": 'impreza wrx sti', "year": 2012},
-    {"make": 'subaru', "model": 'impreza wrx sti', "year": 2008},
-    {"make": 'subaru', "model": 'impreza wrx sti sedan 4d', "year": 2013},
-    {"make": 'subaru', "model": 'legacy', "year": 2020},
-    {"make": 'subaru', "model": 'legacy', "year": 2019},
-    {"make": 'subaru', "model": 'legacy', "year": 2018},
-    {"make": 'subaru', "model": 'legacy', "year": 2017},
-    {"make": 'subaru', "model": 'legacy', "year": 2016},
-    {"make": 'subaru', "model": 'legacy', "year": 2015},
-    {"make": 'subaru', "model": 'legacy', "year": 2014},
-    {"make": 'subaru', "model": 'legacy', "year": 2013},
-    {"make": 'subaru', "model": 'legacy', "year": 2012},
-    {"make": 'subaru', "model": 'legacy', "year": 2011},
-    {"make": 'subaru', "model": 'legacy', "year": 2010},
-    {"make": 'subaru', "model": 'legacy', "year": 2009},
-    {"make": 'subaru', "model": 'legacy', "year": 2008},
-    {"make": 'subaru', "model": 'legacy', "year": 2007},
-    {"make": 'subaru', "model": 'legacy', "year": 2006},
-    {"make": 'subaru', "model": 'legacy', "year": 2005},
-    {"make": 'subaru', "model": 'legacy 2.5i', "year": 2018},
-    {"make": 'subaru', "model": 'legacy 2.5i', "year": 2013},
-    {"make": 'subaru', "model": 'legacy 2.5i', "year": 2008},
-    {"make": 'subaru', "model": 'legacy 2.5i limited', "year": 2017},
-    {"make": 'subaru', "model": 'legacy 2.5i limited', "year": 2014},
-    {"make": 'subaru', "model": 'legacy 2.5i limited', "year": 2013},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2018},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2016},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2015},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2013},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2012},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2011},
-    {"make": 'subaru', "model": 'legacy 2.5i premium', "year": 2010},
-    {"make": 'subaru', "model": 'legacy 2.5i premium sedan', "year": 2019},
-    {"make": 'subaru', "model": 'legacy 2.5i premium sedan', "year": 2017},
-    {"make": 'subaru', "model": 'legacy 2.5i premium sedan', "year": 2016},
-    {"make": 'subaru', "model": 'legacy 2.5i sedan 4d', "year": 2019},
-    {"make": 'subaru', "model": 'legacy 2.5i sedan 4d', "year": 2018},
-    {"make": 'subaru', "model": 'legacy 2.5i sedan 4d', "year": 2015},
-    {"make": 'subaru', "model": 'legacy premium', "year": 2017},
-    {"make": 'subaru', "model": 'legacy premium', "year": 2013},
-    {"make": 'subaru', "model": 'legacy premium awd', "year": 2011},
-    {"make": 'subaru', "model": 'outback', "year": 2021},
-    {"make": 'subaru', "model": 'outback', "year": 2020},
-    {"make": 'subaru', "model": 'outback', "year": 2019},
-    {"make": 'subaru', "model": 'outback', "year": 2018},
-    {"make": 'subaru', "model": 'outback', "year": 2017},
-    {"make": 'subaru', "model": 'outback', "year": 2016},
-    {"make": 'subaru', "model": 'outback', "year": 2015},
-    {"make": 'subaru', "model": 'outback', "year": 2014},
-    {"make": 'subaru', "model": 'outback', "year": 2013},
-    {"make": 'subaru', "model": 'outback', "year": 2012},
-    {"make": 'subaru', "model": 'outback', "year": 2011},
-    {"make": 'subaru', "model": 'outback', "year": 2010},
-    {"make": 'subaru', "model": 'outback', "year": 2009},
-    {"make": 'subaru', "model": 'outback', "year": 2008},
-    {"make": 'subaru', "model": 'outback', "year": 2007},
-    {"make": 'subaru', "model": 'outback', "year": 2006},
-    {"make": 'subaru', "model": 'outback', "year": 2005},
-    {"make": 'subaru', "model": 'outback 2.5i', "year": 2019},
-    {"make": 'subaru', "model": 'outback 2.5i', "year": 2011},
-    {"make": 'subaru', "model": 'outback 2.5i', "year": 2006},
-    {"make": 'subaru', "model": 'outback 2.5i', "year": 2005},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2019},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2018},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2016},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2015},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2014},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2013},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2012},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2011},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2010},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2009},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2008},
-    {"make": 'subaru', "model": 'outback 2.5i limited', "year": 2005},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2019},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2018},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2017},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2016},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2015},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2014},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2013},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2012},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2011},
-    {"make": 'subaru', "model": 'outback 2.5i premium', "year": 2010},
-    {"make": 'subaru', "model": 'outback 2.5i touring', "year": 2017},
-    {"make": 'subaru', "model": 'outback 2.5i wagon 4d', "year": 2018},
-    {"make": 'subaru', "model": 'outback 3.6r limited', "year": 2018},
-    {"make": 'subaru', "model": 'outback 3.6r limited', "year": 2012},
-    {"make": 'subaru', "model": 'outback 3.6r limited', "year": 2011},
-    {"make": 'subaru', "model": 'outback 3.6r limited local trade*low miles* new brakes & rotors*new power steering pump*new air & cabin filters*all 4 new tires*0-accidents*non smoker', "year": 2010},
-    {"make": 'subaru', "model": 'outback 3.6r ltd h6 awd', "year": 2011},
-    {"make": 'subaru', "model": 'outback awd', "year": 2014},
-    {"make": 'subaru', "model": 'outback limited', "year": 2018},
-    {"make": 'subaru', "model": 'outback limited', "year": 2015},
-    {"make": 'subaru', "model": 'outback limited', "year": 2014},
-    {"make": 'subaru', "model": 'outback limited', "year": 2012},
-    {"make": 'subaru', "model": 'outback premium', "year": 2019},
-    {"make": 'subaru', "model": 'outback premium', "year": 2013},
-    {"make": 'subaru', "model": 'outback premium', "year": 2012},
-    {"make": 'subaru', "model": 'outback rltd', "year": 2010},
-    {"make": 'subaru', "model": 'tribeca', "year": 2012},
-    {"make": 'subaru', "model": 'tribeca', "year": 2011},
-    {"make": 'subaru', "model": 'tribeca', "year": 2010},
-    {"make": 'subaru', "model": 'tribeca', "year": 2009},
-    {"make": 'subaru', "model": 'tribeca', "year": 2008},
-    {"make": 'subaru', "model": 'tribeca', "year": 2006},
-    {"make": 'subaru', "model": 'tribeca 3.6r limited', "year": 2013},
-    {"make": 'subaru', "model": 'tribeca limited', "year": 2008},
-    {"make": 'subaru', "model": 'wrx', "year": 2020},
-    {"make": 'subaru', "model": 'wrx', "year": 2019},
-    {"make": 'subaru', "model": 'wrx', "year": 2018},
-    {"make": 'subaru', "model": 'wrx', "year": 2017},
-    {"make": 'subaru', "model": 'wrx', "year": 2016},
-    {"make": 'subaru', "model": 'wrx', "year": 2015},
-    {"make": 'subaru', "model": 'wrx', "year": 2013},
-    {"make": 'subaru', "model": 'wrx', "year": 2011},
-    {"make": 'subaru', "model": 'wrx', "year": 2008},
-    {"make": 'subaru', "model": 'wrx', "year": 2006},
-    {"make": 'subaru', "model": 'wrx', "year": 2005},
-    {"make": 'subaru', "model": 'wrx limited', "year": 2018},
-    {"make": 'subaru', "model": 'wrx limited', "year": 2017},
-    {"make": 'subaru', "model": 'wrx limited', "year": 2016},
-    {"make": 'subaru', "model": 'wrx limited sedan 4d', "year": 2020},
-    {"make": 'subaru', "model": 'wrx limited sedan 4d', "year": 2019},
-    {"make": 'subaru', "model": 'wrx limited sedan 4d', "year": 2016},
-    {"make": 'subaru', "model": 'wrx premium', "year": 2017},
-    {"make": 'subaru', "model": 'wrx premium sedan 4d', "year": 2020},
-    {"make": 'subaru', "model": 'wrx premium sedan 4d', "year": 2019},
-    {"make": 'subaru', "model": 'wrx sedan 4d', "year": 2020},
-    {"make": 'subaru', "model": 'wrx sedan 4d', "year": 2019},
-    {"make": 'subaru', "model": 'wrx sedan 4d', "year": 2018},
-    {"make": 'subaru', "model": 'wrx sedan 4d', "year": 2017},
-    {"make": 'subaru', "model": 'wrx sti', "year": 2018},
-    {"make": 'subaru', "model": 'wrx sti', "year": 2017},
-    {"make": 'subaru', "model": 'wrx sti', "year": 2016},
-    {"make": 'subaru', "model": 'wrx sti', "year": 2015},
-    {"make": 'subaru', "model": 'wrx sti', "year": 2006},
-    {"make": 'subaru', "model": 'wrx sti sedan 4d', "year": 2020},
-    {"make": 'subaru', "model": 'wrx sti sedan 4d', "year": 2018},
-    {"make": 'subaru', "model": 'wrx sti sedan 4d', "year": 2016},
-    {"make": 'subaru', "model": 'xv crosstrek', "year": 2015},
-    {"make": 'subaru', "model": 'xv crosstrek', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek', "year": 2013},
-    {"make": 'subaru', "model": 'xv crosstrek 2.0i', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek 2.0i limited', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek 2.0i premium', "year": 2015},
-    {"make": 'subaru', "model": 'xv crosstrek 2.0i premium', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek 2.0i premium', "year": 2013},
-    {"make": 'subaru', "model": 'xv crosstrek awd limited', "year": 2013},
-    {"make": 'subaru', "model": 'xv crosstrek hybrid', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek limited', "year": 2015},
-    {"make": 'subaru', "model": 'xv crosstrek limited', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek premium', "year": 2014},
-    {"make": 'subaru', "model": 'xv crosstrek premium', "year": 2013},
-    {"make": 'toyota', "model": '4-runner', "year": 2017},
-    {"make": 'toyota', "model": '4-runner', "year": 2016},
-    {"make": 'toyota', "model": '4-runner', "year": 2014},
-    {"make": 'toyota', "model": '4-runner', "year": 2012},
-    {"make": 'toyota', "model": '4-runner', "year": 2011},
-    {"make": 'toyota', "model": '4-runner', "year": 2010},
-    {"make": 'toyota', "model": '4-runner', "year": 2009},
-    {"make": 'toyota', "model": '4-runner', "year": 2008},
-    {"make": 'toyota', "model": '4-runner', "year": 2005},
-    {"make": 'toyota', "model": '4runner', "year": 2020},
-    {"make": 'toyota', "model": '4runner', "year": 2019},
-    {"make": 'toyota', "model": '4runner', "year": 2018},
-    {"make": 'toyota', "model": '4runner', "year": 2017},
-    {"make": 'toyota', "model": '4runner', "year": 2016},
-    {"make": 'toyota', "model": '4runner', "year": 2015},
-    {"make": 'toyota', "model": '4runner', "year": 2014},
-    {"make": 'toyota', "model": '4runner', "year": 2013},
-    {"make": 'toyota', "model": '4runner', "year": 2012},
-    {"make": 'toyota', "model": '4runner', "year": 2011},
-    {"make": 'toyota', "model": '4runner', "year": 2010},
-    {"make": 'toyota', "model": '4runner', "year": 2008},
-    {"make": 'toyota', "model": '4runner', "year": 2007},
-    {"make": 'toyota', "model": '4runner', "year": 2006},
-    {"make": 'toyota', "model": '4runner', "year": 2005},
-    {"make": 'toyota', "model": '4runner 1-arizona owner*0-rust*new bilstein toytec lift*new 33"yokohama m/t*new black rhino wheels* 3rd seat*nav*black out pkg*0-accidents', "year": 2018},
-    {"make": 'toyota', "model": '4runner limited', "year": 2019},
-    {"make": 'toyota', "model": '4runner limited', "year": 2018},
-    {"make": 'toyota', "model": '4runner limited', "year": 2017},
-    {"make": 'toyota', "model": '4runner limited', "year": 2016},
-    {"make": 'toyota', "model": '4runner limited 1-califonia owner*highway miles*all services done @dealer since new w/records*no rust*moon roof*cooled seats*heated seats*limited*jbl sound system*tow pkg', "year": 2015},
-    {"make": 'toyota', "model": '4runner limited 4x4 gas', "year": 2021},
-    {"make": 'toyota', "model": '4runner limited sport', "year": 2020},
-    {"make": 'toyota', "model": '4runner limited sport', "year": 2019},
-    {"make": 'toyota', "model": '4runner limited sport', "year": 2018},
-    {"make": 'toyota', "model": '4runner limited sport', "year": 2016},
-    {"make": 'toyota', "model": '4runner limited sport', "year": 2015},
-    {"make": 'toyota', "model": '4runner limited sport', "year": 2014},
-    {"make": 'toyota', "model": '4runner sport edition 4dr suv 1-oregon owner*rust free* new bilstein lift*new 33"yokohama geolanders*new mk6 wheels*no accidents*tyger roof basket*all records since new', "year": 2007},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2017},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2012},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2011},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2008},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2007},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2006},
-    {"make": 'toyota', "model": '4runner sr5', "year": 2005},
-    {"make": 'toyota', "model": '4runner sr5 4x4', "year": 2016},
-    {"make": 'toyota', "model": '4runner sr5 4x4', "year": 2007},
-    {"make": 'toyota', "model": '4runner sr5 awd', "year": 2008},
-    {"make": 'toyota', "model": '4runner sr5 premium', "year": 2019},
-    {"make": 'toyota', "model": '4runner sr5 premium', "year": 2015},
-    {"make": 'toyota', "model": '4runner sr5 premium 25k in add ons and modifications * overland 4x4 ready* all keys*remote start* full icon lift set up* full gobi roof rack set up w/ tent* upgraded sound', "year": 2015},
-    {"make": 'toyota', "model": '4runner sr5 premium sport', "year": 2018},
-    {"make": 'toyota', "model": '4runner sr5 premium sport', "year": 2015},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2020},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2019},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2018},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2017},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2016},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2015},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2013},
-    {"make": 'toyota', "model": '4runner sr5 sport utility', "year": 2006},
-    {"make": 'toyota', "model": '4runner trd off road 4x4', "year": 2021},
-    {"make": 'toyota', "model": '4runner trd off-road pre', "year": 2018},
-    {"make": 'toyota', "model": '4runner trd off-road premium new bilstein-toytec lift*new 17"trd pro wheels*new 33" yokohama geolander goo3 m/t tires*tyger rock sliders*tyger roof basket*leather*nav*back up cam', "year": 2018},
-    {"make": 'toyota', "model": '4runner trd pro sport', "year": 2020},
-    {"make": 'toyota', "model": '4runner trd pro sport', "year": 2019},
-    {"make": 'toyota', "model": '86', "year": 2019},
-    {"make": 'toyota', "model": '86', "year": 2017},
-    {"make": 'toyota', "model": '86 trd special edition', "year": 2019},
-    {"make": 'toyota', "model": 'avalon', "year": 2019},
-    {"make": 'toyota', "model": 'avalon', "year": 2018},
-    {"make": 'toyota', "model": 'avalon', "year": 2017},
-    {"make": 'toyota', "model": 'avalon', "year": 2016},
-    {"make": 'toyota', "model": 'avalon', "year": 2015},
-    {"make": 'toyota', "model": 'avalon', "year": 2014},
-    {"make": 'toyota', "model": 'avalon', "year": 2013},
-    {"make": 'toyota', "model": 'avalon', "year": 2012},
-    {"make": 'toyota', "model": 'avalon', "year": 2011},
-    {"make": 'toyota', "model": 'avalon', "year": 2010},
-    {"make": 'toyota', "model": 'avalon', "year": 2009},
-    {"make": 'toyota', "model": 'avalon', "year": 2008},
-    {"make": 'toyota', "model": 'avalon', "year": 2007},
-    {"make": 'toyota', "model": 'avalon', "year": 2006},
-    {"make": 'toyota', "model": 'avalon', "year": 2005},
-    {"make": 'toyota', "model": 'avalon hybrid', "year": 2013},
-    {"make": 'toyota', "model": 'avalon hybrid limited', "year": 2017},
-    {"make": 'toyota', "model": 'avalon hybrid limited', "year": 2014},
-    {"make": 'toyota', "model": 'avalon hybrid xle plus', "year": 2018},
-    {"make": 'toyota', "model": 'avalon limited', "year": 2013},
-    {"make": 'toyota', "model": 'avalon limited', "year": 2011},
-    {"make": 'toyota', "model": 'avalon limited', "year": 2008},
-    {"make": 'toyota', "model": 'avalon limited', "year": 2007},
-    {"make": 'toyota', "model": 'avalon limited', "year": 2006},
-    {"make": 'toyota', "model": 'avalon limited', "year": 2005},
-    {"make": 'toyota', "model": 'avalon limited sedan 4d', "year": 2020},
-    {"make": 'toyota', "model": 'avalon limited sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'avalon limited sedan 4d', "year": 2016},
-    {"make": 'toyota', "model": 'avalon limited sedan 4d', "year": 2013},
-    {"make": 'toyota', "model": 'avalon limited w/ navigation / moon roof', "year": 2006},
-    {"make": 'toyota', "model": 'avalon xle premium sedan', "year": 2016},
-    {"make": 'toyota', "model": 'avalon xle touring sedan', "year": 2017},
-    {"make": 'toyota', "model": 'avalon xls', "year": 2007},
-    {"make": 'toyota', "model": 'avalon xls', "year": 2006},
-    {"make": 'toyota', "model": 'avalon xse sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'c-hr', "year": 2020},
-    {"make": 'toyota', "model": 'c-hr', "year": 2019},
-    {"make": 'toyota', "model": 'c-hr', "year": 2018},
-    {"make": 'toyota', "model": 'c-hr xle', "year": 2018},
-    {"make": 'toyota', "model": 'c-hr xle premium sport', "year": 2018},
-    {"make": 'toyota', "model": 'camry', "year": 2020},
-    {"make": 'toyota', "model": 'camry', "year": 2019},
-    {"make": 'toyota', "model": 'camry', "year": 2018},
-    {"make": 'toyota', "model": 'camry', "year": 2017},
-    {"make": 'toyota', "model": 'camry', "year": 2016},
-    {"make": 'toyota', "model": 'camry', "year": 2015},
-    {"make": 'toyota', "model": 'camry', "year": 2014},
-    {"make": 'toyota', "model": 'camry', "year": 2013},
-    {"make": 'toyota', "model": 'camry', "year": 2012},
-    {"make": 'toyota', "model": 'camry', "year": 2011},
-    {"make": 'toyota', "model": 'camry', "year": 2010},
-    {"make": 'toyota', "model": 'camry', "year": 2009},
-    {"make": 'toyota', "model": 'camry', "year": 2008},
-    {"make": 'toyota', "model": 'camry', "year": 2007},
-    {"make": 'toyota', "model": 'camry', "year": 2006},
-    {"make": 'toyota', "model": 'camry', "year": 2005},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2017},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2015},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2014},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2013},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2012},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2011},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2010},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2009},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2008},
-    {"make": 'toyota', "model": 'camry hybrid', "year": 2007},
-    {"make": 'toyota', "model": 'camry hybrid le sedan 4d', "year": 2020},
-    {"make": 'toyota', "model": 'camry hybrid le sedan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'camry hybrid se', "year": 2016},
-    {"make": 'toyota', "model": 'camry hybrid xle', "year": 2014},
-    {"make": 'toyota', "model": 'camry hybrid xle sedan 4d', "year": 2020},
-    {"make": 'toyota', "model": 'camry hybrid xle sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'camry hybrid xle sedan 4d', "year": 2014},
-    {"make": 'toyota', "model": 'camry l sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'camry le', "year": 2018},
-    {"make": 'toyota', "model": 'camry le', "year": 2017},
-    {"make": 'toyota', "model": 'camry le', "year": 2016},
-    {"make": 'toyota', "model": 'camry le', "year": 2015},
-    {"make": 'toyota', "model": 'camry le', "year": 2014},
-    {"make": 'toyota', "model": 'camry le', "year": 2013},
-    {"make": 'toyota', "model": 'camry le', "year": 2012},
-    {"make": 'toyota', "model": 'camry le', "year": 2011},
-    {"make": 'toyota', "model": 'camry le', "year": 2010},
-    {"make": 'toyota', "model": 'camry le', "year": 2009},
-    {"make": 'toyota', "model": 'camry le', "year": 2008},
-    {"make": 'toyota', "model": 'camry le', "year": 2007},
-    {"make": 'toyota', "model": 'camry le', "year": 2006},
-    {"make": 'toyota', "model": 'camry le', "year": 2005},
-    {"make": 'toyota', "model": 'camry le 4dr sedan', "year": 2012},
-    {"make": 'toyota', "model": 'camry le 4dr sedan', "year": 2005},
-    {"make": 'toyota', "model": 'camry le sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'camry le sedan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'camry le sedan 4d', "year": 2017},
-    {"make": 'toyota', "model": 'camry le sedan 4d', "year": 2015},
-    {"make": 'toyota', "model": 'camry le sedan 4d', "year": 2013},
-    {"make": 'toyota', "model": 'camry le sedan 4d', "year": 2012},
-    {"make": 'toyota', "model": 'camry le w/ navigation system', "year": 2018},
-    {"make": 'toyota', "model": 'camry lesedan', "year": 2016},
-    {"make": 'toyota', "model": 'camry se', "year": 2020},
-    {"make": 'toyota', "model": 'camry se', "year": 2019},
-    {"make": 'toyota', "model": 'camry se', "year": 2018},
-    {"make": 'toyota', "model": 'camry se', "year": 2017},
-    {"make": 'toyota', "model": 'camry se', "year": 2016},
-    {"make": 'toyota', "model": 'camry se', "year": 2015},
-    {"make": 'toyota', "model": 'camry se', "year": 2014},
-    {"make": 'toyota', "model": 'camry se', "year": 2013},
-    {"make": 'toyota', "model": 'camry se', "year": 2012},
-    {"make": 'toyota', "model": 'camry se', "year": 2011},
-    {"make": 'toyota', "model": 'camry se', "year": 2010},
-    {"make": 'toyota', "model": 'camry se', "year": 2009},
-    {"make": 'toyota', "model": 'camry se', "year": 2007},
-    {"make": 'toyota', "model": 'camry se', "year": 2005},
-    {"make": 'toyota', "model": 'camry se 4dr sedan', "year": 2017},
-    {"make": 'toyota', "model": 'camry se 4dr sedan', "year": 2014},
-    {"make": 'toyota', "model": 'camry se 4dr sedan', "year": 2012},
-    {"make": 'toyota', "model": 'camry se auto (natl)', "year": 2017},
-    {"make": 'toyota', "model": 'camry se sedan 4d', "year": 2017},
-    {"make": 'toyota', "model": 'camry se sedan 4d', "year": 2016},
-    {"make": 'toyota', "model": 'camry se sedan 4d', "year": 2015},
-    {"make": 'toyota', "model": 'camry solara', "year": 2008},
-    {"make": 'toyota', "model": 'camry solara', "year": 2007},
-    {"make": 'toyota', "model": 'camry solara', "year": 2006},
-    {"make": 'toyota', "model": 'camry solara', "year": 2005},
-    {"make": 'toyota', "model": 'camry solara convertible', "year": 2006},
-    {"make": 'toyota', "model": 'camry solara convertible', "year": 2005},
-    {"make": 'toyota', "model": 'camry xle', "year": 2014},
-    {"make": 'toyota', "model": 'camry xle', "year": 2013},
-    {"make": 'toyota', "model": 'camry xle', "year": 2012},
-    {"make": 'toyota', "model": 'camry xle', "year": 2011},
-    {"make": 'toyota', "model": 'camry xle', "year": 2010},
-    {"make": 'toyota', "model": 'camry xle', "year": 2009},
-    {"make": 'toyota', "model": 'camry xle', "year": 2008},
-    {"make": 'toyota', "model": 'camry xle', "year": 2007},
-    {"make": 'toyota', "model": 'camry xle', "year": 2005},
-    {"make": 'toyota', "model": 'camry xle sedan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'camry xle v6', "year": 2006},
-    {"make": 'toyota', "model": 'camry xse', "year": 2017},
-    {"make": 'toyota', "model": 'camry xse sedan 4d', "year": 2017},
-    {"make": 'toyota', "model": 'camry xse sedan 4d', "year": 2016},
-    {"make": 'toyota', "model": 'corolla', "year": 2021},
-    {"make": 'toyota', "model": 'corolla', "year": 2020},
-    {"make": 'toyota', "model": 'corolla', "year": 2019},
-    {"make": 'toyota', "model": 'corolla', "year": 2018},
-    {"make": 'toyota', "model": 'corolla', "year": 2017},
-    {"make": 'toyota', "model": 'corolla', "year": 2016},
-    {"make": 'toyota', "model": 'corolla', "year": 2015},
-    {"make": 'toyota', "model": 'corolla', "year": 2014},
-    {"make": 'toyota', "model": 'corolla', "year": 2013},
-    {"make": 'toyota', "model": 'corolla', "year": 2012},
-    {"make": 'toyota', "model": 'corolla', "year": 2011},
-    {"make": 'toyota', "model": 'corolla', "year": 2010},
-    {"make": 'toyota', "model": 'corolla', "year": 2009},
-    {"make": 'toyota', "model": 'corolla', "year": 2008},
-    {"make": 'toyota', "model": 'corolla', "year": 2007},
-    {"make": 'toyota', "model": 'corolla', "year": 2006},
-    {"make": 'toyota', "model": 'corolla', "year": 2005},
-    {"make": 'toyota', "model": 'corolla ce', "year": 2008},
-    {"make": 'toyota', "model": 'corolla ce', "year": 2007},
-    {"make": 'toyota', "model": 'corolla ce', "year": 2006},
-    {"make": 'toyota', "model": 'corolla ce', "year": 2005},
-    {"make": 'toyota', "model": 'corolla hatchback', "year": 2019},
-    {"make": 'toyota', "model": 'corolla hatchback se 4d', "year": 2019},
-    {"make": 'toyota', "model": 'corolla hatchback xse 4d', "year": 2020},
-    {"make": 'toyota', "model": 'corolla im', "year": 2018},
-    {"make": 'toyota', "model": 'corolla im', "year": 2017},
-    {"make": 'toyota', "model": 'corolla im hatchback 4d', "year": 2018},
-    {"make": 'toyota', "model": 'corolla im hatchback 4d', "year": 2017},
-    {"make": 'toyota', "model": 'corolla l', "year": 2016},
-    {"make": 'toyota', "model": 'corolla l sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'corolla l sedan 4d', "year": 2015},
-    {"make": 'toyota', "model": 'corolla le', "year": 2020},
-    {"make": 'toyota', "model": 'corolla le', "year": 2019},
-    {"make": 'toyota', "model": 'corolla le', "year": 2018},
-    {"make": 'toyota', "model": 'corolla le', "year": 2017},
-    {"make": 'toyota', "model": 'corolla le', "year": 2016},
-    {"make": 'toyota', "model": 'corolla le', "year": 2015},
-    {"make": 'toyota', "model": 'corolla le', "year": 2014},
-    {"make": 'toyota', "model": 'corolla le', "year": 2013},
-    {"make": 'toyota', "model": 'corolla le', "year": 2012},
-    {"make": 'toyota', "model": 'corolla le', "year": 2011},
-    {"make": 'toyota', "model": 'corolla le', "year": 2010},
-    {"make": 'toyota', "model": 'corolla le', "year": 2009},
-    {"make": 'toyota', "model": 'corolla le', "year": 2008},
-    {"make": 'toyota', "model": 'corolla le', "year": 2007},
-    {"make": 'toyota', "model": 'corolla le', "year": 2006},
-    {"make": 'toyota', "model": 'corolla le', "year": 2005},
-    {"make": 'toyota', "model": 'corolla le 4dr sedan 4a', "year": 2012},
-    {"make": 'toyota', "model": 'corolla le cvt (natl)', "year": 2020},
-    {"make": 'toyota', "model": 'corolla le cvt (natl)', "year": 2019},
-    {"make": 'toyota', "model": 'corolla le eco sedan 4d', "year": 2017},
-    {"make": 'toyota', "model": 'corolla le eco sedan 4d', "year": 2015},
-    {"make": 'toyota', "model": 'corolla le premium sedan', "year": 2016},
-    {"make": 'toyota', "model": 'corolla le sedan 4d', "year": 2020},
-    {"make": 'toyota', "model": 'corolla le sedan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'corolla le sedan 4d', "year": 2016},
-    {"make": 'toyota', "model": 'corolla lsedan 4a', "year": 2016},
-    {"make": 'toyota', "model": 'corolla lsedan 4a', "year": 2014},
-    {"make": 'toyota', "model": 'corolla matrix', "year": 2009},
-    {"make": 'toyota', "model": 'corolla matrix', "year": 2007},
-    {"make": 'toyota', "model": 'corolla s', "year": 2016},
-    {"make": 'toyota', "model": 'corolla s', "year": 2015},
-    {"make": 'toyota', "model": 'corolla s', "year": 2014},
-    {"make": 'toyota', "model": 'corolla s', "year": 2013},
-    {"make": 'toyota', "model": 'corolla s', "year": 2012},
-    {"make": 'toyota', "model": 'corolla s', "year": 2011},
-    {"make": 'toyota', "model": 'corolla s', "year": 2010},
-    {"make": 'toyota', "model": 'corolla s', "year": 2009},
-    {"make": 'toyota', "model": 'corolla s', "year": 2007},
-    {"make": 'toyota', "model": 'corolla s', "year": 2006},
-    {"make": 'toyota', "model": 'corolla s', "year": 2005},
-    {"make": 'toyota', "model": 'corolla s sedan 4d', "year": 2015},
-    {"make": 'toyota', "model": 'corolla se', "year": 2017},
-    {"make": 'toyota', "model": 'corolla xrs', "year": 2009},
-    {"make": 'toyota', "model": 'electric rav4 prime xse awd', "year": 2021},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2014},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2013},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2012},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2011},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2010},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2008},
-    {"make": 'toyota', "model": 'fj cruiser', "year": 2007},
-    {"make": 'toyota', "model": 'fj cruiser 4wd', "year": 2007},
-    {"make": 'toyota', "model": 'fj cruiser 4x4', "year": 2014},
-    {"make": 'toyota', "model": 'fj cruiser 4x4', "year": 2008},
-    {"make": 'toyota', "model": 'fj cruiser 4x4', "year": 2007},
-    {"make": 'toyota', "model": 'fj cruiser 4x4 gas suv', "year": 2013},
-    {"make": 'toyota', "model": 'fj cruiser 4x4 gas suv', "year": 2010},
-    {"make": 'toyota', "model": 'fj cruiser base', "year": 2007},
-    {"make": 'toyota', "model": 'fj cruiser sport utility', "year": 2014},
-    {"make": 'toyota', "model": 'fj cruiser sport utility', "year": 2012},
-    {"make": 'toyota', "model": 'fj cruiser upgrade pkg 2*convenience pkg*preferred premium accessory pkg*roof rack*rear lockers*rust free*level lifted*black out pkg', "year": 2010},
-    {"make": 'toyota', "model": 'gr supra', "year": 2020},
-    {"make": 'toyota', "model": 'highlander', "year": 2019},
-    {"make": 'toyota', "model": 'highlander', "year": 2018},
-    {"make": 'toyota', "model": 'highlander', "year": 2017},
-    {"make": 'toyota', "model": 'highlander', "year": 2016},
-    {"make": 'toyota', "model": 'highlander', "year": 2015},
-    {"make": 'toyota', "model": 'highlander', "year": 2014},
-    {"make": 'toyota', "model": 'highlander', "year": 2013},
-    {"make": 'toyota', "model": 'highlander', "year": 2012},
-    {"make": 'toyota', "model": 'highlander', "year": 2011},
-    {"make": 'toyota', "model": 'highlander', "year": 2010},
-    {"make": 'toyota', "model": 'highlander', "year": 2009},
-    {"make": 'toyota', "model": 'highlander', "year": 2008},
-    {"make": 'toyota', "model": 'highlander', "year": 2007},
-    {"make": 'toyota', "model": 'highlander', "year": 2006},
-    {"make": 'toyota', "model": 'highlander', "year": 2005},
-    {"make": 'toyota', "model": 'highlander base', "year": 2011},
-    {"make": 'toyota', "model": 'highlander hybrid', "year": 2012},
-    {"make": 'toyota', "model": 'highlander hybrid', "year": 2008},
-    {"make": 'toyota', "model": 'highlander hybrid', "year": 2007},
-    {"make": 'toyota', "model": 'highlander hybrid', "year": 2006},
-    {"make": 'toyota', "model": 'highlander hybrid le', "year": 2020},
-    {"make": 'toyota', "model": 'highlander hybrid limited', "year": 2006},
-    {"make": 'toyota', "model": 'highlander le sport', "year": 2019},
-    {"make": 'toyota', "model": 'highlander le sport', "year": 2018},
-    {"make": 'toyota', "model": 'highlander le sport', "year": 2017},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2016},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2015},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2012},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2010},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2009},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2008},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2006},
-    {"make": 'toyota', "model": 'highlander limited', "year": 2005},
-    {"make": 'toyota', "model": 'highlander limited awd', "year": 2006},
-    {"make": 'toyota', "model": 'highlander plus', "year": 2013},
-    {"make": 'toyota', "model": 'highlander sport', "year": 2010},
-    {"make": 'toyota', "model": 'highlander sport', "year": 2008},
-    {"make": 'toyota', "model": 'highlander sport', "year": 2007},
-    {"make": 'toyota', "model": 'highlander xle', "year": 2017},
-    {"make": 'toyota', "model": 'highlander xle', "year": 2016},
-    {"make": 'toyota', "model": 'highlander xle', "year": 2015},
-    {"make": 'toyota', "model": 'highlander xle sport', "year": 2018},
-    {"make": 'toyota', "model": 'land cruiser', "year": 2018},
-    {"make": 'toyota', "model": 'land cruiser 1-owner*full custom build*never off road*new lift*new 33" yokohama x-ats*new 18" black rhino wheels*center council cooler*360 camera*chrome delete', "year": 2018},
-    {"make": 'toyota', "model": 'lifted tundra sr5 4x4 gas', "year": 2017},
-    {"make": 'toyota', "model": 'lifted tundra sr5 4x4 gas', "year": 2016},
-    {"make": 'toyota', "model": 'lifted tundra sr5 trd off', "year": 2019},
-    {"make": 'toyota', "model": 'matrix', "year": 2010},
-    {"make": 'toyota', "model": 'matrix', "year": 2009},
-    {"make": 'toyota', "model": 'matrix', "year": 2007},
-    {"make": 'toyota', "model": 'matrix', "year": 2006},
-    {"make": 'toyota', "model": 'matrix', "year": 2005},
-    {"make": 'toyota', "model": 'matrix s', "year": 2009},
-    {"make": 'toyota', "model": 'matrix xr', "year": 2008},
-    {"make": 'toyota', "model": 'matrix xr', "year": 2007},
-    {"make": 'toyota', "model": 'matrix xr', "year": 2006},
-    {"make": 'toyota', "model": 'matrix xr', "year": 2005},
-    {"make": 'toyota', "model": 'mr2', "year": 2005},
-    {"make": 'toyota', "model": 'prius', "year": 2019},
-    {"make": 'toyota', "model": 'prius', "year": 2018},
-    {"make": 'toyota', "model": 'prius', "year": 2017},
-    {"make": 'toyota', "model": 'prius', "year": 2016},
-    {"make": 'toyota', "model": 'prius', "year": 2015},
-    {"make": 'toyota', "model": 'prius', "year": 2014},
-    {"make": 'toyota', "model": 'prius', "year": 2013},
-    {"make": 'toyota', "model": 'prius', "year": 2012},
-    {"make": 'toyota', "model": 'prius', "year": 2011},
-    {"make": 'toyota', "model": 'prius', "year": 2010},
-    {"make": 'toyota', "model": 'prius', "year": 2009},
-    {"make": 'toyota', "model": 'prius', "year": 2008},
-    {"make": 'toyota', "model": 'prius', "year": 2007},
-    {"make": 'toyota', "model": 'prius', "year": 2006},
-    {"make": 'toyota', "model": 'prius', "year": 2005},
-    {"make": 'toyota', "model": 'prius bad credit', "year": 2018},
-    {"make": 'toyota', "model": 'prius c', "year": 2018},
-    {"make": 'toyota', "model": 'prius c', "year": 2016},
-    {"make": 'toyota', "model": 'prius c', "year": 2015},
-    {"make": 'toyota', "model": 'prius c', "year": 2014},
-    {"make": 'toyota', "model": 'prius c', "year": 2013},
-    {"make": 'toyota', "model": 'prius c', "year": 2012},
-    {"make": 'toyota', "model": 'prius c four hatchback 4d', "year": 2016},
-    {"make": 'toyota', "model": 'prius c four hatchback 4d', "year": 2014},
-    {"make": 'toyota', "model": 'prius c fourhatchback', "year": 2013},
-    {"make": 'toyota', "model": 'prius five', "year": 2013},
-    {"make": 'toyota', "model": 'prius four', "year": 2013},
-    {"make": 'toyota', "model": 'prius four hatchback 4d', "year": 2017},
-    {"make": 'toyota', "model": 'prius four hatchback 4d', "year": 2014},
-    {"make": 'toyota', "model": 'prius four touring', "year": 2018},
-    {"make": 'toyota', "model": 'prius four touring', "year": 2017},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2015},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2014},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2013},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2012},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2011},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2010},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2009},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2008},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2007},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2006},
-    {"make": 'toyota', "model": 'prius hybrid', "year": 2005},
-    {"make": 'toyota', "model": 'prius hybrid hatchback', "year": 2010},
-    {"make": 'toyota', "model": 'prius ii', "year": 2010},
-    {"make": 'toyota', "model": 'prius ii hatchback 4d', "year": 2010},
-    {"make": 'toyota', "model": 'prius iii', "year": 2010},
-    {"make": 'toyota', "model": 'prius iv', "year": 2015},
-    {"make": 'toyota', "model": 'prius iv', "year": 2010},
-    {"make": 'toyota', "model": 'prius plug-in', "year": 2014},
-    {"make": 'toyota', "model": 'prius plug-in hybrid', "year": 2015},
-    {"make": 'toyota', "model": 'prius plug-in hybrid', "year": 2014},
-    {"make": 'toyota', "model": 'prius plug-in hybrid', "year": 2013},
-    {"make": 'toyota', "model": 'prius prime', "year": 2018},
-    {"make": 'toyota', "model": 'prius prime', "year": 2017},
-    {"make": 'toyota', "model": 'prius prime plus', "year": 2019},
-    {"make": 'toyota', "model": 'prius prime premium', "year": 2017},
-    {"make": 'toyota', "model": 'prius standard', "year": 2008},
-    {"make": 'toyota', "model": 'prius three', "year": 2015},
-    {"make": 'toyota', "model": 'prius three', "year": 2014},
-    {"make": 'toyota', "model": 'prius three', "year": 2012},
-    {"make": 'toyota', "model": 'prius three touring', "year": 2016},
-    {"make": 'toyota', "model": 'prius touring', "year": 2009},
-    {"make": 'toyota', "model": 'prius touring', "year": 2008},
-    {"make": 'toyota', "model": 'prius touring', "year": 2007},
-    {"make": 'toyota', "model": 'prius two', "year": 2016},
-    {"make": 'toyota', "model": 'prius two', "year": 2015},
-    {"make": 'toyota', "model": 'prius two', "year": 2013},
-    {"make": 'toyota', "model": 'prius two', "year": 2012},
-    {"make": 'toyota', "model": 'prius two', "year": 2011},
-    {"make": 'toyota', "model": 'prius two hatchback 4d', "year": 2018},
-    {"make": 'toyota', "model": 'prius two hatchback 4d', "year": 2017},
-    {"make": 'toyota', "model": 'prius two hatchback 4d', "year": 2015},
-    {"make": 'toyota', "model": 'prius two hatchback 4d', "year": 2014},
-    {"make": 'toyota', "model": 'prius two hatchback 4d', "year": 2013},
-    {"make": 'toyota', "model": 'prius v', "year": 2017},
-    {"make": 'toyota', "model": 'prius v', "year": 2016},
-    {"make": 'toyota', "model": 'prius v', "year": 2014},
-    {"make": 'toyota', "model": 'prius v', "year": 2013},
-    {"make": 'toyota', "model": 'prius v', "year": 2012},
-    {"make": 'toyota', "model": 'prius v', "year": 2010},
-    {"make": 'toyota', "model": 'prius v three wagon 4d', "year": 2015},
-    {"make": 'toyota', "model": 'prius v two wagon 4d', "year": 2016},
-    {"make": 'toyota', "model": 'rav 4', "year": 2010},
-    {"make": 'toyota', "model": 'rav 4', "year": 2009},
-    {"make": 'toyota', "model": 'rav 4 le', "year": 2017},
-    {"make": 'toyota', "model": 'rav4', "year": 2020},
-    {"make": 'toyota', "model": 'rav4', "year": 2019},
-    {"make": 'toyota', "model": 'rav4', "year": 2018},
-    {"make": 'toyota', "model": 'rav4', "year": 2017},
-    {"make": 'toyota', "model": 'rav4', "year": 2016},
-    {"make": 'toyota', "model": 'rav4', "year": 2015},
-    {"make": 'toyota', "model": 'rav4', "year": 2014},
-    {"make": 'toyota', "model": 'rav4', "year": 2013},
-    {"make": 'toyota', "model": 'rav4', "year": 2012},
-    {"make": 'toyota', "model": 'rav4', "year": 2011},
-    {"make": 'toyota', "model": 'rav4', "year": 2010},
-    {"make": 'toyota', "model": 'rav4', "year": 2009},
-    {"make": 'toyota', "model": 'rav4', "year": 2008},
-    {"make": 'toyota', "model": 'rav4', "year": 2007},
-    {"make": 'toyota', "model": 'rav4', "year": 2006},
-    {"make": 'toyota', "model": 'rav4', "year": 2005},
-    {"make": 'toyota', "model": 'rav4 - rear camera - bluetooth - good on gas -', "year": 2015},
-    {"make": 'toyota', "model": 'rav4 adventure awd', "year": 2019},
-    {"make": 'toyota', "model": 'rav4 adventure sport', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 awd', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 awd', "year": 2015},
-    {"make": 'toyota', "model": 'rav4 awd', "year": 2011},
-    {"make": 'toyota', "model": 'rav4 awd', "year": 2010},
-    {"make": 'toyota', "model": 'rav4 awd', "year": 2009},
-    {"make": 'toyota', "model": 'rav4 awd', "year": 2008},
-    {"make": 'toyota', "model": 'rav4 ev sport utility 4d', "year": 2014},
-    {"make": 'toyota', "model": 'rav4 ev sport utility 4d', "year": 2012},
-    {"make": 'toyota', "model": 'rav4 hybrid', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 hybrid', "year": 2017},
-    {"make": 'toyota', "model": 'rav4 hybrid', "year": 2016},
-    {"make": 'toyota', "model": 'rav4 hybrid le sport', "year": 2020},
-    {"make": 'toyota', "model": 'rav4 hybrid le sport', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 hybrid limited sport', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 hybrid limited sport', "year": 2017},
-    {"make": 'toyota', "model": 'rav4 hybrid xle', "year": 2016},
-    {"make": 'toyota', "model": 'rav4 hybrid xle sport', "year": 2020},
-    {"make": 'toyota', "model": 'rav4 hybrid xse', "year": 2020},
-    {"make": 'toyota', "model": 'rav4 hybrid xse sport', "year": 2019},
-    {"make": 'toyota', "model": 'rav4 le', "year": 2019},
-    {"make": 'toyota', "model": 'rav4 le', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 le', "year": 2015},
-    {"make": 'toyota', "model": 'rav4 le', "year": 2014},
-    {"make": 'toyota', "model": 'rav4 le', "year": 2013},
-    {"make": 'toyota', "model": 'rav4 le awd gas suv auto', "year": 2017},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2015},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2013},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2012},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2010},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2009},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2008},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2007},
-    {"make": 'toyota', "model": 'rav4 limited', "year": 2006},
-    {"make": 'toyota', "model": 'rav4 limited v6', "year": 2012},
-    {"make": 'toyota', "model": 'rav4 sport', "year": 2012},
-    {"make": 'toyota', "model": 'rav4 sport', "year": 2008},
-    {"make": 'toyota', "model": 'rav4 xle', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 xle', "year": 2017},
-    {"make": 'toyota', "model": 'rav4 xle', "year": 2016},
-    {"make": 'toyota', "model": 'rav4 xle', "year": 2015},
-    {"make": 'toyota', "model": 'rav4 xle', "year": 2014},
-    {"make": 'toyota', "model": 'rav4 xle', "year": 2013},
-    {"make": 'toyota', "model": 'rav4 xle awd', "year": 2015},
-    {"make": 'toyota', "model": 'rav4 xle premium sport', "year": 2020},
-    {"make": 'toyota', "model": 'rav4 xle sport utility 4d', "year": 2018},
-    {"make": 'toyota', "model": 'rav4 xle sport utility 4d', "year": 2015},
-    {"make": 'toyota', "model": 'scion fr-s', "year": 2013},
-    {"make": 'toyota', "model": 'scion iq', "year": 2012},
-    {"make": 'toyota', "model": 'scion tc', "year": 2014},
-    {"make": 'toyota', "model": 'scion tc', "year": 2012},
-    {"make": 'toyota', "model": 'scion tc', "year": 2010},
-    {"make": 'toyota', "model": 'scion tc', "year": 2009},
-    {"make": 'toyota', "model": 'scion tc', "year": 2008},
-    {"make": 'toyota', "model": 'scion tc', "year": 2007},
-    {"make": 'toyota', "model": 'scion tc', "year": 2006},
-    {"make": 'toyota', "model": 'scion tc', "year": 2005},
-    {"make": 'toyota', "model": 'scion xa', "year": 2006},
-    {"make": 'toyota', "model": 'scion xa', "year": 2005},
-    {"make": 'toyota', "model": 'scion xb', "year": 2012},
-    {"make": 'toyota', "model": 'scion xb', "year": 2011},
-    {"make": 'toyota', "model": 'scion xb', "year": 2010},
-    {"make": 'toyota', "model": 'scion xb', "year": 2009},
-    {"make": 'toyota', "model": 'scion xb', "year": 2008},
-    {"make": 'toyota', "model": 'scion xb', "year": 2006},
-    {"make": 'toyota', "model": 'scion xb', "year": 2005},
-    {"make": 'toyota', "model": 'scion xd', "year": 2008},
-    {"make": 'toyota', "model": 'sequoia', "year": 2017},
-    {"make": 'toyota', "model": 'sequoia', "year": 2016},
-    {"make": 'toyota', "model": 'sequoia', "year": 2015},
-    {"make": 'toyota', "model": 'sequoia', "year": 2013},
-    {"make": 'toyota', "model": 'sequoia', "year": 2012},
-    {"make": 'toyota', "model": 'sequoia', "year": 2011},
-    {"make": 'toyota', "model": 'sequoia', "year": 2010},
-    {"make": 'toyota', "model": 'sequoia', "year": 2008},
-    {"make": 'toyota', "model": 'sequoia', "year": 2007},
-    {"make": 'toyota', "model": 'sequoia', "year": 2006},
-    {"make": 'toyota', "model": 'sequoia', "year": 2005},
-    {"make": 'toyota', "model": 'sequoia limited', "year": 2017},
-    {"make": 'toyota', "model": 'sequoia limited', "year": 2008},
-    {"make": 'toyota', "model": 'sequoia limited', "year": 2007},
-    {"make": 'toyota', "model": 'sequoia limited', "year": 2005},
-    {"make": 'toyota', "model": 'sequoia limited local oregon rust free* new bilstein lift*new 35" mastercraft tires* new oem trd wheels* new tiger xl basket* chrome delete pkg* color matched door handles and grill', "year": 2010},
-    {"make": 'toyota', "model": 'sequoia platinum sport', "year": 2015},
-    {"make": 'toyota', "model": 'sequoia sr5', "year": 2008},
-    {"make": 'toyota', "model": 'sequoia sr5', "year": 2007},
-    {"make": 'toyota', "model": 'sequoia sr5', "year": 2006},
-    {"make": 'toyota', "model": 'sequoia sr5', "year": 2005},
-    {"make": 'toyota', "model": 'sequoia sr5 platinum', "year": 2010},
-    {"make": 'toyota', "model": 'sequoia sr5 sport utility', "year": 2015},
-    {"make": 'toyota', "model": 'sequoia sr5 trd build out*1-owner*full new build*bilstein lift*35"master craft mxt tires*new 18"black rhino wheels*chrome delete pkg*custom painted 2-tone bumpers*8-pass seating*', "year": 2018},
-    {"make": 'toyota', "model": 'sienna', "year": 2020},
-    {"make": 'toyota', "model": 'sienna', "year": 2019},
-    {"make": 'toyota', "model": 'sienna', "year": 2018},
-    {"make": 'toyota', "model": 'sienna', "year": 2017},
-    {"make": 'toyota', "model": 'sienna', "year": 2016},
-    {"make": 'toyota', "model": 'sienna', "year": 2015},
-    {"make": 'toyota', "model": 'sienna', "year": 2014},
-    {"make": 'toyota', "model": 'sienna', "year": 2013},
-    {"make": 'toyota', "model": 'sienna', "year": 2012},
-    {"make": 'toyota', "model": 'sienna', "year": 2011},
-    {"make": 'toyota', "model": 'sienna', "year": 2010},
-    {"make": 'toyota', "model": 'sienna', "year": 2009},
-    {"make": 'toyota', "model": 'sienna', "year": 2008},
-    {"make": 'toyota', "model": 'sienna', "year": 2007},
-    {"make": 'toyota', "model": 'sienna', "year": 2006},
-    {"make": 'toyota', "model": 'sienna', "year": 2005},
-    {"make": 'toyota', "model": 'sienna l minivan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'sienna le', "year": 2020},
-    {"make": 'toyota', "model": 'sienna le', "year": 2017},
-    {"make": 'toyota', "model": 'sienna le', "year": 2014},
-    {"make": 'toyota', "model": 'sienna le', "year": 2012},
-    {"make": 'toyota', "model": 'sienna le', "year": 2011},
-    {"make": 'toyota', "model": 'sienna le', "year": 2010},
-    {"make": 'toyota', "model": 'sienna le', "year": 2009},
-    {"make": 'toyota', "model": 'sienna le', "year": 2008},
-    {"make": 'toyota', "model": 'sienna le', "year": 2007},
-    {"make": 'toyota', "model": 'sienna le', "year": 2006},
-    {"make": 'toyota', "model": 'sienna le', "year": 2005},
-    {"make": 'toyota', "model": 'sienna le 8 passenger', "year": 2017},
-    {"make": 'toyota', "model": 'sienna le fwd 8-passenger (natl)', "year": 2019},
-    {"make": 'toyota', "model": 'sienna le minivan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'sienna limited', "year": 2013},
-    {"make": 'toyota', "model": 'sienna limited', "year": 2005},
-    {"make": 'toyota', "model": 'sienna se minivan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'sienna se premium minivan', "year": 2017},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2020},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2019},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2018},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2017},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2016},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2014},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2013},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2011},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2010},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2008},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2007},
-    {"make": 'toyota', "model": 'sienna xle', "year": 2005},
-    {"make": 'toyota', "model": 'sienna xle awd', "year": 2005},
-    {"make": 'toyota', "model": 'sienna xle limited', "year": 2005},
-    {"make": 'toyota', "model": 'sienna xle minivan 4d', "year": 2020},
-    {"make": 'toyota', "model": 'sienna xle ny', "year": 2020},
-    {"make": 'toyota', "model": 'sienna xle premium', "year": 2020},
-    {"make": 'toyota', "model": 'sienna xle-nav', "year": 2018},
-    {"make": 'toyota', "model": 'solara', "year": 2007},
-    {"make": 'toyota', "model": 'solara', "year": 2006},
-    {"make": 'toyota', "model": 'solara', "year": 2005},
-    {"make": 'toyota', "model": 'solara sle convertible', "year": 2007},
-    {"make": 'toyota', "model": 'tacoma', "year": 2021},
-    {"make": 'toyota', "model": 'tacoma', "year": 2020},
-    {"make": 'toyota', "model": 'tacoma', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma', "year": 2016},
-    {"make": 'toyota', "model": 'tacoma', "year": 2015},
-    {"make": 'toyota', "model": 'tacoma', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma', "year": 2010},
-    {"make": 'toyota', "model": 'tacoma', "year": 2009},
-    {"make": 'toyota', "model": 'tacoma', "year": 2008},
-    {"make": 'toyota', "model": 'tacoma', "year": 2007},
-    {"make": 'toyota', "model": 'tacoma', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma', "year": 2005},
-    {"make": 'toyota', "model": 'tacoma 2wd', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma 4wd', "year": 2021},
-    {"make": 'toyota', "model": 'tacoma 4wd', "year": 2020},
-    {"make": 'toyota', "model": 'tacoma 4wd', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2010},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma 4x4', "year": 2005},
-    {"make": 'toyota', "model": 'tacoma 4x4 v6', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma access cab', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma access cab', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma access cab', "year": 2008},
-    {"make": 'toyota', "model": 'tacoma access cab', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma access cab 4wd sr5', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma access cab pickup', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma access cab pickup', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma access cab pickup', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma access cab pickup', "year": 2010},
-    {"make": 'toyota', "model": 'tacoma access cab sr', "year": 2020},
-    {"make": 'toyota', "model": 'tacoma access cab sr', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma access cab sr', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma access cab sr', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma access cab sr5', "year": 2020},
-    {"make": 'toyota', "model": 'tacoma access cab sr5', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma access cab sr5', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma access cab sr5', "year": 2016},
-    {"make": 'toyota', "model": 'tacoma access cab trd', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma access cab trd pro', "year": 2015},
-    {"make": 'toyota', "model": 'tacoma crew cab', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma crew cab short bo', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2015},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2010},
-    {"make": 'toyota', "model": 'tacoma double cab', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma double cab 4wd v6', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma double cab long bed v6 auto 4wd 48k miles', "year": 2007},
-    {"make": 'toyota', "model": 'tacoma double cab pickup', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma double cab pickup', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma double cab sr5', "year": 2020},
-    {"make": 'toyota', "model": 'tacoma double cab sr5', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma double cab sr5', "year": 2016},
-    {"make": 'toyota', "model": 'tacoma double cab trd', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma double cab trd', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma double cab trd', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma double cab trd sport 4wd', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma lifted trd sport', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma limited 4x4 gas', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma pre-runner sr5 4x2', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma prerunner', "year": 2015},
-    {"make": 'toyota', "model": 'tacoma prerunner', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma prerunner', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma prerunner', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma prerunner', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma prerunner', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma prerunner 4x2', "year": 2006},
-    {"make": 'toyota', "model": 'tacoma prerunner rwd gas', "year": 2013},
-    {"make": 'toyota', "model": 'tacoma prerunner v6', "year": 2009},
-    {"make": 'toyota', "model": 'tacoma sr 4x4 quarter ton', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma sr access cab 4x2', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma sr5', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma sr5', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma sr5', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma sr5 4x4 1/4 ton', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma sr5 4x4 1/4 ton', "year": 2007},
-    {"make": 'toyota', "model": 'tacoma sr5 rwd 1/4 ton', "year": 2016},
-    {"make": 'toyota', "model": 'tacoma trd', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma trd off road', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma trd off road', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma trd off road', "year": 2015},
-    {"make": 'toyota', "model": 'tacoma trd off road 4x4', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma trd off road 4x4', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma trd off road 4x4', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma trd off-road', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma trd off-road full ads coil over adjustable resivoirs kit* koning ultra light 17"wheels*bfg ko2 tires*trd off road*camburg upper control arms*trd pro grill & roof rack*nav*tech pkg*', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma trd prerunner', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma trd pro', "year": 2020},
-    {"make": 'toyota', "model": 'tacoma trd pro 4x4 gas', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma trd sport', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma trd sport', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma trd sport', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma trd sport', "year": 2016},
-    {"make": 'toyota', "model": 'tacoma trd sport 4x4', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma trd sport 4x4 gas', "year": 2018},
-    {"make": 'toyota', "model": 'tacoma trd sport 4x4 gas', "year": 2017},
-    {"make": 'toyota', "model": 'tacoma trd sport 4x4 gas', "year": 2014},
-    {"make": 'toyota', "model": 'tacoma trd sport rwd gas', "year": 2016},
-    {"make": 'toyota', "model": 'tacoma trd sport v6crew', "year": 2019},
-    {"make": 'toyota', "model": 'tacoma truck 4x4', "year": 2011},
-    {"make": 'toyota', "model": 'tacoma v6 1 owner* trd sport* navigation*back up cam* 6-speed manual* rust free*1-owner*non smoker*bilstein toytec lift', "year": 2015},
-    {"make": 'toyota', "model": 'tacoma v6 1-oregon owner*zero rust*4x4*trd off road*45 service records*like new in&out*rear lockers*never off road*zero accidents', "year": 2012},
-    {"make": 'toyota', "model": 'tacoma v6 4dr double cab', "year": 2005},
-    {"make": 'toyota', "model": 'tacoma v6 4dr double cab 1-owner* rust free*arizona truck since new* 6-speed manual*rear lockers*trd off road*leveling kit*rear air bags* zero accidents* all records since new', "year": 2005},
-    {"make": 'toyota', "model": 'tundra', "year": 2021},
-    {"make": 'toyota', "model": 'tundra', "year": 2020},
-    {"make": 'toyota', "model": 'tundra', "year": 2019},
-    {"make": 'toyota', "model": 'tundra', "year": 2018},
-    {"make": 'toyota', "model": 'tundra', "year": 2017},
-    {"make": 'toyota', "model": 'tundra', "year": 2016},
-    {"make": 'toyota', "model": 'tundra', "year": 2015},
-    {"make": 'toyota', "model": 'tundra', "year": 2014},
-    {"make": 'toyota', "model": 'tundra', "year": 2013},
-    {"make": 'toyota', "model": 'tundra', "year": 2012},
-    {"make": 'toyota', "model": 'tundra', "year": 2011},
-    {"make": 'toyota', "model": 'tundra', "year": 2010},
-    {"make": 'toyota', "model": 'tundra', "year": 2009},
-    {"make": 'toyota', "model": 'tundra', "year": 2008},
-    {"make": 'toyota', "model": 'tundra', "year": 2007},
-    {"make": 'toyota', "model": 'tundra', "year": 2006},
-    {"make": 'toyota', "model": 'tundra', "year": 2005},
-    {"make": 'toyota', "model": 'tundra 1794 4x4', "year": 2015},
-    {"make": 'toyota', "model": 'tundra 1794 edition', "year": 2015},
-    {"make": 'toyota', "model": 'tundra 1794 edition 1-owner* local oregon truck since new* blind spot* 2-keys* non smoker* like new in & out* new brakes and service', "year": 2015},
-    {"make": 'toyota', "model": 'tundra 2wd truck', "year": 2014},
-    {"make": 'toyota', "model": 'tundra 2wd truck', "year": 2011},
-    {"make": 'toyota', "model": 'tundra 4wd', "year": 2020},
-    {"make": 'toyota', "model": 'tundra 4wd', "year": 2019},
-    {"make": 'toyota', "model": 'tundra 4wd', "year": 2018},
-    {"make": 'toyota', "model": 'tundra 4wd truck', "year": 2016},
-    {"make": 'toyota', "model": 'tundra 4wd truck', "year": 2015},
-    {"make": 'toyota', "model": 'tundra 4wd truck', "year": 2014},
-    {"make": 'toyota', "model": 'tundra 4wd truck', "year": 2013},
-    {"make": 'toyota', "model": 'tundra 4wd truck', "year": 2010},
-    {"make": 'toyota', "model": 'tundra 4wd truck', "year": 2008},
-    {"make": 'toyota', "model": 'tundra 4x4', "year": 2016},
-    {"make": 'toyota', "model": 'tundra 4x4', "year": 2007},
-    {"make": 'toyota', "model": 'tundra 4x4 trd', "year": 2012},
-    {"make": 'toyota', "model": 'tundra access cab', "year": 2005},
-    {"make": 'toyota', "model": 'tundra crewmax', "year": 2020},
-    {"make": 'toyota', "model": 'tundra crewmax', "year": 2018},
-    {"make": 'toyota', "model": 'tundra crewmax', "year": 2014},
-    {"make": 'toyota', "model": 'tundra crewmax', "year": 2011},
-    {"make": 'toyota', "model": 'tundra crewmax', "year": 2008},
-    {"make": 'toyota', "model": 'tundra crewmax', "year": 2007},
-    {"make": 'toyota', "model": 'tundra crewmax 1794', "year": 2015},
-    {"make": 'toyota', "model": 'tundra crewmax limited', "year": 2020},
-    {"make": 'toyota', "model": 'tundra crewmax limited', "year": 2019},
-    {"make": 'toyota', "model": 'tundra crewmax limited', "year": 2018},
-    {"make": 'toyota', "model": 'tundra crewmax limited', "year": 2017},
-    {"make": 'toyota', "model": 'tundra crewmax pickup 4d', "year": 2013},
-    {"make": 'toyota', "model": 'tundra crewmax platinum', "year": 2014},
-    {"make": 'toyota', "model": 'tundra crewmax sr5', "year": 2015},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2020},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2019},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2018},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2017},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2016},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2015},
-    {"make": 'toyota', "model": 'tundra crewmax sr5 pickup', "year": 2014},
-    {"make": 'toyota', "model": 'tundra crewmax trd pro', "year": 2019},
-    {"make": 'toyota', "model": 'tundra double cab', "year": 2018},
-    {"make": 'toyota', "model": 'tundra double cab', "year": 2008},
-    {"make": 'toyota', "model": 'tundra double cab', "year": 2007},
-    {"make": 'toyota', "model": 'tundra double cab', "year": 2006},
-    {"make": 'toyota', "model": 'tundra double cab limited', "year": 2017},
-    {"make": 'toyota', "model": 'tundra double cab pickup', "year": 2013},
-    {"make": 'toyota', "model": 'tundra double cab sr', "year": 2019},
-    {"make": 'toyota', "model": 'tundra double cab sr', "year": 2017},
-    {"make": 'toyota', "model": 'tundra double cab sr', "year": 2016},
-    {"make": 'toyota', "model": 'tundra double cab sr', "year": 2014},
-    {"make": 'toyota', "model": 'tundra double cab sr5', "year": 2020},
-    {"make": 'toyota', "model": 'tundra double cab sr5', "year": 2017},
-    {"make": 'toyota', "model": 'tundra double cab sr5', "year": 2008},
-    {"make": 'toyota', "model": 'tundra double cab sr5', "year": 2007},
-    {"make": 'toyota', "model": 'tundra grade', "year": 2012},
-    {"make": 'toyota', "model": 'tundra limited', "year": 2015},
-    {"make": 'toyota', "model": 'tundra limited', "year": 2013},
-    {"make": 'toyota', "model": 'tundra limited crewmax lifted', "year": 2018},
-    {"make": 'toyota', "model": 'tundra limited double cab', "year": 2008},
-    {"make": 'toyota', "model": 'tundra platinum', "year": 2018},
-    {"make": 'toyota', "model": 'tundra platinum crew max lifted on 37s', "year": 2016},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2020},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2017},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2015},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2014},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2008},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2007},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2006},
-    {"make": 'toyota', "model": 'tundra sr5', "year": 2005},
-    {"make": 'toyota', "model": 'tundra sr5 4dr 1-oregon owner*0-rust*never off road*new timing belt&water pump*new bilstein-toytec lift*new 33" yokohama geolanders*new oem 17"toyota wheels*leer canopy', "year": 2005},
-    {"make": 'toyota', "model": 'tundra sr5 4dr double cab 1-owner*rust free*only 112k miles*new water pump & timing belt*new bilstein-toytec lift*new 33" yokohama tires*like new in&out*0-accidents', "year": 2006},
-    {"make": 'toyota', "model": 'tundra sr5 4wd', "year": 2006},
-    {"make": 'toyota', "model": 'tundra sr5 4x4', "year": 2016},
-    {"make": 'toyota', "model": 'tundra sr5 4x4', "year": 2006},
-    {"make": 'toyota', "model": 'tundra sr5 trd off road', "year": 2020},
-    {"make": 'toyota', "model": 'tundra trd 4x4', "year": 2012},
-    {"make": 'toyota', "model": 'tundra trd pro', "year": 2020},
-    {"make": 'toyota', "model": 'venza', "year": 2015},
-    {"make": 'toyota', "model": 'venza', "year": 2014},
-    {"make": 'toyota', "model": 'venza', "year": 2013},
-    {"make": 'toyota', "model": 'venza', "year": 2012},
-    {"make": 'toyota', "model": 'venza', "year": 2011},
-    {"make": 'toyota', "model": 'venza', "year": 2010},
-    {"make": 'toyota', "model": 'venza', "year": 2009},
-    {"make": 'toyota', "model": 'venza 5-door v6 sedan', "year": 2009},
-    {"make": 'toyota', "model": 'venza awd', "year": 2011},
-    {"make": 'toyota', "model": 'venza awd', "year": 2010},
-    {"make": 'toyota', "model": 'venza awd', "year": 2009},
-    {"make": 'toyota', "model": 'venza awd v6', "year": 2009},
-    {"make": 'toyota', "model": 'venza le', "year": 2014},
-    {"make": 'toyota', "model": 'venza le', "year": 2013},
-    {"make": 'toyota', "model": 'venza le', "year": 2012},
-    {"make": 'toyota', "model": 'venza le wagon 4d', "year": 2013},
-    {"make": 'toyota', "model": 'venza limited wagon 4d', "year": 2013},
-    {"make": 'toyota', "model": 'venza wagon 4d', "year": 2011},
-    {"make": 'toyota', "model": 'venza xle', "year": 2021},
-    {"make": 'toyota', "model": 'venza xle wagon 4d', "year": 2014},
-    {"make": 'toyota', "model": 'venza xle wagon 4d', "year": 2013},
-    {"make": 'toyota', "model": 'yaris', "year": 2019},
-    {"make": 'toyota', "model": 'yaris', "year": 2017},
-    {"make": 'toyota', "model": 'yaris', "year": 2016},
-    {"make": 'toyota', "model": 'yaris', "year": 2015},
-    {"make": 'toyota', "model": 'yaris', "year": 2014},
-    {"make": 'toyota', "model": 'yaris', "year": 2013},
-    {"make": 'toyota', "model": 'yaris', "year": 2012},
-    {"make": 'toyota', "model": 'yaris', "year": 2011},
-    {"make": 'toyota', "model": 'yaris', "year": 2010},
-    {"make": 'toyota', "model": 'yaris', "year": 2009},
-    {"make": 'toyota', "model": 'yaris', "year": 2008},
-    {"make": 'toyota', "model": 'yaris', "year": 2007},
-    {"make": 'toyota', "model": 'yaris hatchback', "year": 2015},
-    {"make": 'toyota', "model": 'yaris hatchback', "year": 2010},
-    {"make": 'toyota', "model": 'yaris hatchback', "year": 2009},
-    {"make": 'toyota', "model": 'yaris hatchback', "year": 2008},
-    {"make": 'toyota', "model": 'yaris ia', "year": 2018},
-    {"make": 'toyota', "model": 'yaris ia', "year": 2017},
-    {"make": 'toyota', "model": 'yaris ia sedan 4d', "year": 2018},
-    {"make": 'toyota', "model": 'yaris ia sedan 4d', "year": 2017},
-    {"make": 'toyota', "model": 'yaris l sedan 4d', "year": 2019},
-    {"make": 'toyota', "model": 'yaris le', "year": 2012},
-    {"make": 'toyota', "model": 'yaris le 4dr h/b', "year": 2013},
-    {"make": 'toyota', "model": 'yaris sedan', "year": 2019},
-    {"make": 'toyota', "model": 'yaris sedan', "year": 2007},
-    {"make": 'volkswagen', "model": 'arteon', "year": 2019},
-    {"make": 'volkswagen', "model": 'arteon se 4motion', "year": 2019},
-    {"make": 'volkswagen', "model": 'arteon sel r-line', "year": 2020},
-    {"make": 'volkswagen', "model": 'atlas', "year": 2019},
-    {"make": 'volkswagen', "model": 'atlas', "year": 2018},
-    {"make": 'volkswagen', "model": 'atlas cross sport', "year": 2020},
-    {"make": 'volkswagen', "model": 'atlas cross sport s', "year": 2020},
-    {"make": 'volkswagen', "model": 'atlas cross sport se', "year": 2020},
-    {"make": 'volkswagen', "model": 'atlas cross sport sel', "year": 2020},
-    {"make": 'volkswagen', "model": 'atlas launch edition', "year": 2018},
-    {"make": 'volkswagen', "model": 'atlas s 4motion sport', "year": 2019},
-    {"make": 'volkswagen', "model": 'atlas s sport utility', "year": 2018},
-    {"make": 'volkswagen', "model": 'atlas se 4motion', "year": 2019},
-    {"make": 'volkswagen', "model": 'atlas se 4motion', "year": 2018},
-    {"make": 'volkswagen', "model": 'atlas se r-line', "year": 2019},
-    {"make": 'volkswagen', "model": 'atlas se sport', "year": 2019},
-    {"make": 'volkswagen', "model": 'atlas se sport', "year": 2018},
-    {"make": 'volkswagen', "model": 'atlas sel premium', "year": 2019},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2019},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2017},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2016},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2015},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2014},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2012},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2010},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2009},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2008},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2007},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2006},
-    {"make": 'volkswagen', "model": 'beetle', "year": 2005},
-    {"make": 'volkswagen', "model": 'beetle - new tires - leather and heated seats -', "year": 2015},
-    {"make": 'volkswagen', "model": 'beetle 1.8t', "year": 2014},
-    {"make": 'volkswagen', "model": 'beetle 1.8t fleet', "year": 2015},
-    {"make": 'volkswagen', "model": 'beetle 1.8t s', "year": 2017},
-    {"make": 'volkswagen', "model": 'beetle 1.8t se', "year": 2017},
-    {"make": 'volkswagen', "model": 'beetle 1.8t se', "year": 2016},
-    {"make": 'volkswagen', "model": 'beetle 2.0t coast', "year": 2018},
-    {"make": 'volkswagen', "model": 'beetle 2.0t s', "year": 2019},
-    {"make": 'volkswagen', "model": 'beetle 2.0t s', "year": 2018},
-    {"make": 'volkswagen', "model": 'beetle 2.0t se', "year": 2018},
-    {"make": 'volkswagen', "model": 'beetle 2.5l', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle convertible', "year": 2015},
-    {"make": 'volkswagen', "model": 'beetle convertible', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle convertible', "year": 2009},
-    {"make": 'volkswagen', "model": 'beetle coupe', "year": 2014},
-    {"make": 'volkswagen', "model": 'beetle coupe', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle fender edition', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle tdi', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle turbo', "year": 2013},
-    {"make": 'volkswagen', "model": 'beetle turbo coupe', "year": 2013},
-    {"make": 'volkswagen', "model": 'cc', "year": 2015},
-    {"make": 'volkswagen', "model": 'cc', "year": 2014},
-    {"make": 'volkswagen', "model": 'cc', "year": 2013},
-    {"make": 'volkswagen', "model": 'cc', "year": 2012},
-    {"make": 'volkswagen', "model": 'cc', "year": 2011},
-    {"make": 'volkswagen', "model": 'cc', "year": 2010},
-    {"make": 'volkswagen', "model": 'cc', "year": 2009},
-    {"make": 'volkswagen', "model": 'cc 3.6 vr6 4motion', "year": 2014},
-    {"make": 'volkswagen', "model": 'cc sport', "year": 2013},
-    {"make": 'volkswagen', "model": 'cc sport', "year": 2012},
-    {"make": 'volkswagen', "model": 'cc sport', "year": 2010},
-    {"make": 'volkswagen', "model": 'cc sport', "year": 2009},
-    {"make": 'volkswagen', "model": 'e-golf', "year": 2016},
-    {"make": 'volkswagen', "model": 'e-golf se hatchback', "year": 2019},
-    {"make": 'volkswagen', "model": 'e-golf se hatchback', "year": 2017},
-    {"make": 'volkswagen', "model": 'e-golf se hatchback', "year": 2016},
-    {"make": 'volkswagen', "model": 'e-golf sel premium', "year": 2017},
-    {"make": 'volkswagen', "model": 'e-golf sel premium', "year": 2016},
-    {"make": 'volkswagen', "model": 'eos', "year": 2012},
-    {"make": 'volkswagen', "model": 'eos', "year": 2009},
-    {"make": 'volkswagen', "model": 'eos', "year": 2008},
-    {"make": 'volkswagen', "model": 'eos', "year": 2007},
-    {"make": 'volkswagen', "model": 'eos 2.0 turbo', "year": 2008},
-    {"make": 'volkswagen', "model": 'eos 2.0t', "year": 2007},
-    {"make": 'volkswagen', "model": 'eos komfort', "year": 2015},
-    {"make": 'volkswagen', "model": 'eos sport convertible', "year": 2013},
-    {"make": 'volkswagen', "model": 'golf', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf', "year": 2016},
-    {"make": 'volkswagen', "model": 'golf', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf', "year": 2014},
-    {"make": 'volkswagen', "model": 'golf', "year": 2013},
-    {"make": 'volkswagen', "model": 'golf', "year": 2012},
-    {"make": 'volkswagen', "model": 'golf', "year": 2011},
-    {"make": 'volkswagen', "model": 'golf', "year": 2010},
-    {"make": 'volkswagen', "model": 'golf 1.4t tsi', "year": 2020},
-    {"make": 'volkswagen', "model": 'golf alltrack', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf alltrack', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf alltrack tsi s', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf alltrack tsi s', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf alltrack tsi s', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf alltrack tsi se', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf alltrack tsi se', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf gti', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf gti', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf gti', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf gti', "year": 2016},
-    {"make": 'volkswagen', "model": 'golf gti', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf gti', "year": 2013},
-    {"make": 'volkswagen', "model": 'golf gti autobahn', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf gti autobahn fwd', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf gti rabbit', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf gti s hatchback', "year": 2020},
-    {"make": 'volkswagen', "model": 'golf gti s hatchback', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf gti s hatchback', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf gti se hatchback', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf r', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf r', "year": 2016},
-    {"make": 'volkswagen', "model": 'golf r 4motion', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf r hatchback', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf sportwagen', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf sportwagen', "year": 2016},
-    {"make": 'volkswagen', "model": 'golf sportwagen tdi', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf sportwagen tdi s', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf sportwagen tsi', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf sportwagen tsi s', "year": 2019},
-    {"make": 'volkswagen', "model": 'golf sportwagen tsi s', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf sportwagen tsi s', "year": 2017},
-    {"make": 'volkswagen', "model": 'golf sportwagen tsi s', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf tdi se hatchback', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf tdi sel', "year": 2015},
-    {"make": 'volkswagen', "model": 'golf tsi se hatchback', "year": 2018},
-    {"make": 'volkswagen', "model": 'golf tsi wolfsburg', "year": 2017},
-    {"make": 'volkswagen', "model": 'gti', "year": 2017},
-    {"make": 'volkswagen', "model": 'gti', "year": 2015},
-    {"make": 'volkswagen', "model": 'gti', "year": 2014},
-    {"make": 'volkswagen', "model": 'gti', "year": 2013},
-    {"make": 'volkswagen', "model": 'gti', "year": 2012},
-    {"make": 'volkswagen', "model": 'gti', "year": 2011},
-    {"make": 'volkswagen', "model": 'gti', "year": 2010},
-    {"make": 'volkswagen', "model": 'gti', "year": 2009},
-    {"make": 'volkswagen', "model": 'gti', "year": 2008},
-    {"make": 'volkswagen', "model": 'gti', "year": 2007},
-    {"make": 'volkswagen', "model": 'gti', "year": 2006},
-    {"make": 'volkswagen', "model": 'gti autobahn', "year": 2013},
-    {"make": 'volkswagen', "model": 'gti coupe', "year": 2008},
-    {"make": 'volkswagen', "model": 'gti hatchback sedan', "year": 2013},
-    {"make": 'volkswagen', "model": 'gti wolfsburg edition', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2021},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2020},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2018},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2015},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2012},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2011},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2010},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2009},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2008},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2007},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2006},
-    {"make": 'volkswagen', "model": 'jetta', "year": 2005},
-    {"make": 'volkswagen', "model": 'jetta 1.4t - ac blows ice cold - gas saver -', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta 1.4t r-line', "year": 2020},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s sedan 4d', "year": 2020},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s sedan 4d', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s sedan 4d', "year": 2018},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s sedan 4d', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta 1.4t s sedan 4d', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta 1.4t se', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta 1.4t sel', "year": 2020},
-    {"make": 'volkswagen', "model": 'jetta 1.4t sel', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta 1.8t sport', "year": 2015},
-    {"make": 'volkswagen', "model": 'jetta 2.5 se', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta gli', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta gli', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta gli 35th', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta gli autobahn', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta gli s sedan 4d', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2015},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2011},
-    {"make": 'volkswagen', "model": 'jetta s', "year": 2009},
-    {"make": 'volkswagen', "model": 'jetta s fwd gas sedan', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2019},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2015},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2012},
-    {"make": 'volkswagen', "model": 'jetta se', "year": 2011},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2015},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2012},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2011},
-    {"make": 'volkswagen', "model": 'jetta sedan', "year": 2008},
-    {"make": 'volkswagen', "model": 'jetta sedan se', "year": 2017},
-    {"make": 'volkswagen', "model": 'jetta sel', "year": 2011},
-    {"make": 'volkswagen', "model": 'jetta sportwagen', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta sportwagen', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta sportwagen', "year": 2012},
-    {"make": 'volkswagen', "model": 'jetta sportwagen 2.0l', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta sportwagen 2.0l', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta sportwagen tdi', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta sportwagen tdi', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta tdi', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta tdi', "year": 2013},
-    {"make": 'volkswagen', "model": 'jetta tdi', "year": 2012},
-    {"make": 'volkswagen', "model": 'jetta tdi', "year": 2006},
-    {"make": 'volkswagen', "model": 'jetta tdi', "year": 2005},
-    {"make": 'volkswagen', "model": 'jetta tdi fwd', "year": 2014},
-    {"make": 'volkswagen', "model": 'jetta tdi sportwagen', "year": 2011},
-    {"make": 'volkswagen', "model": 'jetta tsi', "year": 2016},
-    {"make": 'volkswagen', "model": 'jetta tsi turbo', "year": 2017},
-    {"make": 'volkswagen', "model": 'new beetle', "year": 2010},
-    {"make": 'volkswagen', "model": 'new beetle', "year": 2009},
-    {"make": 'volkswagen', "model": 'new beetle', "year": 2007},
-    {"make": 'volkswagen', "model": 'new beetle', "year": 2006},
-    {"make": 'volkswagen', "model": 'new beetle', "year": 2005},
-    {"make": 'volkswagen', "model": 'new beetle - new tires - leather and heated seats', "year": 2010},
-    {"make": 'volkswagen', "model": 'passat', "year": 2020},
-    {"make": 'volkswagen', "model": 'passat', "year": 2018},
-    {"make": 'volkswagen', "model": 'passat', "year": 2017},
-    {"make": 'volkswagen', "model": 'passat', "year": 2016},
-    {"make": 'volkswagen', "model": 'passat', "year": 2015},
-    {"make": 'volkswagen', "model": 'passat', "year": 2014},
-    {"make": 'volkswagen', "model": 'passat', "year": 2013},
-    {"make": 'volkswagen', "model": 'passat', "year": 2012},
-    {"make": 'volkswagen', "model": 'passat', "year": 2010},
-    {"make": 'volkswagen', "model": 'passat', "year": 2009},
-    {"make": 'volkswagen', "model": 'passat', "year": 2008},
-    {"make": 'volkswagen', "model": 'passat', "year": 2007},
-    {"make": 'volkswagen', "model": 'passat', "year": 2006},
-    {"make": 'volkswagen', "model": 'passat', "year": 2005},
-    {"make": 'volkswagen', "model": 'passat 1.8t se', "year": 2016},
-    {"make": 'volkswagen', "model": 'passat 1.8t wolfsburg', "year": 2015},
-    {"make": 'volkswagen', "model": 'passat 2.0t', "year": 2006},
-    {"make": 'volkswagen', "model": 'passat 2.0t r-line', "year": 2018},
-    {"make": 'volkswagen', "model": 'passat 2.0t se sedan', "year": 2018},
-    {"make": 'volkswagen', "model": 'passat komfort', "year": 2009},
-    {"make": 'volkswagen', "model": 'passat komfort', "year": 2008},
-    {"make": 'volkswagen', "model": 'passat r-line sedan', "year": 2020},
-    {"make": 'volkswagen', "model": 'passat se', "year": 2013},
-    {"make": 'volkswagen', "model": 'passat se', "year": 2012},
-    {"make": 'volkswagen', "model": 'passat sedan', "year": 2008},
-    {"make": 'volkswagen', "model": 'passat tdi', "year": 2013},
-    {"make": 'volkswagen', "model": 'passat tdi sel', "year": 2014},
-    {"make": 'volkswagen', "model": 'passat tdi sel', "year": 2012},
-    {"make": 'volkswagen', "model": 'passat wagon', "year": 2010},
-    {"make": 'volkswagen', "model": 'passat wolfsburg', "year": 2014},
-    {"make": 'volkswagen', "model": 'r32', "year": 2008},
-    {"make": 'volkswagen', "model": 'rabbit', "year": 2009},
-    {"make": 'volkswagen', "model": 'rabbit', "year": 2008},
-    {"make": 'volkswagen', "model": 'rabbit', "year": 2007},
-    {"make": 'volkswagen', "model": 'routan', "year": 2012},
-    {"make": 'volkswagen', "model": 'routan', "year": 2011},
-    {"make": 'volkswagen', "model": 'routan', "year": 2010},
-    {"make": 'volkswagen', "model": 'routan', "year": 2009},
-    {"make": 'volkswagen', "model": 'routan se', "year": 2012},
-    {"make": 'volkswagen', "model": 'routan sel', "year": 2010},
-    {"make": 'volkswagen', "model": 'routan smini van', "year": 2009},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2020},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2019},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2018},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2017},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2016},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2015},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2014},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2013},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2012},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2011},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2010},
-    {"make": 'volkswagen', "model": 'tiguan', "year": 2009},
-    {"make": 'volkswagen', "model": 'tiguan 2.0t s 4motion', "year": 2018},
-    {"make": 'volkswagen', "model": 'tiguan 2.0t s sport', "year": 2018},
-    {"make": 'volkswagen', "model": 'tiguan 2.0t se', "year": 2018},
-    {"make": 'volkswagen', "model": 'tiguan 2.0t se sport', "year": 2018},
-    {"make": 'volkswagen', "model": 'tiguan 2.0t sel sport', "year": 2018},
-    {"make": 'volkswagen', "model": 'tiguan limited', "year": 2017},
-    {"make": 'volkswagen', "model": 'tiguan limited 2.0t', "year": 2017},
-    {"make": 'volkswagen', "model": 'tiguan s', "year": 2017},
-    {"make": 'volkswagen', "model": 'tiguan s', "year": 2013},
-    {"make": 'volkswagen', "model": 'tiguan s 4motion', "year": 2020},
-    {"make": 'volkswagen', "model": 'tiguan se', "year": 2019},
-    {"make": 'volkswagen', "model": 'tiguan se 4motion', "year": 2016},
-    {"make": 'volkswagen', "model": 'tiguan sel', "year": 2012},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2016},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2015},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2014},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2013},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2012},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2011},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2010},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2008},
-    {"make": 'volkswagen', "model": 'touareg', "year": 2006},
-    {"make": 'volkswagen', "model": 'touareg tdi', "year": 2010},
-    {"make": 'volkswagen', "model": 'touareg tdi sport suv', "year": 2012},
-]
+CATALOG = CarCatalog.load()
@@ -0,0 +1,246 @@
+# backend/catalog_service.py
+"""The /api/cars catalogue and its dropdown / autocomplete views, served from memory.
+
+The merged list — every (make, model, year) in ``listings`` plus the static
+CATALOG rows ingest has not covered — only changes when ingest runs, so it is
+built at startup and again whenever ingest bumps the version stamp in
+``ingest_meta``, never per request:
+
+  build    $group over listings → merge with CATALOG → sort → JSON bytes
+           → gzip, with a strong ETag per encoding; plus a CatalogIndex
+  serve    the pre-built bytes as they are; If-None-Match → 304, no Mongo
+
+CatalogIndex backs the dropdown endpoints (/api/makes/...) and prefix
+autocomplete (/api/catalog/suggest): make → model → year listing counts, and
+a sorted array of lower-cased names searched with bisect. Suggestions are
+ranked by listing count; short prefixes, which match thousands of names,
+are answered from a precomputed top-k table.
+
+Like the snapshot store, a new payload is built off to the side and swapped
+in with a single reference assignment.
+"""
+from __future__ import annotations
+import asyncio
+import gzip
+import heapq
+import json
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.car_catalog import CATALOG
+from backend.utils.http_cache import etag_for
+from backend.utils.price_series import META_COLLECTION, SERIES_COLLECTION
+
+_PIPELINE = [
+    {"$group": {"_id": {"make": "$make", "model": "$model", "year": "$year"}, "n": {"$sum": 1}}},
+    {"$project": {"_id": 0, "make": "$_id.make", "model": "$_id.model", "year": "$_id.year", "n": 1}},
+]
+
+# Suggestions per request (default / ceiling)
+SUGGEST_LIMIT     = 8
+SUGGEST_LIMIT_MAX = 20
+# Prefixes up to this long get precomputed top-SUGGEST_LIMIT_MAX lists
+_TOP_PREFIX_LEN = 2
+
+
+class CatalogIndex:
+    """Listing counts by make → model → year plus a bisect-able name list."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        # rows: merged, sorted make, model, year desc; "n" = listings (0 = catalogue only)
+        self._years: dict[str, dict[str, list[dict]]] = {}
+        for r in rows:
+            make, model = r.get("make"), r.get("model")
+            if not make or not model or not r.get("year"):
+                continue
+            self._years.setdefault(make, {}).setdefault(model, []).append(
+                {"year": r["year"], "listings": r.get("n", 0)}
+            )
+        self._models = {
+            make: [{"model": model, "listings": sum(y["listings"] for y in years)}
+                   for model, years in models.items()]
+            for make, models in self._years.items()
+        }
+        self._makes = [
+            {"make": make, "listings": sum(m["listings"] for m in models)}
+            for make, models in self._models.items()
+        ]
+
+        # Searchable keys: "toyota", "toyota camry" and bare "camry"
+        entries: list[tuple[str, str, str | None, int]] = []
+        for m in self._makes:
+            entries.append((m["make"], m["make"], None, m["listings"]))
+        for make, models in self._models.items():
+            for m in models:
+                entries.append((f"{make} {m['model']}", make, m["model"], m["listings"]))
+                entries.append((m["model"], make, m["model"], m["listings"]))
+        entries.sort()
+        self._keys    = [e[0] for e in entries]
+        self._entries = entries
+        self._top: dict[str, list[tuple]] = {}
+        for e in entries:
+            for n in range(1, min(_TOP_PREFIX_LEN, len(e[0])) + 1):
+                self._top.setdefault(e[0][:n], []).append(e)
+        for prefix, hits in self._top.items():
+            self._top[prefix] = self._rank(hits, SUGGEST_LIMIT_MAX)
+
+    @staticmethod
+    def _rank(hits, limit: int) -> list[tuple]:
+        """Top *limit* by listings, one per (make, model), makes before their models."""
+        out, seen = [], set()
+        # Each (make, model) has at most two keys ("toyota camry", "camry")
+        for e in heapq.nsmallest(2 * limit, hits, key=lambda e: (-e[3], e[2] is not None, e[0])):
+            if (e[1], e[2]) in seen:
+                continue
+            seen.add((e[1], e[2]))
+            out.append(e)
+            if len(out) == limit:
+                break
+        return out
+
+    def makes(self) -> list[dict]:
+        return self._makes
+
+    def models(self, make: str) -> list[dict] | None:
+        return self._models.get(make)
+
+    def years(self, make: str, model: str) -> list[dict] | None:
+        return self._years.get(make, {}).get(model)
+
+    def suggest(self, q: str, limit: int = SUGGEST_LIMIT) -> list[dict]:
+        q = " ".join(q.lower().split())
+        if not q:
+            return []
+        if len(q) <= _TOP_PREFIX_LEN:
+            hits = self._top.get(q, [])[:limit]
+        else:
+            lo = bisect_left(self._keys, q)
+            hi = bisect_left(self._keys, q + "\uffff", lo)
+            hits = self._rank(self._entries[lo:hi], limit)
+        return [
+            {"make": make, "model": model, "label": f"{make} {model}" if model else make, "listings": n}
+            for _, make, model, n in hits
+        ]
+
+
+@dataclass(frozen=True)
+class CatalogPayload:
+    """One pre-serialized generation of the /api/cars response."""
+    version:  str | None
+    n_rows:   int
+    body:     bytes     # JSON, compact separators
+    body_gz:  bytes
+    etag:     str       # quoted, identity encoding
+    etag_gz:  str       # quoted, gzip encoding (a strong ETag names one representation)
+    index:    CatalogIndex
+    built_at: float
+    build_ms: float
+
+
+def merge(db_rows: list[dict]) -> list[dict]:
+    """DB rows first, static catalogue filling any gaps, sorted make, model, year desc.
+
+    Rows keep their listing count under "n" for the index; it is not served.
+    """
+    # Always merge DB results with the static catalog so all 20 makes appear
+    # even when MongoDB listings is partially ingested (e.g. missing Ford/Jeep).
+    seen = {(r.get("make"), r.get("model"), r.get("year")) for r in db_rows}
+    extras = [
+        {"make": make, "model": model, "year": year, "n": 0}
+        for make, model, year in CATALOG.rows() if (make, model, year) not in seen
+    ]
+    combined = db_rows + extras
+    return sorted(combined, key=lambda r: (r.get("make") or "", r.get("model") or "", -(r.get("year") or 0)))
+
+
+def build_payload(db_rows: list[dict], version: str | None) -> CatalogPayload:
+    t0   = time.perf_counter()
+    rows = merge(db_rows)
+    body = json.dumps(
+        [{"make": r.get("make"), "model": r.get("model"), "year": r.get("year")} for r in rows],
+        ensure_ascii=False, separators=(",", ":"),
+    ).encode()
+    etag = etag_for(body)
+    return CatalogPayload(
+        version=version, n_rows=len(rows), body=body,
+        body_gz=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=etag, etag_gz=etag[:-1] + '-gz"', index=CatalogIndex(rows),
+        built_at=time.time(), build_ms=round((time.perf_counter() - t0) * 1000, 1),
+    )
+
+
+class CatalogService:
+    """Holds the current CatalogPayload; rebuilds it when ingest publishes a new version."""
+
+    def __init__(self, db) -> None:
+        self._db      = db
+        self._payload: CatalogPayload | None = None
+        self._lock    = asyncio.Lock()
+        self._poller: asyncio.Task | None = None
+        self._metrics = {"builds": 0, "served": 0, "served_gzip": 0, "not_modified": 0}
+
+    async def _remote_version(self) -> str | None:
+        meta = await self._db[META_COLLECTION].find_one({"_id": SERIES_COLLECTION}, {"version": 1})
+        return (meta or {}).get("version")
+
+    async def refresh(self, only_if_missing: bool = False) -> CatalogPayload:
+        """(Re)build from listings and swap the new payload in."""
+        async with self._lock:
+            if only_if_missing and self._payload is not None:
+                return self._payload   # built by a concurrent caller while we waited
+            version = await self._remote_version()
+            db_rows = await self._db["listings"].aggregate(_PIPELINE).to_list(None)
+            # Sorting / serializing / compressing ~10k rows is CPU work — off the loop
+            self._payload = await asyncio.to_thread(build_payload, db_rows, version)
+            self._metrics["builds"] += 1
+            return self._payload
+
+    async def get(self) -> CatalogPayload:
+        """Current payload, building it on first use if startup could not."""
+        return self._payload or await self.refresh(only_if_missing=True)
+
+    async def refresh_if_stale(self) -> bool:
+        if self._payload is not None and await self._remote_version() == self._payload.version:
+            return False
+        await self.refresh()
+        return True
+
+    def start_polling(self, interval_s: float = 60.0) -> None:
+        """Poll the ingest version stamp from the event loop."""
+        if self._poller is not None:
+            return
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval_s)
+                try:
+                    if await self.refresh_if_stale():
+                        print(f"[catalog] Rebuilt /api/cars payload (version {self._payload.version})")
+                except Exception as exc:
+                    print(f"[catalog] Refresh failed: {exc}")
+
+        self._poller = asyncio.create_task(_loop())
+
+    def count(self, outcome: str) -> None:
+        self._metrics[outcome] += 1
+
+    def stats(self) -> dict:
+        p = self._payload
+        if p is None:
+            return {"loaded": False, **self._metrics}
+        return {
+            "loaded":   True,
+            "version":  p.version,
+            "n_rows":   p.n_rows,
+            "bytes":    len(p.body),
+            "bytes_gz": len(p.body_gz),
+            "etag":     p.etag,
+            "build_ms": p.build_ms,
+            "built_at": p.built_at,
+            **self._metrics,
+        }
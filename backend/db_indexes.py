@@ -0,0 +1,216 @@
+# backend/db_indexes.py
+"""Indexes the hot paths rely on, declared in one place and checked by explain().
+
+REQUIRED lists every index a request path needs, per collection; PROBES lists
+the canonical queries those paths run. IndexManager
+
+  ensure()   creates whatever REQUIRED index is missing (existing ones, under
+             any name, are left alone) and reports conflicts instead of
+             dropping anything
+  check()    runs explain() on every probe and flags collection scans
+  report()   both, as one JSON-able dict — what /api/admin/indexes returns
+
+Run at startup (DB_ENSURE_INDEXES=1, the default) and from
+scripts/ensure_indexes.py. _id lookups (price_series, ingest_meta,
+market_overview) need nothing beyond the default index;
+llm_cache creates its own TTL index (backend/llm/cache.py). The /api/cars
+$group over listings reads every listing by design and runs only when
+ingest publishes a new version, so it is not probed.
+"""
+from __future__ import annotations
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.leaderboard import COLLECTION as LEADERBOARD_COLLECTION
+from backend.utils.price_series import META_COLLECTION, SERIES_COLLECTION
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    keys:       tuple[tuple[str, int], ...]
+    name:       str
+    options:    dict = field(default_factory=dict)   # unique / expireAfterSeconds / ...
+    purpose:    str  = ""
+
+
+@dataclass(frozen=True)
+class QueryProbe:
+    name:       str
+    collection: str
+    filter:     dict
+    sort:       tuple[tuple[str, int], ...] = ()
+    limit:      int = 0
+
+
+REQUIRED: list[IndexSpec] = [
+    IndexSpec("predictions_cache", (("cache_key", ASCENDING),), "cache_key_unique",
+              {"unique": True}, "/api/predict lookup + upsert"),
+    # Same name / TTL as existing deployments already have
+    IndexSpec("predictions_cache", (("expires_at", ASCENDING),), "ttl_expires_at",
+              {"expireAfterSeconds": 3600}, "TTL expiry"),
+    IndexSpec("predictions_cache",
+              (("is_seed", ASCENDING), ("recommendation", ASCENDING), ("predicted_price", ASCENDING)),
+              "seed_recommendation_price", {}, "market overview seed count + price averages"),
+    IndexSpec("predictions_cache", (("recommendation", ASCENDING), ("predicted_price", ASCENDING)),
+              "recommendation_price", {}, "BUY leaderboard rebuild, seed-market count"),
+    IndexSpec("listings", (("make", ASCENDING), ("model", ASCENDING), ("year", ASCENDING)),
+              "make_model_year", {}, "market-context listing count"),
+    IndexSpec("price_snapshots",
+              (("make", ASCENDING), ("model", ASCENDING), ("year", ASCENDING), ("year_month", ASCENDING)),
+              "make_model_year_month", {}, "per-vehicle snapshot reads"),
+    IndexSpec("price_snapshots", (("year_month", DESCENDING),), "year_month_desc",
+              {}, "market-wide most recent snapshots"),
+    IndexSpec(LEADERBOARD_COLLECTION, (("updated_at", ASCENDING),), "updated_at",
+              {}, "leaderboard sync: mirror docs changed since the watermark"),
+    IndexSpec(LEADERBOARD_COLLECTION, (("expires_at", ASCENDING),), "ttl_expires_at",
+              {"expireAfterSeconds": 0}, "TTL expiry of lapsed entries and tombstones"),
+]
+
+PROBES: list[QueryProbe] = [
+    QueryProbe("predict_cache_lookup", "predictions_cache", {"cache_key": "probe"}),
+    QueryProbe("overview_seed_count", "predictions_cache", {"is_seed": True, "recommendation": "BUY"}),
+    QueryProbe("overview_seed_avg", "predictions_cache", {"is_seed": True, "predicted_price": {"$gt": 0}}),
+    QueryProbe("overview_live_avg", "predictions_cache", {"is_seed": {"$ne": True}, "predicted_price": {"$gt": 0}}),
+    QueryProbe("top_buys", "predictions_cache", {"recommendation": "BUY"}, (("predicted_price", ASCENDING),), 10),
+    QueryProbe("series_bucket", SERIES_COLLECTION, {"_id": "probe"}),
+    QueryProbe("ingest_version", META_COLLECTION, {"_id": SERIES_COLLECTION}),
+    QueryProbe("listing_count", "listings", {"make": "probe", "model": "probe", "year": 2018}),
+    QueryProbe("recent_snapshots", "price_snapshots", {}, (("year_month", DESCENDING),), 3),
+    QueryProbe("leaderboard_sync", LEADERBOARD_COLLECTION,
+               {"updated_at": {"$gt": datetime(2000, 1, 1, tzinfo=timezone.utc)}}),
+]
+
+# explain() stages that read without an index
+_SCAN_STAGES = {"COLLSCAN"}
+
+
+def _plan_stages(plan) -> list[str]:
+    """Stage names of a winningPlan tree, outermost first (classic and SBE layouts)."""
+    stages: list[str] = []
+    node = plan
+    while isinstance(node, dict):
+        node = node.get("queryPlan", node)
+        if "stage" in node:
+            stages.append(node["stage"])
+        if "inputStages" in node:   # OR / MERGE_SORT — flatten the branches
+            for child in node["inputStages"]:
+                stages.extend(_plan_stages(child))
+            break
+        node = node.get("inputStage")
+    return stages
+
+
+def _plan_indexes(plan) -> list[str]:
+    found: list[str] = []
+    if isinstance(plan, dict):
+        if "indexName" in plan:
+            found.append(plan["indexName"])
+        for v in plan.values():
+            found.extend(_plan_indexes(v))
+    elif isinstance(plan, list):
+        for v in plan:
+            found.extend(_plan_indexes(v))
+    return found
+
+
+class IndexManager:
+    """Creates REQUIRED indexes and verifies PROBES against a (sync) pymongo Database."""
+
+    def __init__(self, db, required: list[IndexSpec] = REQUIRED, probes: list[QueryProbe] = PROBES) -> None:
+        self._db      = db
+        self.required = required
+        self.probes   = probes
+        self._last: dict | None = None
+
+    def _existing(self, collection: str) -> dict[str, dict]:
+        try:
+            return self._db[collection].index_information()
+        except PyMongoError:   # collection does not exist yet
+            return {}
+
+    # ── Indexes ───────────────────────────────────────────────────────────────
+    def ensure(self, create: bool = True) -> list[dict]:
+        """Status of every REQUIRED index, creating missing ones when *create*."""
+        out, info = [], {}
+        for spec in self.required:
+            if spec.collection not in info:
+                info[spec.collection] = self._existing(spec.collection)
+            existing = info[spec.collection]
+            row = {"collection": spec.collection, "name": spec.name,
+                   "keys": [list(k) for k in spec.keys], "purpose": spec.purpose}
+            same_keys = [name for name, ix in existing.items()
+                         if tuple(tuple(k) for k in ix["key"]) == spec.keys]
+            if same_keys:
+                ix = existing[same_keys[0]]
+                drift = {k: v for k, v in spec.options.items() if ix.get(k) != v}
+                row.update(status="conflict" if drift else "present", name=same_keys[0])
+                if drift:
+                    row["error"] = f"options differ: want {drift}, have { {k: ix.get(k) for k in drift} }"
+            elif spec.name in existing:
+                row.update(status="conflict", error=f"name taken by keys {existing[spec.name]['key']}")
+            elif not create:
+                row["status"] = "missing"
+            else:
+                try:
+                    t0 = time.perf_counter()
+                    self._db[spec.collection].create_index(list(spec.keys), name=spec.name, **spec.options)
+                    row.update(status="created", build_ms=round((time.perf_counter() - t0) * 1000, 1))
+                except PyMongoError as exc:   # e.g. duplicate cache_key values block the unique index
+                    row.update(status="failed", error=str(exc))
+            out.append(row)
+        return out
+
+    # ── Query plans ───────────────────────────────────────────────────────────
+    def explain(self, probe: QueryProbe) -> dict:
+        row = {"name": probe.name, "collection": probe.collection}
+        try:
+            cursor = self._db[probe.collection].find(probe.filter)
+            if probe.sort:
+                cursor = cursor.sort(list(probe.sort))
+            if probe.limit:
+                cursor = cursor.limit(probe.limit)
+            plan = cursor.explain().get("queryPlanner", {}).get("winningPlan", {})
+        except PyMongoError as exc:
+            row.update(status="error", error=str(exc))
+            return row
+        stages = _plan_stages(plan)
+        row.update(plan=" ← ".join(stages), indexes=sorted(set(_plan_indexes(plan))))
+        if _SCAN_STAGES & set(stages):
+            row["status"] = "collscan"
+        elif stages == ["EOF"]:
+            row["status"] = "empty"   # collection does not exist — nothing to scan yet
+        else:
+            row["status"] = "ok"
+        return row
+
+    def check(self) -> list[dict]:
+        return [self.explain(p) for p in self.probes]
+
+    # ── Report ────────────────────────────────────────────────────────────────
+    def report(self, create: bool = False) -> dict:
+        t0      = time.perf_counter()
+        indexes = self.ensure(create=create)
+        queries = self.check()
+        self._last = {
+            "ok":         all(i["status"] in ("present", "created") for i in indexes)
+                          and not any(q["status"] in ("collscan", "error") for q in queries),
+            "missing":    [i["name"] for i in indexes if i["status"] in ("missing", "failed", "conflict")],
+            "collscans":  [q["name"] for q in queries if q["status"] == "collscan"],
+            "indexes":    indexes,
+            "queries":    queries,
+            "checked_at": time.time(),
+            "check_ms":   round((time.perf_counter() - t0) * 1000, 1),
+        }
+        return self._last
+
+    def last_report(self) -> dict | None:
+        return self._last
@@ -0,0 +1,320 @@
+# backend/leaderboard.py
+"""Cheapest-first BUY leaderboard, maintained as predictions are written.
+
+top_buys used to be ``predictions_cache.find({"recommendation": "BUY"})
+.sort("predicted_price").limit(10)`` — a scan whose cost grows with the
+cache. BuyLeaderboard keeps every live BUY entry in memory instead, in
+price-sorted lists per filter combination
+
+  all · region · make · region + make        (lower-cased)
+
+so top(k, region, make, min_price, max_price) is one dict lookup, a bisect
+to the start of the price band and k steps along the list — O(log n + k),
+with no filtering inside the scan.
+
+Maintenance, all on the event loop:
+  upsert(key, item, expires_at)   a prediction was written (non-BUY removes it)
+  patch(key, fields)              e.g. a deferred explanation landed
+  discard(key) / clear()          cache entries deleted
+  expire()                        drops entries whose expires_at has passed —
+                                  the TTL index removes them from Mongo too —
+                                  via a min-heap; called on every read
+
+Every change is also mirrored to the ``buy_leaderboard`` collection (one doc
+per entry, flushed in batches by persist()), so a restart loads the board
+with one find() instead of re-sorting predictions_cache.
+
+Each uvicorn worker holds its own board, and a prediction only reaches the
+board of the worker that wrote it. sync() — run in every overview recompute
+— flushes this worker's changes to the mirror, then reads back only the
+docs other workers changed since its last sync: every mirror write stamps
+an indexed ``updated_at``, and removals are written as tombstones that the
+TTL index on ``expires_at`` reaps after TOMBSTONE_TTL_S. Workers agree
+within MARKET_OVERVIEW_REFRESH_SECONDS, and local changes not yet flushed
+win over the mirror. Stamps come from the workers' clocks, which uvicorn
+workers on one host share.
+"""
+from __future__ import annotations
+import heapq
+import math
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from pymongo import DeleteOne, ReplaceOne
+
+COLLECTION = "buy_leaderboard"
+
+# Entries per request (default / ceiling)
+TOP_LIMIT     = 10
+TOP_LIMIT_MAX = 50
+
+# How long a removed entry's tombstone stays in the mirror (TTL index on expires_at)
+TOMBSTONE_TTL_S = 24 * 3600
+# sync() re-reads this far behind its watermark to catch writes that landed late
+_SYNC_OVERLAP_S = 5.0
+
+_ANY = "*"
+
+
+@dataclass
+class _Entry:
+    price:      float
+    region:     str
+    make:       str
+    expires_at: float   # epoch seconds
+    item:       dict    # what top() returns — JSON-safe, set by the caller
+
+
+def _epoch(value) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:   # Mongo hands back naive UTC
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value) if value is not None else float("inf")
+
+
+class BuyLeaderboard:
+    """In-memory BUY entries, indexed by price under every region / make filter."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Entry] = {}
+        # (region | "*", make | "*") → sorted [(price, key), ...]
+        self._lists:   dict[tuple[str, str], list[tuple[float, str]]] = {}
+        self._expiry:  list[tuple[float, str]] = []   # min-heap, may hold stale pairs
+        self._changed: set[str] = set()               # keys to mirror on next persist()
+        self._watermark = 0.0                         # newest mirror updated_at seen (epoch s)
+        self._synced_at: float | None = None          # when the mirror was last read
+        self._metrics = {"upserts": 0, "removed": 0, "expired": 0, "queries": 0, "persisted": 0,
+                         "synced": 0}
+
+    @staticmethod
+    def _buckets(e: _Entry) -> tuple[tuple[str, str], ...]:
+        return (_ANY, _ANY), (e.region, _ANY), (_ANY, e.make), (e.region, e.make)
+
+    def _index(self, key: str, e: _Entry) -> None:
+        for b in self._buckets(e):
+            insort(self._lists.setdefault(b, []), (e.price, key))
+
+    def _unindex(self, key: str, e: _Entry) -> None:
+        for b in self._buckets(e):
+            lst = self._lists[b]
+            del lst[bisect_left(lst, (e.price, key))]
+            if not lst:
+                del self._lists[b]
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+    def upsert(self, key: str, item: dict, expires_at=None) -> None:
+        """Record the cache entry *key*; anything but a priced BUY leaves the board."""
+        price = item.get("predicted_price")
+        if item.get("recommendation") != "BUY" or not isinstance(price, (int, float)):
+            self.discard(key)
+            return
+        self._set(key, item, float(price), _epoch(expires_at))
+        self._changed.add(key)
+        self._metrics["upserts"] += 1
+
+    def _set(self, key: str, item: dict, price: float, expires_at: float) -> None:
+        entry = _Entry(
+            price=price,
+            region=str(item.get("region") or "").lower(),
+            make=str(item.get("make") or "").lower(),
+            expires_at=expires_at,
+            item=item,
+        )
+        old = self._entries.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self._entries[key] = entry
+        self._index(key, entry)
+        heapq.heappush(self._expiry, (entry.expires_at, key))
+
+    def patch(self, key: str, fields: dict) -> None:
+        """Merge *fields* into an entry's item (no-op if *key* is not on the board)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.item = {**entry.item, **fields}
+            self._changed.add(key)
+
+    def discard(self, key: str) -> None:
+        if self._drop(key):
+            self._changed.add(key)
+            self._metrics["removed"] += 1
+
+    def _drop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry)
+        return entry is not None
+
+    def clear(self, keep=None) -> None:
+        """Drop every entry, or those whose item fails *keep*."""
+        for key, entry in list(self._entries.items()):
+            if keep is None or not keep(entry.item):
+                self.discard(key)
+
+    def expire(self, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        n = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            ts, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at == ts:   # else re-upserted since
+                self.discard(key)
+                n += 1
+        self._metrics["expired"] += n
+        return n
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+    def top(
+        self,
+        k: int = TOP_LIMIT,
+        region: str | None = None,
+        make: str | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+    ) -> list[dict]:
+        """The *k* cheapest live BUY entries matching the filters."""
+        self.expire()
+        self._metrics["queries"] += 1
+        lst = self._lists.get(((region or _ANY).lower(), (make or _ANY).lower()))
+        if not lst:
+            return []
+        i   = bisect_left(lst, (min_price,)) if min_price is not None else 0
+        out = []
+        for price, key in lst[i:i + k]:
+            if max_price is not None and price > max_price:
+                break
+            out.append(self._entries[key].item)
+        return out
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+    def _advance(self, doc: dict) -> None:
+        """Move the sync watermark past *doc*'s updated_at stamp."""
+        if doc.get("updated_at") is not None:
+            self._watermark = max(self._watermark, _epoch(doc["updated_at"]))
+
+    async def load(self, db) -> int:
+        """Fill the board from the persisted mirror; returns live entries loaded."""
+        now   = time.time()
+        stale = set()
+        for doc in await db[COLLECTION].find({}).to_list(None):
+            self._advance(doc)
+            if doc.get("deleted"):
+                continue
+            expires_at = _epoch(doc.get("expires_at"))
+            if expires_at > now:
+                self.upsert(doc["_id"], doc["item"], expires_at)
+            else:
+                stale.add(doc["_id"])
+        self._changed   = stale   # the rest is already persisted
+        self._synced_at = now
+        return len(self._entries)
+
+    async def rebuild(self, db, to_item=dict) -> int:
+        """Fill the board from predictions_cache (no mirror yet) and mirror it.
+
+        *to_item* turns a cache doc into the item top() returns.
+        """
+        self._watermark = self._synced_at = time.time()   # later mirror writes reach sync()
+        docs = await db["predictions_cache"].find(
+            {"recommendation": "BUY"}, {"_id": 0, "tool_outputs": 0},
+        ).to_list(None)
+        for doc in docs:
+            if doc.get("cache_key") is not None:
+                self.upsert(doc["cache_key"], to_item(doc), doc.get("expires_at"))
+        await self.persist(db)
+        return len(self._entries)
+
+    async def persist(self, db) -> int:
+        """Write entries changed since the last call to the mirror collection.
+
+        Removed entries become tombstones (kept TOMBSTONE_TTL_S) so that
+        other workers' sync() sees the removal.
+        """
+        if not self._changed:
+            return 0
+        keys, self._changed = self._changed, set()
+        now = datetime.now(timezone.utc)
+        ops = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                ops.append(ReplaceOne(
+                    {"_id": key},
+                    {"deleted": True, "updated_at": now,
+                     "expires_at": now + timedelta(seconds=TOMBSTONE_TTL_S)},
+                    upsert=True,
+                ))
+            else:
+                ops.append(ReplaceOne(
+                    {"_id": key},
+                    {"item": entry.item, "price": entry.price, "updated_at": now,
+                     "expires_at": datetime.fromtimestamp(entry.expires_at, timezone.utc)
+                                   if entry.expires_at != float("inf") else None},
+                    upsert=True,
+                ))
+        try:
+            await db[COLLECTION].bulk_write(ops, ordered=False)
+        except Exception:
+            self._changed |= keys   # retry on the next call
+            raise
+        self._metrics["persisted"] += len(ops)
+        return len(ops)
+
+    async def sync(self, db) -> dict:
+        """persist() this worker's changes, then apply mirror docs changed since the last sync.
+
+        Only docs stamped after the watermark (less _SYNC_OVERLAP_S, for
+        writes that land out of order) are read. The whole mirror is read
+        only if this board never loaded it or fell behind by more than
+        TOMBSTONE_TTL_S, when removals may have been missed. Mirror changes
+        are applied without being queued for persist(); keys with
+        unflushed local changes are left alone.
+        Returns {"persisted", "read", "added", "updated", "removed"}.
+        """
+        counts = {"persisted": await self.persist(db), "read": 0, "added": 0, "updated": 0, "removed": 0}
+        now    = time.time()
+        full   = self._synced_at is None or now - self._synced_at > TOMBSTONE_TTL_S
+        query  = {} if full else {"updated_at": {
+            "$gt": datetime.fromtimestamp(self._watermark - _SYNC_OVERLAP_S, timezone.utc)}}
+        seen   = set()
+        for doc in await db[COLLECTION].find(query).to_list(None):
+            self._advance(doc)
+            key = doc["_id"]
+            seen.add(key)
+            counts["read"] += 1
+            if key in self._changed:
+                continue
+            expires_at = _epoch(doc.get("expires_at"))
+            if doc.get("deleted") or expires_at <= now:   # the TTL index reaps the doc
+                if self._drop(key):
+                    counts["removed"] += 1
+                continue
+            old = self._entries.get(key)
+            # Mongo keeps milliseconds, so this worker's own entries come back rounded
+            if (old is not None and old.item == doc["item"]
+                    and math.isclose(old.expires_at, expires_at, abs_tol=1e-3)):
+                continue
+            self._set(key, doc["item"], float(doc["price"]), expires_at)
+            counts["updated" if old is not None else "added"] += 1
+        if full:
+            for key in [k for k in self._entries if k not in seen and k not in self._changed]:
+                self._drop(key)
+                counts["removed"] += 1
+        self._synced_at = now
+        self._metrics["synced"] += counts["added"] + counts["updated"] + counts["removed"]
+        return counts
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "regions": sum(1 for r, m in self._lists if r != _ANY and m == _ANY),
+            "makes":   sum(1 for r, m in self._lists if r == _ANY and m != _ANY),
+            "unpersisted": len(self._changed),
+            **self._metrics,
+        }
@@ -0,0 +1,2 @@
+# backend/llm/__init__.py
+"""Shared plumbing around the OpenAI calls made by the agents."""
@@ -0,0 +1,220 @@
+# backend/llm/async_client.py
+"""Shared async OpenAI client for the event-loop side of the API.
+
+The sync gateway (backend/llm/gateway.py) serves CLI / thread callers; this
+module lets async orchestrator steps await completions directly instead of
+parking one worker thread per in-flight HTTP call.
+
+  * one AsyncOpenAI client over a bounded httpx connection pool
+  * a global concurrency cap (PriorityLimiter) — interactive requests are
+    admitted ahead of background work when the cap is reached
+  * queue-wait / in-flight metrics per priority
+  * the same circuit breaker instance as the sync gateway, so both paths
+    trip and recover together
+
+Environment variables (all optional):
+  LLM_MAX_CONCURRENCY   concurrent completions      (default 16)
+  LLM_POOL_SIZE         pooled HTTP connections     (default LLM_MAX_CONCURRENCY)
+  plus OPENAI_BASE_URL / LLM_TIMEOUT_SECONDS as for the sync gateway
+"""
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+
+from backend.llm.gateway import _TRIP_ERRORS, CircuitBreaker, LLMUnavailable
+
+PRIORITIES = {"interactive": 0, "background": 1}
+
+
+class PriorityLimiter:
+    """Async counting semaphore that hands free slots to the best-priority waiter."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit    = int(limit)
+        self._active  = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq     = itertools.count()
+        self._metrics = {
+            name: {"acquired": 0, "queued": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+            for name in PRIORITIES
+        }
+
+    async def acquire(self, priority: str = "interactive") -> float:
+        """Wait for a slot; returns the time spent queued in milliseconds."""
+        rank = PRIORITIES[priority]
+        t0   = time.perf_counter()
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+        else:
+            fut = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (rank, next(self._seq), fut))
+            self._metrics[priority]["queued"] += 1
+            try:
+                await fut
+            except asyncio.CancelledError:
+                # The slot may have been handed over just before cancellation
+                if fut.done() and not fut.cancelled():
+                    self.release()
+                raise
+        waited = (time.perf_counter() - t0) * 1000
+        m = self._metrics[priority]
+        m["acquired"]      += 1
+        m["wait_ms_total"] += waited
+        m["wait_ms_max"]    = max(m["wait_ms_max"], waited)
+        return waited
+
+    def release(self) -> None:
+        # Pass the slot straight to the next live waiter; _active is unchanged
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: str = "interactive"):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict:
+        out = {
+            "limit":     self.limit,
+            "in_flight": self._active,
+            "waiting":   sum(1 for *_, f in self._waiters if not f.done()),
+        }
+        for name, m in self._metrics.items():
+            out[name] = {
+                "acquired":    m["acquired"],
+                "queued":      m["queued"],
+                "avg_wait_ms": round(m["wait_ms_total"] / m["acquired"], 2) if m["acquired"] else 0.0,
+                "max_wait_ms": round(m["wait_ms_max"], 2),
+            }
+        return out
+
+
+class AsyncLLMClient:
+    """AsyncOpenAI behind the shared breaker and a global priority limiter."""
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        max_concurrency: int = 16,
+        pool_size: int | None = None,
+        timeout_s: float = 20.0,
+    ) -> None:
+        self.breaker   = breaker
+        self.limiter   = PriorityLimiter(max_concurrency)
+        self.pool_size = int(pool_size or max_concurrency)
+        self.timeout_s = float(timeout_s)
+        self._client: AsyncOpenAI | None = None
+        self._metrics  = {"calls": 0, "ok": 0, "failures": 0, "rejected": 0}
+
+    @classmethod
+    def from_env(cls, breaker: CircuitBreaker) -> "AsyncLLMClient":
+        limit = int(os.environ.get("LLM_MAX_CONCURRENCY", 16))
+        return cls(
+            breaker,
+            max_concurrency=limit,
+            pool_size=int(os.environ.get("LLM_POOL_SIZE", limit)),
+            timeout_s=float(os.environ.get("LLM_TIMEOUT_SECONDS", 20)),
+        )
+
+    def _get_client(self) -> AsyncOpenAI:
+        # Created on first use so the httpx pool binds to the serving event loop
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=os.environ["OPENAI_API_KEY"],
+                base_url=os.environ.get("OPENAI_BASE_URL") or None,
+                timeout=self.timeout_s,
+                max_retries=0,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                    ),
+                    timeout=self.timeout_s,
+                ),
+            )
+        return self._client
+
+    async def chat(self, *, priority: str = "interactive", timeout: float | None = None, **kwargs):
+        """Awaitable chat.completions.create; raises LLMUnavailable when the breaker is open."""
+        if not self.breaker.allow():
+            self._metrics["rejected"] += 1
+            raise LLMUnavailable(f"LLM circuit breaker is {self.breaker.state}")
+
+        try:
+            async with self.limiter.slot(priority):
+                self._metrics["calls"] += 1
+                resp = await self._get_client().chat.completions.create(
+                    timeout=timeout or self.timeout_s, **kwargs,
+                )
+        except _TRIP_ERRORS:
+            self.breaker.record_failure()
+            self._metrics["failures"] += 1
+            raise
+        except openai.APIError:
+            # The service answered; the request itself was bad — not an outage
+            self.breaker.record_success()
+            self._metrics["failures"] += 1
+            raise
+        except BaseException:
+            # Cancelled while queued or mid-call: says nothing about the service
+            self.breaker.abandon()
+            raise
+        self.breaker.record_success()
+        self._metrics["ok"] += 1
+        return resp
+
+    async def stream(self, *, priority: str = "interactive", timeout: float | None = None, **kwargs):
+        """Streamed chat completion — async iterator of content deltas.
+
+        Holds its limiter slot until the stream ends; breaker accounting as
+        for chat(). Closing the iterator early counts as a cancellation.
+        """
+        if not self.breaker.allow():
+            self._metrics["rejected"] += 1
+            raise LLMUnavailable(f"LLM circuit breaker is {self.breaker.state}")
+
+        try:
+            async with self.limiter.slot(priority):
+                self._metrics["calls"] += 1
+                chunks = await self._get_client().chat.completions.create(
+                    stream=True, timeout=timeout or self.timeout_s, **kwargs,
+                )
+                async for chunk in chunks:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        except _TRIP_ERRORS:
+            self.breaker.record_failure()
+            self._metrics["failures"] += 1
+            raise
+        except openai.APIError:
+            self.breaker.record_success()
+            self._metrics["failures"] += 1
+            raise
+        except BaseException:
+            self.breaker.abandon()
+            raise
+        self.breaker.record_success()
+        self._metrics["ok"] += 1
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def stats(self) -> dict:
+        return {**self._metrics, "limiter": self.limiter.stats(), "pool_size": self.pool_size}
@@ -0,0 +1,222 @@
+# backend/llm/cache.py
+"""Content-addressed cache for chat-completion responses.
+
+run_llm_price_analysis and ExplanationAgent prompt gpt-4o-mini at low
+temperature with text built only from rounded numbers, so identical prompts
+recur across users. Responses are keyed by a SHA-256 of (model, messages,
+parameters) and kept in two tiers:
+
+  local  SQLite file (LLM_CACHE_PATH) — per host, LRU-trimmed to a size limit
+  mongo  optional shared ``llm_cache`` collection (LLM_CACHE_MONGO=1), expired
+         by a TTL index on ``expires_at``
+
+Callers store a response only after it parsed successfully, so a malformed
+reply is never replayed. A tier that errors (SQLite locked by another worker,
+a corrupt or read-only file, Mongo unreachable) counts in ``errors`` and
+behaves as a miss — the cache never fails an LLM step. A local file that
+cannot be opened at all disables that tier, leaving Mongo only (or no cache).
+
+Environment variables (all optional):
+  LLM_CACHE_ENABLED      1 / 0                (default 1)
+  LLM_CACHE_PATH         SQLite file          (default .cache/llm_cache.sqlite3)
+  LLM_CACHE_TTL_SECONDS  entry lifetime       (default 604800 — 7 days)
+  LLM_CACHE_MAX_ENTRIES  local size limit     (default 50000)
+  LLM_CACHE_MONGO        1 / 0                (default 0)
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+MONGO_COLLECTION = "llm_cache"
+
+# Trim the local tier every this many writes rather than on each one
+_EVICT_EVERY = 200
+# When over the limit, trim down to this fraction of it
+_EVICT_TO = 0.9
+
+
+def make_key(model: str, messages: list[dict], **params) -> str:
+    """SHA-256 over the canonical JSON of everything that shapes the response."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """Two-tier (SQLite + optional MongoDB) response cache with hit metrics."""
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        ttl_s: float = 7 * 24 * 3600,
+        max_entries: int = 50_000,
+        collection=None,
+    ) -> None:
+        self.ttl_s       = float(ttl_s)
+        self.max_entries = int(max_entries)
+        self._col        = collection
+        self._lock       = threading.Lock()
+        self._writes     = 0
+        self._metrics    = {
+            "hits_local": 0, "hits_mongo": 0, "misses": 0,
+            "puts": 0, "expired": 0, "evicted": 0, "errors": 0,
+        }
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            try:
+                self._conn = self._open(path)
+            except (OSError, sqlite3.Error) as exc:   # unwritable dir, read-only / corrupt file
+                self._metrics["errors"] += 1
+                print(f"[llm-cache] Local tier disabled, cannot open {path}: {exc}")
+        if self._col is not None:
+            try:
+                self._col.create_index("expires_at", expireAfterSeconds=0)
+            except Exception:
+                self._metrics["errors"] += 1
+
+    @staticmethod
+    def _open(path: str | Path) -> sqlite3.Connection:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, model TEXT, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    @classmethod
+    def from_env(cls, db=None, root: Path | None = None) -> "LLMCache | None":
+        """Build the cache from LLM_CACHE_* variables (None when disabled)."""
+        if os.environ.get("LLM_CACHE_ENABLED", "1") == "0":
+            return None
+        default = (root or Path.cwd()) / ".cache" / "llm_cache.sqlite3"
+        use_mongo = os.environ.get("LLM_CACHE_MONGO", "0") == "1" and db is not None
+        return cls(
+            path=os.environ.get("LLM_CACHE_PATH", str(default)),
+            ttl_s=float(os.environ.get("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600)),
+            max_entries=int(os.environ.get("LLM_CACHE_MAX_ENTRIES", 50_000)),
+            collection=db[MONGO_COLLECTION] if use_mongo else None,
+        )
+
+    key = staticmethod(make_key)
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+    def get(self, key: str) -> str | None:
+        """Cached response content for *key*, or None on a miss."""
+        now = time.time()
+        if self._conn is not None:
+            try:
+                with self._lock:
+                    row = self._conn.execute(
+                        "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and now - row[1] > self.ttl_s:
+                        self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                        self._metrics["expired"] += 1
+                        row = None
+                    if row is not None:
+                        self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._metrics["hits_local"] += 1
+                        return row[0]
+            except sqlite3.Error:   # locked by another worker, corrupt / read-only file
+                self._metrics["errors"] += 1
+
+        if self._col is not None:
+            try:
+                doc = self._col.find_one(
+                    {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                    {"value": 1, "model": 1},
+                )
+            except Exception:
+                doc = None
+                self._metrics["errors"] += 1
+            if doc:
+                self._metrics["hits_mongo"] += 1
+                self._put_local(key, doc["value"], doc.get("model"))
+                return doc["value"]
+
+        self._metrics["misses"] += 1
+        return None
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+    def put(self, key: str, value: str, model: str | None = None) -> None:
+        """Store a successfully parsed response in every configured tier."""
+        self._metrics["puts"] += 1
+        self._put_local(key, value, model)
+        if self._col is not None:
+            now = datetime.now(timezone.utc)
+            try:
+                self._col.replace_one(
+                    {"_id": key},
+                    {"value": value, "model": model, "created_at": now,
+                     "expires_at": now + timedelta(seconds=self.ttl_s)},
+                    upsert=True,
+                )
+            except Exception:
+                self._metrics["errors"] += 1
+
+    def _put_local(self, key: str, value: str, model: str | None) -> None:
+        if self._conn is None:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, model, value, created_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)", (key, model, value, now, now),
+                )
+                self._writes += 1
+                if self._writes % _EVICT_EVERY == 0:
+                    self._evict()
+        except sqlite3.Error:
+            self._metrics["errors"] += 1
+
+    def _evict(self) -> None:
+        """Drop expired rows, then least-recently-used rows beyond the size limit."""
+        cur = self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_s,))
+        self._metrics["expired"] += cur.rowcount
+        (n,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        if n > self.max_entries:
+            cur = self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN"
+                " (SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (n - int(self.max_entries * _EVICT_TO),),
+            )
+            self._metrics["evicted"] += cur.rowcount
+
+    def clear(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.execute("DELETE FROM llm_cache")
+        if self._col is not None:
+            self._col.delete_many({})
+
+    # ── Metrics ───────────────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        m = dict(self._metrics)
+        hits = m["hits_local"] + m["hits_mongo"]
+        m["hit_rate"] = round(hits / (hits + m["misses"]), 4) if hits + m["misses"] else 0.0
+        if self._conn is not None:
+            try:
+                with self._lock:
+                    (m["local_entries"],) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            except sqlite3.Error:
+                m["local_entries"] = None
+        m["mongo_tier"] = self._col is not None
+        return m
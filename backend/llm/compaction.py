@@ -0,0 +1,90 @@
+# backend/llm/compaction.py
+"""Compact tool results before they are sent back to the model.
+
+run_agent resends the whole transcript on every round, so each tool message
+is paid for once per remaining round. The model only needs the shape of a
+price history and the direction of each SHAP factor, not every monthly row
+or encoded feature value; the full results stay in ``tool_outputs``.
+
+  get_price_history     first / last / min / max / n plus the last few months
+  run_price_prediction  SHAP factors reduced to feature, direction, impact
+  everything else       floats rounded, long lists truncated
+
+compact_tool_result() never changes the numbers the next tool call needs
+(forecasts, prices, percentages are kept at cent precision).
+"""
+from __future__ import annotations
+import json
+from typing import Any
+
+# Monthly points kept verbatim at the end of a compacted history
+RECENT_POINTS = 3
+# Histories up to this length are sent as-is
+_HISTORY_INLINE = 6
+# Generic lists longer than this are cut, with a count of what was dropped
+_MAX_LIST = 10
+
+
+def _round(value: Any) -> Any:
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, dict):
+        return {k: _round(v) for k, v in value.items()}
+    if isinstance(value, list):
+        if len(value) > _MAX_LIST:
+            return [_round(v) for v in value[:_MAX_LIST]] + [f"... {len(value) - _MAX_LIST} more"]
+        return [_round(v) for v in value]
+    return value
+
+
+def _point(row: dict) -> dict:
+    return {"date": row.get("date"), "avg_price": _round(row.get("avg_price"))}
+
+
+def compact_history(history: list[dict]) -> Any:
+    """Summary of a get_price_history list (errors and short series pass through)."""
+    if not history or "error" in history[0] or len(history) <= _HISTORY_INLINE:
+        return _round(history)
+    priced = [r for r in history if r.get("avg_price")]
+    if not priced:
+        return {"n_months": len(history), "note": "no priced months"}
+    lo = min(priced, key=lambda r: r["avg_price"])
+    hi = max(priced, key=lambda r: r["avg_price"])
+    return {
+        "n_months": len(history),
+        "first":    _point(priced[0]),
+        "last":     _point(priced[-1]),
+        "min":      _point(lo),
+        "max":      _point(hi),
+        "recent":   [_point(r) for r in priced[-RECENT_POINTS:]],
+    }
+
+
+def compact_prediction(result: dict) -> dict:
+    """run_price_prediction without the encoded feature values."""
+    return {
+        "predicted_price": _round(result.get("predicted_price")),
+        "shap_factors": [
+            {"feature": f.get("feature"), "direction": f.get("direction"),
+             "impact": round(float(f.get("impact", 0.0)), 3)}
+            for f in result.get("shap_factors", [])
+        ],
+    }
+
+
+_COMPACTORS = {
+    "get_price_history":    compact_history,
+    "run_price_prediction": compact_prediction,
+}
+
+
+def compact_tool_result(tool_name: str, result: Any) -> Any:
+    fn = _COMPACTORS.get(tool_name)
+    if fn is not None and not (isinstance(result, dict) and "error" in result):
+        return fn(result)
+    return _round(result)
+
+
+def tool_message_content(tool_name: str, result: Any) -> str:
+    """JSON for the tool message — compact separators, compacted payload."""
+    return json.dumps(compact_tool_result(tool_name, result), default=str, separators=(",", ":"))
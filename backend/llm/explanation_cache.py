@@ -0,0 +1,195 @@
+# backend/llm/explanation_cache.py
+"""Reuse LLM-written explanations across near-identical analyses.
+
+The exact-prompt cache (backend/llm/cache.py) misses whenever the fair value
+moves by a dollar or the forecast by 0.1 %, yet the three bullets
+ExplanationAgent gets back would read the same apart from those numbers.
+This cache keys explanations by a quantized signature
+
+  make · model · recommendation · volatility · trend · inventory trend
+  · 90-day change bucket (EXPLAIN_TEMPLATE_CHANGE_STEP percentage points)
+  · price bucket (log-scale, EXPLAIN_TEMPLATE_PRICE_STEP relative width)
+
+and stores the bullets as templates: every exact number taken from the
+prompt ($ price, ±change %, confidence %, year, mileage, region, condition)
+is replaced by a placeholder, and a hit re-renders them with the new
+analysis's numbers. Bullets carrying any other number (a paraphrased SHAP
+factor, a rounded price) cannot be re-rendered faithfully and are not stored.
+
+Freshness / diversity policy: each signature keeps up to
+EXPLAIN_TEMPLATE_VARIANTS distinct variants (oldest replaced), each valid for
+EXPLAIN_TEMPLATE_TTL_SECONDS; hits pick a variant at random, and a fraction
+EXPLAIN_TEMPLATE_REFRESH_RATE of hits still go to the LLM to add a new one.
+
+Environment variables (all optional):
+  EXPLAIN_TEMPLATE_ENABLED         1 / 0                        (default 1)
+  EXPLAIN_TEMPLATE_TTL_SECONDS     variant lifetime             (default 86400)
+  EXPLAIN_TEMPLATE_VARIANTS        variants kept per signature  (default 3)
+  EXPLAIN_TEMPLATE_REFRESH_RATE    hits sent to the LLM anyway  (default 0.05)
+  EXPLAIN_TEMPLATE_CHANGE_STEP     change bucket, % points      (default 2.0)
+  EXPLAIN_TEMPLATE_PRICE_STEP      price bucket, relative       (default 0.10)
+  EXPLAIN_TEMPLATE_MAX_SIGNATURES  LRU size limit               (default 5000)
+"""
+from __future__ import annotations
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Numbers every explanation prompt contains — safe to leave in a template
+_STATIC_NUMBERS = {"30", "90"}
+_NUMBER_RE      = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_CONDITION_RE   = re.compile(r"\b(?:like new|excellent|good|fair|poor|salvage|new) condition\b", re.I)
+
+
+def _pattern(text: str) -> re.Pattern:
+    # Whole-token match: "2.5%" must not hit inside "12.5%", "2018" not inside "20180"
+    return re.compile(r"(?<![\w.,])" + re.escape(text) + r"(?!\w|[.,]\d)", re.I)
+
+
+def templatize(bullets: list[str], values: dict[str, str]) -> list[str] | None:
+    """Replace each value's exact text with ``{name}``; None if anything specific is left."""
+    texts = list(values.values())
+    if len(set(t.lower() for t in texts)) != len(texts):
+        return None   # two placeholders would render the same text — ambiguous
+    ordered = sorted(values.items(), key=lambda kv: len(kv[1]), reverse=True)
+    out: list[str] = []
+    for bullet in bullets:
+        if "{" in bullet or "}" in bullet:
+            return None
+        for name, text in ordered:
+            bullet = _pattern(text).sub("{" + name + "}", bullet)
+        rest = re.sub(r"\{\w+\}", " ", bullet)
+        if any(n not in _STATIC_NUMBERS for n in _NUMBER_RE.findall(rest)) or _CONDITION_RE.search(rest):
+            return None
+        if values.get("region") and values["region"].lower() in rest.lower():
+            return None
+        out.append(bullet)
+    return out
+
+
+def render(templates: list[str], values: dict[str, str]) -> list[str]:
+    out = []
+    for tpl in templates:
+        for name, text in values.items():
+            tpl = tpl.replace("{" + name + "}", text)
+        out.append(tpl)
+    return out
+
+
+class ExplanationTemplateCache:
+    """In-process LRU of templated explanation variants keyed by signature."""
+
+    def __init__(
+        self,
+        ttl_s: float = 86_400,
+        variants: int = 3,
+        refresh_rate: float = 0.05,
+        change_step: float = 2.0,
+        price_step: float = 0.10,
+        max_signatures: int = 5_000,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.ttl_s          = float(ttl_s)
+        self.variants       = max(1, int(variants))
+        self.refresh_rate   = float(refresh_rate)
+        self.change_step    = float(change_step)
+        self.price_step     = float(price_step)
+        self.max_signatures = int(max_signatures)
+        self._rng      = rng or random.Random()
+        self._lock     = threading.Lock()
+        # signature → [(created_at, templates), ...]
+        self._entries: OrderedDict[str, list[tuple[float, list[str]]]] = OrderedDict()
+        self._metrics  = {
+            "hits": 0, "misses": 0, "refreshes": 0, "stored": 0,
+            "untemplatable": 0, "expired": 0, "evicted": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "ExplanationTemplateCache | None":
+        """Build the cache from EXPLAIN_TEMPLATE_* variables (None when disabled)."""
+        if os.environ.get("EXPLAIN_TEMPLATE_ENABLED", "1") == "0":
+            return None
+        return cls(
+            ttl_s=float(os.environ.get("EXPLAIN_TEMPLATE_TTL_SECONDS", 86_400)),
+            variants=int(os.environ.get("EXPLAIN_TEMPLATE_VARIANTS", 3)),
+            refresh_rate=float(os.environ.get("EXPLAIN_TEMPLATE_REFRESH_RATE", 0.05)),
+            change_step=float(os.environ.get("EXPLAIN_TEMPLATE_CHANGE_STEP", 2.0)),
+            price_step=float(os.environ.get("EXPLAIN_TEMPLATE_PRICE_STEP", 0.10)),
+            max_signatures=int(os.environ.get("EXPLAIN_TEMPLATE_MAX_SIGNATURES", 5_000)),
+        )
+
+    def signature(
+        self, make: str, model: str, recommendation: str, volatility: str,
+        trend_direction: str, inventory_trend: str, change_pct: float, price: float,
+    ) -> str:
+        # Buckets never straddle zero, so the direction word in a template stays right
+        change_bucket = math.floor(change_pct / self.change_step)
+        price_bucket  = math.floor(math.log(max(price, 1.0)) / math.log1p(self.price_step))
+        return "|".join(str(p).lower() for p in (
+            make, model, recommendation, volatility, trend_direction, inventory_trend,
+            change_bucket, price_bucket,
+        ))
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+    def lookup(self, signature: str) -> list[str] | None:
+        """A fresh template variant for *signature*, or None → call the LLM."""
+        now = time.time()
+        with self._lock:
+            variants = self._entries.get(signature)
+            if variants:
+                live = [v for v in variants if now - v[0] <= self.ttl_s]
+                self._metrics["expired"] += len(variants) - len(live)
+                if live:
+                    self._entries[signature] = live
+                    self._entries.move_to_end(signature)
+                else:
+                    del self._entries[signature]
+                variants = live
+            if not variants:
+                self._metrics["misses"] += 1
+                return None
+            if self._rng.random() < self.refresh_rate:
+                self._metrics["refreshes"] += 1
+                return None
+            self._metrics["hits"] += 1
+            return list(self._rng.choice(variants)[1])
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+    def store(self, signature: str, bullets: list[str], values: dict[str, str]) -> bool:
+        """Templatize LLM *bullets* and keep them as a variant; False if not reusable."""
+        templates = templatize(bullets, values)
+        with self._lock:
+            if templates is None:
+                self._metrics["untemplatable"] += 1
+                return False
+            variants = [v for v in self._entries.get(signature, []) if v[1] != templates]
+            variants.append((time.time(), templates))
+            self._entries[signature] = variants[-self.variants:]
+            self._entries.move_to_end(signature)
+            self._metrics["stored"] += 1
+            while len(self._entries) > self.max_signatures:
+                self._entries.popitem(last=False)
+                self._metrics["evicted"] += 1
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ── Metrics ───────────────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        with self._lock:
+            m = dict(self._metrics)
+            m["signatures"] = len(self._entries)
+            m["variants"]   = sum(len(v) for v in self._entries.values())
+        served = m["hits"] + m["misses"] + m["refreshes"]
+        m["hit_rate"] = round(m["hits"] / served, 4) if served else 0.0
+        m["policy"] = {
+            "ttl_s": self.ttl_s, "variants": self.variants, "refresh_rate": self.refresh_rate,
+            "change_step": self.change_step, "price_step": self.price_step,
+        }
+        return m
@@ -0,0 +1,172 @@
+# backend/llm/gateway.py
+"""Single choke point for every OpenAI chat-completion call.
+
+One shared client (bounded per-call deadline, no SDK retries) behind a
+CLOSED → OPEN → HALF-OPEN circuit breaker:
+
+  CLOSED     calls pass through; consecutive transport failures are counted
+  OPEN       after LLM_BREAKER_FAILURES failures, calls fail fast with
+             LLMUnavailable so agents drop straight to their deterministic
+             fallbacks instead of each waiting out a timeout
+  HALF-OPEN  after LLM_BREAKER_RESET_SECONDS, one probe call is let through;
+             success closes the breaker, failure re-opens it
+
+Only timeouts, connection errors, 429s and 5xx trip the breaker — a 4xx
+means the service is up and the request itself was wrong.
+
+Environment variables (all optional):
+  OPENAI_BASE_URL             point at a local fake server for testing
+  LLM_TIMEOUT_SECONDS         default per-call deadline   (default 20)
+  LLM_BREAKER_FAILURES        failures before opening     (default 5)
+  LLM_BREAKER_RESET_SECONDS   open → half-open cool-down  (default 30)
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+
+import openai
+from openai import OpenAI
+
+CLOSED, OPEN, HALF_OPEN = "CLOSED", "OPEN", "HALF_OPEN"
+
+_TRIP_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class LLMUnavailable(RuntimeError):
+    """Raised instead of calling OpenAI while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure breaker with a single half-open probe."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_s: float = 30.0) -> None:
+        self.failure_threshold = int(failure_threshold)
+        self.reset_timeout_s   = float(reset_timeout_s)
+        self._state     = CLOSED
+        self._failures  = 0
+        self._opened_at = 0.0
+        self._probing   = False
+        self._trips     = 0
+        self._lock      = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_s:
+            self._state, self._probing = HALF_OPEN, False
+
+    def _open(self) -> None:
+        self._state, self._opened_at, self._probing = OPEN, time.monotonic(), False
+        self._trips += 1
+
+    def allow(self) -> bool:
+        """True if a call may proceed now (claims the probe slot when half-open)."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state, self._failures, self._probing = CLOSED, 0, False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                return
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def abandon(self) -> None:
+        """A call was cancelled before it finished — free the probe slot, change nothing else."""
+        with self._lock:
+            self._probing = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state":                self._state,
+                "consecutive_failures": self._failures,
+                "trips":                self._trips,
+            }
+
+
+class LLMGateway:
+    """Shared OpenAI client with per-call deadlines, breaker and call metrics."""
+
+    def __init__(self, client: OpenAI, breaker: CircuitBreaker, timeout_s: float = 20.0) -> None:
+        self.client    = client
+        self.breaker   = breaker
+        self.timeout_s = float(timeout_s)
+        self._lock     = threading.Lock()
+        self._metrics  = {
+            "calls": 0, "ok": 0, "failures": 0, "timeouts": 0,
+            "rejected": 0, "latency_ms_total": 0.0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "LLMGateway":
+        timeout_s = float(os.environ.get("LLM_TIMEOUT_SECONDS", 20))
+        client = OpenAI(
+            api_key=os.environ["OPENAI_API_KEY"],
+            base_url=os.environ.get("OPENAI_BASE_URL") or None,
+            timeout=timeout_s,
+            max_retries=0,
+        )
+        breaker = CircuitBreaker(
+            failure_threshold=int(os.environ.get("LLM_BREAKER_FAILURES", 5)),
+            reset_timeout_s=float(os.environ.get("LLM_BREAKER_RESET_SECONDS", 30)),
+        )
+        return cls(client, breaker, timeout_s)
+
+    def _count(self, **deltas) -> None:
+        with self._lock:
+            for k, v in deltas.items():
+                self._metrics[k] += v
+
+    def chat(self, *, timeout: float | None = None, **kwargs):
+        """chat.completions.create with a deadline; raises LLMUnavailable when open."""
+        if not self.breaker.allow():
+            self._count(rejected=1)
+            raise LLMUnavailable(f"LLM circuit breaker is {self.breaker.state}")
+
+        t0 = time.perf_counter()
+        try:
+            resp = self.client.chat.completions.create(timeout=timeout or self.timeout_s, **kwargs)
+        except _TRIP_ERRORS as exc:
+            self.breaker.record_failure()
+            self._count(calls=1, failures=1, timeouts=int(isinstance(exc, openai.APITimeoutError)),
+                        latency_ms_total=(time.perf_counter() - t0) * 1000)
+            raise
+        except Exception:
+            # The service answered; the request itself was bad — not an outage
+            self.breaker.record_success()
+            self._count(calls=1, failures=1, latency_ms_total=(time.perf_counter() - t0) * 1000)
+            raise
+        self.breaker.record_success()
+        self._count(calls=1, ok=1, latency_ms_total=(time.perf_counter() - t0) * 1000)
+        return resp
+
+    def stats(self) -> dict:
+        with self._lock:
+            m = dict(self._metrics)
+        m["avg_latency_ms"] = round(m.pop("latency_ms_total") / m["calls"], 1) if m["calls"] else 0.0
+        m["breaker"] = self.breaker.stats()
+        return m
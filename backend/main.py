@@ -2,22 +2,40 @@
 main.py — FastAPI backend for Car Price Intelligence
 Endpoints: /health  /api/cars  /api/predict  /api/market-overview
            /api/shap-importance  /api/clear-cache  /api/seed-market
+           /api/metrics  /api/predict/explanation/{token}[/stream]  /api/query
+           /api/predict/stream  /api/makes[/{make}/models[/{model}/years]]
+           /api/catalog/suggest  /api/market-overview/top-buys
+           /api/admin/indexes
 """
-import os, sys, asyncio, hashlib, json
+import os, sys, asyncio, hashlib, time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 import joblib, numpy as np
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 
 _ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agents.orchestrator import run_orchestrator
+from backend.agents.orchestrator import (
+    arun_orchestrator, run_orchestrator, apply_explanation, EXPLAIN_MODES,
+)
+from backend.agents import explanation_agent
+from backend.agent import (
+    snapshot_store, llm, allm, llm_cache, explanation_templates, arun_llm_parse_query,
+    index_manager,
+)
+from backend.query_parser import parse_query
 from backend.utils.validation import validate_predict_params
-from backend.car_catalog import CATALOG as _CAR_CATALOG
+from backend.catalog_service import CatalogService, SUGGEST_LIMIT, SUGGEST_LIMIT_MAX
+from backend.leaderboard import BuyLeaderboard, TOP_LIMIT, TOP_LIMIT_MAX
+from backend.market_overview import MarketOverviewService
+from backend.utils.fast_json import FastJSONResponse, dumps
+from backend.utils.response_profiles import mongo_projection, pick, resolve as resolve_profile
+from backend.utils.http_cache import CACHE_CONTROL, accepts_gzip, etag_matches
 
 load_dotenv(_ROOT / ".env")
 
@@ -28,16 +46,65 @@ app = FastAPI(title="Car Price Intelligence API")
 async def _clean_stale_cache():
     """
     On every server restart:
+      0. Create missing hot-path indexes (DB_ENSURE_INDEXES=0 skips).
+         Load price_series into the in-memory snapshot store and build the
+         /api/cars payload; both poll the ingest version stamp for atomic
+         refreshes.
       1. Wipe ALL non-seed prediction cache entries so stale results
          (wrong signals, bad forecasts, old logic) never linger.
-      2. Force-refresh all seed BUY opportunities so Tab-2 always has data.
+      2. Force-refresh all seed BUY opportunities so Tab-2 always has data,
+         and load the BUY leaderboard from its persisted mirror.
+      3. Materialize the market overview and start its background refresh.
     This is intentional for the demo environment — analyses are fast enough
     that re-running them on demand is preferable to serving stale results.
     """
+    if os.environ.get("DB_ENSURE_INDEXES", "1") != "0":
+        try:
+            report  = await asyncio.to_thread(index_manager.report, True)
+            created = [i["name"] for i in report["indexes"] if i["status"] == "created"]
+            print(f"[startup] Indexes: created {created or 'none'}, "
+                  f"problems {report['missing'] or 'none'}, collection scans {report['collscans'] or 'none'}")
+        except Exception as exc:
+            print(f"[startup] Index check failed ({exc}) — see /api/admin/indexes")
+    try:
+        await asyncio.to_thread(snapshot_store.load)
+        print(f"[startup] Snapshot store loaded: {snapshot_store.stats()['n_series']:,} series in memory")
+    except Exception as exc:
+        print(f"[startup] Snapshot store unavailable ({exc}) — falling back to MongoDB reads")
+    snapshot_store.start_polling(float(os.environ.get("SNAPSHOT_POLL_SECONDS", 60)))
+    try:
+        payload = await catalog_service.refresh()
+        print(f"[startup] /api/cars payload built: {payload.n_rows:,} rows, "
+              f"{len(payload.body_gz) / 1024:.0f} KB gzipped")
+    except Exception as exc:
+        print(f"[startup] /api/cars payload not built ({exc}) — building on first request")
+    catalog_service.start_polling(float(os.environ.get("SNAPSHOT_POLL_SECONDS", 60)))
+
     r = await _db["predictions_cache"].delete_many({"is_seed": {"$ne": True}})
     print(f"[startup] Cleared {r.deleted_count} stale prediction cache entries")
+    if await leaderboard.load(_db):
+        leaderboard.clear(keep=lambda item: item.get("is_seed"))   # mirror the wipe above
+    else:
+        await leaderboard.rebuild(_db, _leaderboard_item)
+    print(f"[startup] BUY leaderboard loaded: {len(leaderboard)} entries")
     seeded = await _seed_market_data(force=True)
     print(f"[startup] Refreshed {seeded} seed BUY entries")
+    try:
+        if await market_overview_service.load_persisted():
+            # Serve the last worker's overview now; the loop recomputes it shortly
+            print("[startup] Serving persisted market overview until the first recompute")
+            market_overview_service.mark_dirty()
+        else:
+            snap = await market_overview_service.refresh()
+            print(f"[startup] Market overview materialized in {snap.compute_ms} ms")
+    except Exception as exc:
+        print(f"[startup] Market overview not built ({exc}) — building on first request")
+    market_overview_service.start()
+
+
+@app.on_event("shutdown")
+async def _close_llm_client():
+    await allm.aclose()
 
 
 app.add_middleware(
@@ -48,6 +115,8 @@ app.add_middleware(
 )
 
 _db   = AsyncIOMotorClient(os.environ["MONGO_URI"])["carmarket"]
+catalog_service = CatalogService(_db)
+leaderboard     = BuyLeaderboard()
 _shap = joblib.load(_ROOT / "models" / "shap_data.pkl") if (_ROOT / "models" / "shap_data.pkl").exists() else None
 
 # ── Fallback seasonality (US used-car market industry averages) ─────────────
@@ -167,14 +236,33 @@ _SEED_BUYS = [
 ]
 
 
-def _clean(obj):
-    """Strip MongoDB internals and make JSON-safe."""
-    return json.loads(json.dumps(obj, default=str, skipkeys=False)
-                      .replace('"_id":', '"__id_skip":')  )  # ObjectId gone via default=str
-
 def _safe(doc: dict) -> dict:
+    """Drop cache internals; BSON types are left for FastJSONResponse to encode."""
     doc.pop("_id", None); doc.pop("expires_at", None); doc.pop("cache_key", None)
-    return json.loads(json.dumps(doc, default=str))
+    doc.pop("explanation_request", None); doc.pop("explanation_started_at", None)
+    return doc
+
+
+# Read on every cache hit to decide whether the entry is usable
+_CACHE_CHECK_FIELDS = (
+    "cache_key", "final_recommendation", "recommendation", "tool_outputs.run_forecast.error",
+    "explanation_status", "explanation_started_at", "explanation_request",
+)
+
+
+def _shape(doc: dict, paths: list[str] | None, profile: str, cache_hit: bool) -> dict:
+    """Response body for *profile* / *paths* (None = whole document)."""
+    if paths is not None:
+        return pick(_safe(doc), paths)
+    if profile == "debug":   # keep cache internals
+        doc.pop("_id", None)
+        return {**doc, "cache_hit": cache_hit}
+    return _safe(doc)
+
+
+def _leaderboard_item(doc: dict) -> dict:
+    """A predictions_cache doc as listed in top_buys."""
+    return _safe({k: v for k, v in doc.items() if k != "tool_outputs"})
 
 
 # ── Health ─────────────────────────────────────────────────────────────────────
@@ -184,22 +272,229 @@ async def health():
     return {"status": "ok", "db": "connected"}
 
 
+# ── Metrics ────────────────────────────────────────────────────────────────────
+@app.get("/api/metrics")
+async def metrics():
+    """In-process counters: LLM gateway / breaker, response + template caches, snapshot store, catalogue, market overview."""
+    return {
+        "llm_gateway":           llm.stats(),
+        "llm_async":             allm.stats(),
+        "llm_cache":             await asyncio.to_thread(llm_cache.stats) if llm_cache else {"enabled": False},
+        "explanation_templates": explanation_templates.stats() if explanation_templates else {"enabled": False},
+        "snapshot_store":        snapshot_store.stats(),
+        "catalog":               catalog_service.stats(),
+        "market_overview":       market_overview_service.stats(),
+        "buy_leaderboard":       leaderboard.stats(),
+    }
+
+
+# ── Admin: indexes ─────────────────────────────────────────────────────────────
+@app.get("/api/admin/indexes")
+async def admin_indexes():
+    """Required indexes present? Canonical queries on an index? (read-only)"""
+    return await asyncio.to_thread(index_manager.report, False)
+
+
+@app.post("/api/admin/indexes")
+async def admin_ensure_indexes():
+    """Create missing required indexes, then report."""
+    return await asyncio.to_thread(index_manager.report, True)
+
+
 # ── Cars catalogue ─────────────────────────────────────────────────────────────
 @app.get("/api/cars")
-async def cars():
-    pipeline = [
-        {"$group": {"_id": {"make": "$make", "model": "$model", "year": "$year"}}},
-        {"$project": {"_id": 0, "make": "$_id.make", "model": "$_id.model", "year": "$_id.year"}},
-        {"$sort": {"make": 1, "model": 1, "year": -1}},
-    ]
-    db_results = await _db["listings"].aggregate(pipeline).to_list(5000)
-    # Always merge DB results with the static catalog so all 20 makes appear
-    # even when MongoDB listings is partially ingested (e.g. missing Ford/Jeep).
-    # DB entries take priority; catalog fills any gaps.
-    seen = {(r["make"], r["model"], r["year"]) for r in db_results}
-    extras = [r for r in _CAR_CATALOG if (r["make"], r["model"], r["year"]) not in seen]
-    combined = db_results + extras
-    return sorted(combined, key=lambda r: (r.get("make") or "", r.get("model") or "", -(r.get("year") or 0)))
+async def cars(request: Request):
+    """Merged listings + static catalogue, pre-built (see backend/catalog_service.py)."""
+    payload = await catalog_service.get()
+    gz      = accepts_gzip(request.headers.get("accept-encoding"))
+    etag    = payload.etag_gz if gz else payload.etag
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag, payload.etag_gz):
+        catalog_service.count("not_modified")
+        return Response(status_code=304, headers=headers)
+    catalog_service.count("served_gzip" if gz else "served")
+    if gz:
+        headers["Content-Encoding"] = "gzip"
+    return Response(payload.body_gz if gz else payload.body, media_type="application/json", headers=headers)
+
+
+def _catalog_json(request: Request, payload, content) -> Response:
+    """Small catalogue lookups: JSON, revalidated against the payload generation's ETag."""
+    headers = {"ETag": payload.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag, payload.etag_gz):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content, headers=headers)
+
+
+@app.get("/api/makes")
+async def catalog_makes(request: Request):
+    """[{make, listings}] — the make dropdown without downloading /api/cars."""
+    payload = await catalog_service.get()
+    return _catalog_json(request, payload, payload.index.makes())
+
+
+@app.get("/api/makes/{make}/models")
+async def catalog_models(make: str, request: Request):
+    payload = await catalog_service.get()
+    models  = payload.index.models(make.strip().lower())
+    if models is None:
+        raise HTTPException(status_code=404, detail=f"Unknown make '{make}'")
+    return _catalog_json(request, payload, models)
+
+
+# {model:path} — trims such as "mdx 3.5l w/advance" contain a slash
+@app.get("/api/makes/{make}/models/{model:path}/years")
+async def catalog_years(make: str, model: str, request: Request):
+    payload = await catalog_service.get()
+    years   = payload.index.years(make.strip().lower(), model.strip().lower())
+    if years is None:
+        raise HTTPException(status_code=404, detail=f"Unknown model '{make} {model}'")
+    return _catalog_json(request, payload, years)
+
+
+@app.get("/api/catalog/suggest")
+async def catalog_suggest(request: Request, q: str = "", limit: int = SUGGEST_LIMIT):
+    """Prefix autocomplete over makes and models, most-listed first."""
+    payload = await catalog_service.get()
+    limit   = max(1, min(limit, SUGGEST_LIMIT_MAX))
+    return _catalog_json(request, payload, payload.index.suggest(q, limit))
+
+
+# ── Deferred explanations ──────────────────────────────────────────────────────
+# /api/predict?explain=deferred answers with the deterministic report and an
+# explanation_token; the LLM explanation is written into the same cache doc by
+# a background task and read back via /api/predict/explanation/{token}.
+# /api/predict/stream instead streams the explanation to the caller itself and
+# registers as that token's task while it does.
+_EXPLAIN_STREAM_SECONDS = 30.0   # SSE gives up (event: timeout) after this
+_EXPLAIN_STALE_SECONDS  = 60.0   # pending with no task for this long → relaunch
+_explain_tasks:  dict[str, asyncio.Task]  = {}
+_explain_events: dict[str, asyncio.Event] = {}
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {dumps(data).decode()}\n\n"
+
+
+async def _store_explanation(token: str, exp_out: dict) -> None:
+    doc = await _db["predictions_cache"].find_one({"cache_key": token}, {"agent_log": 1})
+    if doc is not None:   # cache may have been cleared meanwhile
+        fields = apply_explanation(doc, exp_out)
+        await _db["predictions_cache"].update_one(
+            {"cache_key": token},
+            {"$set": fields, "$unset": {"explanation_request": ""}},
+        )
+        leaderboard.patch(token, fields)
+        market_overview_service.mark_dirty()   # top_buys carry the explanation
+
+
+def _claim_explanation(token: str, task: asyncio.Task) -> None:
+    _explain_events[token] = asyncio.Event()
+    _explain_tasks[token]  = task
+
+
+def _release_explanation(token: str) -> None:
+    """Forget *token*'s task and wake everyone waiting on it."""
+    _explain_tasks.pop(token, None)
+    event = _explain_events.pop(token, None)
+    if event is not None:
+        event.set()
+
+
+async def _generate_explanation(token: str, request: dict) -> None:
+    """Background task: LLM explanation → predictions_cache, then wake SSE waiters."""
+    try:
+        await _store_explanation(token, await explanation_agent.arun(**request, priority="background"))
+    except Exception as exc:
+        print(f"[explain] {token}: {exc} — keeping template explanation")
+        await _db["predictions_cache"].update_one(
+            {"cache_key": token}, {"$set": {"explanation_status": "failed"}},
+        )
+    finally:
+        _release_explanation(token)
+
+
+def _schedule_explanation(token: str, request: dict) -> None:
+    if token in _explain_tasks:
+        return
+    # Created unstarted, so the claim is in place before the task first runs
+    _claim_explanation(token, asyncio.create_task(_generate_explanation(token, request)))
+
+
+async def _ensure_explanation(doc: dict) -> None:
+    """Relaunch a pending explanation whose task died (restart, other worker crash)."""
+    token = doc.get("cache_key")
+    if doc.get("explanation_status") != "pending" or token in _explain_tasks:
+        return
+    if time.time() - doc.get("explanation_started_at", 0) < _EXPLAIN_STALE_SECONDS:
+        return   # probably still running in another worker
+    if not doc.get("explanation_request"):
+        return
+    await _db["predictions_cache"].update_one(
+        {"cache_key": token}, {"$set": {"explanation_started_at": time.time()}},
+    )
+    _schedule_explanation(token, doc["explanation_request"])
+
+
+def _explanation_payload(token: str, doc: dict) -> dict:
+    return {
+        "explanation_token":  token,
+        "explanation_status": doc.get("explanation_status", "ready"),
+        "reasoning_summary":  doc.get("reasoning_summary", []),
+        "explanation":        doc.get("explanation", ""),
+    }
+
+
+_EXPLANATION_FIELDS = {
+    "_id": 0, "cache_key": 1, "explanation_status": 1, "reasoning_summary": 1,
+    "explanation": 1, "explanation_request": 1, "explanation_started_at": 1,
+}
+
+
+@app.get("/api/predict/explanation/{token}")
+async def predict_explanation(token: str):
+    """Current explanation for a deferred prediction (status pending | ready | failed)."""
+    doc = await _db["predictions_cache"].find_one({"cache_key": token}, _EXPLANATION_FIELDS)
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired explanation token")
+    await _ensure_explanation(doc)
+    return _explanation_payload(token, doc)
+
+
+async def _await_explanation(token: str, doc: dict) -> tuple[str, dict]:
+    """Wait until *doc* stops being pending → (SSE event name, payload)."""
+    current  = doc
+    deadline = time.monotonic() + _EXPLAIN_STREAM_SECONDS
+    while current is not None and current.get("explanation_status") == "pending":
+        if time.monotonic() >= deadline:
+            return "timeout", _explanation_payload(token, current)
+        # Woken by a task in this process; the 1 s poll covers other workers
+        event = _explain_events.get(token)
+        try:
+            await asyncio.wait_for(event.wait() if event else asyncio.sleep(1.0), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+        current = await _db["predictions_cache"].find_one({"cache_key": token}, _EXPLANATION_FIELDS)
+    if current is None:
+        return "error", {"detail": "Explanation token expired"}
+    return "explanation", _explanation_payload(token, current)
+
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@app.get("/api/predict/explanation/{token}/stream")
+async def predict_explanation_stream(token: str):
+    """Server-sent events: one `explanation` event when ready, or `timeout`."""
+    doc = await _db["predictions_cache"].find_one({"cache_key": token}, _EXPLANATION_FIELDS)
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired explanation token")
+    await _ensure_explanation(doc)
+
+    async def events():
+        yield _sse(*await _await_explanation(token, doc))
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
 
 
 # ── Predict / analyse ──────────────────────────────────────────────────────────
@@ -207,17 +502,110 @@ async def cars():
 async def predict(
     make: str, model: str, year: int,
     mileage: int = 50000, condition: str = "good", region: str = "california",
+    explain: str = "inline", mode: str = "full", profile: str = "full", fields: str | None = None,
+):
+    """explain=deferred returns the deterministic report at once with
+    explanation_status "pending" and an explanation_token (see above).
+    mode=fast skips OpenAI entirely (statistical forecast, template explanation).
+    profile=summary|full|debug / fields=a,b.c trim the response (see
+    backend/utils/response_profiles.py)."""
+    return FastJSONResponse(await _predict(
+        make, model, year, mileage, condition, region, explain, mode, profile=profile, fields=fields,
+    ))
+
+
+@app.get("/api/predict/stream")
+async def predict_stream(
+    make: str, model: str, year: int,
+    mileage: int = 50000, condition: str = "good", region: str = "california",
 ):
+    """Server-sent events for the analyse panel:
+
+      report    deterministic report (explain=deferred), sent before any LLM call
+      bullet    {"index", "text"} per reasoning bullet as the completion streams
+      done      final explanation payload (also written to predictions_cache)
+    """
+    report = await _predict(make, model, year, mileage, condition, region,
+                            explain="deferred", schedule=False)
+    token  = report.get("explanation_token")
+
+    async def events():
+        yield _sse("report", report)
+        if report.get("explanation_status") != "pending":
+            # Cached and ready (or a demo result): replay the stored bullets
+            for i, text in enumerate(report.get("reasoning_summary", [])):
+                yield _sse("bullet", {"index": i, "text": text})
+            yield _sse("done", _explanation_payload(token, report))
+            return
+        if token in _explain_tasks:
+            # Another request is already generating it — wait for that one
+            name, payload = await _await_explanation(token, report)
+            for i, text in enumerate(payload.get("reasoning_summary", []) if name == "explanation" else []):
+                yield _sse("bullet", {"index": i, "text": text})
+            yield _sse("done" if name == "explanation" else name, payload)
+            return
+
+        doc = await _db["predictions_cache"].find_one({"cache_key": token}, {"explanation_request": 1})
+        request = (doc or {}).get("explanation_request")
+        if not request:
+            yield _sse("error", {"detail": "Explanation token expired"})
+            return
+        _claim_explanation(token, asyncio.current_task())
+        finished = False
+        try:
+            sent = 0
+            async for kind, value in explanation_agent.astream(**request, priority="interactive"):
+                if kind == "bullet":
+                    yield _sse("bullet", {"index": sent, "text": value})
+                    sent += 1
+                else:
+                    await _store_explanation(token, value)
+                    finished = True
+                    yield _sse("done", _explanation_payload(token, {
+                        "reasoning_summary": value["reasoning_summary"],
+                        "explanation":       value["explanation_text"],
+                    }))
+        finally:
+            _release_explanation(token)
+            if not finished:
+                # Client went away mid-stream — finish it in the background
+                _schedule_explanation(token, request)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
+async def _predict(
+    make: str, model: str, year: int, mileage: int, condition: str, region: str,
+    explain: str = "inline", mode: str = "full", schedule: bool = True,
+    profile: str = "full", fields: str | None = None,
+) -> dict:
+    """Validate → predictions_cache lookup → orchestrator → cache write (shared by /api/query).
+
+    schedule=False leaves a pending explanation for the caller to generate.
+    """
     # ── Input validation ──────────────────────────────────────────────────────
     errors = validate_predict_params(
         {"make": make, "model": model, "year": year, "mileage": mileage,
          "condition": condition, "region": region}
     )
+    if explain not in EXPLAIN_MODES:
+        errors.append(f"explain must be one of {', '.join(EXPLAIN_MODES)}")
+    if mode not in ("full", "fast"):
+        errors.append("mode must be one of full, fast")
+    paths, profile_errors = resolve_profile(profile, fields)
+    errors.extend(profile_errors)
     if errors:
         raise HTTPException(status_code=422, detail="; ".join(errors))
 
     key = hashlib.md5(f"{make}{model}{year}{mileage}{condition}{region}".encode()).hexdigest()
-    cached = await _db["predictions_cache"].find_one({"cache_key": key})
+    # Statistical forecast ≠ LLM-blended forecast — never share entries
+    if mode == "fast":
+        key = f"fast:{key}"
+    elif explain == "deferred":
+        key = f"deferred:{key}"
+    # Trimmed profiles fetch only their fields (+ what the validity checks read)
+    projection = mongo_projection([*paths, *_CACHE_CHECK_FIELDS]) if paths is not None else None
+    cached = await _db["predictions_cache"].find_one({"cache_key": key}, projection)
     # Reject cache if forecast errored
     _forecast_errored = bool(
         (cached or {}).get("tool_outputs", {}).get("run_forecast", {}).get("error")
@@ -228,12 +616,20 @@ async def predict(
         (cached or {}).get("recommendation") in ("BUY", "WAIT", "NEUTRAL")
     )
     if cached and _has_result and not _forecast_errored:
-        return _safe(cached)
+        if schedule:
+            await _ensure_explanation(cached)
+        return _shape(cached, paths, profile, cache_hit=True)
 
     try:
-        result = await asyncio.to_thread(
-            run_orchestrator, make, model, year, mileage, condition, region
-        )
+        if mode == "fast":
+            # No awaits on this path — one worker-thread hop for the whole pipeline
+            result = await asyncio.to_thread(
+                run_orchestrator, make, model, year, mileage, condition, region, llm_mode="fast",
+            )
+        else:
+            result = await arun_orchestrator(
+                make, model, year, mileage, condition, region, priority="interactive", explain=explain,
+            )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -249,9 +645,41 @@ async def predict(
         "cache_key":  key,
         "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
     }
+    pending = doc.get("explanation_status") == "pending"
+    if pending:
+        doc["explanation_token"]      = key
+        doc["explanation_started_at"] = time.time()
     # Upsert so stale/error cache entries are replaced
     await _db["predictions_cache"].replace_one({"cache_key": key}, doc, upsert=True)
-    return _safe(doc)
+    leaderboard.upsert(key, _leaderboard_item(doc), doc["expires_at"])
+    market_overview_service.mark_dirty()
+    if pending and schedule:
+        _schedule_explanation(key, doc["explanation_request"])
+    return _shape(doc, paths, profile, cache_hit=False)
+
+
+# ── Natural-language query ────────────────────────────────────────────────────
+@app.get("/api/query")
+async def query(
+    q: str, explain: str = "inline", mode: str = "full", profile: str = "full", fields: str | None = None,
+):
+    """Parse a free-text question locally (LLM only as a fallback), then /api/predict."""
+    t0     = time.perf_counter()
+    parsed = parse_query(q)
+    parse_ms = round((time.perf_counter() - t0) * 1000, 3)
+    parser = "local"
+    if parsed is None and mode != "fast":
+        parsed = await arun_llm_parse_query(q, priority="interactive")
+        parser = "llm"
+    if parsed is None:
+        raise HTTPException(
+            status_code=422,
+            detail="Could not identify make, model and year in the query — try e.g. '2018 Toyota Camry'",
+        )
+    result = await _predict(**parsed, explain=explain, mode=mode, profile=profile, fields=fields)
+    return FastJSONResponse(
+        {**result, "parsed_query": {**parsed, "text": q, "parser": parser, "parse_ms": parse_ms}}
+    )
 
 
 # ── Industry baseline constants (derived from cleaned_cars.csv, 328k listings) ─
@@ -281,6 +709,7 @@ async def _seed_market_data(force: bool = False) -> int:
             "expires_at":   datetime.now(timezone.utc) + timedelta(days=90),
         }
         res = await _db["predictions_cache"].replace_one({"cache_key": seed_key}, doc, upsert=True)
+        leaderboard.upsert(seed_key, _leaderboard_item(doc), doc["expires_at"])
         if res.upserted_id or res.modified_count:
             upserted += 1
     return upserted
@@ -290,6 +719,7 @@ async def _seed_market_data(force: bool = False) -> int:
 async def seed_market():
     """Force-refresh all seed BUY opportunities in the cache."""
     inserted = await _seed_market_data(force=True)
+    market_overview_service.mark_dirty()
     total = await _db["predictions_cache"].count_documents({"recommendation": "BUY"})
     return {
         "seeded": inserted,
@@ -299,8 +729,8 @@ async def seed_market():
 
 
 # ── Market overview ────────────────────────────────────────────────────────────
-@app.get("/api/market-overview")
-async def market_overview():
+async def _compute_market_overview() -> dict:
+    """Full recompute — run by market_overview_service, never per request."""
     # ── Always ensure seed data exists ───────────────────────────────────────
     seed_count = await _db["predictions_cache"].count_documents({"is_seed": True, "recommendation": "BUY"})
     if seed_count < len(_SEED_BUYS):
@@ -330,11 +760,13 @@ async def market_overview():
         mom_pct      = _INDUSTRY_MOM_PCT
         price_source = "industry"
 
-    # ── Top BUY opportunities (seeds + real predictions, sorted by price) ────
-    top_buys = await _db["predictions_cache"].find(
-        {"recommendation": "BUY"},
-        {"_id": 0, "cache_key": 0, "expires_at": 0, "tool_outputs": 0},
-    ).sort("predicted_price", 1).limit(10).to_list(10)
+    # ── Top BUY opportunities (seeds + real predictions, cheapest first) ─────
+    # Flush this worker's BUY changes and pick up other workers' from the mirror
+    try:
+        await leaderboard.sync(_db)
+    except Exception as exc:
+        print(f"[leaderboard] Sync failed: {exc}")
+    top_buys = leaderboard.top(TOP_LIMIT)
 
     # ── Seasonality — always use industry fallback (DB snapshots are 2021 data) ─
     season_data        = _FALLBACK_SEASONALITY
@@ -344,17 +776,46 @@ async def market_overview():
         "avg_price_this_month": avg_now,
         "mom_change_pct":       mom_pct,
         "price_source":         price_source,
-        "top_buys":             [_safe(b) for b in top_buys],
+        "top_buys":             top_buys,
         "seasonality_data":     season_data,
         "seasonality_source":   seasonality_source,
         "updated_at":           datetime.now(timezone.utc).strftime("%Y-%m"),
     }
 
 
+market_overview_service = MarketOverviewService.from_env(_db, _compute_market_overview)
+
+
+@app.get("/api/market-overview")
+async def market_overview(request: Request):
+    """Last materialized overview (see backend/market_overview.py) — no DB work here."""
+    snap    = await market_overview_service.get()
+    headers = {"ETag": snap.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), snap.etag):
+        market_overview_service.count("not_modified")
+        return Response(status_code=304, headers=headers)
+    market_overview_service.count("served")
+    return Response(snap.body, media_type="application/json", headers=headers)
+
+
+@app.get("/api/market-overview/top-buys")
+async def market_top_buys(
+    region: str | None = None, make: str | None = None,
+    min_price: float | None = None, max_price: float | None = None,
+    limit: int = TOP_LIMIT,
+):
+    """Cheapest live BUY signals, filtered — straight from the in-memory leaderboard
+    (other workers' predictions arrive with each overview recompute)."""
+    limit = max(1, min(limit, TOP_LIMIT_MAX))
+    return FastJSONResponse({"top_buys": leaderboard.top(limit, region, make, min_price, max_price)})
+
+
 # ── Clear predictions cache ────────────────────────────────────────────────────
 @app.delete("/api/clear-cache")
 async def clear_cache():
     result = await _db["predictions_cache"].delete_many({})
+    leaderboard.clear()
+    market_overview_service.mark_dirty()
     return {"deleted": result.deleted_count, "message": "Predictions cache cleared"}
 
 
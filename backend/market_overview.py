@@ -0,0 +1,146 @@
+# backend/market_overview.py
+"""Materialized /api/market-overview, recomputed off the request path.
+
+The overview (seed check, two $group averages over predictions_cache, the
+top-BUY list) used to run on every page view, so its latency grew with the
+cache. Here a background task recomputes it and the endpoint serves the last
+result from memory as pre-serialized bytes with an ETag — no database work
+per request.
+
+Recomputation happens
+  * every MARKET_OVERVIEW_REFRESH_SECONDS (catches TTL expiry), and
+  * MARKET_OVERVIEW_DEBOUNCE_SECONDS after mark_dirty() — called when
+    predictions are written — so a burst of writes costs one recompute.
+
+Each result is also persisted to the ``market_overview`` collection, which a
+freshly started worker serves until its first recompute finishes.
+"""
+from __future__ import annotations
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.utils.fast_json import dumps
+from backend.utils.http_cache import etag_for
+
+COLLECTION = "market_overview"
+_DOC_ID    = "current"
+
+
+@dataclass(frozen=True)
+class OverviewSnapshot:
+    version:     int        # bumps on every recompute in this process
+    body:        bytes      # JSON
+    etag:        str        # from the body — unchanged data keeps its ETag
+    computed_at: float
+    compute_ms:  float
+
+
+class MarketOverviewService:
+    """Holds the latest overview; refreshes it on a schedule or when marked dirty."""
+
+    def __init__(
+        self,
+        db,
+        compute: Callable[[], Awaitable[dict]],
+        interval_s: float = 60.0,
+        debounce_s: float = 2.0,
+    ) -> None:
+        self._db        = db
+        self._compute   = compute
+        self.interval_s = float(interval_s)
+        self.debounce_s = float(debounce_s)
+        self._snap: OverviewSnapshot | None = None
+        self._lock   = asyncio.Lock()
+        self._dirty  = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._metrics = {"recomputes": 0, "failures": 0, "served": 0, "not_modified": 0, "marked_dirty": 0}
+
+    @classmethod
+    def from_env(cls, db, compute: Callable[[], Awaitable[dict]]) -> "MarketOverviewService":
+        return cls(
+            db, compute,
+            interval_s=float(os.environ.get("MARKET_OVERVIEW_REFRESH_SECONDS", 60)),
+            debounce_s=float(os.environ.get("MARKET_OVERVIEW_DEBOUNCE_SECONDS", 2)),
+        )
+
+    def _swap(self, overview: dict, computed_at: float, compute_ms: float) -> OverviewSnapshot:
+        body = dumps(overview)
+        version = (self._snap.version + 1) if self._snap else 1
+        self._snap = OverviewSnapshot(version, body, etag_for(body), computed_at, compute_ms)
+        return self._snap
+
+    # ── Refresh ───────────────────────────────────────────────────────────────
+    async def refresh(self) -> OverviewSnapshot:
+        """Recompute now, swap the result in and persist it."""
+        async with self._lock:
+            t0 = time.perf_counter()
+            overview = await self._compute()
+            snap = self._swap(overview, time.time(), round((time.perf_counter() - t0) * 1000, 1))
+            self._metrics["recomputes"] += 1
+        try:
+            await self._db[COLLECTION].replace_one(
+                {"_id": _DOC_ID},
+                {"overview": overview, "computed_at": snap.computed_at, "compute_ms": snap.compute_ms},
+                upsert=True,
+            )
+        except Exception as exc:
+            print(f"[market_overview] Persist failed: {exc}")
+        return snap
+
+    async def load_persisted(self) -> bool:
+        """Serve the last persisted overview until the first recompute (False if none)."""
+        doc = await self._db[COLLECTION].find_one({"_id": _DOC_ID})
+        if not doc or self._snap is not None:
+            return False
+        self._swap(doc["overview"], doc.get("computed_at", 0.0), doc.get("compute_ms", 0.0))
+        return True
+
+    def mark_dirty(self) -> None:
+        """Predictions changed — recompute after the debounce window."""
+        self._metrics["marked_dirty"] += 1
+        self._dirty.set()
+
+    def start(self) -> None:
+        """Background loop: recompute when dirty or every interval_s, whichever first."""
+        if self._task is not None:
+            return
+
+        async def _loop() -> None:
+            while True:
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=self.interval_s)
+                    await asyncio.sleep(self.debounce_s)   # coalesce a burst of writes
+                except asyncio.TimeoutError:
+                    pass
+                self._dirty.clear()
+                try:
+                    await self.refresh()
+                except Exception as exc:
+                    self._metrics["failures"] += 1
+                    print(f"[market_overview] Recompute failed: {exc}")
+
+        self._task = asyncio.create_task(_loop())
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+    async def get(self) -> OverviewSnapshot:
+        """Current snapshot; computed inline only if nothing has been built yet."""
+        return self._snap or await self.refresh()
+
+    def count(self, outcome: str) -> None:
+        self._metrics[outcome] += 1
+
+    def stats(self) -> dict:
+        snap = self._snap
+        out  = {"loaded": snap is not None, **self._metrics}
+        if snap is not None:
+            out.update(version=snap.version, etag=snap.etag, bytes=len(snap.body),
+                       computed_at=snap.computed_at, compute_ms=snap.compute_ms,
+                       age_s=round(time.time() - snap.computed_at, 1))
+        return out
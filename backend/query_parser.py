@@ -0,0 +1,230 @@
+# backend/query_parser.py
+"""Local parser for natural-language car queries.
+
+Turns "Should I buy a 2018 Toyota Camry with 45k miles in good condition in
+California?" into the (make, model, year, mileage, condition, region)
+arguments the pipeline takes, without an LLM round trip.
+
+Makes, models and states are matched with token tries built once from the
+static CATALOG: one scan over the query tokens, longest match wins, so
+multi-token trims ("silverado 1500", "grand cherokee") beat their prefixes.
+Dash variants ("f150", "f 150", "crv") and common aliases ("chevy", "vw")
+are indexed too. A model found without a make resolves the make when only
+one make sells that model and the name is distinctive on its own (not a bare
+number like "500"). Year and mileage are regexes.
+
+parse_query() returns None when make, model or year cannot be found; callers
+fall back to the LLM (run_agent's tool loop, /api/query's LLM parse).
+"""
+from __future__ import annotations
+import re
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.car_catalog import CATALOG
+
+DEFAULT_MILEAGE   = 50_000
+DEFAULT_CONDITION = "good"
+DEFAULT_REGION    = "california"
+
+_CONDITIONS = ("like new", "excellent", "good", "fair", "poor", "salvage", "new")
+
+_STATES = (
+    "alabama", "alaska", "arizona", "arkansas", "california", "colorado",
+    "connecticut", "delaware", "florida", "georgia", "hawaii", "idaho",
+    "illinois", "indiana", "iowa", "kansas", "kentucky", "louisiana", "maine",
+    "maryland", "massachusetts", "michigan", "minnesota", "mississippi",
+    "missouri", "montana", "nebraska", "nevada", "new hampshire", "new jersey",
+    "new mexico", "new york", "north carolina", "north dakota", "ohio",
+    "oklahoma", "oregon", "pennsylvania", "rhode island", "south carolina",
+    "south dakota", "tennessee", "texas", "utah", "vermont", "virginia",
+    "washington", "west virginia", "wisconsin", "wyoming",
+)
+
+_MAKE_ALIASES = {
+    "chevy": "chevrolet", "vw": "volkswagen", "mercedes": "mercedes-benz",
+    "benz": "mercedes-benz", "mercedes benz": "mercedes-benz", "merc": "mercedes-benz",
+    "caddy": "cadillac", "hyundai motors": "hyundai",
+}
+
+_TOKEN_RE   = re.compile(r"[a-z0-9]+(?:[.\-/][a-z0-9]+)*")
+_YEAR_RE    = re.compile(r"\b(19[89]\d|20[0-4]\d)\b")
+# "45k miles", "45,000 miles", "45000 mi", "45k"
+_MILEAGE_RE = re.compile(r"\b(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*(k)?\s*(?:miles|mi)\b|\b(\d+(?:\.\d+)?)k\b")
+
+_END = "\0"   # trie terminal key → matched value
+
+# Shortest model name (letters + digits) accepted without a make
+_MIN_BARE_MODEL = 3
+
+
+# ── Token trie ────────────────────────────────────────────────────────────────
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _insert(trie: dict, phrase: str, value) -> None:
+    node = trie
+    for tok in _tokens(phrase):
+        node = node.setdefault(tok, {})
+    node.setdefault(_END, value)   # first registration wins (canonical before alias)
+
+
+def _longest(trie: dict, toks: list[str], i: int) -> tuple[int, object] | None:
+    """Longest phrase in *trie* starting at toks[i] → (n_tokens, value)."""
+    node, best = trie, None
+    for j in range(i, len(toks)):
+        node = node.get(toks[j])
+        if node is None:
+            break
+        if _END in node:
+            best = (j - i + 1, node[_END])
+    return best
+
+
+def _scan(trie: dict, toks: list[str], skip: set[int] = frozenset()) -> tuple[object, range] | None:
+    """First, longest match anywhere in *toks* (ignoring *skip* positions)."""
+    for i in range(len(toks)):
+        if i in skip:
+            continue
+        hit = _longest(trie, toks, i)
+        if hit is not None:
+            return hit[1], range(i, i + hit[0])
+    return None
+
+
+def _model_variants(model: str) -> list[str]:
+    """'f-150' → ['f-150', 'f150', 'f 150']; 'cr-v' → ['cr-v', 'crv', 'cr v']."""
+    out = [model]
+    if "-" in model:
+        out += [model.replace("-", ""), model.replace("-", " ")]
+    return out
+
+
+def _build() -> tuple[dict, dict, dict]:
+    make_trie:  dict = {}
+    model_trie: dict = {}   # model phrase → {make: canonical model} for every make selling it
+    state_trie: dict = {}
+    models_by_make = {make: CATALOG.models(make) for make in CATALOG.makes()}
+
+    for make in models_by_make:
+        _insert(make_trie, make, make)
+        if "-" in make:
+            _insert(make_trie, make.replace("-", " "), make)
+    for alias, make in _MAKE_ALIASES.items():
+        _insert(make_trie, alias, make)
+
+    for make, models in models_by_make.items():
+        for model in models:
+            for variant in _model_variants(model):
+                node = model_trie
+                for tok in _tokens(variant):
+                    node = node.setdefault(tok, {})
+                node.setdefault(_END, {}).setdefault(make, model)
+
+    for state in _STATES:
+        _insert(state_trie, state, state)
+    return make_trie, model_trie, state_trie
+
+
+_MAKE_TRIE, _MODEL_TRIE, _STATE_TRIE = _build()
+
+
+# ── Field extractors ──────────────────────────────────────────────────────────
+def _parse_mileage(m: re.Match | None) -> int | None:
+    if not m:
+        return None
+    if m.group(3):
+        return int(float(m.group(3)) * 1000)
+    value = float(m.group(1).replace(",", ""))
+    return int(value * 1000 if m.group(2) else value)
+
+
+def _parse_condition(toks: list[str], skip: set[int]) -> str | None:
+    text = " " + " ".join(t for i, t in enumerate(toks) if i not in skip) + " "
+    for cond in _CONDITIONS:
+        if f" {cond} " in text:
+            return cond
+    return None
+
+
+def _distinctive(model_toks: list[str]) -> bool:
+    """Can this model name stand without its make? (has a letter, ≥ 3 characters)"""
+    text = "".join(model_toks)
+    return len(text) >= _MIN_BARE_MODEL and any(c.isalpha() for c in text)
+
+
+def _find_vehicle(toks: list[str]) -> tuple[str, str, set[int]] | None:
+    """(make, model, consumed token positions) or None."""
+    make_hit = _scan(_MAKE_TRIE, toks)
+    if make_hit is not None:
+        make, span = make_hit
+        # Prefer the model right after the make, else anywhere else in the query
+        hit = _longest(_MODEL_TRIE, toks, span.stop)
+        if hit is not None and make in hit[1]:
+            return make, hit[1][make], set(span) | set(range(span.stop, span.stop + hit[0]))
+        for i in range(len(toks)):
+            if i in span:
+                continue
+            hit = _longest(_MODEL_TRIE, toks, i)
+            if hit is not None and make in hit[1]:
+                return make, hit[1][make], set(span) | set(range(i, i + hit[0]))
+        return None
+
+    # No make named: accept a distinctive model only one make sells ("2018
+    # camry"). Bare numbers and short codes ("500", "3", "86") need their make —
+    # in "2018 fiat 500" the brand is simply not in the catalogue, and reading
+    # it as the one catalogue "500" (a Ford) would analyse the wrong car.
+    for i in range(len(toks)):
+        hit = _longest(_MODEL_TRIE, toks, i)
+        if hit is not None and len(hit[1]) == 1 and _distinctive(toks[i:i + hit[0]]):
+            (make, model), = hit[1].items()
+            return make, model, set(range(i, i + hit[0]))
+    return None
+
+
+def parse_query(query: str) -> dict | None:
+    """{make, model, year, mileage, condition, region} or None if the vehicle is unclear."""
+    text   = query.lower()
+    year_m = _YEAR_RE.search(text)
+    if year_m is None:
+        return None
+    miles_m = _MILEAGE_RE.search(text)
+    # Year and mileage digits must not be read as model names ("500", "1500")
+    rest = text[:year_m.start()] + " " + text[year_m.end():]
+    if miles_m:
+        rest = _MILEAGE_RE.sub(" ", rest, count=1)
+    toks = _tokens(rest)
+    vehicle = _find_vehicle(toks)
+    if vehicle is None:
+        return None
+    make, model, used = vehicle
+
+    # States before condition so "new york" / "new jersey" are not read as "new"
+    state_hit = _scan(_STATE_TRIE, toks, used)
+    if state_hit is not None:
+        used |= set(state_hit[1])
+    return {
+        "make":      make,
+        "model":     model,
+        "year":      int(year_m.group(1)),
+        "mileage":   _parse_mileage(miles_m) or DEFAULT_MILEAGE,
+        "condition": _parse_condition(toks, used) or DEFAULT_CONDITION,
+        "region":    state_hit[0] if state_hit else DEFAULT_REGION,
+    }
+
+
+def resolve_vehicle(make: str, model: str) -> tuple[str, str] | None:
+    """Canonical catalogue (make, model) for free-text names (e.g. from the LLM).
+
+    None unless *make* is itself a catalogue make or alias: the spelling is
+    snapped, but a model is never moved to a different make.
+    """
+    make_toks = _tokens(make)
+    hit = _longest(_MAKE_TRIE, make_toks, 0) if make_toks else None
+    if hit is None or hit[0] != len(make_toks):
+        return None
+    found = _find_vehicle(make_toks + _tokens(model))
+    return (found[0], found[1]) if found and found[0] == hit[1] else None
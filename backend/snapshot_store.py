@@ -0,0 +1,315 @@
+# backend/snapshot_store.py
+"""In-memory columnar copy of price_series, loaded once at startup.
+
+All monthly snapshots (~61k rows) live in contiguous NumPy arrays ordered by
+series then month, with a (make, model, year) → (start, stop) slice index.
+Per-series aggregates used by get_market_context, the global market fallback
+and the realized-volatility table used by RiskAssessmentAgent are precomputed
+in one vectorized pass at load time, so the hot read path never touches
+MongoDB.
+
+Refresh is atomic: a new _Snapshot is built off to the side and swapped in
+with a single reference assignment once ingest bumps the version stamp in
+``ingest_meta`` (see scripts/mongo_ingest.py).
+"""
+from __future__ import annotations
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from backend.utils import volatility
+from backend.utils.price_series import META_COLLECTION, SERIES_COLLECTION, series_id
+
+
+def _month_int(month: str) -> int:
+    """'2021-03' → 202103 (0 when unparseable)."""
+    try:
+        return int(month[:4]) * 100 + int(month[5:7])
+    except (TypeError, ValueError):
+        return 0
+
+
+def _as_float(values: list) -> list[float]:
+    return [np.nan if v is None else float(v) for v in values]
+
+
+@dataclass
+class _Snapshot:
+    """One immutable, fully-built generation of the store."""
+    version:      str | None
+    index:        dict[str, tuple[int, int]]
+    months:       np.ndarray            # int32 yyyymm, per row
+    month_labels: list[str]             # 'YYYY-MM', per row (pre-formatted)
+    avg_price:    np.ndarray            # float64, per row (NaN = missing)
+    median_price: np.ndarray
+    count:        np.ndarray            # float64, per row (NaN = missing)
+    # ── per-series aggregates (aligned with series order) ─────────────────────
+    series_pos:   dict[str, int]
+    n_listings:   np.ndarray
+    overall_avg:  np.ndarray            # NaN when the series has no prices
+    min_price:    np.ndarray
+    max_price:    np.ndarray
+    latest_pct:   np.ndarray            # latest avg vs overall avg, %
+    inv_trend:    np.ndarray            # 1 rising · -1 falling · 0 unknown
+    trend:        dict[str, dict]       # series_id → ingest-time trend_features
+    segment:      dict[str, str]        # series_id → dominant body type
+    vol:          volatility.VolatilityTable
+    # ── market-wide fallbacks ─────────────────────────────────────────────────
+    global_recent: list[float] = field(default_factory=list)   # newest first
+    global_range:  dict | None = None
+    loaded_at:     float = 0.0
+
+
+def _build(buckets: list[dict], version: str | None) -> _Snapshot:
+    """Pack bucket documents into contiguous arrays + precomputed aggregates."""
+    index: dict[str, tuple[int, int]] = {}
+    series_pos: dict[str, int] = {}
+    trend: dict[str, dict] = {}
+    segment: dict[str, str] = {}
+    months, avg, med, cnt, n_listings, lengths = [], [], [], [], [], []
+    sids, makes = [], []
+
+    for b in buckets:
+        n = len(b.get("months") or [])
+        if n == 0:
+            continue
+        sid   = b.get("_id") or series_id(b["make"], b["model"], b["year"])
+        start = len(months)
+        index[sid]      = (start, start + n)
+        series_pos[sid] = len(lengths)
+        months.extend(_month_int(m) for m in b["months"])
+        avg.extend(_as_float(b.get("avg_price") or [None] * n))
+        med.extend(_as_float(b.get("median_price") or [None] * n))
+        cnt.extend(_as_float(b.get("listing_count") or [None] * n))
+        n_listings.append(int(b.get("n_listings") or 0))
+        lengths.append(n)
+        sids.append(sid)
+        makes.append(str(b.get("make") or "").lower() or None)
+        if b.get("trend_features"):
+            trend[sid] = b["trend_features"]
+        if b.get("segment"):
+            segment[sid] = b["segment"]
+
+    months_a = np.asarray(months, dtype=np.int32)
+    avg_a    = np.asarray(avg, dtype=np.float64)
+    med_a    = np.asarray(med, dtype=np.float64)
+    cnt_a    = np.asarray(cnt, dtype=np.float64)
+    lengths_a = np.asarray(lengths, dtype=np.int64)
+
+    if len(lengths_a):
+        starts = np.concatenate(([0], np.cumsum(lengths_a)[:-1]))
+        ends   = starts + lengths_a - 1
+        valid  = ~np.isnan(avg_a)
+
+        # Per-series mean / min / max of avg_price, ignoring missing months
+        n_valid = np.add.reduceat(valid.astype(np.int64), starts)
+        sums    = np.add.reduceat(np.where(valid, avg_a, 0.0), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            overall = np.where(n_valid > 0, sums / np.maximum(n_valid, 1), np.nan)
+        mins = np.minimum.reduceat(np.where(valid, avg_a, np.inf), starts)
+        maxs = np.maximum.reduceat(np.where(valid, avg_a, -np.inf), starts)
+        mins = np.where(n_valid > 0, mins, np.nan)
+        maxs = np.where(n_valid > 0, maxs, np.nan)
+
+        # Latest month vs overall average (negative → currently below market)
+        latest = np.where(np.isnan(avg_a[ends]), overall, avg_a[ends])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            latest_pct = np.where(overall > 0, np.round((latest - overall) / overall * 100, 2), 0.0)
+
+        # Inventory trend from the two most recent listing counts
+        curr = np.nan_to_num(cnt_a[ends], nan=0.0)
+        prev = np.where(lengths_a >= 2, cnt_a[np.maximum(ends - 1, 0)], np.nan)
+        prev = np.nan_to_num(prev, nan=1.0)
+        inv_trend = np.where(lengths_a >= 2, np.where(curr >= prev, 1, -1), 0).astype(np.int8)
+
+        # Market-wide fallbacks: three newest rows overall + global price range
+        newest = np.argsort(months_a, kind="stable")[::-1][:3]
+        global_recent = [float(avg_a[i]) for i in newest if not np.isnan(avg_a[i])]
+        global_range = (
+            {"avg": float(np.nanmean(avg_a)), "min": float(np.nanmin(avg_a)), "max": float(np.nanmax(avg_a))}
+            if valid.any() else None
+        )
+        # Realized month-over-month volatility per series / make / segment
+        vol = volatility.build(
+            avg_a, np.concatenate(([0], np.cumsum(lengths_a))),
+            sids, makes, [segment.get(sid) for sid in sids],
+        )
+    else:
+        vol = volatility.VolatilityTable()
+        overall = mins = maxs = latest_pct = np.empty(0, dtype=np.float64)
+        inv_trend = np.empty(0, dtype=np.int8)
+        global_recent, global_range = [], None
+
+    return _Snapshot(
+        version=version, index=index, months=months_a,
+        month_labels=[f"{m // 100:04d}-{m % 100:02d}" for m in months_a.tolist()],
+        avg_price=avg_a, median_price=med_a, count=cnt_a, series_pos=series_pos,
+        n_listings=np.asarray(n_listings, dtype=np.int64),
+        overall_avg=overall, min_price=mins, max_price=maxs,
+        latest_pct=latest_pct, inv_trend=inv_trend, trend=trend,
+        segment=segment, vol=vol,
+        global_recent=global_recent, global_range=global_range,
+        loaded_at=time.time(),
+    )
+
+
+class SnapshotStore:
+    """Process-wide, read-mostly view of price_series served from memory."""
+
+    def __init__(self, db, retry_s: float = 60.0) -> None:
+        self._db   = db
+        self._snap: _Snapshot | None = None
+        self._lock = threading.Lock()          # serialises loads, never readers
+        self._poller: threading.Thread | None = None
+        # Last failed load; ensure_loaded() does not retry within retry_s of it
+        self.retry_s = float(retry_s)
+        self._failed_at: float | None = None
+
+    # ── Loading / refresh ─────────────────────────────────────────────────────
+    def _remote_version(self) -> str | None:
+        meta = self._db[META_COLLECTION].find_one({"_id": SERIES_COLLECTION}, {"version": 1})
+        return (meta or {}).get("version")
+
+    def load(self) -> None:
+        """(Re)build the snapshot from MongoDB and swap it in atomically."""
+        with self._lock:
+            try:
+                version = self._remote_version()
+                buckets = list(self._db[SERIES_COLLECTION].find(
+                    {}, {"make": 1, "model": 1, "year": 1, "months": 1, "avg_price": 1,
+                         "median_price": 1, "listing_count": 1, "n_listings": 1, "trend_features": 1,
+                         "segment": 1},
+                ))
+                snap = _build(buckets, version)
+            except Exception:   # fetch or build (e.g. a malformed bucket) — back off either way
+                self._failed_at = time.monotonic()
+                raise
+            self._snap      = snap
+            self._failed_at = None
+
+    def ensure_loaded(self) -> bool:
+        """Load lazily on first use (CLI / scripts). False if MongoDB is unreachable.
+
+        After a failed load, callers get False straight away for retry_s instead
+        of each paying another full load before their fallback; the poller
+        keeps retrying in the meantime.
+        """
+        if self._snap is not None:
+            return True
+        failed_at = self._failed_at
+        if failed_at is not None and time.monotonic() - failed_at < self.retry_s:
+            return False
+        try:
+            self.load()
+        except Exception:
+            return False
+        return True
+
+    def refresh_if_stale(self) -> bool:
+        """Reload when ingest has published a newer version. Returns True on reload."""
+        if self._snap is not None and self._remote_version() == self._snap.version:
+            return False
+        self.load()
+        return True
+
+    def start_polling(self, interval_s: float = 60.0) -> None:
+        """Poll the ingest version stamp on a daemon thread."""
+        if self._poller is not None:
+            return
+
+        def _loop() -> None:
+            while True:
+                time.sleep(interval_s)
+                try:
+                    if self.refresh_if_stale():
+                        print(f"[snapshot_store] Reloaded price_series (version {self._snap.version})")
+                except Exception as exc:
+                    print(f"[snapshot_store] Refresh failed: {exc}")
+
+        self._poller = threading.Thread(target=_loop, name="snapshot-store-poller", daemon=True)
+        self._poller.start()
+
+    # ── Reads (lock-free: grab the current generation once per call) ──────────
+    @property
+    def loaded(self) -> bool:
+        return self._snap is not None
+
+    def history(self, make: str, model: str, year: int) -> list[dict]:
+        """Monthly series in the get_price_history shape ([] when unknown)."""
+        snap = self._snap
+        span = snap.index.get(series_id(make, model, year)) if snap else None
+        if span is None:
+            return []
+        lo, hi = span
+        # NaN != NaN — cheaper than np.isnan on Python floats
+        return [
+            {
+                "date":          m,
+                "avg_price":     round(a, 2) if a == a else 0,
+                "median_price":  round(md, 2) if md == md else 0,
+                "listing_count": int(c) if c == c else 0,
+            }
+            for m, a, md, c in zip(
+                snap.month_labels[lo:hi], snap.avg_price[lo:hi].tolist(),
+                snap.median_price[lo:hi].tolist(), snap.count[lo:hi].tolist(),
+            )
+        ]
+
+    def context(self, make: str, model: str, year: int) -> dict | None:
+        """Precomputed market aggregates for one series (None when unknown)."""
+        snap = self._snap
+        pos  = snap.series_pos.get(series_id(make, model, year)) if snap else None
+        if pos is None:
+            return None
+        has_prices = not np.isnan(snap.overall_avg[pos])
+        return {
+            "n_listings":          int(snap.n_listings[pos]),
+            "inventory_trend":     {1: "rising", -1: "falling"}.get(int(snap.inv_trend[pos]), "unknown"),
+            "has_prices":          has_prices,
+            "price_vs_median_pct": float(snap.latest_pct[pos]) if has_prices else 0.0,
+            "min_price":           round(float(snap.min_price[pos]), 2) if has_prices else None,
+            "max_price":           round(float(snap.max_price[pos]), 2) if has_prices else None,
+        }
+
+    def trend_features(self, make: str, model: str, year: int) -> dict | None:
+        """Ingest-time trend features for one series (see backend/utils/trend_features.py)."""
+        snap = self._snap
+        return snap.trend.get(series_id(make, model, year)) if snap else None
+
+    def volatility(self, make: str, model: str, year: int) -> dict | None:
+        """Realized monthly volatility for a vehicle — series, else make / segment / market.
+
+        Returns {"sigma_1m", "n_returns", "level"} or None when the store is empty.
+        """
+        snap = self._snap
+        if snap is None:
+            return None
+        sid = series_id(make, model, year)
+        return snap.vol.lookup(sid, str(make).strip().lower(), snap.segment.get(sid))
+
+    def global_recent(self) -> list[float]:
+        """avg_price of the three newest snapshot rows market-wide, newest first."""
+        return list(self._snap.global_recent) if self._snap else []
+
+    def global_range(self) -> dict | None:
+        """Market-wide {avg, min, max} of avg_price (None when the store is empty)."""
+        return dict(self._snap.global_range) if self._snap and self._snap.global_range else None
+
+    def stats(self) -> dict:
+        snap = self._snap
+        if snap is None:
+            failed_at = self._failed_at
+            return {"loaded": False,
+                    "failed_s_ago": round(time.monotonic() - failed_at, 1) if failed_at is not None else None}
+        return {
+            "loaded":     True,
+            "version":    snap.version,
+            "n_series":   len(snap.index),
+            "n_rows":     int(snap.months.size),
+            "nbytes":     int(snap.months.nbytes + snap.avg_price.nbytes
+                              + snap.median_price.nbytes + snap.count.nbytes),
+            "vol_series": len(snap.vol),
+            "loaded_at":  snap.loaded_at,
+        }
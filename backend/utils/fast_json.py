@@ -0,0 +1,70 @@
+# backend/utils/fast_json.py
+"""One-pass JSON encoding for API responses carrying MongoDB documents.
+
+Prediction documents (agent_log, tool_outputs, SHAP factors) used to be
+encoded three times per response: json.dumps(default=str) to get rid of
+ObjectId / datetime, json.loads back into fresh dicts, then FastAPI's
+jsonable_encoder + json.dumps. dumps() goes straight from the document to
+bytes, and FastJSONResponse hands those bytes to the client, so a handler
+that returns one skips FastAPI's encoder entirely.
+
+orjson is used when installed (pip install orjson); otherwise the stdlib
+encoder does the same single pass. Output matches the old default=str
+round trip: datetimes / ObjectIds / Decimal128 as str(), float subclasses
+(numpy.float64) as numbers; NaN / inf become null instead of failing the
+response.
+"""
+from __future__ import annotations
+import json
+import math
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:   # optional speed-up
+    orjson = None
+
+
+def _default(obj: Any):
+    if isinstance(obj, float):   # float subclass orjson will not take natively
+        return float(obj) if math.isfinite(obj) else None
+    return str(obj)
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(obj: Any) -> bytes:
+        """*obj* → compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+else:
+    _encoder = json.JSONEncoder(
+        default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+    )
+
+    def _finite(obj: Any):
+        # Slow path, only after allow_nan=False rejected a NaN / inf somewhere
+        if isinstance(obj, float) and not math.isfinite(obj):
+            return None
+        if isinstance(obj, dict):
+            return {k: _finite(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_finite(v) for v in obj]
+        return obj
+
+    def dumps(obj: Any) -> bytes:
+        """*obj* → compact UTF-8 JSON bytes."""
+        try:
+            return _encoder.encode(obj).encode()
+        except ValueError:
+            return _encoder.encode(_finite(obj)).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by dumps(); content may hold raw BSON types."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,50 @@
+# backend/utils/http_cache.py
+"""Conditional-GET and content-coding helpers for responses pre-serialized in memory."""
+from __future__ import annotations
+import hashlib
+
+# Revalidate every time — a 304 costs a header compare, nothing else
+CACHE_CONTROL = "no-cache"
+
+
+def etag_for(body: bytes) -> str:
+    """Strong, quoted ETag from the response bytes."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, *etags: str) -> bool:
+    """If-None-Match against any of *etags* (weak comparison, RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return any(etag in tags for etag in etags)
+
+
+def _qvalue(params: list[str]) -> float:
+    for p in params:
+        name, _, value = p.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0   # malformed weight — don't risk a body the client can't read
+    return 1.0
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Does Accept-Encoding allow gzip? (RFC 9110 §12.5.3: "gzip;q=0" refuses it)
+
+    An explicit gzip / x-gzip entry decides; otherwise a "*" entry does.
+    """
+    weights: dict[str, float] = {}
+    for token in (accept_encoding or "").split(","):
+        coding, *params = token.split(";")
+        coding = coding.strip().lower()
+        if coding:
+            weights[coding] = _qvalue(params)
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
@@ -0,0 +1,87 @@
+# backend/utils/price_series.py
+"""Bucketed price_series layout — one document per (make, model, year).
+
+Each bucket stores the monthly snapshots of a series as parallel arrays so a
+full history (plus the aggregates get_market_context needs) is one ``_id``
+lookup instead of a sorted cursor over many small price_snapshots documents:
+
+    {
+        "_id": "toyota|camry|2018",
+        "make": "toyota", "model": "camry", "year": 2018,
+        "months":        ["2021-03", "2021-04", ...],   # ascending
+        "avg_price":     [...],
+        "median_price":  [...],
+        "p25_price":     [...],
+        "p75_price":     [...],
+        "listing_count": [...],
+        "n_months": int, "n_listings": int,
+        "segment": "sedan" | "truck" | ... | None,   # dominant body type (ingest)
+    }
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Iterable
+
+SERIES_COLLECTION = "price_series"
+
+# Ingest writes {"_id": SERIES_COLLECTION, "version": str, ...} here after every
+# rebuild so in-memory readers (backend/snapshot_store.py) know when to reload.
+META_COLLECTION = "ingest_meta"
+
+# Per-month array fields, in the order they are stored on the bucket.
+ARRAY_FIELDS = ["avg_price", "median_price", "p25_price", "p75_price", "listing_count"]
+
+
+def series_id(make: str, model: str, year: int) -> str:
+    """Canonical bucket ``_id`` for a vehicle series."""
+    return f"{str(make).strip().lower()}|{str(model).strip().lower()}|{int(year)}"
+
+
+def build_buckets(snapshots: Iterable[dict], listing_counts: dict[str, int] | None = None) -> list[dict]:
+    """Group flat price_snapshots rows into one bucket document per series.
+
+    snapshots      : rows with make, model, year, year_month and the ARRAY_FIELDS
+    listing_counts : optional {series_id: total listings} from the listings collection
+    """
+    listing_counts = listing_counts or {}
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for row in snapshots:
+        if row.get("make") is None or row.get("model") is None or row.get("year") is None:
+            continue
+        grouped[series_id(row["make"], row["model"], row["year"])].append(row)
+
+    buckets = []
+    for sid, rows in grouped.items():
+        rows.sort(key=lambda r: str(r["year_month"]))
+        first = rows[0]
+        bucket = {
+            "_id":    sid,
+            "make":   str(first["make"]).lower(),
+            "model":  str(first["model"]).lower(),
+            "year":   int(first["year"]),
+            "months": [str(r["year_month"]) for r in rows],
+        }
+        for field in ARRAY_FIELDS:
+            bucket[field] = [r.get(field) for r in rows]
+        bucket["n_months"]   = len(rows)
+        bucket["n_listings"] = int(listing_counts.get(sid, sum(r.get("listing_count") or 0 for r in rows)))
+        buckets.append(bucket)
+    return buckets
+
+
+def bucket_to_history(bucket: dict) -> list[dict]:
+    """Expand a bucket into the list-of-dicts shape returned by get_price_history."""
+    return [
+        {
+            "date":          month,
+            "avg_price":     round(avg or 0, 2),
+            "median_price":  round(med or 0, 2),
+            "listing_count": cnt or 0,
+        }
+        for month, avg, med, cnt in zip(
+            bucket.get("months", []),
+            bucket.get("avg_price", []),
+            bucket.get("median_price", []),
+            bucket.get("listing_count", []),
+        )
+    ]
@@ -0,0 +1,82 @@
+# backend/utils/response_profiles.py
+"""Response profiles and field projection for /api/predict and /api/query.
+
+  profile=full      everything the UI renders (the default, unchanged)
+  profile=summary   headline numbers + recommendation + explanation only —
+                    no agent_log, tool_outputs, shap_factors, data_features
+                    or the legacy duplicate fields
+  profile=debug     full plus the cache internals normally stripped
+  fields=a,b.c      exactly these top-level fields / dotted sub-paths
+                    (overrides profile)
+
+For summary / fields the predictions_cache read is projected as well, so
+the heavy sections are never fetched from MongoDB on a cache hit.
+"""
+from __future__ import annotations
+import re
+
+PROFILES = ("summary", "full", "debug")
+
+SUMMARY_FIELDS = (
+    "vehicle_name", "make", "model", "year", "mileage", "condition", "region",
+    "final_recommendation", "confidence_score",
+    "current_price", "projected_price", "forecast_30d", "predicted_90_day_change",
+    "forecast_method", "uncertainty_range", "volatility_index", "risk_score",
+    "reasoning_summary", "explanation", "llm_key_insight", "ethics_disclaimer",
+    "explanation_status", "explanation_token",
+)
+
+_FIELD_RE   = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$")
+_MAX_FIELDS = 50
+
+
+def resolve(profile: str, fields: str | None) -> tuple[list[str] | None, list[str]]:
+    """(paths to return — None = whole document, validation errors)."""
+    errors: list[str] = []
+    if profile not in PROFILES:
+        errors.append(f"profile must be one of {', '.join(PROFILES)}")
+    if fields is not None:
+        paths = [f.strip() for f in fields.split(",") if f.strip()]
+        bad   = [p for p in paths if not _FIELD_RE.match(p)]
+        if bad:
+            errors.append(f"invalid field name(s): {', '.join(bad[:5])}")
+        if not paths:
+            errors.append("fields must name at least one field")
+        if len(paths) > _MAX_FIELDS:
+            errors.append(f"at most {_MAX_FIELDS} fields")
+        return paths, errors
+    return (list(SUMMARY_FIELDS) if profile == "summary" else None), errors
+
+
+def _outermost(paths: list[str]) -> list[str]:
+    """*paths* without those under another listed path ("a.b" goes when "a" is there)."""
+    if not any("." in p for p in paths):   # the profiles: top-level names only
+        return list(dict.fromkeys(paths))
+    kept: list[str] = []
+    for p in sorted(set(paths), key=len):
+        if not any(p == k or p.startswith(k + ".") for k in kept):
+            kept.append(p)
+    return [p for p in dict.fromkeys(paths) if p in kept]   # requested order
+
+
+def mongo_projection(paths: list[str]) -> dict:
+    """Inclusion projection for *paths* (Mongo rejects a path listed under another)."""
+    return {"_id": 0, **{p: 1 for p in _outermost(paths)}}
+
+
+def pick(doc: dict, paths: list[str]) -> dict:
+    """Only *paths* of *doc* (dotted paths keep their nesting); missing ones are skipped."""
+    out: dict = {}
+    for path in _outermost(paths):
+        parts = path.split(".")
+        value = doc
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            dst = out
+            for part in parts[:-1]:
+                dst = dst.setdefault(part, {})
+            dst[parts[-1]] = value
+    return out
@@ -1,19 +1,21 @@
 # backend/utils/smoothing.py
-"""Numerical smoothing helpers used across agents."""
+"""Numerical smoothing helpers used across agents.
+
+List-in / list-out wrappers kept for existing callers; the vectorized
+implementations (single and ragged multi-series) live in
+backend/utils/timeseries.py.
+"""
 from __future__ import annotations
 from typing import List
 
+from backend.utils.timeseries import ema, rolling_mean
+
 
 def moving_average(values: List[float], window: int = 3) -> List[float]:
     """Simple moving average over a list of floats."""
     if not values or window <= 0:
         return values
-    result = []
-    for i in range(len(values)):
-        start = max(0, i - window + 1)
-        chunk = values[start : i + 1]
-        result.append(sum(chunk) / len(chunk))
-    return result
+    return rolling_mean(values, window).tolist()
 
 
 def exponential_moving_average(values: List[float], alpha: float = 0.3) -> List[float]:
@@ -23,10 +25,7 @@ def exponential_moving_average(values: List[float], alpha: float = 0.3) -> List[
     """
     if not values:
         return values
-    ema = [values[0]]
-    for v in values[1:]:
-        ema.append(alpha * v + (1 - alpha) * ema[-1])
-    return ema
+    return ema(values, alpha).tolist()
 
 
 def bound(value: float, lo: float, hi: float) -> float:
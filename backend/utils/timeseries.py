@@ -0,0 +1,275 @@
+# backend/utils/timeseries.py
+"""Vectorized time-series features over price series (NumPy).
+
+Every function accepts either a single series or many series packed into a
+ragged layout: one flat ``values`` array plus ``offsets`` of length
+n_series + 1, where series i is ``values[offsets[i]:offsets[i + 1]]``
+(the layout SnapshotStore and the ingest precompute jobs already use).
+
+Element-wise features (rolling_*, ema) return an array aligned with
+``values``; per-series reductions (realized_volatility, depreciation_*)
+return a float for a single series and an array of length n_series for
+ragged input. Rolling windows are truncated at the start of each series,
+matching backend.utils.smoothing.moving_average.
+"""
+from __future__ import annotations
+from typing import Sequence
+
+import numpy as np
+
+ArrayLike = Sequence[float] | np.ndarray
+
+
+# ── Layout helpers ────────────────────────────────────────────────────────────
+def _prepare(values: ArrayLike, offsets: ArrayLike | None) -> tuple[np.ndarray, np.ndarray]:
+    x = np.asarray(values, dtype=np.float64)
+    if offsets is None:
+        offs = np.array([0, x.size], dtype=np.int64)
+    else:
+        offs = np.asarray(offsets, dtype=np.int64)
+        if offs.ndim != 1 or offs.size < 1 or offs[0] != 0 or offs[-1] != x.size or np.any(np.diff(offs) < 0):
+            raise ValueError("offsets must be non-decreasing, start at 0 and end at len(values)")
+    return x, offs
+
+
+def _segments(offs: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-element series id and per-element series start index."""
+    lengths = np.diff(offs)
+    seg     = np.repeat(np.arange(lengths.size), lengths)
+    return seg, offs[:-1][seg] if n else np.empty(0, dtype=np.int64)
+
+
+def _reduce_result(out: np.ndarray, offsets: ArrayLike | None):
+    return float(out[0]) if offsets is None else out
+
+
+def pack(series: Sequence[ArrayLike]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack a list of series into the ragged (values, offsets) layout."""
+    lengths = np.fromiter((len(s) for s in series), dtype=np.int64, count=len(series))
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+    values  = (np.concatenate([np.asarray(s, dtype=np.float64) for s in series])
+               if len(series) else np.empty(0, dtype=np.float64))
+    return values, offsets
+
+
+# ── Rolling windows ───────────────────────────────────────────────────────────
+def _window_bounds(offs: np.ndarray, n: int, window: int) -> np.ndarray:
+    """Inclusive lower index of each element's (truncated) trailing window."""
+    if window <= 0:
+        raise ValueError("window must be a positive integer")
+    _, starts = _segments(offs, n)
+    return np.maximum(starts, np.arange(n) - window + 1)
+
+
+def _segment_cumsum(x: np.ndarray, offs: np.ndarray) -> np.ndarray:
+    """Cumulative sum restarted at every series start.
+
+    Each series is summed on its own (padded rows, or one slice at a time when
+    padding would waste too much memory), so ragged results are bit-identical
+    to calling the single-series path on each series.
+    """
+    lengths = np.diff(offs)
+    if lengths.size <= 1:
+        return np.cumsum(x)
+    width = int(lengths.max(initial=0))
+    if lengths.size * width <= max(4 * x.size, 1 << 16):
+        seg, starts = _segments(offs, x.size)
+        rel = np.arange(x.size) - starts
+        mat = np.zeros((lengths.size, width))
+        mat[seg, rel] = x
+        return np.cumsum(mat, axis=1)[seg, rel]
+    out = np.empty_like(x)
+    for lo, hi in zip(offs[:-1], offs[1:]):
+        out[lo:hi] = np.cumsum(x[lo:hi])
+    return out
+
+
+def rolling_mean(values: ArrayLike, window: int, offsets: ArrayLike | None = None) -> np.ndarray:
+    """Trailing mean over ``window`` points (fewer at the start of each series)."""
+    x, offs = _prepare(values, offsets)
+    if x.size == 0:
+        return x.copy()
+    lo  = _window_bounds(offs, x.size, window)
+    idx = np.arange(x.size)
+    cs  = _segment_cumsum(x, offs)
+    _, starts = _segments(offs, x.size)
+    # Window sum = cs[i] - cs[lo - 1], where cs before the series start is 0
+    before = np.where(lo > starts, cs[np.maximum(lo - 1, 0)], 0.0)
+    return (cs - before) / (idx + 1 - lo)
+
+
+def _window_matrix(x: np.ndarray, offs: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """(n, window) matrix of each element's trailing window + validity mask."""
+    lo   = _window_bounds(offs, x.size, window)
+    idx  = np.arange(x.size)[:, None] - np.arange(min(window, x.size))[None, :]
+    mask = idx >= lo[:, None]
+    return x[np.maximum(idx, 0)], mask
+
+
+def rolling_std(values: ArrayLike, window: int, offsets: ArrayLike | None = None, ddof: int = 0) -> np.ndarray:
+    """Trailing standard deviation (NaN where the window holds ≤ ddof points).
+
+    Two-pass over the window matrix rather than cumulative sums of squares,
+    which cancel badly at used-car price levels.
+    """
+    x, offs = _prepare(values, offsets)
+    if x.size == 0:
+        return x.copy()
+    vals, mask = _window_matrix(x, offs, window)
+    cnt  = mask.sum(axis=1)
+    mean = np.where(mask, vals, 0.0).sum(axis=1) / cnt
+    ss   = np.where(mask, (vals - mean[:, None]) ** 2, 0.0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(cnt > ddof, np.sqrt(ss / (cnt - ddof)), np.nan)
+
+
+def _rolling_extreme(values: ArrayLike, window: int, offsets: ArrayLike | None, fn, fill: float) -> np.ndarray:
+    x, offs = _prepare(values, offsets)
+    if x.size == 0:
+        return x.copy()
+    vals, mask = _window_matrix(x, offs, window)
+    return fn(np.where(mask, vals, fill), axis=1)
+
+
+def rolling_min(values: ArrayLike, window: int, offsets: ArrayLike | None = None) -> np.ndarray:
+    """Trailing minimum over ``window`` points."""
+    return _rolling_extreme(values, window, offsets, np.min, np.inf)
+
+
+def rolling_max(values: ArrayLike, window: int, offsets: ArrayLike | None = None) -> np.ndarray:
+    """Trailing maximum over ``window`` points."""
+    return _rolling_extreme(values, window, offsets, np.max, -np.inf)
+
+
+# ── Exponential moving average ────────────────────────────────────────────────
+def _ema_1d(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Closed-form EMA, evaluated in blocks so d**-k never overflows.
+
+    Within a block starting at i with carried value e_{i-1}:
+        e_{i+j} = d**(j+1) * (e_{i-1} + alpha * Σ_{t≤j} x_{i+t} / d**(t+1)),  d = 1 - alpha
+    """
+    out = np.empty_like(x)
+    if x.size == 0:
+        return out
+    d = 1.0 - alpha
+    if d == 0.0:
+        return x.copy()
+    block = 256 if abs(d) >= 1.0 else max(1, min(256, int(300 / -np.log10(abs(d)))))
+    pw_full = d ** np.arange(1, block + 1)
+    out[0] = prev = x[0]
+    i = 1
+    while i < x.size:
+        seg = x[i : i + block]
+        pw  = pw_full[: seg.size]
+        out[i : i + seg.size] = pw * (prev + alpha * np.cumsum(seg / pw))
+        prev = out[i + seg.size - 1]
+        i   += seg.size
+    return out
+
+
+def ema(values: ArrayLike, alpha: float = 0.3, offsets: ArrayLike | None = None) -> np.ndarray:
+    """Exponential moving average, restarted at the first point of every series.
+
+    alpha : smoothing factor in (0, 1].  Higher = more weight on recent values.
+    """
+    x, offs = _prepare(values, offsets)
+    lengths = np.diff(offs)
+    if lengths.size <= 1:
+        return _ema_1d(x, alpha)
+
+    # Many series: advance all of them one step at a time on a padded matrix,
+    # i.e. max(len) vector operations instead of len(values) scalar ones.
+    seg, starts = _segments(offs, x.size)
+    rel = np.arange(x.size) - starts
+    mat = np.zeros((lengths.size, int(lengths.max(initial=0))))
+    mat[seg, rel] = x
+    out = np.empty_like(mat)
+    if out.shape[1]:
+        out[:, 0] = mat[:, 0]
+        for t in range(1, out.shape[1]):
+            out[:, t] = alpha * mat[:, t] + (1.0 - alpha) * out[:, t - 1]
+    return out[seg, rel]
+
+
+# ── Per-series reductions ─────────────────────────────────────────────────────
+def period_returns(values: ArrayLike, offsets: ArrayLike | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Simple period-over-period returns within each series.
+
+    Returns (returns, series_id) — one entry per consecutive pair inside a
+    series; pairs with a non-positive or missing base price are dropped.
+    """
+    x, offs = _prepare(values, offsets)
+    seg, starts = _segments(offs, x.size)
+    # A return exists at every position that is not the first of its series
+    pos = np.nonzero(np.arange(x.size) > starts)[0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = x[pos] / x[pos - 1] - 1.0
+    ok = np.isfinite(r) & (x[pos - 1] > 0)
+    return r[ok], seg[pos][ok]
+
+
+def group_std(values: np.ndarray, groups: np.ndarray, n_groups: int, ddof: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """Per-group standard deviation and count via bincount (NaN where count ≤ ddof)."""
+    n  = np.bincount(groups, minlength=n_groups).astype(np.float64)
+    s1 = np.bincount(groups, weights=values, minlength=n_groups)
+    s2 = np.bincount(groups, weights=values * values, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = np.maximum(s2 - s1 * s1 / n, 0.0) / (n - ddof)
+        return np.where(n > ddof, np.sqrt(var), np.nan), n.astype(np.int64)
+
+
+def realized_volatility(values: ArrayLike, offsets: ArrayLike | None = None, ddof: int = 1):
+    """Standard deviation of period-over-period simple returns per series.
+
+    NaN when a series has ≤ ddof usable returns.
+    """
+    _, offs = _prepare(values, offsets)
+    r, seg  = period_returns(values, offsets)
+    out, _  = group_std(r, seg, offs.size - 1, ddof=ddof)
+    return _reduce_result(out, offsets)
+
+
+def depreciation_slope(values: ArrayLike, offsets: ArrayLike | None = None):
+    """Least-squares slope of price vs period index (price units per period).
+
+    Negative = depreciating. NaN for series with fewer than 2 points.
+    """
+    x, offs = _prepare(values, offsets)
+    n_series = offs.size - 1
+    seg, starts = _segments(offs, x.size)
+    t = (np.arange(x.size) - starts).astype(np.float64)
+    n   = np.bincount(seg, minlength=n_series).astype(np.float64)
+    st  = np.bincount(seg, weights=t, minlength=n_series)
+    sx  = np.bincount(seg, weights=x, minlength=n_series)
+    stt = np.bincount(seg, weights=t * t, minlength=n_series)
+    stx = np.bincount(seg, weights=t * x, minlength=n_series)
+    den = n * stt - st * st
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = np.where((n >= 2) & (den != 0), (n * stx - st * sx) / den, np.nan)
+    return _reduce_result(out, offsets)
+
+
+def depreciation_rate(values: ArrayLike, offsets: ArrayLike | None = None, last: ArrayLike | float | None = None):
+    """Annualised % depreciation from the first point to ``last`` (positive = losing value).
+
+    ``last`` defaults to each series' final value. Uses monthly periods and
+    never annualises over less than a year, as TrendAnalysisAgent always has:
+        (first - last) / first / max(n / 12, 1) * 100
+    0.0 for series with fewer than 2 points or a non-positive first/last price.
+    """
+    x, offs = _prepare(values, offsets)
+    lengths = np.diff(offs)
+    n_series = lengths.size
+    has = lengths > 0
+    first = np.full(n_series, np.nan)
+    first[has] = x[offs[:-1][has]]
+    if last is None:
+        end = np.full(n_series, np.nan)
+        end[has] = x[offs[1:][has] - 1]
+    else:
+        end = np.broadcast_to(np.asarray(last, dtype=np.float64), (n_series,))
+    years = np.maximum(lengths / 12.0, 1.0)
+    ok = (lengths >= 2) & (first > 0) & (end > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = np.where(ok, (first - end) / first / years * 100, 0.0)
+    return _reduce_result(out, offsets)
@@ -0,0 +1,73 @@
+# backend/utils/trend_features.py
+"""Per-series trend features materialised at ingest time.
+
+TrendAnalysisAgent derives ma_30, ma_90, depreciation_rate and
+seasonal_factor from a vehicle's monthly price history. Those depend only on
+the history, so scripts/mongo_ingest.py computes them for every series in one
+vectorized pass and stores them on the price_series bucket as
+``trend_features``. The agent reuses the stored values whenever the
+fingerprint of the history it was handed still matches.
+"""
+from __future__ import annotations
+import hashlib
+from typing import Iterable
+
+import numpy as np
+
+from backend.utils import timeseries as ts
+
+# Below this many priced months the agent falls back to forecast values for
+# the moving averages, so nothing is materialised for shorter series.
+MIN_MONTHS = 3
+
+
+def fingerprint(points: Iterable[tuple[str, float]]) -> str:
+    """Stable hash of (month, avg_price) pairs — identifies one version of a series."""
+    payload = ";".join(f"{month}:{float(price):.2f}" for month, price in points)
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+
+def history_fingerprint(price_history: list[dict]) -> str:
+    """Fingerprint of a get_price_history result, over the months the agent uses."""
+    return fingerprint((p.get("date"), p["avg_price"]) for p in price_history if p.get("avg_price"))
+
+
+def _priced(bucket: dict) -> tuple[list[str], list[float]]:
+    months, prices = [], []
+    for m, p in zip(bucket.get("months") or [], bucket.get("avg_price") or []):
+        if p:
+            months.append(m)
+            prices.append(round(float(p), 2))
+    return months, prices
+
+
+def compute(buckets: list[dict]) -> list[dict | None]:
+    """Trend features for every bucket in one vectorized pass (None when too short)."""
+    priced = [_priced(b) for b in buckets]
+    values, offsets = ts.pack([p for _, p in priced])
+    lengths = np.diff(offsets)
+    if values.size == 0:
+        return [None] * len(buckets)
+
+    last_idx = np.maximum(offsets[1:] - 1, 0)
+    ma_30    = ts.rolling_mean(values, 3, offsets)[last_idx]
+    ma_90    = ts.rolling_mean(values, 9, offsets)[last_idx]
+    dep_rate = ts.depreciation_rate(values, offsets)
+    last     = values[last_idx]
+
+    out: list[dict | None] = []
+    for i, (months, prices) in enumerate(priced):
+        if lengths[i] < MIN_MONTHS:
+            out.append(None)
+            continue
+        m90 = round(float(ma_90[i]), 2)
+        out.append({
+            "ma_30":             round(float(ma_30[i]), 2),
+            "ma_90":             m90,
+            "depreciation_rate": round(float(dep_rate[i]), 2),
+            "seasonal_factor":   round(float(last[i]) / m90, 3) if m90 > 0 else 1.0,
+            "last_price":        float(last[i]),
+            "n_months":          int(lengths[i]),
+            "fingerprint":       fingerprint(zip(months, prices)),
+        })
+    return out
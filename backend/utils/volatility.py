@@ -0,0 +1,95 @@
+# backend/utils/volatility.py
+"""Realized month-over-month price volatility, tabulated per series / make / segment.
+
+Built in one vectorized pass over the packed monthly avg_price arrays when
+the snapshot store loads, so RiskAssessmentAgent can size its uncertainty
+band from observed dispersion with a single dict lookup per request.
+
+Lookup falls back from the most to the least specific level that has enough
+returns:  series → make → segment (body type) → market.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from backend.utils import timeseries as ts
+
+# Fewer returns than this and a level's sigma is too noisy to trust
+MIN_RETURNS = 4
+
+# Monthly avg_price is a thin-sample mean, so single months can jump on a
+# handful of listings. Clip returns before pooling so one outlier month
+# doesn't dominate a whole make.
+RETURN_CLIP = 0.5
+
+
+@dataclass
+class VolatilityTable:
+    """sigma_1m (std of monthly simple returns) and sample size per key."""
+    series:  dict[str, tuple[float, int]] = field(default_factory=dict)
+    make:    dict[str, tuple[float, int]] = field(default_factory=dict)
+    segment: dict[str, tuple[float, int]] = field(default_factory=dict)
+    market:  tuple[float, int] | None = None
+
+    def lookup(self, sid: str, make: str | None = None, segment: str | None = None) -> dict | None:
+        """Most specific sigma available: {"sigma_1m", "n_returns", "level"} or None."""
+        for level, table, key in (
+            ("series",  self.series,  sid),
+            ("make",    self.make,    make),
+            ("segment", self.segment, segment),
+        ):
+            hit = table.get(key) if key else None
+            if hit:
+                return {"sigma_1m": hit[0], "n_returns": hit[1], "level": level}
+        if self.market:
+            return {"sigma_1m": self.market[0], "n_returns": self.market[1], "level": "market"}
+        return None
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+
+def _keyed(keys: list, sigma: np.ndarray, n: np.ndarray) -> dict[str, tuple[float, int]]:
+    return {
+        k: (round(float(s), 5), int(c))
+        for k, s, c in zip(keys, sigma.tolist(), n.tolist())
+        if k and c >= MIN_RETURNS and s == s
+    }
+
+
+def _pooled(labels: list[str | None], r: np.ndarray, seg: np.ndarray) -> dict[str, tuple[float, int]]:
+    """Pool every return of the series sharing a label, then take one std per label."""
+    keys, codes = np.unique(np.asarray([l or "" for l in labels], dtype=object), return_inverse=True)
+    sigma, n = ts.group_std(r, codes[seg], len(keys))
+    return _keyed(keys.tolist(), sigma, n)
+
+
+def build(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    series_ids: list[str],
+    makes: list[str | None],
+    segments: list[str | None],
+) -> VolatilityTable:
+    """Tabulate volatility for every series packed in (values, offsets).
+
+    series_ids / makes / segments are aligned with the series order of offsets.
+    """
+    if values.size == 0 or not series_ids:
+        return VolatilityTable()
+
+    r, seg = ts.period_returns(values, offsets)
+    r = np.clip(r, -RETURN_CLIP, RETURN_CLIP)
+    sigma, n = ts.group_std(r, seg, len(series_ids))
+
+    market = None
+    if r.size >= MIN_RETURNS:
+        market = (round(float(np.std(r, ddof=1)), 5), int(r.size))
+
+    return VolatilityTable(
+        series=_keyed(series_ids, sigma, n),
+        make=_pooled(makes, r, seg),
+        segment=_pooled(segments, r, seg),
+        market=market,
+    )
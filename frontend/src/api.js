@@ -8,3 +8,9 @@ export const getMarketOverview = ()       => api.get('/api/market-overview')
 export const getShapImportance = ()       => api.get('/api/shap-importance')
 export const clearCache        = ()       => api.delete('/api/clear-cache')
 export const seedMarket        = ()       => api.post('/api/seed-market')
+
+// Catalogue dropdowns (AnalyzeTab) — small responses instead of all of /api/cars
+const enc = encodeURIComponent
+export const getMakes    = ()             => api.get('/api/makes')
+export const getModels   = (make)         => api.get(`/api/makes/${enc(make)}/models`)
+export const getYears    = (make, model)  => api.get(`/api/makes/${enc(make)}/models/${enc(model)}/years`)
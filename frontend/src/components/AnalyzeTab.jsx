@@ -3,7 +3,7 @@ import {
   ComposedChart, Area, Line, XAxis, YAxis, CartesianGrid,
   Tooltip, ReferenceLine, ResponsiveContainer, Legend,
 } from 'recharts'
-import { getCars, getPrediction } from '../api'
+import { getMakes, getModels, getYears, getPrediction } from '../api'
 import { useApp } from '../App'
 
 const BADGE = { BUY: 'bg-emerald-500', WAIT: 'bg-red-500', NEUTRAL: 'bg-amber-500' }
@@ -31,15 +31,40 @@ function Skeleton() {
 export default function AnalyzeTab() {
   const { pendingCar, setPendingCar } = useApp()
 
-  const [cars,    setCars]    = useState([])
+  const [makes,   setMakes]   = useState([])
+  const [models,  setModels]  = useState([])
+  const [years,   setYears]   = useState([])
   const [form,    setForm]    = useState({ make:'', model:'', year:'', mileage:50000, condition:'good', region:'california' })
   const [result,  setResult]  = useState(null)
   const [loading, setLoading] = useState(false)
   const [error,   setError]   = useState(null)
   const [expanded,setExpanded]= useState({})
 
-  // Load car catalogue once
-  useEffect(() => { getCars().then(r => setCars(r.data)) }, [])
+  // Dropdowns load level by level — makes once, then the chosen make's models,
+  // then that model's years — instead of the whole /api/cars list
+  useEffect(() => {
+    getMakes().then(r => setMakes(r.data.map(m => m.make).sort())).catch(() => setMakes([]))
+  }, [])
+
+  useEffect(() => {
+    setModels([])
+    if (!form.make) return
+    let stale = false
+    getModels(form.make)
+      .then(r => { if (!stale) setModels(r.data.map(m => m.model).sort()) })
+      .catch(() => {})
+    return () => { stale = true }
+  }, [form.make])
+
+  useEffect(() => {
+    setYears([])
+    if (!form.make || !form.model) return
+    let stale = false
+    getYears(form.make, form.model)
+      .then(r => { if (!stale) setYears(r.data.map(y => y.year).sort((a, b) => b - a)) })
+      .catch(() => {})
+    return () => { stale = true }
+  }, [form.make, form.model])
 
   // Pre-populate from MarketOverview click
   useEffect(() => {
@@ -49,15 +74,6 @@ export default function AnalyzeTab() {
     setTimeout(() => document.getElementById('analyze-btn')?.click(), 100)
   }, [pendingCar, setPendingCar])
 
-  const makes  = useMemo(() => [...new Set(cars.map(c => c.make))].sort(), [cars])
-  const models = useMemo(() =>
-    [...new Set(cars.filter(c => c.make === form.make).map(c => c.model))].sort()
-  , [cars, form.make])
-  const years  = useMemo(() =>
-    [...new Set(cars.filter(c => c.make === form.make && c.model === form.model).map(c => c.year))]
-      .sort((a,b) => b - a)
-  , [cars, form.make, form.model])
-
   const set = (k, v) => setForm(f => ({ ...f, [k]: v }))
 
   async function analyze() {
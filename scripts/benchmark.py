@@ -0,0 +1,241 @@
+"""
+benchmark.py
+Micro-benchmarks for the backend hot paths. Each sub-command prints a short
+latency / size report; run from the project root with .env in place.
+
+  python scripts/benchmark.py series [--n 200]
+      price_snapshots (one doc per month) vs price_series (one bucket per
+      series): per-series fetch latency and collection / index size.
+
+  python scripts/benchmark.py pipeline [--n 40] [--workers 8]
+      run_orchestrator full (LLM) vs fast (no LLM) mode on the same sampled
+      vehicles: per-call latency and throughput. The LLM response cache is
+      disabled unless LLM_CACHE_ENABLED is set explicitly.
+
+  python scripts/benchmark.py agent [--repeat 1]
+      run_agent tool loop vs direct mode (local parse, fixed tool order, one
+      completion) on a fixed query set: end-to-end latency and agent tokens.
+
+  python scripts/benchmark.py serialize [--n 50] [--repeat 200]
+      /api/predict response encoding on cached prediction documents: the old
+      json.dumps(default=str) → json.loads → jsonable_encoder → JSONResponse
+      chain vs FastJSONResponse. Per-response latency and peak allocation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.utils.price_series import SERIES_COLLECTION
+
+load_dotenv(_ROOT / ".env")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+def _timed(fn, *args) -> float:
+    """Run fn(*args) once and return the wall time in milliseconds."""
+    t0 = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - t0) * 1000
+
+
+def _report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"  {label:<28} p50 {statistics.median(samples):8.3f} ms   "
+          f"p95 {p95:8.3f} ms   mean {statistics.fmean(samples):8.3f} ms")
+
+
+def _collection_size(db, name: str) -> None:
+    stats = db.command("collStats", name, scale=1024)
+    print(f"  {name:<22} docs {stats.get('count', 0):>9,}   "
+          f"data {stats.get('size', 0):>9,.0f} KB   "
+          f"indexes {stats.get('totalIndexSize', 0):>8,.0f} KB ({stats.get('nindexes', 0)})")
+
+
+# ── series ────────────────────────────────────────────────────────────────────
+def bench_series(n: int) -> None:
+    db = MongoClient(os.environ["MONGO_URI"])["carmarket"]
+    sample = list(db[SERIES_COLLECTION].aggregate([
+        {"$sample": {"size": n}},
+        {"$project": {"_id": 1, "make": 1, "model": 1, "year": 1}},
+    ]))
+    if not sample:
+        print("price_series is empty — run scripts/mongo_ingest.py first")
+        return
+
+    def legacy(doc: dict) -> None:
+        # The reads get_price_history + get_market_context used to issue
+        filter_ = {"make": doc["make"], "model": doc["model"], "year": doc["year"]}
+        snaps = db["price_snapshots"]
+        list(snaps.find(filter_, {"_id": 0, "year_month": 1, "avg_price": 1,
+                                  "median_price": 1, "listing_count": 1}).sort("year_month", 1))
+        list(snaps.find(filter_, {"_id": 0, "year_month": 1, "listing_count": 1, "avg_price": 1})
+             .sort("year_month", -1).limit(2))
+        list(snaps.aggregate([
+            {"$match": filter_},
+            {"$group": {"_id": None, "overall_avg": {"$avg": "$avg_price"},
+                        "min_price": {"$min": "$avg_price"}, "max_price": {"$max": "$avg_price"}}},
+        ]))
+
+    def bucketed(doc: dict) -> None:
+        db[SERIES_COLLECTION].find_one({"_id": doc["_id"]})
+        db[SERIES_COLLECTION].find_one({"_id": doc["_id"]})
+
+    # Warm both paths once so the first sample doesn't pay connection setup
+    legacy(sample[0]); bucketed(sample[0])
+
+    print(f"\n=== Series fetch latency ({len(sample)} series) ===")
+    _report("price_snapshots (3 queries)", [_timed(legacy, d) for d in sample])
+    _report("price_series (2 _id lookups)", [_timed(bucketed, d) for d in sample])
+
+    print("\n=== Collection / index size ===")
+    _collection_size(db, "price_snapshots")
+    _collection_size(db, SERIES_COLLECTION)
+
+
+# ── pipeline ──────────────────────────────────────────────────────────────────
+def bench_pipeline(n: int, workers: int) -> None:
+    # Cached completions would make full mode look as cheap as fast mode
+    os.environ.setdefault("LLM_CACHE_ENABLED", "0")
+    from backend.agents.orchestrator import run_orchestrator, _demo_result
+    from backend.car_catalog import CATALOG
+
+    rng = random.Random(42)
+    # Demo overrides return canned results — benchmark the live pipeline only
+    live = [c for c in CATALOG if _demo_result(c["make"], c["model"], c["year"]) is None]
+    sample = rng.sample(live, min(n, len(live)))
+    run_orchestrator(**sample[0], llm_mode="fast")   # warm models / snapshot store
+
+    print(f"\n=== run_orchestrator ({len(sample)} vehicles, {workers} workers) ===")
+    throughput = {}
+    for mode in ("two_call", "fast"):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            t0 = time.perf_counter()
+            samples = list(pool.map(lambda c: _timed(lambda: run_orchestrator(**c, llm_mode=mode)), sample))
+            wall = time.perf_counter() - t0
+        throughput[mode] = len(sample) / wall
+        _report(f"{mode} ({throughput[mode]:.2f} req/s)", samples)
+    print(f"  fast / full throughput: {throughput['fast'] / throughput['two_call']:.1f}x")
+
+
+# ── agent ─────────────────────────────────────────────────────────────────────
+AGENT_QUERIES = [
+    "Should I buy a 2018 Toyota Camry with 45,000 miles in good condition in California?",
+    "Is a 2019 Honda CR-V with 41k miles in excellent condition in Florida a good buy?",
+    "2018 Ford F-150, 65000 miles, good condition, Texas — buy now or wait?",
+    "Should I wait on a 2017 Jeep Grand Cherokee with 70k miles in New York?",
+    "2020 Hyundai Elantra, 32k miles, excellent, Illinois. Buy?",
+    "Is a 2016 Subaru Outback in fair condition with 98,000 miles in Colorado worth it?",
+]
+
+
+def bench_agent(repeat: int) -> None:
+    os.environ.setdefault("LLM_CACHE_ENABLED", "0")
+    from backend.agent import run_agent
+
+    print(f"\n=== run_agent ({len(AGENT_QUERIES)} queries × {repeat}) ===")
+    for mode in ("loop", "direct"):
+        latencies, tokens, completions = [], [], []
+        for _ in range(repeat):
+            for q in AGENT_QUERIES:
+                t0  = time.perf_counter()
+                out = run_agent(q, mode=mode)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                tokens.append(out["token_usage"]["total_tokens"])
+                completions.append(len(out["token_usage"]["rounds"]))
+        _report(mode, latencies)
+        print(f"  {'':<28} tokens/query {statistics.fmean(tokens):8.0f}   "
+              f"completions/query {statistics.fmean(completions):4.1f}")
+
+
+# ── serialize ─────────────────────────────────────────────────────────────────
+def bench_serialize(n: int, repeat: int) -> None:
+    db = MongoClient(os.environ["MONGO_URI"])["carmarket"]
+    docs = list(db["predictions_cache"].find({"agent_log": {"$exists": True}}).limit(n))
+    if not docs:
+        print("predictions_cache has no full predictions — call /api/predict a few times first")
+        return
+    serialize_report(docs, repeat)
+
+
+def serialize_report(docs: list[dict], repeat: int) -> None:
+    import json
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from backend.utils.fast_json import FastJSONResponse, orjson
+
+    _internal = ("_id", "expires_at", "cache_key", "explanation_request", "explanation_started_at")
+
+    def legacy(doc: dict) -> bytes:
+        doc = {k: v for k, v in doc.items() if k not in _internal}
+        return JSONResponse(jsonable_encoder(json.loads(json.dumps(doc, default=str)))).body
+
+    def fast(doc: dict) -> bytes:
+        return FastJSONResponse({k: v for k, v in doc.items() if k not in _internal}).body
+
+    size = statistics.fmean(len(fast(d)) for d in docs) / 1024
+    print(f"\n=== /api/predict response encoding ({len(docs)} docs, {size:.1f} KB avg, "
+          f"{'orjson' if orjson else 'stdlib json'}) ===")
+    for label, fn in (("legacy round trip", legacy), ("FastJSONResponse", fast)):
+        samples = []
+        for _ in range(repeat):
+            for d in docs:
+                samples.append(_timed(fn, d))
+        tracemalloc.start()
+        peaks = []
+        for d in docs:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn(d)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+        _report(label, samples)
+        print(f"  {'':<28} peak alloc / response {statistics.fmean(peaks) / 1024:8.1f} KB")
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backend hot-path benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_series = sub.add_parser("series", help="price_snapshots vs price_series fetch latency")
+    p_series.add_argument("--n", type=int, default=200, help="number of sampled series")
+
+    p_pipe = sub.add_parser("pipeline", help="full vs fast (no LLM) orchestrator throughput")
+    p_pipe.add_argument("--n", type=int, default=40, help="number of sampled vehicles")
+    p_pipe.add_argument("--workers", type=int, default=8, help="concurrent callers")
+
+    p_agent = sub.add_parser("agent", help="run_agent tool loop vs direct mode")
+    p_agent.add_argument("--repeat", type=int, default=1, help="passes over the query set")
+
+    p_ser = sub.add_parser("serialize", help="legacy vs one-pass JSON encoding of predictions")
+    p_ser.add_argument("--n", type=int, default=50, help="cached prediction docs to encode")
+    p_ser.add_argument("--repeat", type=int, default=200, help="passes over the docs")
+
+    args = parser.parse_args()
+    if args.command == "series":
+        bench_series(args.n)
+    elif args.command == "pipeline":
+        bench_pipeline(args.n, args.workers)
+    elif args.command == "agent":
+        bench_agent(args.repeat)
+    elif args.command == "serialize":
+        bench_serialize(args.n, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+build_catalog.py
+Regenerate backend/car_catalog.json from cleaned_cars.csv.
+
+Keeps the most-listed makes (--makes, default 20) and every (make, model,
+year) seen for them from --min-year on, in the compact format read by
+backend/car_catalog.py (string tables + one year bitmask per make/model).
+
+    python scripts/build_catalog.py
+    python scripts/build_catalog.py --makes 25 --min-year 2000
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.car_catalog import DATA_PATH, CarCatalog, encode, write
+
+# ── Config ────────────────────────────────────────────────────────────────────
+CSV_PATH = Path(__file__).parent.parent / "Data" / "cleaned_cars.csv"
+
+
+def load_rows(path: Path, n_makes: int, min_year: int) -> list[tuple[str, str, int]]:
+    df = pd.read_csv(path, usecols=["make", "model", "year"], low_memory=False).dropna()
+    df["make"]  = df["make"].astype(str).str.strip().str.lower()
+    df["model"] = df["model"].astype(str).str.strip().str.lower()
+    df["year"]  = df["year"].astype(int)
+    df = df[(df["year"] >= min_year) & (df["make"] != "") & (df["model"] != "")]
+    top = df["make"].value_counts().head(n_makes).index
+    df  = df[df["make"].isin(top)].drop_duplicates()
+    return list(df.itertuples(index=False, name=None))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--csv", type=Path, default=CSV_PATH, help="cleaned listings CSV")
+    parser.add_argument("--out", type=Path, default=DATA_PATH, help="catalog file to write")
+    parser.add_argument("--makes", type=int, default=20, help="keep this many most-listed makes")
+    parser.add_argument("--min-year", type=int, default=2005, help="drop model years before this")
+    args = parser.parse_args()
+
+    print(f"Loading {args.csv.name} …")
+    rows = load_rows(args.csv, args.makes, args.min_year)
+    doc  = encode(rows, source=args.csv.name)
+    write(doc, args.out)
+
+    catalog = CarCatalog.load(args.out)   # round-trip check
+    print(f"Wrote {args.out} — {len(catalog):,} rows, {len(doc['model_ids']):,} make/models, "
+          f"{len(doc['makes'])} makes, {args.out.stat().st_size / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+ensure_indexes.py
+Create the MongoDB indexes the API's hot paths need and explain() their queries.
+
+Declarations live in backend/db_indexes.py. Exits non-zero if an index is
+missing / conflicting or a canonical query still plans a collection scan.
+
+    python scripts/ensure_indexes.py            # create missing, then check
+    python scripts/ensure_indexes.py --check    # report only, change nothing
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.db_indexes import IndexManager
+
+# ── Config ────────────────────────────────────────────────────────────────────
+load_dotenv()
+
+DB_NAME = "carmarket"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true", help="report only — do not create indexes")
+    args = parser.parse_args()
+
+    client = MongoClient(os.environ["MONGO_URI"])
+    report = IndexManager(client[DB_NAME]).report(create=not args.check)
+    client.close()
+
+    print("=== Indexes ===")
+    for ix in report["indexes"]:
+        print(f"  {ix['status']:<9} {ix['collection']:<18} {ix['name']:<28} {ix.get('error', '')}")
+    print("\n=== Query plans ===")
+    for q in report["queries"]:
+        print(f"  {q['status']:<9} {q['name']:<22} {q.get('plan') or q.get('error', '')}")
+    print(f"\n{'OK' if report['ok'] else 'PROBLEMS FOUND'} ({report['check_ms']} ms)")
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
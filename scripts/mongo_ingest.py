@@ -1,19 +1,33 @@
 """
 mongo_ingest.py
 Ingest cleaned_cars.csv into MongoDB Atlas — carmarket database.
-Collections: listings, price_snapshots, predictions_cache (TTL)
+Collections: listings, price_snapshots, price_series, predictions_cache (TTL)
+
+price_series is the bucketed layout read by backend/agent.py: one document per
+(make, model, year) holding the monthly snapshots as parallel arrays plus the
+precomputed trend_features used by TrendAnalysisAgent.
+Rebuild it alone from an existing price_snapshots collection with:
+
+    python scripts/mongo_ingest.py --series-only
 
 M0 free-tier fix: drops fat text columns (url, image_url, description,
 region_url, VIN, county, id) — saves ~200 MB, keeps all analytic fields.
 """
 
+import argparse
 import os
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
 from dotenv import load_dotenv
-from pymongo import MongoClient, ASCENDING
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.utils.price_series import META_COLLECTION, SERIES_COLLECTION, build_buckets, series_id
+from backend.utils import trend_features
+from backend.db_indexes import IndexManager
 
 # ── Config ────────────────────────────────────────────────────────────────────
 load_dotenv()
@@ -51,11 +65,77 @@ def chunked(lst: list, size: int):
         yield lst[i : i + size]
 
 
+def build_price_series(db) -> int:
+    """Rebuild price_series (one bucket per series) from price_snapshots + listings."""
+    listing_counts = {
+        series_id(r["_id"]["make"], r["_id"]["model"], r["_id"]["year"]): r["n"]
+        for r in db["listings"].aggregate([
+            {"$group": {"_id": {"make": "$make", "model": "$model", "year": "$year"},
+                        "n":   {"$sum": 1}}},
+        ], allowDiskUse=True)
+        if None not in (r["_id"].get("make"), r["_id"].get("model"), r["_id"].get("year"))
+    }
+    # Dominant body type per (make, model) — the "segment" level of the
+    # volatility table built by backend/snapshot_store.py
+    segments: dict[tuple[str, str], str] = {}
+    for r in db["listings"].aggregate([
+        {"$match": {"type": {"$nin": [None, ""]}}},
+        {"$group": {"_id": {"make": "$make", "model": "$model", "type": "$type"},
+                    "n":   {"$sum": 1}}},
+        {"$sort":  {"n": -1}},
+    ], allowDiskUse=True):
+        key = (str(r["_id"].get("make")).lower(), str(r["_id"].get("model")).lower())
+        segments.setdefault(key, str(r["_id"]["type"]).lower())
+
+    snapshots = db["price_snapshots"].find({}, {"_id": 0, "created_at": 0})
+    buckets   = build_buckets(snapshots, listing_counts)
+
+    # Trend features (ma_30 / ma_90 / depreciation / seasonal) for every series
+    # in one vectorized pass — TrendAnalysisAgent reads these instead of
+    # recomputing them per request.
+    created_at = datetime.now(timezone.utc)
+    for b, feats in zip(buckets, trend_features.compute(buckets)):
+        b["created_at"] = created_at
+        b["segment"]    = segments.get((b["make"], b["model"]))
+        if feats:
+            b["trend_features"] = feats
+
+    # Build aside and swap in with one rename, so readers never see an empty
+    # or half-written price_series while the rebuild runs
+    tmp_col = db[SERIES_COLLECTION + "_build"]
+    tmp_col.drop()                            # leftover from an interrupted run
+    for batch in chunked(buckets, BATCH_SIZE):
+        tmp_col.insert_many(batch, ordered=False)
+    if buckets:
+        tmp_col.rename(SERIES_COLLECTION, dropTarget=True)
+    else:
+        db[SERIES_COLLECTION].drop()
+
+    # Version stamp — running API servers poll this and reload their snapshot store
+    db[META_COLLECTION].replace_one(
+        {"_id": SERIES_COLLECTION},
+        {"version": created_at.isoformat(), "n_series": len(buckets), "updated_at": created_at},
+        upsert=True,
+    )
+    return len(buckets)
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--series-only", action="store_true",
+                        help="only rebuild price_series from the existing price_snapshots")
+    args = parser.parse_args()
+
     client = MongoClient(MONGO_URI)
     db     = client[DB_NAME]
 
+    if args.series_only:
+        n = build_price_series(db)
+        print(f"price_series — rebuilt {n:,} series buckets")
+        client.close()
+        return
+
     # ── 1. listings ───────────────────────────────────────────────────────────
     listings_col = db["listings"]
     listings_col.drop()                       # idempotent re-run: fresh load
@@ -67,11 +147,7 @@ def main() -> None:
     for batch in chunked(docs, BATCH_SIZE):
         listings_col.insert_many(batch, ordered=False)
 
-    listings_col.create_index(
-        [("make", ASCENDING), ("model", ASCENDING), ("year", ASCENDING)],
-        name="make_model_year",
-    )
-    print(f"listings — indexed and inserted {listings_col.count_documents({}):,} docs")
+    print(f"listings — inserted {listings_col.count_documents({}):,} docs")
 
     # ── 2. price_snapshots ────────────────────────────────────────────────────
     snapshots_col = db["price_snapshots"]
@@ -88,6 +164,8 @@ def main() -> None:
             },
             "avg_price":     {"$avg": "$price"},
             "median_price":  {"$median": {"input": "$price", "method": "approximate"}},
+            "pctl_price":    {"$percentile": {"input": "$price", "p": [0.25, 0.75],
+                                              "method": "approximate"}},
             "listing_count": {"$sum": 1},
         }},
         {"$project": {
@@ -98,6 +176,8 @@ def main() -> None:
             "year_month":    "$_id.year_month",
             "avg_price":     {"$round": ["$avg_price", 2]},
             "median_price":  {"$round": ["$median_price", 2]},
+            "p25_price":     {"$round": [{"$arrayElemAt": ["$pctl_price", 0]}, 2]},
+            "p75_price":     {"$round": [{"$arrayElemAt": ["$pctl_price", 1]}, 2]},
             "listing_count": 1,
             "created_at":    {"$literal": datetime.now(timezone.utc)},
         }},
@@ -107,25 +187,20 @@ def main() -> None:
     if snapshots:
         snapshots_col.insert_many(snapshots, ordered=False)
 
-    snapshots_col.create_index(
-        [("make", ASCENDING), ("model", ASCENDING),
-         ("year", ASCENDING), ("year_month", ASCENDING)],
-        name="make_model_year_month",
-    )
     print(f"price_snapshots — inserted {snapshots_col.count_documents({}):,} docs")
 
-    # ── 3. predictions_cache — TTL index (expires after 3600 s) ───────────────
-    cache_col = db["predictions_cache"]
-    cache_col.create_index(
-        [("expires_at", ASCENDING)],
-        expireAfterSeconds=3600,
-        name="ttl_expires_at",
-    )
-    print(f"predictions_cache — TTL index created (expireAfterSeconds=3600)")
+    # ── 2b. price_series — one bucket per (make, model, year), keyed by _id ───
+    n_series = build_price_series(db)
+    print(f"price_series — built {n_series:,} series buckets")
+
+    # ── 3. Indexes — every collection's, declared in backend/db_indexes.py ────
+    report = IndexManager(db).report(create=True)
+    print(f"indexes — {sum(i['status'] == 'created' for i in report['indexes'])} created"
+          + (f", problems: {', '.join(report['missing'])}" if report["missing"] else ""))
 
     # ── 4. Summary ────────────────────────────────────────────────────────────
     print("\n=== Collection counts ===")
-    for name in ["listings", "price_snapshots", "predictions_cache"]:
+    for name in ["listings", "price_snapshots", SERIES_COLLECTION, "predictions_cache"]:
         print(f"  {name:<22} {db[name].count_documents({}):>8,}")
 
     # ── 5. Storage usage (M0 quota check) ────────────────────────────────────
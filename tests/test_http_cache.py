@@ -0,0 +1,44 @@
+# tests/test_http_cache.py
+"""backend/utils/http_cache.py — ETag and Accept-Encoding helpers.
+
+Run from the repo root:  python -m pytest -q tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.utils.http_cache import accepts_gzip, etag_for, etag_matches
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.8, *;q=0.1", True),
+    ("GZIP", True),
+    ("x-gzip", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.000", False),
+    ("identity, gzip;q=0", False),
+    ("*;q=0.5, gzip;q=0", False),       # the explicit entry beats the wildcard
+    ("gzip;q=0, *", False),
+    ("*;q=0", False),
+    ("gzip;q=abc", False),
+    ("identity", False),
+    ("deflate, br", False),
+    ("", False),
+    (None, False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_etag_matches():
+    tag = etag_for(b"body")
+    assert etag_matches(tag, tag)
+    assert etag_matches(f'"other", W/{tag}', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"other"', tag)
+    assert not etag_matches(None, tag)
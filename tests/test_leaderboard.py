@@ -0,0 +1,179 @@
+# tests/test_leaderboard.py
+"""backend/leaderboard.py — top-k queries and cross-worker mirror sync.
+
+The mirror runs on mongomock behind a minimal async wrapper (the board only
+awaits find().to_list() and bulk_write()).
+Run from the repo root:  python -m pytest -q tests
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend import leaderboard as lb
+from backend.leaderboard import COLLECTION, BuyLeaderboard
+
+mongomock = pytest.importorskip("mongomock")
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, n):
+        return self._docs
+
+
+class _AsyncCollection:
+    def __init__(self, col):
+        self.col     = col
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        return _Cursor(list(self.col.find(query, projection)))
+
+    async def bulk_write(self, ops, ordered=True):
+        for op in ops:   # mongomock's bulk_write lags the installed pymongo
+            self.col.replace_one(op._filter, op._doc, upsert=op._upsert)
+
+
+class _AsyncDB:
+    def __init__(self):
+        self._db   = mongomock.MongoClient().db
+        self._cols = {}
+
+    def __getitem__(self, name):
+        return self._cols.setdefault(name, _AsyncCollection(self._db[name]))
+
+
+def _item(price, make="ford", region="california", rec="BUY"):
+    return {"recommendation": rec, "predicted_price": price, "make": make, "region": region}
+
+
+def _prices(board, *args):
+    return [i["predicted_price"] for i in board.top(10, *args)]
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _boards(db, n):
+    """*n* workers' boards, each loaded from the (shared) mirror."""
+    boards = [BuyLeaderboard() for _ in range(n)]
+    for board in boards:
+        _run(board.load(db))
+    return boards
+
+
+LATER = time.time() + 3600
+
+
+# ── In-memory board ───────────────────────────────────────────────────────────
+def test_top_filters_and_price_band():
+    b = BuyLeaderboard()
+    b.upsert("a", _item(300), LATER)
+    b.upsert("b", _item(100, "kia"), LATER)
+    b.upsert("c", _item(200, region="texas"), LATER)
+    b.upsert("d", _item(50, rec="SELL"), LATER)
+    assert _prices(b) == [100, 200, 300]
+    assert _prices(b, None, "Ford") == [200, 300]
+    assert _prices(b, "texas") == [200]
+    assert _prices(b, None, None, 150, 250) == [200]
+    b.upsert("b", _item(100, "kia", rec="HOLD"), LATER)   # no longer a BUY
+    assert _prices(b) == [200, 300]
+
+
+def test_expired_entries_leave_the_board():
+    b = BuyLeaderboard()
+    b.upsert("a", _item(100), time.time() - 1)
+    b.upsert("b", _item(200), LATER)
+    assert _prices(b) == [200] and len(b) == 1
+
+
+# ── Mirror sync ───────────────────────────────────────────────────────────────
+def test_sync_spreads_adds_patches_and_removals():
+    db   = _AsyncDB()
+    a, b = _boards(db, 2)
+    a.upsert("k1", _item(100), LATER)
+    a.upsert("k2", _item(50), LATER)
+    _run(a.sync(db))
+    assert _run(b.sync(db))["added"] == 2 and _prices(b) == [50, 100]
+
+    b.discard("k1")
+    b.patch("k2", {"explanation": "x"})
+    _run(b.sync(db))
+    counts = _run(a.sync(db))
+    assert (counts["removed"], counts["updated"]) == (1, 1)
+    assert _prices(a) == [50] and a.top(1)[0]["explanation"] == "x"
+
+
+def test_sync_reads_only_docs_past_the_watermark(monkeypatch):
+    db   = _AsyncDB()
+    a, b = _boards(db, 2)
+    for i in range(20):
+        a.upsert(f"k{i}", _item(100 + i), LATER)
+    _run(a.sync(db))
+    assert _run(b.sync(db))["read"] == 20
+
+    monkeypatch.setattr(lb, "_SYNC_OVERLAP_S", 0.0)
+    time.sleep(0.01)   # stamps are milliseconds
+    a.upsert("new", _item(1), LATER)
+    _run(a.sync(db))
+    counts = _run(b.sync(db))
+    assert counts["read"] == 1 and counts["added"] == 1
+    assert "updated_at" in db[COLLECTION].queries[-1]
+    assert _run(b.sync(db))["read"] == 0
+
+
+def test_own_entries_cause_no_churn():
+    db = _AsyncDB()
+    a, = _boards(db, 1)
+    a.upsert("k", _item(100), LATER)
+    _run(a.sync(db))
+    counts = _run(a.sync(db))
+    assert counts["added"] == counts["updated"] == counts["removed"] == 0
+
+
+def test_unflushed_local_change_wins():
+    db   = _AsyncDB()
+    a, b = _boards(db, 2)
+    a.upsert("k", _item(100), LATER)
+    _run(a.sync(db))
+    _run(b.sync(db))
+    b.upsert("k", _item(90), LATER)
+    a.patch("k", {"explanation": "mine"})   # a flushes this in its own sync, first
+    _run(a.sync(db))
+    assert a.top(1)[0]["explanation"] == "mine"
+    _run(b.sync(db))
+    assert _prices(b) == [90]
+
+
+def test_removal_is_a_tombstone_and_load_skips_it():
+    db = _AsyncDB()
+    a, = _boards(db, 1)
+    a.upsert("k", _item(100), LATER)
+    a.upsert("gone", _item(100), LATER)
+    _run(a.sync(db))
+    a.discard("gone")
+    _run(a.sync(db))
+    doc = db[COLLECTION].col.find_one({"_id": "gone"})
+    assert doc["deleted"] and doc["expires_at"] is not None
+    fresh = BuyLeaderboard()
+    assert _run(fresh.load(db)) == 1
+
+
+def test_full_resync_after_falling_behind_tombstones():
+    db   = _AsyncDB()
+    a, b = _boards(db, 2)
+    a.upsert("k", _item(100), LATER)
+    _run(a.sync(db))
+    _run(b.sync(db))
+    db[COLLECTION].col.delete_one({"_id": "k"})   # tombstone already reaped
+    b._synced_at -= lb.TOMBSTONE_TTL_S + 1
+    assert _run(b.sync(db))["removed"] == 1 and len(b) == 0
+    assert db[COLLECTION].queries[-1] == {}
@@ -0,0 +1,176 @@
+# tests/test_llm_cache.py
+"""backend/llm/cache.py — two-tier LLM response cache.
+
+Run from the repo root:  python -m pytest -q tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.llm import cache as cache_mod
+from backend.llm.cache import LLMCache, make_key
+
+
+class _Clock:
+    """Stand-in for time.time() inside backend/llm/cache.py."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(cache_mod.time, "time", c)
+    return c
+
+
+def _cache(tmp_path, **kwargs) -> LLMCache:
+    return LLMCache(tmp_path / "llm_cache.sqlite3", **kwargs)
+
+
+# ── Keys ──────────────────────────────────────────────────────────────────────
+def test_key_ignores_param_order_but_not_content():
+    msgs = [{"role": "user", "content": "hi"}]
+    assert make_key("m", msgs, temperature=0.1, top_p=1) == make_key("m", msgs, top_p=1, temperature=0.1)
+    assert make_key("m", msgs, temperature=0.1) != make_key("m", msgs, temperature=0.2)
+    assert make_key("m", msgs) != make_key("other", msgs)
+
+
+# ── Local tier ────────────────────────────────────────────────────────────────
+def test_put_then_get(tmp_path):
+    c = _cache(tmp_path)
+    assert c.get("k") is None
+    c.put("k", '{"a": 1}', model="m")
+    assert c.get("k") == '{"a": 1}'
+    s = c.stats()
+    assert (s["hits_local"], s["misses"], s["puts"], s["errors"]) == (1, 1, 1, 0)
+    assert s["local_entries"] == 1 and s["hit_rate"] == 0.5
+
+
+def test_entries_survive_reopen(tmp_path):
+    _cache(tmp_path).put("k", "v")
+    assert _cache(tmp_path).get("k") == "v"
+
+
+def test_expired_entry_is_a_miss_and_deleted(tmp_path, clock):
+    c = _cache(tmp_path, ttl_s=60)
+    c.put("k", "v")
+    clock.now += 59
+    assert c.get("k") == "v"
+    clock.now += 2
+    assert c.get("k") is None
+    s = c.stats()
+    assert (s["expired"], s["misses"], s["local_entries"]) == (1, 1, 0)
+
+
+def test_eviction_keeps_most_recently_used(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(cache_mod, "_EVICT_EVERY", 10)
+    c = _cache(tmp_path, max_entries=10)
+    for i in range(9):
+        clock.now += 1
+        c.put(f"k{i}", str(i))
+    clock.now += 1
+    assert c.get("k0") == "0"   # touched → most recently used
+    clock.now += 1
+    c.put("k9", "9")             # 10th write → eviction pass, but 10 rows is not over the limit
+    assert c.stats()["evicted"] == 0
+    for i in range(10, 20):
+        clock.now += 1
+        c.put(f"k{i}", str(i))   # 20th write trims 20 → 9 (90 % of the limit)
+    s = c.stats()
+    assert s["local_entries"] == 9 and s["evicted"] == 11
+    assert c.get("k0") is None and c.get("k1") is None
+    assert c.get("k19") == "19"
+
+
+def test_evict_drops_expired_rows_first(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(cache_mod, "_EVICT_EVERY", 5)
+    c = _cache(tmp_path, ttl_s=10)
+    for i in range(4):
+        c.put(f"old{i}", "x")
+    clock.now += 11
+    c.put("new", "y")            # 5th write → eviction pass
+    s = c.stats()
+    assert s["local_entries"] == 1 and s["expired"] == 4 and s["evicted"] == 0
+
+
+def test_clear(tmp_path):
+    c = _cache(tmp_path)
+    c.put("k", "v")
+    c.clear()
+    assert c.get("k") is None
+
+
+# ── Degraded local tier ───────────────────────────────────────────────────────
+def test_unusable_path_disables_local_tier(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    c = LLMCache(blocker / "llm_cache.sqlite3")   # parent is a file → mkdir fails
+    assert c.get("k") is None
+    c.put("k", "v")
+    assert c.get("k") is None
+    s = c.stats()
+    assert s["errors"] == 1 and "local_entries" not in s
+
+
+def test_corrupt_file_disables_local_tier(tmp_path):
+    path = tmp_path / "llm_cache.sqlite3"
+    path.write_bytes(b"not a sqlite database" * 100)
+    c = LLMCache(path)
+    c.put("k", "v")
+    assert c.get("k") is None and c.stats()["errors"] == 1
+
+
+def test_from_env_with_unusable_path(tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(blocker / "x.sqlite3"))
+    monkeypatch.delenv("LLM_CACHE_MONGO", raising=False)
+    c = LLMCache.from_env()
+    assert c is not None and c.get("k") is None
+
+
+def test_sqlite_errors_after_open_are_misses(tmp_path):
+    c = _cache(tmp_path)
+    c.put("k", "v")
+    c._conn.close()              # every later statement raises sqlite3.ProgrammingError
+    assert c.get("k") is None
+    c.put("k2", "v2")
+    s = c.stats()
+    assert s["errors"] == 2 and s["misses"] == 1 and s["local_entries"] is None
+
+
+def test_from_env_disabled(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "0")
+    assert LLMCache.from_env() is None
+
+
+# ── Mongo tier ────────────────────────────────────────────────────────────────
+@pytest.fixture
+def collection():
+    mongomock = pytest.importorskip("mongomock")
+    return mongomock.MongoClient().db[cache_mod.MONGO_COLLECTION]
+
+
+def test_mongo_hit_backfills_local(tmp_path, collection):
+    _cache(tmp_path / "a", collection=collection).put("k", "v", model="m")
+    b = _cache(tmp_path / "b", collection=collection)
+    assert b.get("k") == "v" and b.stats()["hits_mongo"] == 1
+    assert b.get("k") == "v" and b.stats()["hits_local"] == 1
+
+
+def test_mongo_tier_still_serves_when_local_is_unusable(tmp_path, collection):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    c = LLMCache(blocker / "llm_cache.sqlite3", collection=collection)
+    c.put("k", "v")
+    assert c.get("k") == "v"
+    s = c.stats()
+    assert s["hits_mongo"] == 1 and s["errors"] == 1 and s["mongo_tier"]
@@ -0,0 +1,86 @@
+# tests/test_query_parser.py
+"""backend/query_parser.py — local query parsing and catalogue snapping.
+
+Run from the repo root:  python -m pytest -q tests
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.query_parser import parse_query, resolve_vehicle
+
+
+def _v(make, model, year, mileage=50_000, condition="good", region="california"):
+    return {"make": make, "model": model, "year": year,
+            "mileage": mileage, "condition": condition, "region": region}
+
+
+SAMPLE = [
+    ("Should I buy a 2018 Toyota Camry with 45,000 miles in good condition in California?",
+     _v("toyota", "camry", 2018, 45_000)),
+    ("2019 honda crv 41k miles excellent florida",
+     _v("honda", "cr-v", 2019, 41_000, "excellent", "florida")),
+    ("Is a 2017 Jeep Grand Cherokee in New York a good deal?",
+     _v("jeep", "grand cherokee", 2017, region="new york")),
+    ("2016 ford f150 with 80000 mi, fair.",
+     _v("ford", "f-150", 2016, 80_000, "fair")),
+    ("what about a camry", None),                                       # no year
+    ("2018 Nissan Altima 2.5 sr sedan in texas",
+     _v("nissan", "altima 2.5 sr sedan", 2018, region="texas")),
+    ("2018 chevy silverado 1500 60k texas",
+     _v("chevrolet", "silverado 1500", 2018, 60_000, region="texas")),
+    ("2020 camry", _v("toyota", "camry", 2020)),
+    ("2019 vw jetta like new in ohio",
+     _v("volkswagen", "jetta", 2019, condition="like new", region="ohio")),
+    ("2018 Ford F-150, 65000 miles, good condition, Texas — buy now or wait?",
+     _v("ford", "f-150", 2018, 65_000, region="texas")),
+    ("2017 mercedes benz c-class", _v("mercedes-benz", "c-class", 2017)),
+    ("2018 Ram 1500 with 500 miles", _v("ram", "1500", 2018, 500)),
+    ("Is a 2016 Subaru Outback in fair condition with 98,000 miles in Colorado worth it?",
+     _v("subaru", "outback", 2016, 98_000, "fair", "colorado")),
+    ("2015 toyota", None),                                              # no model
+    ("2019 ford 500", _v("ford", "500", 2019)),
+]
+
+
+@pytest.mark.parametrize("query,expected", SAMPLE)
+def test_sample_queries(query, expected):
+    assert parse_query(query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    "2018 fiat 500",          # "500" is sold by one catalogue make (Ford) — not a Fiat
+    "2019 fiat 500 in ohio",
+    "2018 tesla model 3",
+])
+def test_unknown_brand_is_not_swapped_for_a_catalogue_make(query):
+    assert parse_query(query) is None
+
+
+def test_distinctive_model_still_resolves_its_make():
+    assert parse_query("2020 camry")["make"] == "toyota"
+
+
+@pytest.mark.parametrize("make,model,expected", [
+    ("Chevy", "Silverado 1500", ("chevrolet", "silverado 1500")),
+    ("honda", "crv", ("honda", "cr-v")),
+    ("ford", "500", ("ford", "500")),
+    ("fiat", "500", None),        # never moved to Ford
+    ("unknown", "camry", None),   # never moved to Toyota
+])
+def test_resolve_vehicle_only_snaps_spelling(make, model, expected):
+    assert resolve_vehicle(make, model) == expected
+
+
+def test_llm_reply_keeps_an_unknown_make(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "x")
+    monkeypatch.setenv("MONGO_URI", "mongodb://localhost:1")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "0")
+    agent = pytest.importorskip("backend.agent")
+    parsed = agent._parse_query_reply(json.dumps({"make": "Fiat", "model": "500", "year": 2018}))
+    assert (parsed["make"], parsed["model"]) == ("fiat", "500")
+    parsed = agent._parse_query_reply(json.dumps({"make": "Chevy", "model": "silverado 1500", "year": 2018}))
+    assert (parsed["make"], parsed["model"]) == ("chevrolet", "silverado 1500")
@@ -0,0 +1,163 @@
+# tests/test_timeseries.py
+"""Equivalence of backend/utils/timeseries.py with the list-based helpers it replaced.
+
+smoothing.moving_average / exponential_moving_average now delegate to the
+vectorized code, so the original loops are kept here as the reference.
+Run from the repo root:  python -m pytest -q tests
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.utils import smoothing, timeseries as ts
+
+
+# ── Reference implementations (smoothing.py before the vectorized rewrite) ───
+def ref_moving_average(values, window=3):
+    if not values or window <= 0:
+        return values
+    result = []
+    for i in range(len(values)):
+        start = max(0, i - window + 1)
+        chunk = values[start : i + 1]
+        result.append(sum(chunk) / len(chunk))
+    return result
+
+
+def ref_exponential_moving_average(values, alpha=0.3):
+    if not values:
+        return values
+    ema = [values[0]]
+    for v in values[1:]:
+        ema.append(alpha * v + (1 - alpha) * ema[-1])
+    return ema
+
+
+def ref_depreciation_rate(prices, last_price):
+    # trend_agent.run before it used ts.depreciation_rate
+    if last_price > 0 and len(prices) >= 2:
+        oldest = prices[0]
+        n_years = len(prices) / 12
+        return (oldest - last_price) / oldest / max(n_years, 1) * 100
+    return 0.0
+
+
+def _prices(n, seed):
+    rng = np.random.default_rng(seed)
+    return (18_000 + np.cumsum(rng.normal(-40, 350, n))).round(2).tolist()
+
+
+# Cumulative-sum means differ from the summed slices in the last few bits
+RTOL = 1e-9
+
+LENGTHS = [1, 2, 3, 5, 9, 24, 61, 400]
+WINDOWS = [1, 2, 3, 9, 30, 1000]   # 1000 > every series length
+ALPHAS  = [0.05, 0.3, 0.9, 1.0]
+
+# Ragged layouts: mixed lengths, empty segments at the start / middle / end
+RAGGED = [
+    [5, 1, 12, 3],
+    [0, 4, 0, 0, 7, 2, 0],
+    [61] * 20 + [1, 2],
+    [0],
+    [],
+]
+
+
+def _ragged(lengths):
+    series = [_prices(n, seed) for seed, n in enumerate(lengths)]
+    values, offsets = ts.pack(series)
+    return series, values, offsets
+
+
+# ── Single series ─────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("n", LENGTHS)
+@pytest.mark.parametrize("window", WINDOWS)
+def test_moving_average_matches_reference(n, window):
+    prices = _prices(n, n)
+    np.testing.assert_allclose(smoothing.moving_average(prices, window),
+                               ref_moving_average(prices, window), rtol=RTOL)
+    np.testing.assert_allclose(ts.rolling_mean(prices, window),
+                               ref_moving_average(prices, window), rtol=RTOL)
+
+
+@pytest.mark.parametrize("n", LENGTHS)
+@pytest.mark.parametrize("alpha", ALPHAS)
+def test_ema_matches_reference(n, alpha):
+    prices = _prices(n, n)
+    np.testing.assert_allclose(smoothing.exponential_moving_average(prices, alpha),
+                               ref_exponential_moving_average(prices, alpha), rtol=RTOL)
+
+
+def test_long_series_ema_stays_finite():
+    prices = _prices(5_000, 7)
+    np.testing.assert_allclose(ts.ema(prices, 0.01), ref_exponential_moving_average(prices, 0.01), rtol=RTOL)
+
+
+@pytest.mark.parametrize("values", [[], [0.0, 0.0], [100.0]])
+def test_empty_and_degenerate_inputs(values):
+    assert smoothing.moving_average(values, 3) == ref_moving_average(values, 3)
+    assert smoothing.exponential_moving_average(values) == ref_exponential_moving_average(values)
+
+
+def test_non_positive_window_returns_input_unchanged():
+    prices = _prices(5, 1)
+    assert smoothing.moving_average(prices, 0) is prices
+    with pytest.raises(ValueError):
+        ts.rolling_mean(prices, 0)
+
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_depreciation_rate_matches_reference(n):
+    prices = _prices(n, n)
+    assert ts.depreciation_rate(prices) == pytest.approx(ref_depreciation_rate(prices, prices[-1]))
+    assert ts.depreciation_rate(prices, last=15_000.0) == pytest.approx(ref_depreciation_rate(prices, 15_000.0))
+
+
+# ── Ragged (values, offsets) ──────────────────────────────────────────────────
+@pytest.mark.parametrize("lengths", RAGGED)
+@pytest.mark.parametrize("window", WINDOWS)
+def test_ragged_rolling_mean_matches_per_series(lengths, window):
+    series, values, offsets = _ragged(lengths)
+    expected = [v for s in series for v in ref_moving_average(s, window)]
+    np.testing.assert_allclose(ts.rolling_mean(values, window, offsets), expected, rtol=RTOL)
+
+
+@pytest.mark.parametrize("lengths", RAGGED)
+@pytest.mark.parametrize("alpha", ALPHAS)
+def test_ragged_ema_matches_per_series(lengths, alpha):
+    series, values, offsets = _ragged(lengths)
+    expected = [v for s in series for v in ref_exponential_moving_average(s, alpha)]
+    np.testing.assert_allclose(ts.ema(values, alpha, offsets), expected, rtol=RTOL)
+
+
+@pytest.mark.parametrize("lengths", RAGGED)
+def test_ragged_reductions_match_single_series(lengths):
+    series, values, offsets = _ragged(lengths)
+    assert ts.depreciation_rate(values, offsets).tolist() == pytest.approx(
+        [ref_depreciation_rate(s, s[-1]) if s else 0.0 for s in series])
+    np.testing.assert_allclose(
+        ts.realized_volatility(values, offsets),
+        [ts.realized_volatility(s) for s in series], rtol=RTOL, equal_nan=True)
+    np.testing.assert_allclose(
+        ts.depreciation_slope(values, offsets),
+        [ts.depreciation_slope(s) for s in series], rtol=RTOL, equal_nan=True)
+
+
+@pytest.mark.parametrize("lengths", RAGGED)
+@pytest.mark.parametrize("window", [1, 3, 1000])
+def test_ragged_rolling_extremes_match_per_series(lengths, window):
+    series, values, offsets = _ragged(lengths)
+    for fn in (ts.rolling_min, ts.rolling_max, ts.rolling_std):
+        expected = [v for s in series for v in fn(s, window)]
+        np.testing.assert_allclose(fn(values, window, offsets), expected, rtol=RTOL, equal_nan=True)
+
+
+def test_bad_offsets_rejected():
+    with pytest.raises(ValueError):
+        ts.rolling_mean([1.0, 2.0, 3.0], 2, offsets=[0, 2])
+    with pytest.raises(ValueError):
+        ts.ema([1.0, 2.0, 3.0], 0.3, offsets=[0, 2, 1, 3])